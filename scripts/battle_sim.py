@@ -0,0 +1,480 @@
+#!/usr/bin/env python3
+"""Headless battle engine for balancing, driven by the generated catalog.
+
+Reproduces the battle loop of src/game.js: start-of-battle triggers, the trigger
+queue (TRIGGER_PRIORITY order, ties in enqueue order) flushed after every step,
+hurt/faint/summon handling and the seeded LCG, so the same teams and seed end in
+the same state as window.__debugSimulateBattle(). Pets are small lists rather
+than dicts, which keeps a battle in the tens of microseconds.
+
+    python scripts/battle_sim.py --check              # compare against test/battle_fixtures.json
+    python scripts/battle_sim.py --pack pack2 --round 7 --battles 200000
+
+Shop-phase abilities (buy/sell/level-up/end-turn) are not part of a battle and
+are ignored here.
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPTS_DIR.parent
+FIXTURES = ROOT_DIR / "test" / "battle_fixtures.json"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+import build_game_catalog as catalog  # noqa: E402
+
+# Mirrors of the src/game.js constants the battle loop reads.
+TEAM_SLOTS = 5
+TRIGGER_QUEUE_MAX_STEPS = 300
+MAX_BATTLE_STEPS = 200  # SIMULATED_BATTLE_MAX_STEPS: unresolved battles are draws.
+PRIORITY_START = 10
+PRIORITY_PRE_ATTACK = 20
+PRIORITY_ATTACK = 30
+PRIORITY_HURT = 40
+PRIORITY_CLEANUP = 50
+PRIORITY_FAINT = 60
+
+# Pet layout: [uid, attack, health, level, ability, perk, summon, kind]. ``summon`` is
+# None or an (attack, health, kind) summonOnFaint template.
+UID, ATTACK, HEALTH, LEVEL, ABILITY, PERK, SUMMON, KIND = range(8)
+
+# Battle-relevant abilities; every other ability key (shop-phase and placeholders) is 0.
+ABILITIES = (
+    None,
+    "faint_buff_random_ally",
+    "faint_buff_rear",
+    "faint_give_melon_friend_behind",
+    "faint_summon_zombie",
+    "hurt_buff_rear",
+    "hurt_gain_attack",
+    "start_ping_enemy",
+    "start_battle_buff_friend_ahead_attack",
+    "behind_attack_gain",
+    "friend_summoned_attack",
+)
+ABILITY_CODES = {name: code for code, name in enumerate(ABILITIES) if name}
+(
+    _,
+    FAINT_BUFF_RANDOM_ALLY,
+    FAINT_BUFF_REAR,
+    FAINT_GIVE_MELON,
+    FAINT_SUMMON_ZOMBIE,
+    HURT_BUFF_REAR,
+    HURT_GAIN_ATTACK,
+    START_PING_ENEMY,
+    START_BUFF_FRIEND_AHEAD,
+    BEHIND_ATTACK_GAIN,
+    FRIEND_SUMMONED_ATTACK,
+) = range(len(ABILITIES))
+FAINT_ABILITIES = frozenset((FAINT_BUFF_RANDOM_ALLY, FAINT_BUFF_REAR, FAINT_GIVE_MELON, FAINT_SUMMON_ZOMBIE))
+HURT_ABILITIES = frozenset((HURT_BUFF_REAR, HURT_GAIN_ATTACK))
+
+PERKS = (None, "garlic", "melon", "meat")
+PERK_CODES = {name: code for code, name in enumerate(PERKS) if name}
+GARLIC, MELON, MEAT = 1, 2, 3
+
+# Trigger operations queued as (priority, seq, op, side, a, b).
+OP_START_BUFF, OP_START_PING, OP_PRE_ATTACK, OP_ATTACK, OP_HURT, OP_CLEANUP, OP_FAINT = range(7)
+
+RESULTS = ("win", "lose", "draw")
+
+
+def read_data_script(path: Path) -> dict[str, Any]:
+    """Parse a ``<statement> = {...};`` file written by render_data_script()."""
+    text = path.read_text(encoding="utf-8")
+    data = json.loads(text[text.index(" = {") + 3 :].rstrip().rstrip(";"))
+    return catalog.decode_compact_payload(data) if data.get("format") == catalog.COMPACT_FORMAT else data
+
+
+def resolve_root_url(src: str, root: Path = ROOT_DIR) -> Path:
+    """File behind a root-relative URL from the payload (``./assets/fp/x.js?v=...``), as the browser resolves it."""
+    return root / src.split("?", 1)[0].removeprefix("./").lstrip("/")
+
+
+def load_catalog(path: Path = catalog.OUTPUT_JS, root: Path = ROOT_DIR) -> dict[str, Any]:
+    """Load game_data.generated.js in any build layout (verbose/compact, sharded or not).
+
+    Shard URLs (plain or ``--fingerprint``ed) are resolved against ``root``, the
+    directory index.html is served from.
+    """
+    payload = read_data_script(path)
+    if any("shard" in pack for pack in payload["packs"]):
+        pets: list[dict[str, Any]] = []
+        foods: list[dict[str, Any]] = []
+        for pack in payload["packs"]:
+            shard = read_data_script(resolve_root_url(pack["shard"]["src"], root))
+            pets.extend(shard["pets"])
+            foods.extend(shard["foods"])
+        payload = {**payload, "pets": pets, "foods": foods}
+    return payload
+
+
+class Roster:
+    """Pet definitions by id and kind, turning preset entries into compact battle pets.
+
+    Preset entries use the shape of the debug presets in src/game.js:
+    ``{"kind": id-or-kind, "attack", "health", "level", "perk", "summonOnFaint"}``.
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.pets = payload["pets"]
+        self.by_ref: dict[str, dict[str, Any]] = {}
+        for pet in self.pets:
+            self.by_ref.setdefault(pet["kind"], pet)
+        for pet in self.pets:
+            self.by_ref[pet["id"]] = pet
+
+    def pet(self, entry: dict[str, Any]) -> list[Any]:
+        definition = self.by_ref.get(str(entry["kind"]))
+        if definition is None:
+            raise KeyError(f"Unknown pet ref: {entry['kind']}")
+        summon = entry.get("summonOnFaint")
+        attack = entry.get("attack")
+        health = entry.get("health")
+        level = entry.get("level")
+        return [
+            0,
+            definition["attack"] if attack is None else attack,
+            definition["health"] if health is None else health,
+            1 if level is None else level,
+            ABILITY_CODES.get(definition.get("abilityKey"), 0),
+            PERK_CODES.get(entry.get("perk"), 0),
+            (summon["attack"], summon["health"], summon["kind"]) if summon else None,
+            definition["kind"],
+        ]
+
+    def team(self, entries: Iterable[dict[str, Any]]) -> list[list[Any]]:
+        return [self.pet(entry) for entry in entries]
+
+
+class BattleOutcome:
+    __slots__ = ("result", "steps", "friendly", "enemy", "rng_seed")
+
+    def __init__(self, result: str, steps: int, friendly: list[list[Any]], enemy: list[list[Any]], rng_seed: int) -> None:
+        self.result = result
+        self.steps = steps
+        self.friendly = friendly
+        self.enemy = enemy
+        self.rng_seed = rng_seed
+
+    def as_fixture(self) -> dict[str, Any]:
+        """The shape window.__debugSimulateBattle() returns."""
+
+        def line(team: list[list[Any]]) -> list[list[Any]]:
+            return [[pet[KIND], pet[ATTACK], pet[HEALTH], PERKS[pet[PERK]]] for pet in team]
+
+        return {
+            "result": self.result,
+            "steps": self.steps,
+            "friendly": line(self.friendly),
+            "enemy": line(self.enemy),
+            "rngSeed": self.rng_seed,
+        }
+
+
+def simulate(friendly: list[list[Any]], enemy: list[list[Any]], seed: int = 1) -> BattleOutcome:
+    """Fight two compact teams (front first); the inputs are not modified."""
+    teams = ([list(pet) for pet in friendly], [list(pet) for pet in enemy])
+    next_uid = 1
+    for team in teams:
+        for pet in team:
+            pet[UID] = next_uid
+            next_uid += 1
+    rng = seed & 0xFFFFFFFF
+    queue: list[tuple[int, int, int, int, Any, Any]] = []
+    seq = 0
+
+    def random_index(size: int) -> int:
+        nonlocal rng
+        rng = (1664525 * rng + 1013904223) & 0xFFFFFFFF
+        return int(rng / 4294967296 * size)
+
+    def push(priority: int, op: int, side: int, a: Any = None, b: Any = None) -> None:
+        nonlocal seq
+        seq += 1
+        heapq.heappush(queue, (priority, seq, op, side, a, b))
+
+    def find(team: list[list[Any]], uid: int) -> int:
+        for index, pet in enumerate(team):
+            if pet[UID] == uid:
+                return index
+        return -1
+
+    def queue_start(side: int) -> None:
+        team = teams[side]
+        for index in range(len(team) - 1, 0, -1):
+            if team[index][ABILITY] == START_BUFF_FRIEND_AHEAD:
+                push(PRIORITY_START, OP_START_BUFF, side, team[index][UID])
+        for pet in team:
+            if pet[ABILITY] == START_PING_ENEMY:
+                for _ in range(pet[LEVEL]):
+                    push(PRIORITY_START, OP_START_PING, side, pet[UID])
+
+    def queue_cleanup() -> None:
+        push(PRIORITY_CLEANUP, OP_CLEANUP, 0)
+        push(PRIORITY_CLEANUP, OP_CLEANUP, 1)
+
+    def summon(team: list[list[Any]], index: int, attack: int, health: int, kind: str) -> None:
+        nonlocal next_uid
+        pet = [next_uid, attack, health, 1, 0, 0, None, kind]
+        next_uid += 1
+        team.insert(index, pet)
+        pet[ATTACK] += sum(ally[LEVEL] for ally in team if ally is not pet and ally[ABILITY] == FRIEND_SUMMONED_ATTACK)
+
+    def faint(team: list[list[Any]], pet: list[Any], index: int) -> None:
+        ability = pet[ABILITY]
+        level = pet[LEVEL]
+        if ability == FAINT_BUFF_RANDOM_ALLY:
+            # Like game.js, ``index`` is the dead pet's old slot, now held by the pet behind it.
+            targets = [ally for idx, ally in enumerate(team) if idx != index and ally[HEALTH] > 0]
+            if targets:
+                target = targets[random_index(len(targets))]
+                target[ATTACK] += 2 * level
+                target[HEALTH] += level
+        elif ability == FAINT_BUFF_REAR:
+            for target in team[index : index + 2]:
+                target[ATTACK] += level
+                target[HEALTH] += level
+        elif ability == FAINT_GIVE_MELON:
+            if index < len(team):
+                team[index][PERK] = MELON
+        if ability == FAINT_SUMMON_ZOMBIE:
+            if len(team) < TEAM_SLOTS:
+                summon(team, index, level, level, "zombie_cricket")
+        elif pet[SUMMON] is not None and len(team) < TEAM_SLOTS:
+            summon(team, index, *pet[SUMMON])
+
+    def damage(attacker: list[Any], defender: list[Any]) -> int:
+        amount = attacker[ATTACK] + 3 if attacker[PERK] == MEAT else attacker[ATTACK]
+        if defender[PERK] == MELON:
+            amount = max(0, amount - 20)
+            defender[PERK] = 0
+        if defender[PERK] == GARLIC:
+            amount = max(1, amount - 2)
+        return amount
+
+    def run(op: int, side: int, a: Any, b: Any) -> None:
+        team = teams[side]
+        if op == OP_CLEANUP:
+            index = 0
+            while index < len(team):
+                pet = team[index]
+                if pet[HEALTH] > 0:
+                    index += 1
+                    continue
+                del team[index]
+                if pet[ABILITY] in FAINT_ABILITIES or pet[SUMMON] is not None:
+                    push(PRIORITY_FAINT, OP_FAINT, side, pet, index)
+            del team[TEAM_SLOTS:]
+        elif op == OP_ATTACK:
+            left, right = teams
+            if not left or not right:
+                return
+            left_front = left[0]
+            right_front = right[0]
+            left_damage = damage(left_front, right_front)
+            right_damage = damage(right_front, left_front)
+            right_front[HEALTH] -= left_damage
+            left_front[HEALTH] -= right_damage
+            if left_front[HEALTH] > 0 and left_front[ABILITY] in HURT_ABILITIES:
+                push(PRIORITY_HURT, OP_HURT, 0, left_front[UID])
+            if right_front[HEALTH] > 0 and right_front[ABILITY] in HURT_ABILITIES:
+                push(PRIORITY_HURT, OP_HURT, 1, right_front[UID])
+            queue_cleanup()
+        elif op == OP_FAINT:
+            faint(team, a, b)
+        elif op == OP_PRE_ATTACK:
+            index = find(team, a)
+            if index != -1:
+                team[index][ATTACK] += 2 * team[index][LEVEL]
+                team[index][HEALTH] += team[index][LEVEL]
+        elif op == OP_HURT:
+            index = find(team, a)
+            if index == -1:
+                return
+            pet = team[index]
+            if pet[HEALTH] <= 0:
+                return
+            if pet[ABILITY] == HURT_BUFF_REAR:
+                if index + 1 < len(team):
+                    team[index + 1][ATTACK] += pet[LEVEL]
+                    team[index + 1][HEALTH] += pet[LEVEL]
+            else:
+                pet[ATTACK] += 2 * pet[LEVEL]
+        elif op == OP_START_BUFF:
+            index = find(team, a)
+            if index > 0:
+                actor = team[index]
+                team[index - 1][ATTACK] += max(1, math.floor(actor[ATTACK] * (0.5 * actor[LEVEL])))
+        elif op == OP_START_PING:
+            opponent = teams[1 - side]
+            if find(team, a) != -1 and opponent:
+                opponent[random_index(len(opponent))][HEALTH] -= 1
+
+    def flush() -> None:
+        steps = 0
+        while queue and steps < TRIGGER_QUEUE_MAX_STEPS:
+            steps += 1
+            _, _, op, side, a, b = heapq.heappop(queue)
+            run(op, side, a, b)
+        queue.clear()
+
+    def outcome() -> str | None:
+        left, right = teams
+        if not left:
+            return "lose" if right else "draw"
+        return None if right else "win"
+
+    queue_start(0)
+    queue_start(1)
+    queue_cleanup()
+    flush()
+    result = outcome()
+    steps = 0
+    while result is None and steps < MAX_BATTLE_STEPS:
+        steps += 1
+        for side in (0, 1):
+            team = teams[side]
+            for index in range(1, len(team)):
+                if team[index][ABILITY] == BEHIND_ATTACK_GAIN:
+                    push(PRIORITY_PRE_ATTACK, OP_PRE_ATTACK, side, team[index][UID])
+        push(PRIORITY_ATTACK, OP_ATTACK, 0)
+        flush()
+        result = outcome()
+    return BattleOutcome(result or "draw", steps, teams[0], teams[1], rng)
+
+
+def check_fixtures(roster: Roster, path: Path) -> int:
+    """Replay JS-recorded battles; returns the number of mismatches."""
+    fixtures = json.loads(path.read_text(encoding="utf-8"))
+    mismatches = 0
+    for index, case in enumerate(fixtures["cases"]):
+        outcome = simulate(roster.team(case["friendly"]), roster.team(case["enemy"]), case["seed"])
+        actual = outcome.as_fixture()
+        if actual != case["expected"]:
+            mismatches += 1
+            print(f"case {index} (seed={case['seed']}): expected {case['expected']}, got {actual}")
+    print(f"{len(fixtures['cases']) - mismatches}/{len(fixtures['cases'])} battles match {path}")
+    return mismatches
+
+
+def enemy_team_size(round_number: int) -> int:
+    if round_number >= 9:
+        return 5
+    if round_number >= 5:
+        return 4
+    return 3
+
+
+def tier_for_round(round_number: int) -> int:
+    return min(6, max(1, (round_number + 1) // 2))
+
+
+def random_team(pool: list[dict[str, Any]], round_number: int, rng: random.Random) -> list[dict[str, Any]]:
+    """A preset team drawn like generateEnemyTeam() in src/game.js (but from ``rng``)."""
+    bonus = (round_number - 1) // 2
+    team = []
+    for _ in range(enemy_team_size(round_number)):
+        definition = rng.choice(pool)
+        team.append(
+            {
+                "kind": definition["id"],
+                "attack": definition["attack"] + rng.randint(0, bonus),
+                "health": definition["health"] + rng.randint(0, bonus + 1),
+                "perk": "garlic" if rng.random() < 0.2 else None,
+            }
+        )
+    return team
+
+
+def run_random_battles(roster: Roster, args: argparse.Namespace) -> dict[str, Any]:
+    """Fight ``args.battles`` random pairs; tally results and per-pet win rates."""
+    max_tier = tier_for_round(args.round)
+    pool = [pet for pet in roster.pets if pet["packKey"] == args.pack and pet["tier"] <= max_tier]
+    if not pool:
+        raise SystemExit(f"No pets in {args.pack} up to tier {max_tier}")
+    rng = random.Random(args.seed)
+    totals = dict.fromkeys(RESULTS, 0)
+    per_pet: dict[str, list[int]] = {}
+    started = time.perf_counter()
+    for _ in range(args.battles):
+        left = random_team(pool, args.round, rng)
+        right = random_team(pool, args.round, rng)
+        result = simulate(roster.team(left), roster.team(right), rng.getrandbits(32)).result
+        totals[result] += 1
+        for entries, won in ((left, result == "win"), (right, result == "lose")):
+            for entry in entries:
+                record = per_pet.setdefault(entry["kind"], [0, 0])
+                record[0] += won
+                record[1] += 1
+    elapsed = time.perf_counter() - started
+    return {
+        "pack": args.pack,
+        "round": args.round,
+        "battles": args.battles,
+        "seconds": round(elapsed, 3),
+        "battlesPerSecond": round(args.battles / elapsed, 1) if elapsed else None,
+        "results": totals,
+        "winRates": {
+            pet_id: {"winRate": round(wins / games, 4), "battles": games}
+            for pet_id, (wins, games) in sorted(per_pet.items(), key=lambda item: item[1][0] / item[1][1])
+        },
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run src/game.js battles headlessly against the generated catalog.")
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=catalog.OUTPUT_JS,
+        help=f"generated data script to load (default: {catalog.root_rel(catalog.OUTPUT_JS)})",
+    )
+    parser.add_argument(
+        "--check",
+        nargs="?",
+        type=Path,
+        const=FIXTURES,
+        default=None,
+        help=f"replay battles recorded from the JS engine (default: {catalog.root_rel(FIXTURES)})",
+    )
+    parser.add_argument("--pack", default="pack1", help="pack to draw random teams from (default: pack1)")
+    parser.add_argument("--round", type=int, default=5, help="round used for team size, tier and stat bonus (default: 5)")
+    parser.add_argument("--battles", type=int, default=10000, help="random battles to fight (default: 10000)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for team generation (default: 1)")
+    parser.add_argument("--json", type=Path, default=None, help="write the random-battle summary to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    roster = Roster(load_catalog(args.catalog))
+    if args.check is not None:
+        return 1 if check_fixtures(roster, args.check) else 0
+
+    summary = run_random_battles(roster, args)
+    print(
+        f"{summary['battles']} battles in {summary['seconds']}s ({summary['battlesPerSecond']}/s): "
+        + " ".join(f"{key}={value}" for key, value in summary["results"].items())
+    )
+    rates = list(summary["winRates"].items())
+    for label, rows in (("Weakest", rates[:5]), ("Strongest", rates[-5:][::-1])):
+        print(f"{label}: " + ", ".join(f"{pet_id} {row['winRate']:.1%}" for pet_id, row in rows))
+    if args.json:
+        catalog.ensure_parent(args.json)
+        args.json.write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"Summary: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
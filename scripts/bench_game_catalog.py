@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""Benchmark build_game_catalog.py against synthetic workbooks and icon trees.
+
+Each invocation lays out a scratch project (configs.xlsx, assets/icons and a copy
+of the builder), runs the full pipeline with --profile a few times and reports
+per-phase throughput and memory. Results are saved under output/bench/ so runs
+can be compared with --compare.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import shlex
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from openpyxl import Workbook
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPTS_DIR.parent
+BUILDER = SCRIPTS_DIR / "build_game_catalog.py"
+BENCH_OUTPUT_DIR = ROOT_DIR / "output" / "bench"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+import build_game_catalog as catalog  # noqa: E402
+
+HINT_SYLLABLES = "购买 时 使 一 个 随机 伙伴 获得 生命 攻击 回合 开始 结束 受伤 昏厥 召唤 食物 商店 升级 友方".split()
+
+
+def column_number(letter: str) -> int:
+    return catalog.column_index(letter) + 1
+
+
+def write_png(path: Path, width: int, height: int, rng: random.Random) -> int:
+    """Write a small RGBA PNG with a seeded gradient and speckles; returns its size."""
+    red, green, blue = (rng.randrange(256) for _ in range(3))
+    template = bytearray(b"".join(bytes(((red + x) & 255, 0, blue, 255)) for x in range(width)))
+    rows = bytearray()
+    for y in range(height):
+        line = bytearray(template)
+        line[1::4] = bytes([(green + y) & 255]) * width
+        for x in rng.sample(range(width), width // 8):
+            line[4 * x + 2] = rng.randrange(256)
+        rows += b"\x00" + line
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    data = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(bytes(rows), 6)) + chunk(b"IEND", b"")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return len(data)
+
+
+def generate_project(
+    project_dir: Path,
+    packs: int,
+    rows_per_pack: int,
+    dup_ratio: float,
+    icon_size: int,
+    seed: int,
+) -> dict[str, int]:
+    """Lay out a synthetic project under ``project_dir``; returns row/icon counts."""
+    if packs < 1:
+        raise SystemExit("--packs must be at least 1")
+    pack_names = [f"{index}合成兽群" for index in range(1, packs + 1)]
+
+    rng = random.Random(seed)
+    icons_dir = project_dir / "assets" / "icons"
+    (project_dir / "scripts").mkdir(parents=True, exist_ok=True)
+    (project_dir / "src").mkdir(parents=True, exist_ok=True)
+    shutil.copy2(BUILDER, project_dir / "scripts" / BUILDER.name)
+    registry = [{"nameZh": name, "key": f"pack{index}", "nameEn": f"Pack {index}"} for index, name in enumerate(pack_names, 1)]
+    packs_config = project_dir / "assets" / catalog.PACKS_CONFIG.name
+    packs_config.parent.mkdir(parents=True, exist_ok=True)
+    packs_config.write_text(json.dumps({"packs": registry}, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    width = max(column_number(letter) for letter, _ in catalog.SOURCE_COLUMNS.values())
+    header: list[Any] = [None] * width
+    for letter, labels in catalog.SOURCE_COLUMNS.values():
+        header[column_number(letter) - 1] = labels[-1]
+
+    wb = Workbook(write_only=True)
+    counts = {"rows": 0, "duplicates": 0, "icons": 0, "iconBytes": 0}
+    for pack_name in pack_names:
+        ws = wb.create_sheet(pack_name)
+        ws.append(header)
+        unique_rows = max(1, round(rows_per_pack * (1 - dup_ratio)))
+        items: list[list[Any]] = []
+        for item_index in range(unique_rows):
+            type_zh = "动物" if item_index % 4 else "食物"
+            tier = 1 + item_index % 6
+            # normalize_name() strips trailing digits, so the number goes in the middle.
+            name = f"合成{item_index}号{type_zh}"
+            icon_rel = f"{pack_name}/{tier}级/{type_zh}/{name}.png"
+            counts["iconBytes"] += write_png(icons_dir / icon_rel, icon_size, icon_size - 7, rng)
+            counts["icons"] += 1
+            hint = " ".join(rng.choice(HINT_SYLLABLES) for _ in range(rng.randrange(8, 40)))
+            row: list[Any] = [None] * width
+            for field, value in (
+                ("pack_name_zh", pack_name),
+                ("tier", tier),
+                ("round_unlock", tier * 2 - 1),
+                ("type_zh", type_zh),
+                ("icon_src_rel", icon_rel),
+                ("name_raw", name),
+                ("hint_raw", hint),
+                ("ocr_score", round(0.5 + rng.random() / 2, 3)),
+            ):
+                row[column_number(catalog.SOURCE_COLUMNS[field][0]) - 1] = value
+            items.append(row)
+        # Lower-scored OCR re-reads of existing items exercise the dedup path.
+        score_col = column_number(catalog.SOURCE_COLUMNS["ocr_score"][0]) - 1
+        for _ in range(rows_per_pack - unique_rows):
+            duplicate = list(rng.choice(items[:unique_rows]))
+            duplicate[score_col] = round(duplicate[score_col] - 0.5, 3)
+            items.append(duplicate)
+            counts["duplicates"] += 1
+        rng.shuffle(items)
+        for row in items:
+            ws.append(row)
+        counts["rows"] += len(items)
+    source_xlsx = project_dir / "assets" / "configs.xlsx"
+    wb.save(source_xlsx)
+    counts["workbookBytes"] = source_xlsx.stat().st_size
+    return counts
+
+
+def reset_outputs(project_dir: Path) -> None:
+    """Drop every build output so the next run is cold."""
+    for rel in ("assets/icons_en", "assets/icons_sized", "assets/icons_cas", "assets/atlas", "assets/fp", "src", "output", ".build"):
+        shutil.rmtree(project_dir / rel, ignore_errors=True)
+    (project_dir / "src").mkdir(parents=True, exist_ok=True)
+    for rel in ("assets/configs_game.xlsx", "assets/encodings.json"):
+        (project_dir / rel).unlink(missing_ok=True)
+
+
+def run_child(command: list[str]) -> int | None:
+    """Run ``command`` to completion; returns its own peak RSS in bytes where the OS reports it.
+
+    ``RUSAGE_CHILDREN`` is a high-water mark over every child reaped so far, so a warm run
+    would report the cold run's peak; ``os.wait4`` gives the usage of just this process
+    (and the workers it reaped).
+    """
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    if not hasattr(os, "wait4"):  # Windows
+        if proc.wait():
+            raise subprocess.CalledProcessError(proc.returncode, command)
+        return None
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, command)
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def run_builder(project_dir: Path, builder_args: list[str], label: str) -> dict[str, Any]:
+    profile_path = project_dir / "output" / f"profile-{label}.json"
+    command = [sys.executable, str(project_dir / "scripts" / BUILDER.name), "--profile", str(profile_path), *builder_args]
+    start = time.perf_counter()
+    peak_rss = run_child(command)
+    wall = time.perf_counter() - start
+    profile = json.loads(profile_path.read_text(encoding="utf-8"))
+    return {"label": label, "wallSeconds": round(wall, 6), "childPeakRssBytes": peak_rss, "phases": profile["phases"]}
+
+
+def summarize(runs: list[dict[str, Any]], counts: dict[str, int]) -> dict[str, Any]:
+    """Median wall time per phase plus rows/s, icons/s and MB/s where they apply."""
+    phase_names = list(dict.fromkeys(phase["name"] for run in runs for phase in run["phases"]))
+    phases: dict[str, dict[str, Any]] = {}
+    for name in phase_names:
+        records = [phase for run in runs for phase in run["phases"] if phase["name"] == name]
+        wall = statistics.median(record["wallSeconds"] for record in records)
+        moved = statistics.median(record["bytesRead"] + record["bytesWritten"] for record in records)
+        phases[name] = {
+            "medianWallSeconds": round(wall, 6),
+            "maxPeakTracedBytes": max(record.get("peakTracedBytes", 0) for record in records),
+            "mbPerSecond": round(moved / wall / 1e6, 3) if wall and moved else None,
+        }
+
+    def rate(count: int, *names: str) -> float | None:
+        wall = sum(phases[name]["medianWallSeconds"] for name in names if name in phases)
+        return round(count / wall, 1) if wall else None
+
+    total = statistics.median(run["wallSeconds"] for run in runs)
+    return {
+        "medianWallSeconds": round(total, 6),
+        "rowsPerSecond": rate(counts["rows"], "open_workbook", "parse_rows"),
+        "iconsPerSecond": rate(counts["icons"], "icon_stage"),
+        "endToEndRowsPerSecond": round(counts["rows"] / total, 1) if total else None,
+        "maxPeakTracedBytes": max(phase["maxPeakTracedBytes"] for phase in phases.values()),
+        "childPeakRssBytes": max((run["childPeakRssBytes"] or 0) for run in runs) or None,
+        "phases": phases,
+    }
+
+
+def print_summary(title: str, summary: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    print(f"{title}: {summary['medianWallSeconds']:.3f}s median")
+    print(
+        f"  rows/s={summary['rowsPerSecond']} icons/s={summary['iconsPerSecond']} "
+        f"end-to-end rows/s={summary['endToEndRowsPerSecond']} "
+        f"peak traced={summary['maxPeakTracedBytes'] / 1e6:.1f} MB"
+    )
+    for name, phase in summary["phases"].items():
+        line = f"  {name:<24} {phase['medianWallSeconds']:>9.4f}s"
+        if phase["mbPerSecond"] is not None:
+            line += f" {phase['mbPerSecond']:>9.2f} MB/s"
+        previous = (baseline or {}).get("phases", {}).get(name)
+        if previous and previous["medianWallSeconds"]:
+            change = phase["medianWallSeconds"] / previous["medianWallSeconds"] - 1
+            line += f"  ({change:+.1%} vs baseline)"
+        print(line)
+
+
+def check_memory_scaling(small: dict[str, Any], args: argparse.Namespace, builder_args: list[str]) -> dict[str, Any]:
+    """Build a workbook with ``--memory-scale`` times the packs and compare its peaks with the cold runs.
+
+    The builder streams rows and entries through scratch stores and holds at most one
+    pack's entries at a time, so peak memory should stay roughly flat as packs are
+    added; ``passed`` is false once the traced peak grows by more than ``--memory-tolerance``.
+    """
+    project_dir = Path(tempfile.mkdtemp(prefix="catalog-bench-memory-"))
+    try:
+        packs = args.packs * args.memory_scale
+        counts = generate_project(project_dir, packs, args.rows_per_pack, args.dup_ratio, args.icon_size, args.seed)
+        large = summarize([run_builder(project_dir, builder_args, "memory")], counts)
+    finally:
+        shutil.rmtree(project_dir, ignore_errors=True)
+    traced_ratio = large["maxPeakTracedBytes"] / max(small["maxPeakTracedBytes"], 1)
+    rss_ratio = large["childPeakRssBytes"] / small["childPeakRssBytes"] if small["childPeakRssBytes"] and large["childPeakRssBytes"] else None
+    return {
+        "rows": counts["rows"],
+        "maxPeakTracedBytes": large["maxPeakTracedBytes"],
+        "childPeakRssBytes": large["childPeakRssBytes"],
+        "tracedRatio": round(traced_ratio, 3),
+        "rssRatio": round(rss_ratio, 3) if rss_ratio is not None else None,
+        "tolerance": args.memory_tolerance,
+        "passed": traced_ratio <= args.memory_tolerance,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark build_game_catalog.py on a synthetic workbook and icon tree.")
+    parser.add_argument("--packs", type=int, default=6, help="packs (one sheet each) in the synthetic workbook")
+    parser.add_argument("--rows-per-pack", type=int, default=2000, help="workbook rows per pack, duplicates included")
+    parser.add_argument("--dup-ratio", type=float, default=0.1, help="share of rows that are low-score OCR duplicates")
+    parser.add_argument("--icon-size", type=int, default=92, help="synthetic icon width in pixels")
+    parser.add_argument("--repeat", type=int, default=3, help="cold builds to run (default: 3)")
+    parser.add_argument("--incremental", action="store_true", help="also time a warm --incremental rebuild")
+    parser.add_argument("--builder-args", default="", help='extra build_game_catalog.py arguments, e.g. "--format compact"')
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--work-dir", type=Path, default=None, help="scratch project dir (default: a temp dir)")
+    parser.add_argument("--keep", action="store_true", help="keep the scratch project afterwards")
+    parser.add_argument("--output", type=Path, default=None, help="result JSON (default: output/bench/catalog_bench-<time>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="earlier result JSON to diff phase timings against")
+    parser.add_argument(
+        "--memory-scale",
+        type=int,
+        default=0,
+        help="also build with this many times the packs and fail if peak memory grows past --memory-tolerance",
+    )
+    parser.add_argument(
+        "--memory-tolerance", type=float, default=1.5, help="allowed peak traced memory ratio for --memory-scale (default: 1.5)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.repeat < 1:
+        raise SystemExit("--repeat must be >= 1")
+    if not 0 <= args.dup_ratio < 1:
+        raise SystemExit("--dup-ratio must be in [0, 1)")
+    if args.memory_scale and args.memory_scale < 2:
+        raise SystemExit("--memory-scale must be at least 2")
+    builder_args = shlex.split(args.builder_args)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+
+    project_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="catalog-bench-"))
+    try:
+        start = time.perf_counter()
+        counts = generate_project(project_dir, args.packs, args.rows_per_pack, args.dup_ratio, args.icon_size, args.seed)
+        print(
+            f"Synthetic project: {project_dir} ({counts['rows']} rows, {counts['duplicates']} duplicates, "
+            f"{counts['icons']} icons, {time.perf_counter() - start:.1f}s to generate)"
+        )
+
+        cold_runs: list[dict[str, Any]] = []
+        for index in range(args.repeat):
+            reset_outputs(project_dir)
+            cold_runs.append(run_builder(project_dir, builder_args, f"cold-{index}"))
+        results: dict[str, Any] = {"cold": summarize(cold_runs, counts)}
+        runs = {"cold": cold_runs}
+        if args.incremental:
+            warm_runs = [run_builder(project_dir, [*builder_args, "--incremental"], "warm")]
+            results["incremental"] = summarize(warm_runs, counts)
+            runs["incremental"] = warm_runs
+        memory = check_memory_scaling(results["cold"], args, builder_args) if args.memory_scale else None
+    finally:
+        if not args.keep and args.work_dir is None:
+            shutil.rmtree(project_dir, ignore_errors=True)
+
+    report = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "config": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        "counts": counts,
+        "results": results,
+        "runs": runs,
+    }
+    for mode, summary in results.items():
+        print_summary(mode, summary, (baseline or {}).get("results", {}).get(mode))
+    if memory:
+        report["memoryCheck"] = memory
+        rss = f", RSS x{memory['rssRatio']}" if memory["rssRatio"] is not None else ""
+        print(
+            f"memory at {memory['rows']} rows: peak traced={memory['maxPeakTracedBytes'] / 1e6:.1f} MB "
+            f"(x{memory['tracedRatio']} vs {counts['rows']} rows{rss}) "
+            f"{'ok' if memory['passed'] else f'FAILED, tolerance x{args.memory_tolerance}'}"
+        )
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output = args.output or BENCH_OUTPUT_DIR / f"catalog_bench-{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"Results: {output}")
+    return 0 if memory is None or memory["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
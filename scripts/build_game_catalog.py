@@ -1,35 +1,97 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import gzip
 import json
 import hashlib
+import os
+import platform
+import posixpath
 import re
 import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
 import unicodedata
-from dataclasses import dataclass
+import zipfile
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from collections.abc import MutableMapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from dataclasses import astuple, dataclass, fields
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Callable, Collection, Iterable, Iterator, NamedTuple, Sequence
+from xml.etree import ElementTree
 
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 ASSETS_DIR = ROOT_DIR / "assets"
 ICONS_DIR = ASSETS_DIR / "icons"
 ICONS_EN_DIR = ASSETS_DIR / "icons_en"
+ICONS_SIZED_DIR = ASSETS_DIR / "icons_sized"
+ICONS_CAS_DIR = ASSETS_DIR / "icons_cas"
+ICON_HASH_LENGTH = 16
 SOURCE_XLSX = ASSETS_DIR / "configs.xlsx"
+STAT_OVERRIDES = ASSETS_DIR / "stat_overrides.json"
+PACKS_CONFIG = ASSETS_DIR / "packs.json"
 OUTPUT_XLSX = ASSETS_DIR / "configs_game.xlsx"
 OUTPUT_JS = ROOT_DIR / "src" / "game_data.generated.js"
-
-PACK_KEY_MAP = {
-    "1乌龟兽群": {"key": "pack1", "name_en": "Pack 1"},
-    "2濒危兽群": {"key": "pack2", "name_en": "Pack 2"},
-    "3独角兽兽群": {"key": "pack3", "name_en": "Pack 3"},
-    "4金毛兽群": {"key": "pack4", "name_en": "Pack 4"},
-    "5海星兽群": {"key": "pack5", "name_en": "Pack 5"},
-    "6幼犬兽群": {"key": "pack6", "name_en": "Pack 6"},
-}
+ATLAS_DIR = ASSETS_DIR / "atlas"
+FINGERPRINT_DIR = ASSETS_DIR / "fp"
+ASSET_MANIFEST = FINGERPRINT_DIR / "manifest.json"
+FINGERPRINT_LENGTH = 12
+ENCODINGS_MANIFEST = ASSETS_DIR / "encodings.json"
+BUILD_DIR = ROOT_DIR / ".build"
+BUILD_MANIFEST = BUILD_DIR / "catalog_manifest.sqlite"
+ROWS_CACHE = BUILD_DIR / "rows_cache.sqlite"
+PROFILE_REPORT = ROOT_DIR / "output" / "build" / "catalog_profile.json"
+OUTPUT_SQLITE = ROOT_DIR / "output" / "catalog" / "configs_game.sqlite"
+MANIFEST_VERSION = 2
+WATCH_POLL_SECONDS = 0.5
+PARSER_VERSION = 2  # Bump when parse_row()/iter_xlsx_rows() change the rows they produce.
+ROWS_CACHE_VERSION = 3  # Bump when the RowStore schema changes.
+HASH_CHUNK_SIZE = 1 << 16
+JSON_CHUNK_ITEMS = 1024  # List elements per chunk when streaming JSON (see iter_json).
+SHARED_STRING_CACHE = 4096  # Recently used shared strings kept per worksheet reader.
+PIPELINE_WINDOW = 256  # Jobs in flight per worker pool, so streamed inputs are never queued whole.
+
+# Alias strategies for assets/icons_en. "auto" picks the cheapest one the filesystem supports.
+LINK_MODES = ("copy", "hardlink", "reflink", "symlink", "auto")
+AUTO_LINK_ORDER = ("reflink", "hardlink", "copy")
+FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, xfs, ...).
+
+ATLAS_WIDTH = 1024
+ATLAS_MAX_HEIGHT = 2048
+ATLAS_PADDING = 2
+
+# Widest canvas slot an icon is drawn into (battle cards: 66x60; shop cards use
+# 64x58 and 56x56), at 1x and 2x pixel density. game.js picks one by
+# devicePixelRatio (see iconVariantDir()). Variants are never upscaled past the
+# source icon.
+ICON_SLOT_WIDTH = 66
+ICON_VARIANT_WIDTHS = (ICON_SLOT_WIDTH, 2 * ICON_SLOT_WIDTH)
+ICON_FORMATS = ("png", "webp")
+
+# Highest shop tier (getTierForRound() in src/game.js); every pack gets one pool per tier.
+SHOP_MAX_TIER = 6
+
+# Precompressed siblings (--compress). An encoding is kept only when it saves at
+# least 10%, which in practice drops it for already-deflated PNG atlases.
+COMPRESS_EXTENSIONS = {"gzip": ".gz", "br": ".br"}
+COMPRESS_MIN_RATIO = 0.9
+
+# Pack keys end up in item ids, shard file names and URLs.
+PACK_KEY_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]*$")
 
 # Keep existing gameplay behavior for the current implemented roster.
 LEGACY_PET_KIND_MAP = {
@@ -234,6 +296,27 @@ LEGACY_FOOD_KIND_MAP = {
     },
 }
 
+# game_data.generated.js layouts. "compact" is decoded by decodeColumnarGameData() in src/game.js.
+OUTPUT_FORMATS = ("verbose", "compact")
+COMPACT_FORMAT = "columnar-v1"
+SHARD_PREFIX = "game_data."
+TEXT_PREFIX = "game_text."
+TEXT_LANGUAGES = ("en", "zh")  # Mirrors SUPPORTED_LANGUAGES in src/game.js.
+TEXT_FIELDS = ("nameZh", "nameEn", "hintZhRaw", "hintZhClean", "hintEn")
+COMPACT_ENUM_FIELDS = ("packKey", "implStatus", "abilityKey", "effectKey", "sourceSheet")
+
+# Source sheet layout: field -> (legacy column letter, accepted header labels).
+SOURCE_COLUMNS = {
+    "pack_name_zh": ("B", ("pack_name_zh", "兽群")),
+    "tier": ("D", ("tier", "等级")),
+    "round_unlock": ("E", ("round_unlock", "回合")),
+    "type_zh": ("F", ("type_zh", "类型")),
+    "icon_src_rel": ("H", ("icon_src_rel", "图片路径")),
+    "name_raw": ("I", ("name_raw", "名称")),
+    "hint_raw": ("J", ("hint_raw", "描述")),
+    "ocr_score": ("M", ("ocr_score", "ocr置信度")),
+}
+
 CATALOG_COLUMNS = [
     "id",
     "pack_key",
@@ -309,6 +392,42 @@ def placeholder_food_buff(tier: int) -> int:
     return 3
 
 
+def load_pack_registry(path: Path = PACKS_CONFIG) -> dict[str, dict[str, Any]]:
+    """Pack registry from ``assets/packs.json``, keyed by the workbook's pack name column.
+
+    Each entry is ``{"key", "name_en", "order"}``; ``order`` is the position in the file
+    and fixes the pack order of the catalog. Rows naming an unregistered pack are skipped.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Missing pack registry: {path}")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    registry: dict[str, dict[str, Any]] = {}
+    keys: set[str] = set()
+    for order, pack in enumerate(data.get("packs", [])):
+        name_zh, key = str(pack.get("nameZh", "")).strip(), str(pack.get("key", "")).strip()
+        if not name_zh or not PACK_KEY_PATTERN.match(key):
+            raise RuntimeError(f"Invalid pack entry #{order + 1} in {path.name}: {pack}")
+        if name_zh in registry or key in keys:
+            raise RuntimeError(f"Duplicate pack {name_zh!r} / {key!r} in {path.name}")
+        keys.add(key)
+        registry[name_zh] = {"key": key, "name_en": str(pack.get("nameEn") or key), "order": order}
+    if not registry:
+        raise RuntimeError(f"No packs registered in {path.name}")
+    return registry
+
+
+def load_stat_overrides() -> dict[str, dict[str, dict[str, int]]]:
+    """Tuned placeholder stats from ``assets/stat_overrides.json`` (written by scripts/tune_stats.py).
+
+    ``pets`` maps item ids to ``{"attack", "health"}`` and ``foods`` to ``{"placeholderBuff"}``;
+    they replace auto_pet_stats() and placeholder_food_buff() for those items.
+    """
+    if not STAT_OVERRIDES.exists():
+        return {"pets": {}, "foods": {}}
+    data = json.loads(STAT_OVERRIDES.read_text(encoding="utf-8"))
+    return {"pets": data.get("pets", {}), "foods": data.get("foods", {})}
+
+
 def color_from_id(item_id: str, is_food: bool) -> str:
     seed = fnv1a(item_id)
     # Pastel HSL -> RGB
@@ -350,20 +469,56 @@ class RawRow:
     source_row: int
 
 
-def parse_row(ws: Any, row_idx: int) -> RawRow | None:
-    pack_name_zh = str(ws[f"B{row_idx}"].value or "").strip()
-    tier_val = ws[f"D{row_idx}"].value
-    round_val = ws[f"E{row_idx}"].value
-    type_zh = str(ws[f"F{row_idx}"].value or "").strip()
-    icon_src_rel = str(ws[f"H{row_idx}"].value or "").strip().replace("\\", "/")
-    name_raw = str(ws[f"I{row_idx}"].value or "").strip()
-    hint_raw = str(ws[f"J{row_idx}"].value or "").strip()
-    score_val = ws[f"M{row_idx}"].value
+def column_index(letter: str) -> int:
+    index = 0
+    for ch in letter.upper():
+        index = index * 26 + (ord(ch) - ord("A") + 1)
+    return index - 1
+
+
+def _header_key(value: Any) -> str:
+    return re.sub(r"\s+", "", unicodedata.normalize("NFKC", str(value or ""))).lower()
+
+
+def resolve_source_columns(header: Sequence[Any] | None) -> dict[str, int]:
+    """Map each source field to a 0-based column index using the header row.
+
+    Fields whose header label is not recognized keep their legacy column letter,
+    so sheets with unknown or missing headers still parse with the fixed layout.
+    """
+    positions: dict[str, int] = {}
+    for index, value in enumerate(header or ()):
+        key = _header_key(value)
+        if key and key not in positions:
+            positions[key] = index
+
+    columns: dict[str, int] = {}
+    for field, (letter, labels) in SOURCE_COLUMNS.items():
+        columns[field] = column_index(letter)
+        for label in labels:
+            found = positions.get(_header_key(label))
+            if found is not None:
+                columns[field] = found
+                break
+    return columns
+
+
+def _cell(values: Sequence[Any], index: int) -> Any:
+    return values[index] if index < len(values) else None
+
+
+def parse_row(values: Sequence[Any], columns: dict[str, int], sheet_title: str, row_idx: int) -> RawRow | None:
+    pack_name_zh = str(_cell(values, columns["pack_name_zh"]) or "").strip()
+    tier_val = _cell(values, columns["tier"])
+    round_val = _cell(values, columns["round_unlock"])
+    type_zh = str(_cell(values, columns["type_zh"]) or "").strip()
+    icon_src_rel = str(_cell(values, columns["icon_src_rel"]) or "").strip().replace("\\", "/")
+    name_raw = str(_cell(values, columns["name_raw"]) or "").strip()
+    hint_raw = str(_cell(values, columns["hint_raw"]) or "").strip()
+    score_val = _cell(values, columns["ocr_score"])
 
     if not (pack_name_zh and type_zh and icon_src_rel and name_raw):
         return None
-    if pack_name_zh not in PACK_KEY_MAP:
-        return None
     if type_zh not in ("动物", "食物"):
         return None
 
@@ -383,113 +538,1263 @@ def parse_row(ws: Any, row_idx: int) -> RawRow | None:
         name_raw=name_raw,
         hint_raw=hint_raw,
         ocr_score=ocr_score,
-        source_sheet=ws.title,
+        source_sheet=sheet_title,
         source_row=row_idx,
     )
 
 
-def ensure_parent(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-
+def iter_sheet_rows(rows: Iterable[tuple[int, Sequence[Any]]], sheet_title: str) -> Iterator[RawRow]:
+    """Parse one worksheet's ``(row number, values)`` in a single pass; row 1 is the header."""
+    columns: dict[str, int] | None = None
+    for row_idx, values in rows:
+        if columns is None:
+            columns = resolve_source_columns(values if row_idx == 1 else None)
+            if row_idx == 1:
+                continue
+        parsed = parse_row(values, columns, sheet_title, row_idx)
+        if parsed:
+            yield parsed
 
-def _file_md5(path: Path) -> str:
-    return hashlib.md5(path.read_bytes()).hexdigest()
 
+def _xml_name(tag: str) -> str:
+    """Local name of an ElementTree tag or attribute, without its ``{namespace}``."""
+    return tag.rpartition("}")[2]
 
-def mark_suspicious_placeholder_pet_icons(pets: list[dict[str, Any]], foods: list[dict[str, Any]]) -> None:
-    pet_hash_to_indices: dict[str, list[int]] = {}
-    food_hashes: set[str] = set()
 
-    for index, food in enumerate(foods):
-        if food.get("iconMissing"):
+def _xlsx_rels(archive: zipfile.ZipFile, part: str) -> dict[str, tuple[str, str]]:
+    """``Id -> (relationship type, zip member)`` for the relationships of package ``part``."""
+    folder, name = posixpath.split(part)
+    try:
+        root = ElementTree.fromstring(archive.read(posixpath.join(folder, "_rels", f"{name}.rels")))
+    except KeyError:
+        return {}
+    rels: dict[str, tuple[str, str]] = {}
+    for rel in root:
+        target = rel.get("Target", "")
+        member = target.lstrip("/") if target.startswith("/") else posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get("Id", "")] = (rel.get("Type", "").rpartition("/")[2], member)
+    return rels
+
+
+def read_xlsx_layout(archive: zipfile.ZipFile) -> tuple[list[tuple[str, str]], str | None]:
+    """Worksheets as ``(title, zip member)`` in workbook order, plus the shared strings member."""
+    workbook = next(member for kind, member in _xlsx_rels(archive, "").values() if kind == "officeDocument")
+    rels = _xlsx_rels(archive, workbook)
+    sheets: list[tuple[str, str]] = []
+    for element in ElementTree.fromstring(archive.read(workbook)).iter():
+        if _xml_name(element.tag) != "sheet":
             continue
-        alias = food.get("iconAliasRel")
-        if not alias:
+        rel_id = next((value for key, value in element.attrib.items() if _xml_name(key) == "id"), "")
+        kind, member = rels.get(rel_id, ("", ""))
+        if kind == "worksheet":
+            sheets.append((element.get("name", ""), member))
+    shared_strings = next((member for kind, member in rels.values() if kind == "sharedStrings"), None)
+    return sheets, shared_strings
+
+
+def _rich_text(element: ElementTree.Element) -> str:
+    """Plain text of an ``si``/``is`` element: its ``t`` plus every run's ``t`` (phonetic runs are skipped)."""
+    parts: list[str] = []
+    for child in element:
+        name = _xml_name(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            parts.extend(run.text or "" for run in child if _xml_name(run.tag) == "t")
+    return "".join(parts)
+
+
+def iter_shared_strings(source: IO[bytes]) -> Iterator[str]:
+    """Stream a shared strings part, one string per ``si``, the way openpyxl decodes them."""
+    root = None
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = element
+        elif event == "end" and _xml_name(element.tag) == "si":
+            yield _rich_text(element).replace("x005F_", "")
+            root.clear()
+
+
+def _xlsx_cell_value(cell: ElementTree.Element, shared_strings: Callable[[int], str]) -> Any:
+    kind = cell.get("t", "n")
+    if kind == "inlineStr":
+        inline = next((child for child in cell if _xml_name(child.tag) == "is"), None)
+        return None if inline is None else _rich_text(inline)
+    text = next((child.text for child in cell if _xml_name(child.tag) == "v"), None)
+    if not text:
+        return None
+    if kind == "s":
+        return shared_strings(int(text))
+    if kind == "b":
+        return bool(int(text))
+    if kind == "n":
+        return float(text) if any(marker in text for marker in ".Ee") else int(text)
+    return text  # "str" formula results, "e" errors and "d" ISO dates stay as written.
+
+
+def iter_xlsx_rows(source: IO[bytes], shared_strings: Callable[[int], str]) -> Iterator[tuple[int, list[Any]]]:
+    """Stream ``(row number, cell values)`` from a worksheet part, one ``<row>`` at a time.
+
+    Values match openpyxl's read-only ``data_only`` mode (cached formula results, shared
+    and inline strings, bools, ints and floats), except that styles are not read, so
+    date-formatted cells stay serial numbers. Parsed rows are dropped from the tree as
+    soon as they are yielded.
+    """
+    sheet_data = None
+    row_idx = 0
+    for event, element in ElementTree.iterparse(source, events=("start", "end")):
+        name = _xml_name(element.tag)
+        if event == "start":
+            if name == "sheetData":
+                sheet_data = element
             continue
-        icon_path = ROOT_DIR / alias
-        if not icon_path.exists():
+        if name != "row":
             continue
-        food_hashes.add(_file_md5(icon_path))
+        row_idx = int(element.get("r") or row_idx + 1)
+        values: list[Any] = []
+        column = 0
+        for cell in element:
+            ref = cell.get("r")
+            column = column_index(ref.rstrip("0123456789")) + 1 if ref else column + 1
+            if column > len(values):
+                values.extend([None] * (column - len(values)))
+            values[column - 1] = _xlsx_cell_value(cell, shared_strings)
+        yield row_idx, values
+        if sheet_data is not None:
+            sheet_data.clear()
+
+
+class SharedStrings:
+    """A workbook's shared strings table, staged in SQLite so it is never held in memory.
+
+    ``stage()`` copies the table out of the xlsx once per build; every sheet reader (one
+    per worker process) then looks strings up by index through a small LRU cache, which
+    absorbs the pack names and row types repeated on every row.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.conn = sqlite3.connect(path)
+        self.lookup = lru_cache(maxsize=SHARED_STRING_CACHE)(self._lookup)
+
+    @staticmethod
+    def stage(archive: zipfile.ZipFile, member: str | None, path: Path) -> int:
+        """Write the strings of ``member`` to a new SQLite file at ``path``; returns their count."""
+        path.unlink(missing_ok=True)
+        with closing(sqlite3.connect(path)) as conn, conn:
+            conn.execute("CREATE TABLE shared_strings (idx INTEGER PRIMARY KEY, text TEXT NOT NULL)")
+            if member is None:
+                return 0
+            with archive.open(member) as source:
+                conn.executemany("INSERT INTO shared_strings VALUES (?, ?)", enumerate(iter_shared_strings(source)))
+            return conn.execute("SELECT COUNT(*) FROM shared_strings").fetchone()[0]
+
+    def _lookup(self, index: int) -> str:
+        row = self.conn.execute("SELECT text FROM shared_strings WHERE idx = ?", (index,)).fetchone()
+        if row is None:
+            raise IndexError(f"shared string {index} is out of range")
+        return row[0]
+
+    def texts(self, indexes: Collection[int]) -> dict[int, str]:
+        """The strings at ``indexes``, by index; out of range indexes are left out."""
+        return dict(
+            self.conn.execute(
+                "SELECT idx, text FROM shared_strings WHERE idx IN (SELECT value FROM json_each(?))",
+                (json.dumps(sorted(indexes)),),
+            )
+        )
+
+    def digest(self) -> bytes:
+        """sha256 of every string, with its index."""
+        digest = hashlib.sha256()
+        for index, text in self.conn.execute("SELECT idx, text FROM shared_strings ORDER BY idx"):
+            digest.update(f"{index}\0{text}\0".encode("utf-8"))
+        return digest.digest()
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+RAW_ROW_FIELDS = tuple(field.name for field in fields(RawRow))
+
+
+def parser_fingerprint(packs: dict[str, dict[str, Any]]) -> str:
+    """Fingerprint of everything besides the workbook that shapes parsed rows."""
+    parser = {"version": PARSER_VERSION, "columns": SOURCE_COLUMNS, "packs": packs, "fields": RAW_ROW_FIELDS}
+    return _json_sha256(parser)[:16]
+
+
+def rows_cache_key(source_sha256: str, packs: dict[str, dict[str, Any]]) -> str:
+    """Workbook content hash plus a fingerprint of everything that shapes parsed rows."""
+    return f"{source_sha256}:{parser_fingerprint(packs)}"
+
+
+# A shared string cell, and one whose value (the string's index) the scan can read.
+SHARED_STRING_CELL = re.compile(rb"""<(?:\w+:)?c\b[^>]*\bt=["']s["']""")
+SHARED_STRING_REF = re.compile(rb"""<(?:\w+:)?c\b[^>]*\bt=["']s["'][^>]*>\s*<(?:\w+:)?v>\s*(\d+)\s*<""")
+
+
+def sheet_cache_key(
+    archive: zipfile.ZipFile,
+    member: str,
+    title: str,
+    shared_strings: SharedStrings,
+    parser: str,
+) -> str:
+    """Content key of one worksheet: its title and XML, the shared strings it uses and the parser.
+
+    Cells only hold indexes into the shared strings table, which saving an edit to any
+    sheet may renumber, so each shared string cell is hashed with its text in place of
+    its index. Should a shared string cell not match the scan, the whole table is
+    hashed as well.
+    """
+    digest = hashlib.sha256(f"{parser}\0{title}\0".encode("utf-8"))
+    cells = matched = 0
+
+    def scan(buffer: bytes, end: int) -> None:
+        nonlocal cells, matched
+        cells += len(SHARED_STRING_CELL.findall(buffer, 0, end))
+        refs = list(SHARED_STRING_REF.finditer(buffer, 0, end))
+        matched += len(refs)
+        texts = shared_strings.texts({int(ref.group(1)) for ref in refs})
+        start = 0
+        for ref in refs:
+            digest.update(buffer[start : ref.start(1)])
+            # An index past the table keeps its digits, so the parser still sees the error.
+            text = texts.get(int(ref.group(1)))
+            digest.update(ref.group(1) if text is None else f"\0{text}\0".encode("utf-8"))
+            start = ref.end(1)
+        digest.update(buffer[start:end])
+
+    tail = b""
+    with archive.open(member) as source:
+        for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+            # Scan up to the last row boundary so no cell straddles two reads.
+            buffer = tail + chunk
+            end = buffer.rfind(b"row>")
+            cut = end + len(b"row>") if end >= 0 else 0
+            scan(buffer, cut)
+            tail = buffer[cut:]
+    scan(tail, len(tail))
+    if matched != cells:
+        digest.update(shared_strings.digest())
+    return digest.hexdigest()
+
+
+class RowStore:
+    """Parsed workbook rows in SQLite: ``ROWS_CACHE``, or a scratch file with ``--no-rows-cache``.
+
+    Sheets are parsed straight into ``raw_rows`` (every row of a registered pack,
+    duplicates included) under their own ``sheet_cache_key()``, so an edit re-parses
+    only the sheets it touched; ``workbook_sheets`` maps the latest workbook's cache key
+    to its sheets, and only that workbook's rows are kept. ``dedup()`` then picks each
+    item's winning row and orders the winners in SQL, and iterating the store streams
+    them, so no build stage holds every row at once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        ensure_parent(path)
+        self.conn = sqlite3.connect(path)
+        try:
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError:  # Not a database (e.g. a truncated cache): start over.
+            self.conn.close()
+            path.unlink()
+            self.conn = sqlite3.connect(path)
+            version = None
+        self.columns = ("sheet_key", "name_key", *RAW_ROW_FIELDS)
+        # Older builders reuse the file without setting user_version, so check the columns too.
+        columns = tuple(row[1] for row in self.conn.execute("PRAGMA table_info(raw_rows)"))
+        if version != ROWS_CACHE_VERSION or columns != self.columns:
+            self.conn.executescript(
+                f"""
+                DROP TABLE IF EXISTS raw_rows;
+                DROP TABLE IF EXISTS workbook_sheets;
+                CREATE TABLE raw_rows (
+                    sheet_key TEXT NOT NULL,
+                    name_key TEXT NOT NULL,
+                    {", ".join(RAW_ROW_FIELDS)}
+                );
+                CREATE INDEX raw_rows_sheet_key ON raw_rows (sheet_key);
+                CREATE TABLE workbook_sheets (
+                    cache_key TEXT NOT NULL,
+                    sheet_index INTEGER NOT NULL,
+                    sheet_key TEXT NOT NULL,
+                    PRIMARY KEY (cache_key, sheet_index)
+                );
+                PRAGMA user_version = {ROWS_CACHE_VERSION};
+                """
+            )
+        self.insert_sql = f"INSERT INTO raw_rows VALUES ({', '.join('?' for _ in self.columns)})"
+
+    def workbook_sheets(self, cache_key: str) -> list[str] | None:
+        """Sheet keys of the workbook stored under ``cache_key``, in workbook order; ``None`` if it is not."""
+        rows = self.conn.execute(
+            "SELECT sheet_key FROM workbook_sheets WHERE cache_key = ? ORDER BY sheet_index", (cache_key,)
+        ).fetchall()
+        return [sheet_key for (sheet_key,) in rows] or None
+
+    def has_sheet(self, sheet_key: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM raw_rows WHERE sheet_key = ? LIMIT 1", (sheet_key,))
+        return row.fetchone() is not None
+
+    def keep_workbook(self, cache_key: str, sheet_keys: Sequence[str]) -> None:
+        """Record ``sheet_keys`` as the workbook under ``cache_key`` and drop every other sheet's rows."""
+        with self.conn:
+            self.conn.execute("DELETE FROM workbook_sheets")
+            self.conn.executemany(
+                "INSERT INTO workbook_sheets VALUES (?, ?, ?)",
+                ((cache_key, index, sheet_key) for index, sheet_key in enumerate(sheet_keys)),
+            )
+            self.conn.execute(
+                "DELETE FROM raw_rows WHERE sheet_key NOT IN (SELECT value FROM json_each(?))",
+                (json.dumps(list(sheet_keys)),),
+            )
 
-    for index, pet in enumerate(pets):
-        if pet.get("iconMissing"):
-            continue
-        alias = pet.get("iconAliasRel")
-        if not alias:
-            continue
-        icon_path = ROOT_DIR / alias
-        if not icon_path.exists():
-            continue
-        h = _file_md5(icon_path)
-        pet_hash_to_indices.setdefault(h, []).append(index)
+    def add_sheet(
+        self,
+        archive: zipfile.ZipFile,
+        member: str,
+        title: str,
+        shared_strings: SharedStrings,
+        packs: dict[str, dict[str, Any]],
+        sheet_key: str,
+    ) -> dict[str, int]:
+        """Parse one worksheet into ``raw_rows``; returns row counts per unregistered pack name."""
+        unregistered: dict[str, int] = {}
+
+        def rows() -> Iterator[tuple[Any, ...]]:
+            with archive.open(member) as source:
+                for parsed in iter_sheet_rows(iter_xlsx_rows(source, shared_strings.lookup), title):
+                    if parsed.pack_name_zh in packs:
+                        yield (sheet_key, normalize_name(parsed.name_raw), *astuple(parsed))
+                    else:
+                        unregistered[parsed.pack_name_zh] = unregistered.get(parsed.pack_name_zh, 0) + 1
+
+        self.conn.executemany(self.insert_sql, rows())
+        return unregistered
+
+    def merge(self, path: Path) -> None:
+        """Copy every row of another store (a worker's output) into this one."""
+        with closing(sqlite3.connect(path)) as other:
+            self.conn.executemany(self.insert_sql, other.execute(f"SELECT {', '.join(self.columns)} FROM raw_rows"))
+
+    def dedup(self, sheet_keys: Sequence[str], packs: dict[str, dict[str, Any]]) -> int:
+        """Stage the winning rows of the sheets ``sheet_keys``, in catalog order; returns how many there are.
+
+        Per (pack, type, normalized name) the highest OCR score wins and ties keep the
+        earlier sheet and row. Winners are ordered by pack order, pets first, tier,
+        normalized name and source row.
+        """
+        columns = ", ".join(RAW_ROW_FIELDS)
+        with self.conn:
+            self.conn.execute("DROP TABLE IF EXISTS temp.pack_order")
+            self.conn.execute("DROP TABLE IF EXISTS temp.sheet_order")
+            self.conn.execute("DROP TABLE IF EXISTS temp.winners")
+            self.conn.execute("CREATE TEMP TABLE pack_order (name TEXT PRIMARY KEY, position INTEGER NOT NULL)")
+            self.conn.executemany(
+                "INSERT INTO temp.pack_order VALUES (?, ?)", ((name, meta["order"]) for name, meta in packs.items())
+            )
+            self.conn.execute("CREATE TEMP TABLE sheet_order (sheet_key TEXT PRIMARY KEY, position INTEGER NOT NULL)")
+            self.conn.executemany(
+                "INSERT INTO temp.sheet_order VALUES (?, ?)", ((key, index) for index, key in enumerate(sheet_keys))
+            )
+            self.conn.execute(f"CREATE TEMP TABLE winners (seq INTEGER PRIMARY KEY, {columns})")
+            self.conn.execute("CREATE INDEX temp.winners_pack ON winners (pack_name_zh, seq)")
+            self.conn.execute(
+                f"""
+                INSERT INTO temp.winners
+                SELECT ROW_NUMBER() OVER (
+                    ORDER BY pack_position, type_zh <> '动物', tier, name_key, source_row
+                ), {columns}
+                FROM (
+                    SELECT raw_rows.*, pack_order.position AS pack_position, ROW_NUMBER() OVER (
+                        PARTITION BY pack_name_zh, type_zh, name_key
+                        ORDER BY ocr_score DESC, sheet_order.position, source_row
+                    ) AS rank
+                    FROM raw_rows
+                    JOIN temp.sheet_order ON sheet_order.sheet_key = raw_rows.sheet_key
+                    JOIN temp.pack_order ON pack_order.name = raw_rows.pack_name_zh
+                )
+                WHERE rank = 1
+                """
+            )
+        return self.conn.execute("SELECT COUNT(*) FROM temp.winners").fetchone()[0]
 
-    overlapping_hashes = set(pet_hash_to_indices).intersection(food_hashes)
-    for h in overlapping_hashes:
-        for pet_index in pet_hash_to_indices[h]:
-            pet = pets[pet_index]
-            if pet.get("implStatus") == "placeholder":
-                pet["iconMissing"] = True
+    def __iter__(self) -> Iterator[RawRow]:
+        """The winning rows staged by ``dedup()``, in catalog order."""
+        return self.iter_packs()
 
+    def iter_packs(self, pack_names: Collection[str] | None = None) -> Iterator[RawRow]:
+        """The winning rows of the packs named ``pack_names`` (every pack when ``None``), in catalog order."""
+        select = f"SELECT {', '.join(RAW_ROW_FIELDS)} FROM temp.winners"
+        if pack_names is None:
+            rows = self.conn.execute(f"{select} ORDER BY seq")
+        else:
+            rows = self.conn.execute(
+                f"{select} WHERE pack_name_zh IN (SELECT value FROM json_each(?)) ORDER BY seq",
+                (json.dumps(sorted(pack_names), ensure_ascii=False),),
+            )
+        for values in rows:
+            yield RawRow(*values)
+
+    def pack_digests(self) -> dict[str, str]:
+        """sha256 of each pack's winning rows, by pack name: what a ``--watch`` rebuild compares."""
+        digests: dict[str, Any] = {}
+        rows = self.conn.execute(
+            f"SELECT pack_name_zh, json_array({', '.join(RAW_ROW_FIELDS)}) FROM temp.winners ORDER BY seq"
+        )
+        for pack_name_zh, values in rows:
+            digest = digests.get(pack_name_zh)
+            if digest is None:
+                digest = digests[pack_name_zh] = hashlib.sha256()
+            digest.update(values.encode("utf-8"))
+        return {name: digest.hexdigest() for name, digest in digests.items()}
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def parse_sheet(
+    source: str,
+    member: str,
+    title: str,
+    strings_path: str,
+    packs: dict[str, dict[str, Any]],
+    rows_path: str,
+    sheet_key: str,
+) -> dict[str, int]:
+    """Parse one worksheet into a new row store at ``rows_path``; returns unregistered pack row counts.
+
+    Runs in a worker process with its own zip handle and shared strings reader.
+    """
+    with (
+        zipfile.ZipFile(source) as archive,
+        closing(SharedStrings(Path(strings_path))) as shared_strings,
+        closing(RowStore(Path(rows_path))) as store,
+        store.conn,
+    ):
+        return store.add_sheet(archive, member, title, shared_strings, packs, sheet_key)
+
+
+def read_workbook_rows(
+    profiler: BuildProfiler,
+    store: RowStore,
+    cache_key: str,
+    packs: dict[str, dict[str, Any]],
+    scratch_dir: Path,
+    workers: int | None = None,
+) -> list[str]:
+    """Bring ``store`` up to date with ``SOURCE_XLSX``; returns the workbook's sheet keys in order.
+
+    Only sheets whose ``sheet_cache_key()`` the store lacks are parsed, in a process
+    pool when there are several of them and several workers; each worker writes its
+    own scratch store, merged in workbook order. Rows are streamed from the xlsx to
+    SQLite, so memory does not grow with the workbook.
+    """
+    strings_path = scratch_dir / "shared_strings.sqlite"
+    with profiler.phase("open_workbook") as stats:
+        parser = parser_fingerprint(packs)
+        with zipfile.ZipFile(SOURCE_XLSX) as archive:
+            sheets, strings_member = read_xlsx_layout(archive)
+            stats["strings"] = SharedStrings.stage(archive, strings_member, strings_path)
+            with closing(SharedStrings(strings_path)) as shared_strings:
+                sheet_keys = [
+                    sheet_cache_key(archive, member, title, shared_strings, parser) for title, member in sheets
+                ]
+        stale = [
+            (title, member, sheet_key)
+            for (title, member), sheet_key in zip(sheets, sheet_keys)
+            if not store.has_sheet(sheet_key)
+        ]
+        stats["files"] = 1
+        stats["bytesRead"] = SOURCE_XLSX.stat().st_size
+        stats["cachedSheets"] = len(sheets) - len(stale)
+
+    with profiler.phase("parse_rows") as stats:
+        unregistered: dict[str, int] = {}
+        processes = min(len(stale), workers or os.cpu_count() or 1)
+        if processes > 1:
+            rows_paths = [str(scratch_dir / f"rows-{index}.sqlite") for index in range(len(stale))]
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                per_sheet = list(
+                    pool.map(
+                        parse_sheet,
+                        repeat(str(SOURCE_XLSX)),
+                        [member for _, member, _ in stale],
+                        [title for title, _, _ in stale],
+                        repeat(str(strings_path)),
+                        repeat(packs),
+                        rows_paths,
+                        [sheet_key for _, _, sheet_key in stale],
+                    )
+                )
+            for rows_path in rows_paths:
+                store.merge(Path(rows_path))
+                Path(rows_path).unlink()
+        else:
+            with zipfile.ZipFile(SOURCE_XLSX) as archive, closing(SharedStrings(strings_path)) as shared_strings:
+                per_sheet = [
+                    store.add_sheet(archive, member, title, shared_strings, packs, sheet_key)
+                    for title, member, sheet_key in stale
+                ]
+        store.conn.commit()
+        store.keep_workbook(cache_key, sheet_keys)
+        for skipped in per_sheet:
+            for name, count in skipped.items():
+                unregistered[name] = unregistered.get(name, 0) + count
+        for name, count in sorted(unregistered.items()):
+            print(f"Warning: skipped {count} row(s) of pack {name!r}, which is not in {PACKS_CONFIG.name}", file=sys.stderr)
+        stats["sheets"] = len(stale)
+        stats["rows"] = store.conn.execute("SELECT COUNT(*) FROM raw_rows").fetchone()[0]
+    return sheet_keys
 
-def build_catalog() -> dict[str, Any]:
-    if not SOURCE_XLSX.exists():
-        raise FileNotFoundError(f"Missing source config: {SOURCE_XLSX}")
-    if not ICONS_DIR.exists():
-        raise FileNotFoundError(f"Missing icon source dir: {ICONS_DIR}")
 
-    wb = load_workbook(SOURCE_XLSX, data_only=True, read_only=True)
-    sheet_names = wb.sheetnames[:6]
-    if len(sheet_names) < 6:
-        raise RuntimeError("Expected 6 pack sheets in configs.xlsx")
-
-    dedup: dict[tuple[str, str, str], RawRow] = {}
-    for sheet in sheet_names:
-        ws = wb[sheet]
-        for row_idx in range(2, ws.max_row + 1):
-            parsed = parse_row(ws, row_idx)
-            if not parsed:
-                continue
-            key = (parsed.pack_name_zh, parsed.type_zh, normalize_name(parsed.name_raw))
-            prev = dedup.get(key)
-            if not prev or parsed.ocr_score > prev.ocr_score:
-                dedup[key] = parsed
-
-    rows = sorted(
-        dedup.values(),
-        key=lambda r: (
-            PACK_KEY_MAP[r.pack_name_zh]["key"],
-            0 if r.type_zh == "动物" else 1,
-            r.tier,
-            normalize_name(r.name_raw),
-            r.source_row,
-        ),
-    )
-    if not rows:
-        raise RuntimeError("No valid rows parsed from configs.xlsx")
+def ensure_parent(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_file_sha256(src_path: Path, dst_path: Path) -> str:
+    """Copy a file and hash its bytes in the same streaming pass."""
+    digest = hashlib.sha256()
+    with src_path.open("rb") as src, dst_path.open("wb") as dst:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+class JsonSpool:
+    """A JSON array (or, with ``"{}"`` brackets, object) written to a temp file one element at a time.
+
+    ``iter_json`` streams a spool in place wherever it sits in a value, so the writers
+    emit catalog-sized arrays without holding them. Elements are appended as compact JSON
+    text (object members as ``"key":value``), one per line, and come back in the order
+    they were written whatever ``sort_keys`` says. Append everything before reading.
+    """
+
+    def __init__(self, brackets: str = "[]") -> None:
+        self.brackets = brackets
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="\n")
+        self.count = 0
+
+    def append(self, element: str) -> None:
+        self.file.write(element + "\n")
+        self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[str]:
+        self.file.seek(0)
+        for line in self.file:
+            yield line[:-1]
+
+    def iter_chunks(self) -> Iterator[str]:
+        yield self.brackets[0]
+        for index, element in enumerate(self):
+            yield f",{element}" if index else element
+        yield self.brackets[1]
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def iter_entries(entries: JsonSpool | Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """The entries of a list or of a spool of entry objects."""
+    if isinstance(entries, JsonSpool):
+        return (json.loads(text) for text in entries)
+    return iter(entries)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, ShopPools):
+        return value.to_json()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_json(value: Any, sort_keys: bool = False) -> Iterator[str]:
+    """Compact JSON for ``value`` in chunks, byte-identical to one ``json.dumps`` call.
+
+    Dicts and lists are walked so no chunk is larger than one list element; runs of
+    scalars are batched through the C encoder to keep the chunk count down. Int
+    ``array``s encode as lists and ``JsonSpool``s as the array or object they hold.
+    """
+    dumps = partial(json.dumps, ensure_ascii=False, sort_keys=sort_keys, separators=(",", ":"), default=_json_default)
+    if isinstance(value, JsonSpool):
+        yield from value.iter_chunks()
+    elif isinstance(value, dict):
+        yield "{"
+        items = sorted(value.items()) if sort_keys else value.items()
+        for index, (key, item) in enumerate(items):
+            yield f"{',' if index else ''}{dumps(str(key))}:"
+            yield from iter_json(item, sort_keys)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "["
+        for start in range(0, len(value), JSON_CHUNK_ITEMS):
+            batch = value[start : start + JSON_CHUNK_ITEMS]
+            if start:
+                yield ","
+            if any(isinstance(item, (dict, list, tuple, array, JsonSpool)) for item in batch):
+                for index, item in enumerate(batch):
+                    if index:
+                        yield ","
+                    if isinstance(item, (list, tuple, JsonSpool)):
+                        yield from iter_json(item, sort_keys)
+                    else:
+                        yield dumps(item)
+            else:
+                yield dumps(batch)[1:-1]
+        yield "]"
+    else:
+        yield dumps(value)
+
+
+def _json_sha256(value: Any) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter_json(value, sort_keys=True):
+        digest.update(chunk.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def root_rel(path: Path) -> str:
+    return path.relative_to(ROOT_DIR).as_posix()
+
+
+class ManifestSection(MutableMapping):
+    """One ``key -> record`` section of the build manifest, stored as a table.
+
+    Records are JSON objects read and written one at a time, so the manifest costs no
+    memory however many icons and outputs it tracks. ``mark_all_stale()`` and
+    ``drop_stale()`` bracket a pass that rewrites every live key, for sections (like
+    the icons) that must end up holding exactly this build's records.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, table: str) -> None:
+        self.conn = conn
+        self.table = table
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, record TEXT NOT NULL, live INTEGER NOT NULL)"
+        )
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        row = self.conn.execute(f"SELECT record FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __setitem__(self, key: str, record: dict[str, Any]) -> None:
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, 1)",
+            (key, json.dumps(record, ensure_ascii=False, sort_keys=True)),
+        )
+
+    def set_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """``self[key] = record`` for each item, in one statement."""
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, 1)",
+            ((key, json.dumps(record, ensure_ascii=False, sort_keys=True)) for key, record in items),
+        )
+
+    def __delitem__(self, key: str) -> None:
+        if self.conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,)).rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for (key,) in self.conn.execute(f"SELECT key FROM {self.table} ORDER BY key"):
+            yield key
+
+    def __len__(self) -> int:
+        return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def clear(self) -> None:
+        self.conn.execute(f"DELETE FROM {self.table}")
+
+    def mark_all_stale(self) -> None:
+        self.conn.execute(f"UPDATE {self.table} SET live = 0")
+
+    def drop_stale(self) -> None:
+        """Delete every record not written since ``mark_all_stale()``."""
+        self.conn.execute(f"DELETE FROM {self.table} WHERE live = 0")
 
-    if ICONS_EN_DIR.exists():
-        shutil.rmtree(ICONS_EN_DIR)
-    ICONS_EN_DIR.mkdir(parents=True, exist_ok=True)
 
+class BuildManifest:
+    """Hashes of the last build's source, alias icons and outputs, kept in ``BUILD_MANIFEST``.
+
+    ``icons`` (alias rel -> record) and ``outputs`` (output rel -> record) are
+    ``ManifestSection`` tables; ``source`` is the workbook's file record. Everything a
+    build changes is one SQLite transaction that ``save()`` commits, so a failed build
+    leaves the previous manifest as it was.
+    """
+
+    def __init__(self, path: Path = BUILD_MANIFEST, fresh: bool = False) -> None:
+        ensure_parent(path)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        try:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        except sqlite3.DatabaseError:  # Not a database (e.g. a truncated manifest): start over.
+            self.conn.close()
+            path.unlink()
+            self.conn = sqlite3.connect(path)
+            self.conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.icons = ManifestSection(self.conn, "icons")
+        self.outputs = ManifestSection(self.conn, "outputs")
+        self.conn.commit()
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if fresh or meta.get("version") != str(MANIFEST_VERSION):
+            self.icons.clear()
+            self.outputs.clear()
+            meta = {}
+        self.source: dict[str, Any] = json.loads(meta.get("source", "{}"))
+
+    def save(self) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            (("version", str(MANIFEST_VERSION)), ("source", json.dumps(self.source, sort_keys=True))),
+        )
+        self.conn.commit()
+
+
+def empty_manifest(path: Path = BUILD_MANIFEST) -> BuildManifest:
+    """A manifest that starts with no records; saving it replaces the previous build's."""
+    return BuildManifest(path, fresh=True)
+
+
+def load_manifest(path: Path = BUILD_MANIFEST) -> BuildManifest:
+    return BuildManifest(path)
+
+
+def save_manifest(manifest: BuildManifest) -> None:
+    manifest.save()
+
+
+def _stat_matches(stat: os.stat_result, record: dict[str, Any] | None) -> bool:
+    return bool(record) and record.get("size") == stat.st_size and record.get("mtimeNs") == stat.st_mtime_ns
+
+
+def file_record(path: Path, previous: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Return size/mtime/sha256 for a file, reusing the previous hash when stat is unchanged."""
+    stat = path.stat()
+    if _stat_matches(stat, previous) and previous.get("sha256"):
+        sha256 = previous["sha256"]
+    else:
+        sha256 = _file_sha256(path)
+    return {"size": stat.st_size, "mtimeNs": stat.st_mtime_ns, "sha256": sha256}
+
+
+def file_matches_record(path: Path, record: dict[str, Any] | None) -> bool:
+    if not record or not path.exists():
+        return False
+    return file_record(path, record)["sha256"] == record.get("sha256")
+
+
+def _reflink_file(src_path: Path, alias_path: Path) -> None:
+    import fcntl  # POSIX only; ImportError is treated like an unsupported filesystem.
+
+    with src_path.open("rb") as src, alias_path.open("wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
+def _link_file(src_path: Path, alias_path: Path, mode: str) -> str | None:
+    """Create one alias; returns the content hash when the bytes were streamed through."""
+    if mode == "hardlink":
+        os.link(src_path, alias_path)
+    elif mode == "reflink":
+        _reflink_file(src_path, alias_path)
+    elif mode == "symlink":
+        os.symlink(os.path.relpath(src_path, alias_path.parent), alias_path)
+    else:
+        return _copy_file_sha256(src_path, alias_path)
+    return None
+
+
+def link_alias_icon(src_path: Path, alias_path: Path, link_mode: str) -> tuple[str, str | None]:
+    """Materialize ``alias_path`` from ``src_path``.
+
+    Returns the strategy that was used and, for copies, the sha256 of the copied bytes.
+
+    Strategies are tried in order; any that the platform or filesystem rejects falls
+    through to the next one, ending with a plain copy.
+    """
+    strategies = AUTO_LINK_ORDER if link_mode == "auto" else (link_mode, "copy")
+    ensure_parent(alias_path)
+    for mode in dict.fromkeys(strategies):
+        # Never write through an existing alias: it may be a link to the source itself.
+        alias_path.unlink(missing_ok=True)
+        try:
+            sha256 = _link_file(src_path, alias_path, mode)
+        except (OSError, ImportError, NotImplementedError):
+            if mode == "copy":
+                raise
+            continue
+        return mode, sha256
+    raise AssertionError("copy strategy must always be attempted")
+
+
+def alias_is_current(src_path: Path, alias_path: Path, previous: dict[str, Any]) -> bool:
+    mode = previous.get("mode")
+    if mode == "symlink":
+        return alias_path.is_symlink() and os.readlink(alias_path) == os.path.relpath(src_path, alias_path.parent)
+    if alias_path.is_symlink():
+        return False
+    if mode == "hardlink":
+        return alias_path.exists() and os.path.samefile(src_path, alias_path)
+    return file_matches_record(alias_path, previous.get("alias"))
+
+
+def sync_alias_icon(
+    src_path: Path,
+    alias_path: Path,
+    previous: dict[str, Any] | None,
+    incremental: bool,
+    link_mode: str = "copy",
+) -> tuple[dict[str, Any], str]:
+    """Alias one source icon unless the existing alias is still current.
+
+    Returns the manifest record for the alias and the action taken: ``"kept"`` or
+    the strategy used to (re)create it.
+    """
+    src_stat = src_path.stat()
+    previous_src = (previous or {}).get("src")
+    if (
+        incremental
+        and previous
+        and previous.get("linkMode") == link_mode
+        and _stat_matches(src_stat, previous_src)
+        and alias_is_current(src_path, alias_path, previous)
+    ):
+        return previous, "kept"
+
+    # Copies hash the bytes as they stream through; links never read the file,
+    # so their hash comes from the previous record or one read of the source.
+    sha256 = previous_src["sha256"] if _stat_matches(src_stat, previous_src) else None
+    if sha256 is None and link_mode != "copy":
+        sha256 = _file_sha256(src_path)
+    mode, copied_sha256 = link_alias_icon(src_path, alias_path, link_mode)
+    sha256 = copied_sha256 or sha256
+    src = {"size": src_stat.st_size, "mtimeNs": src_stat.st_mtime_ns, "sha256": sha256}
+    stat = alias_path.stat()
+    alias = {"size": stat.st_size, "mtimeNs": stat.st_mtime_ns, "sha256": sha256}
+    return {"src": src, "alias": alias, "linkMode": link_mode, "mode": mode}, mode
+
+
+def iter_pool_map(
+    pool: Executor,
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    window: int = PIPELINE_WINDOW,
+) -> Iterator[tuple[Any, Any]]:
+    """``(item, fn(item))`` in input order, like ``pool.map`` with at most ``window`` items in flight.
+
+    ``pool.map`` submits every item up front; this pulls ``items`` lazily, so a streamed
+    input is never queued (or held) whole.
+    """
+    pending: deque[tuple[Any, Any]] = deque()
+    for item in items:
+        pending.append((item, pool.submit(fn, item)))
+        if len(pending) >= window:
+            done, future = pending.popleft()
+            yield done, future.result()
+    while pending:
+        done, future = pending.popleft()
+        yield done, future.result()
+
+
+def iter_batches(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def run_icon_stage(
+    icon_jobs: Iterable[tuple[str, Path, Path, dict[str, Any] | None]],
+    incremental: bool,
+    link_mode: str,
+    workers: int | None = None,
+) -> Iterator[tuple[str, dict[str, Any], str]]:
+    """Alias icons on a thread pool as ``icon_jobs`` streams in; yields ``(alias_rel, record, action)`` in job order.
+
+    Each job is ``(alias_rel, src_path, alias_path, previous record)``; the caller looks
+    the previous record up, since the manifest must stay on the calling thread. Jobs run
+    ``PIPELINE_WINDOW`` at a time and each window finishes before the next is read: the
+    caller's Python work would otherwise contend with the workers for the GIL.
+    """
+
+    def run(job: tuple[str, Path, Path, dict[str, Any] | None]) -> tuple[dict[str, Any], str]:
+        _, src_path, alias_path, previous = job
+        return sync_alias_icon(src_path, alias_path, previous, incremental, link_mode)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in iter_batches(icon_jobs, PIPELINE_WINDOW):
+            results = list(pool.map(run, batch))
+            for job, (record, action) in zip(batch, results):
+                yield job[0], record, action
+
+
+def remove_stale_files(root: Path, keep: Callable[[str], bool]) -> int:
+    """Delete every file under ``root`` whose root-relative path ``keep`` rejects, then any emptied directories."""
+    removed = 0
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        rel_dir = Path(dirpath).relative_to(ROOT_DIR).as_posix()
+        for name in filenames:
+            if not keep(f"{rel_dir}/{name}"):
+                os.unlink(os.path.join(dirpath, name))
+                removed += 1
+        if dirpath != str(root) and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+    return removed
+
+
+def remove_stale_aliases(icons: IconIndex) -> int:
+    return remove_stale_files(ICONS_EN_DIR, icons.has_icon)
+
+
+class IconInfo(NamedTuple):
+    sha256: str | None
+    missing: bool
+    atlas: int | None
+    x: int | None
+    y: int | None
+    w: int | None
+    h: int | None
+
+
+class IconIndex:
+    """This build's alias icons in a scratch SQLite table, one row per catalog entry.
+
+    The icon stage adds each alias with its content hash; the placeholder check, icon
+    store, variants, atlases, fingerprinting and the SQLite export then query the table
+    instead of holding maps of every icon, and the writers look entries up by alias as
+    they stream past. ``missing`` starts as "no source icon" and gains the placeholder
+    pets flagged by ``mark_placeholder_clashes()``. A ``--watch`` session keeps the
+    index between rebuilds, re-adding the packs whose rows changed and updating the
+    aliases of changed source icons in place.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            f"""
+            CREATE TABLE icons (
+                alias_rel TEXT PRIMARY KEY,
+                pack_key TEXT NOT NULL,
+                type_key TEXT NOT NULL,
+                placeholder INTEGER NOT NULL,
+                src_rel TEXT NOT NULL,
+                missing INTEGER NOT NULL,
+                sha256 TEXT,
+                size INTEGER,
+                action TEXT,
+                atlas INTEGER,
+                x INTEGER,
+                y INTEGER,
+                w INTEGER,
+                h INTEGER
+            );
+            CREATE INDEX icons_sha256 ON icons (sha256);
+            CREATE INDEX icons_pack_sha256 ON icons (pack_key, sha256);
+            CREATE INDEX icons_src_rel ON icons (src_rel);
+            CREATE INDEX icons_icon_hash ON icons (substr(sha256, 1, {ICON_HASH_LENGTH}));
+            """
+        )
+        self.packs: list[str] = []
+        self.get = lru_cache(maxsize=16)(self._get)
+
+    def add(self, rows: list[tuple[str, str, str, bool, str, str | None, int | None, str | None]]) -> None:
+        """Index entries' aliases as ``(alias_rel, pack_key, type_key, placeholder, src_rel, sha256, size, action)``.
+
+        A ``None`` sha256 means the entry's source icon is missing.
+        """
+        self.conn.executemany(
+            """
+            INSERT INTO icons (alias_rel, pack_key, type_key, placeholder, src_rel, missing, sha256, size, action)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            ((*row[:5], row[5] is None, *row[5:]) for row in rows),
+        )
+
+    def update(self, rows: list[tuple[str, str | None, int | None, str]]) -> None:
+        """Re-point aliases at re-synced source icons, as ``(alias_rel, sha256, size, action)``."""
+        self.get.cache_clear()
+        self.conn.executemany(
+            "UPDATE icons SET sha256 = ?2, size = ?3, action = ?4, missing = ?2 IS NULL WHERE alias_rel = ?1", rows
+        )
+
+    def add_pack(self, pack_key: str) -> None:
+        """Note a pack with entries; packs keep the order they are first noted in."""
+        if pack_key not in self.packs:
+            self.packs.append(pack_key)
+
+    def drop_packs(self, pack_keys: Collection[str]) -> list[str]:
+        """Remove the entries of ``pack_keys``; returns their alias rels, for stale alias cleanup."""
+        self.get.cache_clear()
+        keys = json.dumps(sorted(pack_keys))
+        select = "FROM icons WHERE pack_key IN (SELECT value FROM json_each(?))"
+        aliases = [alias_rel for (alias_rel,) in self.conn.execute(f"SELECT alias_rel {select}", (keys,))]
+        self.conn.execute(f"DELETE {select}", (keys,))
+        self.packs = [pack_key for pack_key in self.packs if pack_key not in pack_keys]
+        return aliases
+
+    def order_packs(self, pack_keys: Sequence[str]) -> None:
+        """Put the packs with entries in the catalog order ``pack_keys`` gives."""
+        position = {pack_key: index for index, pack_key in enumerate(pack_keys)}
+        self.packs.sort(key=position.__getitem__)
+
+    def aliases_of(self, src_rels: Collection[str]) -> list[tuple[str, str]]:
+        """``(alias_rel, src_rel)`` of the entries showing any of the source icons ``src_rels``."""
+        return self.conn.execute(
+            "SELECT alias_rel, src_rel FROM icons WHERE src_rel IN (SELECT value FROM json_each(?)) ORDER BY alias_rel",
+            (json.dumps(sorted(src_rels), ensure_ascii=False),),
+        ).fetchall()
+
+    def clear_actions(self) -> None:
+        """Mark every alias kept, before a ``--watch`` rebuild records the ones it touches."""
+        self.conn.execute("UPDATE icons SET action = 'kept' WHERE action IS NOT NULL")
+
+    def mark_placeholder_clashes(self) -> int:
+        """Flag placeholder pets whose icon bytes equal a food icon, clearing earlier flags; returns how many."""
+        self.get.cache_clear()
+        self.conn.execute("UPDATE icons SET missing = sha256 IS NULL")
+        return self.conn.execute(
+            """
+            UPDATE icons SET missing = 1
+            WHERE type_key = 'pet' AND placeholder AND NOT missing AND sha256 IN (
+                SELECT sha256 FROM icons WHERE type_key = 'food' AND NOT missing AND sha256 IS NOT NULL
+            )
+            """
+        ).rowcount
+
+    def _get(self, alias_rel: str) -> IconInfo:
+        row = self.conn.execute(
+            "SELECT sha256, missing, atlas, x, y, w, h FROM icons WHERE alias_rel = ?", (alias_rel,)
+        ).fetchone()
+        return IconInfo(row[0], bool(row[1]), *row[2:])
+
+    def has_icon(self, alias_rel: str) -> bool:
+        """Whether ``alias_rel`` is an alias icon of this build."""
+        row = self.conn.execute("SELECT 1 FROM icons WHERE alias_rel = ? AND sha256 IS NOT NULL", (alias_rel,))
+        return row.fetchone() is not None
+
+    def has_store_icon(self, icon_hash: str) -> bool:
+        """Whether some entry with an icon uses the icon store file named ``icon_hash``."""
+        row = self.conn.execute(
+            f"SELECT 1 FROM icons WHERE substr(sha256, 1, {ICON_HASH_LENGTH}) = ? AND NOT missing LIMIT 1", (icon_hash,)
+        )
+        return row.fetchone() is not None
+
+    def alias_icons(self) -> Iterator[tuple[str, str]]:
+        """``(alias_rel, sha256)`` of every alias icon, by path."""
+        yield from self.conn.execute("SELECT alias_rel, sha256 FROM icons WHERE sha256 IS NOT NULL ORDER BY alias_rel")
+
+    def store_icons(self) -> Iterator[tuple[str, str]]:
+        """``(sha256, a source alias_rel)`` of every distinct icon an entry shows, by hash."""
+        yield from self.conn.execute(
+            "SELECT sha256, MIN(alias_rel) FROM icons WHERE sha256 IS NOT NULL AND NOT missing GROUP BY sha256 ORDER BY sha256"
+        )
+
+    def distinct_icons(self) -> Iterator[tuple[str, int, str]]:
+        """``(sha256, size, first alias_rel)`` per distinct alias icon, in order of that alias."""
+        yield from self.conn.execute(
+            """
+            SELECT sha256, size, MIN(alias_rel) AS first_alias FROM icons
+            WHERE sha256 IS NOT NULL GROUP BY sha256 ORDER BY first_alias
+            """
+        )
+
+    def pack_keys(self) -> list[str]:
+        """Packs with entries, in catalog order."""
+        return list(self.packs)
+
+    def pack_sprites(self, pack_key: str) -> Iterator[tuple[str, str]]:
+        """``(sha256, alias_rel)`` per distinct icon shown by the entries of one pack."""
+        yield from self.conn.execute(
+            """
+            SELECT sha256, MIN(alias_rel) FROM icons
+            WHERE pack_key = ? AND sha256 IS NOT NULL AND NOT missing GROUP BY sha256
+            """,
+            (pack_key,),
+        )
+
+    def clear_placements(self) -> None:
+        self.get.cache_clear()
+        self.conn.execute("UPDATE icons SET atlas = NULL, x = NULL, y = NULL, w = NULL, h = NULL")
+
+    def place(self, pack_key: str, atlas_index: int, rects: dict[str, tuple[int, int, int, int]]) -> None:
+        """Point the entries of ``pack_key`` showing each sprite hash at its rect on atlas page ``atlas_index``."""
+        self.get.cache_clear()
+        self.conn.executemany(
+            """
+            UPDATE icons SET atlas = ?, x = ?, y = ?, w = ?, h = ?
+            WHERE pack_key = ? AND sha256 = ? AND NOT missing
+            """,
+            ((atlas_index, *rect, pack_key, sha256) for sha256, rect in rects.items()),
+        )
+
+    def client_icons(self, icon_store: bool) -> Iterator[tuple[str, str]]:
+        """``(rel, sha256)`` of the icon files entries outside an atlas show, in path order.
+
+        With the icon store that is each distinct store file, else each alias.
+        """
+        if icon_store:
+            store = root_rel(ICONS_CAS_DIR)
+            for (sha256,) in self.conn.execute(
+                "SELECT DISTINCT sha256 FROM icons WHERE sha256 IS NOT NULL AND NOT missing AND atlas IS NULL ORDER BY sha256"
+            ):
+                yield f"{store}/{sha256[:ICON_HASH_LENGTH]}.png", sha256
+            return
+        # Ordered like pathlib compares paths: part by part, i.e. "/" sorts before any other character.
+        yield from self.conn.execute(
+            """
+            SELECT alias_rel, sha256 FROM icons WHERE sha256 IS NOT NULL AND NOT missing AND atlas IS NULL
+            ORDER BY replace(alias_rel, '/', char(1))
+            """
+        )
+
+    def actions(self) -> Iterator[tuple[str, str]]:
+        """``(alias_rel, action)`` of every aliased icon, by path."""
+        yield from self.conn.execute("SELECT alias_rel, action FROM icons WHERE action IS NOT NULL ORDER BY alias_rel")
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def output_is_current(path: Path, content_hash: str, manifest: BuildManifest | None) -> bool:
+    if manifest is None:
+        return False
+    record = manifest.outputs.get(root_rel(path))
+    return bool(record) and record.get("contentSha256") == content_hash and file_matches_record(path, record)
+
+
+def record_output(path: Path, content_hash: str, manifest: BuildManifest | None) -> None:
+    if manifest is None:
+        return
+    manifest.outputs[root_rel(path)] = {"contentSha256": content_hash, **file_record(path)}
+
+
+class BuildProfiler:
+    """Per-phase wall time, file/byte counters and tracemalloc peaks for ``--profile``.
+
+    Disabled profilers still hand out phase records, so call sites need no guards.
+    Phases must not nest: each one resets the tracemalloc peak.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.phases: list[dict[str, Any]] = []
+
+    def start(self, name: str) -> dict[str, Any]:
+        record: dict[str, Any] = {"name": name, "files": 0, "bytesRead": 0, "bytesWritten": 0}
+        if self.enabled and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        record["_start"] = time.perf_counter()
+        return record
+
+    def stop(self, record: dict[str, Any]) -> None:
+        started = record.pop("_start")
+        if not self.enabled:
+            return
+        record["wallSeconds"] = round(time.perf_counter() - started, 6)
+        if tracemalloc.is_tracing():
+            record["peakTracedBytes"] = tracemalloc.get_traced_memory()[1]
+        self.phases.append(record)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[dict[str, Any]]:
+        record = self.start(name)
+        try:
+            yield record
+        finally:
+            self.stop(record)
+
+    def total_seconds(self) -> float:
+        return round(sum(phase["wallSeconds"] for phase in self.phases), 6)
+
+    def report(self, options: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "generatedAt": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "options": options,
+            "totalWallSeconds": self.total_seconds(),
+            "phases": self.phases,
+        }
+
+
+def count_written(stats: dict[str, Any], results: dict[Path, bool]) -> None:
+    """Add the files ``results`` reports as written (and their sizes) to a phase record."""
+    written = [path for path, wrote in results.items() if wrote]
+    stats["files"] += len(written)
+    stats["bytesWritten"] += sum(path.stat().st_size for path in written)
+
+
+def shop_pools(tiers: Sequence[int]) -> list[list[int]]:
+    """Per-tier cumulative positions into one pack's pets (or foods), given their tiers in catalog order.
+
+    ``shopPools["pets"][t - 1]`` lists, in catalog order, the positions (within the pack's
+    own pets) of every pet with ``tier <= t``, which is what shopPoolPets() in src/game.js
+    used to filter on each reroll.
+    """
+    top = max(SHOP_MAX_TIER, max(tiers, default=0))
+    return [[pos for pos, tier in enumerate(tiers) if tier <= limit] for limit in range(1, top + 1)]
+
+
+class ShopPools:
+    """A pack's ``shopPools``, kept as its entry tiers until the pack is encoded.
+
+    _json_default expands it with shop_pools(), so the positions exist as lists only
+    while one pack is being written rather than for every pack through the build.
+    """
+
+    __slots__ = ("tiers",)
+
+    def __init__(self) -> None:
+        self.tiers = {"pets": array("l"), "foods": array("l")}
+
+    def to_json(self) -> dict[str, list[list[int]]]:
+        return {kind: shop_pools(tiers) for kind, tiers in self.tiers.items()}
+
+
+def iter_catalog_entries(
+    rows: Iterable[RawRow],
+    packs_registry: dict[str, dict[str, Any]],
+    overrides: dict[str, dict[str, Any]],
+    icons: IconIndex | None = None,
+) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+    """Yield ``(type_key, entry, pack)`` for every row, in row order.
+
+    All entries of a pack share one ``pack`` dict. ``iconMissing`` says whether the
+    source icon exists or, given the ``icons`` filled in by the icon stage, what that
+    index says (which also covers placeholder pets showing a food's icon).
+    """
     seq_by_pack_type: dict[tuple[str, str], int] = {}
-    packs: list[dict[str, Any]] = []
-    pack_seen: set[str] = set()
-    pets: list[dict[str, Any]] = []
-    foods: list[dict[str, Any]] = []
-    catalog_rows: list[dict[str, Any]] = []
+    packs: dict[str, dict[str, Any]] = {}
 
     for raw in rows:
-        pack_meta = PACK_KEY_MAP[raw.pack_name_zh]
+        pack_meta = packs_registry[raw.pack_name_zh]
         pack_key = pack_meta["key"]
-        if pack_key not in pack_seen:
-            pack_seen.add(pack_key)
-            packs.append(
-                {
-                    "key": pack_key,
-                    "nameZh": raw.pack_name_zh,
-                    "nameEn": pack_meta["name_en"],
-                }
-            )
+        pack = packs.get(pack_key)
+        if pack is None:
+            pack = packs[pack_key] = {
+                "key": pack_key,
+                "nameZh": raw.pack_name_zh,
+                "nameEn": pack_meta["name_en"],
+            }
 
         type_key = "pet" if raw.type_zh == "动物" else "food"
         seq_key = (pack_key, type_key)
@@ -501,13 +1806,11 @@ def build_catalog() -> dict[str, Any]:
         hint_clean = clean_hint(raw.hint_raw)
 
         icon_src_rel = raw.icon_src_rel.lstrip("./")
-        src_path = ICONS_DIR / icon_src_rel
         alias_rel = f"assets/icons_en/{pack_key}/{type_key}s/{item_id}.png"
-        alias_path = ROOT_DIR / alias_rel
-        icon_missing = not src_path.exists()
-        if src_path.exists():
-            ensure_parent(alias_path)
-            shutil.copyfile(src_path, alias_path)
+        if icons is not None:
+            icon_missing = icons.get(alias_rel).missing
+        else:
+            icon_missing = not (ICONS_DIR / icon_src_rel).exists()
 
         if type_key == "pet":
             legacy = LEGACY_PET_KIND_MAP.get(normalized)
@@ -524,6 +1827,9 @@ def build_catalog() -> dict[str, Any]:
                 name_en = ""
                 ability_key = "placeholder_none"
                 attack, health = auto_pet_stats(item_id, raw.tier)
+                tuned = overrides["pets"].get(item_id, {})
+                attack = int(tuned.get("attack", attack))
+                health = int(tuned.get("health", health))
                 impl_status = "placeholder"
                 color = color_from_id(item_id, is_food=False)
 
@@ -549,32 +1855,7 @@ def build_catalog() -> dict[str, Any]:
                 "sourceSheet": raw.source_sheet,
                 "sourceRow": raw.source_row,
             }
-            pets.append(pet)
-            catalog_rows.append(
-                {
-                    "id": item_id,
-                    "pack_key": pack_key,
-                    "pack_name_zh": raw.pack_name_zh,
-                    "pack_name_en": pack_meta["name_en"],
-                    "type": "pet",
-                    "name_zh": normalized,
-                    "name_en": name_en,
-                    "tier": raw.tier,
-                    "round_unlock": raw.round_unlock,
-                    "icon_src_rel": icon_src_rel,
-                    "icon_alias_rel": alias_rel,
-                    "hint_zh_raw": raw.hint_raw,
-                    "hint_zh_clean": hint_clean,
-                    "hint_en": "",
-                    "attack": attack,
-                    "health": health,
-                    "ability_key": ability_key,
-                    "effect_key": "",
-                    "impl_status": impl_status,
-                    "source_sheet": raw.source_sheet,
-                    "source_row": raw.source_row,
-                }
-            )
+            yield "pet", pet, pack
         else:
             legacy = LEGACY_FOOD_KIND_MAP.get(normalized)
             if legacy:
@@ -590,7 +1871,7 @@ def build_catalog() -> dict[str, Any]:
                 impl_status = "placeholder"
                 color = color_from_id(item_id, is_food=True)
 
-            buff = placeholder_food_buff(raw.tier)
+            buff = int(overrides["foods"].get(item_id, {}).get("placeholderBuff", placeholder_food_buff(raw.tier)))
             food = {
                 "id": item_id,
                 "kind": kind,
@@ -612,84 +1893,1899 @@ def build_catalog() -> dict[str, Any]:
                 "sourceSheet": raw.source_sheet,
                 "sourceRow": raw.source_row,
             }
-            foods.append(food)
-            catalog_rows.append(
-                {
-                    "id": item_id,
-                    "pack_key": pack_key,
-                    "pack_name_zh": raw.pack_name_zh,
-                    "pack_name_en": pack_meta["name_en"],
-                    "type": "food",
-                    "name_zh": normalized,
-                    "name_en": name_en,
-                    "tier": raw.tier,
-                    "round_unlock": raw.round_unlock,
-                    "icon_src_rel": icon_src_rel,
-                    "icon_alias_rel": alias_rel,
-                    "hint_zh_raw": raw.hint_raw,
-                    "hint_zh_clean": hint_clean,
-                    "hint_en": "",
-                    "attack": "",
-                    "health": "",
-                    "ability_key": "",
-                    "effect_key": effect_key,
-                    "impl_status": impl_status,
-                    "source_sheet": raw.source_sheet,
-                    "source_row": raw.source_row,
-                }
-            )
+            yield "food", food, pack
+
+
+def stage_icons(
+    entries: Iterable[tuple[str, dict[str, Any], dict[str, Any]]],
+    icons: IconIndex,
+    manifest: BuildManifest | None,
+    incremental: bool,
+    link_mode: str,
+    workers: int | None,
+    stats: dict[str, Any],
+) -> dict[str, int]:
+    """Sync the alias icon of each of ``entries`` and add it to ``icons``; returns alias actions counted.
+
+    Records go to ``manifest`` when there is one, and entries, files and bytes moved
+    are counted into the phase ``stats``.
+    """
+    # Index rows wait here until their alias is synced, then are written a window at a
+    # time: each SQLite call lets the alias threads take the GIL.
+    pending: dict[str, tuple[str, str, bool, str]] = {}
+    rows: list[tuple[str, str, str, bool, str, str | None, int | None, str | None]] = []
+    records: list[tuple[str, dict[str, Any]]] = []
+
+    def flush() -> None:
+        icons.add(rows)
+        if manifest is not None:
+            manifest.icons.set_many(records)
+        rows.clear()
+        records.clear()
+
+    def icon_jobs() -> Iterator[tuple[str, Path, Path, dict[str, Any] | None]]:
+        for type_key, entry, pack in entries:
+            alias_rel = entry["iconAliasRel"]
+            placeholder = entry["implStatus"] == "placeholder"
+            stats["entries"] += 1
+            # Rows are indexed as their aliases finish, so pack order is taken from the stream.
+            icons.add_pack(pack["key"])
+            if entry["iconMissing"]:
+                rows.append((alias_rel, pack["key"], type_key, placeholder, entry["iconSrcRel"], None, None, None))
+                continue
+            pending[alias_rel] = (pack["key"], type_key, placeholder, entry["iconSrcRel"])
+            previous = manifest.icons.get(alias_rel) if manifest is not None else None
+            yield alias_rel, ICONS_DIR / entry["iconSrcRel"], ROOT_DIR / alias_rel, previous
+
+    icon_stats: dict[str, int] = {"kept": 0, "removed": 0}
+    for alias_rel, record, action in run_icon_stage(icon_jobs(), incremental, link_mode, workers):
+        rows.append((alias_rel, *pending.pop(alias_rel), record["alias"]["sha256"], record["alias"]["size"], action))
+        records.append((alias_rel, record))
+        if len(rows) >= PIPELINE_WINDOW:
+            flush()
+        icon_stats[action] = icon_stats.get(action, 0) + 1
+        # Copies read and write every byte; links and kept aliases move none.
+        if action != "kept":
+            stats["files"] += 1
+        if action == "copy":
+            stats["bytesRead"] += record["alias"]["size"]
+            stats["bytesWritten"] += record["alias"]["size"]
+    flush()
+    return icon_stats
+
+
+def build_catalog(
+    scratch_dir: Path,
+    manifest: BuildManifest | None = None,
+    incremental: bool = False,
+    link_mode: str = "copy",
+    workers: int | None = None,
+    profiler: BuildProfiler | None = None,
+    rows_cache: bool = True,
+) -> dict[str, Any]:
+    """Parse configs.xlsx into deduplicated rows and refresh the alias icon of every entry.
+
+    When ``manifest`` is given, alias icons are tracked in it; with ``incremental``
+    aliases whose source bytes are unchanged are kept instead of recreated.
+    ``link_mode`` selects how aliases are materialized (see ``LINK_MODES``) and
+    ``workers`` bounds the sheet-parsing process pool and the icon thread pool.
+    Packs come from ``load_pack_registry()``. Phases are timed into ``profiler``.
+    With ``rows_cache`` the rows come from ``ROWS_CACHE``: all of them whenever the
+    workbook bytes and parser are unchanged, skipping the workbook entirely, else those
+    of every unchanged sheet. Otherwise they are staged in ``scratch_dir``, as is the
+    ``IconIndex``.
+
+    Nothing here holds the catalog: rows live in a ``RowStore`` and entries stream
+    through ``iter_built_entries()``, once for the icon stage and again for the writers.
+    """
+    profiler = profiler or BuildProfiler()
+    if not SOURCE_XLSX.exists():
+        raise FileNotFoundError(f"Missing source config: {SOURCE_XLSX}")
+    if not ICONS_DIR.exists():
+        raise FileNotFoundError(f"Missing icon source dir: {ICONS_DIR}")
+    packs_registry = load_pack_registry()
+    overrides = load_stat_overrides()
+
+    store = RowStore(ROWS_CACHE if rows_cache else scratch_dir / "rows.sqlite")
+    source_sha256 = (manifest.source if manifest is not None else {}).get("sha256") or _file_sha256(SOURCE_XLSX)
+    cache_key = rows_cache_key(source_sha256, packs_registry)
+    sheet_keys = None
+    if rows_cache:
+        with profiler.phase("rows_cache") as stats:
+            sheet_keys = store.workbook_sheets(cache_key)
+            stats["hit"] = sheet_keys is not None
+            if sheet_keys is not None:
+                stats["files"] = 1
+                stats["bytesRead"] = ROWS_CACHE.stat().st_size
+    if sheet_keys is None:
+        sheet_keys = read_workbook_rows(profiler, store, cache_key, packs_registry, scratch_dir, workers)
+    with profiler.phase("dedup_rows") as stats:
+        stats["rows"] = store.dedup(sheet_keys, packs_registry)
+    if not stats["rows"]:
+        raise RuntimeError("No valid rows parsed from configs.xlsx")
+
+    icons = IconIndex(scratch_dir / "icons.sqlite")
+    with profiler.phase("icon_stage") as stats:
+        incremental = incremental and manifest is not None
+        if not incremental and ICONS_EN_DIR.exists():
+            shutil.rmtree(ICONS_EN_DIR)
+        ICONS_EN_DIR.mkdir(parents=True, exist_ok=True)
+        if manifest is not None:
+            manifest.icons.mark_all_stale()
+        stats["entries"] = 0
+        entries = iter_catalog_entries(store, packs_registry, overrides)
+        icon_stats = stage_icons(entries, icons, manifest, incremental, link_mode, workers, stats)
+        if manifest is not None:
+            manifest.icons.drop_stale()
+        if incremental:
+            icon_stats["removed"] = remove_stale_aliases(icons)
+        stats.update(icon_stats)
+
+    with profiler.phase("placeholder_icon_check") as stats:
+        stats["flagged"] = icons.mark_placeholder_clashes()
+
+    return {
+        "rows": store,
+        "icons": icons,
+        "packs": packs_registry,
+        "overrides": overrides,
+        "icon_stats": icon_stats,
+    }
+
+
+def iter_built_entries(built: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+    """The final entries of a ``build_catalog()`` result, as ``iter_catalog_entries()`` yields them.
+
+    In a ``--watch`` session they are replayed from its ``EntryStore`` instead.
+    """
+    if built.get("entries") is not None:
+        return built["entries"].iter_entries(built["icons"])
+    return iter_catalog_entries(built["rows"], built["packs"], built["overrides"], built["icons"])
+
+
+class CatalogSink(ABC):
+    """Consumer of assembled entries; run_build() feeds it ``iter_built_entries()`` one entry at a time."""
+
+    @abstractmethod
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        """Take one pet or food entry of ``pack``."""
+
+    @abstractmethod
+    def close(self) -> bool:
+        """Finish the output; returns whether a file was written."""
+
 
-    packs.sort(key=lambda item: item["key"])
-    pet_by_kind: dict[str, dict[str, Any]] = {}
-    for pet in pets:
-        pet_by_kind.setdefault(pet["kind"], pet)
-    food_by_kind: dict[str, dict[str, Any]] = {}
-    for food in foods:
-        food_by_kind.setdefault(food["kind"], food)
+class PayloadHeaderSink(CatalogSink):
+    """Fills in ``payload["version"]`` and ``payload["packs"]`` (with their shop pools).
 
-    mark_suspicious_placeholder_pet_icons(pets, foods)
+    Only each pack's entry tiers are kept, as a ``ShopPools`` per pack. The version
+    hashes the JSON ``_json_sha256`` would see for ``{"packs", "pets", "foods"}`` while
+    it streams past: foods go straight into the digest and pets are spooled until the
+    packs are final.
+    """
 
-    payload = {
-        "version": datetime.now(timezone.utc).isoformat(),
-        "packs": packs,
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+        self.packs: dict[str, dict[str, Any]] = {}
+        self.counts = {"pets": 0, "foods": 0}
+        self.digest = hashlib.sha256(b'{"foods":[')
+        self.pets = JsonSpool()
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        if pack["key"] not in self.packs:
+            self.packs[pack["key"]] = {**pack, "shopPools": ShopPools()}
+        kind = f"{type_key}s"
+        self.packs[pack["key"]]["shopPools"].tiers[kind].append(entry["tier"])
+        text = json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        if kind == "pets":
+            self.pets.append(text)
+        else:
+            self.digest.update(f"{',' if self.counts['foods'] else ''}{text}".encode("utf-8"))
+        self.counts[kind] += 1
+
+    def close(self) -> bool:
+        packs = list(self.packs.values())
+        self.digest.update(b'],"packs":')
+        for chunk in iter_json(packs, sort_keys=True):
+            self.digest.update(chunk.encode("utf-8"))
+        self.digest.update(b',"pets":')
+        with closing(self.pets):
+            for chunk in self.pets.iter_chunks():
+                self.digest.update(chunk.encode("utf-8"))
+        self.digest.update(b"}")
+        # Lookup maps (by id, kind and pack) are not emitted: buildGameIndexes in
+        # src/game.js derives them from the entry arrays at startup. Only the per-tier shop
+        # pools are precomputed, because the game would otherwise refilter on every reroll.
+        # The version is derived from the data, so identical inputs give byte-identical outputs.
+        self.payload["version"] = self.digest.hexdigest()[:16]
+        self.payload["packs"] = packs
+        return False
+
+
+def catalog_row(type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> list[Any]:
+    """One ``CATALOG_COLUMNS`` row of configs_game.xlsx for a pet or food entry."""
+    is_pet = type_key == "pet"
+    return [
+        entry["id"],
+        pack["key"],
+        pack["nameZh"],
+        pack["nameEn"],
+        type_key,
+        entry["nameZh"],
+        entry["nameEn"],
+        entry["tier"],
+        entry["roundUnlock"],
+        entry["iconSrcRel"],
+        entry["iconAliasRel"],
+        entry["hintZhRaw"],
+        entry["hintZhClean"],
+        entry["hintEn"],
+        entry["attack"] if is_pet else "",
+        entry["health"] if is_pet else "",
+        entry["abilityKey"] if is_pet else "",
+        "" if is_pet else entry["effectKey"],
+        entry["implStatus"],
+        entry["sourceSheet"],
+        entry["sourceRow"],
+    ]
+
+
+class XlsxCatalogSink(CatalogSink):
+    """Collects catalog rows for ``OUTPUT_XLSX`` and writes them as a write-only workbook.
+
+    ``add`` only hashes each row and spools it as a JSON line to a temp file, so memory
+    stays flat however large the catalog gets and the workbook cost lands in ``close``
+    (the ``write_xlsx`` phase). Unless ``force`` is set, rows matching the manifest
+    hash are dropped without building a workbook at all.
+    """
+
+    def __init__(self, path: Path = OUTPUT_XLSX, manifest: BuildManifest | None = None, force: bool = True) -> None:
+        self.path = path
+        self.manifest = manifest
+        self.force = force
+        self.digest = hashlib.sha256()
+        self.spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        line = json.dumps(catalog_row(type_key, entry, pack), ensure_ascii=False, separators=(",", ":")) + "\n"
+        self.digest.update(line.encode("utf-8"))
+        self.spool.write(line)
+
+    def close(self) -> bool:
+        with closing(self.spool):
+            content_hash = self.digest.hexdigest()
+            if not self.force and output_is_current(self.path, content_hash, self.manifest):
+                return False
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet("catalog")
+            sheet.append(CATALOG_COLUMNS)
+            self.spool.seek(0)
+            for line in self.spool:
+                sheet.append(json.loads(line))
+            ensure_parent(self.path)
+            workbook.save(self.path)
+        record_output(self.path, content_hash, self.manifest)
+        return True
+
+    def discard(self) -> None:
+        """Drop the spooled rows without writing the workbook."""
+        self.spool.close()
+
+
+# Normalized catalog for tooling (--sqlite). Columns mirror the payload fields in snake_case;
+# ``entries`` is the union of pets and foods for cross-type aggregates.
+SQLITE_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE packs (
+    key TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    name_zh TEXT NOT NULL,
+    name_en TEXT NOT NULL
+);
+CREATE TABLE abilities (key TEXT PRIMARY KEY);
+CREATE TABLE effects (key TEXT PRIMARY KEY);
+CREATE TABLE icons (sha256 TEXT PRIMARY KEY, size INTEGER NOT NULL, path TEXT NOT NULL);
+CREATE TABLE pets (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    pack_key TEXT NOT NULL REFERENCES packs (key),
+    name_zh TEXT NOT NULL,
+    name_en TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    round_unlock INTEGER NOT NULL,
+    attack INTEGER NOT NULL,
+    health INTEGER NOT NULL,
+    ability_key TEXT NOT NULL REFERENCES abilities (key),
+    impl_status TEXT NOT NULL,
+    color TEXT NOT NULL,
+    icon_sha256 TEXT REFERENCES icons (sha256),
+    icon_src_rel TEXT NOT NULL,
+    icon_alias_rel TEXT NOT NULL,
+    icon_missing INTEGER NOT NULL,
+    hint_zh_raw TEXT NOT NULL,
+    hint_zh_clean TEXT NOT NULL,
+    hint_en TEXT NOT NULL,
+    source_sheet TEXT NOT NULL,
+    source_row INTEGER NOT NULL
+);
+CREATE TABLE foods (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    pack_key TEXT NOT NULL REFERENCES packs (key),
+    name_zh TEXT NOT NULL,
+    name_en TEXT NOT NULL,
+    tier INTEGER NOT NULL,
+    round_unlock INTEGER NOT NULL,
+    effect_key TEXT NOT NULL REFERENCES effects (key),
+    impl_status TEXT NOT NULL,
+    placeholder_buff INTEGER NOT NULL,
+    color TEXT NOT NULL,
+    icon_sha256 TEXT REFERENCES icons (sha256),
+    icon_src_rel TEXT NOT NULL,
+    icon_alias_rel TEXT NOT NULL,
+    icon_missing INTEGER NOT NULL,
+    hint_zh_raw TEXT NOT NULL,
+    hint_zh_clean TEXT NOT NULL,
+    hint_en TEXT NOT NULL,
+    source_sheet TEXT NOT NULL,
+    source_row INTEGER NOT NULL
+);
+CREATE INDEX pets_pack_tier ON pets (pack_key, tier);
+CREATE INDEX pets_tier ON pets (tier);
+CREATE INDEX pets_kind ON pets (kind);
+CREATE INDEX pets_ability_key ON pets (ability_key);
+CREATE INDEX pets_impl_status ON pets (impl_status, pack_key, tier);
+CREATE INDEX foods_pack_tier ON foods (pack_key, tier);
+CREATE INDEX foods_tier ON foods (tier);
+CREATE INDEX foods_kind ON foods (kind);
+CREATE INDEX foods_effect_key ON foods (effect_key);
+CREATE INDEX foods_impl_status ON foods (impl_status, pack_key, tier);
+CREATE VIEW entries AS
+    SELECT 'pet' AS type, id, kind, pack_key, tier, round_unlock, impl_status, icon_sha256, name_zh, name_en FROM pets
+    UNION ALL
+    SELECT 'food', id, kind, pack_key, tier, round_unlock, impl_status, icon_sha256, name_zh, name_en FROM foods;
+"""
+
+
+class SqliteCatalogSink(CatalogSink):
+    """Writes the catalog as an indexed SQLite database (``--sqlite``) for tooling queries.
+
+    Pets and foods are inserted as they arrive into a database built next to ``path``;
+    ``close()`` adds the packs, keys and icons (``payload`` must hold the final version
+    and packs by then) and moves it into place, so readers never see a partial file.
+    Pet and food columns are read back from the schema and filled from the camelCase
+    payload field of the same name.
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        icons: IconIndex,
+        manifest: BuildManifest | None = None,
+        force: bool = True,
+        path: Path = OUTPUT_SQLITE,
+    ) -> None:
+        self.payload = payload
+        self.icons = icons
+        self.manifest = manifest
+        self.force = force
+        self.path = path
+        self.digest = hashlib.sha256()
+        self.abilities: set[str] = set()
+        self.effects: set[str] = set()
+        ensure_parent(path)
+        self.tmp_path = path.with_name(f"{path.name}.tmp")
+        self.tmp_path.unlink(missing_ok=True)
+        self.conn = sqlite3.connect(self.tmp_path)
+        self.conn.executescript(SQLITE_SCHEMA)
+        self.inserts: dict[str, tuple[str, list[tuple[str, str]]]] = {}
+        for table in ("pets", "foods"):
+            columns = [row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")]
+            fields = [re.sub(r"_([a-z])", lambda match: match.group(1).upper(), column) for column in columns]
+            sql = f"INSERT INTO {table} VALUES ({', '.join('?' for _ in columns)})"
+            self.inserts[table] = (sql, list(zip(columns, fields)))
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        sql, columns = self.inserts[f"{type_key}s"]
+        sha256 = self.icons.get(entry["iconAliasRel"]).sha256
+        self.conn.execute(
+            sql,
+            tuple(
+                (None if entry["iconMissing"] else sha256) if column == "icon_sha256" else entry[field]
+                for column, field in columns
+            ),
+        )
+        if type_key == "pet":
+            self.abilities.add(entry["abilityKey"])
+        else:
+            self.effects.add(entry["effectKey"])
+        self.digest.update(f"{entry['id']}:{sha256}\n".encode("utf-8"))
+
+    def close(self) -> bool:
+        with closing(self.conn) as conn:
+            content_hash = _json_sha256(
+                {"schema": SQLITE_SCHEMA, "version": self.payload["version"], "icons": self.digest.hexdigest()}
+            )
+            current = not self.force and output_is_current(self.path, content_hash, self.manifest)
+            if not current:
+                with conn:
+                    conn.execute("INSERT INTO meta VALUES ('version', ?)", (self.payload["version"],))
+                    conn.executemany(
+                        "INSERT INTO packs VALUES (?, ?, ?, ?)",
+                        (
+                            (pack["key"], index, pack["nameZh"], pack["nameEn"])
+                            for index, pack in enumerate(self.payload["packs"])
+                        ),
+                    )
+                    conn.executemany("INSERT INTO abilities VALUES (?)", ((key,) for key in sorted(self.abilities)))
+                    conn.executemany("INSERT INTO effects VALUES (?)", ((key,) for key in sorted(self.effects)))
+                    conn.executemany(
+                        "INSERT INTO icons VALUES (?, ?, ?)",
+                        ((sha256, size, alias_rel) for sha256, size, alias_rel in self.icons.distinct_icons()),
+                    )
+                conn.execute("ANALYZE")
+        if current:
+            self.tmp_path.unlink()
+            return False
+        os.replace(self.tmp_path, self.path)
+        record_output(self.path, content_hash, self.manifest)
+        return True
+
+
+def _load_pillow() -> Any:
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise SystemExit("--atlas needs Pillow: pip install Pillow") from exc
+    return Image
+
+
+def pack_atlas_pages(
+    sprites: list[tuple[str, int, int]],
+) -> list[tuple[int, int, dict[str, tuple[int, int, int, int]]]]:
+    """Shelf-pack ``(key, width, height)`` sprites; returns pages of ``(width, height, key -> rect)``."""
+    pages: list[tuple[int, int, dict[str, tuple[int, int, int, int]]]] = []
+    rects: dict[str, tuple[int, int, int, int]] = {}
+
+    def close_page() -> None:
+        width = max(x + w for x, _, w, _ in rects.values())
+        height = max(y + h for _, y, _, h in rects.values())
+        pages.append((width, height, rects))
+
+    x = y = shelf_height = 0
+    for key, width, height in sorted(sprites, key=lambda sprite: (-sprite[2], sprite[0])):
+        if x and x + width > ATLAS_WIDTH:
+            x, y, shelf_height = 0, y + shelf_height + ATLAS_PADDING, 0
+        if rects and y + height > ATLAS_MAX_HEIGHT:
+            close_page()
+            rects, x, y, shelf_height = {}, 0, 0, 0
+        rects[key] = (x, y, width, height)
+        x += width + ATLAS_PADDING
+        shelf_height = max(shelf_height, height)
+    if rects:
+        close_page()
+    return pages
+
+
+def remove_stale_atlases(keep: set[Path]) -> None:
+    if not ATLAS_DIR.exists():
+        return
+    for path in ATLAS_DIR.glob("*.png"):
+        if path not in keep:
+            path.unlink()
+
+
+def build_icon_atlases(
+    payload: dict[str, Any],
+    icons: IconIndex,
+    manifest: BuildManifest | None = None,
+    force: bool = True,
+    sprite_sizes: dict[str, tuple[int, int]] | None = None,
+) -> dict[Path, bool]:
+    """Pack every pack's alias icons into ``assets/atlas/<pack>-<page>.png``.
+
+    Identical icon bytes share one sprite. Each sprite's rect is recorded in ``icons``,
+    and client_entry() trades ``iconAliasRel`` (or ``iconHash``) for ``iconAtlas``
+    (index into ``payload["atlases"]``) and ``iconX/iconY/iconW/iconH`` for entries
+    that have one. Returns ``path -> written``. ``sprite_sizes`` caches each sprite's
+    size by content hash, for callers that lay out the atlases again and again.
+    """
+    Image = _load_pillow()
+    atlases: list[dict[str, Any]] = []
+    results: dict[Path, bool] = {}
+    sprite_sizes = {} if sprite_sizes is None else sprite_sizes
+    # A --watch session keeps the index, so drop the last rebuild's rects first.
+    icons.clear_placements()
+    for pack_key in icons.pack_keys():
+        sprite_paths: dict[str, Path] = {}
+        sprites: list[tuple[str, int, int]] = []
+        for sha256, alias_rel in icons.pack_sprites(pack_key):
+            sprite_paths[sha256] = ROOT_DIR / alias_rel
+            if sha256 not in sprite_sizes:
+                with Image.open(sprite_paths[sha256]) as image:
+                    sprite_sizes[sha256] = image.size
+            sprites.append((sha256, *sprite_sizes[sha256]))
+
+        for page_index, (width, height, rects) in enumerate(pack_atlas_pages(sprites)):
+            path = ATLAS_DIR / f"{pack_key}-{page_index}.png"
+            # Sprites are keyed by content hash, so this covers the pixels as well as the layout.
+            content_hash = _json_sha256({"size": [width, height], "rects": rects})
+            results[path] = force or not output_is_current(path, content_hash, manifest)
+            if results[path]:
+                sheet = Image.new("RGBA", (width, height))
+                for sha256, (x, y, _, _) in rects.items():
+                    with Image.open(sprite_paths[sha256]) as image:
+                        sheet.paste(image.convert("RGBA"), (x, y))
+                ensure_parent(path)
+                sheet.save(path, optimize=True)
+                record_output(path, content_hash, manifest)
+
+            icons.place(pack_key, len(atlases), rects)
+            atlases.append({"src": root_rel(path), "width": width, "height": height, "version": content_hash[:12]})
+    remove_stale_atlases(set(results))
+    payload["atlases"] = atlases
+    return results
+
+
+def build_icon_store(payload: dict[str, Any], icons: IconIndex) -> dict[str, int]:
+    """Write every distinct icon an entry shows once as ``assets/icons_cas/<hash>.png``.
+
+    client_entry() trades ``iconAliasRel`` for ``iconHash`` and the payload gains
+    ``iconStore``, the directory entryIconPath() in src/game.js resolves hashes against.
+    Returns ``{"unique": ..., "written": ..., "bytesWritten": ...}``.
+    """
+    counts = {"unique": 0, "written": 0, "bytesWritten": 0}
+    for sha256, alias_rel in icons.store_icons():
+        path = ICONS_CAS_DIR / f"{sha256[:ICON_HASH_LENGTH]}.png"
+        counts["unique"] += 1
+        # The name pins the bytes, so an existing file is already correct.
+        if not path.exists():
+            ensure_parent(path)
+            shutil.copyfile(ROOT_DIR / alias_rel, path)
+            counts["written"] += 1
+            counts["bytesWritten"] += path.stat().st_size
+    remove_stale_icon_store(icons)
+    payload["iconStore"] = root_rel(ICONS_CAS_DIR)
+    return counts
+
+
+def remove_stale_icon_store(icons: IconIndex | None) -> None:
+    if not ICONS_CAS_DIR.exists():
+        return
+    for path in ICONS_CAS_DIR.glob("*.png"):
+        if icons is None or not icons.has_store_icon(path.stem):
+            path.unlink()
+
+
+def _render_icon_variants(jobs: list[tuple[str, str, int, str, str]]) -> None:
+    """Process-pool worker: resize icons to ``width`` (keeping aspect) and encode them."""
+    from PIL import Image
+
+    for src, dst, width, icon_format, _ in jobs:
+        with Image.open(src) as image:
+            image = image.convert("RGBA")
+            if image.width > width:
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+            Path(dst).parent.mkdir(parents=True, exist_ok=True)
+            if icon_format == "webp":
+                image.save(dst, "WEBP", quality=90)
+            else:
+                image.save(dst, "PNG", optimize=True)
+
+
+def build_icon_variants(
+    payload: dict[str, Any],
+    icons: IconIndex,
+    manifest: BuildManifest | None = None,
+    force: bool = True,
+    icon_format: str = "png",
+    workers: int | None = None,
+) -> dict[str, int]:
+    """Write every alias icon at ``ICON_VARIANT_WIDTHS`` under ``assets/icons_sized/<width>``.
+
+    Resizing runs on a process pool, fed in batches as the index is read. The payload
+    gains an ``iconVariants`` table; game.js maps each entry's icon path onto a variant
+    dir, so entries carry no extra fields. With ``--icon-store`` variants mirror the
+    store files. Returns ``{"written": ..., "kept": ..., "bytesWritten": ...}``.
+    """
+    _load_pillow()
+    ICONS_SIZED_DIR.mkdir(parents=True, exist_ok=True)
+    icon_store = bool(payload.get("iconStore"))
+    icon_dir = ICONS_CAS_DIR if icon_store else ICONS_EN_DIR
+    alias_prefix = f"{root_rel(icon_dir)}/"
+    if icon_store:
+        sources = ((f"{alias_prefix}{sha256[:ICON_HASH_LENGTH]}.png", sha256) for sha256, _ in icons.store_icons())
+    else:
+        sources = icons.alias_icons()
+    counts = {"written": 0, "kept": 0, "bytesWritten": 0}
+
+    def jobs() -> Iterator[tuple[str, str, int, str, str]]:
+        for icon_rel, sha256 in sources:
+            stem = Path(icon_rel[len(alias_prefix):]).with_suffix(f".{icon_format}")
+            for width in ICON_VARIANT_WIDTHS:
+                path = ICONS_SIZED_DIR / str(width) / stem
+                content_hash = _json_sha256({"src": sha256, "width": width, "format": icon_format})
+                if force or not output_is_current(path, content_hash, manifest):
+                    yield str(ROOT_DIR / icon_rel), str(path), width, icon_format, content_hash
+                else:
+                    counts["kept"] += 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for batch, _ in iter_pool_map(pool, _render_icon_variants, iter_batches(jobs(), 16)):
+            for _, dst, _, _, content_hash in batch:
+                path = Path(dst)
+                record_output(path, content_hash, manifest)
+                counts["written"] += 1
+                counts["bytesWritten"] += path.stat().st_size
+
+    widths = {str(width) for width in ICON_VARIANT_WIDTHS}
+    sized_prefix = f"{root_rel(ICONS_SIZED_DIR)}/"
+
+    def is_variant(rel: str) -> bool:
+        width, _, variant_rel = rel.removeprefix(sized_prefix).partition("/")
+        stem, dot, suffix = variant_rel.rpartition(".")
+        if width not in widths or not dot or suffix != icon_format:
+            return False
+        if icon_store:
+            return "/" not in stem and icons.has_store_icon(stem)
+        return icons.has_icon(f"{alias_prefix}{stem}.png")
+
+    remove_stale_files(ICONS_SIZED_DIR, is_variant)
+    payload["iconVariants"] = {
+        "from": root_rel(icon_dir),
+        "format": icon_format,
+        "slotWidth": ICON_SLOT_WIDTH,
+        "widths": {str(width): root_rel(ICONS_SIZED_DIR / str(width)) for width in ICON_VARIANT_WIDTHS},
+    }
+    return counts
+
+
+class StringTable:
+    """The ``strings`` of a compact payload: each string's index is the order it was first interned in.
+
+    The table lives in a private temp SQLite database and whole columns are interned at
+    once, so a catalog's worth of distinct ids and names is never held in memory.
+    """
+
+    def __init__(self) -> None:
+        self.conn = sqlite3.connect("")
+        self.conn.executescript(
+            """
+            CREATE TABLE strings (id INTEGER PRIMARY KEY, text TEXT NOT NULL UNIQUE);
+            CREATE TABLE column_values (seq INTEGER PRIMARY KEY, text TEXT);
+            """
+        )
+
+    def intern_column(self, values: Iterable[Any]) -> Iterator[int]:
+        """Index of every value (``-1`` for ``None``), interning new ones in order."""
+        self.conn.execute("DELETE FROM column_values")
+        self.conn.executemany(
+            "INSERT INTO column_values (text) VALUES (?)", ((None if value is None else str(value),) for value in values)
+        )
+        self.conn.execute(
+            "INSERT OR IGNORE INTO strings (text) SELECT text FROM column_values WHERE text IS NOT NULL ORDER BY seq"
+        )
+        for (index,) in self.conn.execute(
+            """
+            SELECT coalesce(strings.id - 1, -1) FROM column_values
+            LEFT JOIN strings ON strings.text = column_values.text ORDER BY column_values.seq
+            """
+        ):
+            yield index
+
+    def spool(self) -> JsonSpool:
+        spool = JsonSpool()
+        for (text,) in self.conn.execute("SELECT text FROM strings ORDER BY id"):
+            spool.append(json.dumps(text, ensure_ascii=False))
+        self.conn.close()
+        return spool
+
+
+def encode_compact_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """Encode pets/foods as columns over a shared string table and integer-coded enums.
+
+    Each table is ``{"count": n, "columns": [[field, codec, values], ...]}`` where codec
+    is ``"str"`` (index into ``strings``), ``"int"``, ``"bool"`` (0/1) or an enum name
+    (index into ``enums[name]``). Missing values are ``null`` for ints and ``-1`` otherwise.
+    decodeColumnarGameData() in src/game.js reverses this.
+
+    Pets and foods may be lists or spools of entries. Every field is staged in a spool
+    of its own and encoded one column at a time, so the column values and ``strings``
+    come back as ``JsonSpool``s for ``iter_json`` to stream.
+    """
+    strings = StringTable()
+    enums: dict[str, list[str]] = {field: [] for field in COMPACT_ENUM_FIELDS}
+    enum_ids: dict[str, dict[str, int]] = {field: {} for field in COMPACT_ENUM_FIELDS}
+    dumps = partial(json.dumps, ensure_ascii=False)
+
+    def intern(table: list[str], ids: dict[str, int], value: Any) -> int:
+        if value is None:
+            return -1
+        text = str(value)
+        index = ids.get(text)
+        if index is None:
+            index = ids[text] = len(table)
+            table.append(text)
+        return index
+
+    def encode_table(entries: JsonSpool | list[dict[str, Any]]) -> dict[str, Any]:
+        # field -> [raw values, seen a non-None value, all bools, all ints]
+        raw_columns: dict[str, list[Any]] = {}
+        count = 0
+        for entry in iter_entries(entries):
+            for field in entry:
+                if field not in raw_columns:
+                    raw = JsonSpool()
+                    for _ in range(count):
+                        raw.append("null")
+                    raw_columns[field] = [raw, False, True, True]
+            for field, column in raw_columns.items():
+                value = entry.get(field)
+                column[0].append(dumps(value))
+                if value is not None:
+                    column[1] = True
+                    column[2] = column[2] and isinstance(value, bool)
+                    column[3] = column[3] and isinstance(value, int) and not isinstance(value, bool)
+            count += 1
+
+        columns: list[list[Any]] = []
+        for field, (raw, present, all_bool, all_int) in raw_columns.items():
+            values = map(json.loads, raw)
+            if field in enums:
+                codec = field
+                encoded: Iterable[Any] = (intern(enums[field], enum_ids[field], value) for value in values)
+            elif present and all_bool:
+                codec = "bool"
+                encoded = (-1 if value is None else int(value) for value in values)
+            elif present and all_int:
+                codec = "int"
+                encoded = values
+            else:
+                codec = "str"
+                encoded = strings.intern_column(values)
+            spool = JsonSpool()
+            for value in encoded:
+                spool.append("null" if value is None else str(value))
+            raw.close()
+            columns.append([field, codec, spool])
+        return {"count": count, "columns": columns}
+
+    pets = encode_table(payload["pets"])
+    foods = encode_table(payload["foods"])
+    passthrough = {key: value for key, value in payload.items() if key not in ("pets", "foods")}
+    return {
+        "format": COMPACT_FORMAT,
+        **passthrough,
+        "strings": strings.spool(),
+        "enums": enums,
         "pets": pets,
         "foods": foods,
-        "indexes": {
-            "petByKind": pet_by_kind,
-            "foodByKind": food_by_kind,
-        },
     }
-    return {"payload": payload, "catalog_rows": catalog_rows}
 
 
-def write_output_xlsx(catalog_rows: list[dict[str, Any]]) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "catalog"
-    ws.append(CATALOG_COLUMNS)
-    for row in catalog_rows:
-        ws.append([row.get(col, "") for col in CATALOG_COLUMNS])
-    wb.save(OUTPUT_XLSX)
+def decode_compact_payload(data: dict[str, Any]) -> dict[str, Any]:
+    """Inverse of encode_compact_payload(), for Python readers of a compact build."""
+
+    def decode_table(table: dict[str, Any]) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = [{} for _ in range(table["count"])]
+        for field, codec, values in table["columns"]:
+            lookup = data["strings"] if codec == "str" else data["enums"].get(codec)
+            for row, raw in zip(rows, values):
+                if raw is None or (codec != "int" and raw == -1):
+                    continue
+                if codec == "int":
+                    row[field] = raw
+                elif codec == "bool":
+                    row[field] = raw == 1
+                else:
+                    row[field] = lookup[raw]
+        return rows
+
+    passthrough = {key: value for key, value in data.items() if key not in ("format", "strings", "enums")}
+    return {**passthrough, "pets": decode_table(data["pets"]), "foods": decode_table(data["foods"])}
+
+
+def render_data_script(statement: str, payload: dict[str, Any], output_format: str) -> Iterator[str]:
+    if output_format == "compact":
+        payload = encode_compact_payload(payload)
+    yield (
+        "// Auto-generated by scripts/build_game_catalog.py\n"
+        "// Lookup indexes are built client-side by buildGameIndexes() in src/game.js.\n"
+        f"{statement} = "
+    )
+    yield from iter_json(payload)
+    yield ";\n"
+
+
+def write_text_output(
+    path: Path,
+    content_hash: str,
+    render: Callable[[], Iterable[str]],
+    manifest: BuildManifest | None,
+    force: bool,
+) -> bool:
+    """Stream ``render()`` to ``path`` unless the manifest shows ``content_hash`` is already there."""
+    if not force and output_is_current(path, content_hash, manifest):
+        return False
+    ensure_parent(path)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.writelines(render())
+    record_output(path, content_hash, manifest)
+    return True
+
+
+def shard_path(pack_key: str) -> Path:
+    return OUTPUT_JS.with_name(f"{SHARD_PREFIX}{pack_key}.js")
+
+
+def remove_stale_shards(keep: set[Path]) -> None:
+    for path in OUTPUT_JS.parent.glob(f"{SHARD_PREFIX}*.js"):
+        if path != OUTPUT_JS and path not in keep:
+            path.unlink()
+
+
+def text_bundle_path(language: str) -> Path:
+    return OUTPUT_JS.with_name(f"{TEXT_PREFIX}{language}.js")
+
+
+def entry_text(entry: dict[str, Any]) -> dict[str, dict[str, str]]:
+    """An entry's name/hint text per language, as its text bundles carry it.
+
+    Each language keeps what localizedEntryName()/localizedEntryHint() in src/game.js
+    read for it: its own name and hint, plus the other language's value wherever its
+    own is empty. Only the hint the client would show is kept (clean, else raw).
+    Languages with nothing to show are left out.
+    """
+    zh_hint_field = "hintZhClean" if entry.get("hintZhClean") else "hintZhRaw"
+    own_fields = {"zh": ("nameZh", zh_hint_field), "en": ("nameEn", "hintEn")}
+    texts: dict[str, dict[str, str]] = {}
+    for language, fields in own_fields.items():
+        other = own_fields["en" if language == "zh" else "zh"]
+        text: dict[str, str] = {}
+        for own_field, other_field in zip(fields, other):
+            field = own_field if entry.get(own_field) else other_field
+            if entry.get(field):
+                text[field] = entry[field]
+        if text:
+            texts[language] = text
+    return texts
+
+
+class TextBundleSink(CatalogSink):
+    """Writes ``game_text.<lang>.js`` (``--text-bundles``): every entry's name and hint per language, keyed by id.
+
+    Pets and foods are spooled separately, so each bundle lists the pets first as the
+    catalog does. The texts are also staged in ``scratch_path``, whose id order the
+    content versions are hashed in. ``close()`` sets ``payload["text"]``, the core's
+    table of bundles; GameDataSink drops the fields the bundles carry.
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        scratch_path: Path,
+        manifest: BuildManifest | None = None,
+        force: bool = True,
+    ) -> None:
+        self.payload = payload
+        self.manifest = manifest
+        self.force = force
+        self.spools = {(language, kind): JsonSpool("{}") for language in TEXT_LANGUAGES for kind in ("pets", "foods")}
+        self.conn = sqlite3.connect(scratch_path)
+        self.conn.execute("CREATE TABLE texts (language TEXT, id TEXT, text TEXT, PRIMARY KEY (language, id))")
+        self.results: dict[Path, bool] = {}
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        dumps = partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+        for language, text in entry_text(entry).items():
+            self.spools[language, f"{type_key}s"].append(f"{dumps(entry['id'])}:{dumps(text)}")
+            self.conn.execute(
+                "INSERT INTO texts VALUES (?, ?, ?)", (language, entry["id"], dumps(text, sort_keys=True))
+            )
 
+    def content_hash(self, language: str) -> str:
+        """``_json_sha256({"language": language, "entries": entries})`` without building ``entries``."""
+        digest = hashlib.sha256(b'{"entries":{')
+        rows = self.conn.execute("SELECT id, text FROM texts WHERE language = ? ORDER BY id", (language,))
+        for index, (item_id, text) in enumerate(rows):
+            digest.update(f"{',' if index else ''}{json.dumps(item_id, ensure_ascii=False)}:{text}".encode("utf-8"))
+        digest.update(f'}},"language":{json.dumps(language)}}}'.encode("utf-8"))
+        return digest.hexdigest()
+
+    def close(self) -> bool:
+        text_table: dict[str, dict[str, str]] = {}
+        with closing(self.conn):
+            for language in TEXT_LANGUAGES:
+                entries = self.spools[language, "pets"]
+                for member in self.spools[language, "foods"]:
+                    entries.append(member)
+                path = text_bundle_path(language)
+                content_hash = self.content_hash(language)
+                self.results[path] = write_text_output(
+                    path,
+                    content_hash,
+                    lambda language=language, entries=entries: render_data_script(
+                        f"(window.__GAME_TEXT = window.__GAME_TEXT || {{}})[{json.dumps(language)}]",
+                        {"language": language, "entries": entries},
+                        "verbose",
+                    ),
+                    self.manifest,
+                    self.force,
+                )
+                text_table[language] = {"src": f"./{root_rel(path)}", "version": content_hash[:12]}
+        for spool in self.spools.values():
+            spool.close()
+        remove_stale_text_bundles(set(self.results))
+        self.payload["text"] = text_table
+        return any(self.results.values())
+
+
+def remove_stale_text_bundles(keep: set[Path]) -> None:
+    for path in OUTPUT_JS.parent.glob(f"{TEXT_PREFIX}*.js"):
+        if path not in keep:
+            path.unlink()
+
+
+class FingerprintPublisher:
+    """Content-addressed copies of client-fetched files under ``assets/fp/`` (``--fingerprint``).
+
+    ``publish()`` copies a built file to ``<stem>.<sha256 prefix><suffix>`` and returns its
+    URL; ``assets`` maps each logical path to that URL. Files are copied rather than
+    linked because several outputs are rewritten in place.
+    """
+
+    def __init__(self) -> None:
+        self.assets: dict[str, str] = {}
+        self.published: set[Path] = set()
+
+    def publish(self, path: Path, sha256: str | None = None) -> str:
+        sha256 = sha256 or _file_sha256(path)
+        target = FINGERPRINT_DIR / f"{path.stem}.{sha256[:FINGERPRINT_LENGTH]}{path.suffix}"
+        # The name pins the bytes, so an existing target is already correct.
+        if not target.exists():
+            ensure_parent(target)
+            shutil.copyfile(path, target)
+        self.published.add(target)
+        self.assets[root_rel(path)] = root_rel(target)
+        return root_rel(target)
+
+
+def client_icon_paths(payload: dict[str, Any], icons: IconIndex) -> Iterator[tuple[Path, str | None]]:
+    """Icon files game.js can request for this payload, in path order, with their sha256 when known.
+
+    Atlas entries only fetch their atlas page; the rest fetch every variant width when
+    ``--icon-variants`` ran, else their icon store file or alias icon (see entryIconRef()
+    in src/game.js).
+    """
+    variants = payload.get("iconVariants")
+    icon_store = bool(payload.get("iconStore"))
+    if not variants:
+        for icon_rel, sha256 in icons.client_icons(icon_store):
+            yield ROOT_DIR / icon_rel, sha256
+        return
+    for variant_dir in sorted(variants["widths"].values(), key=Path):
+        for icon_rel, _ in icons.client_icons(icon_store):
+            variant_rel = icon_rel.replace(variants["from"], variant_dir, 1)
+            yield (ROOT_DIR / variant_rel).with_suffix(f".{variants['format']}"), None
+
+
+def fingerprint_payload_assets(payload: dict[str, Any], publisher: FingerprintPublisher, icons: IconIndex) -> None:
+    """Publish the icons the client can fetch, atlases and text bundles; point the payload at them.
+
+    Icons resolve through ``payload["assets"]`` (see resolveAssetUrl() in src/game.js);
+    atlas and text bundle entries get their fingerprinted ``src`` directly. Icon store
+    files are already named by content hash and served as immutable, so they are used
+    as they are instead of being copied again.
+    """
+    for path, sha256 in client_icon_paths(payload, icons):
+        if not path.is_relative_to(ICONS_CAS_DIR):
+            publisher.publish(path, sha256)
+    payload["assets"] = dict(publisher.assets)
+    for atlas in payload.get("atlases", []):
+        atlas["src"] = publisher.publish(ROOT_DIR / atlas["src"])
+        atlas.pop("version", None)
+    for bundle in payload.get("text", {}).values():
+        bundle["src"] = f"./{publisher.publish(ROOT_DIR / bundle['src'].removeprefix('./'))}"
+        bundle.pop("version", None)
+
+
+def write_asset_manifest(publisher: FingerprintPublisher | None, version: str) -> None:
+    """Write ``assets/fp/manifest.json`` and prune copies older than the previous build.
+
+    Copies from the previous build survive one more build so clients still running
+    the old core can finish loading their shards and icons.
+    """
+    previous: set[Path] = set()
+    if ASSET_MANIFEST.exists():
+        try:
+            previous = {ROOT_DIR / rel for rel in json.loads(ASSET_MANIFEST.read_text(encoding="utf-8"))["assets"].values()}
+        except (OSError, ValueError, KeyError):
+            previous = set()
+    if publisher is None:
+        if FINGERPRINT_DIR.exists():
+            shutil.rmtree(FINGERPRINT_DIR)
+        return
+    keep = publisher.published | previous
+    for path in FINGERPRINT_DIR.glob("*"):
+        # Precompressed siblings live and die with the copy they were made from.
+        base = path.with_suffix("") if path.suffix in COMPRESS_EXTENSIONS.values() else path
+        if path != ASSET_MANIFEST and base not in keep:
+            path.unlink()
+    content = {"version": version, "assets": dict(sorted(publisher.assets.items()))}
+    ensure_parent(ASSET_MANIFEST)
+    ASSET_MANIFEST.write_text(json.dumps(content, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def _load_brotli() -> Any:
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
 
-def write_output_js(payload: dict[str, Any]) -> None:
-    OUTPUT_JS.parent.mkdir(parents=True, exist_ok=True)
-    data_json = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-    content = "// Auto-generated by scripts/build_game_catalog.py\nwindow.__GAME_DATA = " + data_json + ";\n"
-    OUTPUT_JS.write_text(content, encoding="utf-8")
 
+def _compress_file(path: Path, brotli: Any) -> dict[str, bytes]:
+    data = path.read_bytes()
+    encoded = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded["br"] = brotli.compress(data, quality=11)
+    return {
+        encoding: body for encoding, body in encoded.items() if len(body) <= len(data) * COMPRESS_MIN_RATIO
+    }
 
-def main() -> int:
-    built = build_catalog()
-    payload = built["payload"]
-    catalog_rows = built["catalog_rows"]
-    write_output_xlsx(catalog_rows)
-    write_output_js(payload)
 
-    print(f"Generated: {OUTPUT_XLSX}")
-    print(f"Generated: {OUTPUT_JS}")
-    print(f"Generated alias icons under: {ICONS_EN_DIR}")
-    print(f"packs={len(payload['packs'])} pets={len(payload['pets'])} foods={len(payload['foods'])}")
+def write_precompressed(paths: list[Path], workers: int | None = None) -> dict[Path, bool]:
+    """Write ``.gz`` (and ``.br`` when the brotli module is installed) next to each file.
+
+    ``assets/encodings.json`` maps every URL path to its size, mtime and compressed
+    siblings so server.js can answer with a matching ``Content-Encoding`` without
+    compressing per request. Siblings whose source bytes are unchanged since the
+    last build are kept. Returns ``sibling -> written``; an empty ``paths`` removes
+    every sibling and the manifest.
+    """
+    previous: dict[str, Any] = {}
+    if ENCODINGS_MANIFEST.exists():
+        try:
+            previous = json.loads(ENCODINGS_MANIFEST.read_text(encoding="utf-8"))["files"]
+        except (OSError, ValueError, KeyError):
+            previous = {}
+    brotli = _load_brotli() if paths else None
+    wanted = set(COMPRESS_EXTENSIONS) if brotli is not None else {"gzip"}
+
+    files: dict[str, Any] = {}
+    pending: list[tuple[str, Path, str]] = []
+    for path in sorted(set(paths)):
+        url = f"/{root_rel(path)}"
+        sha256 = _file_sha256(path)
+        entry = previous.get(url, {})
+        encodings = entry.get("encodings", {})
+        reusable = (
+            entry.get("sha256") == sha256
+            and set(entry.get("tried", [])) >= wanted
+            and all((ROOT_DIR / item["src"].lstrip("/")).is_file() for item in encodings.values())
+        )
+        files[url] = {"sha256": sha256, "encodings": encodings if reusable else {}}
+        if not reusable:
+            pending.append((url, path, sha256))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        compressed = list(pool.map(lambda job: _compress_file(job[1], brotli), pending))
+    results: dict[Path, bool] = {}
+    for (url, path, _), encoded in zip(pending, compressed):
+        for encoding, body in encoded.items():
+            target = path.with_name(path.name + COMPRESS_EXTENSIONS[encoding])
+            target.write_bytes(body)
+            results[target] = True
+            files[url]["encodings"][encoding] = {"src": f"/{root_rel(target)}", "size": len(body)}
+    for url, entry in files.items():
+        path = ROOT_DIR / url.lstrip("/")
+        stat = path.stat()
+        entry.update(size=stat.st_size, mtimeMs=stat.st_mtime_ns // 1_000_000, tried=sorted(wanted))
+        for item in entry["encodings"].values():
+            results.setdefault(ROOT_DIR / item["src"].lstrip("/"), False)
+
+    for entry in previous.values():
+        for item in entry.get("encodings", {}).values():
+            sibling = ROOT_DIR / item["src"].lstrip("/")
+            if sibling not in results:
+                sibling.unlink(missing_ok=True)
+    if not files:
+        ENCODINGS_MANIFEST.unlink(missing_ok=True)
+        return results
+    ensure_parent(ENCODINGS_MANIFEST)
+    content = {"files": {url: files[url] for url in sorted(files)}}
+    ENCODINGS_MANIFEST.write_text(json.dumps(content, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return results
+
+
+def iter_pack_groups(
+    entries: JsonSpool | list[dict[str, Any]], pack_keys: Iterable[str]
+) -> Iterator[list[dict[str, Any]]]:
+    """The entries of each pack in ``pack_keys``, in turn; ``entries`` must be in pack order."""
+    groups = groupby(iter_entries(entries), key=lambda entry: entry["packKey"])
+    group = next(groups, None)
+    for pack_key in pack_keys:
+        if group is not None and group[0] == pack_key:
+            yield list(group[1])
+            group = next(groups, None)
+        else:
+            yield []
+
+
+def write_output_js(
+    payload: dict[str, Any],
+    manifest: BuildManifest | None = None,
+    force: bool = True,
+    output_format: str = "verbose",
+    shards: bool = False,
+    publisher: FingerprintPublisher | None = None,
+) -> dict[Path, bool]:
+    """Write game_data.generated.js (and per-pack shards); returns ``path -> written``.
+
+    With ``shards`` the main file becomes a small core: the pack list with each
+    shard's path and content version, plus the implemented kind templates (the first
+    entry of every implemented kind, the cross-pack refs game.js resolves by kind).
+    Every pack's pets and foods go to ``game_data.<pack>.js``, loaded on demand by
+    game.js. With a ``publisher`` the core points at fingerprinted shard copies instead.
+    Pets and foods may be spooled; shards then hold one pack's entries at a time.
+    """
+    results: dict[Path, bool] = {}
+    if not shards:
+        remove_stale_shards(set())
+        content_hash = _json_sha256({"format": output_format, "payload": payload})
+        results[OUTPUT_JS] = write_text_output(
+            OUTPUT_JS,
+            content_hash,
+            lambda: render_data_script("window.__GAME_DATA", payload, output_format),
+            manifest,
+            force,
+        )
+        return results
+
+    core_packs: list[dict[str, Any]] = []
+    templates: dict[str, dict[str, dict[str, Any]]] = {"pets": {}, "foods": {}}
+    pack_keys = [pack["key"] for pack in payload["packs"]]
+    groups = zip(payload["packs"], iter_pack_groups(payload["pets"], pack_keys), iter_pack_groups(payload["foods"], pack_keys))
+    for pack, pets, foods in groups:
+        pack_key = pack["key"]
+        shard = {"packKey": pack_key, "pets": pets, "foods": foods}
+        for kind in ("pets", "foods"):
+            for entry in shard[kind]:
+                if entry.get("implStatus") == "implemented":
+                    templates[kind].setdefault(entry["kind"], entry)
+        shard_hash = _json_sha256({"format": output_format, "payload": shard})
+        path = shard_path(pack_key)
+        results[path] = write_text_output(
+            path,
+            shard_hash,
+            lambda shard=shard: render_data_script(
+                f"(window.__GAME_DATA_SHARDS = window.__GAME_DATA_SHARDS || {{}})[{json.dumps(pack_key)}]",
+                shard,
+                output_format,
+            ),
+            manifest,
+            force,
+        )
+        shard_ref = {"src": f"./{root_rel(path)}", "version": shard_hash[:12]}
+        if publisher is not None:
+            shard_ref = {"src": f"./{publisher.publish(path)}"}
+        core_packs.append(
+            {
+                **pack,
+                "shard": {**shard_ref, "pets": len(pets), "foods": len(foods)},
+            }
+        )
+    remove_stale_shards(set(results))
+
+    core = {
+        **payload,
+        "packs": core_packs,
+        "pets": list(templates["pets"].values()),
+        "foods": list(templates["foods"].values()),
+    }
+    core_hash = _json_sha256({"format": output_format, "payload": core})
+    results[OUTPUT_JS] = write_text_output(
+        OUTPUT_JS,
+        core_hash,
+        lambda: render_data_script("window.__GAME_DATA", core, output_format),
+        manifest,
+        force,
+    )
+    return results
+
+
+def client_entry(entry: dict[str, Any], icon: IconInfo, icon_store: bool, text_bundles: bool) -> dict[str, Any]:
+    """An entry as game.js receives it: pointed at its icon store file or atlas rect, minus bundled text."""
+    client = dict(entry)
+    if icon_store and not entry["iconMissing"] and icon.sha256:
+        del client["iconAliasRel"]
+        client["iconHash"] = icon.sha256[:ICON_HASH_LENGTH]
+    if icon.atlas is not None:
+        client.pop("iconAliasRel", None)
+        client.pop("iconHash", None)
+        client.update(iconAtlas=icon.atlas, iconX=icon.x, iconY=icon.y, iconW=icon.w, iconH=icon.h)
+    if text_bundles:
+        client = {field: value for field, value in client.items() if field not in TEXT_FIELDS}
+    return client
+
+
+class GameDataSink(CatalogSink):
+    """Writes game_data.generated.js (and its shards) through write_output_js().
+
+    Every entry is reshaped by client_entry() and spooled per type as it arrives.
+    ``close()`` writes ``payload`` (everything but the pets and foods, complete by
+    then) with the spools in their place, so the file streams from disk.
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        icons: IconIndex,
+        manifest: BuildManifest | None = None,
+        force: bool = True,
+        output_format: str = "verbose",
+        shards: bool = False,
+        text_bundles: bool = False,
+        publisher: FingerprintPublisher | None = None,
+    ) -> None:
+        self.payload = payload
+        self.icons = icons
+        self.manifest = manifest
+        self.force = force
+        self.output_format = output_format
+        self.shards = shards
+        self.text_bundles = text_bundles
+        self.spools = {"pets": JsonSpool(), "foods": JsonSpool()}
+        self.publisher = publisher
+        self.results: dict[Path, bool] = {}
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        icon = self.icons.get(entry["iconAliasRel"])
+        client = client_entry(entry, icon, bool(self.payload.get("iconStore")), self.text_bundles)
+        self.spools[f"{type_key}s"].append(json.dumps(client, ensure_ascii=False, separators=(",", ":")))
+
+    def close(self) -> bool:
+        payload = {**self.payload, **self.spools}
+        self.results = write_output_js(
+            payload,
+            self.manifest,
+            force=self.force,
+            output_format=self.output_format,
+            shards=self.shards,
+            publisher=self.publisher,
+        )
+        for spool in self.spools.values():
+            spool.close()
+        return any(self.results.values())
+
+
+class EntryStore(CatalogSink):
+    """Assembled entries by pack in a scratch SQLite file, kept by a ``--watch`` session.
+
+    The session's first build fills it as one more sink. A rebuild drops the packs whose
+    rows changed and records their re-assembled entries as the icon stage streams them.
+    ``iter_entries()`` replays every pack in catalog order with ``iconMissing`` re-read
+    from the ``IconIndex``, so icon changes never re-assemble entries.
+    """
+
+    def __init__(self, path: Path, packs_registry: dict[str, dict[str, Any]]) -> None:
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE packs (key TEXT PRIMARY KEY, position INTEGER NOT NULL, pack TEXT NOT NULL);
+            CREATE TABLE entries (
+                pack_key TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                type_key TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                PRIMARY KEY (pack_key, seq)
+            );
+            """
+        )
+        self.packs_registry = packs_registry
+        self.counts: dict[str, int] = {}
+
+    def add(self, type_key: str, entry: dict[str, Any], pack: dict[str, Any]) -> None:
+        seq = self.counts.get(pack["key"], 0)
+        if not seq:
+            self.conn.execute(
+                "INSERT INTO packs VALUES (?, ?, ?)",
+                (pack["key"], self.packs_registry[pack["nameZh"]]["order"], json.dumps(pack, ensure_ascii=False)),
+            )
+        self.counts[pack["key"]] = seq + 1
+        self.conn.execute(
+            "INSERT INTO entries VALUES (?, ?, ?, ?)",
+            (pack["key"], seq, type_key, json.dumps(entry, ensure_ascii=False)),
+        )
+
+    def record(
+        self, entries: Iterable[tuple[str, dict[str, Any], dict[str, Any]]]
+    ) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+        """Pass ``entries`` through, adding each one on the way."""
+        for type_key, entry, pack in entries:
+            self.add(type_key, entry, pack)
+            yield type_key, entry, pack
+
+    def drop_packs(self, pack_keys: Collection[str]) -> None:
+        keys = json.dumps(sorted(pack_keys))
+        self.conn.execute("DELETE FROM packs WHERE key IN (SELECT value FROM json_each(?))", (keys,))
+        self.conn.execute("DELETE FROM entries WHERE pack_key IN (SELECT value FROM json_each(?))", (keys,))
+        for pack_key in pack_keys:
+            self.counts.pop(pack_key, None)
+
+    def iter_entries(self, icons: IconIndex) -> Iterator[tuple[str, dict[str, Any], dict[str, Any]]]:
+        packs = self.conn.execute("SELECT key, pack FROM packs ORDER BY position").fetchall()
+        for pack_key, pack_json in packs:
+            pack = json.loads(pack_json)
+            rows = self.conn.execute("SELECT type_key, entry FROM entries WHERE pack_key = ? ORDER BY seq", (pack_key,))
+            for type_key, entry_json in rows:
+                entry = json.loads(entry_json)
+                entry["iconMissing"] = icons.get(entry["iconAliasRel"]).missing
+                yield type_key, entry, pack
+
+    def close(self) -> bool:
+        self.conn.commit()
+        return False
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the game catalog from assets/configs.xlsx and assets/icons.")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse unchanged alias icons and skip rewriting outputs whose content is unchanged",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="after the build, keep polling configs.xlsx and assets/icons and rebuild what each change touches",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.3,
+        help="seconds the watched files must stay unchanged before a rebuild (default: 0.3)",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="copy",
+        help="how alias icons are created; unsupported strategies fall back to copy (default: copy)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="verbose",
+        help="game_data.generated.js layout: verbose objects or compact columnar tables (default: verbose)",
+    )
+    parser.add_argument(
+        "--shards",
+        action="store_true",
+        help="emit a small core game_data.generated.js plus one on-demand data shard per pack",
+    )
+    parser.add_argument(
+        "--text-bundles",
+        action="store_true",
+        help="move names and hints into per-language game_text.<lang>.js bundles loaded lazily by game.js",
+    )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help=f"also write an indexed SQLite catalog for tooling queries to {root_rel(OUTPUT_SQLITE)}",
+    )
+    parser.add_argument(
+        "--atlas",
+        action="store_true",
+        help="pack each pack's icons into assets/atlas sprite sheets referenced by rect (needs Pillow)",
+    )
+    parser.add_argument(
+        "--icon-store",
+        action="store_true",
+        help="store each distinct icon once as assets/icons_cas/<hash>.png and point entries at the hash",
+    )
+    parser.add_argument(
+        "--icon-variants",
+        action="store_true",
+        help="write resized icons for the canvas slot sizes under assets/icons_sized (needs Pillow)",
+    )
+    parser.add_argument(
+        "--icon-format",
+        choices=ICON_FORMATS,
+        default="png",
+        help="encoding for --icon-variants (default: png)",
+    )
+    parser.add_argument(
+        "--no-rows-cache",
+        action="store_true",
+        help="always parse configs.xlsx instead of reusing the cached rows in .build/",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=PROFILE_REPORT,
+        default=None,
+        help=f"write per-phase timings, byte counts and tracemalloc peaks as JSON (default: {root_rel(PROFILE_REPORT)})",
+    )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="publish content-hashed copies of icons and data files under assets/fp/ for immutable caching",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="write .gz (and .br with the brotli module) siblings of the data files and atlases for server.js",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="workers for sheet parsing and the icon stages (default: Python's pool defaults)",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="print the aliasing strategy used for every icon",
+    )
+    return parser.parse_args(argv)
+
+
+def run_build(
+    args: argparse.Namespace,
+    manifest: BuildManifest,
+    incremental: bool,
+    profiler: BuildProfiler,
+) -> dict[str, Any]:
+    """Build the catalog and write every selected output; returns what was written.
+
+    The icon stages run off the ``IconIndex`` first; then one pass over the entries
+    feeds every writer (``CatalogSink``), each closed in its own phase.
+    """
+    with tempfile.TemporaryDirectory(prefix="catalog-") as scratch:
+        scratch_dir = Path(scratch)
+        built = build_catalog(
+            scratch_dir,
+            manifest,
+            incremental=incremental,
+            link_mode=args.link_mode,
+            workers=args.jobs,
+            profiler=profiler,
+            rows_cache=not args.no_rows_cache,
+        )
+        with closing(built["rows"]), closing(built["icons"]):
+            return write_outputs(args, manifest, incremental, profiler, built, scratch_dir)
+
+
+def write_outputs(
+    args: argparse.Namespace,
+    manifest: BuildManifest,
+    incremental: bool,
+    profiler: BuildProfiler,
+    built: dict[str, Any],
+    scratch_dir: Path,
+    extra_sinks: Sequence[CatalogSink] = (),
+    defer_xlsx: bool = False,
+) -> dict[str, Any]:
+    icons = built["icons"]
+    # The emitted key order: pets and foods, then extras in the order the stages add them.
+    payload: dict[str, Any] = dict.fromkeys(("version", "packs", "pets", "foods"))
+    store_counts: dict[str, int] = {}
+    with profiler.phase("icon_store") as stats:
+        if args.icon_store:
+            store_counts = build_icon_store(payload, icons)
+            stats["files"] = store_counts["written"]
+            stats["bytesWritten"] = store_counts["bytesWritten"]
+        else:
+            remove_stale_icon_store(None)
+    variant_counts: dict[str, int] = {}
+    with profiler.phase("icon_variants") as stats:
+        if args.icon_variants:
+            variant_counts = build_icon_variants(
+                payload,
+                icons,
+                manifest,
+                force=not incremental,
+                icon_format=args.icon_format,
+                workers=args.jobs,
+            )
+            stats["files"] = variant_counts["written"]
+            stats["bytesWritten"] = variant_counts["bytesWritten"]
+        else:
+            remove_stale_files(ICONS_SIZED_DIR, lambda rel: False)
+    wrote_atlases: dict[Path, bool] = {}
+    with profiler.phase("icon_atlases") as stats:
+        if args.atlas:
+            wrote_atlases = build_icon_atlases(
+                payload, icons, manifest, force=not incremental, sprite_sizes=built.get("sprite_sizes")
+            )
+        else:
+            remove_stale_atlases(set())
+        count_written(stats, wrote_atlases)
+
+    force = not incremental
+    publisher = FingerprintPublisher() if args.fingerprint else None
+    header = PayloadHeaderSink(payload)
+    xlsx_sink = XlsxCatalogSink(OUTPUT_XLSX, manifest, force=force)
+    sqlite_sink = SqliteCatalogSink(payload, icons, manifest, force=force) if args.sqlite else None
+    text_sink = TextBundleSink(payload, scratch_dir / "texts.sqlite", manifest, force=force) if args.text_bundles else None
+    js_sink = GameDataSink(
+        payload,
+        icons,
+        manifest,
+        force=force,
+        output_format=args.format,
+        shards=args.shards,
+        text_bundles=args.text_bundles,
+        publisher=publisher,
+    )
+    sinks = [sink for sink in (header, xlsx_sink, sqlite_sink, text_sink, js_sink, *extra_sinks) if sink is not None]
+    with profiler.phase("assemble_entries") as stats:
+        stats["entries"] = 0
+        for type_key, entry, pack in iter_built_entries(built):
+            for sink in sinks:
+                sink.add(type_key, entry, pack)
+            stats["entries"] += 1
+        header.close()
+        for sink in extra_sinks:
+            sink.close()
+
+    with profiler.phase("write_xlsx") as stats:
+        # With ``defer_xlsx`` the caller gets the sink back and writes the workbook later.
+        wrote_xlsx = {} if defer_xlsx else {OUTPUT_XLSX: xlsx_sink.close()}
+        count_written(stats, wrote_xlsx)
+    wrote_sqlite: dict[Path, bool] = {}
+    with profiler.phase("write_sqlite") as stats:
+        if sqlite_sink is not None:
+            wrote_sqlite[OUTPUT_SQLITE] = sqlite_sink.close()
+        count_written(stats, wrote_sqlite)
+    wrote_text: dict[Path, bool] = {}
+    with profiler.phase("write_text_bundles") as stats:
+        if text_sink is not None:
+            text_sink.close()
+            wrote_text = text_sink.results
+        else:
+            remove_stale_text_bundles(set())
+        count_written(stats, wrote_text)
+    with profiler.phase("fingerprint") as stats:
+        if publisher is not None:
+            fingerprint_payload_assets(payload, publisher, icons)
+        stats["files"] = len(publisher.published) if publisher else 0
+    with profiler.phase("write_js") as stats:
+        js_sink.close()
+        wrote_js = js_sink.results
+        count_written(stats, wrote_js)
+        write_asset_manifest(publisher, payload["version"])
+    wrote_compressed: dict[Path, bool] = {}
+    with profiler.phase("precompress") as stats:
+        compress_paths: list[Path] = []
+        if args.compress:
+            compress_paths = list({**wrote_js, **wrote_text, **wrote_atlases})
+            if publisher is not None:
+                compress_paths += [
+                    ROOT_DIR / publisher.assets[root_rel(path)]
+                    for path in list(compress_paths)
+                    if root_rel(path) in publisher.assets
+                ]
+        wrote_compressed = write_precompressed(compress_paths, workers=args.jobs)
+        count_written(stats, wrote_compressed)
+    with profiler.phase("save_manifest") as stats:
+        save_manifest(manifest)
+        count_written(stats, {BUILD_MANIFEST: True})
+    return {
+        "packs": len(payload["packs"]),
+        "counts": header.counts,
+        "icon_stats": built["icon_stats"],
+        "icon_actions": list(icons.actions()) if args.verbose else [],
+        "outputs": {**wrote_xlsx, **wrote_sqlite, **wrote_js, **wrote_text, **wrote_atlases},
+        "store": store_counts,
+        "variants": variant_counts,
+        "compressed": wrote_compressed,
+        "workbook": xlsx_sink if defer_xlsx else None,
+    }
+
+
+def print_build_report(args: argparse.Namespace, result: dict[str, Any], written_only: bool = False) -> None:
+    for alias_rel, action in result["icon_actions"]:
+        if not (written_only and action == "kept"):
+            print(f"  {action:<8} {alias_rel}")
+    for path, wrote in result["outputs"].items():
+        if wrote or not written_only:
+            print(f"{'Generated' if wrote else 'Unchanged'}: {path}")
+    icon_summary = " ".join(f"{key}={value}" for key, value in sorted(result["icon_stats"].items()))
+    print(f"Alias icons under: {ICONS_EN_DIR} (link-mode={args.link_mode} {icon_summary})")
+    if result["store"]:
+        store = result["store"]
+        print(f"Icon store: {ICONS_CAS_DIR} (unique={store['unique']} written={store['written']})")
+    if result["variants"]:
+        variants = result["variants"]
+        print(f"Icon variants under: {ICONS_SIZED_DIR} (written={variants['written']} kept={variants['kept']})")
+    if result["compressed"]:
+        written = sum(result["compressed"].values())
+        print(f"Precompressed: {ENCODINGS_MANIFEST} (written={written} kept={len(result['compressed']) - written})")
+    counts = result["counts"]
+    print(f"packs={result['packs']} pets={counts['pets']} foods={counts['foods']}")
+
+
+def snapshot_sources() -> dict[str, tuple[int, int]]:
+    """Size and mtime of configs.xlsx, the pack registry, the stat overrides and every file under assets/icons."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    paths: list[str] = [str(SOURCE_XLSX), str(PACKS_CONFIG), str(STAT_OVERRIDES)]
+    for dirpath, _, filenames in os.walk(ICONS_DIR):
+        paths.extend(os.path.join(dirpath, name) for name in filenames)
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+class WatchSession:
+    """What ``--watch`` keeps between rebuilds, so each change redoes only what it touches.
+
+    The first build, and any after the pack registry or stat overrides change, runs
+    build_catalog() and keeps its ``RowStore`` and ``IconIndex`` open, plus an
+    ``EntryStore`` of the assembled entries. ``rebuild()`` then re-parses only the
+    sheets whose content changed, re-assembles and re-aliases only the packs whose
+    winning rows changed, and re-syncs only the aliases of changed source icons. Every
+    entry is replayed from the ``EntryStore`` to the writers, which skip the outputs
+    (shards, text bundles, ...) whose content is unchanged. The catalog workbook is
+    the slowest of them and no client loads it, so after a ``rebuild()`` it waits in
+    ``workbook`` until ``flush_workbook()`` once the sources are quiet.
+    """
+
+    def __init__(self, args: argparse.Namespace, manifest: BuildManifest) -> None:
+        self.args = args
+        self.manifest = manifest
+        self.scratch = tempfile.TemporaryDirectory(prefix="catalog-watch-")
+        self.built: dict[str, Any] | None = None
+        self.digests: dict[str, str] = {}
+        self.sprite_sizes: dict[str, tuple[int, int]] = {}
+        self.workbook: XlsxCatalogSink | None = None
+
+    def build(self, profiler: BuildProfiler) -> dict[str, Any]:
+        """A full incremental build that refills the session's stores."""
+        self.close_stores()
+        scratch_dir = Path(tempfile.mkdtemp(dir=self.scratch.name))
+        built = build_catalog(
+            scratch_dir,
+            self.manifest,
+            incremental=True,
+            link_mode=self.args.link_mode,
+            workers=self.args.jobs,
+            profiler=profiler,
+            rows_cache=not self.args.no_rows_cache,
+        )
+        self.built = {**built, "scratch_dir": scratch_dir, "entries": None, "sprite_sizes": self.sprite_sizes}
+        entries = EntryStore(scratch_dir / "entries.sqlite", built["packs"])
+        try:
+            result = self.write_outputs(profiler, self.built, [entries])
+        except BaseException:
+            entries.conn.close()
+            self.close_stores()
+            raise
+        self.set_workbook(None)
+        self.built["entries"] = entries
+        self.digests = built["rows"].pack_digests()
+        return result
+
+    def rebuild(self, changed: Collection[str], profiler: BuildProfiler) -> dict[str, Any]:
+        """Bring the outputs up to date with the ``changed`` source paths."""
+        if self.built is None or {str(PACKS_CONFIG), str(STAT_OVERRIDES)} & set(changed):
+            return self.build(profiler)
+        try:
+            return self.update(changed, profiler)
+        except BaseException:
+            # The stores may be half updated: the next change starts over.
+            self.close_stores()
+            raise
+
+    def update(self, changed: Collection[str], profiler: BuildProfiler) -> dict[str, Any]:
+        built = self.built
+        rows, icons, entries, packs = built["rows"], built["icons"], built["entries"], built["packs"]
+        affected: set[str] = set()
+        if str(SOURCE_XLSX) in changed:
+            self.manifest.source = file_record(SOURCE_XLSX, self.manifest.source)
+            cache_key = rows_cache_key(self.manifest.source["sha256"], packs)
+            with tempfile.TemporaryDirectory(dir=self.scratch.name) as parse_dir:
+                sheet_keys = read_workbook_rows(profiler, rows, cache_key, packs, Path(parse_dir), self.args.jobs)
+            with profiler.phase("dedup_rows") as stats:
+                stats["rows"] = rows.dedup(sheet_keys, packs)
+            if not stats["rows"]:
+                raise RuntimeError("No valid rows parsed from configs.xlsx")
+            digests = rows.pack_digests()
+            affected = {
+                name for name in digests.keys() | self.digests.keys() if digests.get(name) != self.digests.get(name)
+            }
+            self.digests = digests
+        src_rels = {
+            Path(path).relative_to(ICONS_DIR).as_posix() for path in changed if Path(path).is_relative_to(ICONS_DIR)
+        }
+
+        with profiler.phase("icon_stage") as stats:
+            stats["entries"] = 0
+            icons.clear_actions()
+            pack_keys = [packs[name]["key"] for name in affected]
+            dropped = icons.drop_packs(pack_keys)
+            entries.drop_packs(pack_keys)
+            icon_stats = self.resync_icons(src_rels, stats)
+            staged = stage_icons(
+                entries.record(iter_catalog_entries(rows.iter_packs(affected), packs, built["overrides"])),
+                icons,
+                self.manifest,
+                True,
+                self.args.link_mode,
+                self.args.jobs,
+                stats,
+            )
+            for action, count in staged.items():
+                icon_stats[action] = icon_stats.get(action, 0) + count
+            icons.order_packs([meta["key"] for meta in sorted(packs.values(), key=lambda meta: meta["order"])])
+            for alias_rel in dropped:
+                if not icons.has_icon(alias_rel):
+                    self.manifest.icons.pop(alias_rel, None)
+                    if (ROOT_DIR / alias_rel).exists():
+                        (ROOT_DIR / alias_rel).unlink()
+                        icon_stats["removed"] += 1
+            stats.update(icon_stats)
+
+        with profiler.phase("placeholder_icon_check") as stats:
+            stats["flagged"] = icons.mark_placeholder_clashes()
+        result = self.write_outputs(profiler, {**built, "icon_stats": icon_stats}, defer_xlsx=True)
+        self.set_workbook(result["workbook"])
+        return result
+
+    def resync_icons(self, src_rels: Collection[str], stats: dict[str, Any]) -> dict[str, int]:
+        """Re-sync the aliases of the source icons ``src_rels`` in place; returns alias actions counted."""
+        icon_stats: dict[str, int] = {"kept": 0, "removed": 0}
+        icons = self.built["icons"]
+        jobs: list[tuple[str, Path, Path, dict[str, Any] | None]] = []
+        updates: list[tuple[str, str | None, int | None, str | None]] = []
+        for alias_rel, src_rel in icons.aliases_of(src_rels):
+            if (ICONS_DIR / src_rel).exists():
+                jobs.append((alias_rel, ICONS_DIR / src_rel, ROOT_DIR / alias_rel, self.manifest.icons.get(alias_rel)))
+                continue
+            # The source is gone: the entry shows the missing icon, as a full build would.
+            self.manifest.icons.pop(alias_rel, None)
+            if (ROOT_DIR / alias_rel).exists():
+                (ROOT_DIR / alias_rel).unlink()
+                icon_stats["removed"] += 1
+            updates.append((alias_rel, None, None, None))
+        for alias_rel, record, action in run_icon_stage(jobs, True, self.args.link_mode, self.args.jobs):
+            self.manifest.icons[alias_rel] = record
+            updates.append((alias_rel, record["alias"]["sha256"], record["alias"]["size"], action))
+            icon_stats[action] = icon_stats.get(action, 0) + 1
+            if action != "kept":
+                stats["files"] += 1
+        icons.update(updates)
+        return icon_stats
+
+    def write_outputs(
+        self,
+        profiler: BuildProfiler,
+        built: dict[str, Any],
+        extra_sinks: Sequence[CatalogSink] = (),
+        defer_xlsx: bool = False,
+    ) -> dict[str, Any]:
+        with tempfile.TemporaryDirectory(dir=self.scratch.name) as scratch:
+            return write_outputs(
+                self.args, self.manifest, True, profiler, built, Path(scratch), extra_sinks, defer_xlsx
+            )
+
+    def set_workbook(self, workbook: XlsxCatalogSink | None) -> None:
+        """Make ``workbook`` the pending one, dropping a pending workbook it supersedes."""
+        if self.workbook is not None:
+            self.workbook.discard()
+        self.workbook = workbook
+
+    def flush_workbook(self) -> dict[Path, bool]:
+        """Write the pending catalog workbook, if any; returns ``path -> written``."""
+        if self.workbook is None:
+            return {}
+        workbook, self.workbook = self.workbook, None
+        results = {workbook.path: workbook.close()}
+        save_manifest(self.manifest)
+        return results
+
+    def close_stores(self) -> None:
+        if self.built is None:
+            return
+        self.built["rows"].close()
+        self.built["icons"].close()
+        if self.built["entries"] is not None:
+            self.built["entries"].conn.close()
+        shutil.rmtree(self.built["scratch_dir"], ignore_errors=True)
+        self.built = None
+
+    def close(self) -> None:
+        try:
+            self.flush_workbook()
+        finally:
+            self.close_stores()
+            self.scratch.cleanup()
+
+
+def watch_sources(args: argparse.Namespace, session: WatchSession) -> None:
+    """Poll the workbook, pack registry, stat overrides and icon tree; rebuild once changes settle.
+
+    Each rebuild goes through ``session``: a workbook edit re-parses only the sheets it
+    touched and re-emits only the packs whose rows changed, and an icon edit re-aliases
+    only that icon and re-reads its entries. Outputs whose content is unchanged are not
+    rewritten, and the catalog workbook is written at the first poll with no changes.
+    """
+    manifest = session.manifest
+    previous = snapshot_sources()
+    print(f"Watching {SOURCE_XLSX} and {ICONS_DIR} (Ctrl+C to stop)")
+    while True:
+        time.sleep(WATCH_POLL_SECONDS)
+        current = snapshot_sources()
+        if current == previous:
+            for path, wrote in session.flush_workbook().items():
+                if wrote:
+                    print(f"Generated: {path}")
+            continue
+        # Editors save in several writes; wait until the tree stops changing.
+        while True:
+            time.sleep(args.debounce)
+            settled = snapshot_sources()
+            if settled == current:
+                break
+            current = settled
+        changed = {path for path in previous.keys() | current.keys() if previous.get(path) != current.get(path)}
+        previous = current
+        print(f"Changed: {len(changed)} file(s), e.g. {sorted(changed)[0]}")
+
+        start = time.perf_counter()
+        try:
+            result = session.rebuild(changed, BuildProfiler())
+        except Exception as exc:  # A half-saved workbook should not end the session.
+            manifest.conn.rollback()
+            print(f"Rebuild failed: {exc}")
+            continue
+        print_build_report(args, result, written_only=True)
+        print(f"Rebuilt in {time.perf_counter() - start:.3f}s")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        raise SystemExit("--jobs must be >= 1")
+    if args.debounce < 0:
+        raise SystemExit("--debounce must be >= 0")
+    incremental = args.incremental or args.watch
+    profiler = BuildProfiler(enabled=args.profile is not None)
+    if profiler.enabled:
+        tracemalloc.start()
+
+    with profiler.phase("load_manifest") as stats:
+        manifest = load_manifest() if incremental else empty_manifest()
+        manifest.source = file_record(SOURCE_XLSX, manifest.source) if SOURCE_XLSX.exists() else {}
+        if incremental and BUILD_MANIFEST.exists():
+            stats["files"] = 1
+            stats["bytesRead"] = BUILD_MANIFEST.stat().st_size
+    session = WatchSession(args, manifest) if args.watch else None
+    result = session.build(profiler) if session is not None else run_build(args, manifest, incremental, profiler)
+
+    if profiler.enabled:
+        tracemalloc.stop()
+        options = {key: value for key, value in vars(args).items() if key != "profile"}
+        ensure_parent(args.profile)
+        args.profile.write_text(json.dumps(profiler.report(options), indent=2) + "\n", encoding="utf-8")
+
+    print_build_report(args, result)
+    if profiler.enabled:
+        print(f"Profile: {args.profile} (total {profiler.total_seconds():.3f}s)")
+    if session is not None:
+        with closing(session):
+            try:
+                watch_sources(args, session)
+            except KeyboardInterrupt:
+                print("Stopped watching.")
     return 0
 
 
@@ -0,0 +1,93 @@
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath, pathToFileURL } from "node:url";
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+const rootDir = path.resolve(__dirname, "..");
+const indexUrl = pathToFileURL(path.join(rootDir, "index.html")).href;
+const fixturesPath = path.join(rootDir, "test", "battle_fixtures.json");
+
+// Runs inside the page: draws random preset teams from the loaded catalog and records what
+// window.__debugSimulateBattle() makes of them. Uses its own LCG so the game RNG is untouched.
+export function collectBattleFixtures({ count, seed }) {
+  let rng = seed >>> 0;
+  const next = () => {
+    rng = (1664525 * rng + 1013904223) >>> 0;
+    return rng / 4294967296;
+  };
+  const pick = (list) => list[Math.floor(next() * list.length)];
+  const int = (min, max) => min + Math.floor(next() * (max - min + 1));
+
+  const pets = GAME_DATA.pets;
+  const implemented = pets.filter((pet) => pet.implStatus === "implemented");
+  const perks = [null, null, null, "garlic", "melon", "meat"];
+  const bee = { kind: "bee", name: "Bee", nameZh: "蜜蜂", nameEn: "Bee", attack: 1, health: 1, tier: 1 };
+
+  const presetEntry = () => {
+    const def = next() < 0.6 && implemented.length ? pick(implemented) : pick(pets);
+    const entry = { kind: def.implStatus === "implemented" ? def.kind : def.id, level: int(1, 3) };
+    if (next() < 0.7) entry.attack = int(0, 12);
+    if (next() < 0.7) entry.health = int(1, 12);
+    entry.perk = pick(perks);
+    if (next() < 0.15) entry.summonOnFaint = bee;
+    return entry;
+  };
+  const team = () => Array.from({ length: int(1, 5) }, presetEntry);
+
+  const cases = [];
+  for (let i = 0; i < count; i += 1) {
+    const friendly = team();
+    const enemy = team();
+    const battleSeed = Math.floor(next() * 4294967296) >>> 0;
+    cases.push({ seed: battleSeed, friendly, enemy, expected: window.__debugSimulateBattle(friendly, enemy, battleSeed) });
+  }
+  return { catalogVersion: GAME_DATA.version, cases };
+}
+
+function parseArgs(argv) {
+  const args = { count: 200, seed: 20240601, out: fixturesPath };
+  for (let i = 2; i < argv.length; i += 1) {
+    const arg = argv[i];
+    const next = argv[i + 1];
+    if (arg === "--count" && next) {
+      args.count = Number(next);
+      i += 1;
+    } else if (arg === "--seed" && next) {
+      args.seed = Number(next);
+      i += 1;
+    } else if (arg === "--out" && next) {
+      args.out = path.resolve(next);
+      i += 1;
+    }
+  }
+  return args;
+}
+
+async function main() {
+  const args = parseArgs(process.argv);
+  const { chromium } = await import("playwright");
+  const launchOptions = { headless: true };
+  if (!fs.existsSync(chromium.executablePath())) launchOptions.channel = "chrome";
+  const browser = await chromium.launch(launchOptions);
+  try {
+    const page = await browser.newPage();
+    await page.goto(indexUrl, { waitUntil: "load" });
+    const fixtures = await page.evaluate(collectBattleFixtures, { count: args.count, seed: args.seed });
+    // One battle per line keeps the fixture file reviewable in diffs.
+    const lines = fixtures.cases.map((entry) => `    ${JSON.stringify(entry)}`);
+    const text = `{\n  "catalogVersion": ${JSON.stringify(fixtures.catalogVersion)},\n  "cases": [\n${lines.join(",\n")}\n  ]\n}\n`;
+    fs.writeFileSync(args.out, text, "utf8");
+    console.log(`Wrote ${fixtures.cases.length} battles to ${args.out}`);
+    console.log("Check the Python engine with: python scripts/battle_sim.py --check");
+  } finally {
+    await browser.close();
+  }
+}
+
+if (process.argv[1] && pathToFileURL(process.argv[1]).href === import.meta.url) {
+  main().catch((err) => {
+    console.error(err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Monte Carlo win-rate matrix per pack, pet and shop tier, batched with NumPy.
+
+For every pack and tier, thousands of random team pairs are drawn from the pack's
+shop pool (the precomputed ``shopPools`` of the catalog) the way generateEnemyTeam()
+in src/game.js builds enemies, at the first round that unlocks the tier. Battles
+between pets without battle abilities (every ``placeholder`` pet) are fought
+together as attack/health/perk arrays, one step for all of them at a time. The
+few battles involving an implemented battle ability fall back to battle_sim.py,
+so every result matches the JS engine.
+
+Pets whose win rate sits far from the other placeholders of the same tier are
+listed as outliers: usually an auto_pet_stats() roll that needs an override.
+
+    python scripts/matchup_matrix.py --battles 20000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPTS_DIR.parent
+MATRIX_REPORT = ROOT_DIR / "output" / "balance" / "matchup_matrix.json"
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+import battle_sim  # noqa: E402
+import build_game_catalog as catalog  # noqa: E402
+
+WIN, LOSE, DRAW = range(3)
+
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise SystemExit("matchup_matrix.py needs NumPy: pip install numpy") from exc
+    return numpy
+
+
+def fight_batch(np: Any, attack: Any, health: Any, perk: Any) -> Any:
+    """Fight ``n`` ability-free battles at once; arrays are ``[n, 2, slots]``, front first.
+
+    Without abilities only the two fronts ever take damage, so each side is a queue
+    and a front index per side replaces the splicing in src/game.js. Returns an
+    ``[n]`` array of WIN/LOSE/DRAW from the friendly (side 0) point of view.
+    """
+    count, _, slots = attack.shape
+    health = health.copy()
+    perk = perk.copy()
+    front = np.zeros((count, 2), dtype=np.int64)
+    result = np.full(count, DRAW, dtype=np.int8)
+    active = np.arange(count)
+
+    def settle(active: Any) -> Any:
+        left_alive = front[active, 0] < slots
+        right_alive = front[active, 1] < slots
+        result[active[left_alive & ~right_alive]] = WIN
+        result[active[~left_alive & right_alive]] = LOSE
+        return active[left_alive & right_alive]
+
+    for _ in range(battle_sim.MAX_BATTLE_STEPS):
+        active = settle(active)
+        if not active.size:
+            break
+        left, right = front[active, 0], front[active, 1]
+        left_perk, right_perk = perk[active, 0, left], perk[active, 1, right]
+        # computeDamage(leftFront, rightFront), then computeDamage(rightFront, leftFront).
+        left_damage = attack[active, 0, left] + 3 * (left_perk == battle_sim.MEAT)
+        melon = right_perk == battle_sim.MELON
+        left_damage = np.where(melon, np.maximum(0, left_damage - 20), left_damage)
+        right_perk = np.where(melon, 0, right_perk)
+        left_damage = np.where(right_perk == battle_sim.GARLIC, np.maximum(1, left_damage - 2), left_damage)
+        right_damage = attack[active, 1, right] + 3 * (right_perk == battle_sim.MEAT)
+        melon = left_perk == battle_sim.MELON
+        right_damage = np.where(melon, np.maximum(0, right_damage - 20), right_damage)
+        left_perk = np.where(melon, 0, left_perk)
+        right_damage = np.where(left_perk == battle_sim.GARLIC, np.maximum(1, right_damage - 2), right_damage)
+        perk[active, 0, left] = left_perk
+        perk[active, 1, right] = right_perk
+        health[active, 1, right] -= left_damage
+        health[active, 0, left] -= right_damage
+        front[active, 0] += health[active, 0, left] <= 0
+        front[active, 1] += health[active, 1, right] <= 0
+    settle(active)
+    return result
+
+
+def draw_teams(np: Any, rng: Any, pool: list[dict[str, Any]], round_number: int, battles: int) -> dict[str, Any]:
+    """Random ``[battles, 2, size]`` team pairs, rolled like generateEnemyTeam() in src/game.js."""
+    size = battle_sim.enemy_team_size(round_number)
+    bonus = (round_number - 1) // 2
+    shape = (battles, 2, size)
+    picks = rng.integers(0, len(pool), size=shape)
+    base_attack = np.array([pet["attack"] for pet in pool], dtype=np.int64)
+    base_health = np.array([pet["health"] for pet in pool], dtype=np.int64)
+    abilities = np.array([battle_sim.ABILITY_CODES.get(pet.get("abilityKey"), 0) for pet in pool], dtype=np.int64)
+    return {
+        "picks": picks,
+        "attack": base_attack[picks] + rng.integers(0, bonus + 1, size=shape),
+        "health": base_health[picks] + rng.integers(0, bonus + 2, size=shape),
+        "perk": np.where(rng.random(shape) < 0.2, battle_sim.GARLIC, 0).astype(np.int64),
+        "ability": abilities[picks],
+        "seeds": rng.integers(0, 1 << 32, size=battles, dtype=np.uint64),
+    }
+
+
+def fight_scalar(np: Any, pool: list[dict[str, Any]], teams: dict[str, Any], rows: Any) -> Any:
+    """Fight ``rows`` of ``teams`` one by one with battle_sim.simulate()."""
+    results = np.empty(len(rows), dtype=np.int8)
+    codes = {"win": WIN, "lose": LOSE, "draw": DRAW}
+    for out, row in enumerate(rows.tolist()):
+        sides = []
+        for side in (0, 1):
+            sides.append(
+                [
+                    [0, attack, health, 1, ability, perk, None, pool[pick]["kind"]]
+                    for pick, attack, health, ability, perk in zip(
+                        teams["picks"][row, side].tolist(),
+                        teams["attack"][row, side].tolist(),
+                        teams["health"][row, side].tolist(),
+                        teams["ability"][row, side].tolist(),
+                        teams["perk"][row, side].tolist(),
+                    )
+                ]
+            )
+        results[out] = codes[battle_sim.simulate(sides[0], sides[1], int(teams["seeds"][row])).result]
+    return results
+
+
+def run_tier(np: Any, rng: Any, pool: list[dict[str, Any]], tier: int, battles: int) -> dict[str, Any]:
+    """Fight ``battles`` random pairs at ``tier``; returns per-pool-entry wins/appearances."""
+    round_number = 2 * tier - 1  # First round whose shop offers this tier.
+    teams = draw_teams(np, rng, pool, round_number, battles)
+    scalar = (teams["ability"] != 0).any(axis=(1, 2))
+    results = np.empty(battles, dtype=np.int8)
+    batched = np.flatnonzero(~scalar)
+    results[batched] = fight_batch(np, teams["attack"][batched], teams["health"][batched], teams["perk"][batched])
+    fallback = np.flatnonzero(scalar)
+    results[fallback] = fight_scalar(np, pool, teams, fallback)
+
+    won = np.stack([results == WIN, results == LOSE], axis=1)  # [battles, side]
+    picks = teams["picks"]
+    weights = np.broadcast_to(won[:, :, None], picks.shape)
+    return {
+        "wins": np.bincount(picks.ravel(), weights=weights.ravel(), minlength=len(pool)),
+        "games": np.bincount(picks.ravel(), minlength=len(pool)),
+        "results": {"win": int((results == WIN).sum()), "lose": int((results == LOSE).sum()), "draw": int((results == DRAW).sum())},
+        "batched": int(batched.size),
+        "scalar": int(fallback.size),
+    }
+
+
+def pack_matrix(np: Any, rng: Any, payload: dict[str, Any], pack: dict[str, Any], args: argparse.Namespace) -> dict[str, Any]:
+    pets = [pet for pet in payload["pets"] if pet["packKey"] == pack["key"]]
+    tier_pools = pack.get("shopPools", {}).get("pets")
+    if not tier_pools:
+        # Catalogs built before shop pools were precomputed.
+        top = max([catalog.SHOP_MAX_TIER, *(pet["tier"] for pet in pets)])
+        tier_pools = [[pos for pos, pet in enumerate(pets) if pet["tier"] <= tier] for tier in range(1, top + 1)]
+    rows = {
+        pet["id"]: {
+            "kind": pet["kind"],
+            "nameZh": pet.get("nameZh", ""),
+            "tier": pet["tier"],
+            "attack": pet["attack"],
+            "health": pet["health"],
+            "implStatus": pet.get("implStatus"),
+            "winRate": {},
+            "battles": {},
+        }
+        for pet in pets
+    }
+    tiers: dict[str, Any] = {}
+    for tier in args.tiers:
+        if tier > len(tier_pools) or not tier_pools[tier - 1]:
+            continue
+        pool = [pets[pos] for pos in tier_pools[tier - 1]]
+        start = time.perf_counter()
+        outcome = run_tier(np, rng, pool, tier, args.battles)
+        tiers[str(tier)] = {
+            "battles": args.battles,
+            "seconds": round(time.perf_counter() - start, 3),
+            "results": outcome["results"],
+            "batched": outcome["batched"],
+            "scalar": outcome["scalar"],
+        }
+        for pet, wins, games in zip(pool, outcome["wins"].tolist(), outcome["games"].tolist()):
+            if games:
+                rows[pet["id"]]["winRate"][str(tier)] = round(wins / games, 4)
+                rows[pet["id"]]["battles"][str(tier)] = games
+    return {"tiers": tiers, "pets": rows}
+
+
+def find_outliers(np: Any, matrix: dict[str, Any], z_limit: float, min_battles: int) -> list[dict[str, Any]]:
+    """Placeholder pets whose win rate is ``z_limit`` deviations from their tier's placeholders."""
+    outliers: list[dict[str, Any]] = []
+    for pack_key, pack in matrix.items():
+        for tier in pack["tiers"]:
+            sample = [
+                (pet_id, row["winRate"][tier])
+                for pet_id, row in pack["pets"].items()
+                if row["implStatus"] == "placeholder" and row["battles"].get(tier, 0) >= min_battles
+            ]
+            if len(sample) < 3:
+                continue
+            rates = np.array([rate for _, rate in sample])
+            mean, std = float(rates.mean()), float(rates.std())
+            if std == 0:
+                continue
+            for pet_id, rate in sample:
+                z = (rate - mean) / std
+                if abs(z) >= z_limit:
+                    outliers.append(
+                        {
+                            "pack": pack_key,
+                            "tier": int(tier),
+                            "id": pet_id,
+                            "winRate": rate,
+                            "tierMean": round(mean, 4),
+                            "z": round(z, 2),
+                            "attack": pack["pets"][pet_id]["attack"],
+                            "health": pack["pets"][pet_id]["health"],
+                        }
+                    )
+    return sorted(outliers, key=lambda item: -abs(item["z"]))
+
+
+def parse_tiers(text: str) -> list[int]:
+    low, _, high = text.partition("-")
+    return list(range(int(low), int(high or low) + 1))
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Win-rate matrix per pack, pet and shop tier from batched random battles.")
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=catalog.OUTPUT_JS,
+        help=f"generated data script to load (default: {catalog.root_rel(catalog.OUTPUT_JS)})",
+    )
+    parser.add_argument("--packs", nargs="*", default=None, help="pack keys to analyse (default: all)")
+    parser.add_argument("--tiers", type=parse_tiers, default=parse_tiers(f"1-{catalog.SHOP_MAX_TIER}"), help="tier or range, e.g. 3 or 1-6")
+    parser.add_argument("--battles", type=int, default=20000, help="random battles per pack and tier (default: 20000)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--z", type=float, default=2.5, help="outlier threshold in standard deviations (default: 2.5)")
+    parser.add_argument("--min-battles", type=int, default=200, help="appearances a pet needs at a tier to be judged")
+    parser.add_argument("--output", type=Path, default=MATRIX_REPORT, help=f"result JSON (default: {catalog.root_rel(MATRIX_REPORT)})")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    np = _load_numpy()
+    payload = battle_sim.load_catalog(args.catalog)
+    packs = [pack for pack in payload["packs"] if args.packs is None or pack["key"] in args.packs]
+    if not packs:
+        raise SystemExit(f"No packs match {args.packs}")
+    rng = np.random.default_rng(args.seed)
+
+    start = time.perf_counter()
+    matrix: dict[str, Any] = {}
+    for pack in packs:
+        matrix[pack["key"]] = pack_matrix(np, rng, payload, pack, args)
+        for tier, info in matrix[pack["key"]]["tiers"].items():
+            results = " ".join(f"{key}={value}" for key, value in info["results"].items())
+            print(
+                f"{pack['key']} tier {tier}: {info['battles']} battles in {info['seconds']}s "
+                f"(batched={info['batched']} scalar={info['scalar']}) {results}"
+            )
+    elapsed = time.perf_counter() - start
+    outliers = find_outliers(np, matrix, args.z, args.min_battles)
+
+    report = {
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "catalogVersion": payload.get("version"),
+        "config": {key: str(value) if isinstance(value, Path) else value for key, value in vars(args).items()},
+        "seconds": round(elapsed, 3),
+        "outliers": outliers,
+        "packs": matrix,
+    }
+    catalog.ensure_parent(args.output)
+    args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(f"{len(outliers)} outliers (|z| >= {args.z}) in {elapsed:.1f}s")
+    for item in outliers[:15]:
+        print(
+            f"  {item['pack']} tier {item['tier']} {item['id']} {item['attack']}/{item['health']}: "
+            f"{item['winRate']:.1%} vs {item['tierMean']:.1%} (z={item['z']:+.2f})"
+        )
+    print(f"Matrix: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,7 @@
-import { spawnSync } from "node:child_process";
 import fs from "node:fs";
 import path from "node:path";
 import { fileURLToPath, pathToFileURL } from "node:url";
+import { parseWorkerArgs, runNodeProcess, runWorkerPool, scenarios } from "./run_scenario_assertions.mjs";
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
@@ -11,6 +11,7 @@ const clientPath = path.join(rootDir, "scripts", "web_game_playwright_client.js"
 const scenarioAssertionPath = path.join(rootDir, "scripts", "run_scenario_assertions.mjs");
 const indexUrl = pathToFileURL(path.join(rootDir, "index.html")).href;
 const outputBase = path.join(rootDir, "output", "web-game", "full-regression");
+const summaryPath = path.join(outputBase, "summary.json");
 
 function readActionFiles() {
   const names = fs
@@ -34,21 +35,15 @@ function parseErrorArtifacts(outputDir) {
   }
 }
 
-function runNodeScript(scriptPath, args, label) {
-  const result = spawnSync(process.execPath, [scriptPath, ...args], {
-    cwd: rootDir,
-    stdio: "inherit",
-    windowsHide: true,
-  });
-  if (result.status !== 0) {
-    throw new Error(`${label} failed with exit code ${result.status ?? "unknown"}`);
-  }
+// Each scenario is its own job (run_scenario_assertions.mjs <name>) so it can be sharded too.
+function runScenarioJob(job, logPath) {
+  return runNodeProcess([scenarioAssertionPath, job.scenario], logPath).then((status) =>
+    status === 0 ? null : `scenario assertions failed for ${job.scenario} (exit ${status})`
+  );
 }
 
-function runActionRegression(actionFile, outputDir) {
-  fs.rmSync(outputDir, { recursive: true, force: true });
-  fs.mkdirSync(outputDir, { recursive: true });
-
+async function runActionRegression(job, logPath) {
+  const { actionFile, outputDir } = job;
   const args = [
     clientPath,
     "--url",
@@ -63,29 +58,37 @@ function runActionRegression(actionFile, outputDir) {
     outputDir,
   ];
 
-  const result = spawnSync(process.execPath, args, {
-    cwd: rootDir,
-    stdio: "inherit",
-    windowsHide: true,
-  });
-  if (result.status !== 0) {
-    throw new Error(`Playwright regression failed for ${path.basename(actionFile)} (exit ${result.status ?? "unknown"})`);
+  const status = await runNodeProcess(args, logPath);
+  if (status !== 0) {
+    return `Playwright regression failed for ${path.basename(actionFile)} (exit ${status})`;
   }
 
   const errors = parseErrorArtifacts(outputDir);
   if (errors.length) {
-    throw new Error(`Regression produced console/page errors for ${path.basename(actionFile)} (${errors.length})`);
+    return `Regression produced console/page errors for ${path.basename(actionFile)} (${errors.length})`;
   }
+  return null;
 }
 
-function parseOnlyActions() {
-  const names = process.argv.slice(2).map((name) => name.trim()).filter(Boolean);
-  if (!names.length) return null;
-  return new Set(names.map((name) => name.toLowerCase()));
+// Every job writes to its own output dir; with more than one worker its console output is
+// captured there as run.log.
+async function runJob(job, parallel) {
+  fs.rmSync(job.outputDir, { recursive: true, force: true });
+  fs.mkdirSync(job.outputDir, { recursive: true });
+  const logPath = parallel ? path.join(job.outputDir, "run.log") : null;
+  let error;
+  try {
+    error = job.scenario ? await runScenarioJob(job, logPath) : await runActionRegression(job, logPath);
+  } catch (caught) {
+    error = caught.message;
+  }
+  console.log(`[${error ? "FAIL" : "PASS"}] ${job.name}`);
+  return { error, logPath };
 }
 
-function main() {
-  const only = parseOnlyActions();
+async function main() {
+  const { workers, names } = parseWorkerArgs(process.argv);
+  const only = names.length ? new Set(names.map((name) => name.toLowerCase())) : null;
   const actionFiles = readActionFiles();
   if (!actionFiles.length) {
     throw new Error("No non-scenario action files found under ./test.");
@@ -101,20 +104,62 @@ function main() {
 
   fs.mkdirSync(outputBase, { recursive: true });
 
-  console.log("Running scenario assertions...");
-  runNodeScript(scenarioAssertionPath, [], "scenario assertions");
-  console.log("Scenario assertions complete.\n");
-
-  let passCount = 0;
-  for (const actionFile of selectedActions) {
-    const base = path.basename(actionFile, ".json");
-    const outputDir = path.join(outputBase, base);
-    runActionRegression(actionFile, outputDir);
-    passCount += 1;
-    console.log(`[PASS] ${path.basename(actionFile)}`);
+  // Scenarios go first: serial runs keep the old order, and the pool starts them early.
+  const jobs = [
+    ...scenarios.map((scenario) => ({
+      name: `scenario:${scenario.name}`,
+      scenario: scenario.name,
+      outputDir: path.join(outputBase, `scenario-${scenario.name}`),
+    })),
+    ...selectedActions.map((actionFile) => ({
+      name: path.basename(actionFile),
+      actionFile,
+      outputDir: path.join(outputBase, path.basename(actionFile, ".json")),
+    })),
+  ];
+
+  console.log(`Running ${jobs.length} regression jobs on ${Math.min(workers, jobs.length)} worker(s)...`);
+  const started = performance.now();
+  const { results, lanes } = await runWorkerPool(jobs, workers, (job) => runJob(job, workers > 1));
+  const wallSeconds = (performance.now() - started) / 1000;
+
+  const summary = {
+    workers,
+    wallSeconds: Number(wallSeconds.toFixed(3)),
+    busySeconds: Number(lanes.reduce((total, lane) => total + lane.busySeconds, 0).toFixed(3)),
+    shards: lanes.map((lane) => ({ ...lane, busySeconds: Number(lane.busySeconds.toFixed(3)) })),
+    jobs: jobs.map((job, index) => ({
+      name: job.name,
+      status: results[index].error ? "fail" : "pass",
+      worker: results[index].worker,
+      seconds: Number(results[index].seconds.toFixed(3)),
+      outputDir: path.relative(rootDir, job.outputDir),
+      ...(results[index].error ? { error: results[index].error } : {}),
+    })),
+  };
+  fs.writeFileSync(summaryPath, `${JSON.stringify(summary, null, 2)}\n`, "utf8");
+
+  console.log("\nSummary:");
+  for (const [index, entry] of summary.jobs.entries()) {
+    console.log(`  ${entry.status.toUpperCase()} ${entry.name.padEnd(36)} ${entry.seconds.toFixed(1).padStart(6)}s  worker ${entry.worker}`);
+    if (entry.error) {
+      console.log(`       ${entry.error}`);
+      if (results[index].logPath) console.log(`       log: ${path.relative(rootDir, results[index].logPath)}`);
+    }
   }
+  for (const lane of summary.shards) {
+    console.log(`  worker ${lane.worker}: ${lane.jobs} job(s), ${lane.busySeconds.toFixed(1)}s busy`);
+  }
+  console.log(`  wall ${summary.wallSeconds.toFixed(1)}s for ${summary.busySeconds.toFixed(1)}s of work; ${path.relative(rootDir, summaryPath)}`);
 
-  console.log(`\nFull regression passed (${passCount} action files + scenario assertions).`);
+  const failed = summary.jobs.filter((entry) => entry.status === "fail");
+  if (failed.length) {
+    throw new Error(`Full regression failed: ${failed.length}/${jobs.length} job(s)`);
+  }
+  console.log(`\nFull regression passed (${selectedActions.length} action files + ${scenarios.length} scenario assertions).`);
 }
 
-main();
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -1,5 +1,6 @@
-import { spawnSync } from "node:child_process";
+import { spawn } from "node:child_process";
 import fs from "node:fs";
+import os from "node:os";
 import path from "node:path";
 import { fileURLToPath, pathToFileURL } from "node:url";
 
@@ -10,7 +11,67 @@ const clientPath = path.join(rootDir, "scripts", "web_game_playwright_client.js"
 const indexUrl = pathToFileURL(path.join(rootDir, "index.html")).href;
 const outputBase = path.join(rootDir, "output", "web-game", "scenario-assertions");
 
-function runPlaywrightScenario(name, actionsFile, outputDir) {
+// Resolves with the exit code. With `logPath` the client's output goes to that file instead
+// of the console, so parallel runs do not interleave.
+export function runNodeProcess(args, logPath = null) {
+  const logFd = logPath ? fs.openSync(logPath, "w") : null;
+  return new Promise((resolve, reject) => {
+    const child = spawn(process.execPath, args, {
+      cwd: rootDir,
+      stdio: logFd === null ? "inherit" : ["ignore", logFd, logFd],
+      windowsHide: true,
+    });
+    child.on("error", reject);
+    child.on("exit", (code) => resolve(code ?? 1));
+  }).finally(() => {
+    if (logFd !== null) fs.closeSync(logFd);
+  });
+}
+
+// Runs `jobs` on `workers` lanes, each pulling the next job when it is free. Results come
+// back in job order whatever the finishing order; `lanes` holds per-lane timing.
+export async function runWorkerPool(jobs, workers, runJob) {
+  const results = new Array(jobs.length);
+  const lanes = [];
+  let next = 0;
+  const lane = async (worker) => {
+    const stats = { worker, jobs: 0, busySeconds: 0 };
+    lanes.push(stats);
+    while (next < jobs.length) {
+      const index = next;
+      next += 1;
+      const started = performance.now();
+      const result = await runJob(jobs[index], worker);
+      const seconds = (performance.now() - started) / 1000;
+      results[index] = { ...result, worker, seconds };
+      stats.jobs += 1;
+      stats.busySeconds += seconds;
+    }
+  };
+  await Promise.all(Array.from({ length: Math.max(1, Math.min(workers, jobs.length)) }, (_, worker) => lane(worker)));
+  lanes.sort((a, b) => a.worker - b.worker);
+  return { results, lanes };
+}
+
+// `--workers N` (or `auto` for one per CPU); the remaining arguments are returned as names.
+export function parseWorkerArgs(argv) {
+  const args = { workers: 1, names: [] };
+  for (let i = 2; i < argv.length; i += 1) {
+    const arg = argv[i];
+    const value = arg.startsWith("--workers=") ? arg.slice("--workers=".length) : null;
+    if (value !== null || arg === "--workers" || arg === "-j") {
+      const raw = value ?? argv[(i += 1)];
+      const workers = raw === "auto" ? (os.availableParallelism?.() ?? os.cpus().length) : Number(raw);
+      if (!Number.isInteger(workers) || workers < 1) throw new Error(`--workers must be a positive integer or auto, got ${raw}`);
+      args.workers = workers;
+    } else if (arg.trim()) {
+      args.names.push(arg.trim());
+    }
+  }
+  return args;
+}
+
+function runPlaywrightScenario(actionsFile, outputDir, logPath) {
   const args = [
     clientPath,
     "--url",
@@ -24,14 +85,7 @@ function runPlaywrightScenario(name, actionsFile, outputDir) {
     "--screenshot-dir",
     outputDir,
   ];
-  const result = spawnSync(process.execPath, args, {
-    cwd: rootDir,
-    stdio: "inherit",
-    windowsHide: true,
-  });
-  if (result.status !== 0) {
-    throw new Error(`Playwright scenario failed: ${name}`);
-  }
+  return runNodeProcess(args, logPath);
 }
 
 function parseStateFile(outputDir) {
@@ -72,7 +126,7 @@ function includesResolved(state, text) {
   return entries.some((line) => typeof line === "string" && line.includes(text));
 }
 
-const scenarios = [
+export const scenarios = [
   {
     name: "choco",
     actionsFile: path.join(rootDir, "test", "actions-scenario-choco.json"),
@@ -131,47 +185,55 @@ const scenarios = [
   },
 ];
 
-function parseOnlyScenarios() {
-  const args = process.argv.slice(2);
-  if (!args.length) return null;
-  return new Set(args.map((name) => name.trim().toLowerCase()).filter(Boolean));
+async function runScenario(scenario, logOutput) {
+  const scenarioOutput = path.join(outputBase, scenario.name);
+  fs.rmSync(scenarioOutput, { recursive: true, force: true });
+  fs.mkdirSync(scenarioOutput, { recursive: true });
+
+  const logPath = logOutput ? path.join(scenarioOutput, "run.log") : null;
+  const status = await runPlaywrightScenario(scenario.actionsFile, scenarioOutput, logPath);
+  if (status !== 0) {
+    return { failures: [`Playwright scenario failed (exit ${status})`], logPath };
+  }
+
+  const failures = [];
+  const errors = readErrors(scenarioOutput);
+  if (errors.length) {
+    failures.push(`playwright captured errors (${errors.length})`);
+  }
+
+  try {
+    scenario.validate(parseStateFile(scenarioOutput), failures);
+  } catch (error) {
+    failures.push(error.message);
+  }
+  return { failures, logPath };
 }
 
-function main() {
-  const only = parseOnlyScenarios();
+async function main() {
+  const { workers, names } = parseWorkerArgs(process.argv);
+  const only = names.length ? new Set(names.map((name) => name.toLowerCase())) : null;
   const selected = only ? scenarios.filter((scenario) => only.has(scenario.name)) : scenarios;
   if (!selected.length) {
-    throw new Error("No valid scenario selected. Valid names: choco, melon, dodo, peng, turtle");
+    throw new Error(`No valid scenario selected. Valid names: ${scenarios.map((scenario) => scenario.name).join(", ")}`);
   }
 
   fs.mkdirSync(outputBase, { recursive: true });
 
-  let failedCount = 0;
-  for (const scenario of selected) {
-    const scenarioOutput = path.join(outputBase, scenario.name);
-    fs.rmSync(scenarioOutput, { recursive: true, force: true });
-    fs.mkdirSync(scenarioOutput, { recursive: true });
-
-    runPlaywrightScenario(scenario.name, scenario.actionsFile, scenarioOutput);
-
-    const failures = [];
-    const errors = readErrors(scenarioOutput);
-    if (errors.length) {
-      failures.push(`playwright captured errors (${errors.length})`);
-    }
-
-    const state = parseStateFile(scenarioOutput);
-    scenario.validate(state, failures);
+  const { results } = await runWorkerPool(selected, workers, (scenario) => runScenario(scenario, workers > 1));
 
+  let failedCount = 0;
+  selected.forEach((scenario, index) => {
+    const { failures, logPath } = results[index];
     if (failures.length) {
       failedCount += 1;
       console.error(`\n[FAIL] ${scenario.name}`);
       for (const failure of failures) console.error(`  - ${failure}`);
-      continue;
+      if (logPath) console.error(`  log: ${path.relative(rootDir, logPath)}`);
+      return;
     }
-
     console.log(`[PASS] ${scenario.name}`);
-  }
+  });
 
   if (failedCount > 0) {
     throw new Error(`Scenario assertions failed: ${failedCount}`);
@@ -180,4 +242,9 @@ function main() {
   console.log(`\nScenario assertions passed (${selected.length}/${selected.length}).`);
 }
 
-main();
+if (process.argv[1] && pathToFileURL(process.argv[1]).href === import.meta.url) {
+  main().catch((error) => {
+    console.error(error);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""Tune placeholder pet stats and food buffs toward a target win-rate curve.
+
+Every iteration fights random battles per pack and tier (teams rolled like
+generateEnemyTeam() in src/game.js, at the first round of the tier) on a process
+pool, and measures each placeholder pet's score (win = 1, draw = 0.5) at its own
+tier. Pets above the target lose a point of their larger stat, pets below gain a
+point of their smaller one. A pet stops once it is within --tolerance, or when
+the next step would revisit a stat line; it then keeps its best line. The same
+battle seeds are reused every iteration, so stat changes are compared on equal
+footing. Foods are tuned afterwards: the smallest placeholderBuff (1-6) whose
++buff/+buff on one pet lifts a team's score by --food-uplift.
+
+Results go to assets/stat_overrides.json, which build_catalog() applies on the
+next build:
+
+    python scripts/tune_stats.py --packs pack2 pack3
+    python scripts/build_game_catalog.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+import battle_sim  # noqa: E402
+import build_game_catalog as catalog  # noqa: E402
+
+# Same bounds auto_pet_stats() clamps to; the game clamps placeholderBuff to 1-6.
+ATTACK_RANGE = (1, 12)
+HEALTH_RANGE = (1, 15)
+FOOD_BUFF_RANGE = (1, 6)
+# Battles of a group are split into this many seeded chunks whatever --jobs is, so
+# the results only depend on --seed and --battles.
+FIGHT_CHUNKS = 16
+
+# A pool entry is (kind, attack, health, ability) with ability as a battle_sim code.
+PoolEntry = tuple[str, int, int, int]
+
+
+def _fight_chunk(job: tuple[list[PoolEntry], int, int, int, int]) -> tuple[list[float], list[int]]:
+    """Worker: ``battles`` random pairs from ``pool``; returns per-entry score sums and appearances.
+
+    With ``food_buff`` > 0 only side 0 is scored, and one random pet of side 0 carries
+    +food_buff/+food_buff.
+    """
+    pool, round_number, battles, seed, food_buff = job
+    rng = random.Random(seed)
+    size = battle_sim.enemy_team_size(round_number)
+    bonus = (round_number - 1) // 2
+    scores = [0.0] * len(pool)
+    games = [0] * len(pool)
+    for _ in range(battles):
+        picks = ([rng.randrange(len(pool)) for _ in range(size)], [rng.randrange(len(pool)) for _ in range(size)])
+        teams = []
+        for side_picks in picks:
+            team = []
+            for index in side_picks:
+                kind, attack, health, ability = pool[index]
+                perk = battle_sim.GARLIC if rng.random() < 0.2 else 0
+                attack += rng.randint(0, bonus)
+                health += rng.randint(0, bonus + 1)
+                team.append([0, attack, health, 1, ability, perk, None, kind])
+            teams.append(team)
+        if food_buff:
+            eater = rng.choice(teams[0])
+            eater[battle_sim.ATTACK] += food_buff
+            eater[battle_sim.HEALTH] += food_buff
+        result = battle_sim.simulate(teams[0], teams[1], rng.getrandbits(32)).result
+        score = 1.0 if result == "win" else 0.5 if result == "draw" else 0.0
+        for side, side_picks in enumerate(picks[: 1 if food_buff else 2]):
+            side_score = score if side == 0 else 1.0 - score
+            for index in side_picks:
+                scores[index] += side_score
+                games[index] += 1
+    return scores, games
+
+
+def chunk_seed(*parts: Any) -> int:
+    return zlib.crc32(json.dumps(parts).encode("utf-8"))
+
+
+class Tuner:
+    def __init__(self, payload: dict[str, Any], args: argparse.Namespace, executor: ProcessPoolExecutor) -> None:
+        self.args = args
+        self.executor = executor
+        self.packs = [pack for pack in payload["packs"] if args.packs is None or pack["key"] in args.packs]
+        self.pets = {pack["key"]: [pet for pet in payload["pets"] if pet["packKey"] == pack["key"]] for pack in self.packs}
+        self.foods = {pack["key"]: [food for food in payload["foods"] if food["packKey"] == pack["key"]] for pack in self.packs}
+        self.stats = {pet["id"]: (pet["attack"], pet["health"]) for pets in self.pets.values() for pet in pets}
+        self.history: dict[str, dict[tuple[int, int], float]] = {}
+        self.done: set[str] = set()
+
+    def target(self, tier: int) -> float:
+        curve = self.args.target
+        return curve[min(tier, len(curve)) - 1]
+
+    def pool(self, pack_key: str, tier: int) -> list[dict[str, Any]]:
+        return [pet for pet in self.pets[pack_key] if pet["tier"] <= tier]
+
+    def pool_entries(self, pets: list[dict[str, Any]]) -> list[PoolEntry]:
+        return [
+            (pet["kind"], *self.stats[pet["id"]], battle_sim.ABILITY_CODES.get(pet.get("abilityKey"), 0))
+            for pet in pets
+        ]
+
+    def fight(self, groups: dict[Any, tuple[list[dict[str, Any]], int, int]]) -> dict[Any, tuple[list[float], list[int]]]:
+        """Run every ``key -> (pets, tier, food_buff)`` group, split into chunks across the pool."""
+        base, extra = divmod(self.args.battles, FIGHT_CHUNKS)
+        jobs, owners = [], []
+        for key, (pets, tier, food_buff) in groups.items():
+            entries = self.pool_entries(pets)
+            for chunk in range(FIGHT_CHUNKS):
+                battles = base + (chunk < extra)
+                if not battles:
+                    continue
+                seed = chunk_seed(self.args.seed, key[0], tier, chunk, "food" if food_buff else "pets")
+                jobs.append((entries, 2 * tier - 1, battles, seed, food_buff))
+                owners.append(key)
+        totals = {key: ([0.0] * len(pets), [0] * len(pets)) for key, (pets, _, _) in groups.items()}
+        for key, (scores, games) in zip(owners, self.executor.map(_fight_chunk, jobs)):
+            for index, (score, count) in enumerate(zip(scores, games)):
+                totals[key][0][index] += score
+                totals[key][1][index] += count
+        return totals
+
+    def step(self, pet_id: str, error: float) -> tuple[int, int] | None:
+        attack, health = self.stats[pet_id]
+        if error > 0:
+            if attack >= health and attack > ATTACK_RANGE[0]:
+                return attack - 1, health
+            if health > HEALTH_RANGE[0]:
+                return attack, health - 1
+            return (attack - 1, health) if attack > ATTACK_RANGE[0] else None
+        if attack <= health and attack < ATTACK_RANGE[1]:
+            return attack + 1, health
+        if health < HEALTH_RANGE[1]:
+            return attack, health + 1
+        return (attack + 1, health) if attack < ATTACK_RANGE[1] else None
+
+    def settle(self, pet_id: str) -> None:
+        history = self.history[pet_id]
+        self.stats[pet_id] = min(history, key=lambda line: abs(history[line]))
+        self.done.add(pet_id)
+
+    def tune_pets(self) -> None:
+        placeholders = [pet for pets in self.pets.values() for pet in pets if pet.get("implStatus") == "placeholder"]
+        for iteration in range(1, self.args.iterations + 1):
+            active = [pet for pet in placeholders if pet["id"] not in self.done]
+            if not active:
+                break
+            started = time.perf_counter()
+            groups = {
+                (pack_key, tier): (self.pool(pack_key, tier), tier, 0)
+                for pack_key, tier in sorted({(pet["packKey"], pet["tier"]) for pet in active})
+            }
+            totals = self.fight(groups)
+            moved = 0
+            errors = []
+            for pet in active:
+                pets, _, _ = groups[(pet["packKey"], pet["tier"])]
+                scores, games = totals[(pet["packKey"], pet["tier"])]
+                index = next(pos for pos, entry in enumerate(pets) if entry["id"] == pet["id"])
+                if not games[index]:
+                    continue
+                error = scores[index] / games[index] - self.target(pet["tier"])
+                errors.append(abs(error))
+                self.history.setdefault(pet["id"], {})[self.stats[pet["id"]]] = error
+                if abs(error) <= self.args.tolerance:
+                    self.done.add(pet["id"])
+                    continue
+                line = self.step(pet["id"], error)
+                if line is None or line in self.history[pet["id"]]:
+                    self.settle(pet["id"])
+                    continue
+                self.stats[pet["id"]] = line
+                moved += 1
+            mean_error = sum(errors) / len(errors) if errors else 0.0
+            print(
+                f"iteration {iteration}: {len(active)} pets, mean |error| {mean_error:.3f}, "
+                f"moved {moved}, settled {len(self.done)}/{len(placeholders)} ({time.perf_counter() - started:.1f}s)"
+            )
+            if not moved:
+                break
+        for pet in placeholders:
+            if pet["id"] not in self.done and pet["id"] in self.history:
+                self.settle(pet["id"])
+
+    def tune_foods(self) -> dict[str, int]:
+        """Smallest buff per pack and tier whose score reaches 0.5 + --food-uplift."""
+        pending = sorted(
+            {(food["packKey"], food["tier"]) for foods in self.foods.values() for food in foods if food.get("implStatus") == "placeholder"}
+        )
+        goal = 0.5 + self.args.food_uplift
+        chosen: dict[tuple[str, int], int] = {}
+        previous: dict[tuple[str, int], float] = {}
+        for buff in range(FOOD_BUFF_RANGE[0], FOOD_BUFF_RANGE[1] + 1):
+            pending = [key for key in pending if key not in chosen]
+            if not pending:
+                break
+            totals = self.fight({key: (self.pool(*key), key[1], buff) for key in pending})
+            for key in pending:
+                scores, games = totals[key]
+                score = sum(scores) / max(1, sum(games))
+                if score >= goal:
+                    # Stop at the first buff past the goal; keep the one below if it was closer.
+                    below = previous.get(key)
+                    chosen[key] = buff - 1 if below is not None and goal - below < score - goal else buff
+                previous[key] = score
+        for key in pending:
+            chosen.setdefault(key, FOOD_BUFF_RANGE[1])
+        return {
+            food["id"]: chosen[(food["packKey"], food["tier"])]
+            for foods in self.foods.values()
+            for food in foods
+            if (food["packKey"], food["tier"]) in chosen and food.get("implStatus") == "placeholder"
+        }
+
+
+def write_overrides(tuner: Tuner, food_buffs: dict[str, int], payload: dict[str, Any], args: argparse.Namespace) -> dict[str, Any]:
+    """Merge tuned values for the selected packs into the overrides file; defaults are omitted."""
+    existing: dict[str, Any] = {}
+    if catalog.STAT_OVERRIDES.exists():
+        existing = json.loads(catalog.STAT_OVERRIDES.read_text(encoding="utf-8"))
+    tuned_packs = {pack["key"] for pack in tuner.packs}
+    pets = {key: value for key, value in existing.get("pets", {}).items() if key.split("_pet_")[0] not in tuned_packs}
+    foods = {key: value for key, value in existing.get("foods", {}).items() if key.split("_food_")[0] not in tuned_packs}
+    for pet_list in tuner.pets.values():
+        for pet in pet_list:
+            if pet.get("implStatus") != "placeholder":
+                continue
+            attack, health = tuner.stats[pet["id"]]
+            if (attack, health) != catalog.auto_pet_stats(pet["id"], pet["tier"]):
+                pets[pet["id"]] = {"attack": attack, "health": health}
+    for food_list in tuner.foods.values():
+        for food in food_list:
+            buff = food_buffs.get(food["id"])
+            if buff is not None and buff != catalog.placeholder_food_buff(food["tier"]):
+                foods[food["id"]] = {"placeholderBuff": buff}
+    content = {
+        "generatedBy": "scripts/tune_stats.py",
+        "tunedAt": datetime.now(timezone.utc).isoformat(),
+        "catalogVersion": payload.get("version"),
+        "config": {
+            "packs": sorted(tuned_packs),
+            "target": args.target,
+            "tolerance": args.tolerance,
+            "foodUplift": args.food_uplift,
+            "battles": args.battles,
+            "seed": args.seed,
+        },
+        "pets": dict(sorted(pets.items())),
+        "foods": dict(sorted(foods.items())),
+    }
+    if not args.dry_run:
+        catalog.STAT_OVERRIDES.write_text(json.dumps(content, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    return content
+
+
+def parse_target(text: str) -> list[float]:
+    values = [float(value) for value in text.split(",") if value.strip()]
+    if not values or not all(0 < value < 1 for value in values):
+        raise argparse.ArgumentTypeError("expected win rates in (0, 1), e.g. 0.5 or 0.45,0.48,0.5,0.52,0.54,0.56")
+    return values
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tune placeholder pet stats and food buffs with simulated battles.")
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=catalog.OUTPUT_JS,
+        help=f"generated data script to start from (default: {catalog.root_rel(catalog.OUTPUT_JS)})",
+    )
+    parser.add_argument("--packs", nargs="*", default=None, help="pack keys to tune (default: all)")
+    parser.add_argument(
+        "--target",
+        type=parse_target,
+        default=[0.5],
+        help="score each tier's pets should reach at their tier, one value or one per tier (default: 0.5)",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.03, help="accepted |score - target| (default: 0.03)")
+    parser.add_argument("--food-uplift", type=float, default=0.08, help="score gain one food should give a team (default: 0.08)")
+    parser.add_argument("--battles", type=int, default=8000, help="battles per pack, tier and iteration (default: 8000)")
+    parser.add_argument("--iterations", type=int, default=12, help="stat search iterations at most (default: 12)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--no-foods", action="store_true", help="only tune pets")
+    parser.add_argument("--dry-run", action="store_true", help=f"print the result instead of writing {catalog.root_rel(catalog.STAT_OVERRIDES)}")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    payload = battle_sim.load_catalog(args.catalog)
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        tuner = Tuner(payload, args, executor)
+        if not tuner.packs:
+            raise SystemExit(f"No packs match {args.packs}")
+        tuner.tune_pets()
+        food_buffs = {} if args.no_foods else tuner.tune_foods()
+    content = write_overrides(tuner, food_buffs, payload, args)
+    print(
+        f"Tuned {len(tuner.packs)} packs in {time.perf_counter() - started:.1f}s: "
+        f"{len(content['pets'])} pet and {len(content['foods'])} food overrides"
+    )
+    if args.dry_run:
+        print(json.dumps({"pets": content["pets"], "foods": content["foods"]}, ensure_ascii=False, indent=2))
+    else:
+        print(f"Overrides: {catalog.STAT_OVERRIDES} (rebuild the catalog to apply them)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
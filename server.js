@@ -13,20 +13,101 @@ const mime = {
   ".css": "text/css; charset=utf-8",
   ".json": "application/json; charset=utf-8",
   ".png": "image/png",
+  ".webp": "image/webp",
   ".jpg": "image/jpeg",
   ".svg": "image/svg+xml",
 };
 
-function serveFile(res, filePath) {
-  fs.readFile(filePath, (err, data) => {
+// Content-hashed files from `build_game_catalog.py --fingerprint` and `--icon-store`
+// never change in place.
+const immutableDirs = ["fp", "icons_cas"].map((dir) => path.join(__dirname, "assets", dir) + path.sep);
+
+function cacheHeaders(filePath, stats) {
+  if (immutableDirs.some((dir) => filePath.startsWith(dir)) && !filePath.endsWith("manifest.json")) {
+    return { "Cache-Control": "public, max-age=31536000, immutable" };
+  }
+  // Everything else is revalidated; unchanged files answer 304 via the ETag.
+  return { "Cache-Control": "no-cache", ETag: `W/"${stats.size.toString(16)}-${Math.floor(stats.mtimeMs).toString(16)}"` };
+}
+
+// Precompressed siblings from `build_game_catalog.py --compress`, keyed by URL path.
+const encodingsManifest = path.join(__dirname, "assets", "encodings.json");
+const preferredEncodings = ["br", "gzip"];
+let encodings = { mtimeMs: -1, files: {} };
+
+function loadEncodings(callback) {
+  fs.stat(encodingsManifest, (err, stats) => {
     if (err) {
-      res.statusCode = 404;
-      res.end("Not found");
+      encodings = { mtimeMs: -1, files: {} };
+      callback(encodings.files);
+      return;
+    }
+    if (stats.mtimeMs === encodings.mtimeMs) {
+      callback(encodings.files);
       return;
     }
-    const ext = path.extname(filePath).toLowerCase();
-    res.setHeader("Content-Type", mime[ext] || "application/octet-stream");
-    res.end(data);
+    fs.readFile(encodingsManifest, "utf8", (readErr, text) => {
+      let files = {};
+      try {
+        files = readErr ? {} : JSON.parse(text).files || {};
+      } catch {
+        files = {};
+      }
+      encodings = { mtimeMs: stats.mtimeMs, files };
+      callback(files);
+    });
+  });
+}
+
+function acceptedEncodings(header) {
+  const accepted = new Set();
+  for (const part of String(header || "").split(",")) {
+    const [name, ...params] = part.trim().toLowerCase().split(";");
+    const q = params.map((param) => param.trim()).find((param) => param.startsWith("q="));
+    if (name && (!q || Number(q.slice(2)) > 0)) accepted.add(name);
+  }
+  return accepted;
+}
+
+// Picks a precompressed sibling the client accepts, unless the file changed since it was made.
+function negotiateEncoding(req, entry, stats) {
+  if (!entry || entry.size !== stats.size || entry.mtimeMs !== Math.floor(stats.mtimeMs)) return null;
+  const accepted = acceptedEncodings(req.headers["accept-encoding"]);
+  const encoding = preferredEncodings.find((name) => entry.encodings?.[name] && (accepted.has(name) || accepted.has("*")));
+  return encoding ? { name: encoding, filePath: path.join(__dirname, entry.encodings[encoding].src) } : null;
+}
+
+function notFound(res) {
+  res.statusCode = 404;
+  res.end("Not found");
+}
+
+function serveFile(req, res, filePath, stats) {
+  loadEncodings((files) => {
+    const entry = files["/" + path.relative(__dirname, filePath).split(path.sep).join("/")];
+    const encoding = negotiateEncoding(req, entry, stats);
+    const headers = cacheHeaders(filePath, stats);
+    if (entry) headers.Vary = "Accept-Encoding";
+    if (encoding && headers.ETag) headers.ETag = headers.ETag.replace(/"$/, `-${encoding.name}"`);
+    if (headers.ETag && req.headers["if-none-match"] === headers.ETag) {
+      res.writeHead(304, headers);
+      res.end();
+      return;
+    }
+    fs.readFile(encoding ? encoding.filePath : filePath, (err, data) => {
+      if (err) {
+        notFound(res);
+        return;
+      }
+      const ext = path.extname(filePath).toLowerCase();
+      if (encoding) headers["Content-Encoding"] = encoding.name;
+      res.writeHead(200, {
+        ...headers,
+        "Content-Type": mime[ext] || "application/octet-stream",
+        "Content-Length": data.length,
+      });
+      res.end(data);
+    });
   });
 }
 
@@ -42,10 +123,19 @@ const server = http.createServer((req, res) => {
   }
 
   fs.stat(target, (err, stats) => {
-    if (!err && stats.isDirectory()) {
-      target = path.join(target, "index.html");
+    if (err) {
+      notFound(res);
+      return;
+    }
+    if (!stats.isDirectory()) {
+      serveFile(req, res, target, stats);
+      return;
     }
-    serveFile(res, target);
+    target = path.join(target, "index.html");
+    fs.stat(target, (indexErr, indexStats) => {
+      if (indexErr) notFound(res);
+      else serveFile(req, res, target, indexStats);
+    });
   });
 });
 
@@ -448,58 +448,104 @@ const I18N = {
   },
 };
 
+function decodeColumnarTable(table, data) {
+  const rows = Array.from({ length: table?.count ?? 0 }, () => ({}));
+  for (const [field, codec, values] of table?.columns ?? []) {
+    const lookup = codec === "str" ? data.strings : data.enums?.[codec];
+    for (let i = 0; i < rows.length; i += 1) {
+      const raw = values[i];
+      if (raw === null || raw === undefined) continue;
+      if (codec === "int") rows[i][field] = raw;
+      else if (raw === -1) continue;
+      else if (codec === "bool") rows[i][field] = raw === 1;
+      else rows[i][field] = lookup?.[raw];
+    }
+  }
+  return rows;
+}
+
+// Expands the "compact" build output (build_game_catalog.py --format compact) into verbose entries.
+function decodeColumnarGameData(data) {
+  const { format, strings, enums, ...rest } = data;
+  return {
+    ...rest,
+    pets: decodeColumnarTable(data.pets, data),
+    foods: decodeColumnarTable(data.foods, data),
+  };
+}
+
 function getGameData() {
-  const data = window.__GAME_DATA;
+  let data = window.__GAME_DATA;
   if (!data || typeof data !== "object") {
     throw new Error("Missing window.__GAME_DATA. Run build:game-data and load game_data.generated.js before game.js.");
   }
+  if (data.format === "columnar-v1") data = decodeColumnarGameData(data);
   if (!Array.isArray(data.packs) || !Array.isArray(data.pets) || !Array.isArray(data.foods)) {
     throw new Error("Invalid game data shape. Expected packs/pets/foods arrays.");
   }
   return data;
 }
 
-function buildGameIndexes(data) {
-  const packByKey = new Map();
-  const petById = new Map();
-  const foodById = new Map();
-  const petByKind = new Map();
-  const foodByKind = new Map();
-  const petsByPack = {};
-  const foodsByPack = {};
-
-  for (const pack of data.packs) {
-    if (!pack?.key) continue;
-    packByKey.set(pack.key, pack);
-    petsByPack[pack.key] = [];
-    foodsByPack[pack.key] = [];
-  }
-
-  for (const pet of data.pets) {
+function registerCatalogEntries(indexes, pets, foods, pooled) {
+  for (const pet of pets) {
     if (!pet?.id || !pet?.packKey) continue;
-    petById.set(pet.id, pet);
-    if (!petByKind.has(pet.kind)) petByKind.set(pet.kind, pet);
-    if (!petsByPack[pet.packKey]) petsByPack[pet.packKey] = [];
-    petsByPack[pet.packKey].push(pet);
+    indexes.petById.set(pet.id, pet);
+    if (!indexes.petByKind.has(pet.kind)) indexes.petByKind.set(pet.kind, pet);
+    if (!pooled(pet.packKey)) continue;
+    if (!indexes.petsByPack[pet.packKey]) indexes.petsByPack[pet.packKey] = [];
+    indexes.petsByPack[pet.packKey].push(pet);
   }
 
-  for (const food of data.foods) {
+  for (const food of foods) {
     if (!food?.id || !food?.packKey) continue;
-    foodById.set(food.id, food);
-    if (!foodByKind.has(food.kind)) foodByKind.set(food.kind, food);
-    if (!foodsByPack[food.packKey]) foodsByPack[food.packKey] = [];
-    foodsByPack[food.packKey].push(food);
-  }
+    indexes.foodById.set(food.id, food);
+    if (!indexes.foodByKind.has(food.kind)) indexes.foodByKind.set(food.kind, food);
+    if (!pooled(food.packKey)) continue;
+    if (!indexes.foodsByPack[food.packKey]) indexes.foodsByPack[food.packKey] = [];
+    indexes.foodsByPack[food.packKey].push(food);
+  }
+}
+
+// Per-tier cumulative shop pools from build_game_catalog.py are positions into the pack's
+// entry lists; resolving them once per pack makes every reroll a plain array lookup.
+function resolveShopPools(indexes, packKey) {
+  const pools = indexes.packByKey.get(packKey)?.shopPools;
+  const resolve = (entries, tiers) =>
+    Array.isArray(tiers) ? tiers.map((positions) => positions.map((pos) => entries[pos]).filter(Boolean)) : null;
+  indexes.shopPools[packKey] = {
+    pets: resolve(indexes.petsByPack[packKey] || [], pools?.pets),
+    foods: resolve(indexes.foodsByPack[packKey] || [], pools?.foods),
+  };
+}
 
-  return {
-    packByKey,
-    petById,
-    foodById,
-    petByKind,
-    foodByKind,
-    petsByPack,
-    foodsByPack,
+// The generated catalog ships flat packs/pets/foods arrays; every lookup map is built here.
+// Packs with a `shard` entry (build_game_catalog.py --shards) start unloaded: the core only
+// carries their kind templates, and loadPackShard() fills in the pools on demand.
+function buildGameIndexes(data) {
+  const indexes = {
+    packByKey: new Map(),
+    petById: new Map(),
+    foodById: new Map(),
+    petByKind: new Map(),
+    foodByKind: new Map(),
+    petsByPack: {},
+    foodsByPack: {},
+    shopPools: {},
+    loadedPacks: new Set(),
   };
+
+  for (const pack of data.packs) {
+    if (!pack?.key) continue;
+    indexes.packByKey.set(pack.key, pack);
+    indexes.petsByPack[pack.key] = [];
+    indexes.foodsByPack[pack.key] = [];
+    if (!pack.shard) indexes.loadedPacks.add(pack.key);
+  }
+
+  const pooled = (packKey) => !indexes.packByKey.get(packKey)?.shard;
+  registerCatalogEntries(indexes, data.pets, data.foods, pooled);
+  for (const packKey of indexes.loadedPacks) resolveShopPools(indexes, packKey);
+  return indexes;
 }
 
 const GAME_DATA = getGameData();
@@ -507,6 +553,82 @@ const GAME_INDEXES = buildGameIndexes(GAME_DATA);
 const PACK_KEYS = GAME_DATA.packs.map((pack) => pack.key);
 const DEFAULT_PACK_KEY = PACK_KEYS.includes("pack1") ? "pack1" : PACK_KEYS[0] ?? "pack1";
 const assetImageCache = new Map();
+const iconSpriteCache = new Map();
+const packShardLoads = new Map();
+
+function isPackLoaded(packKey) {
+  return GAME_INDEXES.loadedPacks.has(packKey);
+}
+
+function registerPackShard(packKey, shard) {
+  if (!shard || typeof shard !== "object") return false;
+  const data = shard.format === "columnar-v1" ? decodeColumnarGameData(shard) : shard;
+  const pets = Array.isArray(data.pets) ? data.pets : [];
+  const foods = Array.isArray(data.foods) ? data.foods : [];
+  for (const pet of pets) if (!GAME_INDEXES.petById.has(pet.id)) GAME_DATA.pets.push(pet);
+  for (const food of foods) if (!GAME_INDEXES.foodById.has(food.id)) GAME_DATA.foods.push(food);
+  GAME_INDEXES.petsByPack[packKey] = [];
+  GAME_INDEXES.foodsByPack[packKey] = [];
+  registerCatalogEntries(GAME_INDEXES, pets, foods, (key) => key === packKey);
+  resolveShopPools(GAME_INDEXES, packKey);
+  GAME_INDEXES.loadedPacks.add(packKey);
+  return true;
+}
+
+function loadPackShard(packKey) {
+  if (isPackLoaded(packKey)) return Promise.resolve(true);
+  const shard = GAME_INDEXES.packByKey.get(packKey)?.shard;
+  if (!shard?.src) return Promise.resolve(false);
+  if (packShardLoads.has(packKey)) return packShardLoads.get(packKey);
+
+  const pending = new Promise((resolve) => {
+    const script = document.createElement("script");
+    script.src = shard.version ? `${shard.src}?v=${shard.version}` : shard.src;
+    script.onload = () => resolve(registerPackShard(packKey, window.__GAME_DATA_SHARDS?.[packKey]));
+    script.onerror = () => {
+      packShardLoads.delete(packKey);
+      resolve(false);
+    };
+    document.head.appendChild(script);
+  });
+  packShardLoads.set(packKey, pending);
+  return pending;
+}
+
+// Names/hints split out by build_game_catalog.py --text-bundles, merged per item id.
+const catalogTextById = new Map();
+const textBundleLoads = new Map();
+
+function registerTextBundle(bundle) {
+  if (!bundle?.entries || typeof bundle.entries !== "object") return false;
+  for (const [id, text] of Object.entries(bundle.entries)) {
+    catalogTextById.set(id, { ...catalogTextById.get(id), ...text });
+  }
+  return true;
+}
+
+function loadTextBundle(language) {
+  const bundle = GAME_DATA.text?.[language];
+  if (!bundle?.src) return Promise.resolve(false);
+  if (textBundleLoads.has(language)) return textBundleLoads.get(language);
+
+  const pending = new Promise((resolve) => {
+    const script = document.createElement("script");
+    script.src = bundle.version ? `${bundle.src}?v=${bundle.version}` : bundle.src;
+    script.onload = () => resolve(registerTextBundle(window.__GAME_TEXT?.[language]));
+    script.onerror = () => {
+      textBundleLoads.delete(language);
+      resolve(false);
+    };
+    document.head.appendChild(script);
+  });
+  textBundleLoads.set(language, pending);
+  return pending;
+}
+
+function catalogText(entry) {
+  return catalogTextById.get(String(entry.sourceId || entry.id)) || {};
+}
 
 function t(key, params = {}) {
   const current = I18N[state.language] || I18N.en;
@@ -522,8 +644,9 @@ function hasI18nKey(key) {
 
 function localizedEntryName(entry) {
   if (!entry) return "";
-  const zh = String(entry.nameZh || "").trim();
-  const en = String(entry.nameEn || "").trim();
+  const text = catalogText(entry);
+  const zh = String(text.nameZh || entry.nameZh || "").trim();
+  const en = String(text.nameEn || entry.nameEn || "").trim();
   const fallback = String(entry.name || entry.kind || "").trim();
   if (state.language === "zh") return zh || en || fallback;
   const enFallback = englishMissingNameFallback(entry, zh);
@@ -547,8 +670,9 @@ function englishMissingNameFallback(entry, zhName = "") {
 
 function localizedEntryHint(entry) {
   if (!entry) return "";
-  const zh = String(entry.hintZhClean || entry.hintZhRaw || "").trim();
-  const en = String(entry.hintEn || "").trim();
+  const text = catalogText(entry);
+  const zh = String(text.hintZhClean || text.hintZhRaw || entry.hintZhClean || entry.hintZhRaw || "").trim();
+  const en = String(text.hintEn || entry.hintEn || "").trim();
   if (state.language === "zh") return zh || en;
   return en || zh;
 }
@@ -713,6 +837,7 @@ function restoreLanguagePreference() {
 function toggleLanguage() {
   state.language = state.language === "en" ? "zh" : "en";
   persistLanguagePreference();
+  loadTextBundle(state.language);
   pushToast(t("toast_language_switched", { language: t("language_name") }));
 }
 
@@ -741,6 +866,7 @@ function setActivePack(packKey, options = {}) {
   const changed = state.activePackKey !== packKey;
   state.activePackKey = packKey;
   persistPackPreference();
+  loadPackShard(packKey);
   if (!changed) return true;
   if (!silent) pushToast(t("toast_pack_switched", { pack: activePackDisplayName() }));
   if (state.mode === "shop" && reroll) {
@@ -982,6 +1108,41 @@ function petDef(kindOrId) {
   return resolvePetDef(kindOrId);
 }
 
+// Resized icons from build_game_catalog.py --icon-variants come at the widest icon slot
+// times each pixel density: take the smallest one that still covers the slot on this
+// screen. Low-memory devices fall back to 1x rather than to a width below the slot.
+function iconVariantDir() {
+  const variants = GAME_DATA.iconVariants;
+  const widths = Object.keys(variants?.widths || {}).map(Number).sort((a, b) => a - b);
+  if (!widths.length) return null;
+  const lowMemory = (globalThis.navigator?.deviceMemory ?? Infinity) <= 2;
+  const density = lowMemory ? 1 : Math.max(1, Math.ceil(globalThis.devicePixelRatio || 1));
+  const wanted = (variants.slotWidth || widths[0]) * density;
+  return variants.widths[widths.find((width) => width >= wanted) ?? widths[widths.length - 1]];
+}
+
+// build_game_catalog.py --icon-store names each distinct image by content hash, so every
+// entry sharing an image shares one URL and one assetImageCache record.
+function entryIconPath(def) {
+  if (def.iconHash && GAME_DATA.iconStore) return `${GAME_DATA.iconStore}/${def.iconHash}.png`;
+  return def.iconAliasRel || null;
+}
+
+// Atlas sprites (build_game_catalog.py --atlas) are "<atlas url>#x,y,w,h"; see iconSprite().
+function entryIconRef(def) {
+  if (def.iconMissing) return null;
+  const atlas = def.iconAtlas == null ? null : GAME_DATA.atlases?.[def.iconAtlas];
+  if (atlas) {
+    const src = atlas.version ? `${atlas.src}?v=${atlas.version}` : atlas.src;
+    return `${src}#${def.iconX},${def.iconY},${def.iconW},${def.iconH}`;
+  }
+  const iconPath = entryIconPath(def);
+  const variantDir = iconPath ? iconVariantDir() : null;
+  if (!variantDir) return iconPath;
+  const { from, format } = GAME_DATA.iconVariants;
+  return iconPath.replace(from, variantDir).replace(/\.png$/i, `.${format}`);
+}
+
 function createPet(kindOrId, attackOverride, healthOverride) {
   const def = resolvePetDef(kindOrId);
   if (!def) throw new Error(`Unknown pet ref: ${kindOrId}`);
@@ -994,7 +1155,7 @@ function createPet(kindOrId, attackOverride, healthOverride) {
     nameZh: def.nameZh || fallbackName,
     nameEn: def.nameEn || "",
     color: def.color,
-    icon: def.iconMissing ? null : def.iconAliasRel,
+    icon: entryIconRef(def),
     attack: attackOverride ?? def.attack,
     health: healthOverride ?? def.health,
     level: 1,
@@ -1026,7 +1187,7 @@ function createFood(kindOrId) {
     tier: def.tier ?? 1,
     packKey: def.packKey,
     color: def.color,
-    icon: def.iconMissing ? null : def.iconAliasRel,
+    icon: entryIconRef(def),
     effect: def.effectKey || "placeholder_stat_buff",
     implStatus: def.implStatus || "placeholder",
     hintZhRaw: def.hintZhRaw || "",
@@ -1036,16 +1197,21 @@ function createFood(kindOrId) {
   };
 }
 
-function shopPoolPets() {
+function tierPool(entries, tiers) {
   const tier = maxUnlockedTier();
-  const pool = GAME_INDEXES.petsByPack[state.activePackKey] || [];
-  return pool.filter((pet) => (pet.tier ?? 1) <= tier);
+  if (tiers?.length) return tiers[Math.min(tier, tiers.length) - 1] || [];
+  // Catalogs built before shop pools were precomputed.
+  return entries.filter((entry) => (entry.tier ?? 1) <= tier);
+}
+
+function shopPoolPets() {
+  const packKey = state.activePackKey;
+  return tierPool(GAME_INDEXES.petsByPack[packKey] || [], GAME_INDEXES.shopPools[packKey]?.pets);
 }
 
 function shopPoolFood() {
-  const tier = maxUnlockedTier();
-  const pool = GAME_INDEXES.foodsByPack[state.activePackKey] || [];
-  return pool.filter((food) => (food.tier ?? 1) <= tier);
+  const packKey = state.activePackKey;
+  return tierPool(GAME_INDEXES.foodsByPack[packKey] || [], GAME_INDEXES.shopPools[packKey]?.foods);
 }
 
 function petTier(pet) {
@@ -1123,6 +1289,14 @@ function pushToast(message) {
 
 function rerollShop(free = false) {
   clearEndTurnConfirm();
+  if (!isPackLoaded(state.activePackKey)) {
+    // Sharded catalog: fill the shop for free once the active pack's data arrives.
+    const packKey = state.activePackKey;
+    loadPackShard(packKey).then((loaded) => {
+      if (loaded && state.mode === "shop" && state.activePackKey === packKey) rerollShop(true);
+    });
+    return false;
+  }
   if (!free) {
     if (state.gold < REROLL_COST) {
       pushToast(t("toast_not_enough_gold_reroll"));
@@ -1515,6 +1689,7 @@ function loadDebugScenario(name) {
 }
 
 window.__debugLoadScenario = (name) => loadDebugScenario(String(name || "").toLowerCase());
+window.__debugSimulateBattle = (friendly, enemy, seed = 1) => simulateBattle(friendly, enemy, seed);
 
 function buyPet(shopIndex, teamIndex) {
   const pet = state.shopPets[shopIndex];
@@ -2418,9 +2593,20 @@ function startBattle() {
   state.enemyPreview = enemyTemplate;
   const enemyLine = activeBattleLine(enemyTemplate);
 
-  state.battle = {
-    friendly: friendlyLine,
-    enemy: enemyLine,
+  state.battle = createBattleState(friendlyLine, enemyLine);
+  state.selected = null;
+  clearInspectCard();
+  state.toast = "";
+  state.toastTime = 0;
+  state.mode = "battle";
+  openBattle(state.battle);
+  if (state.battle.result) setBattleAwaitingResultConfirm(state.battle);
+}
+
+function createBattleState(friendly, enemy) {
+  return {
+    friendly,
+    enemy,
     log: [],
     timer: 0,
     result: null,
@@ -2433,18 +2619,52 @@ function startBattle() {
     triggerResolved: [],
     anim: createBattleAnimState(),
   };
-  state.selected = null;
-  clearInspectCard();
-  state.toast = "";
-  state.toastTime = 0;
-  state.mode = "battle";
+}
+
+// Expects state.battle === battle: triggers log through appendBattleLog().
+function openBattle(battle) {
   appendBattleLog(t("log_battle_started"));
-  queueStartBattleTriggers(state.battle.friendly, state.battle.enemy, t("side_friendly"), state.battle);
-  queueStartBattleTriggers(state.battle.enemy, state.battle.friendly, t("side_enemy"), state.battle);
-  queueCleanupForBothSides(state.battle);
-  flushBattleTriggerQueue(state.battle);
-  refreshBattleOutcome(state.battle);
-  if (state.battle.result) setBattleAwaitingResultConfirm(state.battle);
+  queueStartBattleTriggers(battle.friendly, battle.enemy, t("side_friendly"), battle);
+  queueStartBattleTriggers(battle.enemy, battle.friendly, t("side_enemy"), battle);
+  queueCleanupForBothSides(battle);
+  flushBattleTriggerQueue(battle);
+  refreshBattleOutcome(battle);
+}
+
+// Battles that never resolve (e.g. two 0-attack fronts) end as a draw after this many steps.
+const SIMULATED_BATTLE_MAX_STEPS = 200;
+
+// Runs one battle to completion without animation or touching the game in progress.
+// Teams use the debug preset shape ({ kind, attack, health, level, perk, summonOnFaint });
+// scripts/export_battle_fixtures.mjs records the results that scripts/battle_sim.py must match.
+function simulateBattle(friendlyPreset, enemyPreset, seed) {
+  const saved = { battle: state.battle, rngSeed: state.rngSeed, nextId: state.nextId };
+  try {
+    state.nextId = 1;
+    const friendly = activeBattleLine(instantiatePresetTeam(friendlyPreset));
+    const enemy = activeBattleLine(instantiatePresetTeam(enemyPreset));
+    state.rngSeed = seed >>> 0;
+    const battle = createBattleState(friendly, enemy);
+    state.battle = battle;
+    openBattle(battle);
+    let steps = 0;
+    while (!battle.result && steps < SIMULATED_BATTLE_MAX_STEPS) {
+      resolveBattleStep();
+      steps += 1;
+    }
+    const line = (team) => team.map((pet) => [pet.kind, pet.attack, pet.health, pet.perk ?? null]);
+    return {
+      result: battle.result ?? "draw",
+      steps,
+      friendly: line(battle.friendly),
+      enemy: line(battle.enemy),
+      rngSeed: state.rngSeed,
+    };
+  } finally {
+    state.battle = saved.battle;
+    state.rngSeed = saved.rngSeed;
+    state.nextId = saved.nextId;
+  }
 }
 
 function update(dt) {
@@ -2473,6 +2693,11 @@ function roundRect(target, x, y, w, h, r, fillStyle) {
   target.fill();
 }
 
+// build_game_catalog.py --fingerprint maps icon paths to content-hashed copies.
+function resolveAssetUrl(src) {
+  return GAME_DATA.assets?.[src] ?? src;
+}
+
 function getImageRecord(src) {
   if (!src) return null;
   let record = assetImageCache.get(src);
@@ -2486,17 +2711,32 @@ function getImageRecord(src) {
   img.onerror = () => {
     record.state = "error";
   };
-  img.src = encodeURI(src);
+  img.src = encodeURI(resolveAssetUrl(src));
   return record;
 }
 
+function iconSprite(iconSrc) {
+  if (!iconSrc) return null;
+  let sprite = iconSpriteCache.get(iconSrc);
+  if (sprite) return sprite;
+  const hashAt = iconSrc.indexOf("#");
+  sprite =
+    hashAt < 0
+      ? { src: iconSrc, rect: null }
+      : { src: iconSrc.slice(0, hashAt), rect: iconSrc.slice(hashAt + 1).split(",").map(Number) };
+  iconSpriteCache.set(iconSrc, sprite);
+  return sprite;
+}
+
 function drawIconOrFallback(iconSrc, x, y, w, h, fallbackDraw, corner = 12) {
-  const record = getImageRecord(iconSrc);
+  const sprite = iconSprite(iconSrc);
+  const record = getImageRecord(sprite?.src);
   if (record?.state === "ready" && record.img?.naturalWidth > 0 && record.img?.naturalHeight > 0) {
     ctx.save();
     roundRectPath(ctx, x, y, w, h, corner);
     ctx.clip();
-    ctx.drawImage(record.img, x, y, w, h);
+    if (sprite.rect) ctx.drawImage(record.img, ...sprite.rect, x, y, w, h);
+    else ctx.drawImage(record.img, x, y, w, h);
     ctx.restore();
     return true;
   }
@@ -3577,6 +3817,8 @@ document.addEventListener("fullscreenchange", resizeCanvasDisplay);
 
 restoreLanguagePreference();
 restorePackPreference();
+loadTextBundle(state.language);
+loadPackShard(state.activePackKey);
 resizeCanvasDisplay();
 render();
 requestAnimationFrame(loop);
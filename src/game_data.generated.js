@@ -1,2 +1,3 @@
 // Auto-generated by scripts/build_game_catalog.py
-window.__GAME_DATA = {"version":"2026-02-13T09:58:24.384196+00:00","packs":[{"key":"pack1","nameZh":"1乌龟兽群","nameEn":"Pack 1"},{"key":"pack2","nameZh":"2濒危兽群","nameEn":"Pack 2"},{"key":"pack3","nameZh":"3独角兽兽群","nameEn":"Pack 3"},{"key":"pack4","nameZh":"4金毛兽群","nameEn":"Pack 4"},{"key":"pack5","nameZh":"5海星兽群","nameEn":"Pack 5"},{"key":"pack6","nameZh":"6幼犬兽群","nameEn":"Pack 6"}],"pets":[{"id":"pack1_pet_0001","kind":"otter","packKey":"pack1","nameZh":"水獭","nameEn":"Otter","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/水獭.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0001.png","iconMissing":false,"hintZhRaw":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 @ 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命\nNM) sos ab HO Amen oe ee.) @ +a","hintZhClean":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命","hintEn":"","attack":1,"health":2,"abilityKey":"buy_buff_random_shop_pet","implStatus":"implemented","color":"#8f9fc2","sourceSheet":"1乌龟兽群","sourceRow":2},{"id":"pack1_pet_0002","kind":"beaver","packKey":"pack1","nameZh":"河狸","nameEn":"Beaver","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/河狸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0002.png","iconMissing":false,"hintZhRaw":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ wah.\nE> us oe et em CHAE A HEN OL Ok ee. > Hawt","hintZhClean":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 wah.","hintEn":"","attack":2,"health":2,"abilityKey":"sell_buff_attack","implStatus":"implemented","color":"#ab7d61","sourceSheet":"1乌龟兽群","sourceRow":3},{"id":"pack1_pet_0003","kind":"pack1_pet_0003","packKey":"pack1","nameZh":"猪","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0003.png","iconMissing":false,"hintZhRaw":"猪\nCO) unmet =» 获得 +1 O 金币 。\n) 2 出 售 时 => 获得 +*2 〇 £m.\n1S wees wa IB.) os","hintZhClean":"CO) unmet 获得 +1 O 金币 。\n) 2 出 售 时 > 获得 +*2 m.\n1S wees wa IB.) os","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"1乌龟兽群","sourceRow":4},{"id":"pack1_pet_0004","kind":"ant","packKey":"pack1","nameZh":"蚂蚁","nameEn":"Ant","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚂蚁.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0004.png","iconMissing":false,"hintZhRaw":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB wet => 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB wet > 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":2,"health":1,"abilityKey":"faint_buff_random_ally","implStatus":"implemented","color":"#d98f4e","sourceSheet":"1乌龟兽群","sourceRow":5},{"id":"pack1_pet_0005","kind":"mosquito","packKey":"pack1","nameZh":"蚊子","nameEn":"Mosquito","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚊子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0005.png","iconMissing":false,"hintZhRaw":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.\nNM) pes) mae ea HO Aminss Loe SEED","hintZhClean":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.","hintEn":"","attack":2,"health":2,"abilityKey":"start_ping_enemy","implStatus":"implemented","color":"#8a7ef2","sourceSheet":"1乌龟兽群","sourceRow":6},{"id":"pack1_pet_0006","kind":"cricket","packKey":"pack1","nameZh":"蛐蛐","nameEn":"Cricket","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蛐蛐.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0006.png","iconMissing":false,"hintZhRaw":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。\nL3 晕厥时 -> 召唤一个3/3的蟋蟀。","hintZhClean":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_summon_zombie","implStatus":"implemented","color":"#8ac95f","sourceSheet":"1乌龟兽群","sourceRow":7},{"id":"pack1_pet_0007","kind":"horse","packKey":"pack1","nameZh":"马","nameEn":"Horse","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0007.png","iconMissing":false,"hintZhRaw":"oO\nOD 伙伴 被 召唤 时 =» 使 其 获得 +1 @ 攻击 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 @ 攻击， 持续 一 回合 。\nNY a oe ah Tom et ea CHEE. Awe tte 站 人","hintZhClean":"oO\nOD 伙伴 被 召唤 时 使 其 获得 +1 攻击 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":1,"abilityKey":"friend_summoned_attack","implStatus":"implemented","color":"#af8868","sourceSheet":"1乌龟兽群","sourceRow":8},{"id":"pack1_pet_0008","kind":"fish","packKey":"pack1","nameZh":"鱼","nameEn":"Fish","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0008.png","iconMissing":false,"hintZhRaw":"鱼\nCD 升级 时 => 使 两 个 伙伴 获得 +1 @ 攻击 和 +1 Otte.\n) 鸣 升级 时 => 使 两 个 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNY zor,","hintZhClean":"CD 升级 时 > 使 两 个 伙伴 获得 +1 攻击 和 +1 Otte.\n) 鸣 升级 时 > 使 两 个 伙伴 获得 +2 攻击 和 +2 Ota.\nNY zor,","hintEn":"","attack":2,"health":3,"abilityKey":"level_buff_team","implStatus":"implemented","color":"#72b8ea","sourceSheet":"1乌龟兽群","sourceRow":9},{"id":"pack1_pet_0009","kind":"pack1_pet_0009","packKey":"pack1","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"1乌龟兽群","sourceRow":10},{"id":"pack1_pet_0010","kind":"pack1_pet_0010","packKey":"pack1","nameZh":"鸽子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸽子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0010.png","iconMissing":false,"hintZhRaw":"面包 局\n使 一 个 宠物 获得 +1 @ KH.","hintZhClean":"面包 局\n使 一 个 宠物 获得 +1 KH.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"1乌龟兽群","sourceRow":12},{"id":"pack1_pet_0011","kind":"pack1_pet_0011","packKey":"pack1","nameZh":"刺猬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/刺猬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0011.png","iconMissing":false,"hintZhRaw":"RI) 48\nOD sry =o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary => 对 所 有 宠物 造成 4 点 伤害 O.\n1) exci ob HEL See ce Hea","hintZhClean":"RI) 48\nOD sry o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary > 对 所 有 宠物 造成 4 点 伤害 O.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"1乌龟兽群","sourceRow":15},{"id":"pack1_pet_0012","kind":"swan","packKey":"pack1","nameZh":"天鹅","nameEn":"Swan","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/天鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0012.png","iconMissing":false,"hintZhRaw":"F FS\nOQ 回合 开始 时 =» 获得 +1 〇 人 金币 。\n) OH 回合 开始 时 > 获得 +2 〇 mh.\n1","hintZhClean":"F FS\nOQ 回合 开始 时 获得 +1 人 金币 。\n) OH 回合 开始 时 > 获得 +2 mh.","hintEn":"","attack":1,"health":3,"abilityKey":"start_turn_gain_gold","implStatus":"implemented","color":"#e3f3ff","sourceSheet":"1乌龟兽群","sourceRow":16},{"id":"pack1_pet_0013","kind":"peacock","packKey":"pack1","nameZh":"孔雀","nameEn":"Peacock","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/孔雀.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0013.png","iconMissing":false,"hintZhRaw":"4L€\nDO 受伤 时 = 获得 +3 @ 攻击 。\n» 3 受伤 时 => 获得 +6 @ wis.\nNM) =u et ob 证 有 QT 二","hintZhClean":"4L\nDO 受伤 时 获得 +3 攻击 。\n3 受伤 时 > 获得 +6 wis.","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_gain_attack","implStatus":"implemented","color":"#76b7c2","sourceSheet":"1乌龟兽群","sourceRow":17},{"id":"pack1_pet_0014","kind":"flamingo","packKey":"pack1","nameZh":"火烈鸟","nameEn":"Flamingo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/火烈鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0014.png","iconMissing":false,"hintZhRaw":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 @ 攻击 和 +2 O 生命\n1) eer ob CHB A LC Hoe ee. ? A wtin.? @ +s","hintZhClean":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 攻击 和 +2 O 生命","hintEn":"","attack":3,"health":2,"abilityKey":"faint_buff_rear","implStatus":"implemented","color":"#f08da8","sourceSheet":"1乌龟兽群","sourceRow":18},{"id":"pack1_pet_0015","kind":"pack1_pet_0015","packKey":"pack1","nameZh":"蜗牛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜗牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0015.png","iconMissing":false,"hintZhRaw":"Om\nDOSER > 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +2 @ 攻击 。\nNf Fl > +t BR ab ON aw Fete cl tee BR LAS ee ow ee. Aa ws","hintZhClean":"Om\nDOSER > 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +2 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f8fd1","sourceSheet":"1乌龟兽群","sourceRow":19},{"id":"pack1_pet_0016","kind":"pack1_pet_0016","packKey":"pack1","nameZh":"蜘蛛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜘蛛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0016.png","iconMissing":false,"hintZhRaw":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme => 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\n)\nNE oe ret ea 724 _ AC ICA ERIM Soe","hintZhClean":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme > 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\nNE oe ret ea 724 AC ICA ERIM Soe","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ce8f","sourceSheet":"1乌龟兽群","sourceRow":20},{"id":"pack1_pet_0017","kind":"pack1_pet_0017","packKey":"pack1","nameZh":"螃蟹","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/螃蟹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0017.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo @ ts","hintZhClean":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo ts","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f91d1","sourceSheet":"1乌龟兽群","sourceRow":21},{"id":"pack1_pet_0018","kind":"pack1_pet_0018","packKey":"pack1","nameZh":"蠕虫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蠕虫2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0018.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"1乌龟兽群","sourceRow":23},{"id":"pack1_pet_0019","kind":"kangaroo","packKey":"pack1","nameZh":"袋鼠","nameEn":"Kangaroo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/袋鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0019.png","iconMissing":false,"hintZhRaw":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n» 3 前 方 伙 伴 攻击 时 > RG2O@ 攻击 和 +2 Ota.\n1) ase aot te ab 2078.2 Mw tin. @ +s","hintZhClean":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n3 前 方 伙 伴 攻击 时 > RG2O 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"behind_attack_gain","implStatus":"implemented","color":"#c58c42","sourceSheet":"1乌龟兽群","sourceRow":24},{"id":"pack1_pet_0020","kind":"pack1_pet_0020","packKey":"pack1","nameZh":"鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0020.png","iconMissing":false,"hintZhRaw":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY => 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintZhClean":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY > 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#938fd1","sourceSheet":"1乌龟兽群","sourceRow":25},{"id":"pack1_pet_0021","kind":"pack1_pet_0021","packKey":"pack1","nameZh":"公牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/公牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0021.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ced18f","sourceSheet":"1乌龟兽群","sourceRow":30},{"id":"pack1_pet_0022","kind":"rabbit","packKey":"pack1","nameZh":"家兔","nameEn":"Rabbit","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/家兔.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0022.png","iconMissing":false,"hintZhRaw":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。\nMY + ene te ae ee ea 8.2 国生 全 mM SH Bb","hintZhClean":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"friend_eat_bonus_health","implStatus":"implemented","color":"#f5f0f7","sourceSheet":"1乌龟兽群","sourceRow":31},{"id":"pack1_pet_0023","kind":"pack1_pet_0023","packKey":"pack1","nameZh":"海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/海豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0023.png","iconMissing":false,"hintZhRaw":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。\nNM) pe cl mae ea HS BIS LEA EERO th HOI","hintZhClean":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d0d18f","sourceSheet":"1乌龟兽群","sourceRow":32},{"id":"pack1_pet_0024","kind":"dodo","packKey":"pack1","nameZh":"渡渡鸟","nameEn":"Dodo","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/渡渡鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0024.png","iconMissing":false,"hintZhRaw":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 @ 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 @ wai.\nMEY pes) rae ea CRBS OSE 6) Oe TEI ee eno 如 十","hintZhClean":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 wai.","hintEn":"","attack":2,"health":3,"abilityKey":"start_battle_buff_friend_ahead_attack","implStatus":"implemented","color":"#d7ad7b","sourceSheet":"1乌龟兽群","sourceRow":33},{"id":"pack1_pet_0025","kind":"pack1_pet_0025","packKey":"pack1","nameZh":"狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/狗.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0025.png","iconMissing":false,"hintZhRaw":"虽 伙伴 被 召唤 时 =» 获得 +2 全 攻击 和 +1 @@ 生命 ， 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 @ 攻击 和 +2 二 生命 ， 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2? @ te 二 ms","hintZhClean":"虽 伙伴 被 召唤 时 获得 +2 全 攻击 和 +1 生命 , 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 攻击 和 +2 二 生命 , 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2 te 二 ms","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb8","sourceSheet":"1乌龟兽群","sourceRow":34},{"id":"pack1_pet_0026","kind":"pack1_pet_0026","packKey":"pack1","nameZh":"獾","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0026.png","iconMissing":false,"hintZhRaw":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintZhClean":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a7","sourceSheet":"1乌龟兽群","sourceRow":35},{"id":"pack1_pet_0027","kind":"pack1_pet_0027","packKey":"pack1","nameZh":"绵羊","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/绵羊.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0027.png","iconMissing":false,"hintZhRaw":"£8\nCO sey = 召唤 两 只 2/2 的 公 羊 。\n) CB amy => 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintZhClean":"CO sey 召唤 两 只 2/2 的 公 羊 。\n) CB amy > 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ccd18f","sourceSheet":"1乌龟兽群","sourceRow":36},{"id":"pack1_pet_0028","kind":"pack1_pet_0028","packKey":"pack1","nameZh":"象","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/象.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0028.png","iconMissing":false,"hintZhRaw":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintZhClean":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ae","sourceSheet":"1乌龟兽群","sourceRow":37},{"id":"pack1_pet_0029","kind":"giraffe","packKey":"pack1","nameZh":"长颈鹿","nameEn":"Giraffe","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/长颈鹿.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0029.png","iconMissing":false,"hintZhRaw":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 @ tH.\nMW aaron ob BMH AS Howe.) A wstm.) @t+s","hintZhClean":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 攻击 和 +1 tH.","hintEn":"","attack":2,"health":4,"abilityKey":"end_turn_buff_friend_ahead","implStatus":"implemented","color":"#e8b85e","sourceSheet":"1乌龟兽群","sourceRow":38},{"id":"pack1_pet_0030","kind":"camel","packKey":"pack1","nameZh":"骆驼","nameEn":"Camel","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/骆驼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0030.png","iconMissing":false,"hintZhRaw":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 @ 攻击 和 +2 O tm.\n) 0B 受伤 时 => 使 最 近 的 后 方 伙伴 获得 +*2 @ 攻击 和 +4 Ota.\n1) =u et ea CRBS Ks oe ee. ? A wtiw.c @ts","hintZhClean":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 攻击 和 +2 O tm.\n) 0B 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +*2 攻击 和 +4 Ota.\n1) u et ea CRBS Ks oe ee. A wtiw.c ts","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_buff_rear","implStatus":"implemented","color":"#d1ba75","sourceSheet":"1乌龟兽群","sourceRow":39},{"id":"pack1_pet_0031","kind":"turtle","packKey":"pack1","nameZh":"乌龟","nameEn":"Turtle","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/乌龟2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0031.png","iconMissing":false,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_give_melon_friend_behind","implStatus":"implemented","color":"#6aaa77","sourceSheet":"1乌龟兽群","sourceRow":44},{"id":"pack1_pet_0032","kind":"penguin","packKey":"pack1","nameZh":"企鹅","nameEn":"Penguin","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/企鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0032.png","iconMissing":false,"hintZhRaw":"TE #S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNM) 中 全 本 wp abd CHAR bebe oe 8.2? A wtin.2 @*=s+","hintZhClean":"TE S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":2,"abilityKey":"end_turn_buff_level2_friends","implStatus":"implemented","color":"#5d7d9f","sourceSheet":"1乌龟兽群","sourceRow":45},{"id":"pack1_pet_0033","kind":"pack1_pet_0033","packKey":"pack1","nameZh":"松鼠","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/松鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0033.png","iconMissing":false,"hintZhRaw":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 =» 使 商店 所 有 食物 价格 减 2 O 金币 。\nfy fal =» Tbh ee CS FEE GE Te er ee ere fr Ooms","hintZhClean":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 使 商店 所 有 食物 价格 减 2 O 金币 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"1乌龟兽群","sourceRow":46},{"id":"pack1_pet_0034","kind":"pack1_pet_0034","packKey":"pack1","nameZh":"河豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0034.png","iconMissing":false,"hintZhRaw":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 => 对 一 个 随机 敌人 造成 6 点 伤害 O.\nNM) =u et ea 个 tin Loe PORE ae","hintZhClean":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 > 对 一 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"1乌龟兽群","sourceRow":47},{"id":"pack1_pet_0035","kind":"pack1_pet_0035","packKey":"pack1","nameZh":"河马","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0035.png","iconMissing":false,"hintZhRaw":"7a] LS\nCD 击 个 时 > 获得 +3 @ 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey => 获得 +6 @ 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。\nE> et em 7EIB 6 A he tn OD mS el HAH II","hintZhClean":"7a] LS\nCD 击 个 时 > 获得 +3 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey > 获得 +6 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"1乌龟兽群","sourceRow":48},{"id":"pack1_pet_0036","kind":"pack1_pet_0036","packKey":"pack1","nameZh":"臭鼬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/臭鼬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0036.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% @ 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. @t+=-","hintZhClean":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. t+ -","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"1乌龟兽群","sourceRow":49},{"id":"pack1_pet_0037","kind":"pack1_pet_0037","packKey":"pack1","nameZh":"野牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/野牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0037.png","iconMissing":false,"hintZhRaw":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +2 全 攻击 和 +4 Ota.\nNY = om ot Ot oe IN Pee ee Re oe. Hwtin.c @ ts","hintZhClean":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +2 全 攻击 和 +4 Ota.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"1乌龟兽群","sourceRow":50},{"id":"pack1_pet_0038","kind":"pack1_pet_0038","packKey":"pack1","nameZh":"鲸","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鲸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0038.png","iconMissing":false,"hintZhRaw":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 ， 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 ， 并 在 量 磋 后 将 其 作为 2 级 吐出 ，\nNM? pec race ab SBMS hi oR YL Se HrURM WD","hintZhClean":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 , 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 , 并 在 量 磋 后 将 其 作为 2 级 吐出 ,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f92","sourceSheet":"1乌龟兽群","sourceRow":51},{"id":"pack1_pet_0039","kind":"pack1_pet_0039","packKey":"pack1","nameZh":"鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹦鹉.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0039.png","iconMissing":false,"hintZhRaw":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 ， 持 续 一 回合 。\nNY = om ot ot ea WE BSR ME HURRAH Ot ERS","hintZhClean":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cf","sourceSheet":"1乌龟兽群","sourceRow":52},{"id":"pack1_pet_0040","kind":"pack1_pet_0040","packKey":"pack1","nameZh":"鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹿1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0040.png","iconMissing":false,"hintZhRaw":"鹿\n页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。\nL3 晕厥时 -> 召唤一辆15/9且具有辣椒的公交车。","hintZhClean":"页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":53},{"id":"pack1_pet_0041","kind":"pack1_pet_0041","packKey":"pack1","nameZh":"公鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/公鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0041.png","iconMissing":false,"hintZhRaw":"公鸡\nOO sk © 召唤 一 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n1) eee ob 门 人 一 口 目 在 | 国生 和 Iankro 人 人 二 naeop","hintZhClean":"公鸡\nOO sk 召唤 一 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":57},{"id":"pack1_pet_0042","kind":"pack1_pet_0042","packKey":"pack1","nameZh":"奶牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/奶牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0042.png","iconMissing":false,"hintZhRaw":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintZhClean":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"1乌龟兽群","sourceRow":59},{"id":"pack1_pet_0043","kind":"pack1_pet_0043","packKey":"pack1","nameZh":"海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/海豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0043.png","iconMissing":false,"hintZhRaw":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 @ xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 @ 攻击 。\nEY nc ae ae et ea CR — A Hn oo) oe a8? A ws","hintZhClean":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 攻击 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"1乌龟兽群","sourceRow":60},{"id":"pack1_pet_0044","kind":"pack1_pet_0044","packKey":"pack1","nameZh":"火鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/火鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0044.png","iconMissing":false,"hintZhRaw":"火 鸡\nDO 伙伴 被 召唤 时 => 使 其 获得 +3 @ 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 => 使 其 获得 +6 @@ 攻击 和 +2 @ 生命 .\nNY a oe ae Tom et ea CHE EIB Mt tin.? @ +s","hintZhClean":"火 鸡\nDO 伙伴 被 召唤 时 > 使 其 获得 +3 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 > 使 其 获得 +6 攻击 和 +2 生命 .","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"1乌龟兽群","sourceRow":61},{"id":"pack1_pet_0045","kind":"pack1_pet_0045","packKey":"pack1","nameZh":"犀牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犀牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0045.png","iconMissing":false,"hintZhRaw":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。\n1 cet eh 3 Oe LOE PL SRE RON HIN eee","hintZhClean":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"1乌龟兽群","sourceRow":62},{"id":"pack1_pet_0046","kind":"pack1_pet_0046","packKey":"pack1","nameZh":"犰狳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犰狳.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0046.png","iconMissing":false,"hintZhRaw":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.\nME) pos) wae ea CESK Er oeentt@.l, @ +s","hintZhClean":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"1乌龟兽群","sourceRow":63},{"id":"pack1_pet_0047","kind":"pack1_pet_0047","packKey":"pack1","nameZh":"猴子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/猴子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0047.png","iconMissing":false,"hintZhRaw":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 @ 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 和 +*4 O tm.\nNM) =o ot et mt EBM ee eee 让 二 IF @ te","hintZhClean":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 和 +*4 O tm.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"1乌龟兽群","sourceRow":64},{"id":"pack1_pet_0048","kind":"pack1_pet_0048","packKey":"pack1","nameZh":"蝎子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/蝎子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0048.png","iconMissing":false,"hintZhRaw":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintZhClean":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb9d1","sourceSheet":"1乌龟兽群","sourceRow":66},{"id":"pack1_pet_0049","kind":"pack1_pet_0049","packKey":"pack1","nameZh":"鲨鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鲨鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0049.png","iconMissing":false,"hintZhRaw":"& &\nDO neemea > 获得 +2 @ 攻击 和 +2 @ 生命 。\n) Be eRe > 获得 +4 @ 攻击 和 *+4 O 生命 。\nND? op oe ae ert ee Bac Mwti.aic @ rs","hintZhClean":"DO neemea > 获得 +2 攻击 和 +2 生命 。\n) Be eRe > 获得 +4 攻击 和 *+4 O 生命 。\nND op oe ae ert ee Bac Mwti.aic rs","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a68f","sourceSheet":"1乌龟兽群","sourceRow":67},{"id":"pack1_pet_0050","kind":"pack1_pet_0050","packKey":"pack1","nameZh":"鳄鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鳄鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0050.png","iconMissing":false,"hintZhRaw":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。\nNM) pes) wae ab HBC se Leo sie aw ab Pl","hintZhClean":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c78fd1","sourceSheet":"1乌龟兽群","sourceRow":68},{"id":"pack1_pet_0051","kind":"pack1_pet_0051","packKey":"pack1","nameZh":"狼獾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/狼獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0051.png","iconMissing":false,"hintZhRaw":"AR\nD OAKS > 使 所 有 敌人 -3 @ tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 @ 生命\nfm 和 hz 人 nd ea EER th ao Mes","hintZhClean":"AR\nD OAKS > 使 所 有 敌人 -3 tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 生命","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#98d18f","sourceSheet":"1乌龟兽群","sourceRow":72},{"id":"pack1_pet_0052","kind":"pack1_pet_0052","packKey":"pack1","nameZh":"猛犸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猛犸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0052.png","iconMissing":false,"hintZhRaw":"th 59\nCD wre > 使 伙伴 获得 +2 @ 攻击 和 +2 O 生命 .\nCB memes => 使 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\n1) exe ab OHO OK ace TI Fr @ +s","hintZhClean":"th 59\nCD wre > 使 伙伴 获得 +2 攻击 和 +2 O 生命 .\nCB memes > 使 伙伴 获得 +*4 攻击 和 +4 Ota.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"1乌龟兽群","sourceRow":73},{"id":"pack1_pet_0053","kind":"pack1_pet_0053","packKey":"pack1","nameZh":"猩猩","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猩猩1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0053.png","iconMissing":false,"hintZhRaw":"Ve Ye 页 1/2\nQD 受伤 时 » 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。\nfi 和 到 /Ap ob TIMES te OE St Bb","hintZhClean":"Ve Ye 页 1/2\nQD 受伤 时 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"1乌龟兽群","sourceRow":74},{"id":"pack1_pet_0054","kind":"pack1_pet_0054","packKey":"pack1","nameZh":"猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猫.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0054.png","iconMissing":false,"hintZhRaw":"狂\nQO 商店 食物 给 予 两 倍 攻击 @ 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 @5tH@O. saatm2”.\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintZhClean":"QO 商店 食物 给 予 两 倍 攻击 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 5tH O. saatm2 .\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c38fd1","sourceSheet":"1乌龟兽群","sourceRow":76},{"id":"pack1_pet_0055","kind":"pack1_pet_0055","packKey":"pack1","nameZh":"苍蝇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/苍蝇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0055.png","iconMissing":false,"hintZhRaw":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。\nND) op oe eR eb KES BM _ Oa ee 455 [| & Abe Be An","hintZhClean":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9cd18f","sourceSheet":"1乌龟兽群","sourceRow":77},{"id":"pack1_pet_0056","kind":"pack1_pet_0056","packKey":"pack1","nameZh":"虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/虎.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0056.png","iconMissing":false,"hintZhRaw":"虎\nCO 在 战斗 中 ， 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 ， 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintZhClean":"CO 在 战斗 中 , 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 , 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":78},{"id":"pack1_pet_0057","kind":"pack1_pet_0057","packKey":"pack1","nameZh":"蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/蛇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。\nfi 和 pmp 二 pa 入 htinrh LCE RPI Rm OY wtb el tanec","hintZhClean":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":79},{"id":"pack1_pet_0058","kind":"pack1_pet_0058","packKey":"pack1","nameZh":"豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0058.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME? pes) wae ea HI Amminse bE OU Reeth HON HED","hintZhClean":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME pes) wae ea HI Amminse bE OU Reeth HON HED","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d08fd1","sourceSheet":"1乌龟兽群","sourceRow":80},{"id":"pack1_pet_0059","kind":"pack1_pet_0059","packKey":"pack1","nameZh":"野猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/野猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0059.png","iconMissing":false,"hintZhRaw":"Ee c=]\nDO 攻击 前 > 获得 +4 @ 攻击 和 +2 @@ 生命 .\n» 3 攻击 前 > 获得 +8 @ 攻击 和 +4 Ota.\n3 eae ae Se we pres","hintZhClean":"Ee c ]\nDO 攻击 前 > 获得 +4 攻击 和 +2 生命 .\n3 攻击 前 > 获得 +8 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd18f","sourceSheet":"1乌龟兽群","sourceRow":81},{"id":"pack1_pet_0060","kind":"pack1_pet_0060","packKey":"pack1","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b2","sourceSheet":"1乌龟兽群","sourceRow":82},{"id":"pack2_pet_0001","kind":"pack2_pet_0001","packKey":"pack2","nameZh":"伊犁鼠兔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/伊犁鼠兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0001.png","iconMissing":false,"hintZhRaw":"FRR?! ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1， 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2， 持 续 一 回合 。\nNY? op oe mr wet ea ChE BmwM.r 1ie_Mms","hintZhClean":"FRR ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1, 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2, 持 续 一 回合 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":2},{"id":"pack2_pet_0002","kind":"pack2_pet_0002","packKey":"pack2","nameZh":"埃塞俄比亚狼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/埃塞俄比亚狼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0002.png","iconMissing":false,"hintZhRaw":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n小 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n小 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":3},{"id":"pack2_pet_0003","kind":"pack2_pet_0003","packKey":"pack2","nameZh":"托吉安鹿豚","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/托吉安鹿豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0003.png","iconMissing":false,"hintZhRaw":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 @ tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 @ tH,\n1) ec ab H_ Amine | oe.) @ +s","hintZhClean":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 tH,","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":4},{"id":"pack2_pet_0004","kind":"pack2_pet_0004","packKey":"pack2","nameZh":"火山蜗牛","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/火山蜗牛2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0004.png","iconMissing":false,"hintZhRaw":"任意 单位 攻击 时 @ SHISHEO, ， 生 效 一 次 。","hintZhClean":"任意 单位 攻击 时 SHISHEO, , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":6},{"id":"pack2_pet_0005","kind":"pack2_pet_0005","packKey":"pack2","nameZh":"熊蜂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/熊蜂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0005.png","iconMissing":false,"hintZhRaw":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ，\nEY sek ey eB oe 时 A Le Pl eae OY me cl tahoe","hintZhClean":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":7},{"id":"pack2_pet_0006","kind":"pack2_pet_0006","packKey":"pack2","nameZh":"翡翠贻贝","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/翡翠贻贝.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0006.png","iconMissing":false,"hintZhRaw":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。\nNW mane). | OSH Ab","hintZhClean":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":8},{"id":"pack2_pet_0007","kind":"pack2_pet_0007","packKey":"pack2","nameZh":"西表猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/西表猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0007.png","iconMissing":false,"hintZhRaw":"FOR Is\n加 战斗 前 >» 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 => 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。\n1S tec) wa KA Te BON ee ER 1)","hintZhClean":"FOR Is\n加 战斗 前 > 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 > 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":9},{"id":"pack2_pet_0008","kind":"pack2_pet_0008","packKey":"pack2","nameZh":"非洲野狗","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/非洲野狗.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0008.png","iconMissing":false,"hintZhRaw":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 ， 造 成 3 点 伤 寄 〇 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 ， 造 成 6 点 伤害 O,\nNS sec) wand wa HUES kh :过 Fo 上 六","hintZhClean":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 , 造 成 3 点 伤 寄 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 , 造 成 6 点 伤害 O,","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c98fd1","sourceSheet":"2濒危兽群","sourceRow":10},{"id":"pack2_pet_0009","kind":"pack2_pet_0009","packKey":"pack2","nameZh":"马来貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/马来貘.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0009.png","iconMissing":false,"hintZhRaw":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 @@O 生命 。 每 回合 生效 3 次 。\nfy 440 61 OK TH Ee aa UI. 2 OO KH 455 (Al) & 4 GA 2° Ar","hintZhClean":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#95d18f","sourceSheet":"2濒危兽群","sourceRow":11},{"id":"pack2_pet_0010","kind":"pack2_pet_0010","packKey":"pack2","nameZh":"齿嘴鸠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/齿嘴鸠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0010.png","iconMissing":false,"hintZhRaw":"一 堆 种 子 A 2}:\n使 一 个 宠物 获得 +1 O 生命 。","hintZhClean":"一 堆 种 子 A 2 :\n使 一 个 宠物 获得 +1 O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aed18f","sourceSheet":"2濒危兽群","sourceRow":13},{"id":"pack2_pet_0011","kind":"pack2_pet_0011","packKey":"pack2","nameZh":"中南大羚","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/中南大羚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0011.png","iconMissing":false,"hintZhRaw":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 @ 攻击 和 +2 @ tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 @ 攻击 和 +2 O tH.\nMW) mace stn ob Het Bem Awww) A wt. @ +s","hintZhClean":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 攻击 和 +2 tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 攻击 和 +2 O tH.","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b18fd1","sourceSheet":"2濒危兽群","sourceRow":16},{"id":"pack2_pet_0012","kind":"pack2_pet_0012","packKey":"pack2","nameZh":"侏儒猪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/侏儒猪2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0012.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b0d18f","sourceSheet":"2濒危兽群","sourceRow":18},{"id":"pack2_pet_0013","kind":"pack2_pet_0013","packKey":"pack2","nameZh":"普氏野马","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/普氏野马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0013.png","iconMissing":false,"hintZhRaw":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She => 召 隐 一 个 6/4 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n1) eet ab 2A AOC st eh: SPOOL me twee","hintZhClean":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She > 召 隐 一 个 6/4 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#af8fd1","sourceSheet":"2濒危兽群","sourceRow":19},{"id":"pack2_pet_0014","kind":"pack2_pet_0014","packKey":"pack2","nameZh":"泰塔尖鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/泰塔尖鼠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0014.png","iconMissing":false,"hintZhRaw":"& EUR\nTQ 2/:\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\nTQ 2/:\n) sae 下 一 回合 获得 +1 O 金币 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a9d18f","sourceSheet":"2濒危兽群","sourceRow":21},{"id":"pack2_pet_0015","kind":"pack2_pet_0015","packKey":"pack2","nameZh":"澳洲水貂","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/澳洲水貂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0015.png","iconMissing":false,"hintZhRaw":"BR GAN 7K $2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。\nfy AVE OK TH Se om SHRINE Mest 455 (Al) & 4 GS QA","hintZhClean":"BR GAN 7K 2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b58fd1","sourceSheet":"2濒危兽群","sourceRow":22},{"id":"pack2_pet_0016","kind":"pack2_pet_0016","packKey":"pack2","nameZh":"白腹鹭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/白腹鹭2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0016.png","iconMissing":true,"hintZhRaw":"页 2/:\n内 骨头\n攻击 伤害 〇 +3。","hintZhClean":"页 2/:\n内 骨头\n攻击 伤害 +3。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#acd18f","sourceSheet":"2濒危兽群","sourceRow":24},{"id":"pack2_pet_0017","kind":"pack2_pet_0017","packKey":"pack2","nameZh":"赛克尔隼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/赛克尔隼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0017.png","iconMissing":false,"hintZhRaw":"FF oe\nOD 攻击 前 OP URRBN, RO+2O@ 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。\n1D? we tee 证 昌国 pz rr Ot mse shy","hintZhClean":"FF oe\nOD 攻击 前 OP URRBN, RO+2O 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b38fd1","sourceSheet":"2濒危兽群","sourceRow":25},{"id":"pack2_pet_0018","kind":"pack2_pet_0018","packKey":"pack2","nameZh":"达尔文狐","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/达尔文狐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0018.png","iconMissing":false,"hintZhRaw":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。\nNf Sy A 24 RS eh 7423S Se at Bett ante bo Fh Oe ST te -全 4e5 4%, ER OL AE BS 2","hintZhClean":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b7d18f","sourceSheet":"2濒危兽群","sourceRow":26},{"id":"pack2_pet_0019","kind":"pack2_pet_0019","packKey":"pack2","nameZh":"长鼻猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/长鼻猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0019.png","iconMissing":false,"hintZhRaw":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\nNM) marron ab BEE M HABE bh) ETE AHIR 1 ET th","hintZhClean":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a88fd1","sourceSheet":"2濒危兽群","sourceRow":27},{"id":"pack2_pet_0020","kind":"pack2_pet_0020","packKey":"pack2","nameZh":"阿拉里佩侏儒鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/阿拉里佩侏儒鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0020.png","iconMissing":false,"hintZhRaw":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 @ 获得 +3 @@ 生命 ， 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。\nfy 站 OF OZ OME Te 1358.0 TO ++ ORR ms a fA) & Ae ASDA","hintZhClean":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 获得 +3 生命 , 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"2濒危兽群","sourceRow":28},{"id":"pack2_pet_0021","kind":"pack2_pet_0021","packKey":"pack2","nameZh":"亨氏牛羚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/亨氏牛羚2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0021.png","iconMissing":false,"hintZhRaw":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n» 3 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n3 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"2濒危兽群","sourceRow":33},{"id":"pack2_pet_0022","kind":"pack2_pet_0022","packKey":"pack2","nameZh":"侏儒河马","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/侏儒河马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0022.png","iconMissing":false,"hintZhRaw":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\nNf lek eto ce at 24S BH KH Ase LoS ee tee @ + 2 220M DD","hintZhClean":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"2濒危兽群","sourceRow":34},{"id":"pack2_pet_0023","kind":"pack2_pet_0023","packKey":"pack2","nameZh":"勺嘴鹬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/勺嘴鹬.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0023.png","iconMissing":false,"hintZhRaw":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。\nNM marron ea BEM HAS Howe Bi wees,","hintZhClean":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b4","sourceSheet":"2濒危兽群","sourceRow":35},{"id":"pack2_pet_0024","kind":"pack2_pet_0024","packKey":"pack2","nameZh":"土库海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/土库海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0024.png","iconMissing":false,"hintZhRaw":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +3 @ 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +6 @ 攻击 和 *6 Ota.\nTE) aw rit bh Be ok ee ee Ot EK el ce BH etn @ +=","hintZhClean":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +3 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +6 攻击 和 *6 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"2濒危兽群","sourceRow":36},{"id":"pack2_pet_0025","kind":"pack2_pet_0025","packKey":"pack2","nameZh":"树袋鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/树袋鼠1.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0025.png","iconMissing":false,"hintZhRaw":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活一次。\nL2 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活两次。\nL3 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活三次。","hintZhClean":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢,并激活一次。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"2濒危兽群","sourceRow":37},{"id":"pack2_pet_0026","kind":"pack2_pet_0026","packKey":"pack2","nameZh":"猴面蝙蝠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/猴面蝙蝠.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0026.png","iconMissing":false,"hintZhRaw":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 |] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。\nNf Eee ewe ee EC web BA HN St eee. A wtinic @ +s aur 4%, FS ol AE BSD AP","hintZhClean":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 ] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"2濒危兽群","sourceRow":39},{"id":"pack2_pet_0027","kind":"pack2_pet_0027","packKey":"pack2","nameZh":"琉球兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/琉球兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0027.png","iconMissing":false,"hintZhRaw":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\nNS rp we UA IRN ee HRN EHO BAMHI","hintZhClean":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"2濒危兽群","sourceRow":40},{"id":"pack2_pet_0028","kind":"pack2_pet_0028","packKey":"pack2","nameZh":"罗洛韦猴","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/罗洛韦猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0028.png","iconMissing":false,"hintZhRaw":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。\nNf be oL WAG Qe ab 2 OOo TN OF OK OWE 4 LOO Sn FRO 2A TB) Ko oe 8 eB Oh ae TE ER 4 2)","hintZhClean":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa2","sourceSheet":"2濒危兽群","sourceRow":41},{"id":"pack2_pet_0029","kind":"pack2_pet_0029","packKey":"pack2","nameZh":"羚牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/羚牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0029.png","iconMissing":false,"hintZhRaw":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 @ 生命 ， 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 ， 持 续 一 回合 。\nfy yt Ra nm OH —™) 3274s","hintZhClean":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 生命 , 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bf","sourceSheet":"2濒危兽群","sourceRow":42},{"id":"pack2_pet_0030","kind":"pack2_pet_0030","packKey":"pack2","nameZh":"蓝喉金刚鹦鹉","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/蓝喉金刚鹦鹉.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0030.png","iconMissing":false,"hintZhRaw":"WA Dee = MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 ， 使 其 获得 +3 @ 攻击 ， 持 续 一 回合 ; 否则 ， 使 其 获得 @ 生命 。\n小 伙伴 变形 时 @ 若 其 在 前 排 ， 使 其 获得 +6 全 攻击， 持续 一 回合 ; BM, CHRO 生命.\nNf 人 2% MEU A eh 3 ET Pr a4 et 43 Ff ZEA 20 a Th = 2 eh fh) oe - AEM ‘sew @ ++=-","hintZhClean":"WA Dee MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 , 使 其 获得 +3 攻击 , 持 续 一 回合 否则 , 使 其 获得 生命 。\n小 伙伴 变形 时 若 其 在 前 排 , 使 其 获得 +6 全 攻击, 持续 一 回合 BM, CHRO 生命.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":43},{"id":"pack2_pet_0031","kind":"pack2_pet_0031","packKey":"pack2","nameZh":"亚马逊海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/亚马逊海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0031.png","iconMissing":false,"hintZhRaw":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 ， 或 获得 +3 @ 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 ， 或 获得 +6 @ 攻击 .\nNM) sa eeavpak te te ab ME Sect ctoscic mw CO 十 这/ 有 CO 人 十","hintZhClean":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 , 或 获得 +3 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 , 或 获得 +6 攻击 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":47},{"id":"pack2_pet_0032","kind":"pack2_pet_0032","packKey":"pack2","nameZh":"倭黑猩猩","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/倭黑猩猩.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0032.png","iconMissing":false,"hintZhRaw":"倭 黑猩猩\nCD 回合 开始 时 &@ 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 => 变 为 最 前 排 的 伙伴 。\nNM) marron ob TH Beto) oe","hintZhClean":"倭 黑猩猩\nCD 回合 开始 时 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 > 变 为 最 前 排 的 伙伴 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":48},{"id":"pack2_pet_0033","kind":"pack2_pet_0033","packKey":"pack2","nameZh":"天使鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/天使鲨.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0033.png","iconMissing":false,"hintZhRaw":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。\nfy fal = +2 RY eb CEE Ty 61: KOH OS fe 2","hintZhClean":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":49},{"id":"pack2_pet_0034","kind":"pack2_pet_0034","packKey":"pack2","nameZh":"巨獭","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/巨獭.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0034.png","iconMissing":false,"hintZhRaw":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 => 使 所 有 伙伴 获得 +4 O KHN+10O 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\nfy 上 上 cl 二 oem CREE tree zk 二 FTP 二 xz 1c Oem) Er Ie 二 天","hintZhClean":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 > 使 所 有 伙伴 获得 +4 O KHN+10O 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":50},{"id":"pack2_pet_0035","kind":"pack2_pet_0035","packKey":"pack2","nameZh":"栉齿锯鳐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/栉齿锯鳐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0035.png","iconMissing":false,"hintZhRaw":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 @ 生命 ， 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 ， 并 使 所 有 敌人 8 OY tH.\n小 -\nteh wet Oo ce at 7578.17 @ > +e ewe 1 1D @ +s","hintZhClean":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 生命 , 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 , 并 使 所 有 敌人 8 OY tH.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"2濒危兽群","sourceRow":51},{"id":"pack2_pet_0036","kind":"pack2_pet_0036","packKey":"pack2","nameZh":"波纹唇鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/波纹唇鱼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0036.png","iconMissing":false,"hintZhRaw":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% @ KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% @ 攻击 .\nNM) peel wae ob Chet Bete ann. Hawt","hintZhClean":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":52},{"id":"pack2_pet_0037","kind":"pack2_pet_0037","packKey":"pack2","nameZh":"袋獾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/袋獾2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0037.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":54},{"id":"pack2_pet_0038","kind":"pack2_pet_0038","packKey":"pack2","nameZh":"金狮狨猴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/金狮狨猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0038.png","iconMissing":false,"hintZhRaw":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。\nMEY ra eh OF HO 丰 故国 在 ke、 ZT OR BEE Some EER AH?)","hintZhClean":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"2濒危兽群","sourceRow":55},{"id":"pack2_pet_0039","kind":"pack2_pet_0039","packKey":"pack2","nameZh":"阿尔达布拉象龟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/阿尔达布拉象龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0039.png","iconMissing":false,"hintZhRaw":"Bo] “RA Fp ti RRB\nDassen» 获得 +2 二 生命 ， 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100，\n小 回合 结束 时 > 获得 +4 @ 生命 ， 并 将 O@ 攻击 设 为 8。 生 命 上 限 可 达 100，\nfi 人 请 全 广 未 pi ee Mc Hee te 让 证 :Ar +e EBT tin:","hintZhClean":"Bo] RA Fp ti RRB\nDassen 获得 +2 二 生命 , 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100,\n小 回合 结束 时 > 获得 +4 生命 , 并 将 O 攻击 设 为 8。 生 命 上 限 可 达 100,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"2濒危兽群","sourceRow":56},{"id":"pack2_pet_0040","kind":"pack2_pet_0040","packKey":"pack2","nameZh":"鸮鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/鸮鹦鹉2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0040.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bc8fd1","sourceSheet":"2濒危兽群","sourceRow":58},{"id":"pack2_pet_0041","kind":"pack2_pet_0041","packKey":"pack2","nameZh":"几何陆龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/几何陆龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0041.png","iconMissing":false,"hintZhRaw":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 => 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。\nNE) =u et ea 34 _ A HEN Sh OL OE PEE SE Be ae 全 MI.","hintZhClean":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a3d18f","sourceSheet":"2濒危兽群","sourceRow":62},{"id":"pack2_pet_0042","kind":"pack2_pet_0042","packKey":"pack2","nameZh":"夏威夷僧海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/夏威夷僧海豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0042.png","iconMissing":false,"hintZhRaw":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命\nNM) aaron ea OH bith ib ll ET Ameo oe aac @ 小 全","hintZhClean":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#be8fd1","sourceSheet":"2濒危兽群","sourceRow":63},{"id":"pack2_pet_0043","kind":"pack2_pet_0043","packKey":"pack2","nameZh":"小熊猫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/小熊猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0043.png","iconMissing":false,"hintZhRaw":"/\\\\ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\nNEY os et ea ii 下 _RA 在 让 :汉人 和 pa OTE ie tee (STL Oe am Eo AX)","hintZhClean":"/ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a0d18f","sourceSheet":"2濒危兽群","sourceRow":64},{"id":"pack2_pet_0044","kind":"pack2_pet_0044","packKey":"pack2","nameZh":"指猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/指猴2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0044.png","iconMissing":false,"hintZhRaw":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。\nNM marron abd :大汉 人 DonnnxynysI 一 加","hintZhClean":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b88fd1","sourceSheet":"2濒危兽群","sourceRow":66},{"id":"pack2_pet_0045","kind":"pack2_pet_0045","packKey":"pack2","nameZh":"泰塔鸫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/泰塔鸫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0045.png","iconMissing":false,"hintZhRaw":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 @KGN+2O 生命 。 每 回合 生效 3 次 。\nND? 40 48 Ook Te eo CEER Seb ow a? A we ti.2 Ot mM SH ab.","hintZhClean":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 KGN+2O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a7d18f","sourceSheet":"2濒危兽群","sourceRow":67},{"id":"pack2_pet_0046","kind":"pack2_pet_0046","packKey":"pack2","nameZh":"海鬣蜥","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/海鬣蜥2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0046.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"2濒危兽群","sourceRow":69},{"id":"pack2_pet_0047","kind":"pack2_pet_0047","packKey":"pack2","nameZh":"考氏鳍竺鲷","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/考氏鳍竺鲷.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0047.png","iconMissing":false,"hintZhRaw":"S as = 88\nCO wim = 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 @ 攻击 ， 最 低 减 至 4。\nME) pec) mae ea CER SS ah ee oo Tb 二 Brae","hintZhClean":"S as 88\nCO wim 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 攻击 , 最 低 减 至 4。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a5d18f","sourceSheet":"2濒危兽群","sourceRow":70},{"id":"pack2_pet_0048","kind":"pack2_pet_0048","packKey":"pack2","nameZh":"西瓜龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/西瓜龟2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0048.png","iconMissing":true,"hintZhRaw":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintZhClean":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"2濒危兽群","sourceRow":72},{"id":"pack2_pet_0049","kind":"pack2_pet_0049","packKey":"pack2","nameZh":"长丝巨鲇","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/长丝巨鲇.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0049.png","iconMissing":false,"hintZhRaw":"1 22 6 84\nQO sky» 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 8 点 伤害 O.\n1) ect ob KOM E_ARK wee 入 pinb erplio 上 全 二 全","hintZhClean":"1 22 6 84\nQO sky 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 8 点 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"2濒危兽群","sourceRow":73},{"id":"pack2_pet_0050","kind":"pack2_pet_0050","packKey":"pack2","nameZh":"雪豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/雪豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0050.png","iconMissing":false,"hintZhRaw":"SN\nCD 战斗 开始 时 > 获得 +5 | 攻击 和 *+5 二 生命 ， 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 @ 攻击 和 +10 OD 生命 ， 并 跳跃 攻击 一 个 随机 敌人 ，\nMEY pec) raed ea 7578.10 TI ic @te + eee t_Aminewi","hintZhClean":"SN\nCD 战斗 开始 时 > 获得 +5 攻击 和 *+5 二 生命 , 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 攻击 和 +10 OD 生命 , 并 跳跃 攻击 一 个 随机 敌人 ,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c4d18f","sourceSheet":"2濒危兽群","sourceRow":74},{"id":"pack2_pet_0051","kind":"pack2_pet_0051","packKey":"pack2","nameZh":"丝绒冕狐猴","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/丝绒冕狐猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0051.png","iconMissing":false,"hintZhRaw":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。\nNf ES cL WAG Re ab 2 Gt ABN CO) OK OWE 4% OO So RON ts BS 8 HO ee ae CO OE ER 4 2)","hintZhClean":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9b8fd1","sourceSheet":"2濒危兽群","sourceRow":78},{"id":"pack2_pet_0052","kind":"pack2_pet_0052","packKey":"pack2","nameZh":"加州秃鹰","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/加州秃鹰.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0052.png","iconMissing":false,"hintZhRaw":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。\nNEY op oe mr et ee TRIMER BE OEE ER Sl 人 Ah","hintZhClean":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c6d18f","sourceSheet":"2濒危兽群","sourceRow":79},{"id":"pack2_pet_0053","kind":"pack2_pet_0053","packKey":"pack2","nameZh":"婆罗洲金猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/婆罗洲金猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0053.png","iconMissing":false,"hintZhRaw":"2S iN = Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\nNf @@et ab 72°40 BK Oo ORO ge £8 、| IT 84 BEA BOAR) SOO OCS Be -人","hintZhClean":"2S iN Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#998fd1","sourceSheet":"2濒危兽群","sourceRow":80},{"id":"pack2_pet_0054","kind":"pack2_pet_0054","packKey":"pack2","nameZh":"灰犀鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/灰犀鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0054.png","iconMissing":false,"hintZhRaw":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。\nfy fal &@ ¢2 DBRS a 16 — MO): eK OM 2 Se wt OS","hintZhClean":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c8d18f","sourceSheet":"2濒危兽群","sourceRow":81},{"id":"pack2_pet_0055","kind":"pack2_pet_0055","packKey":"pack2","nameZh":"绿海龟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/绿海龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0055.png","iconMissing":false,"hintZhRaw":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。\nNf leh tet DY ce ab CBB St wee mwa mito se we ON ws 45 (7) & 4+ S61 Ar","hintZhClean":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#968fd1","sourceSheet":"2濒危兽群","sourceRow":82},{"id":"pack2_pet_0056","kind":"pack2_pet_0056","packKey":"pack2","nameZh":"苏门达腊虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/苏门达腊虎.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0056.png","iconMissing":false,"hintZhRaw":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 ， 并 对 相 邻 敌人 造成 6 点 伤害 。\nNf be | Wee ee abd FS — il (BOO te 人 He Kh Oe ST Th 二 2 HMA 人 SP 1I Se a","hintZhClean":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 , 并 对 相 邻 敌人 造成 6 点 伤害 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cbd18f","sourceSheet":"2濒危兽群","sourceRow":83},{"id":"pack2_pet_0057","kind":"pack2_pet_0057","packKey":"pack2","nameZh":"菲律宾雕","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/菲律宾雕.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0057.png","iconMissing":false,"hintZhRaw":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 @ 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 @ 攻击 和 +8 Ota.\nNY cr me i eT ot BAN et oe 8.1) A wt.) 国 秆 全","hintZhClean":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 攻击 和 +8 Ota.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#948fd1","sourceSheet":"2濒危兽群","sourceRow":84},{"id":"pack2_pet_0058","kind":"pack2_pet_0058","packKey":"pack2","nameZh":"蓝鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/蓝鲸.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0058.png","iconMissing":false,"hintZhRaw":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 @ 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 @O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 @ 生命 。\nfy TF) & WAAR abd TEMA GOT) OM OTR FEE OMB Tene mac pp 二 In F Oem","hintZhClean":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 生命 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bbd18f","sourceSheet":"2濒危兽群","sourceRow":85},{"id":"pack2_pet_0059","kind":"pack2_pet_0059","packKey":"pack2","nameZh":"阿姆斯特丹信天翁","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/阿姆斯特丹信天翁.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0059.png","iconMissing":false,"hintZhRaw":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。\nND) aoe mw ab CREAN 2379.c @ wtinac @ +s 45 [二 | & 4&e Bb) Ap","hintZhClean":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a48fd1","sourceSheet":"2濒危兽群","sourceRow":86},{"id":"pack2_pet_0060","kind":"pack2_pet_0060","packKey":"pack2","nameZh":"黑犀牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/黑犀牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0060.png","iconMissing":false,"hintZhRaw":"墨 犀牛\nOD 敌人 攻击 七 次 后 @ 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\nfi 了 mp 二 上 六 户 一 入 系 人 是 关 snh 站 让 mn 上 人 二 全","hintZhClean":"墨 犀牛\nOD 敌人 攻击 七 次 后 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#928fd1","sourceSheet":"2濒危兽群","sourceRow":87},{"id":"pack3_pet_0001","kind":"pack3_pet_0001","packKey":"pack3","nameZh":"???","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/？？？2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0001.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"3独角兽兽群","sourceRow":16},{"id":"pack3_pet_0002","kind":"pack3_pet_0002","packKey":"pack3","nameZh":"企鹅鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/企鹅鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0002.png","iconMissing":false,"hintZhRaw":"TE #8 &\n@ Rema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次，\n1) ecco et tk ec ss A wee mM Se Bh","hintZhClean":"TE 8\nRema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa3","sourceSheet":"3独角兽兽群","sourceRow":2},{"id":"pack3_pet_0003","kind":"pack3_pet_0003","packKey":"pack3","nameZh":"抱抱蟾蜍","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/抱抱蟾蜍4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0003.png","iconMissing":false,"hintZhRaw":"水 晶 球 页 4/2\nC) 战斗 开始 时 => 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.\nfy te cl TT AR ab (HOM maces fi -人","hintZhClean":"水 晶 球 页 4/2\nC) 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bc","sourceSheet":"3独角兽兽群","sourceRow":6},{"id":"pack3_pet_0004","kind":"pack3_pet_0004","packKey":"pack3","nameZh":"澳洲水兽","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/澳洲水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0004.png","iconMissing":false,"hintZhRaw":"GN 7k &\nCD 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.\nNM) pec) waa ea Mr Rte (Bw) ee. @ +s","hintZhClean":"GN 7k\nCD 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa5","sourceSheet":"3独角兽兽群","sourceRow":7},{"id":"pack3_pet_0005","kind":"pack3_pet_0005","packKey":"pack3","nameZh":"炼金小虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/炼金小虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0005.png","iconMissing":false,"hintZhRaw":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.\nME? pe sl maces ea CEB me eo) ee. A es","hintZhClean":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ba","sourceSheet":"3独角兽兽群","sourceRow":8},{"id":"pack3_pet_0006","kind":"pack3_pet_0006","packKey":"pack3","nameZh":"犬魔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/犬魔2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0006.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa7","sourceSheet":"3独角兽兽群","sourceRow":10},{"id":"pack3_pet_0007","kind":"pack3_pet_0007","packKey":"pack3","nameZh":"野槌蛇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/野槌蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0007.png","iconMissing":false,"hintZhRaw":"$F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 ， 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 ， 并 获得 +2 B 经 验 值 。\nME) posi maces ee MSL Eee) tt tw. @ ez mee","hintZhClean":"F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 , 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 , 并 获得 +2 B 经 验 值 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b8","sourceSheet":"3独角兽兽群","sourceRow":11},{"id":"pack3_pet_0008","kind":"pack3_pet_0008","packKey":"pack3","nameZh":"食梦貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/食梦貘.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0008.png","iconMissing":false,"hintZhRaw":"RS\nDOSER @ 回合 数 为 偶数 时 ， 用 +1 @ 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 ， 用 +2 @ 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。\nNf fl & +2 3 RS at TD) © BS 4 (BE RO mo OD + mB A OL OK Loin mie XK","hintZhClean":"RS\nDOSER 回合 数 为 偶数 时 , 用 +1 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 , 用 +2 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f98","sourceSheet":"3独角兽兽群","sourceRow":12},{"id":"pack3_pet_0009","kind":"pack3_pet_0009","packKey":"pack3","nameZh":"鬼祟蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鬼祟蛋.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0009.png","iconMissing":false,"hintZhRaw":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。\nNM) pec) raed ea MH DM _A10 cob Th","hintZhClean":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c7","sourceSheet":"3独角兽兽群","sourceRow":13},{"id":"pack3_pet_0010","kind":"pack3_pet_0010","packKey":"pack3","nameZh":"鱼头人","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鱼头人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0010.png","iconMissing":false,"hintZhRaw":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 =» 获得 +1 @ 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击， 持续 一 回合 。\nNY op oe oe ez OR ea E18. ”人 wet tt ms","hintZhClean":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 获得 +1 攻击 , 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"3独角兽兽群","sourceRow":14},{"id":"pack3_pet_0011","kind":"pack3_pet_0011","packKey":"pack3","nameZh":"双足飞龙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/双足飞龙.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0011.png","iconMissing":false,"hintZhRaw":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。\nfy 只 中 -FE KS","hintZhClean":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"3独角兽兽群","sourceRow":19},{"id":"pack3_pet_0012","kind":"pack3_pet_0012","packKey":"pack3","nameZh":"大脚怪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/大脚怪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0012.png","iconMissing":false,"hintZhRaw":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。\nfy SER? ab 1 fh) > 75 — Ae em PCRS","hintZhClean":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"3独角兽兽群","sourceRow":20},{"id":"pack3_pet_0013","kind":"pack3_pet_0013","packKey":"pack3","nameZh":"天蛾人","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/天蛾人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0013.png","iconMissing":false,"hintZhRaw":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 © 获得 +1 @ xtH-1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 &@ RG+2O 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\nNEY cr cm oe a EK EHR ea 2058.2 A wt. @ ts 和 末 门生 mm SH ae","hintZhClean":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 获得 +1 xtH-1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 RG+2O 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"3独角兽兽群","sourceRow":21},{"id":"pack3_pet_0014","kind":"pack3_pet_0014","packKey":"pack3","nameZh":"奥古普古","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/奥古普古.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0014.png","iconMissing":false,"hintZhRaw":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 & 经 验 值 。\nME) peel mae ea CBS IK Ao oe tee.) 2 ,De 人 襄","hintZhClean":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 经 验 值 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"3独角兽兽群","sourceRow":22},{"id":"pack3_pet_0015","kind":"pack3_pet_0015","packKey":"pack3","nameZh":"幽灵猫咪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/幽灵猫咪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0015.png","iconMissing":false,"hintZhRaw":"Hi =e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。\nNY xamer ayer Sos","hintZhClean":"Hi e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"3独角兽兽群","sourceRow":23},{"id":"pack3_pet_0016","kind":"pack3_pet_0016","packKey":"pack3","nameZh":"掉掉熊","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/掉掉熊.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0016.png","iconMissing":false,"hintZhRaw":"OD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce~}~6. ores Sent 3 +H eB _Atw Lot ctasee ND","hintZhClean":"OD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce 6. ores Sent 3 +H eB Atw Lot ctasee ND","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"3独角兽兽群","sourceRow":24},{"id":"pack3_pet_0017","kind":"pack3_pet_0017","packKey":"pack3","nameZh":"滴水兽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/滴水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0017.png","iconMissing":false,"hintZhRaw":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。\nNf SBR ab HBR ME Ke OK eh iB.c @ += ge cues) t AX mea eee Oh BleSt oe","hintZhClean":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"3独角兽兽群","sourceRow":25},{"id":"pack3_pet_0018","kind":"pack3_pet_0018","packKey":"pack3","nameZh":"雷鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/雷鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0018.png","iconMissing":false,"hintZhRaw":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.\nNM) pec) Ten ob CRE ES CR OO) oe ao Aes","hintZhClean":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbad1","sourceSheet":"3独角兽兽群","sourceRow":26},{"id":"pack3_pet_0019","kind":"pack3_pet_0019","packKey":"pack3","nameZh":"霜狼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/霜狼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0019.png","iconMissing":false,"hintZhRaw":"寒冷 页 2/:\n受到 的 伤害 O +5， 生 效 一 次 。","hintZhClean":"寒冷 页 2/:\n受到 的 伤害 O +5, 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a78f","sourceSheet":"3独角兽兽群","sourceRow":28},{"id":"pack3_pet_0020","kind":"pack3_pet_0020","packKey":"pack3","nameZh":"鹿角兔","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/鹿角兔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0020.png","iconMissing":false,"hintZhRaw":"CD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR ”Tb 这 OST ee Be Eb CL AE abr","hintZhClean":"CD 伙伴 攻击 前 > 使 其 获得 +1 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR Tb 这 OST ee Be Eb CL AE abr","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"3独角兽兽群","sourceRow":29},{"id":"pack3_pet_0021","kind":"pack3_pet_0021","packKey":"pack3","nameZh":"卡灵犬兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/卡灵犬兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0021.png","iconMissing":false,"hintZhRaw":"ERAS\nOD sky 吵 KH 个 魔力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 £8.\nNf BBR ab :光世 & mee ny fer A 2S) OR PO OT 4 * Oe BB er an ARK te dl 2 @ Ae a","hintZhClean":"ERAS\nOD sky 吵 KH 个 魔力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 8.","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"3独角兽兽群","sourceRow":33},{"id":"pack3_pet_0022","kind":"pack3_pet_0022","packKey":"pack3","nameZh":"塔佐蠕虫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/塔佐蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0022.png","iconMissing":false,"hintZhRaw":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 ， 伤 害 番 倍 。\nNf ~ ee 1, Ok BBE RS ab 2 OSB Ys Lot eC Eee OY aN Bal Ak +524R 4c wea","hintZhClean":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 , 伤 害 番 倍 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"3独角兽兽群","sourceRow":34},{"id":"pack3_pet_0023","kind":"pack3_pet_0023","packKey":"pack3","nameZh":"招财猫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/招财猫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0023.png","iconMissing":false,"hintZhRaw":"$B UA 468\nCO 升级 时 = 立刻 获得 +2 O 攻击 和 +2 人 生命 ， 下 回合 获得 +2 〇 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 @ 生命 ， 下 回合 获得 +4 〇 金币 。\nNM} 工 zr","hintZhClean":"B UA 468\nCO 升级 时 立刻 获得 +2 O 攻击 和 +2 人 生命 , 下 回合 获得 +2 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 生命 , 下 回合 获得 +4 金币 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"3独角兽兽群","sourceRow":35},{"id":"pack3_pet_0024","kind":"pack3_pet_0024","packKey":"pack3","nameZh":"曼德拉草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/曼德拉草2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0024.png","iconMissing":false,"hintZhRaw":"页 2/:\nay 1\n阻止 能 力 激活 。","hintZhClean":"页 2/:\nay 1\n阻止 能 力 激活 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"3独角兽兽群","sourceRow":37},{"id":"pack3_pet_0025","kind":"pack3_pet_0025","packKey":"pack3","nameZh":"毛皮蹲鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/毛皮蹲鱼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintZhClean":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9fd1","sourceSheet":"3独角兽兽群","sourceRow":39},{"id":"pack3_pet_0026","kind":"pack3_pet_0026","packKey":"pack3","nameZh":"狮鹫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/狮鹫4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0026.png","iconMissing":false,"hintZhRaw":"8 页 4/¢\nCD 损坏 时 —> 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 => 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。\nSY 网 未 Ri wa FRO 2A1 9/1 DARED CRA Gh BED","hintZhClean":"8 页 4/\nCD 损坏 时 > 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 > 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"3独角兽兽群","sourceRow":43},{"id":"pack3_pet_0027","kind":"pack3_pet_0027","packKey":"pack3","nameZh":"猎头蟹","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/猎头蟹2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0027.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9dd1","sourceSheet":"3独角兽兽群","sourceRow":45},{"id":"pack3_pet_0028","kind":"pack3_pet_0028","packKey":"pack3","nameZh":"衔尾蛇","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/衔尾蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0028.png","iconMissing":false,"hintZhRaw":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +1 | 攻击 和 +1 @ 生命， 持续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +*2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\nM1) aise ns we MRIS | OR EEA oe ee? Bw tin. Ot 82 _ Ms) nb Bite EBay","hintZhClean":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +1 攻击 和 +1 生命, 持续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +*2 攻击 和 +2 全 生命 , 持 续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c68f","sourceSheet":"3独角兽兽群","sourceRow":46},{"id":"pack3_pet_0029","kind":"pack3_pet_0029","packKey":"pack3","nameZh":"骷髅狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/骷髅狗.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0029.png","iconMissing":false,"hintZhRaw":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 @ tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 Ota.\n1) eet ob OHO AEN eK RA ee) A wtin.) @ +s","hintZhClean":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 攻击 和 +1 tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 攻击 和 +1 Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9bd1","sourceSheet":"3独角兽兽群","sourceRow":47},{"id":"pack3_pet_0030","kind":"pack3_pet_0030","packKey":"pack3","nameZh":"魔力猎犬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/魔力猎犬.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0030.png","iconMissing":false,"hintZhRaw":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 ， 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,\nNS sacl wend ob KIM OS TRIS SEER CHORE es eee ames 内 本人 KRABI","hintZhClean":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 , 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"3独角兽兽群","sourceRow":48},{"id":"pack3_pet_0031","kind":"pack3_pet_0031","packKey":"pack3","nameZh":"克拉肯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/克拉肯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0031.png","iconMissing":false,"hintZhRaw":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 @ 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.\nMEY re: raed ab CESK ES ah een Ko @ +4","hintZhClean":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"3独角兽兽群","sourceRow":52},{"id":"pack3_pet_0032","kind":"pack3_pet_0032","packKey":"pack3","nameZh":"外星来客","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/外星来客2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0032.png","iconMissing":false,"hintZhRaw":"TE TQ 2/2\n受到 的 伤害 加 倍 ， 生 效 两 次 。","hintZhClean":"TE TQ 2/2\n受到 的 伤害 加 倍 , 生 效 两 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"3独角兽兽群","sourceRow":54},{"id":"pack3_pet_0033","kind":"pack3_pet_0033","packKey":"pack3","nameZh":"大鹏鸟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/大鹏鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0033.png","iconMissing":false,"hintZhRaw":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 © 魔力 。 重 复 3 次 ， 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 ， 在 前 方 伙 伴 中 逐个 分 配 。\nNf bS ol WA Ot aod (2 XK 24 KO) Ow TRB. & mee ny wor Tr ascot oO) OF ch ik KA OR","hintZhClean":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 魔力 。 重 复 3 次 , 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 , 在 前 方 伙 伴 中 逐个 分 配 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"3独角兽兽群","sourceRow":55},{"id":"pack3_pet_0034","kind":"pack3_pet_0034","packKey":"pack3","nameZh":"奇美拉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/奇美拉.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0034.png","iconMissing":false,"hintZhRaw":"ti\nOD sky = 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\nfi 和 品 下 Re 门人 一 和 个 Jonpti KE A eH e8,.) 人 wtw. @*s+","hintZhClean":"ti\nOD sky 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"3独角兽兽群","sourceRow":56},{"id":"pack3_pet_0035","kind":"pack3_pet_0035","packKey":"pack3","nameZh":"弥诺陶洛斯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/弥诺陶洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0035.png","iconMissing":false,"hintZhRaw":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +2 @ 攻击 和 +2 Ota.\nNEY 六 pmp 二 nd ea 水生 在、 en? BM wtin.2 @*+s+","hintZhClean":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"3独角兽兽群","sourceRow":57},{"id":"pack3_pet_0036","kind":"pack3_pet_0036","packKey":"pack3","nameZh":"憎恶","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/憎恶.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0036.png","iconMissing":false,"hintZhRaw":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 ， 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 | 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintZhClean":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 , 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"3独角兽兽群","sourceRow":58},{"id":"pack3_pet_0037","kind":"pack3_pet_0037","packKey":"pack3","nameZh":"沙之蠕虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/沙之蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0037.png","iconMissing":false,"hintZhRaw":"1) ZB\nDOSER > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 @ 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\nNM? =o ot at ee SM RISEAY ORI ORL ee ie. A wt. @t> see eeizeeeison","hintZhClean":"1) ZB\nDOSER > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 生命 , 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 , 效 果 最 多 持续 至 刷新 8 次 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"3独角兽兽群","sourceRow":59},{"id":"pack3_pet_0038","kind":"pack3_pet_0038","packKey":"pack3","nameZh":"独眼巨人","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独眼巨人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0038.png","iconMissing":false,"hintZhRaw":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 & BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 ， 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 & HM.\nNf 4b @2LéR e+ et Chee Fr A wee KM SAMO ree Se eo.) 会 Bh","hintZhClean":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 , 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 HM.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"3独角兽兽群","sourceRow":60},{"id":"pack3_pet_0039","kind":"pack3_pet_0039","packKey":"pack3","nameZh":"独角兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独角兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0039.png","iconMissing":false,"hintZhRaw":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 @ 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。\nNf ble OM DR SE oR om IV PO EH KY el 78.) A wHwtin.? @ += 455 (7) & Ae BS 2","hintZhClean":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"3独角兽兽群","sourceRow":61},{"id":"pack3_pet_0040","kind":"pack3_pet_0040","packKey":"pack3","nameZh":"蚁虎","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/蚁虎.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0040.png","iconMissing":false,"hintZhRaw":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 6 点 伤害 O.\nNf 合生 《生起 2323T SS Sent 3 +PMAAMA tH Lot FeaO 上 (全 合","hintZhClean":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"3独角兽兽群","sourceRow":62},{"id":"pack3_pet_0041","kind":"pack3_pet_0041","packKey":"pack3","nameZh":"吸血蝙蝠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/吸血蝙蝠.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0041.png","iconMissing":false,"hintZhRaw":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 ， 并 获得 等 量 @ 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 ， 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。\nME) sek eee EH eb BE eS wm ON teem Oe mi eel HAO","hintZhClean":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 , 并 获得 等 量 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 , 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"3独角兽兽群","sourceRow":66},{"id":"pack3_pet_0042","kind":"pack3_pet_0042","packKey":"pack3","nameZh":"坏狗狗","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/坏狗狗3.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0042.png","iconMissing":false,"hintZhRaw":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 〇 。\nfy 24 +8 4% cD eb Zoi ll co TKK A 1a /i emt aS SANEK Trea wes eresiecwe SX","hintZhClean":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"3独角兽兽群","sourceRow":69},{"id":"pack3_pet_0043","kind":"pack3_pet_0043","packKey":"pack3","nameZh":"尼斯湖水怪","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/尼斯湖水怪1.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0043.png","iconMissing":false,"hintZhRaw":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +2 @ 攻击 和 +2 O tm,\nNf BER ab 72°F —_OCa/ame) Anes Mer wee te cl Ow OM Ser Riece se we.2? A wtin.2? @ +=","hintZhClean":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +2 攻击 和 +2 O tm,","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"3独角兽兽群","sourceRow":70},{"id":"pack3_pet_0044","kind":"pack3_pet_0044","packKey":"pack3","nameZh":"智慧鲑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/智慧鲑鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0044.png","iconMissing":false,"hintZhRaw":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 @ 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 & 经 验 值 。\nME) re: Top ea CRBS EA OL Oe Te hace SB ee","hintZhClean":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 经 验 值 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"3独角兽兽群","sourceRow":72},{"id":"pack3_pet_0045","kind":"pack3_pet_0045","packKey":"pack3","nameZh":"狐妖","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狐妖.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0045.png","iconMissing":false,"hintZhRaw":"狐 妊\nDO eee = 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。\nND)? a oe et ob DSR ee te teh AY mH CES OBES ET Ok","hintZhClean":"狐 妊\nDO eee 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"3独角兽兽群","sourceRow":73},{"id":"pack3_pet_0046","kind":"pack3_pet_0046","packKey":"pack3","nameZh":"狼人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狼人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0046.png","iconMissing":false,"hintZhRaw":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 ， 获 得 +50% @ 攻击 和 全 生命 。 否 则 ， 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 ， 获 得 +100% @xtn 全 生命 。 否 则 ， 获 得 12 点 O 魔力 。\nNM) pec maar ab HSH ee ORM tno, M wt @+ es Km egies A e+","hintZhClean":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 , 获 得 +50% 攻击 和 全 生命 。 否 则 , 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 , 获 得 +100% xtn 全 生命 。 否 则 , 获 得 12 点 O 魔力 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"3独角兽兽群","sourceRow":74},{"id":"pack3_pet_0047","kind":"pack3_pet_0047","packKey":"pack3","nameZh":"红龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/红龙2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0047.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"3独角兽兽群","sourceRow":76},{"id":"pack3_pet_0048","kind":"pack3_pet_0048","packKey":"pack3","nameZh":"羊蹄鸟身龙虾","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/羊蹄鸟身龙虾2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0048.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f93","sourceSheet":"3独角兽兽群","sourceRow":78},{"id":"pack3_pet_0049","kind":"pack3_pet_0049","packKey":"pack3","nameZh":"貔貅","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/貔貅.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0049.png","iconMissing":false,"hintZhRaw":"5 tk\nCO ame = 消耗 4 点 O 魔力 ， 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 ， 下 回合 获得 +6 人 金币。\n1) exces wb KE Ame 下 站 公共 和/ ao Nex","hintZhClean":"5 tk\nCO ame 消耗 4 点 O 魔力 , 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 , 下 回合 获得 +6 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cc","sourceSheet":"3独角兽兽群","sourceRow":79},{"id":"pack3_pet_0050","kind":"pack3_pet_0050","packKey":"pack3","nameZh":"青蛙人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/青蛙人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0050.png","iconMissing":false,"hintZhRaw":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 和 +2 吉 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 @ 攻击 和 *4 二 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\nNY? op oe ty os ea 人 诈 革 共有 ”mp 二 Is @ Ht HAR OT RK HEA Ow","hintZhClean":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 攻击 和 +2 吉 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 攻击 和 *4 二 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"3独角兽兽群","sourceRow":80},{"id":"pack3_pet_0051","kind":"pack3_pet_0051","packKey":"pack3","nameZh":"不死鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/不死鸟2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0051.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"3独角兽兽群","sourceRow":85},{"id":"pack3_pet_0052","kind":"pack3_pet_0052","packKey":"pack3","nameZh":"九头蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/九头蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0052.png","iconMissing":false,"hintZhRaw":"九 头 蛇\nOQ) sre = 每 有 10 点 攻击 ， 便 召唤 一 个 5/5 的 头 。\n) CO srt = 每 有 10 点 攻击 ， 便 召唤 一 个 10/10 的 头 。\n1 men wm MHASH MMA ema","hintZhClean":"九 头 蛇\nOQ) sre 每 有 10 点 攻击 , 便 召唤 一 个 5/5 的 头 。\n) CO srt 每 有 10 点 攻击 , 便 召唤 一 个 10/10 的 头 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"3独角兽兽群","sourceRow":86},{"id":"pack3_pet_0053","kind":"pack3_pet_0053","packKey":"pack3","nameZh":"刻耳柏洛斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/刻耳柏洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0053.png","iconMissing":false,"hintZhRaw":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 —> 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。\nfy 24 +8 4% cS 7 人 AD RDER el at hi #55 $% £8 21 At BS 2‘","hintZhClean":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 > 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"3独角兽兽群","sourceRow":87},{"id":"pack3_pet_0054","kind":"pack3_pet_0054","packKey":"pack3","nameZh":"团队精神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/团队精神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0054.png","iconMissing":false,"hintZhRaw":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 @ 攻击 和 +*2 O 生命\nNY op oe Then Rt ea CESK Erol oe 257822 A wsti.? @ +s","hintZhClean":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 攻击 和 +*2 O 生命","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"3独角兽兽群","sourceRow":88},{"id":"pack3_pet_0055","kind":"pack3_pet_0055","packKey":"pack3","nameZh":"斯雷普尼尔","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/斯雷普尼尔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0055.png","iconMissing":false,"hintZhRaw":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 ， 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 ， 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.\nfront ea MEI MR w ee —Aswae.) A est","hintZhClean":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 , 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 , 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"3独角兽兽群","sourceRow":89},{"id":"pack3_pet_0056","kind":"pack3_pet_0056","packKey":"pack3","nameZh":"海蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/海蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0056.png","iconMissing":false,"hintZhRaw":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。\nNf iM Fe on 23 Ae OS Bw tote § IN — A StS A OS FM Tae ee fy Hk we","hintZhClean":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"3独角兽兽群","sourceRow":90},{"id":"pack3_pet_0057","kind":"pack3_pet_0057","packKey":"pack3","nameZh":"羽蛇神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/羽蛇神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0057.png","iconMissing":false,"hintZhRaw":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B@ 经 验 值 。 触发 2 次 。\nNM) =o ot at ea CH _ ANIME Kee eB.) BA MOH Bh P22","hintZhClean":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B 经 验 值 。 触发 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"3独角兽兽群","sourceRow":91},{"id":"pack3_pet_0058","kind":"pack3_pet_0058","packKey":"pack3","nameZh":"蝎尾狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/蝎尾狮.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0058.png","iconMissing":false,"hintZhRaw":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。\nNM) seb ome Re wD Hee","hintZhClean":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb5d1","sourceSheet":"3独角兽兽群","sourceRow":92},{"id":"pack3_pet_0059","kind":"pack3_pet_0059","packKey":"pack3","nameZh":"贝希摩斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/贝希摩斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0059.png","iconMissing":false,"hintZhRaw":"Dl #5 FF BA\nOD 回合 结束 时 > 获得 +2 @xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\n哆 回合 结束 时 > 获得 +4 | 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\nNf Fl +t Bet ea 1278. 加 十 In Fr @ += The N44 SS BWaresiwBiinni","hintZhClean":"Dl 5 FF BA\nOD 回合 结束 时 > 获得 +2 xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100,\n哆 回合 结束 时 > 获得 +4 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100,","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ac8f","sourceSheet":"3独角兽兽群","sourceRow":93},{"id":"pack3_pet_0060","kind":"pack3_pet_0060","packKey":"pack3","nameZh":"雪人","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/雪人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0060.png","iconMissing":false,"hintZhRaw":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。\nNf fal @ Tbh Re ab 77S ot Te On Ww Ell oe INRA Oo Oe OO MEO OCT OB! Sk 4 ae","hintZhClean":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cfd18f","sourceSheet":"3独角兽兽群","sourceRow":94},{"id":"pack4_pet_0001","kind":"pack4_pet_0001","packKey":"pack4","nameZh":"喜鹊","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/喜鹊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0001.png","iconMissing":false,"hintZhRaw":"rs 8S\nQO 回合 结束 时 — 花费 至 多 1 @ 〇 金币 ， 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 ， 并 在 下 回合 重新 获得 之 。\nfy fa) + RY ome TT BE 22) eos t+ Xr Kh) > SS C738","hintZhClean":"rs 8S\nQO 回合 结束 时 花费 至 多 1 金币 , 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 , 并 在 下 回合 重新 获得 之 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb7","sourceSheet":"4金毛兽群","sourceRow":2},{"id":"pack4_pet_0002","kind":"pack4_pet_0002","packKey":"pack4","nameZh":"土拨鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/土拨鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0002.png","iconMissing":false,"hintZhRaw":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。\nL3 晕厥时 -> 获得+3 喇叭。","hintZhClean":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a6","sourceSheet":"4金毛兽群","sourceRow":3},{"id":"pack4_pet_0003","kind":"pack4_pet_0003","packKey":"pack4","nameZh":"斗牛犬","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/斗牛犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0003.png","iconMissing":false,"hintZhRaw":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。\nNS sem st ob Roc PT 二","hintZhClean":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb9","sourceSheet":"4金毛兽群","sourceRow":4},{"id":"pack4_pet_0004","kind":"pack4_pet_0004","packKey":"pack4","nameZh":"旅鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/旅鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0004.png","iconMissing":false,"hintZhRaw":"旅居\nCO) 出 镶 时 =» 下 回合 获得 +1 O 金币。\n) ume => 下 回合 获得 +2 O 金币 。\nNS wee wa EKMom 8.2 f\\ os","hintZhClean":"旅居\nCO) 出 镶 时 下 回合 获得 +1 O 金币。\n) ume > 下 回合 获得 +2 O 金币 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"4金毛兽群","sourceRow":5},{"id":"pack4_pet_0005","kind":"pack4_pet_0005","packKey":"pack4","nameZh":"芋螺","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/芋螺.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0005.png","iconMissing":false,"hintZhRaw":"+\nCD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac @ te","hintZhClean":"CD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac te","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"4金毛兽群","sourceRow":6},{"id":"pack4_pet_0006","kind":"pack4_pet_0006","packKey":"pack4","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0006.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1aa","sourceSheet":"4金毛兽群","sourceRow":7},{"id":"pack4_pet_0007","kind":"pack4_pet_0007","packKey":"pack4","nameZh":"蚕蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/蚕蛾.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0007.png","iconMissing":false,"hintZhRaw":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。\nNM) hp 到 人 pe ea he. 国生 全 mM Sse BHI","hintZhClean":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb4","sourceSheet":"4金毛兽群","sourceRow":8},{"id":"pack4_pet_0008","kind":"pack4_pet_0008","packKey":"pack4","nameZh":"负鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/负鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0008.png","iconMissing":false,"hintZhRaw":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) CB 出 售 时 => 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 @ 攻击 和 +2 Ota.\nTE) ws oe et eh CHA EE he eae Ow Rt eee? Ow wtw.? @+-s","hintZhClean":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 攻击 和 +1 O tm.\n) CB 出 售 时 > 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"4金毛兽群","sourceRow":9},{"id":"pack4_pet_0009","kind":"pack4_pet_0009","packKey":"pack4","nameZh":"鹅","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0009.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 => 使 最 前 排 的 政 人 -1 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2@ 攻击 .\nNM) pes) raed ea CBee > A wt","hintZhClean":"CD 战斗 开始 时 > 使 最 前 排 的 政 人 -1 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2 攻击 .\nNM) pes) raed ea CBee > A wt","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"4金毛兽群","sourceRow":10},{"id":"pack4_pet_0010","kind":"pack4_pet_0010","packKey":"pack4","nameZh":"黑白花绒","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/黑白花绒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0010.png","iconMissing":false,"hintZhRaw":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy = 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言 〇\nfy oR ee 和 部 A miner ARs ise Lot reas ice","hintZhClean":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cb8fd1","sourceSheet":"4金毛兽群","sourceRow":11},{"id":"pack4_pet_0011","kind":"pack4_pet_0011","packKey":"pack4","nameZh":"海胆","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海胆.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0011.png","iconMissing":false,"hintZhRaw":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are = 使 前 两 个 政 人 .5 @ Em.\nNS ment wa 人 一 人 天 CAH","hintZhClean":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are 使 前 两 个 政 人 .5 Em.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#96d18f","sourceSheet":"4金毛兽群","sourceRow":14},{"id":"pack4_pet_0012","kind":"pack4_pet_0012","packKey":"pack4","nameZh":"海龟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海龟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0012.png","iconMissing":false,"hintZhRaw":"3\nD 伙伴 被 召唤 时 =» 使 其 获得 +2 @ 生命 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY? aoe ae Tmt eb CHE hac te < 站 人","hintZhClean":"D 伙伴 被 召唤 时 使 其 获得 +2 生命 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY aoe ae Tmt eb CHE hac te < 站 人","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cd8fd1","sourceSheet":"4金毛兽群","sourceRow":15},{"id":"pack4_pet_0013","kind":"pack4_pet_0013","packKey":"pack4","nameZh":"狐獴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/狐獴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0013.png","iconMissing":false,"hintZhRaw":"AM aR\nOQ 战斗 开始 时 =» 本 回合 每 花费 4 人 〇 金币 ， 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 @ 〇 金币 ， 就 使 相 邻 伙伴 获得 *2 O 攻击 ，\nfy teach TT AR ab we Honma lf) om 69K I9 404 Oe 2579.2 MA Tb 二","hintZhClean":"AM aR\nOQ 战斗 开始 时 本 回合 每 花费 4 人 金币 , 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 金币 , 就 使 相 邻 伙伴 获得 *2 O 攻击 ,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#94d18f","sourceSheet":"4金毛兽群","sourceRow":16},{"id":"pack4_pet_0014","kind":"pack4_pet_0014","packKey":"pack4","nameZh":"独角仙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/独角仙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0014.png","iconMissing":false,"hintZhRaw":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 @ 午 攻击， 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 ， 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\nEY us om tt em CHUL Ok EE ee Cech peeled 人 人 二 wt BOE ewe HeN THOR","hintZhClean":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 午 攻击, 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 , 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c68fd1","sourceSheet":"4金毛兽群","sourceRow":17},{"id":"pack4_pet_0015","kind":"pack4_pet_0015","packKey":"pack4","nameZh":"白鼬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/白鼬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0015.png","iconMissing":false,"hintZhRaw":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 ， 并 使 其 变 为 1/1。\n小 出 售 时 => 召 歇 一 个 当前 阶 的 2 级 宠物 ， 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintZhClean":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 , 并 使 其 变 为 1/1。\n小 出 售 时 > 召 歇 一 个 当前 阶 的 2 级 宠物 , 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9bd18f","sourceSheet":"4金毛兽群","sourceRow":18},{"id":"pack4_pet_0016","kind":"pack4_pet_0016","packKey":"pack4","nameZh":"蜥蜴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/蜥蜴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0016.png","iconMissing":false,"hintZhRaw":"oH OF\nCD 受伤 时 > BR—73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。\nNT) =u et ee 站 内 入 opnakss 忆 OE St ath","hintZhClean":"oH OF\nCD 受伤 时 > BR 73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c88fd1","sourceSheet":"4金毛兽群","sourceRow":19},{"id":"pack4_pet_0017","kind":"pack4_pet_0017","packKey":"pack4","nameZh":"非洲企鹅","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/非洲企鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0017.png","iconMissing":false,"hintZhRaw":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 @ 攻击 。\n) CB 购买 时 => 使 三 个 随机 伙伴 获得 +2 @ 攻击\nNM) ast ab OHO A een oe 8. ? a wt","hintZhClean":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 攻击 。\n) CB 购买 时 > 使 三 个 随机 伙伴 获得 +2 攻击","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#99d18f","sourceSheet":"4金毛兽群","sourceRow":20},{"id":"pack4_pet_0018","kind":"pack4_pet_0018","packKey":"pack4","nameZh":"鱿鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/鱿鱼1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0018.png","iconMissing":false,"hintZhRaw":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。\nL2 晕厥时 -> 花费1 喇叭使前两个敌人染墨。\nL3 晕厥时 -> 花费1 喇叭使前三个敌人染墨。","hintZhClean":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"4金毛兽群","sourceRow":21},{"id":"pack4_pet_0019","kind":"pack4_pet_0019","packKey":"pack4","nameZh":"黑颈长脚鹬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/黑颈长脚鹬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0019.png","iconMissing":false,"hintZhRaw":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。\nL3 晕厥时 -> 获得+6 喇叭。","hintZhClean":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"4金毛兽群","sourceRow":23},{"id":"pack4_pet_0020","kind":"pack4_pet_0020","packKey":"pack4","nameZh":"龟蚁","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/龟蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0020.png","iconMissing":false,"hintZhRaw":"& By\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +8 Ota.\nM1) ee wa OT Eee Otte Esl toh.) @ +e","hintZhClean":"By\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +8 Ota.","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bed18f","sourceSheet":"4金毛兽群","sourceRow":24},{"id":"pack4_pet_0021","kind":"pack4_pet_0021","packKey":"pack4","nameZh":"五彩搏鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/五彩搏鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0021.png","iconMissing":false,"hintZhRaw":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, ， 或 攻击 造成 +3 伤 害 名 ， 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintZhClean":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, , 或 攻击 造成 +3 伤 害 名 , 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a38fd1","sourceSheet":"4金毛兽群","sourceRow":29},{"id":"pack4_pet_0022","kind":"pack4_pet_0022","packKey":"pack4","nameZh":"刺尾鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/刺尾鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0022.png","iconMissing":false,"hintZhRaw":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.\n1) ect ab te) Aw BCR MORAL Hoo 8.1) @ +s","hintZhClean":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bcd18f","sourceSheet":"4金毛兽群","sourceRow":30},{"id":"pack4_pet_0023","kind":"pack4_pet_0023","packKey":"pack4","nameZh":"狒狒","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/狒狒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0023.png","iconMissing":false,"hintZhRaw":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 @xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 @ 攻击 与 + O tm.\nNf fal & 42 3 Rt ab (8: 6 24 Be BG OD FE rt RO Bb OH) * RE 2 OO) Oe OB 7B. 2 a tty = &H—.2 r) ye >","hintZhClean":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 攻击 与 + O tm.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a58fd1","sourceSheet":"4金毛兽群","sourceRow":31},{"id":"pack4_pet_0024","kind":"pack4_pet_0024","packKey":"pack4","nameZh":"珠鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/珠鸡.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0024.png","iconMissing":false,"hintZhRaw":"珠 鸡\nOO 受伤 时 = 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,\nNM) =u ps ea 2t7B.c D wn","hintZhClean":"珠 鸡\nOO 受伤 时 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bad18f","sourceSheet":"4金毛兽群","sourceRow":32},{"id":"pack4_pet_0025","kind":"pack4_pet_0025","packKey":"pack4","nameZh":"皇霸鹟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/皇霸鹟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0025.png","iconMissing":false,"hintZhRaw":"CO =ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M=a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintZhClean":"CO ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a78fd1","sourceSheet":"4金毛兽群","sourceRow":33},{"id":"pack4_pet_0026","kind":"pack4_pet_0026","packKey":"pack4","nameZh":"跳蚤","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/跳蚤2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0026.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b8d18f","sourceSheet":"4金毛兽群","sourceRow":35},{"id":"pack4_pet_0027","kind":"pack4_pet_0027","packKey":"pack4","nameZh":"飞鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/飞鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0027.png","iconMissing":false,"hintZhRaw":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。\nfy ble O84 TI eb Ar 了 sr OR EIB F 人 tte St fp) & 4e 6a 3°","hintZhClean":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a98fd1","sourceSheet":"4金毛兽群","sourceRow":36},{"id":"pack4_pet_0028","kind":"pack4_pet_0028","packKey":"pack4","nameZh":"鱼鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/鱼鹰.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0028.png","iconMissing":false,"hintZhRaw":"—\nOD say =» 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n)\n1) eee ot 力作 一 人 Dion 二 eg","hintZhClean":"OD say 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n1) eee ot 力作 一 人 Dion 二 eg","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b5d18f","sourceSheet":"4金毛兽群","sourceRow":37},{"id":"pack4_pet_0029","kind":"pack4_pet_0029","packKey":"pack4","nameZh":"麝牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/麝牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0029.png","iconMissing":false,"hintZhRaw":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 @@ 攻击 和 +4 @ 生命 ， 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2? HB wtiic Ot yz 闲 丫 公","hintZhClean":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 攻击 和 +2 全 生命 , 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 攻击 和 +4 生命 , 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2 HB wtiic Ot yz 闲 丫 公","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ac8fd1","sourceSheet":"4金毛兽群","sourceRow":38},{"id":"pack4_pet_0030","kind":"pack4_pet_0030","packKey":"pack4","nameZh":"黄鼠狼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/黄鼠狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0030.png","iconMissing":false,"hintZhRaw":"& EUR\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\n) sae 下 一 回合 获得 +1 O 金币 。\nNS men wa 下 站 全 六 f os","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9cd1","sourceSheet":"4金毛兽群","sourceRow":39},{"id":"pack4_pet_0031","kind":"pack4_pet_0031","packKey":"pack4","nameZh":"凤头鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/凤头鹦鹉.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0031.png","iconMissing":false,"hintZhRaw":"CD 购买 时 => 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 => 使 最 高 阶 的 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc @ +","hintZhClean":"CD 购买 时 > 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 > 使 最 高 阶 的 伙伴 获得 +*4 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc +","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"4金毛兽群","sourceRow":43},{"id":"pack4_pet_0032","kind":"pack4_pet_0032","packKey":"pack4","nameZh":"墨鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/墨鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0032.png","iconMissing":false,"hintZhRaw":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintZhClean":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ed1","sourceSheet":"4金毛兽群","sourceRow":45},{"id":"pack4_pet_0033","kind":"pack4_pet_0033","packKey":"pack4","nameZh":"小头鼠海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/小头鼠海豚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0033.png","iconMissing":false,"hintZhRaw":"小 头 刀 海豚\nCD sry = 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey => 获得 +100% DMN (最少 +8 OS 喇叭 ) 。\nNE) exert we 共有 cro A wn (@e2.10 DA was","hintZhClean":"小 头 刀 海豚\nCD sry 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey > 获得 +100% DMN (最少 +8 OS 喇叭 ) 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c18f","sourceSheet":"4金毛兽群","sourceRow":46},{"id":"pack4_pet_0034","kind":"pack4_pet_0034","packKey":"pack4","nameZh":"海牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0034.png","iconMissing":false,"hintZhRaw":"海牛\nDassen @ 受到 5 点 伤害 含 ， 并 使 最 近 的 前 方 伙 伴 获得 +2 @ 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 ， 并 使 最 近 的 前 方 伙伴 获得 +4 @ 攻击 与 +2 二 tH.\nNf mo +t Bee at Vc Se eH +h Eras roo ee. Aa wtc.2 Oo t=","hintZhClean":"海牛\nDassen 受到 5 点 伤害 含 , 并 使 最 近 的 前 方 伙 伴 获得 +2 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 , 并 使 最 近 的 前 方 伙伴 获得 +4 攻击 与 +2 二 tH.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"4金毛兽群","sourceRow":47},{"id":"pack4_pet_0035","kind":"pack4_pet_0035","packKey":"pack4","nameZh":"海狮","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海狮.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0035.png","iconMissing":false,"hintZhRaw":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 ， 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击， 前方 的 所 有 伙伴 获得 +*2 @ tm.\nNf Fh) > ¢t Bet ab CEE OOS Brel Oe 2378.2 A ws aa SAW eet, Pen 小 全","hintZhClean":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 , 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击, 前方 的 所 有 伙伴 获得 +*2 tm.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"4金毛兽群","sourceRow":48},{"id":"pack4_pet_0036","kind":"pack4_pet_0036","packKey":"pack4","nameZh":"箭毒蛙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/箭毒蛙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0036.png","iconMissing":false,"hintZhRaw":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.\n1 22 ea ok Rt ek EO Be rn 上 人 丰富","hintZhClean":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ad1","sourceSheet":"4金毛兽群","sourceRow":49},{"id":"pack4_pet_0037","kind":"pack4_pet_0037","packKey":"pack4","nameZh":"蛞蝓","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蛞蝓.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0037.png","iconMissing":false,"hintZhRaw":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。\nNf @ Rt ad 72 4 “6/05 ,!.63 2@ (71.03 20 > FM A 2/209 22 | OF oe)","hintZhClean":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c58f","sourceSheet":"4金毛兽群","sourceRow":50},{"id":"pack4_pet_0038","kind":"pack4_pet_0038","packKey":"pack4","nameZh":"蝠鲼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蝠鲼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0038.png","iconMissing":false,"hintZhRaw":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 ， 下 回合 获得 +2 〇 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 ， 下 回合 获得 +4 O £m.\nfy fal st BR eb INN TrSis 下 辣 全 让 ? 本 _C fom","hintZhClean":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 , 下 回合 获得 +2 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 , 下 回合 获得 +4 O m.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"4金毛兽群","sourceRow":51},{"id":"pack4_pet_0039","kind":"pack4_pet_0039","packKey":"pack4","nameZh":"隼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/隼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0039.png","iconMissing":false,"hintZhRaw":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 => 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 | | ER CL AE Bb","hintZhClean":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 > 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 ER CL AE Bb","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"4金毛兽群","sourceRow":52},{"id":"pack4_pet_0040","kind":"pack4_pet_0040","packKey":"pack4","nameZh":"高鼻羚羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/高鼻羚羊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0040.png","iconMissing":false,"hintZhRaw":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。\nL3 两个伙伴晕厥时 -> 获得+9 喇叭。","hintZhClean":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a48f","sourceSheet":"4金毛兽群","sourceRow":53},{"id":"pack4_pet_0041","kind":"pack4_pet_0041","packKey":"pack4","nameZh":"护士鲨","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/护士鲨.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0041.png","iconMissing":false,"hintZhRaw":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 ， 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 ， 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\nNf BER ab Tee sac JD mini 34 — Amp inte be cP rR TBR Tt eee aN er","hintZhClean":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 , 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 , 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbbd1","sourceSheet":"4金毛兽群","sourceRow":57},{"id":"pack4_pet_0042","kind":"pack4_pet_0042","packKey":"pack4","nameZh":"火蚁","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/火蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0042.png","iconMissing":false,"hintZhRaw":"CD Srey > 使 最 高 阶 的 伙伴 获得 @ 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 @ 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintZhClean":"CD Srey > 使 最 高 阶 的 伙伴 获得 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"4金毛兽群","sourceRow":58},{"id":"pack4_pet_0043","kind":"pack4_pet_0043","packKey":"pack4","nameZh":"狼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0043.png","iconMissing":false,"hintZhRaw":"狼\nL1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintZhClean":"L1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbdd1","sourceSheet":"4金毛兽群","sourceRow":59},{"id":"pack4_pet_0044","kind":"pack4_pet_0044","packKey":"pack4","nameZh":"猕猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/猕猴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0044.png","iconMissing":false,"hintZhRaw":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。\nMEY pe cl raed ab TI _ ACL bh Be on Se ES OIC CHET EIB DP","hintZhClean":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19f8f","sourceSheet":"4金毛兽群","sourceRow":60},{"id":"pack4_pet_0045","kind":"pack4_pet_0045","packKey":"pack4","nameZh":"白斑羚","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白斑羚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0045.png","iconMissing":false,"hintZhRaw":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。\nL3 晕厥时 -> 获得+24 喇叭。","hintZhClean":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbfd1","sourceSheet":"4金毛兽群","sourceRow":61},{"id":"pack4_pet_0046","kind":"pack4_pet_0046","packKey":"pack4","nameZh":"白鲸","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白鲸.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0046.png","iconMissing":false,"hintZhRaw":"B&F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 ， 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 ， 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。\nfy nS BE & et ab 7 6 SEE rh ot Peo ee Ot Tr OS ES R47 A Tr ae OO ERIS Sn","hintZhClean":"B F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 , 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 , 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19d8f","sourceSheet":"4金毛兽群","sourceRow":62},{"id":"pack4_pet_0047","kind":"pack4_pet_0047","packKey":"pack4","nameZh":"蓝环章鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蓝环章鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0047.png","iconMissing":false,"hintZhRaw":"监 环 章鱼\nCO) 购买 时 = 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 => 使 伙伴 获得 +2 O 攻击 和 +2 @ tH,\nfy BTR at CREEK EI AY The tein? +s","hintZhClean":"监 环 章鱼\nCO) 购买 时 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 > 使 伙伴 获得 +2 O 攻击 和 +2 tH,","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc2d1","sourceSheet":"4金毛兽群","sourceRow":63},{"id":"pack4_pet_0048","kind":"pack4_pet_0048","packKey":"pack4","nameZh":"蛇鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蛇鹫.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0048.png","iconMissing":false,"hintZhRaw":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 @ 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 @ 攻击 和 +8 Ota.\nNY =e A a ok Rt ee CBR A Es oe eo Mw tin.1) @ ts","hintZhClean":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 攻击 和 +8 Ota.\nNY e A a ok Rt ee CBR A Es oe eo Mw tin.1) ts","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"4金毛兽群","sourceRow":64},{"id":"pack4_pet_0049","kind":"pack4_pet_0049","packKey":"pack4","nameZh":"鸸鹋","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鸸鹋.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0049.png","iconMissing":false,"hintZhRaw":"mS &S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 ， 并 将 其 移动 至 最 前 排 。\nNf ae 6 BoD em Pb Cl eh CB BBR AD Ae te Ol) Oe 87.) tm Hv ier ABs is","hintZhClean":"mS S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 , 并 将 其 移动 至 最 前 排 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"4金毛兽群","sourceRow":65},{"id":"pack4_pet_0050","kind":"pack4_pet_0050","packKey":"pack4","nameZh":"鹤","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鹤.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0050.png","iconMissing":false,"hintZhRaw":"#5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 @Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 @wxs. 每 回合 生效 2 次 。\nfi 和 ae me ao ie Rt ea EEUU 4te ines Tb 二 SMS ab","hintZhClean":"5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 wxs. 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c6","sourceSheet":"4金毛兽群","sourceRow":66},{"id":"pack4_pet_0051","kind":"pack4_pet_0051","packKey":"pack4","nameZh":"天堂鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/天堂鸟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0051.png","iconMissing":false,"hintZhRaw":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 | 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。\n1? se ose mt ea CET Aino 0% 28? BO wtw.2 @t se mS Ht ab,","hintZhClean":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f9b","sourceSheet":"4金毛兽群","sourceRow":70},{"id":"pack4_pet_0052","kind":"pack4_pet_0052","packKey":"pack4","nameZh":"德国牧羊犬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/德国牧羊犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0052.png","iconMissing":false,"hintZhRaw":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 => 使 其 获得 此 宠物 50% 的 Oks, 4-4.\nNEY ab oe a 20 mt ea CHES TEI ees 人 wt tte ms","hintZhClean":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 , 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 > 使 其 获得 此 宠物 50% 的 Oks, 4-4.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c8","sourceSheet":"4金毛兽群","sourceRow":71},{"id":"pack4_pet_0053","kind":"pack4_pet_0053","packKey":"pack4","nameZh":"无齿翼龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/无齿翼龙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0053.png","iconMissing":false,"hintZhRaw":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。\nND)? op oe eR eb KO Seem woe ZITA 2¢ 12 Sf OTK 41/71 4a, 4%, FS 、| AE Be QU","hintZhClean":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f99","sourceSheet":"4金毛兽群","sourceRow":72},{"id":"pack4_pet_0054","kind":"pack4_pet_0054","packKey":"pack4","nameZh":"灰熊","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/灰熊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0054.png","iconMissing":false,"hintZhRaw":"TRAE\nQO 友 方 单位 攻击 五 次 后 @ 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.\nfi 生生 廊 吕 人 让 本 工 帮 户 天 人 入 卫 tn ein 上 人 丰富 全","hintZhClean":"TRAE\nQO 友 方 单位 攻击 五 次 后 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cb","sourceSheet":"4金毛兽群","sourceRow":73},{"id":"pack4_pet_0055","kind":"pack4_pet_0055","packKey":"pack4","nameZh":"牛羚","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牛羚1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0055.png","iconMissing":false,"hintZhRaw":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。\nEY ve es te to ey A mini cece Ot OER CL AE ab YD","hintZhClean":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f96","sourceSheet":"4金毛兽群","sourceRow":74},{"id":"pack4_pet_0056","kind":"pack4_pet_0056","packKey":"pack4","nameZh":"牡蛎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牡蛎.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0056.png","iconMissing":false,"hintZhRaw":"tt OF\nCO 出 售 时 > 获得 +3 @ 〇 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,\nNM) wee ab 证 四, of 人 公干","hintZhClean":"tt OF\nCO 出 售 时 > 获得 +3 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cd","sourceSheet":"4金毛兽群","sourceRow":76},{"id":"pack4_pet_0057","kind":"pack4_pet_0057","packKey":"pack4","nameZh":"疣猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/疣猪.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0057.png","iconMissing":false,"hintZhRaw":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) een ab ib Seem rset CBN OL oe a8. M@ wtin.2 @*=-+","hintZhClean":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +1 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f94","sourceSheet":"4金毛兽群","sourceRow":77},{"id":"pack4_pet_0058","kind":"pack4_pet_0058","packKey":"pack4","nameZh":"眼镜蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/眼镜蛇.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0058.png","iconMissing":false,"hintZhRaw":"BR $3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.\nfi 和 pmp 二 pa 入 xiinrh LCE REI SOT ENOL ie aA","hintZhClean":"BR 3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"4金毛兽群","sourceRow":78},{"id":"pack4_pet_0059","kind":"pack4_pet_0059","packKey":"pack4","nameZh":"高地牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/高地牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0059.png","iconMissing":false,"hintZhRaw":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +2 侈 MO.\nNE? rs: raed ea 2578.19 AD win) bh eee ee eee) oom oke.2 DA wn","hintZhClean":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +2 侈 MO.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"4金毛兽群","sourceRow":79},{"id":"pack4_pet_0060","kind":"pack4_pet_0060","packKey":"pack4","nameZh":"鲶鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/鲶鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0060.png","iconMissing":false,"hintZhRaw":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 一 次 ， 或 使 其 获得 +4 @ 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 两 次 ， 或 使 其 获得 +8 O tH.\nNf fal & Tbh Re ab 186 SF 24 ot BB IE OH OL 1 OY BD FD Oot Bt -人 A4- Ah — at 4% tf 257.1 @ AE am","hintZhClean":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 一 次 , 或 使 其 获得 +4 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 两 次 , 或 使 其 获得 +8 O tH.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b1d18f","sourceSheet":"4金毛兽群","sourceRow":80},{"id":"pack5_pet_0001","kind":"pack5_pet_0001","packKey":"pack5","nameZh":"几维鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/几维鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0001.png","iconMissing":false,"hintZhRaw":"LES\nCD 受伤 时 & HM > SREHORASBRMBRG+1 @ 攻击 。\n受伤 时 & 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 @ 攻击 。\n小 -\nuch @ Wet ob HBC tt ae ee. Aa wes","hintZhClean":"LES\nCD 受伤 时 HM > SREHORASBRMBRG+1 攻击 。\n受伤 时 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 攻击 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"5海星兽群","sourceRow":2},{"id":"pack5_pet_0002","kind":"pack5_pet_0002","packKey":"pack5","nameZh":"吉娃娃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/吉娃娃.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0002.png","iconMissing":false,"hintZhRaw":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。\nME) peel wae ea OH eB te Settee rh— we","hintZhClean":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"5海星兽群","sourceRow":3},{"id":"pack5_pet_0003","kind":"pack5_pet_0003","packKey":"pack5","nameZh":"家鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/家鼠2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0003.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"5海星兽群","sourceRow":5},{"id":"pack5_pet_0004","kind":"pack5_pet_0004","packKey":"pack5","nameZh":"狨猴","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/狨猴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0004.png","iconMissing":false,"hintZhRaw":"A\nCO 出 售 时 => 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintZhClean":"CO 出 售 时 > 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"5海星兽群","sourceRow":6},{"id":"pack5_pet_0005","kind":"pack5_pet_0005","packKey":"pack5","nameZh":"萤火虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/萤火虫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0005.png","iconMissing":false,"hintZhRaw":"mK Dp\nOQ 票据 时 © 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay => 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.\n1S op cnt bd MN RI HEE Tee Bae","hintZhClean":"mK Dp\nOQ 票据 时 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay > 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"5海星兽群","sourceRow":7},{"id":"pack5_pet_0006","kind":"pack5_pet_0006","packKey":"pack5","nameZh":"蜂鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蜂鸟2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0006.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"5海星兽群","sourceRow":9},{"id":"pack5_pet_0007","kind":"pack5_pet_0007","packKey":"pack5","nameZh":"蟑螂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蟑螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0007.png","iconMissing":false,"hintZhRaw":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 @ SRA.\nCB She => 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n)\n1) exer ab 7274 _ A111 om ee tt 2? BD 42m","hintZhClean":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 SRA.\nCB She > 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n1) exer ab 7274 A111 om ee tt 2 BD 42m","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"5海星兽群","sourceRow":10},{"id":"pack5_pet_0008","kind":"pack5_pet_0008","packKey":"pack5","nameZh":"雉鸡","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/雉鸡2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0008.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"5海星兽群","sourceRow":12},{"id":"pack5_pet_0009","kind":"pack5_pet_0009","packKey":"pack5","nameZh":"青蛙","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/青蛙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0009.png","iconMissing":false,"hintZhRaw":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 ， 则 互 换 其 属性 。\n) 2) 出 售 时 => 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 ， 则 互 换 其 属性 。\nEY us oe et eh AN ER ARON AR AGL OK RR KID MCR UPI are","hintZhClean":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 , 则 互 换 其 属性 。\n) 2) 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 , 则 互 换 其 属性 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"5海星兽群","sourceRow":13},{"id":"pack5_pet_0010","kind":"pack5_pet_0010","packKey":"pack5","nameZh":"鼠妇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/鼠妇1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0010.png","iconMissing":false,"hintZhRaw":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 => 转 积 两 个 免费 的 安眠 药 。\n1) wee ap MIO—AewmeHocws","hintZhClean":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 > 转 积 两 个 免费 的 安眠 药 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"5海星兽群","sourceRow":14},{"id":"pack5_pet_0011","kind":"pack5_pet_0011","packKey":"pack5","nameZh":"小飞象章鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/小飞象章鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0011.png","iconMissing":false,"hintZhRaw":"| ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 1 〇 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 2 〇 SH.\nNS areca nt wa LL CIR ASR MOR DRIO_AYC EA HEME IY Os","hintZhClean":"ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 1 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 2 SH.","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"5海星兽群","sourceRow":18},{"id":"pack5_pet_0012","kind":"pack5_pet_0012","packKey":"pack5","nameZh":"海蜇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/海蜇.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0012.png","iconMissing":false,"hintZhRaw":"9 6\nOD 伙伴 升级 时 > 获得 +1 @xsn-1 @ 生命\n) OB 伙伴 升级 时 => 获得 +2 @ 攻击 和 +2 O tm.\nNM) op oe tenet ea 2258.2 MA wstiw.? @ +s","hintZhClean":"9 6\nOD 伙伴 升级 时 > 获得 +1 xsn-1 生命\n) OB 伙伴 升级 时 > 获得 +2 攻击 和 +2 O tm.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"5海星兽群","sourceRow":19},{"id":"pack5_pet_0013","kind":"pack5_pet_0013","packKey":"pack5","nameZh":"白鸽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/白鸽.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0013.png","iconMissing":false,"hintZhRaw":"三 下\nCO eae = 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 ， 且 相应 效果 变 为 两 倍 。\n1) eee ob BIT OKHATCHTEBR Siascwerno-e","hintZhClean":"三 下\nCO eae 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 , 且 相应 效果 变 为 两 倍 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"5海星兽群","sourceRow":20},{"id":"pack5_pet_0014","kind":"pack5_pet_0014","packKey":"pack5","nameZh":"绿鬣蜥","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/绿鬣蜥.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0014.png","iconMissing":false,"hintZhRaw":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 @ HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 &@ 对 其 造成 4 点 伤害 人 @.\nMEY sek ah Tm Be ECHR ea MO BCS ROC EEED","hintZhClean":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 对 其 造成 4 点 伤害 人 .","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"5海星兽群","sourceRow":21},{"id":"pack5_pet_0015","kind":"pack5_pet_0015","packKey":"pack5","nameZh":"考拉","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/考拉2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0015.png","iconMissing":false,"hintZhRaw":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 ， 生 效 一 次 。","hintZhClean":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"5海星兽群","sourceRow":23},{"id":"pack5_pet_0016","kind":"pack5_pet_0016","packKey":"pack5","nameZh":"蝾螈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/蝾螈.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0016.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +2 @ 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn? AB wstin.2? @ ts","hintZhClean":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +2 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn AB wstin.2 ts","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"5海星兽群","sourceRow":24},{"id":"pack5_pet_0017","kind":"pack5_pet_0017","packKey":"pack5","nameZh":"豚鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/豚鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0017.png","iconMissing":false,"hintZhRaw":"豚鼠\nOO 购买 时 = 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 => BR—22/20RM.\nNM) sos ab 72°40 2/2o8E","hintZhClean":"豚鼠\nOO 购买 时 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 > BR 22/20RM.","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"5海星兽群","sourceRow":25},{"id":"pack5_pet_0018","kind":"pack5_pet_0018","packKey":"pack5","nameZh":"长尾山雀","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/长尾山雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0018.png","iconMissing":false,"hintZhRaw":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 ， 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 ， 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。\nNf 4 2¢ 2 BR ab Ff BS Teenie eee OP eS OZ eK Ia OL 45 [二 | & 4+ 869 Yr","hintZhClean":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 , 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 , 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"5海星兽群","sourceRow":26},{"id":"pack5_pet_0019","kind":"pack5_pet_0019","packKey":"pack5","nameZh":"鲈鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鲈鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0019.png","iconMissing":false,"hintZhRaw":"鲈鱼\nCD 票 挨 时 & 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 & SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 & 经 验 值 。\n1S} mens po Ws tet om CRS OT a EHR oe ER. 2 OD tH","hintZhClean":"鲈鱼\nCD 票 挨 时 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"5海星兽群","sourceRow":27},{"id":"pack5_pet_0020","kind":"pack5_pet_0020","packKey":"pack5","nameZh":"鹳","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0020.png","iconMissing":false,"hintZhRaw":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb _ RA EE NA _A CICA ER OO","hintZhClean":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb RA EE NA A CICA ER OO","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa0d1","sourceSheet":"5海星兽群","sourceRow":28},{"id":"pack5_pet_0021","kind":"pack5_pet_0021","packKey":"pack5","nameZh":"哈巴狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/哈巴狗.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0021.png","iconMissing":false,"hintZhRaw":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 & 经 验 值 。\nME) pec) wae ea CRB EO) Oe eI. BS bzw","hintZhClean":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1be8f","sourceSheet":"5海星兽群","sourceRow":32},{"id":"pack5_pet_0022","kind":"pack5_pet_0022","packKey":"pack5","nameZh":"水蛭","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水蛭.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0022.png","iconMissing":false,"hintZhRaw":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 ， 并 获得 等 量 全 生命\nNf fe) >} +t Be ab HBS EO OM Se See +7227 @ + -","hintZhClean":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 , 并 获得 等 量 全 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa3d1","sourceSheet":"5海星兽群","sourceRow":33},{"id":"pack5_pet_0023","kind":"pack5_pet_0023","packKey":"pack5","nameZh":"水豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水豚.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0023.png","iconMissing":false,"hintZhRaw":"7K BR\nCD 刷新 时 & 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 Ota.\n) 哆 刷新 时 & 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 @ 攻击 和 +2 Ota.\nNf BIS e+ @ We ht am CHET BS Ww WOE os eee the. 2? BA wtin.? @ +=","hintZhClean":"7K BR\nCD 刷新 时 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 攻击 和 +1 Ota.\n) 哆 刷新 时 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bc8f","sourceSheet":"5海星兽群","sourceRow":34},{"id":"pack5_pet_0024","kind":"pack5_pet_0024","packKey":"pack5","nameZh":"獾珈独","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/獾珈独.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0024.png","iconMissing":false,"hintZhRaw":"Ae 400 AR\nCD 剧 新 时 => 获得 +1 @ 攻击 和 +1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 => 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n1) arp ea 共有 ”mp 二 ri” Ot 这, 京 、 门人 mM SH Bee","hintZhClean":"Ae 400 AR\nCD 剧 新 时 > 获得 +1 攻击 和 +1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":35},{"id":"pack5_pet_0025","kind":"pack5_pet_0025","packKey":"pack5","nameZh":"红毛猩猩","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红毛猩猩.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 @ 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.\n1) mace sn ea HH Se Bam et wet. 和 小 全","hintZhClean":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ba8f","sourceSheet":"5海星兽群","sourceRow":36},{"id":"pack5_pet_0026","kind":"pack5_pet_0026","packKey":"pack5","nameZh":"红衣凤头鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红衣凤头鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0026.png","iconMissing":false,"hintZhRaw":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 2 〇 ) 金币 。\nfy 作证 二 Re TOLER mst ete Ooo HET ve 人 om","hintZhClean":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 , 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 , 并 使 其 价格 减 2 ) 金币 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa7d1","sourceSheet":"5海星兽群","sourceRow":37},{"id":"pack5_pet_0027","kind":"pack5_pet_0027","packKey":"pack5","nameZh":"蟾蜍","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/蟾蜍2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0027.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b88f","sourceSheet":"5海星兽群","sourceRow":39},{"id":"pack5_pet_0028","kind":"pack5_pet_0028","packKey":"pack5","nameZh":"金枪鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/金枪鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0028.png","iconMissing":false,"hintZhRaw":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 @ tm.\n) CB Bet > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\nNf Se BE Rt ae 485 MC HO 22 4 个 RAEN 4 OK ZEIBs 2 a Thy 2 2042 @ Ate &","hintZhClean":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 tm.\n) CB Bet > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"5海星兽群","sourceRow":40},{"id":"pack5_pet_0029","kind":"pack5_pet_0029","packKey":"pack5","nameZh":"食蚁兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/食蚁兽2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0029.png","iconMissing":false,"hintZhRaw":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"5海星兽群","sourceRow":42},{"id":"pack5_pet_0030","kind":"pack5_pet_0030","packKey":"pack5","nameZh":"鹤鸵","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/鹤鸵.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0030.png","iconMissing":false,"hintZhRaw":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 @@ 生命\n。 另 获得 +1 @ 攻击 ， 持 续 一 回合\n友 方 获得 草莓 时 @ R290 生命\n。 另 获得 +2 千 攻击， 持续 一 回合\n小 -\n> * Thi BER aa 28.2? @ + =\nowe. 2 a wt\nem ¢*® fs) &","hintZhClean":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 生命\n。 另 获得 +1 攻击 , 持 续 一 回合","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"5海星兽群","sourceRow":43},{"id":"pack5_pet_0031","kind":"pack5_pet_0031","packKey":"pack5","nameZh":"仙女犰狳","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/仙女犰狳2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0031.png","iconMissing":false,"hintZhRaw":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。\nNW) mma week","hintZhClean":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"5海星兽群","sourceRow":49},{"id":"pack5_pet_0032","kind":"pack5_pet_0032","packKey":"pack5","nameZh":"小丑鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/小丑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0032.png","iconMissing":false,"hintZhRaw":"小 丑 鱼\nOD REAR > 使 其 获得 +2 @ 攻击 和 +2 @ tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 @ 生命 。\nMM) +e ain ea Heme A wt. @ +2","hintZhClean":"小 丑 鱼\nOD REAR > 使 其 获得 +2 攻击 和 +2 tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"5海星兽群","sourceRow":50},{"id":"pack5_pet_0033","kind":"pack5_pet_0033","packKey":"pack5","nameZh":"暹罗猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/暹罗猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0033.png","iconMissing":false,"hintZhRaw":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 获得 +1 @ 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 黎 得 +2 人 @ FM,\nfg 站 全 广 示 Re HHA AN ee OM KER HINKBHRe he Bw. Oa","hintZhClean":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 获得 +1 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 黎 得 +2 人 FM,","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"5海星兽群","sourceRow":51},{"id":"pack5_pet_0034","kind":"pack5_pet_0034","packKey":"pack5","nameZh":"猎鹰","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/猎鹰.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0034.png","iconMissing":false,"hintZhRaw":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.\nNM) pec) wae ea 必要 AT) 生疏 1 上 个 十 全","hintZhClean":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"5海星兽群","sourceRow":52},{"id":"pack5_pet_0035","kind":"pack5_pet_0035","packKey":"pack5","nameZh":"螳螂","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/螳螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0035.png","iconMissing":false,"hintZhRaw":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, ， 并 获得 +2 @ 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.\nNM) marron ab HiRes oe een aie ae ON tee. 让 二 IF @+s","hintZhClean":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, , 并 获得 +2 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"5海星兽群","sourceRow":53},{"id":"pack5_pet_0036","kind":"pack5_pet_0036","packKey":"pack5","nameZh":"长尾灵猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/长尾灵猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0036.png","iconMissing":false,"hintZhRaw":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 ， 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 ， 使 前 两 个 敌人 2O tH.\nNM) pec) mae ea 由 中 人 向 症 parp 和 人 了 2 @+-s","hintZhClean":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 , 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 , 使 前 两 个 敌人 2O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"5海星兽群","sourceRow":54},{"id":"pack5_pet_0037","kind":"pack5_pet_0037","packKey":"pack5","nameZh":"驴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/驴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0037.png","iconMissing":false,"hintZhRaw":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。\nNS? op oe Rt ab 4 只 Fn eg 2 DT 二 IRB cl A Bd","hintZhClean":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"5海星兽群","sourceRow":55},{"id":"pack5_pet_0038","kind":"pack5_pet_0038","packKey":"pack5","nameZh":"鸭嘴兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/鸭嘴兽3.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0038.png","iconMissing":false,"hintZhRaw":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ 攻击 .\nE> us oe et em CHAE A HEN OL Ok ee. Hawt","hintZhClean":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"5海星兽群","sourceRow":58},{"id":"pack5_pet_0039","kind":"pack5_pet_0039","packKey":"pack5","nameZh":"麋鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麋鹿.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0039.png","iconMissing":false,"hintZhRaw":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。\nNf fl & 4t Bede ab CE“ en SW me BE OE OK HU eH ANASatnc Com","hintZhClean":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"5海星兽群","sourceRow":59},{"id":"pack5_pet_0040","kind":"pack5_pet_0040","packKey":"pack5","nameZh":"麻雀","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麻雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0040.png","iconMissing":false,"hintZhRaw":"FR £€\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。\nf 人 人 ee Ene Re 1/ 丰 ab ee ae oe ee ee","hintZhClean":"FR\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"5海星兽群","sourceRow":60},{"id":"pack5_pet_0041","kind":"pack5_pet_0041","packKey":"pack5","nameZh":"三角龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/三角龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0041.png","iconMissing":false,"hintZhRaw":"","hintZhClean":"","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"5海星兽群","sourceRow":64},{"id":"pack5_pet_0042","kind":"pack5_pet_0042","packKey":"pack5","nameZh":"仓鼠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/仓鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0042.png","iconMissing":false,"hintZhRaw":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。\nNM) aise ea 1B RIS OI Se","hintZhClean":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"5海星兽群","sourceRow":65},{"id":"pack5_pet_0043","kind":"pack5_pet_0043","packKey":"pack5","nameZh":"剑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/剑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0043.png","iconMissing":false,"hintZhRaw":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 〇 。\nfy te cl TT ARA ab 3 了 直人 们 加 0 了 bin 4 ise Ol OTS 二 ONIN Hs Se ON","hintZhClean":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"5海星兽群","sourceRow":66},{"id":"pack5_pet_0044","kind":"pack5_pet_0044","packKey":"pack5","nameZh":"啄木鸟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/啄木鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0044.png","iconMissing":false,"hintZhRaw":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。\nfy ta cl TT PRA eb 3 了 | 品 :FAN 下 人 二 下 -Rh 这 FF 人 1 二 As SNe ONE LOE PU ICTS","hintZhClean":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b48fd1","sourceSheet":"5海星兽群","sourceRow":67},{"id":"pack5_pet_0045","kind":"pack5_pet_0045","packKey":"pack5","nameZh":"水滴鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/水滴鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0045.png","iconMissing":false,"hintZhRaw":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B@ 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\nNf SBR ab HEIR M LA LS KH OK hi. ? BA eee ES 、| cto BOO LS MM O61 OK RIB IM oo","hintZhClean":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#add18f","sourceSheet":"5海星兽群","sourceRow":68},{"id":"pack5_pet_0046","kind":"pack5_pet_0046","packKey":"pack5","nameZh":"海星","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/海星.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0046.png","iconMissing":false,"hintZhRaw":"海星\nCD 出 镶 3 级 伙伴 时 => 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 => 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 @ 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\nfy 条 QtRi 人 Re OR BE Tre OK ee DY the en. 2 OOD OH Ot eT Se RIN miIAh we Hie","hintZhClean":"海星\nCD 出 镶 3 级 伙伴 时 > 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 > 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"5海星兽群","sourceRow":69},{"id":"pack5_pet_0047","kind":"pack5_pet_0047","packKey":"pack5","nameZh":"秃鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/秃鹫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0047.png","iconMissing":false,"hintZhRaw":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) =A ook BR ob tH _ AEN Se LCE PILI REREAD","hintZhClean":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) A ook BR ob tH AEN Se LCE PILI REREAD","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aad18f","sourceSheet":"5海星兽群","sourceRow":70},{"id":"pack5_pet_0048","kind":"pack5_pet_0048","packKey":"pack5","nameZh":"羱羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/羱羊.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0048.png","iconMissing":false,"hintZhRaw":"R=\nCD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintZhClean":"CD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"5海星兽群","sourceRow":71},{"id":"pack5_pet_0049","kind":"pack5_pet_0049","packKey":"pack5","nameZh":"鲸头鹳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鲸头鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0049.png","iconMissing":false,"hintZhRaw":"BRK #\nOQ) 回合 开始 时 => 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。\nfy 辣 们 这 hpARA ebm Ut Be ROB 8k a 10 OY te te t9.819 6 全 全","hintZhClean":"BRK\nOQ) 回合 开始 时 > 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"5海星兽群","sourceRow":72},{"id":"pack5_pet_0050","kind":"pack5_pet_0050","packKey":"pack5","nameZh":"鹈鹕","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鹈鹕1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0050.png","iconMissing":false,"hintZhRaw":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL2 战斗开始时 -> 吞噬前方两个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL3 战斗开始时 -> 吞噬前方三个草莓伙伴，并在晕厥时将其变成鲑鱼。","hintZhClean":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴,并在晕厥时将其变成鲑鱼。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"5海星兽群","sourceRow":73},{"id":"pack5_pet_0051","kind":"pack5_pet_0051","packKey":"pack5","nameZh":"剑齿虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/剑齿虎1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0051.png","iconMissing":false,"hintZhRaw":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL2 晕厥时 -> 召唤两个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL3 晕厥时 -> 召唤三个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。","hintZhClean":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸,且此宠物每受伤一次,使其获得+2 攻击和+3 生命。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"5海星兽群","sourceRow":78},{"id":"pack5_pet_0052","kind":"pack5_pet_0052","packKey":"pack5","nameZh":"棘背龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/棘背龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0052.png","iconMissing":false,"hintZhRaw":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 @ 攻击 和 *6 Ot.\nNY? aoe eR eb CRA an on oe ac BM wt. @ +s","hintZhClean":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 攻击 和 *6 Ot.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"5海星兽群","sourceRow":80},{"id":"pack5_pet_0053","kind":"pack5_pet_0053","packKey":"pack5","nameZh":"真迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/真迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0053.png","iconMissing":false,"hintZhRaw":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。\nNY? one ee teen ab CBA MM SOHO ARS a","hintZhClean":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"5海星兽群","sourceRow":81},{"id":"pack5_pet_0054","kind":"pack5_pet_0054","packKey":"pack5","nameZh":"羊驼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/羊驼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0054.png","iconMissing":false,"hintZhRaw":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 => 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintZhClean":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 > 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"5海星兽群","sourceRow":82},{"id":"pack5_pet_0055","kind":"pack5_pet_0055","packKey":"pack5","nameZh":"菊石","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/菊石2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0055.png","iconMissing":false,"hintZhRaw":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n1) ws ab HK AK SBS Le EEA","hintZhClean":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"5海星兽群","sourceRow":84},{"id":"pack5_pet_0056","kind":"pack5_pet_0056","packKey":"pack5","nameZh":"虎鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/虎鲸.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0056.png","iconMissing":false,"hintZhRaw":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。\n1) eee ob (OR MH RMO ACI COO Bw is","hintZhClean":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"5海星兽群","sourceRow":85},{"id":"pack5_pet_0057","kind":"pack5_pet_0057","packKey":"pack5","nameZh":"迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0057.png","iconMissing":false,"hintZhRaw":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 ， 使 所 有 伙伴 获得 +2 @xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 ， 使 所 有 伙伴 获得 +4 @ 攻击 和 *6 O tm.\nNf 4 2¢ ty SRS at (2 3 At te Oh tS te Bmw et 43 BR Se Os O% BSB a The 2 3020 r) ye >","hintZhClean":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 , 使 所 有 伙伴 获得 +2 xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 , 使 所 有 伙伴 获得 +4 攻击 和 *6 O tm.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"5海星兽群","sourceRow":86},{"id":"pack5_pet_0058","kind":"pack5_pet_0058","packKey":"pack5","nameZh":"食人鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/食人鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0058.png","iconMissing":false,"hintZhRaw":"RAS\nOQ 受伤 时 = 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.\nNS xt ae wa CEB Trio Bo Mbt","hintZhClean":"RAS\nOQ 受伤 时 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"5海星兽群","sourceRow":87},{"id":"pack5_pet_0059","kind":"pack5_pet_0059","packKey":"pack5","nameZh":"驯鹿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/驯鹿2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0059.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"5海星兽群","sourceRow":89},{"id":"pack5_pet_0060","kind":"pack5_pet_0060","packKey":"pack5","nameZh":"鸵鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/鸵鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0060.png","iconMissing":false,"hintZhRaw":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 @ 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。\nNS plas wa SETTAAN SEE SEM EPR ORI SE eee ORE roe eRe OE) MOH BA","hintZhClean":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":90},{"id":"pack6_pet_0001","kind":"pack6_pet_0001","packKey":"pack6","nameZh":"壁虎","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/壁虎.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0001.png","iconMissing":false,"hintZhRaw":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 ， 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 ， 获得 +4 @ 生命 。\nNM) rs: mwaoe eb Om Sic me 共有 Mts","hintZhClean":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 , 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 , 获得 +4 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"6幼犬兽群","sourceRow":2},{"id":"pack6_pet_0002","kind":"beaver","packKey":"pack6","nameZh":"河狸","nameEn":"Beaver","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/河狸.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0002.png","iconMissing":false,"hintZhRaw":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ wah.\nE> us oe et em CHAE A HEN OL Ok ee. > Hawt","hintZhClean":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 wah.","hintEn":"","attack":2,"health":2,"abilityKey":"sell_buff_attack","implStatus":"implemented","color":"#ab7d61","sourceSheet":"6幼犬兽群","sourceRow":3},{"id":"pack6_pet_0003","kind":"pack6_pet_0003","packKey":"pack6","nameZh":"瓢虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/瓢虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0003.png","iconMissing":false,"hintZhRaw":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击， 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 ， 持 续 一 回合 。\nfy rest PL a ee 让 Ie Tb 二 于 -站 人 心","hintZhClean":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击, 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 , 持 续 一 回合 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"6幼犬兽群","sourceRow":4},{"id":"pack6_pet_0004","kind":"pack6_pet_0004","packKey":"pack6","nameZh":"甲鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/甲鱼2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0004.png","iconMissing":false,"hintZhRaw":"胡桃 A 2\n屏蔽 2 点 伤害 侠 ， 生 效 一 次 。","hintZhClean":"胡桃 A 2\n屏蔽 2 点 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":6},{"id":"pack6_pet_0005","kind":"pack6_pet_0005","packKey":"pack6","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0005.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":7},{"id":"pack6_pet_0006","kind":"pack6_pet_0006","packKey":"pack6","nameZh":"蓝鸲","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蓝鸲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0006.png","iconMissing":false,"hintZhRaw":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 @ wa.\nNM) =o ot at ee O_o ow 8? A ws","hintZhClean":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 wa.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"6幼犬兽群","sourceRow":8},{"id":"pack6_pet_0007","kind":"pack6_pet_0007","packKey":"pack6","nameZh":"蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蛾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0007.png","iconMissing":false,"hintZhRaw":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 。\nME) pec) Tan ea CBS te eet ec A ws","hintZhClean":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"6幼犬兽群","sourceRow":9},{"id":"pack6_pet_0008","kind":"pack6_pet_0008","packKey":"pack6","nameZh":"雪貂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/雪貂1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0008.png","iconMissing":false,"hintZhRaw":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。\nL2 回合开始时 -> 选择一个2级的雪貂玩具。\nL3 回合开始时 -> 选择一个3级的雪貂玩具。","hintZhClean":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":10},{"id":"pack6_pet_0009","kind":"pack6_pet_0009","packKey":"pack6","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":13},{"id":"pack6_pet_0010","kind":"pack6_pet_0010","packKey":"pack6","nameZh":"龙猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/龙猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0010.png","iconMissing":false,"hintZhRaw":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 => 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。\nEY us om et em 22H _ AC ICON 2ER Dee wh He at","hintZhClean":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 > 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"6幼犬兽群","sourceRow":14},{"id":"pack6_pet_0011","kind":"pack6_pet_0011","packKey":"pack6","nameZh":"兔耳袋狸","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/兔耳袋狸2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0011.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"6幼犬兽群","sourceRow":18},{"id":"pack6_pet_0012","kind":"pack6_pet_0012","packKey":"pack6","nameZh":"单峰驼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/单峰驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0012.png","iconMissing":false,"hintZhRaw":"& le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) BOSH © 使 商店 最 左 侧 的 两 个 宠物 获得 +2 @ 攻击 和 *+*2 @O tH.\nNM marron ob CHEE Bt wm BA went. @ wtin.2 @ +s","hintZhClean":"le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 攻击 和 +1 O tm.\n) BOSH 使 商店 最 左 侧 的 两 个 宠物 获得 +2 攻击 和 *+*2 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"6幼犬兽群","sourceRow":19},{"id":"pack6_pet_0013","kind":"pack6_pet_0013","packKey":"pack6","nameZh":"山魈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/山魈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0013.png","iconMissing":false,"hintZhRaw":"LL) #5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。\nfi 和 总 区 ab ECM BY COE EIS RIX","hintZhClean":"LL) 5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"6幼犬兽群","sourceRow":20},{"id":"pack6_pet_0014","kind":"pack6_pet_0014","packKey":"pack6","nameZh":"欧洲鳇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/欧洲鳇2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0014.png","iconMissing":true,"hintZhRaw":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintZhClean":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":22},{"id":"pack6_pet_0015","kind":"pack6_pet_0015","packKey":"pack6","nameZh":"狐猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/狐猴4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0015.png","iconMissing":false,"hintZhRaw":"SBE SE 页 4/4\nCD 战斗 开始 时 —> 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。\nMEY pec) raed ea CRBS IK Ao) oe Bite tee","hintZhClean":"SBE SE 页 4/4\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":26},{"id":"pack6_pet_0016","kind":"pack6_pet_0016","packKey":"pack6","nameZh":"知更鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/知更鸟3.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0016.png","iconMissing":true,"hintZhRaw":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 ， 生 效 一 次 。","hintZhClean":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"6幼犬兽群","sourceRow":29},{"id":"pack6_pet_0017","kind":"pack6_pet_0017","packKey":"pack6","nameZh":"虎斑猫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虎斑猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0017.png","iconMissing":false,"hintZhRaw":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 ， 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 ， 持 续 一 回合 .\nME) + ee sett ob Ch A ENOL oe 2 te tems","hintZhClean":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 , 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 , 持 续 一 回合 .","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"6幼犬兽群","sourceRow":30},{"id":"pack6_pet_0018","kind":"pack6_pet_0018","packKey":"pack6","nameZh":"虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0018.png","iconMissing":false,"hintZhRaw":"oF\nCD 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ，\n) CB 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。\nfi 人 41, oe a Us om Ae am (5h pain ol Oe 2h. 2? @ +s 48 fr) & A&E Bb >","hintZhClean":"oF\nCD 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ,\n) CB 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":31},{"id":"pack6_pet_0019","kind":"pack6_pet_0019","packKey":"pack6","nameZh":"蝙蝠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/蝙蝠2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0019.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":33},{"id":"pack6_pet_0020","kind":"pack6_pet_0020","packKey":"pack6","nameZh":"金鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/金鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0020.png","iconMissing":false,"hintZhRaw":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 = 出 售 价格 加 2 O em.\nfy 全 TITTphpA ee Wt Metin f) 总 不","hintZhClean":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 出 售 价格 加 2 O em.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"6幼犬兽群","sourceRow":34},{"id":"pack6_pet_0021","kind":"pack6_pet_0021","packKey":"pack6","nameZh":"巨嘴鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/巨嘴鸟.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0021.png","iconMissing":false,"hintZhRaw":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。\nNf St > th = oS ab WOR ee) KAO ete = 6f( PTE CUM ENS BORA KAMA CK OI ee","hintZhClean":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"6幼犬兽群","sourceRow":38},{"id":"pack6_pet_0022","kind":"pack6_pet_0022","packKey":"pack6","nameZh":"戴胜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/戴胜.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0022.png","iconMissing":false,"hintZhRaw":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintZhClean":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"6幼犬兽群","sourceRow":39},{"id":"pack6_pet_0023","kind":"pack6_pet_0023","packKey":"pack6","nameZh":"热带鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/热带鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0023.png","iconMissing":false,"hintZhRaw":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 @ tH.\n) CO 回合 开始 时 => 使 相 邻 伙伴 获得 +2 O tH.\nfy fal & bet ed $6184 Oe 25782 +","hintZhClean":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 tH.\n) CO 回合 开始 时 > 使 相 邻 伙伴 获得 +2 O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"6幼犬兽群","sourceRow":40},{"id":"pack6_pet_0024","kind":"pack6_pet_0024","packKey":"pack6","nameZh":"猫头鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/猫头鹰1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0024.png","iconMissing":false,"hintZhRaw":"猫 头 应 页 1/:\nDO 回合 开始 时 © 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。\nNM marron ad TOURS el","hintZhClean":"猫 头 应 页 1/:\nDO 回合 开始 时 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"6幼犬兽群","sourceRow":41},{"id":"pack6_pet_0025","kind":"pack6_pet_0025","packKey":"pack6","nameZh":"破壳鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/破壳鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0025.png","iconMissing":false,"hintZhRaw":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 @xtH-3 O 生命 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 @ 攻击 和 +2 @ 生命 。\nNM) =o ot ee ee 人 二 是:Fona Eo oe er.) 2 ,zhe 人 让","hintZhClean":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 xtH-3 O 生命 , 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"6幼犬兽群","sourceRow":43},{"id":"pack6_pet_0026","kind":"pack6_pet_0026","packKey":"pack6","nameZh":"穿山甲","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/穿山甲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0026.png","iconMissing":false,"hintZhRaw":"Fw\nCD SRY > 如 果 有 玩具 ， 使 最 近 的 后 方 伙 伴 获 得 +*4 @ 生命 。\n小 RAKY PD 如 果 有 玩具 ， 使 最 近 的 后 方 伙伴 获得 +8 @ tm,\n1) eee eb ESI mM CRB RM Kom.) @ +s","hintZhClean":"Fw\nCD SRY > 如 果 有 玩具 , 使 最 近 的 后 方 伙 伴 获 得 +*4 生命 。\n小 RAKY PD 如 果 有 玩具 , 使 最 近 的 后 方 伙伴 获得 +8 tm,","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"6幼犬兽群","sourceRow":44},{"id":"pack6_pet_0027","kind":"pack6_pet_0027","packKey":"pack6","nameZh":"紫蛙","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/紫蛙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0027.png","iconMissing":false,"hintZhRaw":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 => 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 2 次 。\nND) aoe ae Tmt ek MOTH MMEMeA They OIRO Om SH Ab 2","hintZhClean":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"6幼犬兽群","sourceRow":45},{"id":"pack6_pet_0028","kind":"pack6_pet_0028","packKey":"pack6","nameZh":"野兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/野兔.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0028.png","iconMissing":false,"hintZhRaw":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 => 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。\nEY ver ee 和香 s 入 了 in 入 在 用 人 全 sn 性 IER Cl te aby","hintZhClean":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"6幼犬兽群","sourceRow":46},{"id":"pack6_pet_0029","kind":"pack6_pet_0029","packKey":"pack6","nameZh":"长吻鳄","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/长吻鳄2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0029.png","iconMissing":false,"hintZhRaw":"ae 页 2/4\nCD 损坏 时 => 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 => 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。\nNY 人 水 pr ea CRO NH AGL OK CEI ote","hintZhClean":"ae 页 2/4\nCD 损坏 时 > 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 > 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa0","sourceSheet":"6幼犬兽群","sourceRow":48},{"id":"pack6_pet_0030","kind":"pack6_pet_0030","packKey":"pack6","nameZh":"鼹鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/鼹鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0030.png","iconMissing":false,"hintZhRaw":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM_O1E/1 om ORD","hintZhClean":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM O1E/1 om ORD","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"6幼犬兽群","sourceRow":51},{"id":"pack6_pet_0031","kind":"pack6_pet_0031","packKey":"pack6","nameZh":"变色龙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/变色龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0031.png","iconMissing":false,"hintZhRaw":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 ， 最 高 为 1 级， 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 ， 最 高 为 2 级 ， 持 续 一 回合 。\nNM aace sn ea SHIEK Ssh BeHUR 这/ 素 _ 站 属","hintZhClean":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 , 最 高 为 1 级, 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 , 最 高 为 2 级 , 持 续 一 回合 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"6幼犬兽群","sourceRow":55},{"id":"pack6_pet_0032","kind":"pack6_pet_0032","packKey":"pack6","nameZh":"塔尔羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/塔尔羊2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0032.png","iconMissing":false,"hintZhRaw":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintZhClean":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"6幼犬兽群","sourceRow":57},{"id":"pack6_pet_0033","kind":"pack6_pet_0033","packKey":"pack6","nameZh":"幼犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/幼犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0033.png","iconMissing":false,"hintZhRaw":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。\nNM marron ab :友人 Donnnch wee","hintZhClean":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"6幼犬兽群","sourceRow":58},{"id":"pack6_pet_0034","kind":"pack6_pet_0034","packKey":"pack6","nameZh":"微生物","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/微生物2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0034.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"6幼犬兽群","sourceRow":63},{"id":"pack6_pet_0035","kind":"pack6_pet_0035","packKey":"pack6","nameZh":"杜宾犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/杜宾犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0035.png","iconMissing":false,"hintZhRaw":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 => 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 村 子 特性 。\n) C3 战斗 开始 时 = 获得 +16 O 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 醒 子 特性 。\nfy Fe cl TT AR em 13578204 TR 人 二 MP ER TOE RRO TIMOR TATED tte","hintZhClean":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 > 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 , 还 会 获得 村 子 特性 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"6幼犬兽群","sourceRow":64},{"id":"pack6_pet_0036","kind":"pack6_pet_0036","packKey":"pack6","nameZh":"毛毛虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/毛毛虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0036.png","iconMissing":false,"hintZhRaw":"毛毛 虫\nOO) 回合 开始 时 =» 获得 +1 & 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。\nfy tec] WARS eb TF HMA 1 OH OUD 二 + 8 ants 3 O watts 1 ah & wr","hintZhClean":"毛毛 虫\nOO) 回合 开始 时 获得 +1 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"6幼犬兽群","sourceRow":66},{"id":"pack6_pet_0037","kind":"pack6_pet_0037","packKey":"pack6","nameZh":"水牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/水牛.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0037.png","iconMissing":false,"hintZhRaw":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 @ 攻击 和 +4 @ 生命 ， 持 续 一 回合 .\nNY op oe am em et ae E08 ac Mwtiw.c @ te 1244 _ ms","hintZhClean":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 攻击 和 +4 生命 , 持 续 一 回合 .","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"6幼犬兽群","sourceRow":67},{"id":"pack6_pet_0038","kind":"pack6_pet_0038","packKey":"pack6","nameZh":"美洲驼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/美洲驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0038.png","iconMissing":false,"hintZhRaw":"NIE\nOQ 回合 结束 时 @ 如 果 有 空位 ， 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 ， 获 得 +2 轩 攻击 和 +4 O tH,\nfy inl &@ ¢2 DBRS a ff | Ty Sods Fe T1 Pell @ ee ee oe","hintZhClean":"NIE\nOQ 回合 结束 时 如 果 有 空位 , 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 , 获 得 +2 轩 攻击 和 +4 O tH,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cf8fd1","sourceSheet":"6幼犬兽群","sourceRow":68},{"id":"pack6_pet_0039","kind":"pack6_pet_0039","packKey":"pack6","nameZh":"鲸鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/鲸鲨.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0039.png","iconMissing":false,"hintZhRaw":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +1 O 攻击 和 +1 @@ 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH=E,\nfy Poel Lie ie Oe ee ee E22 AC et Pee Tb 十 了 ID 小 和 Cee a eet","hintZhClean":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +1 O 攻击 和 +1 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH E,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#92d18f","sourceSheet":"6幼犬兽群","sourceRow":69},{"id":"pack6_pet_0040","kind":"pack6_pet_0040","packKey":"pack6","nameZh":"龙虾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/龙虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0040.png","iconMissing":false,"hintZhRaw":"龙 是\nCD 伙伴 被 召唤 时 =D 如 果 在 战斗 外 ， 使 其 获得 +1 @ 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 ， 使 其 获得 +2 @ 攻击 和 +4 个 生命 .\nNY? aoe ae mt em Nw tecl oh Ooh he? MW wstw.ic @t+=s","hintZhClean":"龙 是\nCD 伙伴 被 召唤 时 D 如 果 在 战斗 外 , 使 其 获得 +1 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 , 使 其 获得 +2 攻击 和 +4 个 生命 .","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"6幼犬兽群","sourceRow":70},{"id":"pack6_pet_0041","kind":"pack6_pet_0041","packKey":"pack6","nameZh":"兰花螳螂","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/兰花螳螂.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0041.png","iconMissing":false,"hintZhRaw":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 ， 使 其 获得 此 宠物 40% 的 @ 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 ， 使 其 获得 此 宠物 80% 的 @ 攻击 和 OD 生命 .\n小 -\nks、 Tbk ee FIM —_ Asem CHET TRIB Swen 市 十 态 @ +=","hintZhClean":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 , 使 其 获得 此 宠物 40% 的 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 , 使 其 获得 此 宠物 80% 的 攻击 和 OD 生命 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"6幼犬兽群","sourceRow":74},{"id":"pack6_pet_0042","kind":"pack6_pet_0042","packKey":"pack6","nameZh":"山羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/山羊.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0042.png","iconMissing":false,"hintZhRaw":"虽 购买 伙伴 时 + 获得 +1 @@ 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintZhClean":"虽 购买 伙伴 时 + 获得 +1 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"6幼犬兽群","sourceRow":75},{"id":"pack6_pet_0043","kind":"pack6_pet_0043","packKey":"pack6","nameZh":"沧龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/沧龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0043.png","iconMissing":false,"hintZhRaw":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 @ 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,\nfy — EH mee om CRIA eek TA te tino OO +s","hintZhClean":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"6幼犬兽群","sourceRow":76},{"id":"pack6_pet_0044","kind":"pack6_pet_0044","packKey":"pack6","nameZh":"石头鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/石头鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0044.png","iconMissing":false,"hintZhRaw":"石头 鱼\nOQ) ket © 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。\nfy SRR? wd HEE a M1 9B KI AT mice SX","hintZhClean":"石头 鱼\nOQ) ket 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":77},{"id":"pack6_pet_0045","kind":"pack6_pet_0045","packKey":"pack6","nameZh":"美洲豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美洲豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0045.png","iconMissing":false,"hintZhRaw":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。\nEY ut acy mm ee att OER Cl cho 2s ee eee","hintZhClean":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":78},{"id":"pack6_pet_0046","kind":"pack6_pet_0046","packKey":"pack6","nameZh":"美西螈","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美西螈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0046.png","iconMissing":false,"hintZhRaw":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 @wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 @ 攻击 和 +2 二 生命。 每 回合 生效 3 次 。\nND) + + eps este ne ab HEAD 2372.2 @ wtin.2? @ += 455 f=) & Abt Bb Qi","hintZhClean":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 攻击 和 +2 二 生命。 每 回合 生效 3 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"6幼犬兽群","sourceRow":79},{"id":"pack6_pet_0047","kind":"pack6_pet_0047","packKey":"pack6","nameZh":"魟鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/魟鱼4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0047.png","iconMissing":false,"hintZhRaw":"B\n照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。\nfy tec) TT AR ad HHISETtOWMO— Aw tL tno MA ws","hintZhClean":"照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"6幼犬兽群","sourceRow":83},{"id":"pack6_pet_0048","kind":"pack6_pet_0048","packKey":"pack6","nameZh":"鳄龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鳄龟2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0048.png","iconMissing":false,"hintZhRaw":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintZhClean":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":85},{"id":"pack6_pet_0049","kind":"pack6_pet_0049","packKey":"pack6","nameZh":"鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0049.png","iconMissing":false,"hintZhRaw":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 @ 攻击 和 +2 @@ 生命 。\nNM) aaron ob CEE DOSE oe eee. A wti.? @ +s","hintZhClean":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":86},{"id":"pack6_pet_0050","kind":"pack6_pet_0050","packKey":"pack6","nameZh":"鹰","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鹰.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0050.png","iconMissing":false,"hintZhRaw":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY => 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 _RA EE _A 1/1 EBD 26","hintZhClean":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY > 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 RA EE A 1/1 EBD 26","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"6幼犬兽群","sourceRow":87},{"id":"pack6_pet_0051","kind":"pack6_pet_0051","packKey":"pack6","nameZh":"梁龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/梁龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0051.png","iconMissing":false,"hintZhRaw":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C 〇 ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 〇 金币 。 每 回合 生效 3 次 。\nfy 和 下 ot Kh) 8.2 (人 os 455 (Al) & 4 GA 2° Ar","hintZhClean":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 金币 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"6幼犬兽群","sourceRow":91},{"id":"pack6_pet_0052","kind":"pack6_pet_0052","packKey":"pack6","nameZh":"灯笼鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/灯笼鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0052.png","iconMissing":false,"hintZhRaw":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 。\n) 03 购买 时 => 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 两 次 。\nfy BH YT? Rh ab 【| dr 上 -人 了 Shik IR LAH FEE 了 TR FR] 30 a","hintZhClean":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 。\n) 03 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 两 次 。","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"6幼犬兽群","sourceRow":92},{"id":"pack6_pet_0053","kind":"pack6_pet_0053","packKey":"pack6","nameZh":"狮子鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/狮子鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0053.png","iconMissing":false,"hintZhRaw":"Wh &\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH—R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 ， 便 额外 触发 一 次 。\n1 exert od 2 _ Ahan Leto skie we ON mM BINS Me Oh et ev","hintZhClean":"Wh\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 , 便 额外 触发 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"6幼犬兽群","sourceRow":93},{"id":"pack6_pet_0054","kind":"pack6_pet_0054","packKey":"pack6","nameZh":"猫鼬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/猫鼬4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0054.png","iconMissing":false,"hintZhRaw":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。\nMEY pes) rp ea Chet BM KH Ao oe eis","hintZhClean":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":97},{"id":"pack6_pet_0055","kind":"pack6_pet_0055","packKey":"pack6","nameZh":"皮皮虾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/皮皮虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0055.png","iconMissing":false,"hintZhRaw":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ，\nMY peel wae ab HB ees LCE PIN ee we eh Ele","hintZhClean":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ,","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":98},{"id":"pack6_pet_0056","kind":"pack6_pet_0056","packKey":"pack6","nameZh":"章鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/章鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0056.png","iconMissing":false,"hintZhRaw":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.\n1) wes ab HK Amine Loe ec HEE eA","hintZhClean":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"6幼犬兽群","sourceRow":99},{"id":"pack6_pet_0057","kind":"pack6_pet_0057","packKey":"pack6","nameZh":"美洲狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/美洲狮.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe iN\n@ 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 2 级 玩具 。\nNM) ++i me wee eee Oe HOUR","hintZhClean":"Fe iN\n友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 2 级 玩具 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"6幼犬兽群","sourceRow":100},{"id":"pack6_pet_0058","kind":"pack6_pet_0058","packKey":"pack6","nameZh":"象海豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/象海豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0058.png","iconMissing":false,"hintZhRaw":"Ris\nOD 获得 特性 © 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 ， 持 续 一 回合 。 每 回合 生效 1 次 。\nNf PKB Aste ot OO 4) OV TRIB 1D a Ty 二 xz 1 @ += 4% (eh [| a 45 fr) & 4b Bb 1 AP","hintZhClean":"Ris\nOD 获得 特性 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 , 持 续 一 回合 。 每 回合 生效 1 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":101},{"id":"pack6_pet_0059","kind":"pack6_pet_0059","packKey":"pack6","nameZh":"霸王龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/霸王龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0059.png","iconMissing":false,"hintZhRaw":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 @ 攻击 和 +4 Ota.\nNM) marron abd EACH SE bee oe aie MBM wt. @+=s","hintZhClean":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 攻击 和 +4 Ota.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":102},{"id":"pack6_pet_0060","kind":"pack6_pet_0060","packKey":"pack6","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"6幼犬兽群","sourceRow":103}],"foods":[{"id":"pack1_food_0001","kind":"apple","packKey":"pack1","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"1乌龟兽群","sourceRow":13},{"id":"pack1_food_0002","kind":"honey","packKey":"pack1","nameZh":"蜂蜜","nameEn":"Honey","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/蜂蜜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0002.png","iconMissing":false,"hintZhRaw":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT @ Zi —O]/|/ME£s.","hintZhClean":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT Zi O]/ /ME s.","hintEn":"","effectKey":"summon_bee","implStatus":"implemented","placeholderBuff":1,"color":"#e0aa35","sourceSheet":"1乌龟兽群","sourceRow":14},{"id":"pack1_food_0003","kind":"pack1_food_0003","packKey":"pack1","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9adac9","sourceSheet":"1乌龟兽群","sourceRow":26},{"id":"pack1_food_0004","kind":"cupcake","packKey":"pack1","nameZh":"纸杯蛋糕","nameEn":"Cupcake","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/纸杯蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0004.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 ， 持 续 一 回合 。","hintZhClean":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 , 持 续 一 回合 。","hintEn":"","effectKey":"temp_3_3","implStatus":"implemented","placeholderBuff":1,"color":"#f29ec0","sourceSheet":"1乌龟兽群","sourceRow":27},{"id":"pack1_food_0005","kind":"meat","packKey":"pack1","nameZh":"肉骨头","nameEn":"Meat","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/肉骨头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0005.png","iconMissing":false,"hintZhRaw":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintZhClean":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintEn":"","effectKey":"perk_meat","implStatus":"implemented","placeholderBuff":1,"color":"#d66a4f","sourceSheet":"1乌龟兽群","sourceRow":28},{"id":"pack1_food_0006","kind":"garlic","packKey":"pack1","nameZh":"大蒜","nameEn":"Garlic","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/大蒜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0006.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintZhClean":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintEn":"","effectKey":"perk_garlic","implStatus":"implemented","placeholderBuff":2,"color":"#b9b3a6","sourceSheet":"1乌龟兽群","sourceRow":40},{"id":"pack1_food_0007","kind":"salad","packKey":"pack1","nameZh":"碗装沙拉","nameEn":"Salad","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/碗装沙拉.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0007.png","iconMissing":false,"hintZhRaw":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"team_random_buff_1_1","implStatus":"implemented","placeholderBuff":2,"color":"#62c26e","sourceSheet":"1乌龟兽群","sourceRow":41},{"id":"pack1_food_0008","kind":"pack1_food_0008","packKey":"pack1","nameZh":"蛋糕","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0008.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintZhClean":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9ab7","sourceSheet":"1乌龟兽群","sourceRow":42},{"id":"pack1_food_0009","kind":"canned_food","packKey":"pack1","nameZh":"食物罐头","nameEn":"Can","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/食物罐头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0009.png","iconMissing":false,"hintZhRaw":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"shop_buff_2_1","implStatus":"implemented","placeholderBuff":2,"color":"#8ea7bb","sourceSheet":"1乌龟兽群","sourceRow":55},{"id":"pack1_food_0010","kind":"pear","packKey":"pack1","nameZh":"鸭梨","nameEn":"Pear","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/鸭梨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0010.png","iconMissing":false,"hintZhRaw":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"stat_2_2","implStatus":"implemented","placeholderBuff":2,"color":"#8dc95f","sourceSheet":"1乌龟兽群","sourceRow":56},{"id":"pack1_food_0011","kind":"pack1_food_0011","packKey":"pack1","nameZh":"寿司","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/寿司.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0011.png","iconMissing":false,"hintZhRaw":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ace","sourceSheet":"1乌龟兽群","sourceRow":69},{"id":"pack1_food_0012","kind":"chocolate","packKey":"pack1","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"1乌龟兽群","sourceRow":70},{"id":"pack1_food_0013","kind":"pack1_food_0013","packKey":"pack1","nameZh":"辣椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/辣椒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintZhClean":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ad0","sourceSheet":"1乌龟兽群","sourceRow":71},{"id":"pack1_food_0014","kind":"pack1_food_0014","packKey":"pack1","nameZh":"披萨","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/披萨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0014.png","iconMissing":false,"hintZhRaw":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaab","sourceSheet":"1乌龟兽群","sourceRow":83},{"id":"pack1_food_0015","kind":"pack1_food_0015","packKey":"pack1","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0015.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aca","sourceSheet":"1乌龟兽群","sourceRow":84},{"id":"pack1_food_0016","kind":"pack1_food_0016","packKey":"pack1","nameZh":"蘑菇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/蘑菇.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0016.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintZhClean":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaa9","sourceSheet":"1乌龟兽群","sourceRow":85},{"id":"pack1_food_0017","kind":"pack1_food_0017","packKey":"pack1","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9acc","sourceSheet":"1乌龟兽群","sourceRow":86},{"id":"pack2_food_0001","kind":"pack2_food_0001","packKey":"pack2","nameZh":"大麦克香蕉","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/大麦克香蕉.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0001.png","iconMissing":false,"hintZhRaw":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta @ FH —Oseaey .","hintZhClean":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta FH Oseaey .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab5da","sourceSheet":"2濒危兽群","sourceRow":14},{"id":"pack2_food_0002","kind":"pack2_food_0002","packKey":"pack2","nameZh":"淡水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/淡水.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0002.png","iconMissing":false,"hintZhRaw":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintZhClean":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dabe9a","sourceSheet":"2濒危兽群","sourceRow":15},{"id":"pack2_food_0003","kind":"pack2_food_0003","packKey":"pack2","nameZh":"南极磷虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/南极磷虾.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0003.png","iconMissing":false,"hintZhRaw":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 ， 并 花费 1 金币 围 积 。","hintZhClean":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 , 并 花费 1 金币 围 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab7da","sourceSheet":"2濒危兽群","sourceRow":29},{"id":"pack2_food_0004","kind":"pack2_food_0004","packKey":"pack2","nameZh":"苏达斯番茄","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/苏达斯番茄.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0004.png","iconMissing":false,"hintZhRaw":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK #2278841 OCF tH.","hintZhClean":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK 2278841 OCF tH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac59a","sourceSheet":"2濒危兽群","sourceRow":30},{"id":"pack2_food_0005","kind":"pack2_food_0005","packKey":"pack2","nameZh":"鳕鱼籽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/鳕鱼籽.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0005.png","iconMissing":false,"hintZhRaw":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintZhClean":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab1da","sourceSheet":"2濒危兽群","sourceRow":31},{"id":"pack2_food_0006","kind":"pack2_food_0006","packKey":"pack2","nameZh":"吉奇红豌豆","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/吉奇红豌豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0006.png","iconMissing":false,"hintZhRaw":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintZhClean":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac39a","sourceSheet":"2濒危兽群","sourceRow":44},{"id":"pack2_food_0007","kind":"pack2_food_0007","packKey":"pack2","nameZh":"巴黎胡萝卜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/巴黎胡萝卜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0007.png","iconMissing":false,"hintZhRaw":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintZhClean":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab3da","sourceSheet":"2濒危兽群","sourceRow":45},{"id":"pack2_food_0008","kind":"pack2_food_0008","packKey":"pack2","nameZh":"白松露","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/白松露.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0008.png","iconMissing":false,"hintZhRaw":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击，并对攻击力最高的敌人发动跳跃攻击，生效一次。","hintZhClean":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击,并对攻击力最高的敌人发动跳跃攻击,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":46},{"id":"pack2_food_0009","kind":"pack2_food_0009","packKey":"pack2","nameZh":"枫糖","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/枫糖.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0009.png","iconMissing":false,"hintZhRaw":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%，且受到的伤害-50%，生效三次。","hintZhClean":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%,且受到的伤害-50%,生效三次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":59},{"id":"pack2_food_0010","kind":"pack2_food_0010","packKey":"pack2","nameZh":"香荚兰豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/香荚兰豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0010.png","iconMissing":false,"hintZhRaw":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aafda","sourceSheet":"2濒危兽群","sourceRow":60},{"id":"pack2_food_0011","kind":"pack2_food_0011","packKey":"pack2","nameZh":"鹰嘴豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/鹰嘴豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0011.png","iconMissing":false,"hintZhRaw":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 ， 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintZhClean":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 , 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac79a","sourceSheet":"2濒危兽群","sourceRow":61},{"id":"pack2_food_0012","kind":"pack2_food_0012","packKey":"pack2","nameZh":"可可豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/可可豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0012.png","iconMissing":false,"hintZhRaw":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制，生效一次。","hintZhClean":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":75},{"id":"pack2_food_0013","kind":"pack2_food_0013","packKey":"pack2","nameZh":"奥布洛诺特甜瓜","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/奥布洛诺特甜瓜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0013.png","iconMissing":false,"hintZhRaw":"BR Fi 78 15 $5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintZhClean":"BR Fi 78 15 5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":76},{"id":"pack2_food_0014","kind":"chocolate","packKey":"pack2","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0014.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"2濒危兽群","sourceRow":77},{"id":"pack2_food_0015","kind":"pack2_food_0015","packKey":"pack2","nameZh":"撒丁岛醋栗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/撒丁岛醋栗.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0015.png","iconMissing":false,"hintZhRaw":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintZhClean":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacb9a","sourceSheet":"2濒危兽群","sourceRow":88},{"id":"pack2_food_0016","kind":"pack2_food_0016","packKey":"pack2","nameZh":"犹太海枣","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/犹太海枣3.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0016.png","iconMissing":false,"hintZhRaw":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20， 生 效 一 次 。","hintZhClean":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20, 生 效 一 次 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa8da","sourceSheet":"2濒危兽群","sourceRow":91},{"id":"pack2_food_0017","kind":"pack2_food_0017","packKey":"pack2","nameZh":"白秋葵","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/白秋葵.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0017.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH#E (4N BF) PRIZFRXK (4NH—7) .","hintZhClean":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH E (4N BF) PRIZFRXK (4NH 7) .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacd9a","sourceSheet":"2濒危兽群","sourceRow":92},{"id":"pack3_food_0001","kind":"pack3_food_0001","packKey":"pack3","nameZh":"南瓜","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/南瓜.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 ， 在 偶数 回合 获得 +2 O 生命 。","hintZhClean":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 , 在 偶数 回合 获得 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c0da9a","sourceSheet":"3独角兽兽群","sourceRow":17},{"id":"pack3_food_0002","kind":"pack3_food_0002","packKey":"pack3","nameZh":"魔力药水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0002.png","iconMissing":false,"hintZhRaw":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintZhClean":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b19ada","sourceSheet":"3独角兽兽群","sourceRow":18},{"id":"pack3_food_0003","kind":"pack3_food_0003","packKey":"pack3","nameZh":"仙尘","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/仙尘.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0003.png","iconMissing":false,"hintZhRaw":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen\nny\n—v","hintZhClean":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c3da9a","sourceSheet":"3独角兽兽群","sourceRow":30},{"id":"pack3_food_0004","kind":"pack3_food_0004","packKey":"pack3","nameZh":"壁中鸡","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/壁中鸡.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0004.png","iconMissing":false,"hintZhRaw":"壁 中 鸡\n使 一 个 宠物 获得 +3 @ 攻击 和 虚弱 ®.","hintZhClean":"壁 中 鸡\n使 一 个 宠物 获得 +3 攻击 和 虚弱 .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b79ada","sourceSheet":"3独角兽兽群","sourceRow":31},{"id":"pack3_food_0005","kind":"pack3_food_0005","packKey":"pack3","nameZh":"晕厥面包","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/晕厥面包.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0005.png","iconMissing":false,"hintZhRaw":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintZhClean":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#bcda9a","sourceSheet":"3独角兽兽群","sourceRow":32},{"id":"pack3_food_0006","kind":"pack3_food_0006","packKey":"pack3","nameZh":"姜饼人","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/姜饼人.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0006.png","iconMissing":false,"hintZhRaw":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintZhClean":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b59ada","sourceSheet":"3独角兽兽群","sourceRow":49},{"id":"pack3_food_0007","kind":"pack3_food_0007","packKey":"pack3","nameZh":"美味粥","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/美味粥.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0007.png","iconMissing":false,"hintZhRaw":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintZhClean":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#beda9a","sourceSheet":"3独角兽兽群","sourceRow":50},{"id":"pack3_food_0008","kind":"pack3_food_0008","packKey":"pack3","nameZh":"青春之水","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/青春之水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0008.png","iconMissing":false,"hintZhRaw":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintZhClean":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#bb9ada","sourceSheet":"3独角兽兽群","sourceRow":51},{"id":"pack3_food_0009","kind":"pack3_food_0009","packKey":"pack3","nameZh":"变大蛋糕","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/变大蛋糕.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0009.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 O 攻击 ， 并 将 2 久 生命 转化 为 攻击 。","hintZhClean":"使 一 个 宠物 获得 +3 O 攻击 , 并 将 2 久 生命 转化 为 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b8da9a","sourceSheet":"3独角兽兽群","sourceRow":63},{"id":"pack3_food_0010","kind":"pack3_food_0010","packKey":"pack3","nameZh":"珍馐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/珍馐.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0010.png","iconMissing":false,"hintZhRaw":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H —7.","hintZhClean":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dad39a","sourceSheet":"3独角兽兽群","sourceRow":64},{"id":"pack3_food_0011","kind":"pack3_food_0011","packKey":"pack3","nameZh":"缩小水","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/缩小水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0011.png","iconMissing":false,"hintZhRaw":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 ， 并 将 2 加 攻击 转化 为 生命 。","hintZhClean":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 , 并 将 2 加 攻击 转化 为 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa2da","sourceSheet":"3独角兽兽群","sourceRow":65},{"id":"pack3_food_0012","kind":"pack3_food_0012","packKey":"pack3","nameZh":"大瓶魔力药水","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/大瓶魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0012.png","iconMissing":false,"hintZhRaw":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintZhClean":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad69a","sourceSheet":"3独角兽兽群","sourceRow":81},{"id":"pack3_food_0013","kind":"chocolate","packKey":"pack3","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0013.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"3独角兽兽群","sourceRow":82},{"id":"pack3_food_0014","kind":"pack3_food_0014","packKey":"pack3","nameZh":"魔豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/魔豆.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0014.png","iconMissing":false,"hintZhRaw":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。\nla > FOS BS 本 IEP BIS. HPHHEKRB+1ZO SF.","hintZhClean":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacf9a","sourceSheet":"3独角兽兽群","sourceRow":83},{"id":"pack3_food_0015","kind":"pack3_food_0015","packKey":"pack3","nameZh":"丰饶角","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/丰饶角.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0015.png","iconMissing":false,"hintZhRaw":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 ， 可 从 所 有 兽 群 中 选择 。","hintZhClean":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 , 可 从 所 有 兽 群 中 选择 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa6da","sourceSheet":"3独角兽兽群","sourceRow":95},{"id":"pack3_food_0016","kind":"pack3_food_0016","packKey":"pack3","nameZh":"星星糖","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/星星糖.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0016.png","iconMissing":false,"hintZhRaw":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintZhClean":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad19a","sourceSheet":"3独角兽兽群","sourceRow":96},{"id":"pack3_food_0017","kind":"pack3_food_0017","packKey":"pack3","nameZh":"长生桃","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/长生桃.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0017.png","iconMissing":false,"hintZhRaw":"KK Hk\n使 一 个 宠物 获得 +2 @ 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintZhClean":"KK Hk\n使 一 个 宠物 获得 +2 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa4da","sourceSheet":"3独角兽兽群","sourceRow":97},{"id":"pack4_food_0001","kind":"apple","packKey":"pack4","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"4金毛兽群","sourceRow":12},{"id":"pack4_food_0002","kind":"pack4_food_0002","packKey":"pack4","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ada9a","sourceSheet":"4金毛兽群","sourceRow":13},{"id":"pack4_food_0003","kind":"pack4_food_0003","packKey":"pack4","nameZh":"巧克力蛋糕","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/巧克力蛋糕.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0003.png","iconMissing":false,"hintZhRaw":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta @ 21/217 BERGHE.","hintZhClean":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta 21/217 BERGHE.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d99ada","sourceSheet":"4金毛兽群","sourceRow":25},{"id":"pack4_food_0004","kind":"pack4_food_0004","packKey":"pack4","nameZh":"樱桃","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/樱桃.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0004.png","iconMissing":false,"hintZhRaw":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM |","hintZhClean":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#a1da9a","sourceSheet":"4金毛兽群","sourceRow":26},{"id":"pack4_food_0005","kind":"pack4_food_0005","packKey":"pack4","nameZh":"白菜","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/白菜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0005.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintZhClean":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d29ada","sourceSheet":"4金毛兽群","sourceRow":27},{"id":"pack4_food_0006","kind":"pack4_food_0006","packKey":"pack4","nameZh":"无花果","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/无花果.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0006.png","iconMissing":false,"hintZhRaw":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintZhClean":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9fda9a","sourceSheet":"4金毛兽群","sourceRow":40},{"id":"pack4_food_0007","kind":"pack4_food_0007","packKey":"pack4","nameZh":"莴苣","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/莴苣.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0007.png","iconMissing":false,"hintZhRaw":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 @ 〇 攻击 和 +1 O 生命。","hintZhClean":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 攻击 和 +1 O 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#d59ada","sourceSheet":"4金毛兽群","sourceRow":41},{"id":"pack4_food_0008","kind":"pack4_food_0008","packKey":"pack4","nameZh":"鳄梨","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/鳄梨.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0008.png","iconMissing":false,"hintZhRaw":"ED\n下 一 回合 获得 +3 O 金币 。","hintZhClean":"ED\n下 一 回合 获得 +3 O 金币 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#a5da9a","sourceSheet":"4金毛兽群","sourceRow":42},{"id":"pack4_food_0009","kind":"pack4_food_0009","packKey":"pack4","nameZh":"华夫饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/华夫饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0009.png","iconMissing":false,"hintZhRaw":"华 夫 饼\n激活 宠物 的 “购买 时 ”能 力 ， 或 获得 +3 OY +H.","hintZhClean":"华 夫 饼\n激活 宠物 的 购买 时 能 力 , 或 获得 +3 OY +H.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#ce9ada","sourceSheet":"4金毛兽群","sourceRow":54},{"id":"pack4_food_0010","kind":"pack4_food_0010","packKey":"pack4","nameZh":"土豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/土豆.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0010.png","iconMissing":false,"hintZhRaw":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO\nEB BBA","hintZhClean":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9abd","sourceSheet":"4金毛兽群","sourceRow":55},{"id":"pack4_food_0011","kind":"pack4_food_0011","packKey":"pack4","nameZh":"香蕉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/香蕉.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0011.png","iconMissing":false,"hintZhRaw":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT @ ZIG nhALIMIEL.","hintZhClean":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT ZIG nhALIMIEL.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adab8","sourceSheet":"4金毛兽群","sourceRow":56},{"id":"pack4_food_0012","kind":"chocolate","packKey":"pack4","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"4金毛兽群","sourceRow":67},{"id":"pack4_food_0013","kind":"pack4_food_0013","packKey":"pack4","nameZh":"榴莲","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/榴莲.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0013.png","iconMissing":false,"hintZhRaw":"一 0 一 4 一\n榴\n连\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全\noy —, a","hintZhClean":"一 0 一 4 一\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adab6","sourceSheet":"4金毛兽群","sourceRow":68},{"id":"pack4_food_0014","kind":"melon","packKey":"pack4","nameZh":"蜜瓜","nameEn":"Melon","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/蜜瓜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintZhClean":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintEn":"","effectKey":"perk_melon","implStatus":"implemented","placeholderBuff":3,"color":"#8fdc78","sourceSheet":"4金毛兽群","sourceRow":69},{"id":"pack4_food_0015","kind":"pack4_food_0015","packKey":"pack4","nameZh":"口袋饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/口袋饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0015.png","iconMissing":false,"hintZhRaw":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap £79415 +2 +H -—7.","hintZhClean":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap 79415 +2 +H - 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adabc","sourceSheet":"4金毛兽群","sourceRow":81},{"id":"pack4_food_0016","kind":"pack4_food_0016","packKey":"pack4","nameZh":"椒盐卷饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/椒盐卷饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0016.png","iconMissing":false,"hintZhRaw":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 @ HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 ， 此 效果 翻 倍 。","hintZhClean":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 , 此 效果 翻 倍 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9abb","sourceSheet":"4金毛兽群","sourceRow":82},{"id":"pack4_food_0017","kind":"pack4_food_0017","packKey":"pack4","nameZh":"西红柿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/西红柿.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0017.png","iconMissing":false,"hintZhRaw":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta @ TRBEUMHASRPIISEEO. 4+H-—7.","hintZhClean":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta TRBEUMHASRPIISEEO. 4+H- 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaba","sourceSheet":"4金毛兽群","sourceRow":83},{"id":"pack5_food_0001","kind":"pack5_food_0001","packKey":"pack5","nameZh":"草莓","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/草莓.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac7da","sourceSheet":"5海星兽群","sourceRow":16},{"id":"pack5_food_0002","kind":"pack5_food_0002","packKey":"pack5","nameZh":"蜜桃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/蜜桃.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0002.png","iconMissing":false,"hintZhRaw":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintZhClean":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daaf9a","sourceSheet":"5海星兽群","sourceRow":17},{"id":"pack5_food_0003","kind":"pack5_food_0003","packKey":"pack5","nameZh":"炸虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/炸虾.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0003.png","iconMissing":false,"hintZhRaw":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintZhClean":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac5da","sourceSheet":"5海星兽群","sourceRow":29},{"id":"pack5_food_0004","kind":"pack5_food_0004","packKey":"pack5","nameZh":"焦糖","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/焦糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0004.png","iconMissing":false,"hintZhRaw":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖；每有一个焦糖便对生命最高的敌人造成3点伤害，生效一次。","hintZhClean":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖 每有一个焦糖便对生命最高的敌人造成3点伤害,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daa89a","sourceSheet":"5海星兽群","sourceRow":30},{"id":"pack5_food_0005","kind":"pack5_food_0005","packKey":"pack5","nameZh":"西兰花","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/西兰花.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0005.png","iconMissing":false,"hintZhRaw":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 @ 攻击 。","hintZhClean":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9acbda","sourceSheet":"5海星兽群","sourceRow":31},{"id":"pack5_food_0006","kind":"pack5_food_0006","packKey":"pack5","nameZh":"棒棒糖","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/棒棒糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0006.png","iconMissing":false,"hintZhRaw":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ，","hintZhClean":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ,","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#daaa9a","sourceSheet":"5海星兽群","sourceRow":44},{"id":"pack5_food_0007","kind":"pack5_food_0007","packKey":"pack5","nameZh":"海草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/海草2.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0007.png","iconMissing":false,"hintZhRaw":"小 海胆 页 2/7\n加 票据 时 => 使 盟 前 排 的 政 人 -4 @ 生命 。\n) ary = 使 前 两 个 政 人 .4 @ Em.\nNS} ment ob 人 一 人 天 AH","hintZhClean":"小 海胆 页 2/7\n加 票据 时 > 使 盟 前 排 的 政 人 -4 生命 。\n) ary 使 前 两 个 政 人 .4 Em.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ac9da","sourceSheet":"5海星兽群","sourceRow":46},{"id":"pack5_food_0008","kind":"pack5_food_0008","packKey":"pack5","nameZh":"火腿肠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/火腿肠.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0008.png","iconMissing":false,"hintZhRaw":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE — TT GB BP.","hintZhClean":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE TT GB BP.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dab59a","sourceSheet":"5海星兽群","sourceRow":47},{"id":"pack5_food_0009","kind":"pack5_food_0009","packKey":"pack5","nameZh":"法国面包","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/法国面包.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0009.png","iconMissing":false,"hintZhRaw":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintZhClean":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9abeda","sourceSheet":"5海星兽群","sourceRow":61},{"id":"pack5_food_0010","kind":"pack5_food_0010","packKey":"pack5","nameZh":"芝士","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/芝士.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0010.png","iconMissing":false,"hintZhRaw":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals £2 —7.","hintZhClean":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals 2 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adacd","sourceSheet":"5海星兽群","sourceRow":62},{"id":"pack5_food_0011","kind":"pear","packKey":"pack5","nameZh":"鸭梨","nameEn":"Pear","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/鸭梨.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0011.png","iconMissing":false,"hintZhRaw":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"stat_2_2","implStatus":"implemented","placeholderBuff":2,"color":"#8dc95f","sourceSheet":"5海星兽群","sourceRow":63},{"id":"pack5_food_0012","kind":"chocolate","packKey":"pack5","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"5海星兽群","sourceRow":75},{"id":"pack5_food_0013","kind":"pack5_food_0013","packKey":"pack5","nameZh":"草莓酱","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/草莓酱.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ，\nBRR o> (FREY WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ,\nBRR o> (FREY WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaa","sourceSheet":"5海星兽群","sourceRow":76},{"id":"pack5_food_0014","kind":"pack5_food_0014","packKey":"pack5","nameZh":"青椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/青椒.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0014.png","iconMissing":false,"hintZhRaw":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintZhClean":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac9","sourceSheet":"5海星兽群","sourceRow":77},{"id":"pack5_food_0015","kind":"pack5_food_0015","packKey":"pack5","nameZh":"杨桃+","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/杨桃+.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0015.png","iconMissing":false,"hintZhRaw":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintZhClean":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aac","sourceSheet":"5海星兽群","sourceRow":91},{"id":"pack5_food_0016","kind":"pack5_food_0016","packKey":"pack5","nameZh":"热狗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/热狗.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0016.png","iconMissing":false,"hintZhRaw":"热狗\n使 两 个 随机 宠物 获得 +4 @ 攻击 。","hintZhClean":"热狗\n使 两 个 随机 宠物 获得 +4 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac7","sourceSheet":"5海星兽群","sourceRow":92},{"id":"pack5_food_0017","kind":"pack5_food_0017","packKey":"pack5","nameZh":"芹菜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/芹菜.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0017.png","iconMissing":false,"hintZhRaw":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintZhClean":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaf","sourceSheet":"5海星兽群","sourceRow":93},{"id":"pack6_food_0001","kind":"apple","packKey":"pack6","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"6幼犬兽群","sourceRow":15},{"id":"pack6_food_0002","kind":"pack6_food_0002","packKey":"pack6","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9aadda","sourceSheet":"6幼犬兽群","sourceRow":16},{"id":"pack6_food_0003","kind":"pack6_food_0003","packKey":"pack6","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac69a","sourceSheet":"6幼犬兽群","sourceRow":35},{"id":"pack6_food_0004","kind":"pack6_food_0004","packKey":"pack6","nameZh":"米饭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/米饭.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0004.png","iconMissing":false,"hintZhRaw":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintZhClean":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab0da","sourceSheet":"6幼犬兽群","sourceRow":36},{"id":"pack6_food_0005","kind":"pack6_food_0005","packKey":"pack6","nameZh":"酸橙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/酸橙.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0005.png","iconMissing":false,"hintZhRaw":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintZhClean":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac49a","sourceSheet":"6幼犬兽群","sourceRow":37},{"id":"pack6_food_0006","kind":"pack6_food_0006","packKey":"pack6","nameZh":"可颂","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/可颂.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0006.png","iconMissing":false,"hintZhRaw":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintZhClean":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab2da","sourceSheet":"6幼犬兽群","sourceRow":52},{"id":"pack6_food_0007","kind":"pack6_food_0007","packKey":"pack6","nameZh":"节瓜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/节瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0007.png","iconMissing":false,"hintZhRaw":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 | te tH — 7.","hintZhClean":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 te tH 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac29a","sourceSheet":"6幼犬兽群","sourceRow":53},{"id":"pack6_food_0008","kind":"pack6_food_0008","packKey":"pack6","nameZh":"黑莓","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/黑莓.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0008.png","iconMissing":false,"hintZhRaw":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) @ wtH17@ +2.","hintZhClean":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) wtH17 +2.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab4da","sourceSheet":"6幼犬兽群","sourceRow":54},{"id":"pack6_food_0009","kind":"pack6_food_0009","packKey":"pack6","nameZh":"盐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/盐.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0009.png","iconMissing":false,"hintZhRaw":"盐\n使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintZhClean":"使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dabf9a","sourceSheet":"6幼犬兽群","sourceRow":71},{"id":"pack6_food_0010","kind":"canned_food","packKey":"pack6","nameZh":"食物罐头","nameEn":"Can","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/食物罐头.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0010.png","iconMissing":false,"hintZhRaw":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"shop_buff_2_1","implStatus":"implemented","placeholderBuff":2,"color":"#8ea7bb","sourceSheet":"6幼犬兽群","sourceRow":72},{"id":"pack6_food_0011","kind":"pack6_food_0011","packKey":"pack6","nameZh":"馅饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/馅饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0011.png","iconMissing":false,"hintZhRaw":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintZhClean":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa5da","sourceSheet":"6幼犬兽群","sourceRow":73},{"id":"pack6_food_0012","kind":"pack6_food_0012","packKey":"pack6","nameZh":"千层饼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/千层饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0012.png","iconMissing":false,"hintZhRaw":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad09a","sourceSheet":"6幼犬兽群","sourceRow":88},{"id":"pack6_food_0013","kind":"chocolate","packKey":"pack6","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0013.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"6幼犬兽群","sourceRow":89},{"id":"pack6_food_0014","kind":"pack6_food_0014","packKey":"pack6","nameZh":"柠檬","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/柠檬.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintZhClean":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#daca9a","sourceSheet":"6幼犬兽群","sourceRow":90},{"id":"pack6_food_0015","kind":"pack6_food_0015","packKey":"pack6","nameZh":"煎饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/煎饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0015.png","iconMissing":false,"hintZhRaw":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS +? @ 大 入 77 国 和 会","hintZhClean":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS + 大 入 77 国 和 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa9da","sourceSheet":"6幼犬兽群","sourceRow":104},{"id":"pack6_food_0016","kind":"pack6_food_0016","packKey":"pack6","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0016.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacc9a","sourceSheet":"6幼犬兽群","sourceRow":105},{"id":"pack6_food_0017","kind":"pack6_food_0017","packKey":"pack6","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa7da","sourceSheet":"6幼犬兽群","sourceRow":106}],"indexes":{"petByKind":{"otter":{"id":"pack1_pet_0001","kind":"otter","packKey":"pack1","nameZh":"水獭","nameEn":"Otter","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/水獭.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0001.png","iconMissing":false,"hintZhRaw":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 @ 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命\nNM) sos ab HO Amen oe ee.) @ +a","hintZhClean":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命","hintEn":"","attack":1,"health":2,"abilityKey":"buy_buff_random_shop_pet","implStatus":"implemented","color":"#8f9fc2","sourceSheet":"1乌龟兽群","sourceRow":2},"beaver":{"id":"pack1_pet_0002","kind":"beaver","packKey":"pack1","nameZh":"河狸","nameEn":"Beaver","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/河狸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0002.png","iconMissing":false,"hintZhRaw":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ wah.\nE> us oe et em CHAE A HEN OL Ok ee. > Hawt","hintZhClean":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 wah.","hintEn":"","attack":2,"health":2,"abilityKey":"sell_buff_attack","implStatus":"implemented","color":"#ab7d61","sourceSheet":"1乌龟兽群","sourceRow":3},"pack1_pet_0003":{"id":"pack1_pet_0003","kind":"pack1_pet_0003","packKey":"pack1","nameZh":"猪","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0003.png","iconMissing":false,"hintZhRaw":"猪\nCO) unmet =» 获得 +1 O 金币 。\n) 2 出 售 时 => 获得 +*2 〇 £m.\n1S wees wa IB.) os","hintZhClean":"CO) unmet 获得 +1 O 金币 。\n) 2 出 售 时 > 获得 +*2 m.\n1S wees wa IB.) os","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"1乌龟兽群","sourceRow":4},"ant":{"id":"pack1_pet_0004","kind":"ant","packKey":"pack1","nameZh":"蚂蚁","nameEn":"Ant","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚂蚁.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0004.png","iconMissing":false,"hintZhRaw":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB wet => 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB wet > 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":2,"health":1,"abilityKey":"faint_buff_random_ally","implStatus":"implemented","color":"#d98f4e","sourceSheet":"1乌龟兽群","sourceRow":5},"mosquito":{"id":"pack1_pet_0005","kind":"mosquito","packKey":"pack1","nameZh":"蚊子","nameEn":"Mosquito","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚊子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0005.png","iconMissing":false,"hintZhRaw":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.\nNM) pes) mae ea HO Aminss Loe SEED","hintZhClean":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.","hintEn":"","attack":2,"health":2,"abilityKey":"start_ping_enemy","implStatus":"implemented","color":"#8a7ef2","sourceSheet":"1乌龟兽群","sourceRow":6},"cricket":{"id":"pack1_pet_0006","kind":"cricket","packKey":"pack1","nameZh":"蛐蛐","nameEn":"Cricket","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蛐蛐.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0006.png","iconMissing":false,"hintZhRaw":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。\nL3 晕厥时 -> 召唤一个3/3的蟋蟀。","hintZhClean":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_summon_zombie","implStatus":"implemented","color":"#8ac95f","sourceSheet":"1乌龟兽群","sourceRow":7},"horse":{"id":"pack1_pet_0007","kind":"horse","packKey":"pack1","nameZh":"马","nameEn":"Horse","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0007.png","iconMissing":false,"hintZhRaw":"oO\nOD 伙伴 被 召唤 时 =» 使 其 获得 +1 @ 攻击 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 @ 攻击， 持续 一 回合 。\nNY a oe ah Tom et ea CHEE. Awe tte 站 人","hintZhClean":"oO\nOD 伙伴 被 召唤 时 使 其 获得 +1 攻击 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":1,"abilityKey":"friend_summoned_attack","implStatus":"implemented","color":"#af8868","sourceSheet":"1乌龟兽群","sourceRow":8},"fish":{"id":"pack1_pet_0008","kind":"fish","packKey":"pack1","nameZh":"鱼","nameEn":"Fish","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0008.png","iconMissing":false,"hintZhRaw":"鱼\nCD 升级 时 => 使 两 个 伙伴 获得 +1 @ 攻击 和 +1 Otte.\n) 鸣 升级 时 => 使 两 个 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNY zor,","hintZhClean":"CD 升级 时 > 使 两 个 伙伴 获得 +1 攻击 和 +1 Otte.\n) 鸣 升级 时 > 使 两 个 伙伴 获得 +2 攻击 和 +2 Ota.\nNY zor,","hintEn":"","attack":2,"health":3,"abilityKey":"level_buff_team","implStatus":"implemented","color":"#72b8ea","sourceSheet":"1乌龟兽群","sourceRow":9},"pack1_pet_0009":{"id":"pack1_pet_0009","kind":"pack1_pet_0009","packKey":"pack1","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"1乌龟兽群","sourceRow":10},"pack1_pet_0010":{"id":"pack1_pet_0010","kind":"pack1_pet_0010","packKey":"pack1","nameZh":"鸽子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸽子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0010.png","iconMissing":false,"hintZhRaw":"面包 局\n使 一 个 宠物 获得 +1 @ KH.","hintZhClean":"面包 局\n使 一 个 宠物 获得 +1 KH.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"1乌龟兽群","sourceRow":12},"pack1_pet_0011":{"id":"pack1_pet_0011","kind":"pack1_pet_0011","packKey":"pack1","nameZh":"刺猬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/刺猬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0011.png","iconMissing":false,"hintZhRaw":"RI) 48\nOD sry =o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary => 对 所 有 宠物 造成 4 点 伤害 O.\n1) exci ob HEL See ce Hea","hintZhClean":"RI) 48\nOD sry o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary > 对 所 有 宠物 造成 4 点 伤害 O.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"1乌龟兽群","sourceRow":15},"swan":{"id":"pack1_pet_0012","kind":"swan","packKey":"pack1","nameZh":"天鹅","nameEn":"Swan","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/天鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0012.png","iconMissing":false,"hintZhRaw":"F FS\nOQ 回合 开始 时 =» 获得 +1 〇 人 金币 。\n) OH 回合 开始 时 > 获得 +2 〇 mh.\n1","hintZhClean":"F FS\nOQ 回合 开始 时 获得 +1 人 金币 。\n) OH 回合 开始 时 > 获得 +2 mh.","hintEn":"","attack":1,"health":3,"abilityKey":"start_turn_gain_gold","implStatus":"implemented","color":"#e3f3ff","sourceSheet":"1乌龟兽群","sourceRow":16},"peacock":{"id":"pack1_pet_0013","kind":"peacock","packKey":"pack1","nameZh":"孔雀","nameEn":"Peacock","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/孔雀.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0013.png","iconMissing":false,"hintZhRaw":"4L€\nDO 受伤 时 = 获得 +3 @ 攻击 。\n» 3 受伤 时 => 获得 +6 @ wis.\nNM) =u et ob 证 有 QT 二","hintZhClean":"4L\nDO 受伤 时 获得 +3 攻击 。\n3 受伤 时 > 获得 +6 wis.","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_gain_attack","implStatus":"implemented","color":"#76b7c2","sourceSheet":"1乌龟兽群","sourceRow":17},"flamingo":{"id":"pack1_pet_0014","kind":"flamingo","packKey":"pack1","nameZh":"火烈鸟","nameEn":"Flamingo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/火烈鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0014.png","iconMissing":false,"hintZhRaw":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 @ 攻击 和 +2 O 生命\n1) eer ob CHB A LC Hoe ee. ? A wtin.? @ +s","hintZhClean":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 攻击 和 +2 O 生命","hintEn":"","attack":3,"health":2,"abilityKey":"faint_buff_rear","implStatus":"implemented","color":"#f08da8","sourceSheet":"1乌龟兽群","sourceRow":18},"pack1_pet_0015":{"id":"pack1_pet_0015","kind":"pack1_pet_0015","packKey":"pack1","nameZh":"蜗牛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜗牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0015.png","iconMissing":false,"hintZhRaw":"Om\nDOSER > 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +2 @ 攻击 。\nNf Fl > +t BR ab ON aw Fete cl tee BR LAS ee ow ee. Aa ws","hintZhClean":"Om\nDOSER > 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +2 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f8fd1","sourceSheet":"1乌龟兽群","sourceRow":19},"pack1_pet_0016":{"id":"pack1_pet_0016","kind":"pack1_pet_0016","packKey":"pack1","nameZh":"蜘蛛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜘蛛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0016.png","iconMissing":false,"hintZhRaw":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme => 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\n)\nNE oe ret ea 724 _ AC ICA ERIM Soe","hintZhClean":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme > 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\nNE oe ret ea 724 AC ICA ERIM Soe","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ce8f","sourceSheet":"1乌龟兽群","sourceRow":20},"pack1_pet_0017":{"id":"pack1_pet_0017","kind":"pack1_pet_0017","packKey":"pack1","nameZh":"螃蟹","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/螃蟹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0017.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo @ ts","hintZhClean":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo ts","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f91d1","sourceSheet":"1乌龟兽群","sourceRow":21},"pack1_pet_0018":{"id":"pack1_pet_0018","kind":"pack1_pet_0018","packKey":"pack1","nameZh":"蠕虫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蠕虫2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0018.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"1乌龟兽群","sourceRow":23},"kangaroo":{"id":"pack1_pet_0019","kind":"kangaroo","packKey":"pack1","nameZh":"袋鼠","nameEn":"Kangaroo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/袋鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0019.png","iconMissing":false,"hintZhRaw":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n» 3 前 方 伙 伴 攻击 时 > RG2O@ 攻击 和 +2 Ota.\n1) ase aot te ab 2078.2 Mw tin. @ +s","hintZhClean":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n3 前 方 伙 伴 攻击 时 > RG2O 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"behind_attack_gain","implStatus":"implemented","color":"#c58c42","sourceSheet":"1乌龟兽群","sourceRow":24},"pack1_pet_0020":{"id":"pack1_pet_0020","kind":"pack1_pet_0020","packKey":"pack1","nameZh":"鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0020.png","iconMissing":false,"hintZhRaw":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY => 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintZhClean":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY > 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#938fd1","sourceSheet":"1乌龟兽群","sourceRow":25},"pack1_pet_0021":{"id":"pack1_pet_0021","kind":"pack1_pet_0021","packKey":"pack1","nameZh":"公牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/公牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0021.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ced18f","sourceSheet":"1乌龟兽群","sourceRow":30},"rabbit":{"id":"pack1_pet_0022","kind":"rabbit","packKey":"pack1","nameZh":"家兔","nameEn":"Rabbit","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/家兔.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0022.png","iconMissing":false,"hintZhRaw":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。\nMY + ene te ae ee ea 8.2 国生 全 mM SH Bb","hintZhClean":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"friend_eat_bonus_health","implStatus":"implemented","color":"#f5f0f7","sourceSheet":"1乌龟兽群","sourceRow":31},"pack1_pet_0023":{"id":"pack1_pet_0023","kind":"pack1_pet_0023","packKey":"pack1","nameZh":"海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/海豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0023.png","iconMissing":false,"hintZhRaw":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。\nNM) pe cl mae ea HS BIS LEA EERO th HOI","hintZhClean":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d0d18f","sourceSheet":"1乌龟兽群","sourceRow":32},"dodo":{"id":"pack1_pet_0024","kind":"dodo","packKey":"pack1","nameZh":"渡渡鸟","nameEn":"Dodo","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/渡渡鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0024.png","iconMissing":false,"hintZhRaw":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 @ 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 @ wai.\nMEY pes) rae ea CRBS OSE 6) Oe TEI ee eno 如 十","hintZhClean":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 wai.","hintEn":"","attack":2,"health":3,"abilityKey":"start_battle_buff_friend_ahead_attack","implStatus":"implemented","color":"#d7ad7b","sourceSheet":"1乌龟兽群","sourceRow":33},"pack1_pet_0025":{"id":"pack1_pet_0025","kind":"pack1_pet_0025","packKey":"pack1","nameZh":"狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/狗.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0025.png","iconMissing":false,"hintZhRaw":"虽 伙伴 被 召唤 时 =» 获得 +2 全 攻击 和 +1 @@ 生命 ， 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 @ 攻击 和 +2 二 生命 ， 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2? @ te 二 ms","hintZhClean":"虽 伙伴 被 召唤 时 获得 +2 全 攻击 和 +1 生命 , 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 攻击 和 +2 二 生命 , 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2 te 二 ms","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb8","sourceSheet":"1乌龟兽群","sourceRow":34},"pack1_pet_0026":{"id":"pack1_pet_0026","kind":"pack1_pet_0026","packKey":"pack1","nameZh":"獾","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0026.png","iconMissing":false,"hintZhRaw":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintZhClean":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a7","sourceSheet":"1乌龟兽群","sourceRow":35},"pack1_pet_0027":{"id":"pack1_pet_0027","kind":"pack1_pet_0027","packKey":"pack1","nameZh":"绵羊","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/绵羊.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0027.png","iconMissing":false,"hintZhRaw":"£8\nCO sey = 召唤 两 只 2/2 的 公 羊 。\n) CB amy => 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintZhClean":"CO sey 召唤 两 只 2/2 的 公 羊 。\n) CB amy > 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ccd18f","sourceSheet":"1乌龟兽群","sourceRow":36},"pack1_pet_0028":{"id":"pack1_pet_0028","kind":"pack1_pet_0028","packKey":"pack1","nameZh":"象","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/象.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0028.png","iconMissing":false,"hintZhRaw":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintZhClean":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ae","sourceSheet":"1乌龟兽群","sourceRow":37},"giraffe":{"id":"pack1_pet_0029","kind":"giraffe","packKey":"pack1","nameZh":"长颈鹿","nameEn":"Giraffe","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/长颈鹿.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0029.png","iconMissing":false,"hintZhRaw":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 @ tH.\nMW aaron ob BMH AS Howe.) A wstm.) @t+s","hintZhClean":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 攻击 和 +1 tH.","hintEn":"","attack":2,"health":4,"abilityKey":"end_turn_buff_friend_ahead","implStatus":"implemented","color":"#e8b85e","sourceSheet":"1乌龟兽群","sourceRow":38},"camel":{"id":"pack1_pet_0030","kind":"camel","packKey":"pack1","nameZh":"骆驼","nameEn":"Camel","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/骆驼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0030.png","iconMissing":false,"hintZhRaw":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 @ 攻击 和 +2 O tm.\n) 0B 受伤 时 => 使 最 近 的 后 方 伙伴 获得 +*2 @ 攻击 和 +4 Ota.\n1) =u et ea CRBS Ks oe ee. ? A wtiw.c @ts","hintZhClean":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 攻击 和 +2 O tm.\n) 0B 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +*2 攻击 和 +4 Ota.\n1) u et ea CRBS Ks oe ee. A wtiw.c ts","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_buff_rear","implStatus":"implemented","color":"#d1ba75","sourceSheet":"1乌龟兽群","sourceRow":39},"turtle":{"id":"pack1_pet_0031","kind":"turtle","packKey":"pack1","nameZh":"乌龟","nameEn":"Turtle","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/乌龟2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0031.png","iconMissing":false,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_give_melon_friend_behind","implStatus":"implemented","color":"#6aaa77","sourceSheet":"1乌龟兽群","sourceRow":44},"penguin":{"id":"pack1_pet_0032","kind":"penguin","packKey":"pack1","nameZh":"企鹅","nameEn":"Penguin","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/企鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0032.png","iconMissing":false,"hintZhRaw":"TE #S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNM) 中 全 本 wp abd CHAR bebe oe 8.2? A wtin.2 @*=s+","hintZhClean":"TE S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":2,"abilityKey":"end_turn_buff_level2_friends","implStatus":"implemented","color":"#5d7d9f","sourceSheet":"1乌龟兽群","sourceRow":45},"pack1_pet_0033":{"id":"pack1_pet_0033","kind":"pack1_pet_0033","packKey":"pack1","nameZh":"松鼠","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/松鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0033.png","iconMissing":false,"hintZhRaw":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 =» 使 商店 所 有 食物 价格 减 2 O 金币 。\nfy fal =» Tbh ee CS FEE GE Te er ee ere fr Ooms","hintZhClean":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 使 商店 所 有 食物 价格 减 2 O 金币 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"1乌龟兽群","sourceRow":46},"pack1_pet_0034":{"id":"pack1_pet_0034","kind":"pack1_pet_0034","packKey":"pack1","nameZh":"河豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0034.png","iconMissing":false,"hintZhRaw":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 => 对 一 个 随机 敌人 造成 6 点 伤害 O.\nNM) =u et ea 个 tin Loe PORE ae","hintZhClean":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 > 对 一 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"1乌龟兽群","sourceRow":47},"pack1_pet_0035":{"id":"pack1_pet_0035","kind":"pack1_pet_0035","packKey":"pack1","nameZh":"河马","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0035.png","iconMissing":false,"hintZhRaw":"7a] LS\nCD 击 个 时 > 获得 +3 @ 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey => 获得 +6 @ 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。\nE> et em 7EIB 6 A he tn OD mS el HAH II","hintZhClean":"7a] LS\nCD 击 个 时 > 获得 +3 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey > 获得 +6 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"1乌龟兽群","sourceRow":48},"pack1_pet_0036":{"id":"pack1_pet_0036","kind":"pack1_pet_0036","packKey":"pack1","nameZh":"臭鼬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/臭鼬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0036.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% @ 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. @t+=-","hintZhClean":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. t+ -","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"1乌龟兽群","sourceRow":49},"pack1_pet_0037":{"id":"pack1_pet_0037","kind":"pack1_pet_0037","packKey":"pack1","nameZh":"野牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/野牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0037.png","iconMissing":false,"hintZhRaw":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +2 全 攻击 和 +4 Ota.\nNY = om ot Ot oe IN Pee ee Re oe. Hwtin.c @ ts","hintZhClean":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +2 全 攻击 和 +4 Ota.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"1乌龟兽群","sourceRow":50},"pack1_pet_0038":{"id":"pack1_pet_0038","kind":"pack1_pet_0038","packKey":"pack1","nameZh":"鲸","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鲸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0038.png","iconMissing":false,"hintZhRaw":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 ， 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 ， 并 在 量 磋 后 将 其 作为 2 级 吐出 ，\nNM? pec race ab SBMS hi oR YL Se HrURM WD","hintZhClean":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 , 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 , 并 在 量 磋 后 将 其 作为 2 级 吐出 ,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f92","sourceSheet":"1乌龟兽群","sourceRow":51},"pack1_pet_0039":{"id":"pack1_pet_0039","kind":"pack1_pet_0039","packKey":"pack1","nameZh":"鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹦鹉.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0039.png","iconMissing":false,"hintZhRaw":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 ， 持 续 一 回合 。\nNY = om ot ot ea WE BSR ME HURRAH Ot ERS","hintZhClean":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cf","sourceSheet":"1乌龟兽群","sourceRow":52},"pack1_pet_0040":{"id":"pack1_pet_0040","kind":"pack1_pet_0040","packKey":"pack1","nameZh":"鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹿1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0040.png","iconMissing":false,"hintZhRaw":"鹿\n页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。\nL3 晕厥时 -> 召唤一辆15/9且具有辣椒的公交车。","hintZhClean":"页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":53},"pack1_pet_0041":{"id":"pack1_pet_0041","kind":"pack1_pet_0041","packKey":"pack1","nameZh":"公鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/公鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0041.png","iconMissing":false,"hintZhRaw":"公鸡\nOO sk © 召唤 一 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n1) eee ob 门 人 一 口 目 在 | 国生 和 Iankro 人 人 二 naeop","hintZhClean":"公鸡\nOO sk 召唤 一 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":57},"pack1_pet_0042":{"id":"pack1_pet_0042","kind":"pack1_pet_0042","packKey":"pack1","nameZh":"奶牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/奶牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0042.png","iconMissing":false,"hintZhRaw":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintZhClean":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"1乌龟兽群","sourceRow":59},"pack1_pet_0043":{"id":"pack1_pet_0043","kind":"pack1_pet_0043","packKey":"pack1","nameZh":"海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/海豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0043.png","iconMissing":false,"hintZhRaw":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 @ xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 @ 攻击 。\nEY nc ae ae et ea CR — A Hn oo) oe a8? A ws","hintZhClean":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 攻击 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"1乌龟兽群","sourceRow":60},"pack1_pet_0044":{"id":"pack1_pet_0044","kind":"pack1_pet_0044","packKey":"pack1","nameZh":"火鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/火鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0044.png","iconMissing":false,"hintZhRaw":"火 鸡\nDO 伙伴 被 召唤 时 => 使 其 获得 +3 @ 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 => 使 其 获得 +6 @@ 攻击 和 +2 @ 生命 .\nNY a oe ae Tom et ea CHE EIB Mt tin.? @ +s","hintZhClean":"火 鸡\nDO 伙伴 被 召唤 时 > 使 其 获得 +3 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 > 使 其 获得 +6 攻击 和 +2 生命 .","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"1乌龟兽群","sourceRow":61},"pack1_pet_0045":{"id":"pack1_pet_0045","kind":"pack1_pet_0045","packKey":"pack1","nameZh":"犀牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犀牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0045.png","iconMissing":false,"hintZhRaw":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。\n1 cet eh 3 Oe LOE PL SRE RON HIN eee","hintZhClean":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"1乌龟兽群","sourceRow":62},"pack1_pet_0046":{"id":"pack1_pet_0046","kind":"pack1_pet_0046","packKey":"pack1","nameZh":"犰狳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犰狳.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0046.png","iconMissing":false,"hintZhRaw":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.\nME) pos) wae ea CESK Er oeentt@.l, @ +s","hintZhClean":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"1乌龟兽群","sourceRow":63},"pack1_pet_0047":{"id":"pack1_pet_0047","kind":"pack1_pet_0047","packKey":"pack1","nameZh":"猴子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/猴子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0047.png","iconMissing":false,"hintZhRaw":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 @ 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 和 +*4 O tm.\nNM) =o ot et mt EBM ee eee 让 二 IF @ te","hintZhClean":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 和 +*4 O tm.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"1乌龟兽群","sourceRow":64},"pack1_pet_0048":{"id":"pack1_pet_0048","kind":"pack1_pet_0048","packKey":"pack1","nameZh":"蝎子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/蝎子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0048.png","iconMissing":false,"hintZhRaw":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintZhClean":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb9d1","sourceSheet":"1乌龟兽群","sourceRow":66},"pack1_pet_0049":{"id":"pack1_pet_0049","kind":"pack1_pet_0049","packKey":"pack1","nameZh":"鲨鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鲨鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0049.png","iconMissing":false,"hintZhRaw":"& &\nDO neemea > 获得 +2 @ 攻击 和 +2 @ 生命 。\n) Be eRe > 获得 +4 @ 攻击 和 *+4 O 生命 。\nND? op oe ae ert ee Bac Mwti.aic @ rs","hintZhClean":"DO neemea > 获得 +2 攻击 和 +2 生命 。\n) Be eRe > 获得 +4 攻击 和 *+4 O 生命 。\nND op oe ae ert ee Bac Mwti.aic rs","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a68f","sourceSheet":"1乌龟兽群","sourceRow":67},"pack1_pet_0050":{"id":"pack1_pet_0050","kind":"pack1_pet_0050","packKey":"pack1","nameZh":"鳄鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鳄鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0050.png","iconMissing":false,"hintZhRaw":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。\nNM) pes) wae ab HBC se Leo sie aw ab Pl","hintZhClean":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c78fd1","sourceSheet":"1乌龟兽群","sourceRow":68},"pack1_pet_0051":{"id":"pack1_pet_0051","kind":"pack1_pet_0051","packKey":"pack1","nameZh":"狼獾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/狼獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0051.png","iconMissing":false,"hintZhRaw":"AR\nD OAKS > 使 所 有 敌人 -3 @ tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 @ 生命\nfm 和 hz 人 nd ea EER th ao Mes","hintZhClean":"AR\nD OAKS > 使 所 有 敌人 -3 tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 生命","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#98d18f","sourceSheet":"1乌龟兽群","sourceRow":72},"pack1_pet_0052":{"id":"pack1_pet_0052","kind":"pack1_pet_0052","packKey":"pack1","nameZh":"猛犸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猛犸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0052.png","iconMissing":false,"hintZhRaw":"th 59\nCD wre > 使 伙伴 获得 +2 @ 攻击 和 +2 O 生命 .\nCB memes => 使 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\n1) exe ab OHO OK ace TI Fr @ +s","hintZhClean":"th 59\nCD wre > 使 伙伴 获得 +2 攻击 和 +2 O 生命 .\nCB memes > 使 伙伴 获得 +*4 攻击 和 +4 Ota.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"1乌龟兽群","sourceRow":73},"pack1_pet_0053":{"id":"pack1_pet_0053","kind":"pack1_pet_0053","packKey":"pack1","nameZh":"猩猩","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猩猩1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0053.png","iconMissing":false,"hintZhRaw":"Ve Ye 页 1/2\nQD 受伤 时 » 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。\nfi 和 到 /Ap ob TIMES te OE St Bb","hintZhClean":"Ve Ye 页 1/2\nQD 受伤 时 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"1乌龟兽群","sourceRow":74},"pack1_pet_0054":{"id":"pack1_pet_0054","kind":"pack1_pet_0054","packKey":"pack1","nameZh":"猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猫.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0054.png","iconMissing":false,"hintZhRaw":"狂\nQO 商店 食物 给 予 两 倍 攻击 @ 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 @5tH@O. saatm2”.\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintZhClean":"QO 商店 食物 给 予 两 倍 攻击 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 5tH O. saatm2 .\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c38fd1","sourceSheet":"1乌龟兽群","sourceRow":76},"pack1_pet_0055":{"id":"pack1_pet_0055","kind":"pack1_pet_0055","packKey":"pack1","nameZh":"苍蝇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/苍蝇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0055.png","iconMissing":false,"hintZhRaw":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。\nND) op oe eR eb KES BM _ Oa ee 455 [| & Abe Be An","hintZhClean":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9cd18f","sourceSheet":"1乌龟兽群","sourceRow":77},"pack1_pet_0056":{"id":"pack1_pet_0056","kind":"pack1_pet_0056","packKey":"pack1","nameZh":"虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/虎.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0056.png","iconMissing":false,"hintZhRaw":"虎\nCO 在 战斗 中 ， 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 ， 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintZhClean":"CO 在 战斗 中 , 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 , 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":78},"pack1_pet_0057":{"id":"pack1_pet_0057","kind":"pack1_pet_0057","packKey":"pack1","nameZh":"蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/蛇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。\nfi 和 pmp 二 pa 入 htinrh LCE RPI Rm OY wtb el tanec","hintZhClean":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":79},"pack1_pet_0058":{"id":"pack1_pet_0058","kind":"pack1_pet_0058","packKey":"pack1","nameZh":"豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0058.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME? pes) wae ea HI Amminse bE OU Reeth HON HED","hintZhClean":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME pes) wae ea HI Amminse bE OU Reeth HON HED","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d08fd1","sourceSheet":"1乌龟兽群","sourceRow":80},"pack1_pet_0059":{"id":"pack1_pet_0059","kind":"pack1_pet_0059","packKey":"pack1","nameZh":"野猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/野猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0059.png","iconMissing":false,"hintZhRaw":"Ee c=]\nDO 攻击 前 > 获得 +4 @ 攻击 和 +2 @@ 生命 .\n» 3 攻击 前 > 获得 +8 @ 攻击 和 +4 Ota.\n3 eae ae Se we pres","hintZhClean":"Ee c ]\nDO 攻击 前 > 获得 +4 攻击 和 +2 生命 .\n3 攻击 前 > 获得 +8 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd18f","sourceSheet":"1乌龟兽群","sourceRow":81},"pack1_pet_0060":{"id":"pack1_pet_0060","kind":"pack1_pet_0060","packKey":"pack1","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b2","sourceSheet":"1乌龟兽群","sourceRow":82},"pack2_pet_0001":{"id":"pack2_pet_0001","kind":"pack2_pet_0001","packKey":"pack2","nameZh":"伊犁鼠兔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/伊犁鼠兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0001.png","iconMissing":false,"hintZhRaw":"FRR?! ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1， 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2， 持 续 一 回合 。\nNY? op oe mr wet ea ChE BmwM.r 1ie_Mms","hintZhClean":"FRR ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1, 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2, 持 续 一 回合 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":2},"pack2_pet_0002":{"id":"pack2_pet_0002","kind":"pack2_pet_0002","packKey":"pack2","nameZh":"埃塞俄比亚狼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/埃塞俄比亚狼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0002.png","iconMissing":false,"hintZhRaw":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n小 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n小 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":3},"pack2_pet_0003":{"id":"pack2_pet_0003","kind":"pack2_pet_0003","packKey":"pack2","nameZh":"托吉安鹿豚","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/托吉安鹿豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0003.png","iconMissing":false,"hintZhRaw":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 @ tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 @ tH,\n1) ec ab H_ Amine | oe.) @ +s","hintZhClean":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 tH,","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":4},"pack2_pet_0004":{"id":"pack2_pet_0004","kind":"pack2_pet_0004","packKey":"pack2","nameZh":"火山蜗牛","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/火山蜗牛2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0004.png","iconMissing":false,"hintZhRaw":"任意 单位 攻击 时 @ SHISHEO, ， 生 效 一 次 。","hintZhClean":"任意 单位 攻击 时 SHISHEO, , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":6},"pack2_pet_0005":{"id":"pack2_pet_0005","kind":"pack2_pet_0005","packKey":"pack2","nameZh":"熊蜂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/熊蜂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0005.png","iconMissing":false,"hintZhRaw":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ，\nEY sek ey eB oe 时 A Le Pl eae OY me cl tahoe","hintZhClean":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":7},"pack2_pet_0006":{"id":"pack2_pet_0006","kind":"pack2_pet_0006","packKey":"pack2","nameZh":"翡翠贻贝","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/翡翠贻贝.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0006.png","iconMissing":false,"hintZhRaw":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。\nNW mane). | OSH Ab","hintZhClean":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":8},"pack2_pet_0007":{"id":"pack2_pet_0007","kind":"pack2_pet_0007","packKey":"pack2","nameZh":"西表猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/西表猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0007.png","iconMissing":false,"hintZhRaw":"FOR Is\n加 战斗 前 >» 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 => 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。\n1S tec) wa KA Te BON ee ER 1)","hintZhClean":"FOR Is\n加 战斗 前 > 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 > 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":9},"pack2_pet_0008":{"id":"pack2_pet_0008","kind":"pack2_pet_0008","packKey":"pack2","nameZh":"非洲野狗","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/非洲野狗.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0008.png","iconMissing":false,"hintZhRaw":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 ， 造 成 3 点 伤 寄 〇 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 ， 造 成 6 点 伤害 O,\nNS sec) wand wa HUES kh :过 Fo 上 六","hintZhClean":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 , 造 成 3 点 伤 寄 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 , 造 成 6 点 伤害 O,","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c98fd1","sourceSheet":"2濒危兽群","sourceRow":10},"pack2_pet_0009":{"id":"pack2_pet_0009","kind":"pack2_pet_0009","packKey":"pack2","nameZh":"马来貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/马来貘.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0009.png","iconMissing":false,"hintZhRaw":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 @@O 生命 。 每 回合 生效 3 次 。\nfy 440 61 OK TH Ee aa UI. 2 OO KH 455 (Al) & 4 GA 2° Ar","hintZhClean":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#95d18f","sourceSheet":"2濒危兽群","sourceRow":11},"pack2_pet_0010":{"id":"pack2_pet_0010","kind":"pack2_pet_0010","packKey":"pack2","nameZh":"齿嘴鸠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/齿嘴鸠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0010.png","iconMissing":false,"hintZhRaw":"一 堆 种 子 A 2}:\n使 一 个 宠物 获得 +1 O 生命 。","hintZhClean":"一 堆 种 子 A 2 :\n使 一 个 宠物 获得 +1 O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aed18f","sourceSheet":"2濒危兽群","sourceRow":13},"pack2_pet_0011":{"id":"pack2_pet_0011","kind":"pack2_pet_0011","packKey":"pack2","nameZh":"中南大羚","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/中南大羚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0011.png","iconMissing":false,"hintZhRaw":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 @ 攻击 和 +2 @ tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 @ 攻击 和 +2 O tH.\nMW) mace stn ob Het Bem Awww) A wt. @ +s","hintZhClean":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 攻击 和 +2 tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 攻击 和 +2 O tH.","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b18fd1","sourceSheet":"2濒危兽群","sourceRow":16},"pack2_pet_0012":{"id":"pack2_pet_0012","kind":"pack2_pet_0012","packKey":"pack2","nameZh":"侏儒猪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/侏儒猪2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0012.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b0d18f","sourceSheet":"2濒危兽群","sourceRow":18},"pack2_pet_0013":{"id":"pack2_pet_0013","kind":"pack2_pet_0013","packKey":"pack2","nameZh":"普氏野马","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/普氏野马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0013.png","iconMissing":false,"hintZhRaw":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She => 召 隐 一 个 6/4 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n1) eet ab 2A AOC st eh: SPOOL me twee","hintZhClean":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She > 召 隐 一 个 6/4 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#af8fd1","sourceSheet":"2濒危兽群","sourceRow":19},"pack2_pet_0014":{"id":"pack2_pet_0014","kind":"pack2_pet_0014","packKey":"pack2","nameZh":"泰塔尖鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/泰塔尖鼠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0014.png","iconMissing":false,"hintZhRaw":"& EUR\nTQ 2/:\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\nTQ 2/:\n) sae 下 一 回合 获得 +1 O 金币 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a9d18f","sourceSheet":"2濒危兽群","sourceRow":21},"pack2_pet_0015":{"id":"pack2_pet_0015","kind":"pack2_pet_0015","packKey":"pack2","nameZh":"澳洲水貂","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/澳洲水貂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0015.png","iconMissing":false,"hintZhRaw":"BR GAN 7K $2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。\nfy AVE OK TH Se om SHRINE Mest 455 (Al) & 4 GS QA","hintZhClean":"BR GAN 7K 2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b58fd1","sourceSheet":"2濒危兽群","sourceRow":22},"pack2_pet_0016":{"id":"pack2_pet_0016","kind":"pack2_pet_0016","packKey":"pack2","nameZh":"白腹鹭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/白腹鹭2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0016.png","iconMissing":true,"hintZhRaw":"页 2/:\n内 骨头\n攻击 伤害 〇 +3。","hintZhClean":"页 2/:\n内 骨头\n攻击 伤害 +3。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#acd18f","sourceSheet":"2濒危兽群","sourceRow":24},"pack2_pet_0017":{"id":"pack2_pet_0017","kind":"pack2_pet_0017","packKey":"pack2","nameZh":"赛克尔隼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/赛克尔隼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0017.png","iconMissing":false,"hintZhRaw":"FF oe\nOD 攻击 前 OP URRBN, RO+2O@ 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。\n1D? we tee 证 昌国 pz rr Ot mse shy","hintZhClean":"FF oe\nOD 攻击 前 OP URRBN, RO+2O 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b38fd1","sourceSheet":"2濒危兽群","sourceRow":25},"pack2_pet_0018":{"id":"pack2_pet_0018","kind":"pack2_pet_0018","packKey":"pack2","nameZh":"达尔文狐","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/达尔文狐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0018.png","iconMissing":false,"hintZhRaw":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。\nNf Sy A 24 RS eh 7423S Se at Bett ante bo Fh Oe ST te -全 4e5 4%, ER OL AE BS 2","hintZhClean":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b7d18f","sourceSheet":"2濒危兽群","sourceRow":26},"pack2_pet_0019":{"id":"pack2_pet_0019","kind":"pack2_pet_0019","packKey":"pack2","nameZh":"长鼻猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/长鼻猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0019.png","iconMissing":false,"hintZhRaw":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\nNM) marron ab BEE M HABE bh) ETE AHIR 1 ET th","hintZhClean":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a88fd1","sourceSheet":"2濒危兽群","sourceRow":27},"pack2_pet_0020":{"id":"pack2_pet_0020","kind":"pack2_pet_0020","packKey":"pack2","nameZh":"阿拉里佩侏儒鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/阿拉里佩侏儒鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0020.png","iconMissing":false,"hintZhRaw":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 @ 获得 +3 @@ 生命 ， 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。\nfy 站 OF OZ OME Te 1358.0 TO ++ ORR ms a fA) & Ae ASDA","hintZhClean":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 获得 +3 生命 , 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"2濒危兽群","sourceRow":28},"pack2_pet_0021":{"id":"pack2_pet_0021","kind":"pack2_pet_0021","packKey":"pack2","nameZh":"亨氏牛羚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/亨氏牛羚2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0021.png","iconMissing":false,"hintZhRaw":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n» 3 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n3 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"2濒危兽群","sourceRow":33},"pack2_pet_0022":{"id":"pack2_pet_0022","kind":"pack2_pet_0022","packKey":"pack2","nameZh":"侏儒河马","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/侏儒河马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0022.png","iconMissing":false,"hintZhRaw":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\nNf lek eto ce at 24S BH KH Ase LoS ee tee @ + 2 220M DD","hintZhClean":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"2濒危兽群","sourceRow":34},"pack2_pet_0023":{"id":"pack2_pet_0023","kind":"pack2_pet_0023","packKey":"pack2","nameZh":"勺嘴鹬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/勺嘴鹬.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0023.png","iconMissing":false,"hintZhRaw":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。\nNM marron ea BEM HAS Howe Bi wees,","hintZhClean":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b4","sourceSheet":"2濒危兽群","sourceRow":35},"pack2_pet_0024":{"id":"pack2_pet_0024","kind":"pack2_pet_0024","packKey":"pack2","nameZh":"土库海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/土库海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0024.png","iconMissing":false,"hintZhRaw":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +3 @ 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +6 @ 攻击 和 *6 Ota.\nTE) aw rit bh Be ok ee ee Ot EK el ce BH etn @ +=","hintZhClean":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +3 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +6 攻击 和 *6 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"2濒危兽群","sourceRow":36},"pack2_pet_0025":{"id":"pack2_pet_0025","kind":"pack2_pet_0025","packKey":"pack2","nameZh":"树袋鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/树袋鼠1.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0025.png","iconMissing":false,"hintZhRaw":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活一次。\nL2 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活两次。\nL3 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活三次。","hintZhClean":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢,并激活一次。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"2濒危兽群","sourceRow":37},"pack2_pet_0026":{"id":"pack2_pet_0026","kind":"pack2_pet_0026","packKey":"pack2","nameZh":"猴面蝙蝠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/猴面蝙蝠.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0026.png","iconMissing":false,"hintZhRaw":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 |] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。\nNf Eee ewe ee EC web BA HN St eee. A wtinic @ +s aur 4%, FS ol AE BSD AP","hintZhClean":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 ] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"2濒危兽群","sourceRow":39},"pack2_pet_0027":{"id":"pack2_pet_0027","kind":"pack2_pet_0027","packKey":"pack2","nameZh":"琉球兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/琉球兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0027.png","iconMissing":false,"hintZhRaw":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\nNS rp we UA IRN ee HRN EHO BAMHI","hintZhClean":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"2濒危兽群","sourceRow":40},"pack2_pet_0028":{"id":"pack2_pet_0028","kind":"pack2_pet_0028","packKey":"pack2","nameZh":"罗洛韦猴","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/罗洛韦猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0028.png","iconMissing":false,"hintZhRaw":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。\nNf be oL WAG Qe ab 2 OOo TN OF OK OWE 4 LOO Sn FRO 2A TB) Ko oe 8 eB Oh ae TE ER 4 2)","hintZhClean":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa2","sourceSheet":"2濒危兽群","sourceRow":41},"pack2_pet_0029":{"id":"pack2_pet_0029","kind":"pack2_pet_0029","packKey":"pack2","nameZh":"羚牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/羚牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0029.png","iconMissing":false,"hintZhRaw":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 @ 生命 ， 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 ， 持 续 一 回合 。\nfy yt Ra nm OH —™) 3274s","hintZhClean":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 生命 , 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bf","sourceSheet":"2濒危兽群","sourceRow":42},"pack2_pet_0030":{"id":"pack2_pet_0030","kind":"pack2_pet_0030","packKey":"pack2","nameZh":"蓝喉金刚鹦鹉","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/蓝喉金刚鹦鹉.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0030.png","iconMissing":false,"hintZhRaw":"WA Dee = MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 ， 使 其 获得 +3 @ 攻击 ， 持 续 一 回合 ; 否则 ， 使 其 获得 @ 生命 。\n小 伙伴 变形 时 @ 若 其 在 前 排 ， 使 其 获得 +6 全 攻击， 持续 一 回合 ; BM, CHRO 生命.\nNf 人 2% MEU A eh 3 ET Pr a4 et 43 Ff ZEA 20 a Th = 2 eh fh) oe - AEM ‘sew @ ++=-","hintZhClean":"WA Dee MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 , 使 其 获得 +3 攻击 , 持 续 一 回合 否则 , 使 其 获得 生命 。\n小 伙伴 变形 时 若 其 在 前 排 , 使 其 获得 +6 全 攻击, 持续 一 回合 BM, CHRO 生命.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":43},"pack2_pet_0031":{"id":"pack2_pet_0031","kind":"pack2_pet_0031","packKey":"pack2","nameZh":"亚马逊海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/亚马逊海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0031.png","iconMissing":false,"hintZhRaw":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 ， 或 获得 +3 @ 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 ， 或 获得 +6 @ 攻击 .\nNM) sa eeavpak te te ab ME Sect ctoscic mw CO 十 这/ 有 CO 人 十","hintZhClean":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 , 或 获得 +3 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 , 或 获得 +6 攻击 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":47},"pack2_pet_0032":{"id":"pack2_pet_0032","kind":"pack2_pet_0032","packKey":"pack2","nameZh":"倭黑猩猩","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/倭黑猩猩.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0032.png","iconMissing":false,"hintZhRaw":"倭 黑猩猩\nCD 回合 开始 时 &@ 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 => 变 为 最 前 排 的 伙伴 。\nNM) marron ob TH Beto) oe","hintZhClean":"倭 黑猩猩\nCD 回合 开始 时 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 > 变 为 最 前 排 的 伙伴 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":48},"pack2_pet_0033":{"id":"pack2_pet_0033","kind":"pack2_pet_0033","packKey":"pack2","nameZh":"天使鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/天使鲨.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0033.png","iconMissing":false,"hintZhRaw":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。\nfy fal = +2 RY eb CEE Ty 61: KOH OS fe 2","hintZhClean":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":49},"pack2_pet_0034":{"id":"pack2_pet_0034","kind":"pack2_pet_0034","packKey":"pack2","nameZh":"巨獭","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/巨獭.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0034.png","iconMissing":false,"hintZhRaw":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 => 使 所 有 伙伴 获得 +4 O KHN+10O 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\nfy 上 上 cl 二 oem CREE tree zk 二 FTP 二 xz 1c Oem) Er Ie 二 天","hintZhClean":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 > 使 所 有 伙伴 获得 +4 O KHN+10O 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":50},"pack2_pet_0035":{"id":"pack2_pet_0035","kind":"pack2_pet_0035","packKey":"pack2","nameZh":"栉齿锯鳐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/栉齿锯鳐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0035.png","iconMissing":false,"hintZhRaw":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 @ 生命 ， 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 ， 并 使 所 有 敌人 8 OY tH.\n小 -\nteh wet Oo ce at 7578.17 @ > +e ewe 1 1D @ +s","hintZhClean":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 生命 , 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 , 并 使 所 有 敌人 8 OY tH.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"2濒危兽群","sourceRow":51},"pack2_pet_0036":{"id":"pack2_pet_0036","kind":"pack2_pet_0036","packKey":"pack2","nameZh":"波纹唇鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/波纹唇鱼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0036.png","iconMissing":false,"hintZhRaw":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% @ KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% @ 攻击 .\nNM) peel wae ob Chet Bete ann. Hawt","hintZhClean":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":52},"pack2_pet_0037":{"id":"pack2_pet_0037","kind":"pack2_pet_0037","packKey":"pack2","nameZh":"袋獾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/袋獾2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0037.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":54},"pack2_pet_0038":{"id":"pack2_pet_0038","kind":"pack2_pet_0038","packKey":"pack2","nameZh":"金狮狨猴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/金狮狨猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0038.png","iconMissing":false,"hintZhRaw":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。\nMEY ra eh OF HO 丰 故国 在 ke、 ZT OR BEE Some EER AH?)","hintZhClean":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"2濒危兽群","sourceRow":55},"pack2_pet_0039":{"id":"pack2_pet_0039","kind":"pack2_pet_0039","packKey":"pack2","nameZh":"阿尔达布拉象龟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/阿尔达布拉象龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0039.png","iconMissing":false,"hintZhRaw":"Bo] “RA Fp ti RRB\nDassen» 获得 +2 二 生命 ， 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100，\n小 回合 结束 时 > 获得 +4 @ 生命 ， 并 将 O@ 攻击 设 为 8。 生 命 上 限 可 达 100，\nfi 人 请 全 广 未 pi ee Mc Hee te 让 证 :Ar +e EBT tin:","hintZhClean":"Bo] RA Fp ti RRB\nDassen 获得 +2 二 生命 , 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100,\n小 回合 结束 时 > 获得 +4 生命 , 并 将 O 攻击 设 为 8。 生 命 上 限 可 达 100,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"2濒危兽群","sourceRow":56},"pack2_pet_0040":{"id":"pack2_pet_0040","kind":"pack2_pet_0040","packKey":"pack2","nameZh":"鸮鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/鸮鹦鹉2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0040.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bc8fd1","sourceSheet":"2濒危兽群","sourceRow":58},"pack2_pet_0041":{"id":"pack2_pet_0041","kind":"pack2_pet_0041","packKey":"pack2","nameZh":"几何陆龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/几何陆龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0041.png","iconMissing":false,"hintZhRaw":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 => 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。\nNE) =u et ea 34 _ A HEN Sh OL OE PEE SE Be ae 全 MI.","hintZhClean":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a3d18f","sourceSheet":"2濒危兽群","sourceRow":62},"pack2_pet_0042":{"id":"pack2_pet_0042","kind":"pack2_pet_0042","packKey":"pack2","nameZh":"夏威夷僧海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/夏威夷僧海豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0042.png","iconMissing":false,"hintZhRaw":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命\nNM) aaron ea OH bith ib ll ET Ameo oe aac @ 小 全","hintZhClean":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#be8fd1","sourceSheet":"2濒危兽群","sourceRow":63},"pack2_pet_0043":{"id":"pack2_pet_0043","kind":"pack2_pet_0043","packKey":"pack2","nameZh":"小熊猫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/小熊猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0043.png","iconMissing":false,"hintZhRaw":"/\\\\ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\nNEY os et ea ii 下 _RA 在 让 :汉人 和 pa OTE ie tee (STL Oe am Eo AX)","hintZhClean":"/ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a0d18f","sourceSheet":"2濒危兽群","sourceRow":64},"pack2_pet_0044":{"id":"pack2_pet_0044","kind":"pack2_pet_0044","packKey":"pack2","nameZh":"指猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/指猴2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0044.png","iconMissing":false,"hintZhRaw":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。\nNM marron abd :大汉 人 DonnnxynysI 一 加","hintZhClean":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b88fd1","sourceSheet":"2濒危兽群","sourceRow":66},"pack2_pet_0045":{"id":"pack2_pet_0045","kind":"pack2_pet_0045","packKey":"pack2","nameZh":"泰塔鸫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/泰塔鸫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0045.png","iconMissing":false,"hintZhRaw":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 @KGN+2O 生命 。 每 回合 生效 3 次 。\nND? 40 48 Ook Te eo CEER Seb ow a? A we ti.2 Ot mM SH ab.","hintZhClean":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 KGN+2O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a7d18f","sourceSheet":"2濒危兽群","sourceRow":67},"pack2_pet_0046":{"id":"pack2_pet_0046","kind":"pack2_pet_0046","packKey":"pack2","nameZh":"海鬣蜥","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/海鬣蜥2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0046.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"2濒危兽群","sourceRow":69},"pack2_pet_0047":{"id":"pack2_pet_0047","kind":"pack2_pet_0047","packKey":"pack2","nameZh":"考氏鳍竺鲷","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/考氏鳍竺鲷.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0047.png","iconMissing":false,"hintZhRaw":"S as = 88\nCO wim = 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 @ 攻击 ， 最 低 减 至 4。\nME) pec) mae ea CER SS ah ee oo Tb 二 Brae","hintZhClean":"S as 88\nCO wim 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 攻击 , 最 低 减 至 4。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a5d18f","sourceSheet":"2濒危兽群","sourceRow":70},"pack2_pet_0048":{"id":"pack2_pet_0048","kind":"pack2_pet_0048","packKey":"pack2","nameZh":"西瓜龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/西瓜龟2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0048.png","iconMissing":true,"hintZhRaw":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintZhClean":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"2濒危兽群","sourceRow":72},"pack2_pet_0049":{"id":"pack2_pet_0049","kind":"pack2_pet_0049","packKey":"pack2","nameZh":"长丝巨鲇","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/长丝巨鲇.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0049.png","iconMissing":false,"hintZhRaw":"1 22 6 84\nQO sky» 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 8 点 伤害 O.\n1) ect ob KOM E_ARK wee 入 pinb erplio 上 全 二 全","hintZhClean":"1 22 6 84\nQO sky 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 8 点 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"2濒危兽群","sourceRow":73},"pack2_pet_0050":{"id":"pack2_pet_0050","kind":"pack2_pet_0050","packKey":"pack2","nameZh":"雪豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/雪豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0050.png","iconMissing":false,"hintZhRaw":"SN\nCD 战斗 开始 时 > 获得 +5 | 攻击 和 *+5 二 生命 ， 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 @ 攻击 和 +10 OD 生命 ， 并 跳跃 攻击 一 个 随机 敌人 ，\nMEY pec) raed ea 7578.10 TI ic @te + eee t_Aminewi","hintZhClean":"SN\nCD 战斗 开始 时 > 获得 +5 攻击 和 *+5 二 生命 , 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 攻击 和 +10 OD 生命 , 并 跳跃 攻击 一 个 随机 敌人 ,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c4d18f","sourceSheet":"2濒危兽群","sourceRow":74},"pack2_pet_0051":{"id":"pack2_pet_0051","kind":"pack2_pet_0051","packKey":"pack2","nameZh":"丝绒冕狐猴","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/丝绒冕狐猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0051.png","iconMissing":false,"hintZhRaw":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。\nNf ES cL WAG Re ab 2 Gt ABN CO) OK OWE 4% OO So RON ts BS 8 HO ee ae CO OE ER 4 2)","hintZhClean":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9b8fd1","sourceSheet":"2濒危兽群","sourceRow":78},"pack2_pet_0052":{"id":"pack2_pet_0052","kind":"pack2_pet_0052","packKey":"pack2","nameZh":"加州秃鹰","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/加州秃鹰.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0052.png","iconMissing":false,"hintZhRaw":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。\nNEY op oe mr et ee TRIMER BE OEE ER Sl 人 Ah","hintZhClean":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c6d18f","sourceSheet":"2濒危兽群","sourceRow":79},"pack2_pet_0053":{"id":"pack2_pet_0053","kind":"pack2_pet_0053","packKey":"pack2","nameZh":"婆罗洲金猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/婆罗洲金猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0053.png","iconMissing":false,"hintZhRaw":"2S iN = Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\nNf @@et ab 72°40 BK Oo ORO ge £8 、| IT 84 BEA BOAR) SOO OCS Be -人","hintZhClean":"2S iN Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#998fd1","sourceSheet":"2濒危兽群","sourceRow":80},"pack2_pet_0054":{"id":"pack2_pet_0054","kind":"pack2_pet_0054","packKey":"pack2","nameZh":"灰犀鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/灰犀鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0054.png","iconMissing":false,"hintZhRaw":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。\nfy fal &@ ¢2 DBRS a 16 — MO): eK OM 2 Se wt OS","hintZhClean":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c8d18f","sourceSheet":"2濒危兽群","sourceRow":81},"pack2_pet_0055":{"id":"pack2_pet_0055","kind":"pack2_pet_0055","packKey":"pack2","nameZh":"绿海龟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/绿海龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0055.png","iconMissing":false,"hintZhRaw":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。\nNf leh tet DY ce ab CBB St wee mwa mito se we ON ws 45 (7) & 4+ S61 Ar","hintZhClean":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#968fd1","sourceSheet":"2濒危兽群","sourceRow":82},"pack2_pet_0056":{"id":"pack2_pet_0056","kind":"pack2_pet_0056","packKey":"pack2","nameZh":"苏门达腊虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/苏门达腊虎.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0056.png","iconMissing":false,"hintZhRaw":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 ， 并 对 相 邻 敌人 造成 6 点 伤害 。\nNf be | Wee ee abd FS — il (BOO te 人 He Kh Oe ST Th 二 2 HMA 人 SP 1I Se a","hintZhClean":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 , 并 对 相 邻 敌人 造成 6 点 伤害 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cbd18f","sourceSheet":"2濒危兽群","sourceRow":83},"pack2_pet_0057":{"id":"pack2_pet_0057","kind":"pack2_pet_0057","packKey":"pack2","nameZh":"菲律宾雕","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/菲律宾雕.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0057.png","iconMissing":false,"hintZhRaw":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 @ 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 @ 攻击 和 +8 Ota.\nNY cr me i eT ot BAN et oe 8.1) A wt.) 国 秆 全","hintZhClean":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 攻击 和 +8 Ota.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#948fd1","sourceSheet":"2濒危兽群","sourceRow":84},"pack2_pet_0058":{"id":"pack2_pet_0058","kind":"pack2_pet_0058","packKey":"pack2","nameZh":"蓝鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/蓝鲸.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0058.png","iconMissing":false,"hintZhRaw":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 @ 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 @O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 @ 生命 。\nfy TF) & WAAR abd TEMA GOT) OM OTR FEE OMB Tene mac pp 二 In F Oem","hintZhClean":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 生命 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bbd18f","sourceSheet":"2濒危兽群","sourceRow":85},"pack2_pet_0059":{"id":"pack2_pet_0059","kind":"pack2_pet_0059","packKey":"pack2","nameZh":"阿姆斯特丹信天翁","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/阿姆斯特丹信天翁.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0059.png","iconMissing":false,"hintZhRaw":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。\nND) aoe mw ab CREAN 2379.c @ wtinac @ +s 45 [二 | & 4&e Bb) Ap","hintZhClean":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a48fd1","sourceSheet":"2濒危兽群","sourceRow":86},"pack2_pet_0060":{"id":"pack2_pet_0060","kind":"pack2_pet_0060","packKey":"pack2","nameZh":"黑犀牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/黑犀牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0060.png","iconMissing":false,"hintZhRaw":"墨 犀牛\nOD 敌人 攻击 七 次 后 @ 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\nfi 了 mp 二 上 六 户 一 入 系 人 是 关 snh 站 让 mn 上 人 二 全","hintZhClean":"墨 犀牛\nOD 敌人 攻击 七 次 后 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#928fd1","sourceSheet":"2濒危兽群","sourceRow":87},"pack3_pet_0001":{"id":"pack3_pet_0001","kind":"pack3_pet_0001","packKey":"pack3","nameZh":"???","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/？？？2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0001.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"3独角兽兽群","sourceRow":16},"pack3_pet_0002":{"id":"pack3_pet_0002","kind":"pack3_pet_0002","packKey":"pack3","nameZh":"企鹅鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/企鹅鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0002.png","iconMissing":false,"hintZhRaw":"TE #8 &\n@ Rema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次，\n1) ecco et tk ec ss A wee mM Se Bh","hintZhClean":"TE 8\nRema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa3","sourceSheet":"3独角兽兽群","sourceRow":2},"pack3_pet_0003":{"id":"pack3_pet_0003","kind":"pack3_pet_0003","packKey":"pack3","nameZh":"抱抱蟾蜍","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/抱抱蟾蜍4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0003.png","iconMissing":false,"hintZhRaw":"水 晶 球 页 4/2\nC) 战斗 开始 时 => 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.\nfy te cl TT AR ab (HOM maces fi -人","hintZhClean":"水 晶 球 页 4/2\nC) 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bc","sourceSheet":"3独角兽兽群","sourceRow":6},"pack3_pet_0004":{"id":"pack3_pet_0004","kind":"pack3_pet_0004","packKey":"pack3","nameZh":"澳洲水兽","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/澳洲水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0004.png","iconMissing":false,"hintZhRaw":"GN 7k &\nCD 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.\nNM) pec) waa ea Mr Rte (Bw) ee. @ +s","hintZhClean":"GN 7k\nCD 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa5","sourceSheet":"3独角兽兽群","sourceRow":7},"pack3_pet_0005":{"id":"pack3_pet_0005","kind":"pack3_pet_0005","packKey":"pack3","nameZh":"炼金小虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/炼金小虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0005.png","iconMissing":false,"hintZhRaw":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.\nME? pe sl maces ea CEB me eo) ee. A es","hintZhClean":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ba","sourceSheet":"3独角兽兽群","sourceRow":8},"pack3_pet_0006":{"id":"pack3_pet_0006","kind":"pack3_pet_0006","packKey":"pack3","nameZh":"犬魔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/犬魔2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0006.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa7","sourceSheet":"3独角兽兽群","sourceRow":10},"pack3_pet_0007":{"id":"pack3_pet_0007","kind":"pack3_pet_0007","packKey":"pack3","nameZh":"野槌蛇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/野槌蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0007.png","iconMissing":false,"hintZhRaw":"$F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 ， 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 ， 并 获得 +2 B 经 验 值 。\nME) posi maces ee MSL Eee) tt tw. @ ez mee","hintZhClean":"F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 , 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 , 并 获得 +2 B 经 验 值 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b8","sourceSheet":"3独角兽兽群","sourceRow":11},"pack3_pet_0008":{"id":"pack3_pet_0008","kind":"pack3_pet_0008","packKey":"pack3","nameZh":"食梦貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/食梦貘.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0008.png","iconMissing":false,"hintZhRaw":"RS\nDOSER @ 回合 数 为 偶数 时 ， 用 +1 @ 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 ， 用 +2 @ 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。\nNf fl & +2 3 RS at TD) © BS 4 (BE RO mo OD + mB A OL OK Loin mie XK","hintZhClean":"RS\nDOSER 回合 数 为 偶数 时 , 用 +1 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 , 用 +2 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f98","sourceSheet":"3独角兽兽群","sourceRow":12},"pack3_pet_0009":{"id":"pack3_pet_0009","kind":"pack3_pet_0009","packKey":"pack3","nameZh":"鬼祟蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鬼祟蛋.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0009.png","iconMissing":false,"hintZhRaw":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。\nNM) pec) raed ea MH DM _A10 cob Th","hintZhClean":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c7","sourceSheet":"3独角兽兽群","sourceRow":13},"pack3_pet_0010":{"id":"pack3_pet_0010","kind":"pack3_pet_0010","packKey":"pack3","nameZh":"鱼头人","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鱼头人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0010.png","iconMissing":false,"hintZhRaw":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 =» 获得 +1 @ 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击， 持续 一 回合 。\nNY op oe oe ez OR ea E18. ”人 wet tt ms","hintZhClean":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 获得 +1 攻击 , 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"3独角兽兽群","sourceRow":14},"pack3_pet_0011":{"id":"pack3_pet_0011","kind":"pack3_pet_0011","packKey":"pack3","nameZh":"双足飞龙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/双足飞龙.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0011.png","iconMissing":false,"hintZhRaw":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。\nfy 只 中 -FE KS","hintZhClean":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"3独角兽兽群","sourceRow":19},"pack3_pet_0012":{"id":"pack3_pet_0012","kind":"pack3_pet_0012","packKey":"pack3","nameZh":"大脚怪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/大脚怪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0012.png","iconMissing":false,"hintZhRaw":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。\nfy SER? ab 1 fh) > 75 — Ae em PCRS","hintZhClean":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"3独角兽兽群","sourceRow":20},"pack3_pet_0013":{"id":"pack3_pet_0013","kind":"pack3_pet_0013","packKey":"pack3","nameZh":"天蛾人","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/天蛾人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0013.png","iconMissing":false,"hintZhRaw":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 © 获得 +1 @ xtH-1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 &@ RG+2O 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\nNEY cr cm oe a EK EHR ea 2058.2 A wt. @ ts 和 末 门生 mm SH ae","hintZhClean":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 获得 +1 xtH-1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 RG+2O 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"3独角兽兽群","sourceRow":21},"pack3_pet_0014":{"id":"pack3_pet_0014","kind":"pack3_pet_0014","packKey":"pack3","nameZh":"奥古普古","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/奥古普古.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0014.png","iconMissing":false,"hintZhRaw":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 & 经 验 值 。\nME) peel mae ea CBS IK Ao oe tee.) 2 ,De 人 襄","hintZhClean":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 经 验 值 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"3独角兽兽群","sourceRow":22},"pack3_pet_0015":{"id":"pack3_pet_0015","kind":"pack3_pet_0015","packKey":"pack3","nameZh":"幽灵猫咪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/幽灵猫咪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0015.png","iconMissing":false,"hintZhRaw":"Hi =e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。\nNY xamer ayer Sos","hintZhClean":"Hi e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"3独角兽兽群","sourceRow":23},"pack3_pet_0016":{"id":"pack3_pet_0016","kind":"pack3_pet_0016","packKey":"pack3","nameZh":"掉掉熊","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/掉掉熊.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0016.png","iconMissing":false,"hintZhRaw":"OD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce~}~6. ores Sent 3 +H eB _Atw Lot ctasee ND","hintZhClean":"OD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce 6. ores Sent 3 +H eB Atw Lot ctasee ND","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"3独角兽兽群","sourceRow":24},"pack3_pet_0017":{"id":"pack3_pet_0017","kind":"pack3_pet_0017","packKey":"pack3","nameZh":"滴水兽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/滴水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0017.png","iconMissing":false,"hintZhRaw":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。\nNf SBR ab HBR ME Ke OK eh iB.c @ += ge cues) t AX mea eee Oh BleSt oe","hintZhClean":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"3独角兽兽群","sourceRow":25},"pack3_pet_0018":{"id":"pack3_pet_0018","kind":"pack3_pet_0018","packKey":"pack3","nameZh":"雷鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/雷鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0018.png","iconMissing":false,"hintZhRaw":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.\nNM) pec) Ten ob CRE ES CR OO) oe ao Aes","hintZhClean":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbad1","sourceSheet":"3独角兽兽群","sourceRow":26},"pack3_pet_0019":{"id":"pack3_pet_0019","kind":"pack3_pet_0019","packKey":"pack3","nameZh":"霜狼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/霜狼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0019.png","iconMissing":false,"hintZhRaw":"寒冷 页 2/:\n受到 的 伤害 O +5， 生 效 一 次 。","hintZhClean":"寒冷 页 2/:\n受到 的 伤害 O +5, 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a78f","sourceSheet":"3独角兽兽群","sourceRow":28},"pack3_pet_0020":{"id":"pack3_pet_0020","kind":"pack3_pet_0020","packKey":"pack3","nameZh":"鹿角兔","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/鹿角兔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0020.png","iconMissing":false,"hintZhRaw":"CD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR ”Tb 这 OST ee Be Eb CL AE abr","hintZhClean":"CD 伙伴 攻击 前 > 使 其 获得 +1 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR Tb 这 OST ee Be Eb CL AE abr","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"3独角兽兽群","sourceRow":29},"pack3_pet_0021":{"id":"pack3_pet_0021","kind":"pack3_pet_0021","packKey":"pack3","nameZh":"卡灵犬兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/卡灵犬兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0021.png","iconMissing":false,"hintZhRaw":"ERAS\nOD sky 吵 KH 个 魔力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 £8.\nNf BBR ab :光世 & mee ny fer A 2S) OR PO OT 4 * Oe BB er an ARK te dl 2 @ Ae a","hintZhClean":"ERAS\nOD sky 吵 KH 个 魔力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 8.","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"3独角兽兽群","sourceRow":33},"pack3_pet_0022":{"id":"pack3_pet_0022","kind":"pack3_pet_0022","packKey":"pack3","nameZh":"塔佐蠕虫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/塔佐蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0022.png","iconMissing":false,"hintZhRaw":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 ， 伤 害 番 倍 。\nNf ~ ee 1, Ok BBE RS ab 2 OSB Ys Lot eC Eee OY aN Bal Ak +524R 4c wea","hintZhClean":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 , 伤 害 番 倍 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"3独角兽兽群","sourceRow":34},"pack3_pet_0023":{"id":"pack3_pet_0023","kind":"pack3_pet_0023","packKey":"pack3","nameZh":"招财猫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/招财猫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0023.png","iconMissing":false,"hintZhRaw":"$B UA 468\nCO 升级 时 = 立刻 获得 +2 O 攻击 和 +2 人 生命 ， 下 回合 获得 +2 〇 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 @ 生命 ， 下 回合 获得 +4 〇 金币 。\nNM} 工 zr","hintZhClean":"B UA 468\nCO 升级 时 立刻 获得 +2 O 攻击 和 +2 人 生命 , 下 回合 获得 +2 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 生命 , 下 回合 获得 +4 金币 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"3独角兽兽群","sourceRow":35},"pack3_pet_0024":{"id":"pack3_pet_0024","kind":"pack3_pet_0024","packKey":"pack3","nameZh":"曼德拉草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/曼德拉草2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0024.png","iconMissing":false,"hintZhRaw":"页 2/:\nay 1\n阻止 能 力 激活 。","hintZhClean":"页 2/:\nay 1\n阻止 能 力 激活 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"3独角兽兽群","sourceRow":37},"pack3_pet_0025":{"id":"pack3_pet_0025","kind":"pack3_pet_0025","packKey":"pack3","nameZh":"毛皮蹲鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/毛皮蹲鱼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintZhClean":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9fd1","sourceSheet":"3独角兽兽群","sourceRow":39},"pack3_pet_0026":{"id":"pack3_pet_0026","kind":"pack3_pet_0026","packKey":"pack3","nameZh":"狮鹫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/狮鹫4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0026.png","iconMissing":false,"hintZhRaw":"8 页 4/¢\nCD 损坏 时 —> 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 => 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。\nSY 网 未 Ri wa FRO 2A1 9/1 DARED CRA Gh BED","hintZhClean":"8 页 4/\nCD 损坏 时 > 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 > 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"3独角兽兽群","sourceRow":43},"pack3_pet_0027":{"id":"pack3_pet_0027","kind":"pack3_pet_0027","packKey":"pack3","nameZh":"猎头蟹","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/猎头蟹2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0027.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9dd1","sourceSheet":"3独角兽兽群","sourceRow":45},"pack3_pet_0028":{"id":"pack3_pet_0028","kind":"pack3_pet_0028","packKey":"pack3","nameZh":"衔尾蛇","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/衔尾蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0028.png","iconMissing":false,"hintZhRaw":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +1 | 攻击 和 +1 @ 生命， 持续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +*2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\nM1) aise ns we MRIS | OR EEA oe ee? Bw tin. Ot 82 _ Ms) nb Bite EBay","hintZhClean":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +1 攻击 和 +1 生命, 持续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +*2 攻击 和 +2 全 生命 , 持 续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c68f","sourceSheet":"3独角兽兽群","sourceRow":46},"pack3_pet_0029":{"id":"pack3_pet_0029","kind":"pack3_pet_0029","packKey":"pack3","nameZh":"骷髅狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/骷髅狗.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0029.png","iconMissing":false,"hintZhRaw":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 @ tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 Ota.\n1) eet ob OHO AEN eK RA ee) A wtin.) @ +s","hintZhClean":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 攻击 和 +1 tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 攻击 和 +1 Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9bd1","sourceSheet":"3独角兽兽群","sourceRow":47},"pack3_pet_0030":{"id":"pack3_pet_0030","kind":"pack3_pet_0030","packKey":"pack3","nameZh":"魔力猎犬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/魔力猎犬.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0030.png","iconMissing":false,"hintZhRaw":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 ， 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,\nNS sacl wend ob KIM OS TRIS SEER CHORE es eee ames 内 本人 KRABI","hintZhClean":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 , 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"3独角兽兽群","sourceRow":48},"pack3_pet_0031":{"id":"pack3_pet_0031","kind":"pack3_pet_0031","packKey":"pack3","nameZh":"克拉肯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/克拉肯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0031.png","iconMissing":false,"hintZhRaw":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 @ 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.\nMEY re: raed ab CESK ES ah een Ko @ +4","hintZhClean":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"3独角兽兽群","sourceRow":52},"pack3_pet_0032":{"id":"pack3_pet_0032","kind":"pack3_pet_0032","packKey":"pack3","nameZh":"外星来客","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/外星来客2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0032.png","iconMissing":false,"hintZhRaw":"TE TQ 2/2\n受到 的 伤害 加 倍 ， 生 效 两 次 。","hintZhClean":"TE TQ 2/2\n受到 的 伤害 加 倍 , 生 效 两 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"3独角兽兽群","sourceRow":54},"pack3_pet_0033":{"id":"pack3_pet_0033","kind":"pack3_pet_0033","packKey":"pack3","nameZh":"大鹏鸟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/大鹏鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0033.png","iconMissing":false,"hintZhRaw":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 © 魔力 。 重 复 3 次 ， 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 ， 在 前 方 伙 伴 中 逐个 分 配 。\nNf bS ol WA Ot aod (2 XK 24 KO) Ow TRB. & mee ny wor Tr ascot oO) OF ch ik KA OR","hintZhClean":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 魔力 。 重 复 3 次 , 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 , 在 前 方 伙 伴 中 逐个 分 配 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"3独角兽兽群","sourceRow":55},"pack3_pet_0034":{"id":"pack3_pet_0034","kind":"pack3_pet_0034","packKey":"pack3","nameZh":"奇美拉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/奇美拉.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0034.png","iconMissing":false,"hintZhRaw":"ti\nOD sky = 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\nfi 和 品 下 Re 门人 一 和 个 Jonpti KE A eH e8,.) 人 wtw. @*s+","hintZhClean":"ti\nOD sky 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"3独角兽兽群","sourceRow":56},"pack3_pet_0035":{"id":"pack3_pet_0035","kind":"pack3_pet_0035","packKey":"pack3","nameZh":"弥诺陶洛斯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/弥诺陶洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0035.png","iconMissing":false,"hintZhRaw":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +2 @ 攻击 和 +2 Ota.\nNEY 六 pmp 二 nd ea 水生 在、 en? BM wtin.2 @*+s+","hintZhClean":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"3独角兽兽群","sourceRow":57},"pack3_pet_0036":{"id":"pack3_pet_0036","kind":"pack3_pet_0036","packKey":"pack3","nameZh":"憎恶","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/憎恶.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0036.png","iconMissing":false,"hintZhRaw":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 ， 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 | 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintZhClean":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 , 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"3独角兽兽群","sourceRow":58},"pack3_pet_0037":{"id":"pack3_pet_0037","kind":"pack3_pet_0037","packKey":"pack3","nameZh":"沙之蠕虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/沙之蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0037.png","iconMissing":false,"hintZhRaw":"1) ZB\nDOSER > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 @ 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\nNM? =o ot at ee SM RISEAY ORI ORL ee ie. A wt. @t> see eeizeeeison","hintZhClean":"1) ZB\nDOSER > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 生命 , 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 , 效 果 最 多 持续 至 刷新 8 次 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"3独角兽兽群","sourceRow":59},"pack3_pet_0038":{"id":"pack3_pet_0038","kind":"pack3_pet_0038","packKey":"pack3","nameZh":"独眼巨人","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独眼巨人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0038.png","iconMissing":false,"hintZhRaw":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 & BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 ， 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 & HM.\nNf 4b @2LéR e+ et Chee Fr A wee KM SAMO ree Se eo.) 会 Bh","hintZhClean":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 , 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 HM.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"3独角兽兽群","sourceRow":60},"pack3_pet_0039":{"id":"pack3_pet_0039","kind":"pack3_pet_0039","packKey":"pack3","nameZh":"独角兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独角兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0039.png","iconMissing":false,"hintZhRaw":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 @ 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。\nNf ble OM DR SE oR om IV PO EH KY el 78.) A wHwtin.? @ += 455 (7) & Ae BS 2","hintZhClean":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"3独角兽兽群","sourceRow":61},"pack3_pet_0040":{"id":"pack3_pet_0040","kind":"pack3_pet_0040","packKey":"pack3","nameZh":"蚁虎","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/蚁虎.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0040.png","iconMissing":false,"hintZhRaw":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 6 点 伤害 O.\nNf 合生 《生起 2323T SS Sent 3 +PMAAMA tH Lot FeaO 上 (全 合","hintZhClean":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"3独角兽兽群","sourceRow":62},"pack3_pet_0041":{"id":"pack3_pet_0041","kind":"pack3_pet_0041","packKey":"pack3","nameZh":"吸血蝙蝠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/吸血蝙蝠.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0041.png","iconMissing":false,"hintZhRaw":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 ， 并 获得 等 量 @ 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 ， 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。\nME) sek eee EH eb BE eS wm ON teem Oe mi eel HAO","hintZhClean":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 , 并 获得 等 量 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 , 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"3独角兽兽群","sourceRow":66},"pack3_pet_0042":{"id":"pack3_pet_0042","kind":"pack3_pet_0042","packKey":"pack3","nameZh":"坏狗狗","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/坏狗狗3.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0042.png","iconMissing":false,"hintZhRaw":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 〇 。\nfy 24 +8 4% cD eb Zoi ll co TKK A 1a /i emt aS SANEK Trea wes eresiecwe SX","hintZhClean":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"3独角兽兽群","sourceRow":69},"pack3_pet_0043":{"id":"pack3_pet_0043","kind":"pack3_pet_0043","packKey":"pack3","nameZh":"尼斯湖水怪","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/尼斯湖水怪1.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0043.png","iconMissing":false,"hintZhRaw":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +2 @ 攻击 和 +2 O tm,\nNf BER ab 72°F —_OCa/ame) Anes Mer wee te cl Ow OM Ser Riece se we.2? A wtin.2? @ +=","hintZhClean":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +2 攻击 和 +2 O tm,","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"3独角兽兽群","sourceRow":70},"pack3_pet_0044":{"id":"pack3_pet_0044","kind":"pack3_pet_0044","packKey":"pack3","nameZh":"智慧鲑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/智慧鲑鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0044.png","iconMissing":false,"hintZhRaw":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 @ 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 & 经 验 值 。\nME) re: Top ea CRBS EA OL Oe Te hace SB ee","hintZhClean":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 经 验 值 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"3独角兽兽群","sourceRow":72},"pack3_pet_0045":{"id":"pack3_pet_0045","kind":"pack3_pet_0045","packKey":"pack3","nameZh":"狐妖","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狐妖.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0045.png","iconMissing":false,"hintZhRaw":"狐 妊\nDO eee = 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。\nND)? a oe et ob DSR ee te teh AY mH CES OBES ET Ok","hintZhClean":"狐 妊\nDO eee 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"3独角兽兽群","sourceRow":73},"pack3_pet_0046":{"id":"pack3_pet_0046","kind":"pack3_pet_0046","packKey":"pack3","nameZh":"狼人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狼人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0046.png","iconMissing":false,"hintZhRaw":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 ， 获 得 +50% @ 攻击 和 全 生命 。 否 则 ， 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 ， 获 得 +100% @xtn 全 生命 。 否 则 ， 获 得 12 点 O 魔力 。\nNM) pec maar ab HSH ee ORM tno, M wt @+ es Km egies A e+","hintZhClean":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 , 获 得 +50% 攻击 和 全 生命 。 否 则 , 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 , 获 得 +100% xtn 全 生命 。 否 则 , 获 得 12 点 O 魔力 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"3独角兽兽群","sourceRow":74},"pack3_pet_0047":{"id":"pack3_pet_0047","kind":"pack3_pet_0047","packKey":"pack3","nameZh":"红龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/红龙2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0047.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"3独角兽兽群","sourceRow":76},"pack3_pet_0048":{"id":"pack3_pet_0048","kind":"pack3_pet_0048","packKey":"pack3","nameZh":"羊蹄鸟身龙虾","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/羊蹄鸟身龙虾2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0048.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f93","sourceSheet":"3独角兽兽群","sourceRow":78},"pack3_pet_0049":{"id":"pack3_pet_0049","kind":"pack3_pet_0049","packKey":"pack3","nameZh":"貔貅","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/貔貅.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0049.png","iconMissing":false,"hintZhRaw":"5 tk\nCO ame = 消耗 4 点 O 魔力 ， 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 ， 下 回合 获得 +6 人 金币。\n1) exces wb KE Ame 下 站 公共 和/ ao Nex","hintZhClean":"5 tk\nCO ame 消耗 4 点 O 魔力 , 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 , 下 回合 获得 +6 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cc","sourceSheet":"3独角兽兽群","sourceRow":79},"pack3_pet_0050":{"id":"pack3_pet_0050","kind":"pack3_pet_0050","packKey":"pack3","nameZh":"青蛙人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/青蛙人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0050.png","iconMissing":false,"hintZhRaw":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 和 +2 吉 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 @ 攻击 和 *4 二 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\nNY? op oe ty os ea 人 诈 革 共有 ”mp 二 Is @ Ht HAR OT RK HEA Ow","hintZhClean":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 攻击 和 +2 吉 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 攻击 和 *4 二 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"3独角兽兽群","sourceRow":80},"pack3_pet_0051":{"id":"pack3_pet_0051","kind":"pack3_pet_0051","packKey":"pack3","nameZh":"不死鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/不死鸟2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0051.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"3独角兽兽群","sourceRow":85},"pack3_pet_0052":{"id":"pack3_pet_0052","kind":"pack3_pet_0052","packKey":"pack3","nameZh":"九头蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/九头蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0052.png","iconMissing":false,"hintZhRaw":"九 头 蛇\nOQ) sre = 每 有 10 点 攻击 ， 便 召唤 一 个 5/5 的 头 。\n) CO srt = 每 有 10 点 攻击 ， 便 召唤 一 个 10/10 的 头 。\n1 men wm MHASH MMA ema","hintZhClean":"九 头 蛇\nOQ) sre 每 有 10 点 攻击 , 便 召唤 一 个 5/5 的 头 。\n) CO srt 每 有 10 点 攻击 , 便 召唤 一 个 10/10 的 头 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"3独角兽兽群","sourceRow":86},"pack3_pet_0053":{"id":"pack3_pet_0053","kind":"pack3_pet_0053","packKey":"pack3","nameZh":"刻耳柏洛斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/刻耳柏洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0053.png","iconMissing":false,"hintZhRaw":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 —> 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。\nfy 24 +8 4% cS 7 人 AD RDER el at hi #55 $% £8 21 At BS 2‘","hintZhClean":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 > 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"3独角兽兽群","sourceRow":87},"pack3_pet_0054":{"id":"pack3_pet_0054","kind":"pack3_pet_0054","packKey":"pack3","nameZh":"团队精神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/团队精神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0054.png","iconMissing":false,"hintZhRaw":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 @ 攻击 和 +*2 O 生命\nNY op oe Then Rt ea CESK Erol oe 257822 A wsti.? @ +s","hintZhClean":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 攻击 和 +*2 O 生命","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"3独角兽兽群","sourceRow":88},"pack3_pet_0055":{"id":"pack3_pet_0055","kind":"pack3_pet_0055","packKey":"pack3","nameZh":"斯雷普尼尔","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/斯雷普尼尔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0055.png","iconMissing":false,"hintZhRaw":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 ， 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 ， 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.\nfront ea MEI MR w ee —Aswae.) A est","hintZhClean":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 , 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 , 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"3独角兽兽群","sourceRow":89},"pack3_pet_0056":{"id":"pack3_pet_0056","kind":"pack3_pet_0056","packKey":"pack3","nameZh":"海蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/海蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0056.png","iconMissing":false,"hintZhRaw":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。\nNf iM Fe on 23 Ae OS Bw tote § IN — A StS A OS FM Tae ee fy Hk we","hintZhClean":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"3独角兽兽群","sourceRow":90},"pack3_pet_0057":{"id":"pack3_pet_0057","kind":"pack3_pet_0057","packKey":"pack3","nameZh":"羽蛇神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/羽蛇神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0057.png","iconMissing":false,"hintZhRaw":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B@ 经 验 值 。 触发 2 次 。\nNM) =o ot at ea CH _ ANIME Kee eB.) BA MOH Bh P22","hintZhClean":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B 经 验 值 。 触发 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"3独角兽兽群","sourceRow":91},"pack3_pet_0058":{"id":"pack3_pet_0058","kind":"pack3_pet_0058","packKey":"pack3","nameZh":"蝎尾狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/蝎尾狮.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0058.png","iconMissing":false,"hintZhRaw":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。\nNM) seb ome Re wD Hee","hintZhClean":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb5d1","sourceSheet":"3独角兽兽群","sourceRow":92},"pack3_pet_0059":{"id":"pack3_pet_0059","kind":"pack3_pet_0059","packKey":"pack3","nameZh":"贝希摩斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/贝希摩斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0059.png","iconMissing":false,"hintZhRaw":"Dl #5 FF BA\nOD 回合 结束 时 > 获得 +2 @xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\n哆 回合 结束 时 > 获得 +4 | 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\nNf Fl +t Bet ea 1278. 加 十 In Fr @ += The N44 SS BWaresiwBiinni","hintZhClean":"Dl 5 FF BA\nOD 回合 结束 时 > 获得 +2 xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100,\n哆 回合 结束 时 > 获得 +4 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100,","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ac8f","sourceSheet":"3独角兽兽群","sourceRow":93},"pack3_pet_0060":{"id":"pack3_pet_0060","kind":"pack3_pet_0060","packKey":"pack3","nameZh":"雪人","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/雪人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0060.png","iconMissing":false,"hintZhRaw":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。\nNf fal @ Tbh Re ab 77S ot Te On Ww Ell oe INRA Oo Oe OO MEO OCT OB! Sk 4 ae","hintZhClean":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cfd18f","sourceSheet":"3独角兽兽群","sourceRow":94},"pack4_pet_0001":{"id":"pack4_pet_0001","kind":"pack4_pet_0001","packKey":"pack4","nameZh":"喜鹊","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/喜鹊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0001.png","iconMissing":false,"hintZhRaw":"rs 8S\nQO 回合 结束 时 — 花费 至 多 1 @ 〇 金币 ， 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 ， 并 在 下 回合 重新 获得 之 。\nfy fa) + RY ome TT BE 22) eos t+ Xr Kh) > SS C738","hintZhClean":"rs 8S\nQO 回合 结束 时 花费 至 多 1 金币 , 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 , 并 在 下 回合 重新 获得 之 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb7","sourceSheet":"4金毛兽群","sourceRow":2},"pack4_pet_0002":{"id":"pack4_pet_0002","kind":"pack4_pet_0002","packKey":"pack4","nameZh":"土拨鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/土拨鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0002.png","iconMissing":false,"hintZhRaw":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。\nL3 晕厥时 -> 获得+3 喇叭。","hintZhClean":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a6","sourceSheet":"4金毛兽群","sourceRow":3},"pack4_pet_0003":{"id":"pack4_pet_0003","kind":"pack4_pet_0003","packKey":"pack4","nameZh":"斗牛犬","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/斗牛犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0003.png","iconMissing":false,"hintZhRaw":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。\nNS sem st ob Roc PT 二","hintZhClean":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb9","sourceSheet":"4金毛兽群","sourceRow":4},"pack4_pet_0004":{"id":"pack4_pet_0004","kind":"pack4_pet_0004","packKey":"pack4","nameZh":"旅鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/旅鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0004.png","iconMissing":false,"hintZhRaw":"旅居\nCO) 出 镶 时 =» 下 回合 获得 +1 O 金币。\n) ume => 下 回合 获得 +2 O 金币 。\nNS wee wa EKMom 8.2 f\\ os","hintZhClean":"旅居\nCO) 出 镶 时 下 回合 获得 +1 O 金币。\n) ume > 下 回合 获得 +2 O 金币 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"4金毛兽群","sourceRow":5},"pack4_pet_0005":{"id":"pack4_pet_0005","kind":"pack4_pet_0005","packKey":"pack4","nameZh":"芋螺","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/芋螺.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0005.png","iconMissing":false,"hintZhRaw":"+\nCD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac @ te","hintZhClean":"CD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac te","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"4金毛兽群","sourceRow":6},"pack4_pet_0006":{"id":"pack4_pet_0006","kind":"pack4_pet_0006","packKey":"pack4","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0006.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1aa","sourceSheet":"4金毛兽群","sourceRow":7},"pack4_pet_0007":{"id":"pack4_pet_0007","kind":"pack4_pet_0007","packKey":"pack4","nameZh":"蚕蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/蚕蛾.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0007.png","iconMissing":false,"hintZhRaw":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。\nNM) hp 到 人 pe ea he. 国生 全 mM Sse BHI","hintZhClean":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb4","sourceSheet":"4金毛兽群","sourceRow":8},"pack4_pet_0008":{"id":"pack4_pet_0008","kind":"pack4_pet_0008","packKey":"pack4","nameZh":"负鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/负鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0008.png","iconMissing":false,"hintZhRaw":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) CB 出 售 时 => 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 @ 攻击 和 +2 Ota.\nTE) ws oe et eh CHA EE he eae Ow Rt eee? Ow wtw.? @+-s","hintZhClean":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 攻击 和 +1 O tm.\n) CB 出 售 时 > 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"4金毛兽群","sourceRow":9},"pack4_pet_0009":{"id":"pack4_pet_0009","kind":"pack4_pet_0009","packKey":"pack4","nameZh":"鹅","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0009.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 => 使 最 前 排 的 政 人 -1 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2@ 攻击 .\nNM) pes) raed ea CBee > A wt","hintZhClean":"CD 战斗 开始 时 > 使 最 前 排 的 政 人 -1 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2 攻击 .\nNM) pes) raed ea CBee > A wt","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"4金毛兽群","sourceRow":10},"pack4_pet_0010":{"id":"pack4_pet_0010","kind":"pack4_pet_0010","packKey":"pack4","nameZh":"黑白花绒","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/黑白花绒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0010.png","iconMissing":false,"hintZhRaw":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy = 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言 〇\nfy oR ee 和 部 A miner ARs ise Lot reas ice","hintZhClean":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cb8fd1","sourceSheet":"4金毛兽群","sourceRow":11},"pack4_pet_0011":{"id":"pack4_pet_0011","kind":"pack4_pet_0011","packKey":"pack4","nameZh":"海胆","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海胆.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0011.png","iconMissing":false,"hintZhRaw":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are = 使 前 两 个 政 人 .5 @ Em.\nNS ment wa 人 一 人 天 CAH","hintZhClean":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are 使 前 两 个 政 人 .5 Em.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#96d18f","sourceSheet":"4金毛兽群","sourceRow":14},"pack4_pet_0012":{"id":"pack4_pet_0012","kind":"pack4_pet_0012","packKey":"pack4","nameZh":"海龟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海龟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0012.png","iconMissing":false,"hintZhRaw":"3\nD 伙伴 被 召唤 时 =» 使 其 获得 +2 @ 生命 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY? aoe ae Tmt eb CHE hac te < 站 人","hintZhClean":"D 伙伴 被 召唤 时 使 其 获得 +2 生命 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY aoe ae Tmt eb CHE hac te < 站 人","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cd8fd1","sourceSheet":"4金毛兽群","sourceRow":15},"pack4_pet_0013":{"id":"pack4_pet_0013","kind":"pack4_pet_0013","packKey":"pack4","nameZh":"狐獴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/狐獴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0013.png","iconMissing":false,"hintZhRaw":"AM aR\nOQ 战斗 开始 时 =» 本 回合 每 花费 4 人 〇 金币 ， 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 @ 〇 金币 ， 就 使 相 邻 伙伴 获得 *2 O 攻击 ，\nfy teach TT AR ab we Honma lf) om 69K I9 404 Oe 2579.2 MA Tb 二","hintZhClean":"AM aR\nOQ 战斗 开始 时 本 回合 每 花费 4 人 金币 , 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 金币 , 就 使 相 邻 伙伴 获得 *2 O 攻击 ,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#94d18f","sourceSheet":"4金毛兽群","sourceRow":16},"pack4_pet_0014":{"id":"pack4_pet_0014","kind":"pack4_pet_0014","packKey":"pack4","nameZh":"独角仙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/独角仙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0014.png","iconMissing":false,"hintZhRaw":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 @ 午 攻击， 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 ， 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\nEY us om tt em CHUL Ok EE ee Cech peeled 人 人 二 wt BOE ewe HeN THOR","hintZhClean":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 午 攻击, 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 , 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c68fd1","sourceSheet":"4金毛兽群","sourceRow":17},"pack4_pet_0015":{"id":"pack4_pet_0015","kind":"pack4_pet_0015","packKey":"pack4","nameZh":"白鼬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/白鼬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0015.png","iconMissing":false,"hintZhRaw":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 ， 并 使 其 变 为 1/1。\n小 出 售 时 => 召 歇 一 个 当前 阶 的 2 级 宠物 ， 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintZhClean":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 , 并 使 其 变 为 1/1。\n小 出 售 时 > 召 歇 一 个 当前 阶 的 2 级 宠物 , 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9bd18f","sourceSheet":"4金毛兽群","sourceRow":18},"pack4_pet_0016":{"id":"pack4_pet_0016","kind":"pack4_pet_0016","packKey":"pack4","nameZh":"蜥蜴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/蜥蜴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0016.png","iconMissing":false,"hintZhRaw":"oH OF\nCD 受伤 时 > BR—73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。\nNT) =u et ee 站 内 入 opnakss 忆 OE St ath","hintZhClean":"oH OF\nCD 受伤 时 > BR 73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c88fd1","sourceSheet":"4金毛兽群","sourceRow":19},"pack4_pet_0017":{"id":"pack4_pet_0017","kind":"pack4_pet_0017","packKey":"pack4","nameZh":"非洲企鹅","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/非洲企鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0017.png","iconMissing":false,"hintZhRaw":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 @ 攻击 。\n) CB 购买 时 => 使 三 个 随机 伙伴 获得 +2 @ 攻击\nNM) ast ab OHO A een oe 8. ? a wt","hintZhClean":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 攻击 。\n) CB 购买 时 > 使 三 个 随机 伙伴 获得 +2 攻击","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#99d18f","sourceSheet":"4金毛兽群","sourceRow":20},"pack4_pet_0018":{"id":"pack4_pet_0018","kind":"pack4_pet_0018","packKey":"pack4","nameZh":"鱿鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/鱿鱼1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0018.png","iconMissing":false,"hintZhRaw":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。\nL2 晕厥时 -> 花费1 喇叭使前两个敌人染墨。\nL3 晕厥时 -> 花费1 喇叭使前三个敌人染墨。","hintZhClean":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"4金毛兽群","sourceRow":21},"pack4_pet_0019":{"id":"pack4_pet_0019","kind":"pack4_pet_0019","packKey":"pack4","nameZh":"黑颈长脚鹬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/黑颈长脚鹬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0019.png","iconMissing":false,"hintZhRaw":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。\nL3 晕厥时 -> 获得+6 喇叭。","hintZhClean":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"4金毛兽群","sourceRow":23},"pack4_pet_0020":{"id":"pack4_pet_0020","kind":"pack4_pet_0020","packKey":"pack4","nameZh":"龟蚁","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/龟蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0020.png","iconMissing":false,"hintZhRaw":"& By\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +8 Ota.\nM1) ee wa OT Eee Otte Esl toh.) @ +e","hintZhClean":"By\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +8 Ota.","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bed18f","sourceSheet":"4金毛兽群","sourceRow":24},"pack4_pet_0021":{"id":"pack4_pet_0021","kind":"pack4_pet_0021","packKey":"pack4","nameZh":"五彩搏鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/五彩搏鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0021.png","iconMissing":false,"hintZhRaw":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, ， 或 攻击 造成 +3 伤 害 名 ， 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintZhClean":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, , 或 攻击 造成 +3 伤 害 名 , 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a38fd1","sourceSheet":"4金毛兽群","sourceRow":29},"pack4_pet_0022":{"id":"pack4_pet_0022","kind":"pack4_pet_0022","packKey":"pack4","nameZh":"刺尾鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/刺尾鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0022.png","iconMissing":false,"hintZhRaw":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.\n1) ect ab te) Aw BCR MORAL Hoo 8.1) @ +s","hintZhClean":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bcd18f","sourceSheet":"4金毛兽群","sourceRow":30},"pack4_pet_0023":{"id":"pack4_pet_0023","kind":"pack4_pet_0023","packKey":"pack4","nameZh":"狒狒","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/狒狒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0023.png","iconMissing":false,"hintZhRaw":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 @xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 @ 攻击 与 + O tm.\nNf fal & 42 3 Rt ab (8: 6 24 Be BG OD FE rt RO Bb OH) * RE 2 OO) Oe OB 7B. 2 a tty = &H—.2 r) ye >","hintZhClean":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 攻击 与 + O tm.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a58fd1","sourceSheet":"4金毛兽群","sourceRow":31},"pack4_pet_0024":{"id":"pack4_pet_0024","kind":"pack4_pet_0024","packKey":"pack4","nameZh":"珠鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/珠鸡.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0024.png","iconMissing":false,"hintZhRaw":"珠 鸡\nOO 受伤 时 = 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,\nNM) =u ps ea 2t7B.c D wn","hintZhClean":"珠 鸡\nOO 受伤 时 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bad18f","sourceSheet":"4金毛兽群","sourceRow":32},"pack4_pet_0025":{"id":"pack4_pet_0025","kind":"pack4_pet_0025","packKey":"pack4","nameZh":"皇霸鹟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/皇霸鹟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0025.png","iconMissing":false,"hintZhRaw":"CO =ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M=a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintZhClean":"CO ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a78fd1","sourceSheet":"4金毛兽群","sourceRow":33},"pack4_pet_0026":{"id":"pack4_pet_0026","kind":"pack4_pet_0026","packKey":"pack4","nameZh":"跳蚤","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/跳蚤2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0026.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b8d18f","sourceSheet":"4金毛兽群","sourceRow":35},"pack4_pet_0027":{"id":"pack4_pet_0027","kind":"pack4_pet_0027","packKey":"pack4","nameZh":"飞鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/飞鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0027.png","iconMissing":false,"hintZhRaw":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。\nfy ble O84 TI eb Ar 了 sr OR EIB F 人 tte St fp) & 4e 6a 3°","hintZhClean":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a98fd1","sourceSheet":"4金毛兽群","sourceRow":36},"pack4_pet_0028":{"id":"pack4_pet_0028","kind":"pack4_pet_0028","packKey":"pack4","nameZh":"鱼鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/鱼鹰.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0028.png","iconMissing":false,"hintZhRaw":"—\nOD say =» 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n)\n1) eee ot 力作 一 人 Dion 二 eg","hintZhClean":"OD say 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n1) eee ot 力作 一 人 Dion 二 eg","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b5d18f","sourceSheet":"4金毛兽群","sourceRow":37},"pack4_pet_0029":{"id":"pack4_pet_0029","kind":"pack4_pet_0029","packKey":"pack4","nameZh":"麝牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/麝牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0029.png","iconMissing":false,"hintZhRaw":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 @@ 攻击 和 +4 @ 生命 ， 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2? HB wtiic Ot yz 闲 丫 公","hintZhClean":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 攻击 和 +2 全 生命 , 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 攻击 和 +4 生命 , 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2 HB wtiic Ot yz 闲 丫 公","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ac8fd1","sourceSheet":"4金毛兽群","sourceRow":38},"pack4_pet_0030":{"id":"pack4_pet_0030","kind":"pack4_pet_0030","packKey":"pack4","nameZh":"黄鼠狼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/黄鼠狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0030.png","iconMissing":false,"hintZhRaw":"& EUR\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\n) sae 下 一 回合 获得 +1 O 金币 。\nNS men wa 下 站 全 六 f os","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9cd1","sourceSheet":"4金毛兽群","sourceRow":39},"pack4_pet_0031":{"id":"pack4_pet_0031","kind":"pack4_pet_0031","packKey":"pack4","nameZh":"凤头鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/凤头鹦鹉.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0031.png","iconMissing":false,"hintZhRaw":"CD 购买 时 => 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 => 使 最 高 阶 的 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc @ +","hintZhClean":"CD 购买 时 > 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 > 使 最 高 阶 的 伙伴 获得 +*4 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc +","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"4金毛兽群","sourceRow":43},"pack4_pet_0032":{"id":"pack4_pet_0032","kind":"pack4_pet_0032","packKey":"pack4","nameZh":"墨鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/墨鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0032.png","iconMissing":false,"hintZhRaw":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintZhClean":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ed1","sourceSheet":"4金毛兽群","sourceRow":45},"pack4_pet_0033":{"id":"pack4_pet_0033","kind":"pack4_pet_0033","packKey":"pack4","nameZh":"小头鼠海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/小头鼠海豚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0033.png","iconMissing":false,"hintZhRaw":"小 头 刀 海豚\nCD sry = 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey => 获得 +100% DMN (最少 +8 OS 喇叭 ) 。\nNE) exert we 共有 cro A wn (@e2.10 DA was","hintZhClean":"小 头 刀 海豚\nCD sry 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey > 获得 +100% DMN (最少 +8 OS 喇叭 ) 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c18f","sourceSheet":"4金毛兽群","sourceRow":46},"pack4_pet_0034":{"id":"pack4_pet_0034","kind":"pack4_pet_0034","packKey":"pack4","nameZh":"海牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0034.png","iconMissing":false,"hintZhRaw":"海牛\nDassen @ 受到 5 点 伤害 含 ， 并 使 最 近 的 前 方 伙 伴 获得 +2 @ 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 ， 并 使 最 近 的 前 方 伙伴 获得 +4 @ 攻击 与 +2 二 tH.\nNf mo +t Bee at Vc Se eH +h Eras roo ee. Aa wtc.2 Oo t=","hintZhClean":"海牛\nDassen 受到 5 点 伤害 含 , 并 使 最 近 的 前 方 伙 伴 获得 +2 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 , 并 使 最 近 的 前 方 伙伴 获得 +4 攻击 与 +2 二 tH.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"4金毛兽群","sourceRow":47},"pack4_pet_0035":{"id":"pack4_pet_0035","kind":"pack4_pet_0035","packKey":"pack4","nameZh":"海狮","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海狮.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0035.png","iconMissing":false,"hintZhRaw":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 ， 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击， 前方 的 所 有 伙伴 获得 +*2 @ tm.\nNf Fh) > ¢t Bet ab CEE OOS Brel Oe 2378.2 A ws aa SAW eet, Pen 小 全","hintZhClean":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 , 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击, 前方 的 所 有 伙伴 获得 +*2 tm.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"4金毛兽群","sourceRow":48},"pack4_pet_0036":{"id":"pack4_pet_0036","kind":"pack4_pet_0036","packKey":"pack4","nameZh":"箭毒蛙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/箭毒蛙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0036.png","iconMissing":false,"hintZhRaw":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.\n1 22 ea ok Rt ek EO Be rn 上 人 丰富","hintZhClean":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ad1","sourceSheet":"4金毛兽群","sourceRow":49},"pack4_pet_0037":{"id":"pack4_pet_0037","kind":"pack4_pet_0037","packKey":"pack4","nameZh":"蛞蝓","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蛞蝓.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0037.png","iconMissing":false,"hintZhRaw":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。\nNf @ Rt ad 72 4 “6/05 ,!.63 2@ (71.03 20 > FM A 2/209 22 | OF oe)","hintZhClean":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c58f","sourceSheet":"4金毛兽群","sourceRow":50},"pack4_pet_0038":{"id":"pack4_pet_0038","kind":"pack4_pet_0038","packKey":"pack4","nameZh":"蝠鲼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蝠鲼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0038.png","iconMissing":false,"hintZhRaw":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 ， 下 回合 获得 +2 〇 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 ， 下 回合 获得 +4 O £m.\nfy fal st BR eb INN TrSis 下 辣 全 让 ? 本 _C fom","hintZhClean":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 , 下 回合 获得 +2 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 , 下 回合 获得 +4 O m.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"4金毛兽群","sourceRow":51},"pack4_pet_0039":{"id":"pack4_pet_0039","kind":"pack4_pet_0039","packKey":"pack4","nameZh":"隼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/隼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0039.png","iconMissing":false,"hintZhRaw":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 => 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 | | ER CL AE Bb","hintZhClean":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 > 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 ER CL AE Bb","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"4金毛兽群","sourceRow":52},"pack4_pet_0040":{"id":"pack4_pet_0040","kind":"pack4_pet_0040","packKey":"pack4","nameZh":"高鼻羚羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/高鼻羚羊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0040.png","iconMissing":false,"hintZhRaw":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。\nL3 两个伙伴晕厥时 -> 获得+9 喇叭。","hintZhClean":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a48f","sourceSheet":"4金毛兽群","sourceRow":53},"pack4_pet_0041":{"id":"pack4_pet_0041","kind":"pack4_pet_0041","packKey":"pack4","nameZh":"护士鲨","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/护士鲨.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0041.png","iconMissing":false,"hintZhRaw":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 ， 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 ， 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\nNf BER ab Tee sac JD mini 34 — Amp inte be cP rR TBR Tt eee aN er","hintZhClean":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 , 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 , 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbbd1","sourceSheet":"4金毛兽群","sourceRow":57},"pack4_pet_0042":{"id":"pack4_pet_0042","kind":"pack4_pet_0042","packKey":"pack4","nameZh":"火蚁","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/火蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0042.png","iconMissing":false,"hintZhRaw":"CD Srey > 使 最 高 阶 的 伙伴 获得 @ 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 @ 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintZhClean":"CD Srey > 使 最 高 阶 的 伙伴 获得 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"4金毛兽群","sourceRow":58},"pack4_pet_0043":{"id":"pack4_pet_0043","kind":"pack4_pet_0043","packKey":"pack4","nameZh":"狼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0043.png","iconMissing":false,"hintZhRaw":"狼\nL1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintZhClean":"L1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbdd1","sourceSheet":"4金毛兽群","sourceRow":59},"pack4_pet_0044":{"id":"pack4_pet_0044","kind":"pack4_pet_0044","packKey":"pack4","nameZh":"猕猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/猕猴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0044.png","iconMissing":false,"hintZhRaw":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。\nMEY pe cl raed ab TI _ ACL bh Be on Se ES OIC CHET EIB DP","hintZhClean":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19f8f","sourceSheet":"4金毛兽群","sourceRow":60},"pack4_pet_0045":{"id":"pack4_pet_0045","kind":"pack4_pet_0045","packKey":"pack4","nameZh":"白斑羚","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白斑羚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0045.png","iconMissing":false,"hintZhRaw":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。\nL3 晕厥时 -> 获得+24 喇叭。","hintZhClean":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbfd1","sourceSheet":"4金毛兽群","sourceRow":61},"pack4_pet_0046":{"id":"pack4_pet_0046","kind":"pack4_pet_0046","packKey":"pack4","nameZh":"白鲸","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白鲸.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0046.png","iconMissing":false,"hintZhRaw":"B&F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 ， 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 ， 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。\nfy nS BE & et ab 7 6 SEE rh ot Peo ee Ot Tr OS ES R47 A Tr ae OO ERIS Sn","hintZhClean":"B F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 , 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 , 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19d8f","sourceSheet":"4金毛兽群","sourceRow":62},"pack4_pet_0047":{"id":"pack4_pet_0047","kind":"pack4_pet_0047","packKey":"pack4","nameZh":"蓝环章鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蓝环章鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0047.png","iconMissing":false,"hintZhRaw":"监 环 章鱼\nCO) 购买 时 = 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 => 使 伙伴 获得 +2 O 攻击 和 +2 @ tH,\nfy BTR at CREEK EI AY The tein? +s","hintZhClean":"监 环 章鱼\nCO) 购买 时 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 > 使 伙伴 获得 +2 O 攻击 和 +2 tH,","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc2d1","sourceSheet":"4金毛兽群","sourceRow":63},"pack4_pet_0048":{"id":"pack4_pet_0048","kind":"pack4_pet_0048","packKey":"pack4","nameZh":"蛇鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蛇鹫.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0048.png","iconMissing":false,"hintZhRaw":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 @ 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 @ 攻击 和 +8 Ota.\nNY =e A a ok Rt ee CBR A Es oe eo Mw tin.1) @ ts","hintZhClean":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 攻击 和 +8 Ota.\nNY e A a ok Rt ee CBR A Es oe eo Mw tin.1) ts","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"4金毛兽群","sourceRow":64},"pack4_pet_0049":{"id":"pack4_pet_0049","kind":"pack4_pet_0049","packKey":"pack4","nameZh":"鸸鹋","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鸸鹋.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0049.png","iconMissing":false,"hintZhRaw":"mS &S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 ， 并 将 其 移动 至 最 前 排 。\nNf ae 6 BoD em Pb Cl eh CB BBR AD Ae te Ol) Oe 87.) tm Hv ier ABs is","hintZhClean":"mS S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 , 并 将 其 移动 至 最 前 排 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"4金毛兽群","sourceRow":65},"pack4_pet_0050":{"id":"pack4_pet_0050","kind":"pack4_pet_0050","packKey":"pack4","nameZh":"鹤","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鹤.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0050.png","iconMissing":false,"hintZhRaw":"#5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 @Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 @wxs. 每 回合 生效 2 次 。\nfi 和 ae me ao ie Rt ea EEUU 4te ines Tb 二 SMS ab","hintZhClean":"5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 wxs. 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c6","sourceSheet":"4金毛兽群","sourceRow":66},"pack4_pet_0051":{"id":"pack4_pet_0051","kind":"pack4_pet_0051","packKey":"pack4","nameZh":"天堂鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/天堂鸟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0051.png","iconMissing":false,"hintZhRaw":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 | 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。\n1? se ose mt ea CET Aino 0% 28? BO wtw.2 @t se mS Ht ab,","hintZhClean":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f9b","sourceSheet":"4金毛兽群","sourceRow":70},"pack4_pet_0052":{"id":"pack4_pet_0052","kind":"pack4_pet_0052","packKey":"pack4","nameZh":"德国牧羊犬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/德国牧羊犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0052.png","iconMissing":false,"hintZhRaw":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 => 使 其 获得 此 宠物 50% 的 Oks, 4-4.\nNEY ab oe a 20 mt ea CHES TEI ees 人 wt tte ms","hintZhClean":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 , 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 > 使 其 获得 此 宠物 50% 的 Oks, 4-4.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c8","sourceSheet":"4金毛兽群","sourceRow":71},"pack4_pet_0053":{"id":"pack4_pet_0053","kind":"pack4_pet_0053","packKey":"pack4","nameZh":"无齿翼龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/无齿翼龙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0053.png","iconMissing":false,"hintZhRaw":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。\nND)? op oe eR eb KO Seem woe ZITA 2¢ 12 Sf OTK 41/71 4a, 4%, FS 、| AE Be QU","hintZhClean":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f99","sourceSheet":"4金毛兽群","sourceRow":72},"pack4_pet_0054":{"id":"pack4_pet_0054","kind":"pack4_pet_0054","packKey":"pack4","nameZh":"灰熊","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/灰熊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0054.png","iconMissing":false,"hintZhRaw":"TRAE\nQO 友 方 单位 攻击 五 次 后 @ 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.\nfi 生生 廊 吕 人 让 本 工 帮 户 天 人 入 卫 tn ein 上 人 丰富 全","hintZhClean":"TRAE\nQO 友 方 单位 攻击 五 次 后 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cb","sourceSheet":"4金毛兽群","sourceRow":73},"pack4_pet_0055":{"id":"pack4_pet_0055","kind":"pack4_pet_0055","packKey":"pack4","nameZh":"牛羚","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牛羚1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0055.png","iconMissing":false,"hintZhRaw":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。\nEY ve es te to ey A mini cece Ot OER CL AE ab YD","hintZhClean":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f96","sourceSheet":"4金毛兽群","sourceRow":74},"pack4_pet_0056":{"id":"pack4_pet_0056","kind":"pack4_pet_0056","packKey":"pack4","nameZh":"牡蛎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牡蛎.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0056.png","iconMissing":false,"hintZhRaw":"tt OF\nCO 出 售 时 > 获得 +3 @ 〇 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,\nNM) wee ab 证 四, of 人 公干","hintZhClean":"tt OF\nCO 出 售 时 > 获得 +3 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cd","sourceSheet":"4金毛兽群","sourceRow":76},"pack4_pet_0057":{"id":"pack4_pet_0057","kind":"pack4_pet_0057","packKey":"pack4","nameZh":"疣猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/疣猪.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0057.png","iconMissing":false,"hintZhRaw":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) een ab ib Seem rset CBN OL oe a8. M@ wtin.2 @*=-+","hintZhClean":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +1 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f94","sourceSheet":"4金毛兽群","sourceRow":77},"pack4_pet_0058":{"id":"pack4_pet_0058","kind":"pack4_pet_0058","packKey":"pack4","nameZh":"眼镜蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/眼镜蛇.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0058.png","iconMissing":false,"hintZhRaw":"BR $3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.\nfi 和 pmp 二 pa 入 xiinrh LCE REI SOT ENOL ie aA","hintZhClean":"BR 3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"4金毛兽群","sourceRow":78},"pack4_pet_0059":{"id":"pack4_pet_0059","kind":"pack4_pet_0059","packKey":"pack4","nameZh":"高地牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/高地牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0059.png","iconMissing":false,"hintZhRaw":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +2 侈 MO.\nNE? rs: raed ea 2578.19 AD win) bh eee ee eee) oom oke.2 DA wn","hintZhClean":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +2 侈 MO.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"4金毛兽群","sourceRow":79},"pack4_pet_0060":{"id":"pack4_pet_0060","kind":"pack4_pet_0060","packKey":"pack4","nameZh":"鲶鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/鲶鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0060.png","iconMissing":false,"hintZhRaw":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 一 次 ， 或 使 其 获得 +4 @ 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 两 次 ， 或 使 其 获得 +8 O tH.\nNf fal & Tbh Re ab 186 SF 24 ot BB IE OH OL 1 OY BD FD Oot Bt -人 A4- Ah — at 4% tf 257.1 @ AE am","hintZhClean":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 一 次 , 或 使 其 获得 +4 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 两 次 , 或 使 其 获得 +8 O tH.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b1d18f","sourceSheet":"4金毛兽群","sourceRow":80},"pack5_pet_0001":{"id":"pack5_pet_0001","kind":"pack5_pet_0001","packKey":"pack5","nameZh":"几维鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/几维鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0001.png","iconMissing":false,"hintZhRaw":"LES\nCD 受伤 时 & HM > SREHORASBRMBRG+1 @ 攻击 。\n受伤 时 & 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 @ 攻击 。\n小 -\nuch @ Wet ob HBC tt ae ee. Aa wes","hintZhClean":"LES\nCD 受伤 时 HM > SREHORASBRMBRG+1 攻击 。\n受伤 时 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 攻击 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"5海星兽群","sourceRow":2},"pack5_pet_0002":{"id":"pack5_pet_0002","kind":"pack5_pet_0002","packKey":"pack5","nameZh":"吉娃娃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/吉娃娃.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0002.png","iconMissing":false,"hintZhRaw":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。\nME) peel wae ea OH eB te Settee rh— we","hintZhClean":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"5海星兽群","sourceRow":3},"pack5_pet_0003":{"id":"pack5_pet_0003","kind":"pack5_pet_0003","packKey":"pack5","nameZh":"家鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/家鼠2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0003.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"5海星兽群","sourceRow":5},"pack5_pet_0004":{"id":"pack5_pet_0004","kind":"pack5_pet_0004","packKey":"pack5","nameZh":"狨猴","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/狨猴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0004.png","iconMissing":false,"hintZhRaw":"A\nCO 出 售 时 => 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintZhClean":"CO 出 售 时 > 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"5海星兽群","sourceRow":6},"pack5_pet_0005":{"id":"pack5_pet_0005","kind":"pack5_pet_0005","packKey":"pack5","nameZh":"萤火虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/萤火虫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0005.png","iconMissing":false,"hintZhRaw":"mK Dp\nOQ 票据 时 © 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay => 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.\n1S op cnt bd MN RI HEE Tee Bae","hintZhClean":"mK Dp\nOQ 票据 时 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay > 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"5海星兽群","sourceRow":7},"pack5_pet_0006":{"id":"pack5_pet_0006","kind":"pack5_pet_0006","packKey":"pack5","nameZh":"蜂鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蜂鸟2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0006.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"5海星兽群","sourceRow":9},"pack5_pet_0007":{"id":"pack5_pet_0007","kind":"pack5_pet_0007","packKey":"pack5","nameZh":"蟑螂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蟑螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0007.png","iconMissing":false,"hintZhRaw":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 @ SRA.\nCB She => 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n)\n1) exer ab 7274 _ A111 om ee tt 2? BD 42m","hintZhClean":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 SRA.\nCB She > 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n1) exer ab 7274 A111 om ee tt 2 BD 42m","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"5海星兽群","sourceRow":10},"pack5_pet_0008":{"id":"pack5_pet_0008","kind":"pack5_pet_0008","packKey":"pack5","nameZh":"雉鸡","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/雉鸡2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0008.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"5海星兽群","sourceRow":12},"pack5_pet_0009":{"id":"pack5_pet_0009","kind":"pack5_pet_0009","packKey":"pack5","nameZh":"青蛙","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/青蛙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0009.png","iconMissing":false,"hintZhRaw":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 ， 则 互 换 其 属性 。\n) 2) 出 售 时 => 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 ， 则 互 换 其 属性 。\nEY us oe et eh AN ER ARON AR AGL OK RR KID MCR UPI are","hintZhClean":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 , 则 互 换 其 属性 。\n) 2) 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 , 则 互 换 其 属性 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"5海星兽群","sourceRow":13},"pack5_pet_0010":{"id":"pack5_pet_0010","kind":"pack5_pet_0010","packKey":"pack5","nameZh":"鼠妇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/鼠妇1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0010.png","iconMissing":false,"hintZhRaw":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 => 转 积 两 个 免费 的 安眠 药 。\n1) wee ap MIO—AewmeHocws","hintZhClean":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 > 转 积 两 个 免费 的 安眠 药 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"5海星兽群","sourceRow":14},"pack5_pet_0011":{"id":"pack5_pet_0011","kind":"pack5_pet_0011","packKey":"pack5","nameZh":"小飞象章鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/小飞象章鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0011.png","iconMissing":false,"hintZhRaw":"| ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 1 〇 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 2 〇 SH.\nNS areca nt wa LL CIR ASR MOR DRIO_AYC EA HEME IY Os","hintZhClean":"ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 1 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 2 SH.","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"5海星兽群","sourceRow":18},"pack5_pet_0012":{"id":"pack5_pet_0012","kind":"pack5_pet_0012","packKey":"pack5","nameZh":"海蜇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/海蜇.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0012.png","iconMissing":false,"hintZhRaw":"9 6\nOD 伙伴 升级 时 > 获得 +1 @xsn-1 @ 生命\n) OB 伙伴 升级 时 => 获得 +2 @ 攻击 和 +2 O tm.\nNM) op oe tenet ea 2258.2 MA wstiw.? @ +s","hintZhClean":"9 6\nOD 伙伴 升级 时 > 获得 +1 xsn-1 生命\n) OB 伙伴 升级 时 > 获得 +2 攻击 和 +2 O tm.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"5海星兽群","sourceRow":19},"pack5_pet_0013":{"id":"pack5_pet_0013","kind":"pack5_pet_0013","packKey":"pack5","nameZh":"白鸽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/白鸽.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0013.png","iconMissing":false,"hintZhRaw":"三 下\nCO eae = 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 ， 且 相应 效果 变 为 两 倍 。\n1) eee ob BIT OKHATCHTEBR Siascwerno-e","hintZhClean":"三 下\nCO eae 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 , 且 相应 效果 变 为 两 倍 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"5海星兽群","sourceRow":20},"pack5_pet_0014":{"id":"pack5_pet_0014","kind":"pack5_pet_0014","packKey":"pack5","nameZh":"绿鬣蜥","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/绿鬣蜥.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0014.png","iconMissing":false,"hintZhRaw":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 @ HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 &@ 对 其 造成 4 点 伤害 人 @.\nMEY sek ah Tm Be ECHR ea MO BCS ROC EEED","hintZhClean":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 对 其 造成 4 点 伤害 人 .","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"5海星兽群","sourceRow":21},"pack5_pet_0015":{"id":"pack5_pet_0015","kind":"pack5_pet_0015","packKey":"pack5","nameZh":"考拉","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/考拉2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0015.png","iconMissing":false,"hintZhRaw":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 ， 生 效 一 次 。","hintZhClean":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"5海星兽群","sourceRow":23},"pack5_pet_0016":{"id":"pack5_pet_0016","kind":"pack5_pet_0016","packKey":"pack5","nameZh":"蝾螈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/蝾螈.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0016.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +2 @ 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn? AB wstin.2? @ ts","hintZhClean":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +2 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn AB wstin.2 ts","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"5海星兽群","sourceRow":24},"pack5_pet_0017":{"id":"pack5_pet_0017","kind":"pack5_pet_0017","packKey":"pack5","nameZh":"豚鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/豚鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0017.png","iconMissing":false,"hintZhRaw":"豚鼠\nOO 购买 时 = 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 => BR—22/20RM.\nNM) sos ab 72°40 2/2o8E","hintZhClean":"豚鼠\nOO 购买 时 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 > BR 22/20RM.","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"5海星兽群","sourceRow":25},"pack5_pet_0018":{"id":"pack5_pet_0018","kind":"pack5_pet_0018","packKey":"pack5","nameZh":"长尾山雀","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/长尾山雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0018.png","iconMissing":false,"hintZhRaw":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 ， 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 ， 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。\nNf 4 2¢ 2 BR ab Ff BS Teenie eee OP eS OZ eK Ia OL 45 [二 | & 4+ 869 Yr","hintZhClean":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 , 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 , 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"5海星兽群","sourceRow":26},"pack5_pet_0019":{"id":"pack5_pet_0019","kind":"pack5_pet_0019","packKey":"pack5","nameZh":"鲈鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鲈鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0019.png","iconMissing":false,"hintZhRaw":"鲈鱼\nCD 票 挨 时 & 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 & SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 & 经 验 值 。\n1S} mens po Ws tet om CRS OT a EHR oe ER. 2 OD tH","hintZhClean":"鲈鱼\nCD 票 挨 时 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"5海星兽群","sourceRow":27},"pack5_pet_0020":{"id":"pack5_pet_0020","kind":"pack5_pet_0020","packKey":"pack5","nameZh":"鹳","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0020.png","iconMissing":false,"hintZhRaw":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb _ RA EE NA _A CICA ER OO","hintZhClean":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb RA EE NA A CICA ER OO","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa0d1","sourceSheet":"5海星兽群","sourceRow":28},"pack5_pet_0021":{"id":"pack5_pet_0021","kind":"pack5_pet_0021","packKey":"pack5","nameZh":"哈巴狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/哈巴狗.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0021.png","iconMissing":false,"hintZhRaw":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 & 经 验 值 。\nME) pec) wae ea CRB EO) Oe eI. BS bzw","hintZhClean":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1be8f","sourceSheet":"5海星兽群","sourceRow":32},"pack5_pet_0022":{"id":"pack5_pet_0022","kind":"pack5_pet_0022","packKey":"pack5","nameZh":"水蛭","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水蛭.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0022.png","iconMissing":false,"hintZhRaw":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 ， 并 获得 等 量 全 生命\nNf fe) >} +t Be ab HBS EO OM Se See +7227 @ + -","hintZhClean":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 , 并 获得 等 量 全 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa3d1","sourceSheet":"5海星兽群","sourceRow":33},"pack5_pet_0023":{"id":"pack5_pet_0023","kind":"pack5_pet_0023","packKey":"pack5","nameZh":"水豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水豚.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0023.png","iconMissing":false,"hintZhRaw":"7K BR\nCD 刷新 时 & 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 Ota.\n) 哆 刷新 时 & 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 @ 攻击 和 +2 Ota.\nNf BIS e+ @ We ht am CHET BS Ww WOE os eee the. 2? BA wtin.? @ +=","hintZhClean":"7K BR\nCD 刷新 时 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 攻击 和 +1 Ota.\n) 哆 刷新 时 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bc8f","sourceSheet":"5海星兽群","sourceRow":34},"pack5_pet_0024":{"id":"pack5_pet_0024","kind":"pack5_pet_0024","packKey":"pack5","nameZh":"獾珈独","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/獾珈独.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0024.png","iconMissing":false,"hintZhRaw":"Ae 400 AR\nCD 剧 新 时 => 获得 +1 @ 攻击 和 +1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 => 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n1) arp ea 共有 ”mp 二 ri” Ot 这, 京 、 门人 mM SH Bee","hintZhClean":"Ae 400 AR\nCD 剧 新 时 > 获得 +1 攻击 和 +1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":35},"pack5_pet_0025":{"id":"pack5_pet_0025","kind":"pack5_pet_0025","packKey":"pack5","nameZh":"红毛猩猩","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红毛猩猩.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 @ 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.\n1) mace sn ea HH Se Bam et wet. 和 小 全","hintZhClean":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ba8f","sourceSheet":"5海星兽群","sourceRow":36},"pack5_pet_0026":{"id":"pack5_pet_0026","kind":"pack5_pet_0026","packKey":"pack5","nameZh":"红衣凤头鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红衣凤头鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0026.png","iconMissing":false,"hintZhRaw":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 2 〇 ) 金币 。\nfy 作证 二 Re TOLER mst ete Ooo HET ve 人 om","hintZhClean":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 , 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 , 并 使 其 价格 减 2 ) 金币 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa7d1","sourceSheet":"5海星兽群","sourceRow":37},"pack5_pet_0027":{"id":"pack5_pet_0027","kind":"pack5_pet_0027","packKey":"pack5","nameZh":"蟾蜍","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/蟾蜍2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0027.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b88f","sourceSheet":"5海星兽群","sourceRow":39},"pack5_pet_0028":{"id":"pack5_pet_0028","kind":"pack5_pet_0028","packKey":"pack5","nameZh":"金枪鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/金枪鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0028.png","iconMissing":false,"hintZhRaw":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 @ tm.\n) CB Bet > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\nNf Se BE Rt ae 485 MC HO 22 4 个 RAEN 4 OK ZEIBs 2 a Thy 2 2042 @ Ate &","hintZhClean":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 tm.\n) CB Bet > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"5海星兽群","sourceRow":40},"pack5_pet_0029":{"id":"pack5_pet_0029","kind":"pack5_pet_0029","packKey":"pack5","nameZh":"食蚁兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/食蚁兽2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0029.png","iconMissing":false,"hintZhRaw":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"5海星兽群","sourceRow":42},"pack5_pet_0030":{"id":"pack5_pet_0030","kind":"pack5_pet_0030","packKey":"pack5","nameZh":"鹤鸵","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/鹤鸵.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0030.png","iconMissing":false,"hintZhRaw":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 @@ 生命\n。 另 获得 +1 @ 攻击 ， 持 续 一 回合\n友 方 获得 草莓 时 @ R290 生命\n。 另 获得 +2 千 攻击， 持续 一 回合\n小 -\n> * Thi BER aa 28.2? @ + =\nowe. 2 a wt\nem ¢*® fs) &","hintZhClean":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 生命\n。 另 获得 +1 攻击 , 持 续 一 回合","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"5海星兽群","sourceRow":43},"pack5_pet_0031":{"id":"pack5_pet_0031","kind":"pack5_pet_0031","packKey":"pack5","nameZh":"仙女犰狳","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/仙女犰狳2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0031.png","iconMissing":false,"hintZhRaw":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。\nNW) mma week","hintZhClean":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"5海星兽群","sourceRow":49},"pack5_pet_0032":{"id":"pack5_pet_0032","kind":"pack5_pet_0032","packKey":"pack5","nameZh":"小丑鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/小丑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0032.png","iconMissing":false,"hintZhRaw":"小 丑 鱼\nOD REAR > 使 其 获得 +2 @ 攻击 和 +2 @ tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 @ 生命 。\nMM) +e ain ea Heme A wt. @ +2","hintZhClean":"小 丑 鱼\nOD REAR > 使 其 获得 +2 攻击 和 +2 tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"5海星兽群","sourceRow":50},"pack5_pet_0033":{"id":"pack5_pet_0033","kind":"pack5_pet_0033","packKey":"pack5","nameZh":"暹罗猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/暹罗猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0033.png","iconMissing":false,"hintZhRaw":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 获得 +1 @ 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 黎 得 +2 人 @ FM,\nfg 站 全 广 示 Re HHA AN ee OM KER HINKBHRe he Bw. Oa","hintZhClean":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 获得 +1 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 黎 得 +2 人 FM,","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"5海星兽群","sourceRow":51},"pack5_pet_0034":{"id":"pack5_pet_0034","kind":"pack5_pet_0034","packKey":"pack5","nameZh":"猎鹰","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/猎鹰.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0034.png","iconMissing":false,"hintZhRaw":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.\nNM) pec) wae ea 必要 AT) 生疏 1 上 个 十 全","hintZhClean":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"5海星兽群","sourceRow":52},"pack5_pet_0035":{"id":"pack5_pet_0035","kind":"pack5_pet_0035","packKey":"pack5","nameZh":"螳螂","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/螳螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0035.png","iconMissing":false,"hintZhRaw":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, ， 并 获得 +2 @ 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.\nNM) marron ab HiRes oe een aie ae ON tee. 让 二 IF @+s","hintZhClean":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, , 并 获得 +2 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"5海星兽群","sourceRow":53},"pack5_pet_0036":{"id":"pack5_pet_0036","kind":"pack5_pet_0036","packKey":"pack5","nameZh":"长尾灵猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/长尾灵猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0036.png","iconMissing":false,"hintZhRaw":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 ， 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 ， 使 前 两 个 敌人 2O tH.\nNM) pec) mae ea 由 中 人 向 症 parp 和 人 了 2 @+-s","hintZhClean":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 , 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 , 使 前 两 个 敌人 2O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"5海星兽群","sourceRow":54},"pack5_pet_0037":{"id":"pack5_pet_0037","kind":"pack5_pet_0037","packKey":"pack5","nameZh":"驴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/驴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0037.png","iconMissing":false,"hintZhRaw":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。\nNS? op oe Rt ab 4 只 Fn eg 2 DT 二 IRB cl A Bd","hintZhClean":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"5海星兽群","sourceRow":55},"pack5_pet_0038":{"id":"pack5_pet_0038","kind":"pack5_pet_0038","packKey":"pack5","nameZh":"鸭嘴兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/鸭嘴兽3.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0038.png","iconMissing":false,"hintZhRaw":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ 攻击 .\nE> us oe et em CHAE A HEN OL Ok ee. Hawt","hintZhClean":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"5海星兽群","sourceRow":58},"pack5_pet_0039":{"id":"pack5_pet_0039","kind":"pack5_pet_0039","packKey":"pack5","nameZh":"麋鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麋鹿.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0039.png","iconMissing":false,"hintZhRaw":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。\nNf fl & 4t Bede ab CE“ en SW me BE OE OK HU eH ANASatnc Com","hintZhClean":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"5海星兽群","sourceRow":59},"pack5_pet_0040":{"id":"pack5_pet_0040","kind":"pack5_pet_0040","packKey":"pack5","nameZh":"麻雀","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麻雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0040.png","iconMissing":false,"hintZhRaw":"FR £€\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。\nf 人 人 ee Ene Re 1/ 丰 ab ee ae oe ee ee","hintZhClean":"FR\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"5海星兽群","sourceRow":60},"pack5_pet_0041":{"id":"pack5_pet_0041","kind":"pack5_pet_0041","packKey":"pack5","nameZh":"三角龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/三角龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0041.png","iconMissing":false,"hintZhRaw":"","hintZhClean":"","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"5海星兽群","sourceRow":64},"pack5_pet_0042":{"id":"pack5_pet_0042","kind":"pack5_pet_0042","packKey":"pack5","nameZh":"仓鼠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/仓鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0042.png","iconMissing":false,"hintZhRaw":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。\nNM) aise ea 1B RIS OI Se","hintZhClean":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"5海星兽群","sourceRow":65},"pack5_pet_0043":{"id":"pack5_pet_0043","kind":"pack5_pet_0043","packKey":"pack5","nameZh":"剑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/剑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0043.png","iconMissing":false,"hintZhRaw":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 〇 。\nfy te cl TT ARA ab 3 了 直人 们 加 0 了 bin 4 ise Ol OTS 二 ONIN Hs Se ON","hintZhClean":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"5海星兽群","sourceRow":66},"pack5_pet_0044":{"id":"pack5_pet_0044","kind":"pack5_pet_0044","packKey":"pack5","nameZh":"啄木鸟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/啄木鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0044.png","iconMissing":false,"hintZhRaw":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。\nfy ta cl TT PRA eb 3 了 | 品 :FAN 下 人 二 下 -Rh 这 FF 人 1 二 As SNe ONE LOE PU ICTS","hintZhClean":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b48fd1","sourceSheet":"5海星兽群","sourceRow":67},"pack5_pet_0045":{"id":"pack5_pet_0045","kind":"pack5_pet_0045","packKey":"pack5","nameZh":"水滴鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/水滴鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0045.png","iconMissing":false,"hintZhRaw":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B@ 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\nNf SBR ab HEIR M LA LS KH OK hi. ? BA eee ES 、| cto BOO LS MM O61 OK RIB IM oo","hintZhClean":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#add18f","sourceSheet":"5海星兽群","sourceRow":68},"pack5_pet_0046":{"id":"pack5_pet_0046","kind":"pack5_pet_0046","packKey":"pack5","nameZh":"海星","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/海星.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0046.png","iconMissing":false,"hintZhRaw":"海星\nCD 出 镶 3 级 伙伴 时 => 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 => 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 @ 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\nfy 条 QtRi 人 Re OR BE Tre OK ee DY the en. 2 OOD OH Ot eT Se RIN miIAh we Hie","hintZhClean":"海星\nCD 出 镶 3 级 伙伴 时 > 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 > 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"5海星兽群","sourceRow":69},"pack5_pet_0047":{"id":"pack5_pet_0047","kind":"pack5_pet_0047","packKey":"pack5","nameZh":"秃鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/秃鹫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0047.png","iconMissing":false,"hintZhRaw":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) =A ook BR ob tH _ AEN Se LCE PILI REREAD","hintZhClean":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) A ook BR ob tH AEN Se LCE PILI REREAD","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aad18f","sourceSheet":"5海星兽群","sourceRow":70},"pack5_pet_0048":{"id":"pack5_pet_0048","kind":"pack5_pet_0048","packKey":"pack5","nameZh":"羱羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/羱羊.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0048.png","iconMissing":false,"hintZhRaw":"R=\nCD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintZhClean":"CD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"5海星兽群","sourceRow":71},"pack5_pet_0049":{"id":"pack5_pet_0049","kind":"pack5_pet_0049","packKey":"pack5","nameZh":"鲸头鹳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鲸头鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0049.png","iconMissing":false,"hintZhRaw":"BRK #\nOQ) 回合 开始 时 => 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。\nfy 辣 们 这 hpARA ebm Ut Be ROB 8k a 10 OY te te t9.819 6 全 全","hintZhClean":"BRK\nOQ) 回合 开始 时 > 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"5海星兽群","sourceRow":72},"pack5_pet_0050":{"id":"pack5_pet_0050","kind":"pack5_pet_0050","packKey":"pack5","nameZh":"鹈鹕","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鹈鹕1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0050.png","iconMissing":false,"hintZhRaw":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL2 战斗开始时 -> 吞噬前方两个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL3 战斗开始时 -> 吞噬前方三个草莓伙伴，并在晕厥时将其变成鲑鱼。","hintZhClean":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴,并在晕厥时将其变成鲑鱼。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"5海星兽群","sourceRow":73},"pack5_pet_0051":{"id":"pack5_pet_0051","kind":"pack5_pet_0051","packKey":"pack5","nameZh":"剑齿虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/剑齿虎1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0051.png","iconMissing":false,"hintZhRaw":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL2 晕厥时 -> 召唤两个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL3 晕厥时 -> 召唤三个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。","hintZhClean":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸,且此宠物每受伤一次,使其获得+2 攻击和+3 生命。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"5海星兽群","sourceRow":78},"pack5_pet_0052":{"id":"pack5_pet_0052","kind":"pack5_pet_0052","packKey":"pack5","nameZh":"棘背龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/棘背龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0052.png","iconMissing":false,"hintZhRaw":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 @ 攻击 和 *6 Ot.\nNY? aoe eR eb CRA an on oe ac BM wt. @ +s","hintZhClean":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 攻击 和 *6 Ot.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"5海星兽群","sourceRow":80},"pack5_pet_0053":{"id":"pack5_pet_0053","kind":"pack5_pet_0053","packKey":"pack5","nameZh":"真迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/真迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0053.png","iconMissing":false,"hintZhRaw":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。\nNY? one ee teen ab CBA MM SOHO ARS a","hintZhClean":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"5海星兽群","sourceRow":81},"pack5_pet_0054":{"id":"pack5_pet_0054","kind":"pack5_pet_0054","packKey":"pack5","nameZh":"羊驼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/羊驼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0054.png","iconMissing":false,"hintZhRaw":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 => 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintZhClean":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 > 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"5海星兽群","sourceRow":82},"pack5_pet_0055":{"id":"pack5_pet_0055","kind":"pack5_pet_0055","packKey":"pack5","nameZh":"菊石","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/菊石2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0055.png","iconMissing":false,"hintZhRaw":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n1) ws ab HK AK SBS Le EEA","hintZhClean":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"5海星兽群","sourceRow":84},"pack5_pet_0056":{"id":"pack5_pet_0056","kind":"pack5_pet_0056","packKey":"pack5","nameZh":"虎鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/虎鲸.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0056.png","iconMissing":false,"hintZhRaw":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。\n1) eee ob (OR MH RMO ACI COO Bw is","hintZhClean":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"5海星兽群","sourceRow":85},"pack5_pet_0057":{"id":"pack5_pet_0057","kind":"pack5_pet_0057","packKey":"pack5","nameZh":"迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0057.png","iconMissing":false,"hintZhRaw":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 ， 使 所 有 伙伴 获得 +2 @xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 ， 使 所 有 伙伴 获得 +4 @ 攻击 和 *6 O tm.\nNf 4 2¢ ty SRS at (2 3 At te Oh tS te Bmw et 43 BR Se Os O% BSB a The 2 3020 r) ye >","hintZhClean":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 , 使 所 有 伙伴 获得 +2 xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 , 使 所 有 伙伴 获得 +4 攻击 和 *6 O tm.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"5海星兽群","sourceRow":86},"pack5_pet_0058":{"id":"pack5_pet_0058","kind":"pack5_pet_0058","packKey":"pack5","nameZh":"食人鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/食人鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0058.png","iconMissing":false,"hintZhRaw":"RAS\nOQ 受伤 时 = 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.\nNS xt ae wa CEB Trio Bo Mbt","hintZhClean":"RAS\nOQ 受伤 时 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"5海星兽群","sourceRow":87},"pack5_pet_0059":{"id":"pack5_pet_0059","kind":"pack5_pet_0059","packKey":"pack5","nameZh":"驯鹿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/驯鹿2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0059.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"5海星兽群","sourceRow":89},"pack5_pet_0060":{"id":"pack5_pet_0060","kind":"pack5_pet_0060","packKey":"pack5","nameZh":"鸵鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/鸵鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0060.png","iconMissing":false,"hintZhRaw":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 @ 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。\nNS plas wa SETTAAN SEE SEM EPR ORI SE eee ORE roe eRe OE) MOH BA","hintZhClean":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":90},"pack6_pet_0001":{"id":"pack6_pet_0001","kind":"pack6_pet_0001","packKey":"pack6","nameZh":"壁虎","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/壁虎.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0001.png","iconMissing":false,"hintZhRaw":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 ， 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 ， 获得 +4 @ 生命 。\nNM) rs: mwaoe eb Om Sic me 共有 Mts","hintZhClean":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 , 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 , 获得 +4 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"6幼犬兽群","sourceRow":2},"pack6_pet_0003":{"id":"pack6_pet_0003","kind":"pack6_pet_0003","packKey":"pack6","nameZh":"瓢虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/瓢虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0003.png","iconMissing":false,"hintZhRaw":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击， 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 ， 持 续 一 回合 。\nfy rest PL a ee 让 Ie Tb 二 于 -站 人 心","hintZhClean":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击, 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 , 持 续 一 回合 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"6幼犬兽群","sourceRow":4},"pack6_pet_0004":{"id":"pack6_pet_0004","kind":"pack6_pet_0004","packKey":"pack6","nameZh":"甲鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/甲鱼2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0004.png","iconMissing":false,"hintZhRaw":"胡桃 A 2\n屏蔽 2 点 伤害 侠 ， 生 效 一 次 。","hintZhClean":"胡桃 A 2\n屏蔽 2 点 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":6},"pack6_pet_0005":{"id":"pack6_pet_0005","kind":"pack6_pet_0005","packKey":"pack6","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0005.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":7},"pack6_pet_0006":{"id":"pack6_pet_0006","kind":"pack6_pet_0006","packKey":"pack6","nameZh":"蓝鸲","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蓝鸲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0006.png","iconMissing":false,"hintZhRaw":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 @ wa.\nNM) =o ot at ee O_o ow 8? A ws","hintZhClean":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 wa.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"6幼犬兽群","sourceRow":8},"pack6_pet_0007":{"id":"pack6_pet_0007","kind":"pack6_pet_0007","packKey":"pack6","nameZh":"蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蛾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0007.png","iconMissing":false,"hintZhRaw":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 。\nME) pec) Tan ea CBS te eet ec A ws","hintZhClean":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"6幼犬兽群","sourceRow":9},"pack6_pet_0008":{"id":"pack6_pet_0008","kind":"pack6_pet_0008","packKey":"pack6","nameZh":"雪貂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/雪貂1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0008.png","iconMissing":false,"hintZhRaw":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。\nL2 回合开始时 -> 选择一个2级的雪貂玩具。\nL3 回合开始时 -> 选择一个3级的雪貂玩具。","hintZhClean":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":10},"pack6_pet_0009":{"id":"pack6_pet_0009","kind":"pack6_pet_0009","packKey":"pack6","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":13},"pack6_pet_0010":{"id":"pack6_pet_0010","kind":"pack6_pet_0010","packKey":"pack6","nameZh":"龙猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/龙猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0010.png","iconMissing":false,"hintZhRaw":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 => 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。\nEY us om et em 22H _ AC ICON 2ER Dee wh He at","hintZhClean":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 > 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"6幼犬兽群","sourceRow":14},"pack6_pet_0011":{"id":"pack6_pet_0011","kind":"pack6_pet_0011","packKey":"pack6","nameZh":"兔耳袋狸","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/兔耳袋狸2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0011.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"6幼犬兽群","sourceRow":18},"pack6_pet_0012":{"id":"pack6_pet_0012","kind":"pack6_pet_0012","packKey":"pack6","nameZh":"单峰驼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/单峰驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0012.png","iconMissing":false,"hintZhRaw":"& le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) BOSH © 使 商店 最 左 侧 的 两 个 宠物 获得 +2 @ 攻击 和 *+*2 @O tH.\nNM marron ob CHEE Bt wm BA went. @ wtin.2 @ +s","hintZhClean":"le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 攻击 和 +1 O tm.\n) BOSH 使 商店 最 左 侧 的 两 个 宠物 获得 +2 攻击 和 *+*2 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"6幼犬兽群","sourceRow":19},"pack6_pet_0013":{"id":"pack6_pet_0013","kind":"pack6_pet_0013","packKey":"pack6","nameZh":"山魈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/山魈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0013.png","iconMissing":false,"hintZhRaw":"LL) #5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。\nfi 和 总 区 ab ECM BY COE EIS RIX","hintZhClean":"LL) 5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"6幼犬兽群","sourceRow":20},"pack6_pet_0014":{"id":"pack6_pet_0014","kind":"pack6_pet_0014","packKey":"pack6","nameZh":"欧洲鳇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/欧洲鳇2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0014.png","iconMissing":true,"hintZhRaw":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintZhClean":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":22},"pack6_pet_0015":{"id":"pack6_pet_0015","kind":"pack6_pet_0015","packKey":"pack6","nameZh":"狐猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/狐猴4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0015.png","iconMissing":false,"hintZhRaw":"SBE SE 页 4/4\nCD 战斗 开始 时 —> 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。\nMEY pec) raed ea CRBS IK Ao) oe Bite tee","hintZhClean":"SBE SE 页 4/4\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":26},"pack6_pet_0016":{"id":"pack6_pet_0016","kind":"pack6_pet_0016","packKey":"pack6","nameZh":"知更鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/知更鸟3.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0016.png","iconMissing":true,"hintZhRaw":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 ， 生 效 一 次 。","hintZhClean":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"6幼犬兽群","sourceRow":29},"pack6_pet_0017":{"id":"pack6_pet_0017","kind":"pack6_pet_0017","packKey":"pack6","nameZh":"虎斑猫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虎斑猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0017.png","iconMissing":false,"hintZhRaw":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 ， 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 ， 持 续 一 回合 .\nME) + ee sett ob Ch A ENOL oe 2 te tems","hintZhClean":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 , 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 , 持 续 一 回合 .","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"6幼犬兽群","sourceRow":30},"pack6_pet_0018":{"id":"pack6_pet_0018","kind":"pack6_pet_0018","packKey":"pack6","nameZh":"虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0018.png","iconMissing":false,"hintZhRaw":"oF\nCD 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ，\n) CB 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。\nfi 人 41, oe a Us om Ae am (5h pain ol Oe 2h. 2? @ +s 48 fr) & A&E Bb >","hintZhClean":"oF\nCD 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ,\n) CB 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":31},"pack6_pet_0019":{"id":"pack6_pet_0019","kind":"pack6_pet_0019","packKey":"pack6","nameZh":"蝙蝠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/蝙蝠2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0019.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":33},"pack6_pet_0020":{"id":"pack6_pet_0020","kind":"pack6_pet_0020","packKey":"pack6","nameZh":"金鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/金鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0020.png","iconMissing":false,"hintZhRaw":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 = 出 售 价格 加 2 O em.\nfy 全 TITTphpA ee Wt Metin f) 总 不","hintZhClean":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 出 售 价格 加 2 O em.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"6幼犬兽群","sourceRow":34},"pack6_pet_0021":{"id":"pack6_pet_0021","kind":"pack6_pet_0021","packKey":"pack6","nameZh":"巨嘴鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/巨嘴鸟.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0021.png","iconMissing":false,"hintZhRaw":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。\nNf St > th = oS ab WOR ee) KAO ete = 6f( PTE CUM ENS BORA KAMA CK OI ee","hintZhClean":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"6幼犬兽群","sourceRow":38},"pack6_pet_0022":{"id":"pack6_pet_0022","kind":"pack6_pet_0022","packKey":"pack6","nameZh":"戴胜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/戴胜.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0022.png","iconMissing":false,"hintZhRaw":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintZhClean":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"6幼犬兽群","sourceRow":39},"pack6_pet_0023":{"id":"pack6_pet_0023","kind":"pack6_pet_0023","packKey":"pack6","nameZh":"热带鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/热带鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0023.png","iconMissing":false,"hintZhRaw":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 @ tH.\n) CO 回合 开始 时 => 使 相 邻 伙伴 获得 +2 O tH.\nfy fal & bet ed $6184 Oe 25782 +","hintZhClean":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 tH.\n) CO 回合 开始 时 > 使 相 邻 伙伴 获得 +2 O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"6幼犬兽群","sourceRow":40},"pack6_pet_0024":{"id":"pack6_pet_0024","kind":"pack6_pet_0024","packKey":"pack6","nameZh":"猫头鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/猫头鹰1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0024.png","iconMissing":false,"hintZhRaw":"猫 头 应 页 1/:\nDO 回合 开始 时 © 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。\nNM marron ad TOURS el","hintZhClean":"猫 头 应 页 1/:\nDO 回合 开始 时 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"6幼犬兽群","sourceRow":41},"pack6_pet_0025":{"id":"pack6_pet_0025","kind":"pack6_pet_0025","packKey":"pack6","nameZh":"破壳鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/破壳鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0025.png","iconMissing":false,"hintZhRaw":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 @xtH-3 O 生命 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 @ 攻击 和 +2 @ 生命 。\nNM) =o ot ee ee 人 二 是:Fona Eo oe er.) 2 ,zhe 人 让","hintZhClean":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 xtH-3 O 生命 , 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"6幼犬兽群","sourceRow":43},"pack6_pet_0026":{"id":"pack6_pet_0026","kind":"pack6_pet_0026","packKey":"pack6","nameZh":"穿山甲","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/穿山甲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0026.png","iconMissing":false,"hintZhRaw":"Fw\nCD SRY > 如 果 有 玩具 ， 使 最 近 的 后 方 伙 伴 获 得 +*4 @ 生命 。\n小 RAKY PD 如 果 有 玩具 ， 使 最 近 的 后 方 伙伴 获得 +8 @ tm,\n1) eee eb ESI mM CRB RM Kom.) @ +s","hintZhClean":"Fw\nCD SRY > 如 果 有 玩具 , 使 最 近 的 后 方 伙 伴 获 得 +*4 生命 。\n小 RAKY PD 如 果 有 玩具 , 使 最 近 的 后 方 伙伴 获得 +8 tm,","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"6幼犬兽群","sourceRow":44},"pack6_pet_0027":{"id":"pack6_pet_0027","kind":"pack6_pet_0027","packKey":"pack6","nameZh":"紫蛙","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/紫蛙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0027.png","iconMissing":false,"hintZhRaw":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 => 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 2 次 。\nND) aoe ae Tmt ek MOTH MMEMeA They OIRO Om SH Ab 2","hintZhClean":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"6幼犬兽群","sourceRow":45},"pack6_pet_0028":{"id":"pack6_pet_0028","kind":"pack6_pet_0028","packKey":"pack6","nameZh":"野兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/野兔.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0028.png","iconMissing":false,"hintZhRaw":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 => 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。\nEY ver ee 和香 s 入 了 in 入 在 用 人 全 sn 性 IER Cl te aby","hintZhClean":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"6幼犬兽群","sourceRow":46},"pack6_pet_0029":{"id":"pack6_pet_0029","kind":"pack6_pet_0029","packKey":"pack6","nameZh":"长吻鳄","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/长吻鳄2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0029.png","iconMissing":false,"hintZhRaw":"ae 页 2/4\nCD 损坏 时 => 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 => 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。\nNY 人 水 pr ea CRO NH AGL OK CEI ote","hintZhClean":"ae 页 2/4\nCD 损坏 时 > 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 > 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa0","sourceSheet":"6幼犬兽群","sourceRow":48},"pack6_pet_0030":{"id":"pack6_pet_0030","kind":"pack6_pet_0030","packKey":"pack6","nameZh":"鼹鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/鼹鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0030.png","iconMissing":false,"hintZhRaw":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM_O1E/1 om ORD","hintZhClean":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM O1E/1 om ORD","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"6幼犬兽群","sourceRow":51},"pack6_pet_0031":{"id":"pack6_pet_0031","kind":"pack6_pet_0031","packKey":"pack6","nameZh":"变色龙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/变色龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0031.png","iconMissing":false,"hintZhRaw":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 ， 最 高 为 1 级， 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 ， 最 高 为 2 级 ， 持 续 一 回合 。\nNM aace sn ea SHIEK Ssh BeHUR 这/ 素 _ 站 属","hintZhClean":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 , 最 高 为 1 级, 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 , 最 高 为 2 级 , 持 续 一 回合 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"6幼犬兽群","sourceRow":55},"pack6_pet_0032":{"id":"pack6_pet_0032","kind":"pack6_pet_0032","packKey":"pack6","nameZh":"塔尔羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/塔尔羊2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0032.png","iconMissing":false,"hintZhRaw":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintZhClean":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"6幼犬兽群","sourceRow":57},"pack6_pet_0033":{"id":"pack6_pet_0033","kind":"pack6_pet_0033","packKey":"pack6","nameZh":"幼犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/幼犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0033.png","iconMissing":false,"hintZhRaw":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。\nNM marron ab :友人 Donnnch wee","hintZhClean":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"6幼犬兽群","sourceRow":58},"pack6_pet_0034":{"id":"pack6_pet_0034","kind":"pack6_pet_0034","packKey":"pack6","nameZh":"微生物","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/微生物2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0034.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"6幼犬兽群","sourceRow":63},"pack6_pet_0035":{"id":"pack6_pet_0035","kind":"pack6_pet_0035","packKey":"pack6","nameZh":"杜宾犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/杜宾犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0035.png","iconMissing":false,"hintZhRaw":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 => 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 村 子 特性 。\n) C3 战斗 开始 时 = 获得 +16 O 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 醒 子 特性 。\nfy Fe cl TT AR em 13578204 TR 人 二 MP ER TOE RRO TIMOR TATED tte","hintZhClean":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 > 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 , 还 会 获得 村 子 特性 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"6幼犬兽群","sourceRow":64},"pack6_pet_0036":{"id":"pack6_pet_0036","kind":"pack6_pet_0036","packKey":"pack6","nameZh":"毛毛虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/毛毛虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0036.png","iconMissing":false,"hintZhRaw":"毛毛 虫\nOO) 回合 开始 时 =» 获得 +1 & 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。\nfy tec] WARS eb TF HMA 1 OH OUD 二 + 8 ants 3 O watts 1 ah & wr","hintZhClean":"毛毛 虫\nOO) 回合 开始 时 获得 +1 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"6幼犬兽群","sourceRow":66},"pack6_pet_0037":{"id":"pack6_pet_0037","kind":"pack6_pet_0037","packKey":"pack6","nameZh":"水牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/水牛.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0037.png","iconMissing":false,"hintZhRaw":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 @ 攻击 和 +4 @ 生命 ， 持 续 一 回合 .\nNY op oe am em et ae E08 ac Mwtiw.c @ te 1244 _ ms","hintZhClean":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 攻击 和 +4 生命 , 持 续 一 回合 .","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"6幼犬兽群","sourceRow":67},"pack6_pet_0038":{"id":"pack6_pet_0038","kind":"pack6_pet_0038","packKey":"pack6","nameZh":"美洲驼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/美洲驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0038.png","iconMissing":false,"hintZhRaw":"NIE\nOQ 回合 结束 时 @ 如 果 有 空位 ， 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 ， 获 得 +2 轩 攻击 和 +4 O tH,\nfy inl &@ ¢2 DBRS a ff | Ty Sods Fe T1 Pell @ ee ee oe","hintZhClean":"NIE\nOQ 回合 结束 时 如 果 有 空位 , 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 , 获 得 +2 轩 攻击 和 +4 O tH,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cf8fd1","sourceSheet":"6幼犬兽群","sourceRow":68},"pack6_pet_0039":{"id":"pack6_pet_0039","kind":"pack6_pet_0039","packKey":"pack6","nameZh":"鲸鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/鲸鲨.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0039.png","iconMissing":false,"hintZhRaw":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +1 O 攻击 和 +1 @@ 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH=E,\nfy Poel Lie ie Oe ee ee E22 AC et Pee Tb 十 了 ID 小 和 Cee a eet","hintZhClean":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +1 O 攻击 和 +1 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH E,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#92d18f","sourceSheet":"6幼犬兽群","sourceRow":69},"pack6_pet_0040":{"id":"pack6_pet_0040","kind":"pack6_pet_0040","packKey":"pack6","nameZh":"龙虾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/龙虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0040.png","iconMissing":false,"hintZhRaw":"龙 是\nCD 伙伴 被 召唤 时 =D 如 果 在 战斗 外 ， 使 其 获得 +1 @ 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 ， 使 其 获得 +2 @ 攻击 和 +4 个 生命 .\nNY? aoe ae mt em Nw tecl oh Ooh he? MW wstw.ic @t+=s","hintZhClean":"龙 是\nCD 伙伴 被 召唤 时 D 如 果 在 战斗 外 , 使 其 获得 +1 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 , 使 其 获得 +2 攻击 和 +4 个 生命 .","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"6幼犬兽群","sourceRow":70},"pack6_pet_0041":{"id":"pack6_pet_0041","kind":"pack6_pet_0041","packKey":"pack6","nameZh":"兰花螳螂","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/兰花螳螂.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0041.png","iconMissing":false,"hintZhRaw":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 ， 使 其 获得 此 宠物 40% 的 @ 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 ， 使 其 获得 此 宠物 80% 的 @ 攻击 和 OD 生命 .\n小 -\nks、 Tbk ee FIM —_ Asem CHET TRIB Swen 市 十 态 @ +=","hintZhClean":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 , 使 其 获得 此 宠物 40% 的 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 , 使 其 获得 此 宠物 80% 的 攻击 和 OD 生命 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"6幼犬兽群","sourceRow":74},"pack6_pet_0042":{"id":"pack6_pet_0042","kind":"pack6_pet_0042","packKey":"pack6","nameZh":"山羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/山羊.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0042.png","iconMissing":false,"hintZhRaw":"虽 购买 伙伴 时 + 获得 +1 @@ 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintZhClean":"虽 购买 伙伴 时 + 获得 +1 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"6幼犬兽群","sourceRow":75},"pack6_pet_0043":{"id":"pack6_pet_0043","kind":"pack6_pet_0043","packKey":"pack6","nameZh":"沧龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/沧龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0043.png","iconMissing":false,"hintZhRaw":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 @ 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,\nfy — EH mee om CRIA eek TA te tino OO +s","hintZhClean":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"6幼犬兽群","sourceRow":76},"pack6_pet_0044":{"id":"pack6_pet_0044","kind":"pack6_pet_0044","packKey":"pack6","nameZh":"石头鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/石头鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0044.png","iconMissing":false,"hintZhRaw":"石头 鱼\nOQ) ket © 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。\nfy SRR? wd HEE a M1 9B KI AT mice SX","hintZhClean":"石头 鱼\nOQ) ket 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":77},"pack6_pet_0045":{"id":"pack6_pet_0045","kind":"pack6_pet_0045","packKey":"pack6","nameZh":"美洲豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美洲豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0045.png","iconMissing":false,"hintZhRaw":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。\nEY ut acy mm ee att OER Cl cho 2s ee eee","hintZhClean":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":78},"pack6_pet_0046":{"id":"pack6_pet_0046","kind":"pack6_pet_0046","packKey":"pack6","nameZh":"美西螈","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美西螈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0046.png","iconMissing":false,"hintZhRaw":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 @wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 @ 攻击 和 +2 二 生命。 每 回合 生效 3 次 。\nND) + + eps este ne ab HEAD 2372.2 @ wtin.2? @ += 455 f=) & Abt Bb Qi","hintZhClean":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 攻击 和 +2 二 生命。 每 回合 生效 3 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"6幼犬兽群","sourceRow":79},"pack6_pet_0047":{"id":"pack6_pet_0047","kind":"pack6_pet_0047","packKey":"pack6","nameZh":"魟鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/魟鱼4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0047.png","iconMissing":false,"hintZhRaw":"B\n照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。\nfy tec) TT AR ad HHISETtOWMO— Aw tL tno MA ws","hintZhClean":"照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"6幼犬兽群","sourceRow":83},"pack6_pet_0048":{"id":"pack6_pet_0048","kind":"pack6_pet_0048","packKey":"pack6","nameZh":"鳄龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鳄龟2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0048.png","iconMissing":false,"hintZhRaw":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintZhClean":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":85},"pack6_pet_0049":{"id":"pack6_pet_0049","kind":"pack6_pet_0049","packKey":"pack6","nameZh":"鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0049.png","iconMissing":false,"hintZhRaw":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 @ 攻击 和 +2 @@ 生命 。\nNM) aaron ob CEE DOSE oe eee. A wti.? @ +s","hintZhClean":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":86},"pack6_pet_0050":{"id":"pack6_pet_0050","kind":"pack6_pet_0050","packKey":"pack6","nameZh":"鹰","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鹰.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0050.png","iconMissing":false,"hintZhRaw":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY => 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 _RA EE _A 1/1 EBD 26","hintZhClean":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY > 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 RA EE A 1/1 EBD 26","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"6幼犬兽群","sourceRow":87},"pack6_pet_0051":{"id":"pack6_pet_0051","kind":"pack6_pet_0051","packKey":"pack6","nameZh":"梁龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/梁龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0051.png","iconMissing":false,"hintZhRaw":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C 〇 ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 〇 金币 。 每 回合 生效 3 次 。\nfy 和 下 ot Kh) 8.2 (人 os 455 (Al) & 4 GA 2° Ar","hintZhClean":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 金币 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"6幼犬兽群","sourceRow":91},"pack6_pet_0052":{"id":"pack6_pet_0052","kind":"pack6_pet_0052","packKey":"pack6","nameZh":"灯笼鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/灯笼鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0052.png","iconMissing":false,"hintZhRaw":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 。\n) 03 购买 时 => 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 两 次 。\nfy BH YT? Rh ab 【| dr 上 -人 了 Shik IR LAH FEE 了 TR FR] 30 a","hintZhClean":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 。\n) 03 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 两 次 。","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"6幼犬兽群","sourceRow":92},"pack6_pet_0053":{"id":"pack6_pet_0053","kind":"pack6_pet_0053","packKey":"pack6","nameZh":"狮子鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/狮子鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0053.png","iconMissing":false,"hintZhRaw":"Wh &\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH—R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 ， 便 额外 触发 一 次 。\n1 exert od 2 _ Ahan Leto skie we ON mM BINS Me Oh et ev","hintZhClean":"Wh\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 , 便 额外 触发 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"6幼犬兽群","sourceRow":93},"pack6_pet_0054":{"id":"pack6_pet_0054","kind":"pack6_pet_0054","packKey":"pack6","nameZh":"猫鼬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/猫鼬4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0054.png","iconMissing":false,"hintZhRaw":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。\nMEY pes) rp ea Chet BM KH Ao oe eis","hintZhClean":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":97},"pack6_pet_0055":{"id":"pack6_pet_0055","kind":"pack6_pet_0055","packKey":"pack6","nameZh":"皮皮虾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/皮皮虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0055.png","iconMissing":false,"hintZhRaw":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ，\nMY peel wae ab HB ees LCE PIN ee we eh Ele","hintZhClean":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ,","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":98},"pack6_pet_0056":{"id":"pack6_pet_0056","kind":"pack6_pet_0056","packKey":"pack6","nameZh":"章鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/章鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0056.png","iconMissing":false,"hintZhRaw":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.\n1) wes ab HK Amine Loe ec HEE eA","hintZhClean":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"6幼犬兽群","sourceRow":99},"pack6_pet_0057":{"id":"pack6_pet_0057","kind":"pack6_pet_0057","packKey":"pack6","nameZh":"美洲狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/美洲狮.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe iN\n@ 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 2 级 玩具 。\nNM) ++i me wee eee Oe HOUR","hintZhClean":"Fe iN\n友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 2 级 玩具 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"6幼犬兽群","sourceRow":100},"pack6_pet_0058":{"id":"pack6_pet_0058","kind":"pack6_pet_0058","packKey":"pack6","nameZh":"象海豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/象海豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0058.png","iconMissing":false,"hintZhRaw":"Ris\nOD 获得 特性 © 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 ， 持 续 一 回合 。 每 回合 生效 1 次 。\nNf PKB Aste ot OO 4) OV TRIB 1D a Ty 二 xz 1 @ += 4% (eh [| a 45 fr) & 4b Bb 1 AP","hintZhClean":"Ris\nOD 获得 特性 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 , 持 续 一 回合 。 每 回合 生效 1 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":101},"pack6_pet_0059":{"id":"pack6_pet_0059","kind":"pack6_pet_0059","packKey":"pack6","nameZh":"霸王龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/霸王龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0059.png","iconMissing":false,"hintZhRaw":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 @ 攻击 和 +4 Ota.\nNM) marron abd EACH SE bee oe aie MBM wt. @+=s","hintZhClean":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 攻击 和 +4 Ota.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":102},"pack6_pet_0060":{"id":"pack6_pet_0060","kind":"pack6_pet_0060","packKey":"pack6","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"6幼犬兽群","sourceRow":103}},"foodByKind":{"apple":{"id":"pack1_food_0001","kind":"apple","packKey":"pack1","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"1乌龟兽群","sourceRow":13},"honey":{"id":"pack1_food_0002","kind":"honey","packKey":"pack1","nameZh":"蜂蜜","nameEn":"Honey","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/蜂蜜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0002.png","iconMissing":false,"hintZhRaw":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT @ Zi —O]/|/ME£s.","hintZhClean":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT Zi O]/ /ME s.","hintEn":"","effectKey":"summon_bee","implStatus":"implemented","placeholderBuff":1,"color":"#e0aa35","sourceSheet":"1乌龟兽群","sourceRow":14},"pack1_food_0003":{"id":"pack1_food_0003","kind":"pack1_food_0003","packKey":"pack1","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9adac9","sourceSheet":"1乌龟兽群","sourceRow":26},"cupcake":{"id":"pack1_food_0004","kind":"cupcake","packKey":"pack1","nameZh":"纸杯蛋糕","nameEn":"Cupcake","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/纸杯蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0004.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 ， 持 续 一 回合 。","hintZhClean":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 , 持 续 一 回合 。","hintEn":"","effectKey":"temp_3_3","implStatus":"implemented","placeholderBuff":1,"color":"#f29ec0","sourceSheet":"1乌龟兽群","sourceRow":27},"meat":{"id":"pack1_food_0005","kind":"meat","packKey":"pack1","nameZh":"肉骨头","nameEn":"Meat","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/肉骨头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0005.png","iconMissing":false,"hintZhRaw":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintZhClean":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintEn":"","effectKey":"perk_meat","implStatus":"implemented","placeholderBuff":1,"color":"#d66a4f","sourceSheet":"1乌龟兽群","sourceRow":28},"garlic":{"id":"pack1_food_0006","kind":"garlic","packKey":"pack1","nameZh":"大蒜","nameEn":"Garlic","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/大蒜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0006.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintZhClean":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintEn":"","effectKey":"perk_garlic","implStatus":"implemented","placeholderBuff":2,"color":"#b9b3a6","sourceSheet":"1乌龟兽群","sourceRow":40},"salad":{"id":"pack1_food_0007","kind":"salad","packKey":"pack1","nameZh":"碗装沙拉","nameEn":"Salad","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/碗装沙拉.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0007.png","iconMissing":false,"hintZhRaw":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"team_random_buff_1_1","implStatus":"implemented","placeholderBuff":2,"color":"#62c26e","sourceSheet":"1乌龟兽群","sourceRow":41},"pack1_food_0008":{"id":"pack1_food_0008","kind":"pack1_food_0008","packKey":"pack1","nameZh":"蛋糕","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0008.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintZhClean":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9ab7","sourceSheet":"1乌龟兽群","sourceRow":42},"canned_food":{"id":"pack1_food_0009","kind":"canned_food","packKey":"pack1","nameZh":"食物罐头","nameEn":"Can","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/食物罐头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0009.png","iconMissing":false,"hintZhRaw":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"shop_buff_2_1","implStatus":"implemented","placeholderBuff":2,"color":"#8ea7bb","sourceSheet":"1乌龟兽群","sourceRow":55},"pear":{"id":"pack1_food_0010","kind":"pear","packKey":"pack1","nameZh":"鸭梨","nameEn":"Pear","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/鸭梨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0010.png","iconMissing":false,"hintZhRaw":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"stat_2_2","implStatus":"implemented","placeholderBuff":2,"color":"#8dc95f","sourceSheet":"1乌龟兽群","sourceRow":56},"pack1_food_0011":{"id":"pack1_food_0011","kind":"pack1_food_0011","packKey":"pack1","nameZh":"寿司","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/寿司.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0011.png","iconMissing":false,"hintZhRaw":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ace","sourceSheet":"1乌龟兽群","sourceRow":69},"chocolate":{"id":"pack1_food_0012","kind":"chocolate","packKey":"pack1","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"1乌龟兽群","sourceRow":70},"pack1_food_0013":{"id":"pack1_food_0013","kind":"pack1_food_0013","packKey":"pack1","nameZh":"辣椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/辣椒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintZhClean":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ad0","sourceSheet":"1乌龟兽群","sourceRow":71},"pack1_food_0014":{"id":"pack1_food_0014","kind":"pack1_food_0014","packKey":"pack1","nameZh":"披萨","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/披萨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0014.png","iconMissing":false,"hintZhRaw":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaab","sourceSheet":"1乌龟兽群","sourceRow":83},"pack1_food_0015":{"id":"pack1_food_0015","kind":"pack1_food_0015","packKey":"pack1","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0015.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aca","sourceSheet":"1乌龟兽群","sourceRow":84},"pack1_food_0016":{"id":"pack1_food_0016","kind":"pack1_food_0016","packKey":"pack1","nameZh":"蘑菇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/蘑菇.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0016.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintZhClean":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaa9","sourceSheet":"1乌龟兽群","sourceRow":85},"pack1_food_0017":{"id":"pack1_food_0017","kind":"pack1_food_0017","packKey":"pack1","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9acc","sourceSheet":"1乌龟兽群","sourceRow":86},"pack2_food_0001":{"id":"pack2_food_0001","kind":"pack2_food_0001","packKey":"pack2","nameZh":"大麦克香蕉","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/大麦克香蕉.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0001.png","iconMissing":false,"hintZhRaw":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta @ FH —Oseaey .","hintZhClean":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta FH Oseaey .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab5da","sourceSheet":"2濒危兽群","sourceRow":14},"pack2_food_0002":{"id":"pack2_food_0002","kind":"pack2_food_0002","packKey":"pack2","nameZh":"淡水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/淡水.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0002.png","iconMissing":false,"hintZhRaw":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintZhClean":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dabe9a","sourceSheet":"2濒危兽群","sourceRow":15},"pack2_food_0003":{"id":"pack2_food_0003","kind":"pack2_food_0003","packKey":"pack2","nameZh":"南极磷虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/南极磷虾.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0003.png","iconMissing":false,"hintZhRaw":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 ， 并 花费 1 金币 围 积 。","hintZhClean":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 , 并 花费 1 金币 围 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab7da","sourceSheet":"2濒危兽群","sourceRow":29},"pack2_food_0004":{"id":"pack2_food_0004","kind":"pack2_food_0004","packKey":"pack2","nameZh":"苏达斯番茄","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/苏达斯番茄.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0004.png","iconMissing":false,"hintZhRaw":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK #2278841 OCF tH.","hintZhClean":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK 2278841 OCF tH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac59a","sourceSheet":"2濒危兽群","sourceRow":30},"pack2_food_0005":{"id":"pack2_food_0005","kind":"pack2_food_0005","packKey":"pack2","nameZh":"鳕鱼籽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/鳕鱼籽.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0005.png","iconMissing":false,"hintZhRaw":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintZhClean":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab1da","sourceSheet":"2濒危兽群","sourceRow":31},"pack2_food_0006":{"id":"pack2_food_0006","kind":"pack2_food_0006","packKey":"pack2","nameZh":"吉奇红豌豆","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/吉奇红豌豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0006.png","iconMissing":false,"hintZhRaw":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintZhClean":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac39a","sourceSheet":"2濒危兽群","sourceRow":44},"pack2_food_0007":{"id":"pack2_food_0007","kind":"pack2_food_0007","packKey":"pack2","nameZh":"巴黎胡萝卜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/巴黎胡萝卜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0007.png","iconMissing":false,"hintZhRaw":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintZhClean":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab3da","sourceSheet":"2濒危兽群","sourceRow":45},"pack2_food_0008":{"id":"pack2_food_0008","kind":"pack2_food_0008","packKey":"pack2","nameZh":"白松露","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/白松露.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0008.png","iconMissing":false,"hintZhRaw":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击，并对攻击力最高的敌人发动跳跃攻击，生效一次。","hintZhClean":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击,并对攻击力最高的敌人发动跳跃攻击,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":46},"pack2_food_0009":{"id":"pack2_food_0009","kind":"pack2_food_0009","packKey":"pack2","nameZh":"枫糖","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/枫糖.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0009.png","iconMissing":false,"hintZhRaw":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%，且受到的伤害-50%，生效三次。","hintZhClean":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%,且受到的伤害-50%,生效三次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":59},"pack2_food_0010":{"id":"pack2_food_0010","kind":"pack2_food_0010","packKey":"pack2","nameZh":"香荚兰豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/香荚兰豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0010.png","iconMissing":false,"hintZhRaw":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aafda","sourceSheet":"2濒危兽群","sourceRow":60},"pack2_food_0011":{"id":"pack2_food_0011","kind":"pack2_food_0011","packKey":"pack2","nameZh":"鹰嘴豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/鹰嘴豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0011.png","iconMissing":false,"hintZhRaw":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 ， 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintZhClean":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 , 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac79a","sourceSheet":"2濒危兽群","sourceRow":61},"pack2_food_0012":{"id":"pack2_food_0012","kind":"pack2_food_0012","packKey":"pack2","nameZh":"可可豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/可可豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0012.png","iconMissing":false,"hintZhRaw":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制，生效一次。","hintZhClean":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":75},"pack2_food_0013":{"id":"pack2_food_0013","kind":"pack2_food_0013","packKey":"pack2","nameZh":"奥布洛诺特甜瓜","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/奥布洛诺特甜瓜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0013.png","iconMissing":false,"hintZhRaw":"BR Fi 78 15 $5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintZhClean":"BR Fi 78 15 5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":76},"pack2_food_0015":{"id":"pack2_food_0015","kind":"pack2_food_0015","packKey":"pack2","nameZh":"撒丁岛醋栗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/撒丁岛醋栗.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0015.png","iconMissing":false,"hintZhRaw":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintZhClean":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacb9a","sourceSheet":"2濒危兽群","sourceRow":88},"pack2_food_0016":{"id":"pack2_food_0016","kind":"pack2_food_0016","packKey":"pack2","nameZh":"犹太海枣","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/犹太海枣3.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0016.png","iconMissing":false,"hintZhRaw":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20， 生 效 一 次 。","hintZhClean":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20, 生 效 一 次 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa8da","sourceSheet":"2濒危兽群","sourceRow":91},"pack2_food_0017":{"id":"pack2_food_0017","kind":"pack2_food_0017","packKey":"pack2","nameZh":"白秋葵","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/白秋葵.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0017.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH#E (4N BF) PRIZFRXK (4NH—7) .","hintZhClean":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH E (4N BF) PRIZFRXK (4NH 7) .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacd9a","sourceSheet":"2濒危兽群","sourceRow":92},"pack3_food_0001":{"id":"pack3_food_0001","kind":"pack3_food_0001","packKey":"pack3","nameZh":"南瓜","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/南瓜.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 ， 在 偶数 回合 获得 +2 O 生命 。","hintZhClean":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 , 在 偶数 回合 获得 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c0da9a","sourceSheet":"3独角兽兽群","sourceRow":17},"pack3_food_0002":{"id":"pack3_food_0002","kind":"pack3_food_0002","packKey":"pack3","nameZh":"魔力药水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0002.png","iconMissing":false,"hintZhRaw":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintZhClean":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b19ada","sourceSheet":"3独角兽兽群","sourceRow":18},"pack3_food_0003":{"id":"pack3_food_0003","kind":"pack3_food_0003","packKey":"pack3","nameZh":"仙尘","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/仙尘.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0003.png","iconMissing":false,"hintZhRaw":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen\nny\n—v","hintZhClean":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c3da9a","sourceSheet":"3独角兽兽群","sourceRow":30},"pack3_food_0004":{"id":"pack3_food_0004","kind":"pack3_food_0004","packKey":"pack3","nameZh":"壁中鸡","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/壁中鸡.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0004.png","iconMissing":false,"hintZhRaw":"壁 中 鸡\n使 一 个 宠物 获得 +3 @ 攻击 和 虚弱 ®.","hintZhClean":"壁 中 鸡\n使 一 个 宠物 获得 +3 攻击 和 虚弱 .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b79ada","sourceSheet":"3独角兽兽群","sourceRow":31},"pack3_food_0005":{"id":"pack3_food_0005","kind":"pack3_food_0005","packKey":"pack3","nameZh":"晕厥面包","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/晕厥面包.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0005.png","iconMissing":false,"hintZhRaw":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintZhClean":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#bcda9a","sourceSheet":"3独角兽兽群","sourceRow":32},"pack3_food_0006":{"id":"pack3_food_0006","kind":"pack3_food_0006","packKey":"pack3","nameZh":"姜饼人","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/姜饼人.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0006.png","iconMissing":false,"hintZhRaw":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintZhClean":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b59ada","sourceSheet":"3独角兽兽群","sourceRow":49},"pack3_food_0007":{"id":"pack3_food_0007","kind":"pack3_food_0007","packKey":"pack3","nameZh":"美味粥","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/美味粥.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0007.png","iconMissing":false,"hintZhRaw":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintZhClean":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#beda9a","sourceSheet":"3独角兽兽群","sourceRow":50},"pack3_food_0008":{"id":"pack3_food_0008","kind":"pack3_food_0008","packKey":"pack3","nameZh":"青春之水","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/青春之水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0008.png","iconMissing":false,"hintZhRaw":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintZhClean":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#bb9ada","sourceSheet":"3独角兽兽群","sourceRow":51},"pack3_food_0009":{"id":"pack3_food_0009","kind":"pack3_food_0009","packKey":"pack3","nameZh":"变大蛋糕","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/变大蛋糕.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0009.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 O 攻击 ， 并 将 2 久 生命 转化 为 攻击 。","hintZhClean":"使 一 个 宠物 获得 +3 O 攻击 , 并 将 2 久 生命 转化 为 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b8da9a","sourceSheet":"3独角兽兽群","sourceRow":63},"pack3_food_0010":{"id":"pack3_food_0010","kind":"pack3_food_0010","packKey":"pack3","nameZh":"珍馐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/珍馐.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0010.png","iconMissing":false,"hintZhRaw":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H —7.","hintZhClean":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dad39a","sourceSheet":"3独角兽兽群","sourceRow":64},"pack3_food_0011":{"id":"pack3_food_0011","kind":"pack3_food_0011","packKey":"pack3","nameZh":"缩小水","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/缩小水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0011.png","iconMissing":false,"hintZhRaw":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 ， 并 将 2 加 攻击 转化 为 生命 。","hintZhClean":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 , 并 将 2 加 攻击 转化 为 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa2da","sourceSheet":"3独角兽兽群","sourceRow":65},"pack3_food_0012":{"id":"pack3_food_0012","kind":"pack3_food_0012","packKey":"pack3","nameZh":"大瓶魔力药水","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/大瓶魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0012.png","iconMissing":false,"hintZhRaw":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintZhClean":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad69a","sourceSheet":"3独角兽兽群","sourceRow":81},"pack3_food_0014":{"id":"pack3_food_0014","kind":"pack3_food_0014","packKey":"pack3","nameZh":"魔豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/魔豆.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0014.png","iconMissing":false,"hintZhRaw":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。\nla > FOS BS 本 IEP BIS. HPHHEKRB+1ZO SF.","hintZhClean":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacf9a","sourceSheet":"3独角兽兽群","sourceRow":83},"pack3_food_0015":{"id":"pack3_food_0015","kind":"pack3_food_0015","packKey":"pack3","nameZh":"丰饶角","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/丰饶角.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0015.png","iconMissing":false,"hintZhRaw":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 ， 可 从 所 有 兽 群 中 选择 。","hintZhClean":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 , 可 从 所 有 兽 群 中 选择 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa6da","sourceSheet":"3独角兽兽群","sourceRow":95},"pack3_food_0016":{"id":"pack3_food_0016","kind":"pack3_food_0016","packKey":"pack3","nameZh":"星星糖","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/星星糖.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0016.png","iconMissing":false,"hintZhRaw":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintZhClean":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad19a","sourceSheet":"3独角兽兽群","sourceRow":96},"pack3_food_0017":{"id":"pack3_food_0017","kind":"pack3_food_0017","packKey":"pack3","nameZh":"长生桃","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/长生桃.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0017.png","iconMissing":false,"hintZhRaw":"KK Hk\n使 一 个 宠物 获得 +2 @ 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintZhClean":"KK Hk\n使 一 个 宠物 获得 +2 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa4da","sourceSheet":"3独角兽兽群","sourceRow":97},"pack4_food_0002":{"id":"pack4_food_0002","kind":"pack4_food_0002","packKey":"pack4","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ada9a","sourceSheet":"4金毛兽群","sourceRow":13},"pack4_food_0003":{"id":"pack4_food_0003","kind":"pack4_food_0003","packKey":"pack4","nameZh":"巧克力蛋糕","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/巧克力蛋糕.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0003.png","iconMissing":false,"hintZhRaw":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta @ 21/217 BERGHE.","hintZhClean":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta 21/217 BERGHE.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d99ada","sourceSheet":"4金毛兽群","sourceRow":25},"pack4_food_0004":{"id":"pack4_food_0004","kind":"pack4_food_0004","packKey":"pack4","nameZh":"樱桃","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/樱桃.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0004.png","iconMissing":false,"hintZhRaw":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM |","hintZhClean":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#a1da9a","sourceSheet":"4金毛兽群","sourceRow":26},"pack4_food_0005":{"id":"pack4_food_0005","kind":"pack4_food_0005","packKey":"pack4","nameZh":"白菜","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/白菜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0005.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintZhClean":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d29ada","sourceSheet":"4金毛兽群","sourceRow":27},"pack4_food_0006":{"id":"pack4_food_0006","kind":"pack4_food_0006","packKey":"pack4","nameZh":"无花果","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/无花果.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0006.png","iconMissing":false,"hintZhRaw":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintZhClean":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9fda9a","sourceSheet":"4金毛兽群","sourceRow":40},"pack4_food_0007":{"id":"pack4_food_0007","kind":"pack4_food_0007","packKey":"pack4","nameZh":"莴苣","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/莴苣.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0007.png","iconMissing":false,"hintZhRaw":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 @ 〇 攻击 和 +1 O 生命。","hintZhClean":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 攻击 和 +1 O 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#d59ada","sourceSheet":"4金毛兽群","sourceRow":41},"pack4_food_0008":{"id":"pack4_food_0008","kind":"pack4_food_0008","packKey":"pack4","nameZh":"鳄梨","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/鳄梨.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0008.png","iconMissing":false,"hintZhRaw":"ED\n下 一 回合 获得 +3 O 金币 。","hintZhClean":"ED\n下 一 回合 获得 +3 O 金币 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#a5da9a","sourceSheet":"4金毛兽群","sourceRow":42},"pack4_food_0009":{"id":"pack4_food_0009","kind":"pack4_food_0009","packKey":"pack4","nameZh":"华夫饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/华夫饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0009.png","iconMissing":false,"hintZhRaw":"华 夫 饼\n激活 宠物 的 “购买 时 ”能 力 ， 或 获得 +3 OY +H.","hintZhClean":"华 夫 饼\n激活 宠物 的 购买 时 能 力 , 或 获得 +3 OY +H.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#ce9ada","sourceSheet":"4金毛兽群","sourceRow":54},"pack4_food_0010":{"id":"pack4_food_0010","kind":"pack4_food_0010","packKey":"pack4","nameZh":"土豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/土豆.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0010.png","iconMissing":false,"hintZhRaw":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO\nEB BBA","hintZhClean":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9abd","sourceSheet":"4金毛兽群","sourceRow":55},"pack4_food_0011":{"id":"pack4_food_0011","kind":"pack4_food_0011","packKey":"pack4","nameZh":"香蕉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/香蕉.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0011.png","iconMissing":false,"hintZhRaw":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT @ ZIG nhALIMIEL.","hintZhClean":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT ZIG nhALIMIEL.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adab8","sourceSheet":"4金毛兽群","sourceRow":56},"pack4_food_0013":{"id":"pack4_food_0013","kind":"pack4_food_0013","packKey":"pack4","nameZh":"榴莲","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/榴莲.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0013.png","iconMissing":false,"hintZhRaw":"一 0 一 4 一\n榴\n连\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全\noy —, a","hintZhClean":"一 0 一 4 一\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adab6","sourceSheet":"4金毛兽群","sourceRow":68},"melon":{"id":"pack4_food_0014","kind":"melon","packKey":"pack4","nameZh":"蜜瓜","nameEn":"Melon","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/蜜瓜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintZhClean":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintEn":"","effectKey":"perk_melon","implStatus":"implemented","placeholderBuff":3,"color":"#8fdc78","sourceSheet":"4金毛兽群","sourceRow":69},"pack4_food_0015":{"id":"pack4_food_0015","kind":"pack4_food_0015","packKey":"pack4","nameZh":"口袋饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/口袋饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0015.png","iconMissing":false,"hintZhRaw":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap £79415 +2 +H -—7.","hintZhClean":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap 79415 +2 +H - 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adabc","sourceSheet":"4金毛兽群","sourceRow":81},"pack4_food_0016":{"id":"pack4_food_0016","kind":"pack4_food_0016","packKey":"pack4","nameZh":"椒盐卷饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/椒盐卷饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0016.png","iconMissing":false,"hintZhRaw":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 @ HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 ， 此 效果 翻 倍 。","hintZhClean":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 , 此 效果 翻 倍 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9abb","sourceSheet":"4金毛兽群","sourceRow":82},"pack4_food_0017":{"id":"pack4_food_0017","kind":"pack4_food_0017","packKey":"pack4","nameZh":"西红柿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/西红柿.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0017.png","iconMissing":false,"hintZhRaw":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta @ TRBEUMHASRPIISEEO. 4+H-—7.","hintZhClean":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta TRBEUMHASRPIISEEO. 4+H- 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaba","sourceSheet":"4金毛兽群","sourceRow":83},"pack5_food_0001":{"id":"pack5_food_0001","kind":"pack5_food_0001","packKey":"pack5","nameZh":"草莓","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/草莓.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac7da","sourceSheet":"5海星兽群","sourceRow":16},"pack5_food_0002":{"id":"pack5_food_0002","kind":"pack5_food_0002","packKey":"pack5","nameZh":"蜜桃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/蜜桃.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0002.png","iconMissing":false,"hintZhRaw":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintZhClean":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daaf9a","sourceSheet":"5海星兽群","sourceRow":17},"pack5_food_0003":{"id":"pack5_food_0003","kind":"pack5_food_0003","packKey":"pack5","nameZh":"炸虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/炸虾.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0003.png","iconMissing":false,"hintZhRaw":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintZhClean":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac5da","sourceSheet":"5海星兽群","sourceRow":29},"pack5_food_0004":{"id":"pack5_food_0004","kind":"pack5_food_0004","packKey":"pack5","nameZh":"焦糖","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/焦糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0004.png","iconMissing":false,"hintZhRaw":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖；每有一个焦糖便对生命最高的敌人造成3点伤害，生效一次。","hintZhClean":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖 每有一个焦糖便对生命最高的敌人造成3点伤害,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daa89a","sourceSheet":"5海星兽群","sourceRow":30},"pack5_food_0005":{"id":"pack5_food_0005","kind":"pack5_food_0005","packKey":"pack5","nameZh":"西兰花","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/西兰花.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0005.png","iconMissing":false,"hintZhRaw":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 @ 攻击 。","hintZhClean":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9acbda","sourceSheet":"5海星兽群","sourceRow":31},"pack5_food_0006":{"id":"pack5_food_0006","kind":"pack5_food_0006","packKey":"pack5","nameZh":"棒棒糖","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/棒棒糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0006.png","iconMissing":false,"hintZhRaw":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ，","hintZhClean":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ,","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#daaa9a","sourceSheet":"5海星兽群","sourceRow":44},"pack5_food_0007":{"id":"pack5_food_0007","kind":"pack5_food_0007","packKey":"pack5","nameZh":"海草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/海草2.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0007.png","iconMissing":false,"hintZhRaw":"小 海胆 页 2/7\n加 票据 时 => 使 盟 前 排 的 政 人 -4 @ 生命 。\n) ary = 使 前 两 个 政 人 .4 @ Em.\nNS} ment ob 人 一 人 天 AH","hintZhClean":"小 海胆 页 2/7\n加 票据 时 > 使 盟 前 排 的 政 人 -4 生命 。\n) ary 使 前 两 个 政 人 .4 Em.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ac9da","sourceSheet":"5海星兽群","sourceRow":46},"pack5_food_0008":{"id":"pack5_food_0008","kind":"pack5_food_0008","packKey":"pack5","nameZh":"火腿肠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/火腿肠.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0008.png","iconMissing":false,"hintZhRaw":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE — TT GB BP.","hintZhClean":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE TT GB BP.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dab59a","sourceSheet":"5海星兽群","sourceRow":47},"pack5_food_0009":{"id":"pack5_food_0009","kind":"pack5_food_0009","packKey":"pack5","nameZh":"法国面包","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/法国面包.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0009.png","iconMissing":false,"hintZhRaw":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintZhClean":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9abeda","sourceSheet":"5海星兽群","sourceRow":61},"pack5_food_0010":{"id":"pack5_food_0010","kind":"pack5_food_0010","packKey":"pack5","nameZh":"芝士","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/芝士.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0010.png","iconMissing":false,"hintZhRaw":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals £2 —7.","hintZhClean":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals 2 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adacd","sourceSheet":"5海星兽群","sourceRow":62},"pack5_food_0013":{"id":"pack5_food_0013","kind":"pack5_food_0013","packKey":"pack5","nameZh":"草莓酱","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/草莓酱.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ，\nBRR o> (FREY WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ,\nBRR o> (FREY WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaa","sourceSheet":"5海星兽群","sourceRow":76},"pack5_food_0014":{"id":"pack5_food_0014","kind":"pack5_food_0014","packKey":"pack5","nameZh":"青椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/青椒.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0014.png","iconMissing":false,"hintZhRaw":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintZhClean":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac9","sourceSheet":"5海星兽群","sourceRow":77},"pack5_food_0015":{"id":"pack5_food_0015","kind":"pack5_food_0015","packKey":"pack5","nameZh":"杨桃+","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/杨桃+.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0015.png","iconMissing":false,"hintZhRaw":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintZhClean":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aac","sourceSheet":"5海星兽群","sourceRow":91},"pack5_food_0016":{"id":"pack5_food_0016","kind":"pack5_food_0016","packKey":"pack5","nameZh":"热狗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/热狗.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0016.png","iconMissing":false,"hintZhRaw":"热狗\n使 两 个 随机 宠物 获得 +4 @ 攻击 。","hintZhClean":"热狗\n使 两 个 随机 宠物 获得 +4 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac7","sourceSheet":"5海星兽群","sourceRow":92},"pack5_food_0017":{"id":"pack5_food_0017","kind":"pack5_food_0017","packKey":"pack5","nameZh":"芹菜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/芹菜.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0017.png","iconMissing":false,"hintZhRaw":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintZhClean":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaf","sourceSheet":"5海星兽群","sourceRow":93},"pack6_food_0002":{"id":"pack6_food_0002","kind":"pack6_food_0002","packKey":"pack6","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9aadda","sourceSheet":"6幼犬兽群","sourceRow":16},"pack6_food_0003":{"id":"pack6_food_0003","kind":"pack6_food_0003","packKey":"pack6","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac69a","sourceSheet":"6幼犬兽群","sourceRow":35},"pack6_food_0004":{"id":"pack6_food_0004","kind":"pack6_food_0004","packKey":"pack6","nameZh":"米饭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/米饭.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0004.png","iconMissing":false,"hintZhRaw":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintZhClean":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab0da","sourceSheet":"6幼犬兽群","sourceRow":36},"pack6_food_0005":{"id":"pack6_food_0005","kind":"pack6_food_0005","packKey":"pack6","nameZh":"酸橙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/酸橙.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0005.png","iconMissing":false,"hintZhRaw":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintZhClean":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac49a","sourceSheet":"6幼犬兽群","sourceRow":37},"pack6_food_0006":{"id":"pack6_food_0006","kind":"pack6_food_0006","packKey":"pack6","nameZh":"可颂","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/可颂.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0006.png","iconMissing":false,"hintZhRaw":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintZhClean":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab2da","sourceSheet":"6幼犬兽群","sourceRow":52},"pack6_food_0007":{"id":"pack6_food_0007","kind":"pack6_food_0007","packKey":"pack6","nameZh":"节瓜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/节瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0007.png","iconMissing":false,"hintZhRaw":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 | te tH — 7.","hintZhClean":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 te tH 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac29a","sourceSheet":"6幼犬兽群","sourceRow":53},"pack6_food_0008":{"id":"pack6_food_0008","kind":"pack6_food_0008","packKey":"pack6","nameZh":"黑莓","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/黑莓.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0008.png","iconMissing":false,"hintZhRaw":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) @ wtH17@ +2.","hintZhClean":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) wtH17 +2.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab4da","sourceSheet":"6幼犬兽群","sourceRow":54},"pack6_food_0009":{"id":"pack6_food_0009","kind":"pack6_food_0009","packKey":"pack6","nameZh":"盐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/盐.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0009.png","iconMissing":false,"hintZhRaw":"盐\n使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintZhClean":"使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dabf9a","sourceSheet":"6幼犬兽群","sourceRow":71},"pack6_food_0011":{"id":"pack6_food_0011","kind":"pack6_food_0011","packKey":"pack6","nameZh":"馅饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/馅饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0011.png","iconMissing":false,"hintZhRaw":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintZhClean":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa5da","sourceSheet":"6幼犬兽群","sourceRow":73},"pack6_food_0012":{"id":"pack6_food_0012","kind":"pack6_food_0012","packKey":"pack6","nameZh":"千层饼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/千层饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0012.png","iconMissing":false,"hintZhRaw":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad09a","sourceSheet":"6幼犬兽群","sourceRow":88},"pack6_food_0014":{"id":"pack6_food_0014","kind":"pack6_food_0014","packKey":"pack6","nameZh":"柠檬","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/柠檬.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintZhClean":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#daca9a","sourceSheet":"6幼犬兽群","sourceRow":90},"pack6_food_0015":{"id":"pack6_food_0015","kind":"pack6_food_0015","packKey":"pack6","nameZh":"煎饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/煎饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0015.png","iconMissing":false,"hintZhRaw":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS +? @ 大 入 77 国 和 会","hintZhClean":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS + 大 入 77 国 和 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa9da","sourceSheet":"6幼犬兽群","sourceRow":104},"pack6_food_0016":{"id":"pack6_food_0016","kind":"pack6_food_0016","packKey":"pack6","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0016.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacc9a","sourceSheet":"6幼犬兽群","sourceRow":105},"pack6_food_0017":{"id":"pack6_food_0017","kind":"pack6_food_0017","packKey":"pack6","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa7da","sourceSheet":"6幼犬兽群","sourceRow":106}}}};
+// Lookup indexes are built client-side by buildGameIndexes() in src/game.js.
+window.__GAME_DATA = {"version":"28919f9d1633055e","packs":[{"key":"pack1","nameZh":"1乌龟兽群","nameEn":"Pack 1","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}},{"key":"pack2","nameZh":"2濒危兽群","nameEn":"Pack 2","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9,10],[0,1,2,3,4,5,6,7,8,9,10,11,12,13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}},{"key":"pack3","nameZh":"3独角兽兽群","nameEn":"Pack 3","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9,10],[0,1,2,3,4,5,6,7,8,9,10,11,12,13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}},{"key":"pack4","nameZh":"4金毛兽群","nameEn":"Pack 4","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9,10],[0,1,2,3,4,5,6,7,8,9,10,11,12,13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}},{"key":"pack5","nameZh":"5海星兽群","nameEn":"Pack 5","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9,10],[0,1,2,3,4,5,6,7,8,9,10,11,12,13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}},{"key":"pack6","nameZh":"6幼犬兽群","nameEn":"Pack 6","shopPools":{"pets":[[0,1,2,3,4,5,6,7,8,9],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59]],"foods":[[0,1],[0,1,2,3,4],[0,1,2,3,4,5,6,7],[0,1,2,3,4,5,6,7,8,9,10],[0,1,2,3,4,5,6,7,8,9,10,11,12,13],[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16]]}}],"pets":[{"id":"pack1_pet_0001","kind":"otter","packKey":"pack1","nameZh":"水獭","nameEn":"Otter","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/水獭.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0001.png","iconMissing":false,"hintZhRaw":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 @ 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命\nNM) sos ab HO Amen oe ee.) @ +a","hintZhClean":"7K HR\nCD 购买 时 > 使 一 个 随机 伙伴 获得 +1 生命 。\n) CB 购买 时 > 使 两 个 随机 伙伴 获得 +1 O 生命","hintEn":"","attack":1,"health":2,"abilityKey":"buy_buff_random_shop_pet","implStatus":"implemented","color":"#8f9fc2","sourceSheet":"1乌龟兽群","sourceRow":2},{"id":"pack1_pet_0002","kind":"beaver","packKey":"pack1","nameZh":"河狸","nameEn":"Beaver","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/河狸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0002.png","iconMissing":false,"hintZhRaw":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ wah.\nE> us oe et em CHAE A HEN OL Ok ee. > Hawt","hintZhClean":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 wah.","hintEn":"","attack":2,"health":2,"abilityKey":"sell_buff_attack","implStatus":"implemented","color":"#ab7d61","sourceSheet":"1乌龟兽群","sourceRow":3},{"id":"pack1_pet_0003","kind":"pack1_pet_0003","packKey":"pack1","nameZh":"猪","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0003.png","iconMissing":false,"hintZhRaw":"猪\nCO) unmet =» 获得 +1 O 金币 。\n) 2 出 售 时 => 获得 +*2 〇 £m.\n1S wees wa IB.) os","hintZhClean":"CO) unmet 获得 +1 O 金币 。\n) 2 出 售 时 > 获得 +*2 m.\n1S wees wa IB.) os","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"1乌龟兽群","sourceRow":4},{"id":"pack1_pet_0004","kind":"ant","packKey":"pack1","nameZh":"蚂蚁","nameEn":"Ant","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚂蚁.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0004.png","iconMissing":false,"hintZhRaw":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB wet => 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁\nCD eRe > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB wet > 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":2,"health":1,"abilityKey":"faint_buff_random_ally","implStatus":"implemented","color":"#d98f4e","sourceSheet":"1乌龟兽群","sourceRow":5},{"id":"pack1_pet_0005","kind":"mosquito","packKey":"pack1","nameZh":"蚊子","nameEn":"Mosquito","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蚊子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0005.png","iconMissing":false,"hintZhRaw":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.\nNM) pes) mae ea HO Aminss Loe SEED","hintZhClean":"蚊子\nCD 战斗 开始 时 > 对 一 个 随机 敌人 造成 1 点 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 1 点 伤害 O.","hintEn":"","attack":2,"health":2,"abilityKey":"start_ping_enemy","implStatus":"implemented","color":"#8a7ef2","sourceSheet":"1乌龟兽群","sourceRow":6},{"id":"pack1_pet_0006","kind":"cricket","packKey":"pack1","nameZh":"蛐蛐","nameEn":"Cricket","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/蛐蛐.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0006.png","iconMissing":false,"hintZhRaw":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。\nL3 晕厥时 -> 召唤一个3/3的蟋蟀。","hintZhClean":"蛐蛐\nL1 晕厥时 -> 召唤一个1/1的蟋蟀。\nL2 晕厥时 -> 召唤一个2/2的蟋蟀。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_summon_zombie","implStatus":"implemented","color":"#8ac95f","sourceSheet":"1乌龟兽群","sourceRow":7},{"id":"pack1_pet_0007","kind":"horse","packKey":"pack1","nameZh":"马","nameEn":"Horse","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0007.png","iconMissing":false,"hintZhRaw":"oO\nOD 伙伴 被 召唤 时 =» 使 其 获得 +1 @ 攻击 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 @ 攻击， 持续 一 回合 。\nNY a oe ah Tom et ea CHEE. Awe tte 站 人","hintZhClean":"oO\nOD 伙伴 被 召唤 时 使 其 获得 +1 攻击 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 +2 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":1,"abilityKey":"friend_summoned_attack","implStatus":"implemented","color":"#af8868","sourceSheet":"1乌龟兽群","sourceRow":8},{"id":"pack1_pet_0008","kind":"fish","packKey":"pack1","nameZh":"鱼","nameEn":"Fish","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0008.png","iconMissing":false,"hintZhRaw":"鱼\nCD 升级 时 => 使 两 个 伙伴 获得 +1 @ 攻击 和 +1 Otte.\n) 鸣 升级 时 => 使 两 个 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNY zor,","hintZhClean":"CD 升级 时 > 使 两 个 伙伴 获得 +1 攻击 和 +1 Otte.\n) 鸣 升级 时 > 使 两 个 伙伴 获得 +2 攻击 和 +2 Ota.\nNY zor,","hintEn":"","attack":2,"health":3,"abilityKey":"level_buff_team","implStatus":"implemented","color":"#72b8ea","sourceSheet":"1乌龟兽群","sourceRow":9},{"id":"pack1_pet_0009","kind":"pack1_pet_0009","packKey":"pack1","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"1乌龟兽群","sourceRow":10},{"id":"pack1_pet_0010","kind":"pack1_pet_0010","packKey":"pack1","nameZh":"鸽子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/动物/鸽子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0010.png","iconMissing":false,"hintZhRaw":"面包 局\n使 一 个 宠物 获得 +1 @ KH.","hintZhClean":"面包 局\n使 一 个 宠物 获得 +1 KH.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"1乌龟兽群","sourceRow":12},{"id":"pack1_pet_0011","kind":"pack1_pet_0011","packKey":"pack1","nameZh":"刺猬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/刺猬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0011.png","iconMissing":false,"hintZhRaw":"RI) 48\nOD sry =o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary => 对 所 有 宠物 造成 4 点 伤害 O.\n1) exci ob HEL See ce Hea","hintZhClean":"RI) 48\nOD sry o 对 所 有 宠物 造成 2 点 伤害 O.\n) Bary > 对 所 有 宠物 造成 4 点 伤害 O.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"1乌龟兽群","sourceRow":15},{"id":"pack1_pet_0012","kind":"swan","packKey":"pack1","nameZh":"天鹅","nameEn":"Swan","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/天鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0012.png","iconMissing":false,"hintZhRaw":"F FS\nOQ 回合 开始 时 =» 获得 +1 〇 人 金币 。\n) OH 回合 开始 时 > 获得 +2 〇 mh.\n1","hintZhClean":"F FS\nOQ 回合 开始 时 获得 +1 人 金币 。\n) OH 回合 开始 时 > 获得 +2 mh.","hintEn":"","attack":1,"health":3,"abilityKey":"start_turn_gain_gold","implStatus":"implemented","color":"#e3f3ff","sourceSheet":"1乌龟兽群","sourceRow":16},{"id":"pack1_pet_0013","kind":"peacock","packKey":"pack1","nameZh":"孔雀","nameEn":"Peacock","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/孔雀.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0013.png","iconMissing":false,"hintZhRaw":"4L€\nDO 受伤 时 = 获得 +3 @ 攻击 。\n» 3 受伤 时 => 获得 +6 @ wis.\nNM) =u et ob 证 有 QT 二","hintZhClean":"4L\nDO 受伤 时 获得 +3 攻击 。\n3 受伤 时 > 获得 +6 wis.","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_gain_attack","implStatus":"implemented","color":"#76b7c2","sourceSheet":"1乌龟兽群","sourceRow":17},{"id":"pack1_pet_0014","kind":"flamingo","packKey":"pack1","nameZh":"火烈鸟","nameEn":"Flamingo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/火烈鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0014.png","iconMissing":false,"hintZhRaw":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 @ 攻击 和 +2 O 生命\n1) eer ob CHB A LC Hoe ee. ? A wtin.? @ +s","hintZhClean":"火 烈 乌\nCD SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB SRY > 使 最 近 的 两 个 后 方 伙伴 获得 +2 攻击 和 +2 O 生命","hintEn":"","attack":3,"health":2,"abilityKey":"faint_buff_rear","implStatus":"implemented","color":"#f08da8","sourceSheet":"1乌龟兽群","sourceRow":18},{"id":"pack1_pet_0015","kind":"pack1_pet_0015","packKey":"pack1","nameZh":"蜗牛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜗牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0015.png","iconMissing":false,"hintZhRaw":"Om\nDOSER > 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 ， 使 最 近 的 三 个 前 方 伙伴 获得 +2 @ 攻击 。\nNf Fl > +t BR ab ON aw Fete cl tee BR LAS ee ow ee. Aa ws","hintZhClean":"Om\nDOSER > 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 DP 如 果 上 一 场 战斗 失败 , 使 最 近 的 三 个 前 方 伙伴 获得 +2 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f8fd1","sourceSheet":"1乌龟兽群","sourceRow":19},{"id":"pack1_pet_0016","kind":"pack1_pet_0016","packKey":"pack1","nameZh":"蜘蛛","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蜘蛛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0016.png","iconMissing":false,"hintZhRaw":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme => 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\n)\nNE oe ret ea 724 _ AC ICA ERIM Soe","hintZhClean":"CD sry > 召唤 一 个 2/2 的 1 级 3 阶 宠物 。\nCB sme > 召唤 一 个 4/4 的 2 级 3 阶 宠物 。\nNE oe ret ea 724 AC ICA ERIM Soe","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ce8f","sourceSheet":"1乌龟兽群","sourceRow":20},{"id":"pack1_pet_0017","kind":"pack1_pet_0017","packKey":"pack1","nameZh":"螃蟹","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/螃蟹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0017.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo @ ts","hintZhClean":"CD 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 25% 的 者 生命 。\n) CB 战斗 开始 时 > 获得 相当 于 生命 最 高 的 伙伴 50% 的 OD tH.\nME) pes) raed ea WUBI TH ewe) eT eo ts","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f91d1","sourceSheet":"1乌龟兽群","sourceRow":21},{"id":"pack1_pet_0018","kind":"pack1_pet_0018","packKey":"pack1","nameZh":"蠕虫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/蠕虫2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0018.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"1乌龟兽群","sourceRow":23},{"id":"pack1_pet_0019","kind":"kangaroo","packKey":"pack1","nameZh":"袋鼠","nameEn":"Kangaroo","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/袋鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0019.png","iconMissing":false,"hintZhRaw":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n» 3 前 方 伙 伴 攻击 时 > RG2O@ 攻击 和 +2 Ota.\n1) ase aot te ab 2078.2 Mw tin. @ +s","hintZhClean":"袋鼠\nOD 前 方 伙伴 攻击 时 > 获得 +1 Owes Ota.\n3 前 方 伙 伴 攻击 时 > RG2O 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"behind_attack_gain","implStatus":"implemented","color":"#c58c42","sourceSheet":"1乌龟兽群","sourceRow":24},{"id":"pack1_pet_0020","kind":"pack1_pet_0020","packKey":"pack1","nameZh":"鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/动物/鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0020.png","iconMissing":false,"hintZhRaw":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY => 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintZhClean":"CO sme 9 在 对 手 最 前 排 召唤 一 只 1/1 的 脏 电 。\n) CB SRY > 在 对 手 最 前 排 召唤 两 只 1/1 的 脏 鼠 。\n1) eee ab KH TBS RABI OL ae","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#938fd1","sourceSheet":"1乌龟兽群","sourceRow":25},{"id":"pack1_pet_0021","kind":"pack1_pet_0021","packKey":"pack1","nameZh":"公牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/公牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0021.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ced18f","sourceSheet":"1乌龟兽群","sourceRow":30},{"id":"pack1_pet_0022","kind":"rabbit","packKey":"pack1","nameZh":"家兔","nameEn":"Rabbit","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/家兔.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0022.png","iconMissing":false,"hintZhRaw":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。\nMY + ene te ae ee ea 8.2 国生 全 mM SH Bb","hintZhClean":"家 免\nOD 友 方 吃 掉 食 物 时 加 使 其 获得 +1 全 生命 。 每 回合 生效 3 次 。\n史 友 方 吃 掉 食 物 时 只 使 其 获得 *2 全 生命 每 回合 生效 3 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"friend_eat_bonus_health","implStatus":"implemented","color":"#f5f0f7","sourceSheet":"1乌龟兽群","sourceRow":31},{"id":"pack1_pet_0023","kind":"pack1_pet_0023","packKey":"pack1","nameZh":"海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/海豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0023.png","iconMissing":false,"hintZhRaw":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。\nNM) pe cl mae ea HS BIS LEA EERO th HOI","hintZhClean":"海豚\nCD 战斗 开始 时 > 对 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) 哆 战斗 开始 时 路 对 生命 最 低 的 敌人 造成 4 点 伤害 OO. 触发 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d0d18f","sourceSheet":"1乌龟兽群","sourceRow":32},{"id":"pack1_pet_0024","kind":"dodo","packKey":"pack1","nameZh":"渡渡鸟","nameEn":"Dodo","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/渡渡鸟.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0024.png","iconMissing":false,"hintZhRaw":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 @ 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 @ wai.\nMEY pes) rae ea CRBS OSE 6) Oe TEI ee eno 如 十","hintZhClean":"BBS\nCD RAF > 使 最 近 的 前 方 伙伴 获得 此 宠物 50% 的 攻击 。\n) CBA > 使 最 近 的 前 方 伙伴 获得 此 宠物 100% 的 wai.","hintEn":"","attack":2,"health":3,"abilityKey":"start_battle_buff_friend_ahead_attack","implStatus":"implemented","color":"#d7ad7b","sourceSheet":"1乌龟兽群","sourceRow":33},{"id":"pack1_pet_0025","kind":"pack1_pet_0025","packKey":"pack1","nameZh":"狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/狗.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0025.png","iconMissing":false,"hintZhRaw":"虽 伙伴 被 召唤 时 =» 获得 +2 全 攻击 和 +1 @@ 生命 ， 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 @ 攻击 和 +2 二 生命 ， 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2? @ te 二 ms","hintZhClean":"虽 伙伴 被 召唤 时 获得 +2 全 攻击 和 +1 生命 , 持 续 一 回合 。\ny B 伙伴 被 召唤 时 中 获得 +4 攻击 和 +2 二 生命 , 持 续 一 回合 .\nNEY op oe ah Z2 mt ee ha Ato tin.2 te 二 ms","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb8","sourceSheet":"1乌龟兽群","sourceRow":34},{"id":"pack1_pet_0026","kind":"pack1_pet_0026","packKey":"pack1","nameZh":"獾","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0026.png","iconMissing":false,"hintZhRaw":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintZhClean":"CD SRY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) CB BAY > 对 相 邻 的 宠物 造成 此 宠物 攻击 值 100% 的 伤害 O.\n1S ge rt bh 25 8 OO Ee A Be Eno he oe 全","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a7","sourceSheet":"1乌龟兽群","sourceRow":35},{"id":"pack1_pet_0027","kind":"pack1_pet_0027","packKey":"pack1","nameZh":"绵羊","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/绵羊.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0027.png","iconMissing":false,"hintZhRaw":"£8\nCO sey = 召唤 两 只 2/2 的 公 羊 。\n) CB amy => 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintZhClean":"CO sey 召唤 两 只 2/2 的 公 羊 。\n) CB amy > 召唤 两 只 4/4 的 公 羊 。\n1) eee ab ROC ICON","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ccd18f","sourceSheet":"1乌龟兽群","sourceRow":36},{"id":"pack1_pet_0028","kind":"pack1_pet_0028","packKey":"pack1","nameZh":"象","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/象.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0028.png","iconMissing":false,"hintZhRaw":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintZhClean":"OD 攻击 后 > 对 最 近 的 后 方 伙 伴 造成 1 点 伤害 O.\n) 鸣 攻击 后 > 对 最 近 的 后 方 伙 伴 造 成 1 点 伤害 OO. BHI,\nND wes ak BIR ME KOK EE EERO eM HOY","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ae","sourceSheet":"1乌龟兽群","sourceRow":37},{"id":"pack1_pet_0029","kind":"giraffe","packKey":"pack1","nameZh":"长颈鹿","nameEn":"Giraffe","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/长颈鹿.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0029.png","iconMissing":false,"hintZhRaw":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 @ 攻击 和 +1 @ tH.\nMW aaron ob BMH AS Howe.) A wstm.) @t+s","hintZhClean":"te il\nOD 回合 开始 时 > 使 最 近 的 一 个 前 方 伙伴 获得 +1 攻击 和 +1 O 生命 。\n) CB 回合 开始 时 > 使 最 近 的 两 个 前 方 伙伴 获得 +1 攻击 和 +1 tH.","hintEn":"","attack":2,"health":4,"abilityKey":"end_turn_buff_friend_ahead","implStatus":"implemented","color":"#e8b85e","sourceSheet":"1乌龟兽群","sourceRow":38},{"id":"pack1_pet_0030","kind":"camel","packKey":"pack1","nameZh":"骆驼","nameEn":"Camel","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/动物/骆驼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0030.png","iconMissing":false,"hintZhRaw":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 @ 攻击 和 +2 O tm.\n) 0B 受伤 时 => 使 最 近 的 后 方 伙伴 获得 +*2 @ 攻击 和 +4 Ota.\n1) =u et ea CRBS Ks oe ee. ? A wtiw.c @ts","hintZhClean":"CD 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +1 攻击 和 +2 O tm.\n) 0B 受伤 时 > 使 最 近 的 后 方 伙伴 获得 +*2 攻击 和 +4 Ota.\n1) u et ea CRBS Ks oe ee. A wtiw.c ts","hintEn":"","attack":2,"health":5,"abilityKey":"hurt_buff_rear","implStatus":"implemented","color":"#d1ba75","sourceSheet":"1乌龟兽群","sourceRow":39},{"id":"pack1_pet_0031","kind":"turtle","packKey":"pack1","nameZh":"乌龟","nameEn":"Turtle","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/乌龟2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0031.png","iconMissing":false,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":1,"health":2,"abilityKey":"faint_give_melon_friend_behind","implStatus":"implemented","color":"#6aaa77","sourceSheet":"1乌龟兽群","sourceRow":44},{"id":"pack1_pet_0032","kind":"penguin","packKey":"pack1","nameZh":"企鹅","nameEn":"Penguin","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/企鹅.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0032.png","iconMissing":false,"hintZhRaw":"TE #S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\nNM) 中 全 本 wp abd CHAR bebe oe 8.2? A wtin.2 @*=s+","hintZhClean":"TE S\nCD 回合 开始 时 加 使 两 个 2 级 或 以 上 的 伙伴 获得 +1 攻击 和 +1 Ota.\n) CB 回合 开始 时 DP 使 两 个 2 级 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":2,"abilityKey":"end_turn_buff_level2_friends","implStatus":"implemented","color":"#5d7d9f","sourceSheet":"1乌龟兽群","sourceRow":45},{"id":"pack1_pet_0033","kind":"pack1_pet_0033","packKey":"pack1","nameZh":"松鼠","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/松鼠.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0033.png","iconMissing":false,"hintZhRaw":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 =» 使 商店 所 有 食物 价格 减 2 O 金币 。\nfy fal =» Tbh ee CS FEE GE Te er ee ere fr Ooms","hintZhClean":"松鼠\nOQ) 回合 开始 时 > 使 商店 所 有 食物 价格 减 1 O 金币 。\n) 拘 回合 开始 时 使 商店 所 有 食物 价格 减 2 O 金币 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"1乌龟兽群","sourceRow":46},{"id":"pack1_pet_0034","kind":"pack1_pet_0034","packKey":"pack1","nameZh":"河豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河豚.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0034.png","iconMissing":false,"hintZhRaw":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 => 对 一 个 随机 敌人 造成 6 点 伤害 O.\nNM) =u et ea 个 tin Loe PORE ae","hintZhClean":"7B] AK\nOD 受伤 时 > 对 一 个 随机 敌人 造成 3 点 伤害 O.\n) CB 受伤 时 > 对 一 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"1乌龟兽群","sourceRow":47},{"id":"pack1_pet_0035","kind":"pack1_pet_0035","packKey":"pack1","nameZh":"河马","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/河马.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0035.png","iconMissing":false,"hintZhRaw":"7a] LS\nCD 击 个 时 > 获得 +3 @ 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey => 获得 +6 @ 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。\nE> et em 7EIB 6 A he tn OD mS el HAH II","hintZhClean":"7a] LS\nCD 击 个 时 > 获得 +3 攻击 和 +3 全 生命 。 每 场 战斗 生效 3 次 。\n) CB sey > 获得 +6 攻击 和 +6 二 生命 。 每 场 战斗 生效 3 次 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"1乌龟兽群","sourceRow":48},{"id":"pack1_pet_0036","kind":"pack1_pet_0036","packKey":"pack1","nameZh":"臭鼬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/臭鼬.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0036.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% @ 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. @t+=-","hintZhClean":"CD 战斗 开始 时 > 使 生命 最 高 的 敌人 -33% 生命 。\n) CB 战斗 开始 时 > 使 生命 最 高 的 敌人 66% O tH.\nNM) pec wae ea HH Se Bete) cnn. t+ -","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"1乌龟兽群","sourceRow":49},{"id":"pack1_pet_0037","kind":"pack1_pet_0037","packKey":"pack1","nameZh":"野牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/野牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0037.png","iconMissing":false,"hintZhRaw":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 ， 获 得 +2 全 攻击 和 +4 Ota.\nNY = om ot Ot oe IN Pee ee Re oe. Hwtin.c @ ts","hintZhClean":"野牛\nOD 回合 结束 时 路 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +1 全 攻击 和 +2 Ota.\n) 哆 回合 结束 时 D 如 果 此 宠物 有 3 级 的 伙伴 , 获 得 +2 全 攻击 和 +4 Ota.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"1乌龟兽群","sourceRow":50},{"id":"pack1_pet_0038","kind":"pack1_pet_0038","packKey":"pack1","nameZh":"鲸","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鲸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0038.png","iconMissing":false,"hintZhRaw":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 ， 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 ， 并 在 量 磋 后 将 其 作为 2 级 吐出 ，\nNM? pec race ab SBMS hi oR YL Se HrURM WD","hintZhClean":"Et\nCD 战斗 开始 时 > 吞噬 最 近 的 前 方 伙伴 , 并 在 量 顾 后 将 其 作为 1 级 吐出 。\n) Bete > 吞噬 最 近 的 前 方 伙 伴 , 并 在 量 磋 后 将 其 作为 2 级 吐出 ,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f92","sourceSheet":"1乌龟兽群","sourceRow":51},{"id":"pack1_pet_0039","kind":"pack1_pet_0039","packKey":"pack1","nameZh":"鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹦鹉.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0039.png","iconMissing":false,"hintZhRaw":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 ， 持 续 一 回合 。\nNY = om ot ot ea WE BSR ME HURRAH Ot ERS","hintZhClean":"BS 5\nDOSER > 复制 最 近 的 前 方 宠物 的 1 级 能 力 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 复制 最 近 的 前 方 宠物 的 2 级 能 力 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cf","sourceSheet":"1乌龟兽群","sourceRow":52},{"id":"pack1_pet_0040","kind":"pack1_pet_0040","packKey":"pack1","nameZh":"鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/动物/鹿1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0040.png","iconMissing":false,"hintZhRaw":"鹿\n页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。\nL3 晕厥时 -> 召唤一辆15/9且具有辣椒的公交车。","hintZhClean":"页 1/2\nL1 晕厥时 -> 召唤一辆5/3且具有辣椒的公交车。\nL2 晕厥时 -> 召唤一辆10/6且具有辣椒的公交车。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":53},{"id":"pack1_pet_0041","kind":"pack1_pet_0041","packKey":"pack1","nameZh":"公鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/公鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0041.png","iconMissing":false,"hintZhRaw":"公鸡\nOO sk © 召唤 一 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% @ 攻击 的 雏鸡 。\n1) eee ob 门 人 一 口 目 在 | 国生 和 Iankro 人 人 二 naeop","hintZhClean":"公鸡\nOO sk 召唤 一 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。\n) 0B sky > 召 痪 两 只 具有 1 O 生命 和 此 宠物 50% 攻击 的 雏鸡 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":57},{"id":"pack1_pet_0042","kind":"pack1_pet_0042","packKey":"pack1","nameZh":"奶牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/奶牛2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0042.png","iconMissing":false,"hintZhRaw":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintZhClean":"onl 一\n使 一 个 宠物 获得 +1 全 攻击 和 +2 OY 生命 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"1乌龟兽群","sourceRow":59},{"id":"pack1_pet_0043","kind":"pack1_pet_0043","packKey":"pack1","nameZh":"海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/海豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0043.png","iconMissing":false,"hintZhRaw":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 @ xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 @ 攻击 。\nEY nc ae ae et ea CR — A Hn oo) oe a8? A ws","hintZhClean":"3 59\nCD 吃 掉 食 物 时 > 使 三 个 随机 伙伴 获得 +1 xs.\n) CB 吃 掉 食 物 时 D> 使 三 个 随机 伙伴 获得 +2 攻击 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"1乌龟兽群","sourceRow":60},{"id":"pack1_pet_0044","kind":"pack1_pet_0044","packKey":"pack1","nameZh":"火鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/火鸡.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0044.png","iconMissing":false,"hintZhRaw":"火 鸡\nDO 伙伴 被 召唤 时 => 使 其 获得 +3 @ 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 => 使 其 获得 +6 @@ 攻击 和 +2 @ 生命 .\nNY a oe ae Tom et ea CHE EIB Mt tin.? @ +s","hintZhClean":"火 鸡\nDO 伙伴 被 召唤 时 > 使 其 获得 +3 攻击 和 +1 Otte.\n小 伙伴 被 召唤 时 > 使 其 获得 +6 攻击 和 +2 生命 .","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"1乌龟兽群","sourceRow":61},{"id":"pack1_pet_0045","kind":"pack1_pet_0045","packKey":"pack1","nameZh":"犀牛","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犀牛.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0045.png","iconMissing":false,"hintZhRaw":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。\n1 cet eh 3 Oe LOE PL SRE RON HIN eee","hintZhClean":"犀牛\nCD 击 个 时 > 对 最 前 排 的 敌人 造成 4 点 伤害 仿 。 对 1 阶 宠物 伤害 翻 倍 。\n) CB 击 倒 时 > 对 最 前 排 的 敌人 造成 8 点 伤害 侠 。 对 1 阶 宠物 伤害 翻 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"1乌龟兽群","sourceRow":62},{"id":"pack1_pet_0046","kind":"pack1_pet_0046","packKey":"pack1","nameZh":"犰狳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/犰狳.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0046.png","iconMissing":false,"hintZhRaw":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.\nME) pos) wae ea CESK Er oeentt@.l, @ +s","hintZhClean":"HR\nCD 战斗 开始 时 加 使 所 有 宠物 获得 +8 O tH.\n) CB 战斗 开始 时 > 使 所 有 宠物 获得 +16 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"1乌龟兽群","sourceRow":63},{"id":"pack1_pet_0047","kind":"pack1_pet_0047","packKey":"pack1","nameZh":"猴子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/猴子.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0047.png","iconMissing":false,"hintZhRaw":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 @ 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 和 +*4 O tm.\nNM) =o ot et mt EBM ee eee 让 二 IF @ te","hintZhClean":"猴子\nDOSER > 使 最 前 排 的 友 方 宠物 获得 +2 攻击 和 +2 O tH.\n) 哆 回合 结束 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 和 +*4 O tm.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"1乌龟兽群","sourceRow":64},{"id":"pack1_pet_0048","kind":"pack1_pet_0048","packKey":"pack1","nameZh":"蝎子","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/蝎子2.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0048.png","iconMissing":false,"hintZhRaw":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintZhClean":"花生 内 2/2\n击 倒 所 有 被 此 宠物 攻击 且 受 到 伤害 的 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb9d1","sourceSheet":"1乌龟兽群","sourceRow":66},{"id":"pack1_pet_0049","kind":"pack1_pet_0049","packKey":"pack1","nameZh":"鲨鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鲨鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0049.png","iconMissing":false,"hintZhRaw":"& &\nDO neemea > 获得 +2 @ 攻击 和 +2 @ 生命 。\n) Be eRe > 获得 +4 @ 攻击 和 *+4 O 生命 。\nND? op oe ae ert ee Bac Mwti.aic @ rs","hintZhClean":"DO neemea > 获得 +2 攻击 和 +2 生命 。\n) Be eRe > 获得 +4 攻击 和 *+4 O 生命 。\nND op oe ae ert ee Bac Mwti.aic rs","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a68f","sourceSheet":"1乌龟兽群","sourceRow":67},{"id":"pack1_pet_0050","kind":"pack1_pet_0050","packKey":"pack1","nameZh":"鳄鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/动物/鳄鱼.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0050.png","iconMissing":false,"hintZhRaw":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。\nNM) pes) wae ab HBC se Leo sie aw ab Pl","hintZhClean":"鳄鱼\nCD 战斗 开始 时 > 对 最 后 排 的 敌人 造成 8 点 伤害 O.\n) Bx > 对 最 后 排 的 敌人 造成 8 点 伤害 O. 触发 2 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c78fd1","sourceSheet":"1乌龟兽群","sourceRow":68},{"id":"pack1_pet_0051","kind":"pack1_pet_0051","packKey":"pack1","nameZh":"狼獾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/狼獾.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0051.png","iconMissing":false,"hintZhRaw":"AR\nD OAKS > 使 所 有 敌人 -3 @ tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 @ 生命\nfm 和 hz 人 nd ea EER th ao Mes","hintZhClean":"AR\nD OAKS > 使 所 有 敌人 -3 tH.\n) CB 四 个 伙伴 受伤 时 > 使 所 有 敌人 6 生命","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#98d18f","sourceSheet":"1乌龟兽群","sourceRow":72},{"id":"pack1_pet_0052","kind":"pack1_pet_0052","packKey":"pack1","nameZh":"猛犸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猛犸.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0052.png","iconMissing":false,"hintZhRaw":"th 59\nCD wre > 使 伙伴 获得 +2 @ 攻击 和 +2 O 生命 .\nCB memes => 使 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\n1) exe ab OHO OK ace TI Fr @ +s","hintZhClean":"th 59\nCD wre > 使 伙伴 获得 +2 攻击 和 +2 O 生命 .\nCB memes > 使 伙伴 获得 +*4 攻击 和 +4 Ota.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"1乌龟兽群","sourceRow":73},{"id":"pack1_pet_0053","kind":"pack1_pet_0053","packKey":"pack1","nameZh":"猩猩","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猩猩1.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0053.png","iconMissing":false,"hintZhRaw":"Ve Ye 页 1/2\nQD 受伤 时 » 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。\nfi 和 到 /Ap ob TIMES te OE St Bb","hintZhClean":"Ve Ye 页 1/2\nQD 受伤 时 获得 椰子 特性 。 每 回合 生效 1 次 。\n) CB 受伤 时 > 获得 椰子 特性 。 每 回合 生效 2 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"1乌龟兽群","sourceRow":74},{"id":"pack1_pet_0054","kind":"pack1_pet_0054","packKey":"pack1","nameZh":"猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/猫.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0054.png","iconMissing":false,"hintZhRaw":"狂\nQO 商店 食物 给 予 两 倍 攻击 @ 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 @5tH@O. saatm2”.\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintZhClean":"QO 商店 食物 给 予 两 倍 攻击 与 生命 井 。 每 回合 生效 2 次 。\n) GB 商店 食物 给 予 三 倍 攻击 5tH O. saatm2 .\n人 人 关上 An 了 mn 二 和 二 生生 国志 门人 小 sho","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c38fd1","sourceSheet":"1乌龟兽群","sourceRow":76},{"id":"pack1_pet_0055","kind":"pack1_pet_0055","packKey":"pack1","nameZh":"苍蝇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/苍蝇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0055.png","iconMissing":false,"hintZhRaw":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。\nND) op oe eR eb KES BM _ Oa ee 455 [| & Abe Be An","hintZhClean":"苑 蝇\nCD kee BRE > 在 其 位 置 召 唤 一 只 4/4 的 苍 锅 。 每 回合 生效 3 次 。\n) CB ke RRS > 在 其 位 置 召 唤 一 只 8/8 的 苍蝇 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9cd18f","sourceSheet":"1乌龟兽群","sourceRow":77},{"id":"pack1_pet_0056","kind":"pack1_pet_0056","packKey":"pack1","nameZh":"虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/虎.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0056.png","iconMissing":false,"hintZhRaw":"虎\nCO 在 战斗 中 ， 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 ， 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintZhClean":"CO 在 战斗 中 , 最 近 的 前 方 伙 伴 的 能 力 额外 触发 一 次 ( 视 为 1 级 效果 ) 。\n) 2 在 战斗 中 , 最 近 的 前 方 伙伴 的 能 力 额 外 起 发 一 次 ( 祝 为 2 级 效果 ) 。\nNM +z sci 5 > ON Fe a irri -人","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"1乌龟兽群","sourceRow":78},{"id":"pack1_pet_0057","kind":"pack1_pet_0057","packKey":"pack1","nameZh":"蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/蛇.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。\nfi 和 pmp 二 pa 入 htinrh LCE RPI Rm OY wtb el tanec","hintZhClean":"Fe\nD MAKERS D> 对 一 个 随机 敌人 造成 5 点 伤害 O. 每 场 战斗 生效 5 次 。\n) CB 前 方 伙伴 攻击 时 > 对 一 个 随机 敌人 造成 10 点 伤害 侠 。 每 场 战斗 生效 5 次 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"1乌龟兽群","sourceRow":79},{"id":"pack1_pet_0058","kind":"pack1_pet_0058","packKey":"pack1","nameZh":"豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/豹.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0058.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME? pes) wae ea HI Amminse bE OU Reeth HON HED","hintZhClean":"CD 战斗 开始 时 路 对 一 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\n) 鸣 战斗 开始 时 路 对 两 个 随机 敌人 造成 此 宠物 攻击 值 50% 的 伤害 O.\nME pes) wae ea HI Amminse bE OU Reeth HON HED","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d08fd1","sourceSheet":"1乌龟兽群","sourceRow":80},{"id":"pack1_pet_0059","kind":"pack1_pet_0059","packKey":"pack1","nameZh":"野猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/野猪.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0059.png","iconMissing":false,"hintZhRaw":"Ee c=]\nDO 攻击 前 > 获得 +4 @ 攻击 和 +2 @@ 生命 .\n» 3 攻击 前 > 获得 +8 @ 攻击 和 +4 Ota.\n3 eae ae Se we pres","hintZhClean":"Ee c ]\nDO 攻击 前 > 获得 +4 攻击 和 +2 生命 .\n3 攻击 前 > 获得 +8 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd18f","sourceSheet":"1乌龟兽群","sourceRow":81},{"id":"pack1_pet_0060","kind":"pack1_pet_0060","packKey":"pack1","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack1/pets/pack1_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b2","sourceSheet":"1乌龟兽群","sourceRow":82},{"id":"pack2_pet_0001","kind":"pack2_pet_0001","packKey":"pack2","nameZh":"伊犁鼠兔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/伊犁鼠兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0001.png","iconMissing":false,"hintZhRaw":"FRR?! ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1， 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2， 持 续 一 回合 。\nNY? op oe mr wet ea ChE BmwM.r 1ie_Mms","hintZhClean":"FRR ii\nCD 伙伴 变形 时 > 使 其 最 高 属性 +1, 持 续 一 回合 。\n) 鸣 伙伴 变形 时 > 使 其 最 高 属性 +2, 持 续 一 回合 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":2},{"id":"pack2_pet_0002","kind":"pack2_pet_0002","packKey":"pack2","nameZh":"埃塞俄比亚狼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/埃塞俄比亚狼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0002.png","iconMissing":false,"hintZhRaw":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n小 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃塞俄比亚 狠\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n小 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":3},{"id":"pack2_pet_0003","kind":"pack2_pet_0003","packKey":"pack2","nameZh":"托吉安鹿豚","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/托吉安鹿豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0003.png","iconMissing":false,"hintZhRaw":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 @ tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 @ tH,\n1) ec ab H_ Amine | oe.) @ +s","hintZhClean":"HARE\nCD sre > 使 一 个 随机 敌人 获得 +1 tH.\n) CB SRY > 使 一 个 随机 敌人 获得 +1 tH,","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":4},{"id":"pack2_pet_0004","kind":"pack2_pet_0004","packKey":"pack2","nameZh":"火山蜗牛","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/火山蜗牛2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0004.png","iconMissing":false,"hintZhRaw":"任意 单位 攻击 时 @ SHISHEO, ， 生 效 一 次 。","hintZhClean":"任意 单位 攻击 时 SHISHEO, , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":6},{"id":"pack2_pet_0005","kind":"pack2_pet_0005","packKey":"pack2","nameZh":"熊蜂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/熊蜂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0005.png","iconMissing":false,"hintZhRaw":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ，\nEY sek ey eB oe 时 A Le Pl eae OY me cl tahoe","hintZhClean":"AE SF\nDA REAR DP 对 最 前 排 的 敌人 造成 1 点 伤害 O. 每 场 战斗 生效 2 次 。\n) 鸣 敌人 攻击 两 次 时 加 对 最 前 排 的 敌人 造成 2 点 伤害 O, 每 场 战斗 生效 2 次 ,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":7},{"id":"pack2_pet_0006","kind":"pack2_pet_0006","packKey":"pack2","nameZh":"翡翠贻贝","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/翡翠贻贝.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0006.png","iconMissing":false,"hintZhRaw":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。\nNW mane). | OSH Ab","hintZhClean":"45 206 1\nQD 受到 的 伤害 减少 1 点 。 每 回合 生效 2 次 。\n) CB 受到 的 伤害 减少 2 点 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":8},{"id":"pack2_pet_0007","kind":"pack2_pet_0007","packKey":"pack2","nameZh":"西表猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/西表猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0007.png","iconMissing":false,"hintZhRaw":"FOR Is\n加 战斗 前 >» 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 => 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。\n1S tec) wa KA Te BON ee ER 1)","hintZhClean":"FOR Is\n加 战斗 前 > 变 为 任 一 有 用 的 1 阶 宠物 (等 级 为 ]) 。\n) 3 战斗 前 > 变 为 任 一 有 用 的 2 阶 宠 物 (SMAI) 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":9},{"id":"pack2_pet_0008","kind":"pack2_pet_0008","packKey":"pack2","nameZh":"非洲野狗","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/非洲野狗.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0008.png","iconMissing":false,"hintZhRaw":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 ， 造 成 3 点 伤 寄 〇 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 ， 造 成 6 点 伤害 O,\nNS sec) wand wa HUES kh :过 Fo 上 六","hintZhClean":"非洲 野 狗\nCD 战斗 开始 时 > 跳跃 攻击 第 二 排 敌人 , 造 成 3 点 伤 寄 。\n) 力战 斗 开始 时 中 跳跃 攻击 第 二 排 敌 人 , 造 成 6 点 伤害 O,","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c98fd1","sourceSheet":"2濒危兽群","sourceRow":10},{"id":"pack2_pet_0009","kind":"pack2_pet_0009","packKey":"pack2","nameZh":"马来貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/马来貘.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0009.png","iconMissing":false,"hintZhRaw":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 @@O 生命 。 每 回合 生效 3 次 。\nfy 440 61 OK TH Ee aa UI. 2 OO KH 455 (Al) & 4 GA 2° Ar","hintZhClean":"OK\nQO 相 邻 伙伴 攻击 后 > 获得 +1l O tH. 每 回合 生效 3 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 获得 +2 O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#95d18f","sourceSheet":"2濒危兽群","sourceRow":11},{"id":"pack2_pet_0010","kind":"pack2_pet_0010","packKey":"pack2","nameZh":"齿嘴鸠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/动物/齿嘴鸠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0010.png","iconMissing":false,"hintZhRaw":"一 堆 种 子 A 2}:\n使 一 个 宠物 获得 +1 O 生命 。","hintZhClean":"一 堆 种 子 A 2 :\n使 一 个 宠物 获得 +1 O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aed18f","sourceSheet":"2濒危兽群","sourceRow":13},{"id":"pack2_pet_0011","kind":"pack2_pet_0011","packKey":"pack2","nameZh":"中南大羚","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/中南大羚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0011.png","iconMissing":false,"hintZhRaw":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 @ 攻击 和 +2 @ tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 @ 攻击 和 +2 O tH.\nMW) mace stn ob Het Bem Awww) A wt. @ +s","hintZhClean":"中 南大 状\nDOSER > 使 攻击 最 高 的 伙伴 获得 -1 攻击 和 +2 tm.\n) 鸣 回合 结束 时 DS 使 攻击 最 高 的 两 个 伙伴 获得 1 攻击 和 +2 O tH.","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b18fd1","sourceSheet":"2濒危兽群","sourceRow":16},{"id":"pack2_pet_0012","kind":"pack2_pet_0012","packKey":"pack2","nameZh":"侏儒猪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/侏儒猪2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0012.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b0d18f","sourceSheet":"2濒危兽群","sourceRow":18},{"id":"pack2_pet_0013","kind":"pack2_pet_0013","packKey":"pack2","nameZh":"普氏野马","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/普氏野马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0013.png","iconMissing":false,"hintZhRaw":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She => 召 隐 一 个 6/4 的 非洲 野 狗 ; 它 会 跳跃 攻击 第 二 排 的 敌人 。\n1) eet ab 2A AOC st eh: SPOOL me twee","hintZhClean":"BAS\nCD sre > 召唤 一 个 3/2 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。\n) CB She > 召 隐 一 个 6/4 的 非洲 野 狗 它 会 跳跃 攻击 第 二 排 的 敌人 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#af8fd1","sourceSheet":"2濒危兽群","sourceRow":19},{"id":"pack2_pet_0014","kind":"pack2_pet_0014","packKey":"pack2","nameZh":"泰塔尖鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/泰塔尖鼠2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0014.png","iconMissing":false,"hintZhRaw":"& EUR\nTQ 2/:\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\nTQ 2/:\n) sae 下 一 回合 获得 +1 O 金币 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a9d18f","sourceSheet":"2濒危兽群","sourceRow":21},{"id":"pack2_pet_0015","kind":"pack2_pet_0015","packKey":"pack2","nameZh":"澳洲水貂","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/澳洲水貂.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0015.png","iconMissing":false,"hintZhRaw":"BR GAN 7K $2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。\nfy AVE OK TH Se om SHRINE Mest 455 (Al) & 4 GS QA","hintZhClean":"BR GAN 7K 2\nQO 相 第 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +1 ONG. 每 回合 生效 5 次 。\n) 上 哆 相 和 分 伙伴 攻击 后 > 使 相 邻 伙伴 获得 +2 ONE. 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b58fd1","sourceSheet":"2濒危兽群","sourceRow":22},{"id":"pack2_pet_0016","kind":"pack2_pet_0016","packKey":"pack2","nameZh":"白腹鹭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/白腹鹭2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0016.png","iconMissing":true,"hintZhRaw":"页 2/:\n内 骨头\n攻击 伤害 〇 +3。","hintZhClean":"页 2/:\n内 骨头\n攻击 伤害 +3。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#acd18f","sourceSheet":"2濒危兽群","sourceRow":24},{"id":"pack2_pet_0017","kind":"pack2_pet_0017","packKey":"pack2","nameZh":"赛克尔隼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/赛克尔隼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0017.png","iconMissing":false,"hintZhRaw":"FF oe\nOD 攻击 前 OP URRBN, RO+2O@ 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。\n1D? we tee 证 昌国 pz rr Ot mse shy","hintZhClean":"FF oe\nOD 攻击 前 OP URRBN, RO+2O 攻击 和 +2 二 生命 。 每 回合 生效 3 次 。\ny B 攻 击 前 中 ame, 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b38fd1","sourceSheet":"2濒危兽群","sourceRow":25},{"id":"pack2_pet_0018","kind":"pack2_pet_0018","packKey":"pack2","nameZh":"达尔文狐","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/达尔文狐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0018.png","iconMissing":false,"hintZhRaw":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。\nNf Sy A 24 RS eh 7423S Se at Bett ante bo Fh Oe ST te -全 4e5 4%, ER OL AE BS 2","hintZhClean":"达尔 文 狐\nCD 敌人 受伤 时 D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战斗 生效 1 次 。\n) BASEN D> 对 该 宠物 或 最 前 排 的 敌人 发 动 跳跃 攻击 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b7d18f","sourceSheet":"2濒危兽群","sourceRow":26},{"id":"pack2_pet_0019","kind":"pack2_pet_0019","packKey":"pack2","nameZh":"长鼻猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/长鼻猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0019.png","iconMissing":false,"hintZhRaw":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\nNM) marron ab BEE M HABE bh) ETE AHIR 1 ET th","hintZhClean":"te HK\nCD 回合 开始 时 吵 将 最 近 的 一 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。\n) CB 回合 开始 时 DS 将 最 近 的 两 个 前 方 伙伴 变 为 同 阶 的 其 他 宠物 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a88fd1","sourceSheet":"2濒危兽群","sourceRow":27},{"id":"pack2_pet_0020","kind":"pack2_pet_0020","packKey":"pack2","nameZh":"阿拉里佩侏儒鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/动物/阿拉里佩侏儒鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0020.png","iconMissing":false,"hintZhRaw":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 @ 获得 +3 @@ 生命 ， 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。\nfy 站 OF OZ OME Te 1358.0 TO ++ ORR ms a fA) & Ae ASDA","hintZhClean":"阿拉 里 佩 侏 傅 乌\nQO 伙伴 跳跃 或 变形 后 获得 +3 生命 , 持 续 一 回合 。 每 回合 生效 2 次 。\n) C3 伙伴 跳跃 或 变形 后 路 获得 +6 O th, HR-OS. 每 回合 生效 2 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"2濒危兽群","sourceRow":28},{"id":"pack2_pet_0021","kind":"pack2_pet_0021","packKey":"pack2","nameZh":"亨氏牛羚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/亨氏牛羚2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0021.png","iconMissing":false,"hintZhRaw":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 @ 攻击 。\n» 3 BAY > 使 前 两 个 敌人 1 @ 攻击 。\n1) eee ab HE KA | ws","hintZhClean":"埃 春 俄 比 亚 狠 页 2/:\nOD sre 9 使 最 前 排 的 敌人 -1 攻击 。\n3 BAY > 使 前 两 个 敌人 1 攻击 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"2濒危兽群","sourceRow":33},{"id":"pack2_pet_0022","kind":"pack2_pet_0022","packKey":"pack2","nameZh":"侏儒河马","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/侏儒河马.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0022.png","iconMissing":false,"hintZhRaw":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\nNf lek eto ce at 24S BH KH Ase LoS ee tee @ + 2 220M DD","hintZhClean":"th fi 9) S\nOD 敌人 攻击 五 次 后 D> 对 生命 最 低 的 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.\n) 鸣 敌人 攻击 五 次 后 > 对 生命 最 低 的 两 个 敌人 造成 此 宠物 O 生命 33% 的 伤害 O.","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"2濒危兽群","sourceRow":34},{"id":"pack2_pet_0023","kind":"pack2_pet_0023","packKey":"pack2","nameZh":"勺嘴鹬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/勺嘴鹬.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0023.png","iconMissing":false,"hintZhRaw":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。\nNM marron ea BEM HAS Howe Bi wees,","hintZhClean":"A) 6 AS\nCD 回合 开始 时 > 使 最 近 的 一 个 后 方 伙伴 的 最 低 属性 +2。\n) 哆 回合 开始 时 加 使 最 近 的 两 个 后 方 伙 伴 的 最 低 属性 +2。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b4","sourceSheet":"2濒危兽群","sourceRow":35},{"id":"pack2_pet_0024","kind":"pack2_pet_0024","packKey":"pack2","nameZh":"土库海豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/土库海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0024.png","iconMissing":false,"hintZhRaw":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +3 @ 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 ， 并 使 其 在 战斗 中 获得 +6 @ 攻击 和 *6 Ota.\nTE) aw rit bh Be ok ee ee Ot EK el ce BH etn @ +=","hintZhClean":"土 库 海 豚\nCD SRY > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +3 攻击 和 +3 O tm.\n) CB SR > 将 最 后 排 的 伙伴 推 至 最 前 排 , 并 使 其 在 战斗 中 获得 +6 攻击 和 *6 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"2濒危兽群","sourceRow":36},{"id":"pack2_pet_0025","kind":"pack2_pet_0025","packKey":"pack2","nameZh":"树袋鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/树袋鼠1.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0025.png","iconMissing":false,"hintZhRaw":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活一次。\nL2 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活两次。\nL3 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢，并激活三次。","hintZhClean":"树袋鼠\n页 1/2\nL1 战斗开始时 -> 使最靠后的没有特性的敌人变得愚蠢,并激活一次。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"2濒危兽群","sourceRow":37},{"id":"pack2_pet_0026","kind":"pack2_pet_0026","packKey":"pack2","nameZh":"猴面蝙蝠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/猴面蝙蝠.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0026.png","iconMissing":false,"hintZhRaw":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 |] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。\nNf Eee ewe ee EC web BA HN St eee. A wtinic @ +s aur 4%, FS ol AE BSD AP","hintZhClean":"钦 面 蝙蝠\nQD 后 方 任意 单位 受伤 后 D> 使 两 个 随机 友 方 宠 物 获得 +1 ] 攻击 和 +2 二 生命 。 每 场 战斗 生效 2 次 。\n) CB 后 方 任意 单位 受伤 后 > 使 两 个 随机 友 方 宠物 获得 +2 便 攻击 和 +*4 二 生命 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"2濒危兽群","sourceRow":39},{"id":"pack2_pet_0027","kind":"pack2_pet_0027","packKey":"pack2","nameZh":"琉球兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/琉球兔.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0027.png","iconMissing":false,"hintZhRaw":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 ， 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\nNS rp we UA IRN ee HRN EHO BAMHI","hintZhClean":"琉球 免\nCD 战斗 开始 时 > 永久 获得 +1 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 永久 获得 +2 加 攻击 , 并 对 攻击 力 最 高 的 敌人 发 动 跳跃 攻击 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"2濒危兽群","sourceRow":40},{"id":"pack2_pet_0028","kind":"pack2_pet_0028","packKey":"pack2","nameZh":"罗洛韦猴","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/罗洛韦猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0028.png","iconMissing":false,"hintZhRaw":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。\nNf be oL WAG Qe ab 2 OOo TN OF OK OWE 4 LOO Sn FRO 2A TB) Ko oe 8 eB Oh ae TE ER 4 2)","hintZhClean":"BiB Bk\nCD RAF > 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 1) 。\n小 RAF DP 将 前 方 两 个 伙伴 变 为 任意 有 用 的 3 阶 及 以 下 具有 受伤 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa2","sourceSheet":"2濒危兽群","sourceRow":41},{"id":"pack2_pet_0029","kind":"pack2_pet_0029","packKey":"pack2","nameZh":"羚牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/羚牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0029.png","iconMissing":false,"hintZhRaw":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 @ 生命 ， 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 ， 持 续 一 回合 。\nfy yt Ra nm OH —™) 3274s","hintZhClean":"冷 牛\nQO 前 方 伙伴 受伤 时 吵 获得 +1 O 攻击 和 +2 生命 , 持 续 一 回合 。\n) CO 前 方 伙伴 受伤 时 > 获得 +2 四 攻击 和 +*4 O 生命 , 持 续 一 回合 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bf","sourceSheet":"2濒危兽群","sourceRow":42},{"id":"pack2_pet_0030","kind":"pack2_pet_0030","packKey":"pack2","nameZh":"蓝喉金刚鹦鹉","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/动物/蓝喉金刚鹦鹉.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0030.png","iconMissing":false,"hintZhRaw":"WA Dee = MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 ， 使 其 获得 +3 @ 攻击 ， 持 续 一 回合 ; 否则 ， 使 其 获得 @ 生命 。\n小 伙伴 变形 时 @ 若 其 在 前 排 ， 使 其 获得 +6 全 攻击， 持续 一 回合 ; BM, CHRO 生命.\nNf 人 2% MEU A eh 3 ET Pr a4 et 43 Ff ZEA 20 a Th = 2 eh fh) oe - AEM ‘sew @ ++=-","hintZhClean":"WA Dee MM) BS 8\nD 伙伴 变形 时 + 若 其 在 前 排 , 使 其 获得 +3 攻击 , 持 续 一 回合 否则 , 使 其 获得 生命 。\n小 伙伴 变形 时 若 其 在 前 排 , 使 其 获得 +6 全 攻击, 持续 一 回合 BM, CHRO 生命.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"2濒危兽群","sourceRow":43},{"id":"pack2_pet_0031","kind":"pack2_pet_0031","packKey":"pack2","nameZh":"亚马逊海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/亚马逊海豚.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0031.png","iconMissing":false,"hintZhRaw":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 ， 或 获得 +3 @ 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 ， 或 获得 +6 @ 攻击 .\nNM) sa eeavpak te te ab ME Sect ctoscic mw CO 十 这/ 有 CO 人 十","hintZhClean":"亚 与 进 可 用\nDO 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 3 点 伤害 侠 , 或 获得 +3 攻击 .\n) 哆 相 邹 伙伴 攻击 后 哆 对 其 目标 造成 6 点 伤害 侠 , 或 获得 +6 攻击 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"2濒危兽群","sourceRow":47},{"id":"pack2_pet_0032","kind":"pack2_pet_0032","packKey":"pack2","nameZh":"倭黑猩猩","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/倭黑猩猩.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0032.png","iconMissing":false,"hintZhRaw":"倭 黑猩猩\nCD 回合 开始 时 &@ 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 => 变 为 最 前 排 的 伙伴 。\nNM) marron ob TH Beto) oe","hintZhClean":"倭 黑猩猩\nCD 回合 开始 时 变 为 最 前 排 的 伙伴 。\n小 回合 开始 时 > 变 为 最 前 排 的 伙伴 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"2濒危兽群","sourceRow":48},{"id":"pack2_pet_0033","kind":"pack2_pet_0033","packKey":"pack2","nameZh":"天使鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/天使鲨.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0033.png","iconMissing":false,"hintZhRaw":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。\nfy fal = +2 RY eb CEE Ty 61: KOH OS fe 2","hintZhClean":"天 使 多\nOQ) 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +1。\n) C8 回合 结束 时 > 使 所 有 伙伴 的 最 高 属性 +2。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"2濒危兽群","sourceRow":49},{"id":"pack2_pet_0034","kind":"pack2_pet_0034","packKey":"pack2","nameZh":"巨獭","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/巨獭.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0034.png","iconMissing":false,"hintZhRaw":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 => 使 所 有 伙伴 获得 +4 O KHN+10O 生命 ， 持 续 至 第 一 次 非 跳跃 攻击 后 。\nfy 上 上 cl 二 oem CREE tree zk 二 FTP 二 xz 1c Oem) Er Ie 二 天","hintZhClean":"BH\nCO 战斗 前 > 使 所 有 伙伴 获得 +2 ORES 人 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。\n) C8 战斗 前 > 使 所 有 伙伴 获得 +4 O KHN+10O 生命 , 持 续 至 第 一 次 非 跳跃 攻击 后 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"2濒危兽群","sourceRow":50},{"id":"pack2_pet_0035","kind":"pack2_pet_0035","packKey":"pack2","nameZh":"栉齿锯鳐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/栉齿锯鳐.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0035.png","iconMissing":false,"hintZhRaw":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 @ 生命 ， 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 ， 并 使 所 有 敌人 8 OY tH.\n小 -\nteh wet Oo ce at 7578.17 @ > +e ewe 1 1D @ +s","hintZhClean":"By,\nOD 敌人 攻击 五 次 后 9 获得 +4 生命 , 并 使 所 有 天 人 -4 全 生命 .\n敌人 攻击 五 次 后 DRESS 二 生命 , 并 使 所 有 敌人 8 OY tH.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"2濒危兽群","sourceRow":51},{"id":"pack2_pet_0036","kind":"pack2_pet_0036","packKey":"pack2","nameZh":"波纹唇鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/波纹唇鱼.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0036.png","iconMissing":false,"hintZhRaw":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% @ KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% @ 攻击 .\nNM) peel wae ob Chet Bete ann. Hawt","hintZhClean":"疲 纹 唇 鱼\nCD 战斗 开始 时 > 使 攻击 最 高 的 敌人 -30% KH.\n) 鸣 战斗 开始 时 > 使 攻击 最 高 的 敌人 60% 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"2濒危兽群","sourceRow":52},{"id":"pack2_pet_0037","kind":"pack2_pet_0037","packKey":"pack2","nameZh":"袋獾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/袋獾2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0037.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"2濒危兽群","sourceRow":54},{"id":"pack2_pet_0038","kind":"pack2_pet_0038","packKey":"pack2","nameZh":"金狮狨猴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/金狮狨猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0038.png","iconMissing":false,"hintZhRaw":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。\nMEY ra eh OF HO 丰 故国 在 ke、 ZT OR BEE Some EER AH?)","hintZhClean":"se WT\nCD 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 1) 。\n小 战斗 前 > 变 为 任 一 有 用 的 具有 战斗 开始 时 能 力 的 5 阶 宠物 (等 级 为 2) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"2濒危兽群","sourceRow":55},{"id":"pack2_pet_0039","kind":"pack2_pet_0039","packKey":"pack2","nameZh":"阿尔达布拉象龟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/阿尔达布拉象龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0039.png","iconMissing":false,"hintZhRaw":"Bo] “RA Fp ti RRB\nDassen» 获得 +2 二 生命 ， 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100，\n小 回合 结束 时 > 获得 +4 @ 生命 ， 并 将 O@ 攻击 设 为 8。 生 命 上 限 可 达 100，\nfi 人 请 全 广 未 pi ee Mc Hee te 让 证 :Ar +e EBT tin:","hintZhClean":"Bo] RA Fp ti RRB\nDassen 获得 +2 二 生命 , 并 将 OQ 攻击 设 为 4。 生 命 上 限 可 达 100,\n小 回合 结束 时 > 获得 +4 生命 , 并 将 O 攻击 设 为 8。 生 命 上 限 可 达 100,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"2濒危兽群","sourceRow":56},{"id":"pack2_pet_0040","kind":"pack2_pet_0040","packKey":"pack2","nameZh":"鸮鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/动物/鸮鹦鹉2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0040.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bc8fd1","sourceSheet":"2濒危兽群","sourceRow":58},{"id":"pack2_pet_0041","kind":"pack2_pet_0041","packKey":"pack2","nameZh":"几何陆龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/几何陆龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0041.png","iconMissing":false,"hintZhRaw":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 => 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。\nNE) =u et ea 34 _ A HEN Sh OL OE PEE SE Be ae 全 MI.","hintZhClean":"几何 陆 龟\nCD 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 O 的 33%。\n) 0B 受伤 时 > 对 一 个 随机 敌人 造成 所 受到 伤害 侠 的 66%。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a3d18f","sourceSheet":"2濒危兽群","sourceRow":62},{"id":"pack2_pet_0042","kind":"pack2_pet_0042","packKey":"pack2","nameZh":"夏威夷僧海豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/夏威夷僧海豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0042.png","iconMissing":false,"hintZhRaw":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命\nNM) aaron ea OH bith ib ll ET Ameo oe aac @ 小 全","hintZhClean":"夏威夷 僧 海 豹\nCD DASH D> 使 上 一 场 战 斗 中 曼 顾 的 三 个 随机 伙伴 获得 +2 Ota.\n) 哆 回合 开始 时 路 使 上 一 场 战 斗 中 量 磋 的 三 个 随机 伙伴 获得 +4 二 生命","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#be8fd1","sourceSheet":"2濒危兽群","sourceRow":63},{"id":"pack2_pet_0043","kind":"pack2_pet_0043","packKey":"pack2","nameZh":"小熊猫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/小熊猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0043.png","iconMissing":false,"hintZhRaw":"/\\\\ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 ， 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\nNEY os et ea ii 下 _RA 在 让 :汉人 和 pa OTE ie tee (STL Oe am Eo AX)","hintZhClean":"/ AE 38\nCD 购买 时 > 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。\n小 购买 时 路 从 下 一 阶 商店 选择 一 个 宠物 , 变 形 为 该 宠物 (可 从 任意 兽 群 选择 ) 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a0d18f","sourceSheet":"2濒危兽群","sourceRow":64},{"id":"pack2_pet_0044","kind":"pack2_pet_0044","packKey":"pack2","nameZh":"指猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/指猴2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0044.png","iconMissing":false,"hintZhRaw":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。\nNM marron abd :大汉 人 DonnnxynysI 一 加","hintZhClean":"IM 页 2/2\nOD 回合 开始 时 > 选择 一 个 1 级 的 狐 猴 玩具 。\n) CB 回合 开始 时 串 选择 一 个 2 级 的 狐 净 玩具 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b88fd1","sourceSheet":"2濒危兽群","sourceRow":66},{"id":"pack2_pet_0045","kind":"pack2_pet_0045","packKey":"pack2","nameZh":"泰塔鸫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/泰塔鸫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0045.png","iconMissing":false,"hintZhRaw":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 @KGN+2O 生命 。 每 回合 生效 3 次 。\nND? 40 48 Ook Te eo CEER Seb ow a? A we ti.2 Ot mM SH ab.","hintZhClean":"RISKS\nD 相 和 分 伙伴 攻击 后 > 使 所 有 伙伴 获得 +1 Okt Ota. 每 回合 生效 3 次 。\n) 哆 相 和 分 伙伴 攻击 后 D> 使 所 有 伙伴 获得 +2 KGN+2O 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a7d18f","sourceSheet":"2濒危兽群","sourceRow":67},{"id":"pack2_pet_0046","kind":"pack2_pet_0046","packKey":"pack2","nameZh":"海鬣蜥","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/海鬣蜥2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0046.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"2濒危兽群","sourceRow":69},{"id":"pack2_pet_0047","kind":"pack2_pet_0047","packKey":"pack2","nameZh":"考氏鳍竺鲷","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/考氏鳍竺鲷.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0047.png","iconMissing":false,"hintZhRaw":"S as = 88\nCO wim = 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 @ 攻击 ， 最 低 减 至 4。\nME) pec) mae ea CER SS ah ee oo Tb 二 Brae","hintZhClean":"S as 88\nCO wim 使 所 有 其 他 宠物 -6 Oxt, MRM.\n) CB 战斗 开始 时 四 使 所 有 其 他 宠物 12 攻击 , 最 低 减 至 4。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a5d18f","sourceSheet":"2濒危兽群","sourceRow":70},{"id":"pack2_pet_0048","kind":"pack2_pet_0048","packKey":"pack2","nameZh":"西瓜龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/西瓜龟2.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0048.png","iconMissing":true,"hintZhRaw":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintZhClean":"onl r\nA Pk 3 DL 2/2\n屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c58fd1","sourceSheet":"2濒危兽群","sourceRow":72},{"id":"pack2_pet_0049","kind":"pack2_pet_0049","packKey":"pack2","nameZh":"长丝巨鲇","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/长丝巨鲇.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0049.png","iconMissing":false,"hintZhRaw":"1 22 6 84\nQO sky» 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 ， 对 一 个 随机 敌人 造成 8 点 伤害 O.\n1) ect ob KOM E_ARK wee 入 pinb erplio 上 全 二 全","hintZhClean":"1 22 6 84\nQO sky 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) sky 串 本 回合 每 有 一 个 友 方 宠物 变形 , 对 一 个 随机 敌人 造成 8 点 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9ad18f","sourceSheet":"2濒危兽群","sourceRow":73},{"id":"pack2_pet_0050","kind":"pack2_pet_0050","packKey":"pack2","nameZh":"雪豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/动物/雪豹.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0050.png","iconMissing":false,"hintZhRaw":"SN\nCD 战斗 开始 时 > 获得 +5 | 攻击 和 *+5 二 生命 ， 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 @ 攻击 和 +10 OD 生命 ， 并 跳跃 攻击 一 个 随机 敌人 ，\nMEY pec) raed ea 7578.10 TI ic @te + eee t_Aminewi","hintZhClean":"SN\nCD 战斗 开始 时 > 获得 +5 攻击 和 *+5 二 生命 , 并 跳跃 攻击 一 个 随机 敌人 。\n) 哆 战斗 开始 时 路 获得 +10 攻击 和 +10 OD 生命 , 并 跳跃 攻击 一 个 随机 敌人 ,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c4d18f","sourceSheet":"2濒危兽群","sourceRow":74},{"id":"pack2_pet_0051","kind":"pack2_pet_0051","packKey":"pack2","nameZh":"丝绒冕狐猴","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/丝绒冕狐猴.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0051.png","iconMissing":false,"hintZhRaw":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。\nNf ES cL WAG Re ab 2 Gt ABN CO) OK OWE 4% OO So RON ts BS 8 HO ee ae CO OE ER 4 2)","hintZhClean":"Le GY Be MN HR\nCD 战斗 开始 时 加 BEAATUHEHNERARHOMREBRENNDRM (等 级 为 1]) 。\n) CB 战斗 开始 时 > 将 后 方 两 个 伙伴 变 为 任意 有 用 的 6 阶 具 有 量 顾 能 力 的 宠物 (等 级 为 2) 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9b8fd1","sourceSheet":"2濒危兽群","sourceRow":78},{"id":"pack2_pet_0052","kind":"pack2_pet_0052","packKey":"pack2","nameZh":"加州秃鹰","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/加州秃鹰.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0052.png","iconMissing":false,"hintZhRaw":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。\nNEY op oe mr et ee TRIMER BE OEE ER Sl 人 Ah","hintZhClean":"PON FE BS\nCD 伙伴 变形 时 > 获得 其 1 级 能 力 。 每 场 战斗 生效 2 次 。\n) 哆 伙伴 变形 时 > 获得 其 2 级 能 力 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c6d18f","sourceSheet":"2濒危兽群","sourceRow":79},{"id":"pack2_pet_0053","kind":"pack2_pet_0053","packKey":"pack2","nameZh":"婆罗洲金猫","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/婆罗洲金猫.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0053.png","iconMissing":false,"hintZhRaw":"2S iN = Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 ， 并 激活 其 能 力 。\nNf @@et ab 72°40 BK Oo ORO ge £8 、| IT 84 BEA BOAR) SOO OCS Be -人","hintZhClean":"2S iN Fk\nOD SRY > 召唤 任意 一 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。\n) CB SRY > 召唤 任意 两 个 有 用 的 具有 战斗 开始 能 力 的 4 阶 宠物 , 并 激活 其 能 力 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#998fd1","sourceSheet":"2濒危兽群","sourceRow":80},{"id":"pack2_pet_0054","kind":"pack2_pet_0054","packKey":"pack2","nameZh":"灰犀鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/灰犀鸟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0054.png","iconMissing":false,"hintZhRaw":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。\nfy fal &@ ¢2 DBRS a 16 — MO): eK OM 2 Se wt OS","hintZhClean":"BRS\nCO) 回合 结束 时 > 使 三 个 伙伴 的 最 低 力 性 分 别 +2。\n) C8 回合 结束 时 D> 使 三 个 伙伴 的 最 低 属性 分 别 +4。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c8d18f","sourceSheet":"2濒危兽群","sourceRow":81},{"id":"pack2_pet_0055","kind":"pack2_pet_0055","packKey":"pack2","nameZh":"绿海龟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/绿海龟.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0055.png","iconMissing":false,"hintZhRaw":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。\nNf leh tet DY ce ab CBB St wee mwa mito se we ON ws 45 (7) & 4+ S61 Ar","hintZhClean":"绿 海龟\nOD 敌人 攻击 五 次 后 哆 使 所 有 友 方 宠物 获得 能 够 屏蔽 20 点 伤害 ONAN. 每 回合 生效 1 次 。\n) 鸣 敌人 攻击 五 次 后 D 使 所 有 友 方 宠物 获得 能 够 屏蔽 40 点 伤害 ONAL. 每 回合 生效 1 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#968fd1","sourceSheet":"2濒危兽群","sourceRow":82},{"id":"pack2_pet_0056","kind":"pack2_pet_0056","packKey":"pack2","nameZh":"苏门达腊虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/苏门达腊虎.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0056.png","iconMissing":false,"hintZhRaw":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 ， 并 对 相 邻 敌人 造成 6 点 伤害 。\nNf be | Wee ee abd FS — il (BOO te 人 He Kh Oe ST Th 二 2 HMA 人 SP 1I Se a","hintZhClean":"苏 门 达 腊 虎\nCD 战斗 开始 时 路 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 。\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 发 动 跳跃 攻击 , 并 对 相 邻 敌人 造成 6 点 伤害 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cbd18f","sourceSheet":"2濒危兽群","sourceRow":83},{"id":"pack2_pet_0057","kind":"pack2_pet_0057","packKey":"pack2","nameZh":"菲律宾雕","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/菲律宾雕.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0057.png","iconMissing":false,"hintZhRaw":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 @ 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 @ 攻击 和 +8 Ota.\nNY cr me i eT ot BAN et oe 8.1) A wt.) 国 秆 全","hintZhClean":"FEZ RAR\nDO 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +4 攻击 和 +4 Ota.\n) B 任意 单位 跳跃 后 > 使 一 个 随机 友 方 宠物 获得 +8 攻击 和 +8 Ota.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#948fd1","sourceSheet":"2濒危兽群","sourceRow":84},{"id":"pack2_pet_0058","kind":"pack2_pet_0058","packKey":"pack2","nameZh":"蓝鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/蓝鲸.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0058.png","iconMissing":false,"hintZhRaw":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 @ 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 @O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 〇 ) 金币 ， 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 @ 生命 。\nfy TF) & WAAR abd TEMA GOT) OM OTR FEE OMB Tene mac pp 二 In F Oem","hintZhClean":"TK 85\nOQ GAA > 使 每 个 伙伴 售 价 +2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +2 O 攻击 和 +2 O 生命 。\n拘 回合 开始 时 叫 使 每 个 伙伴 售 价 *2 ) 金币 , 并 使 商店 将 来 的 所 有 宠物 获得 +4 O 攻击 和 +4 生命 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bbd18f","sourceSheet":"2濒危兽群","sourceRow":85},{"id":"pack2_pet_0059","kind":"pack2_pet_0059","packKey":"pack2","nameZh":"阿姆斯特丹信天翁","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/阿姆斯特丹信天翁.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0059.png","iconMissing":false,"hintZhRaw":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 @ 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。\nND) aoe mw ab CREAN 2379.c @ wtinac @ +s 45 [二 | & 4&e Bb) Ap","hintZhClean":"阿姆斯特丹 信天翁\nDO 伙伴 变形 时 > 使 其 永久 获得 +2 便 攻击 和 +2 二 生命 。 每 回合 生效 2 次 。\n) CB 伙伴 变形 时 串 使 其 永久 获得 +4 攻击 和 *4 二 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a48fd1","sourceSheet":"2濒危兽群","sourceRow":86},{"id":"pack2_pet_0060","kind":"pack2_pet_0060","packKey":"pack2","nameZh":"黑犀牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/动物/黑犀牛.png","iconAliasRel":"assets/icons_en/pack2/pets/pack2_pet_0060.png","iconMissing":false,"hintZhRaw":"墨 犀牛\nOD 敌人 攻击 七 次 后 @ 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\nfi 了 mp 二 上 六 户 一 入 系 人 是 关 snh 站 让 mn 上 人 二 全","hintZhClean":"墨 犀牛\nOD 敌人 攻击 七 次 后 对 一 个 生命 最 高 的 敌人 造成 30 点 伤害 O.\n) 哆 敌人 攻击 七 次 后 D 对 两 个 生命 最 高 的 敌人 造成 30 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#928fd1","sourceSheet":"2濒危兽群","sourceRow":87},{"id":"pack3_pet_0001","kind":"pack3_pet_0001","packKey":"pack3","nameZh":"???","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/？？？2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0001.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"3独角兽兽群","sourceRow":16},{"id":"pack3_pet_0002","kind":"pack3_pet_0002","packKey":"pack3","nameZh":"企鹅鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/企鹅鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0002.png","iconMissing":false,"hintZhRaw":"TE #8 &\n@ Rema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次，\n1) ecco et tk ec ss A wee mM Se Bh","hintZhClean":"TE 8\nRema 9 获得 2 点 O 魔力 加 成 。 每 回合 生效 2 次 。\n) 鸣 获得 魔力 时 嘱 获得 4 点 全 魔力 加 成 。 每 回合 生效 2 次,","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa3","sourceSheet":"3独角兽兽群","sourceRow":2},{"id":"pack3_pet_0003","kind":"pack3_pet_0003","packKey":"pack3","nameZh":"抱抱蟾蜍","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/抱抱蟾蜍4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0003.png","iconMissing":false,"hintZhRaw":"水 晶 球 页 4/2\nC) 战斗 开始 时 => 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.\nfy te cl TT AR ab (HOM maces fi -人","hintZhClean":"水 晶 球 页 4/2\nC) 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +2 O MH.\n拘 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +4 O RH.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bc","sourceSheet":"3独角兽兽群","sourceRow":6},{"id":"pack3_pet_0004","kind":"pack3_pet_0004","packKey":"pack3","nameZh":"澳洲水兽","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/澳洲水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0004.png","iconMissing":false,"hintZhRaw":"GN 7k &\nCD 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 => 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.\nNM) pec) waa ea Mr Rte (Bw) ee. @ +s","hintZhClean":"GN 7k\nCD 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +1 Ota.\n) CB 战斗 开始 时 > 每 次 刷新 (最 多 2 次 ) 时 获得 +2 二 ts.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa5","sourceSheet":"3独角兽兽群","sourceRow":7},{"id":"pack3_pet_0005","kind":"pack3_pet_0005","packKey":"pack3","nameZh":"炼金小虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/炼金小虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0005.png","iconMissing":false,"hintZhRaw":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.\nME? pe sl maces ea CEB me eo) ee. A es","hintZhClean":"炼金 小 虫\nDO 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 O 魔力 。\n) Bx > 使 最 近 的 前 方 伙伴 获得 +2 O MH.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ba","sourceSheet":"3独角兽兽群","sourceRow":8},{"id":"pack3_pet_0006","kind":"pack3_pet_0006","packKey":"pack3","nameZh":"犬魔","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/犬魔2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0006.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa7","sourceSheet":"3独角兽兽群","sourceRow":10},{"id":"pack3_pet_0007","kind":"pack3_pet_0007","packKey":"pack3","nameZh":"野槌蛇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/野槌蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0007.png","iconMissing":false,"hintZhRaw":"$F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 ， 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 ， 并 获得 +2 B 经 验 值 。\nME) posi maces ee MSL Eee) tt tw. @ ez mee","hintZhClean":"F HE PE\nCD 战斗 开始 时 串 跳跃 至 前 排 , 并 获得 +1 SB 经 验 值 。\n) 哆 战斗 开始 时 > 跳跃 至 前 排 , 并 获得 +2 B 经 验 值 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b8","sourceSheet":"3独角兽兽群","sourceRow":11},{"id":"pack3_pet_0008","kind":"pack3_pet_0008","packKey":"pack3","nameZh":"食梦貘","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/食梦貘.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0008.png","iconMissing":false,"hintZhRaw":"RS\nDOSER @ 回合 数 为 偶数 时 ， 用 +1 @ 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 ， 用 +2 @ 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。\nNf fl & +2 3 RS at TD) © BS 4 (BE RO mo OD + mB A OL OK Loin mie XK","hintZhClean":"RS\nDOSER 回合 数 为 偶数 时 , 用 +1 生命 瞪 换 两 个 伙伴 身上 的 随机 不 适 状 态 。\n) BOSE DP 回合 数 为 偶数 时 , 用 +2 生命 蔡 换 两 个 伙伴 身上 的 随机 不 适 状态 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f98","sourceSheet":"3独角兽兽群","sourceRow":12},{"id":"pack3_pet_0009","kind":"pack3_pet_0009","packKey":"pack3","nameZh":"鬼祟蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鬼祟蛋.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0009.png","iconMissing":false,"hintZhRaw":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。\nNM) pec) raed ea MH DM _A10 cob Th","hintZhClean":"BF Be\nCD 战斗 开始 时 > 量 顾 并 召唤 一 个 4/2 的 破 了 的 蛋 。\n) CB 战斗 开始 时 > 暴 顾 并 召唤 一 个 8/4 的 破 了 的 蛋 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c7","sourceSheet":"3独角兽兽群","sourceRow":13},{"id":"pack3_pet_0010","kind":"pack3_pet_0010","packKey":"pack3","nameZh":"鱼头人","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/动物/鱼头人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0010.png","iconMissing":false,"hintZhRaw":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 =» 获得 +1 @ 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击， 持续 一 回合 。\nNY op oe oe ez OR ea E18. ”人 wet tt ms","hintZhClean":"鱼 头 人\nOD 伙伴 获得 经 验 值 时 获得 +1 攻击 , 持 续 一 回合 。\n) 哆 伙伴 获得 经 验 值 时 > 获得 +2 合 攻击, 持续 一 回合 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"3独角兽兽群","sourceRow":14},{"id":"pack3_pet_0011","kind":"pack3_pet_0011","packKey":"pack3","nameZh":"双足飞龙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/双足飞龙.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0011.png","iconMissing":false,"hintZhRaw":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。\nfy 只 中 -FE KS","hintZhClean":"双 足 飞龙\nCQ) 友 方 升级 时 > 获得 1 份额 外 商店 奖励 。\n) ORAS 叫 获得 2 份额 外 商店 奖励 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"3独角兽兽群","sourceRow":19},{"id":"pack3_pet_0012","kind":"pack3_pet_0012","packKey":"pack3","nameZh":"大脚怪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/大脚怪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0012.png","iconMissing":false,"hintZhRaw":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。\nfy SER? ab 1 fh) > 75 — Ae em PCRS","hintZhClean":"大 脚 怪\nOQ) 票据 时 吵 下 回合 获得 一 次 免费 剧 新 。\n) CO art > 下 回合 获得 两 次 免费 剧 新 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"3独角兽兽群","sourceRow":20},{"id":"pack3_pet_0013","kind":"pack3_pet_0013","packKey":"pack3","nameZh":"天蛾人","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/天蛾人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0013.png","iconMissing":false,"hintZhRaw":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 © 获得 +1 @ xtH-1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 &@ RG+2O 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\nNEY cr cm oe a EK EHR ea 2058.2 A wt. @ ts 和 末 门生 mm SH ae","hintZhClean":"KRHA\nOD 任何 宠物 获得 不 适 状 态 时 获得 +1 xtH-1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) 哆 任何 宠物 获得 不 适 状态 时 RG+2O 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"3独角兽兽群","sourceRow":21},{"id":"pack3_pet_0014","kind":"pack3_pet_0014","packKey":"pack3","nameZh":"奥古普古","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/奥古普古.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0014.png","iconMissing":false,"hintZhRaw":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 & 经 验 值 。\nME) peel mae ea CBS IK Ao oe tee.) 2 ,De 人 襄","hintZhClean":"奥 古 普 古\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 +1 BSA.\n) CB 战斗 开始 时 > 使 最 前 排 的 两 个 伙伴 获得 +1 经 验 值 。","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"3独角兽兽群","sourceRow":22},{"id":"pack3_pet_0015","kind":"pack3_pet_0015","packKey":"pack3","nameZh":"幽灵猫咪","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/幽灵猫咪.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0015.png","iconMissing":false,"hintZhRaw":"Hi =e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。\nNY xamer ayer Sos","hintZhClean":"Hi e Fee OK\nCO) 受到 能 力 的 伤害 减少 3 点 。\n) 8 受到 能 力 的 伤 襄 减 少 6 点 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"3独角兽兽群","sourceRow":23},{"id":"pack3_pet_0016","kind":"pack3_pet_0016","packKey":"pack3","nameZh":"掉掉熊","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/掉掉熊.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0016.png","iconMissing":false,"hintZhRaw":"OD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce~}~6. ores Sent 3 +H eB _Atw Lot ctasee ND","hintZhClean":"OD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 战斗 中 最 后 一 个 敌人 造成 6 点 伤害 O,\nNf nbs a oce 6. ores Sent 3 +H eB Atw Lot ctasee ND","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"3独角兽兽群","sourceRow":24},{"id":"pack3_pet_0017","kind":"pack3_pet_0017","packKey":"pack3","nameZh":"滴水兽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/滴水兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0017.png","iconMissing":false,"hintZhRaw":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。\nNf SBR ab HBR ME Ke OK eh iB.c @ += ge cues) t AX mea eee Oh BleSt oe","hintZhClean":"滴水 兽\nCD SRY 吵 使 最 近 的 后 方 伙伴 获得 +2 OtH. SHHIA 个 魔力 可 使 其 额外 获得 1 点 生命\n) 哆 SRY > 使 最 近 的 后 方 伙 伴 获 得 +4 Oth, SHIA 个 魔力 可 使 其 额外 获得 2 点 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"3独角兽兽群","sourceRow":25},{"id":"pack3_pet_0018","kind":"pack3_pet_0018","packKey":"pack3","nameZh":"雷鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/雷鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0018.png","iconMissing":false,"hintZhRaw":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.\nNM) pec) Ten ob CRE ES CR OO) oe ao Aes","hintZhClean":"aS\nCD 战斗 开始 时 > 使 前 方 第 二 近 的 伙伴 获得 +3 O 魔力 。\n) CB 战斗 开始 时 加 使 前 方 第 二 近 的 伙伴 获得 +6 O MH.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbad1","sourceSheet":"3独角兽兽群","sourceRow":26},{"id":"pack3_pet_0019","kind":"pack3_pet_0019","packKey":"pack3","nameZh":"霜狼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/霜狼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0019.png","iconMissing":false,"hintZhRaw":"寒冷 页 2/:\n受到 的 伤害 O +5， 生 效 一 次 。","hintZhClean":"寒冷 页 2/:\n受到 的 伤害 O +5, 生 效 一 次 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a78f","sourceSheet":"3独角兽兽群","sourceRow":28},{"id":"pack3_pet_0020","kind":"pack3_pet_0020","packKey":"pack3","nameZh":"鹿角兔","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/动物/鹿角兔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0020.png","iconMissing":false,"hintZhRaw":"CD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR ”Tb 这 OST ee Be Eb CL AE abr","hintZhClean":"CD 伙伴 攻击 前 > 使 其 获得 +1 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\n) CB 伙伴 攻击 前 > 使 其 获得 +2 全 攻击 。 跳 跃 时 效果 加 倍 。 每 场 战斗 生效 3 次 。\nNY aL oe ty as eb ORR Tb 这 OST ee Be Eb CL AE abr","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"3独角兽兽群","sourceRow":29},{"id":"pack3_pet_0021","kind":"pack3_pet_0021","packKey":"pack3","nameZh":"卡灵犬兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/卡灵犬兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0021.png","iconMissing":false,"hintZhRaw":"ERAS\nOD sky 吵 KH 个 魔力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 ， 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 £8.\nNf BBR ab :光世 & mee ny fer A 2S) OR PO OT 4 * Oe BB er an ARK te dl 2 @ Ae a","hintZhClean":"ERAS\nOD sky 吵 KH 个 魔力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 敌人 -1 O 生命 。\n) CB 巡 质 时 吵 消 耗 镶 魔 力 , 每 消耗 1 魔力 便 可 使 生命 最 高 的 两 个 政 人 29 8.","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"3独角兽兽群","sourceRow":33},{"id":"pack3_pet_0022","kind":"pack3_pet_0022","packKey":"pack3","nameZh":"塔佐蠕虫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/塔佐蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0022.png","iconMissing":false,"hintZhRaw":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 ， 伤 害 番 倍 。\nNf ~ ee 1, Ok BBE RS ab 2 OSB Ys Lot eC Eee OY aN Bal Ak +524R 4c wea","hintZhClean":"塔 佐 蠕 虫\nD mAs RRS D> 对 最 前 排 的 敌人 造成 2 点 伤害 OO. WRU, MBB.\n) CB MAE BRS 加 对 最 前 排 的 敌人 造成 4 点 伤害 O, 。 如 果 伙 伴 为 3 级 , 伤 害 番 倍 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"3独角兽兽群","sourceRow":34},{"id":"pack3_pet_0023","kind":"pack3_pet_0023","packKey":"pack3","nameZh":"招财猫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/招财猫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0023.png","iconMissing":false,"hintZhRaw":"$B UA 468\nCO 升级 时 = 立刻 获得 +2 O 攻击 和 +2 人 生命 ， 下 回合 获得 +2 〇 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 @ 生命 ， 下 回合 获得 +4 〇 金币 。\nNM} 工 zr","hintZhClean":"B UA 468\nCO 升级 时 立刻 获得 +2 O 攻击 和 +2 人 生命 , 下 回合 获得 +2 金币 。\n) OB 升级 时 吵 立刻 获得 +4 O 攻击 和 +4 生命 , 下 回合 获得 +4 金币 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"3独角兽兽群","sourceRow":35},{"id":"pack3_pet_0024","kind":"pack3_pet_0024","packKey":"pack3","nameZh":"曼德拉草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/曼德拉草2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0024.png","iconMissing":false,"hintZhRaw":"页 2/:\nay 1\n阻止 能 力 激活 。","hintZhClean":"页 2/:\nay 1\n阻止 能 力 激活 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"3独角兽兽群","sourceRow":37},{"id":"pack3_pet_0025","kind":"pack3_pet_0025","packKey":"pack3","nameZh":"毛皮蹲鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/毛皮蹲鱼2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintZhClean":"红 毛 丹\n攻击 前 > 获得 +3 O MH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9fd1","sourceSheet":"3独角兽兽群","sourceRow":39},{"id":"pack3_pet_0026","kind":"pack3_pet_0026","packKey":"pack3","nameZh":"狮鹫","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/狮鹫4.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0026.png","iconMissing":false,"hintZhRaw":"8 页 4/¢\nCD 损坏 时 —> 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 => 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。\nSY 网 未 Ri wa FRO 2A1 9/1 DARED CRA Gh BED","hintZhClean":"8 页 4/\nCD 损坏 时 > 图 积 一 个 4/4 的 3 级 2 阶 免费 宠物 。\nC8 损坏 时 > 图 积 一 个 8/8 的 3 级 4 阶 免 费 宠物 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"3独角兽兽群","sourceRow":43},{"id":"pack3_pet_0027","kind":"pack3_pet_0027","packKey":"pack3","nameZh":"猎头蟹","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/猎头蟹2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0027.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9dd1","sourceSheet":"3独角兽兽群","sourceRow":45},{"id":"pack3_pet_0028","kind":"pack3_pet_0028","packKey":"pack3","nameZh":"衔尾蛇","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/衔尾蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0028.png","iconMissing":false,"hintZhRaw":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +1 | 攻击 和 +1 @ 生命， 持续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 ， 使 商店 的 新 宠物 获得 +*2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 ， 效 果 最 多 持续 至 刷新 5 次 。\nM1) aise ns we MRIS | OR EEA oe ee? Bw tin. Ot 82 _ Ms) nb Bite EBay","hintZhClean":"(i FER\nCD 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +1 攻击 和 +1 生命, 持续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。\n) 0B 刷新 时 > 每 次 剧 新 时 , 使 商店 的 新 宠物 获得 +*2 攻击 和 +2 全 生命 , 持 续 一 回合 , 效 果 最 多 持续 至 刷新 5 次 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c68f","sourceSheet":"3独角兽兽群","sourceRow":46},{"id":"pack3_pet_0029","kind":"pack3_pet_0029","packKey":"pack3","nameZh":"骷髅狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/骷髅狗.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0029.png","iconMissing":false,"hintZhRaw":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 @ tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 @ 攻击 和 +1 Ota.\n1) eet ob OHO AEN eK RA ee) A wtin.) @ +s","hintZhClean":"Aa Rx 35)\nCD BRE > 使 一 个 随机 伙伴 永久 获得 +1 攻击 和 +1 tH.\n小 BAY D> 使 两 个 随机 伙伴 永久 获得 +1 攻击 和 +1 Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9bd1","sourceSheet":"3独角兽兽群","sourceRow":47},{"id":"pack3_pet_0030","kind":"pack3_pet_0030","packKey":"pack3","nameZh":"魔力猎犬","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/动物/魔力猎犬.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0030.png","iconMissing":false,"hintZhRaw":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 ， 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 ， 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,\nNS sacl wend ob KIM OS TRIS SEER CHORE es eee ames 内 本人 KRABI","hintZhClean":"Ra Fier\nCD 战斗 开始 时 > 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +2 O 魔力 , 至 多 刷新 3 次 。\n) Bere - 本 回合 每 次 刷新 商店 时 , 使 最 近 的 前 方 伙伴 获得 +4 ORN, ESPRIN,","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"3独角兽兽群","sourceRow":48},{"id":"pack3_pet_0031","kind":"pack3_pet_0031","packKey":"pack3","nameZh":"克拉肯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/克拉肯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0031.png","iconMissing":false,"hintZhRaw":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 @ 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.\nMEY re: raed ab CESK ES ah een Ko @ +4","hintZhClean":"RA\nCD 战斗 开始 时 > 使 所 有 其 他 宠物 .15% 人 生命 .\n) 鸣 战斗 开始 时 > 使 所 有 其 他 宠物 30% Ota.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"3独角兽兽群","sourceRow":52},{"id":"pack3_pet_0032","kind":"pack3_pet_0032","packKey":"pack3","nameZh":"外星来客","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/外星来客2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0032.png","iconMissing":false,"hintZhRaw":"TE TQ 2/2\n受到 的 伤害 加 倍 ， 生 效 两 次 。","hintZhClean":"TE TQ 2/2\n受到 的 伤害 加 倍 , 生 效 两 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"3独角兽兽群","sourceRow":54},{"id":"pack3_pet_0033","kind":"pack3_pet_0033","packKey":"pack3","nameZh":"大鹏鸟","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/大鹏鸟.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0033.png","iconMissing":false,"hintZhRaw":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 © 魔力 。 重 复 3 次 ， 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 ， 在 前 方 伙 伴 中 逐个 分 配 。\nNf bS ol WA Ot aod (2 XK 24 KO) Ow TRB. & mee ny wor Tr ascot oO) OF ch ik KA OR","hintZhClean":"ASS\nCD 战斗 开始 时 加 使 一 个 前 方 伙 伴 获得 +2 魔力 。 重 复 3 次 , 在 前 方 伙伴 中 逐个 分 配 。\n小 战斗 开始 时 加 使 一 个 前 方 伙伴 获得 +2 O 魔 力 。 重 复 6 次 , 在 前 方 伙 伴 中 逐个 分 配 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"3独角兽兽群","sourceRow":55},{"id":"pack3_pet_0034","kind":"pack3_pet_0034","packKey":"pack3","nameZh":"奇美拉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/奇美拉.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0034.png","iconMissing":false,"hintZhRaw":"ti\nOD sky = 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 @ 攻击 和 +2 @ 生命 。\nfi 和 品 下 Re 门人 一 和 个 Jonpti KE A eH e8,.) 人 wtw. @*s+","hintZhClean":"ti\nOD sky 召唤 一 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。\n) CB SRY > 召唤 两 个 3/3 的 宠物 。 每 消耗 2 点 O 魔力 便 可 使 其 获得 +1 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"3独角兽兽群","sourceRow":56},{"id":"pack3_pet_0035","kind":"pack3_pet_0035","packKey":"pack3","nameZh":"弥诺陶洛斯","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/弥诺陶洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0035.png","iconMissing":false,"hintZhRaw":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 ， 便 获得 +2 @ 攻击 和 +2 Ota.\nNEY 六 pmp 二 nd ea 水生 在、 en? BM wtin.2 @*+s+","hintZhClean":"O/T 1s BS) 744 BAT\nD 前 方 伙伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +1 Okt Ota.\n小 前 方 伙 伴 攻击 时 DP 伙伴 每 有 一 级 , 便 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"3独角兽兽群","sourceRow":57},{"id":"pack3_pet_0036","kind":"pack3_pet_0036","packKey":"pack3","nameZh":"憎恶","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/憎恶.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0036.png","iconMissing":false,"hintZhRaw":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 ， 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 | 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintZhClean":"QD 回合 结束 时 叫 吞噬 并 复制 商店 中 最 左 侧 未 冻结 的 宠物 , 持 续 一 回合 。\n) 鸣 回合 结束 时 > 吞 只 并 复制 商店 中 最 左 侧 两 个 不 同 的 未 冻结 宠物 , 持 续 一 回合 。\n1M) aace sin ob 天 m 放 久生 在 让 由 旺 基 出 二 入 天 由 的 十 大 全 tems","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"3独角兽兽群","sourceRow":58},{"id":"pack3_pet_0037","kind":"pack3_pet_0037","packKey":"pack3","nameZh":"沙之蠕虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/沙之蠕虫.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0037.png","iconMissing":false,"hintZhRaw":"1) ZB\nDOSER > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 @ 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 ， 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 ， 效 果 最 多 持续 至 刷新 8 次 。\nNM? =o ot at ee SM RISEAY ORI ORL ee ie. A wt. @t> see eeizeeeison","hintZhClean":"1) ZB\nDOSER > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +1 OS 攻击 和 +1 生命 , 效 果 最 多 持续 至 刷新 8 次 。\n) 哆 回合 结束 时 > 每 刷新 4 次 , 使 相 邻 伙伴 获得 +2 全 攻击 和 +2 二 生命 , 效 果 最 多 持续 至 刷新 8 次 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"3独角兽兽群","sourceRow":59},{"id":"pack3_pet_0038","kind":"pack3_pet_0038","packKey":"pack3","nameZh":"独眼巨人","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独眼巨人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0038.png","iconMissing":false,"hintZhRaw":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 & BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 ， 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 & HM.\nNf 4b @2LéR e+ et Chee Fr A wee KM SAMO ree Se eo.) 会 Bh","hintZhClean":"独眼 巨人\nCD 伙伴 升级 时 > 使 其 获得 +2 和 全 魔力 。 本 回合 第 一 次 能 发 时 还 会 使 其 获得 +1 BHM.\nyD 伙伴 升级 时 中 使 其 获得 +4 个 麻 力 , 本 回合 前 两 次 能 发 时 还 会 使 其 获得 +1 HM.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"3独角兽兽群","sourceRow":60},{"id":"pack3_pet_0039","kind":"pack3_pet_0039","packKey":"pack3","nameZh":"独角兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/独角兽.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0039.png","iconMissing":false,"hintZhRaw":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 @ 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。\nNf ble OM DR SE oR om IV PO EH KY el 78.) A wHwtin.? @ += 455 (7) & Ae BS 2","hintZhClean":"ik FAS\nD 伙伴 获得 不 适 状态 时 加 移 除 不 适 状态 并 使 宠物 永久 获得 +*2 攻击 和 +2 全 生命 。 每 回合 生效 1 次 。\n) 鸣 伙伴 获得 不 适 状态 时 D 移 除 不 适 状态 并 使 宠物 永久 获得 +2 全 攻击 和 +2 人 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"3独角兽兽群","sourceRow":61},{"id":"pack3_pet_0040","kind":"pack3_pet_0040","packKey":"pack3","nameZh":"蚁虎","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/动物/蚁虎.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0040.png","iconMissing":false,"hintZhRaw":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 ， 并 对 前 两 个 敌人 造成 6 点 伤害 O.\nNf 合生 《生起 2323T SS Sent 3 +PMAAMA tH Lot FeaO 上 (全 合","hintZhClean":"BW\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 3 点 伤害 O.\n) CB 前 排 为 空 > 跳跃 至 最 前 排 , 并 对 前 两 个 敌人 造成 6 点 伤害 O.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"3独角兽兽群","sourceRow":62},{"id":"pack3_pet_0041","kind":"pack3_pet_0041","packKey":"pack3","nameZh":"吸血蝙蝠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/吸血蝙蝠.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0041.png","iconMissing":false,"hintZhRaw":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 ， 并 获得 等 量 @ 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 ， 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。\nME) sek eee EH eb BE eS wm ON teem Oe mi eel HAO","hintZhClean":"OR Of Oy Be\nDA RRFERSEN DHMBAMIADE 全 , 并 获得 等 量 生命 。 每 场 战斗 生效 2 次 。\n) 鸣 敌人 获得 不 适 状态 时 DS 对 其 造成 8 点 伤害 全 , 并 获得 等 量 OTS. 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"3独角兽兽群","sourceRow":66},{"id":"pack3_pet_0042","kind":"pack3_pet_0042","packKey":"pack3","nameZh":"坏狗狗","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/坏狗狗3.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0042.png","iconMissing":false,"hintZhRaw":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 ， 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 〇 。\nfy 24 +8 4% cD eb Zoi ll co TKK A 1a /i emt aS SANEK Trea wes eresiecwe SX","hintZhClean":"ABE 2 4 页 3/:\nOQ 前 排 为 空 > 在 战斗 中 召唤 一 个 6/6 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 5 点 伤害 O.\n8 前 排 为 空 > 在 战斗 中 召唤 一 个 12/12 的 支配 者 , 其 会 对 所 有 其 他 宠物 造成 10 点 伤 言 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"3独角兽兽群","sourceRow":69},{"id":"pack3_pet_0043","kind":"pack3_pet_0043","packKey":"pack3","nameZh":"尼斯湖水怪","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/尼斯湖水怪1.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0043.png","iconMissing":false,"hintZhRaw":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 ， 每 次 刷新 时 使 其 获得 +2 @ 攻击 和 +2 O tm,\nNf BER ab 72°F —_OCa/ame) Anes Mer wee te cl Ow OM Ser Riece se we.2? A wtin.2? @ +=","hintZhClean":"又 一\nOD) Se > 召唤 一 只 3/3 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +1 O 攻击 和 +1 Om.\n) CB SREY > 召唤 一 只 6/6 的 船 。 如 果 这 是 你 本 场 战 斗 的 第 一 只 船 , 每 次 刷新 时 使 其 获得 +2 攻击 和 +2 O tm,","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"3独角兽兽群","sourceRow":70},{"id":"pack3_pet_0044","kind":"pack3_pet_0044","packKey":"pack3","nameZh":"智慧鲑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/智慧鲑鱼.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0044.png","iconMissing":false,"hintZhRaw":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 @ 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 & 经 验 值 。\nME) re: Top ea CRBS EA OL Oe Te hace SB ee","hintZhClean":"智慧 鲸鱼\nCD 战斗 开始 时 加 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +2 经 验 值 。\n) CB 战斗 开始 时 DP 使 最 前 排 的 两 个 伙伴 以 及 敌人 获得 +4 经 验 值 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"3独角兽兽群","sourceRow":72},{"id":"pack3_pet_0045","kind":"pack3_pet_0045","packKey":"pack3","nameZh":"狐妖","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狐妖.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0045.png","iconMissing":false,"hintZhRaw":"狐 妊\nDO eee = 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。\nND)? a oe et ob DSR ee te teh AY mH CES OBES ET Ok","hintZhClean":"狐 妊\nDO eee 把 所 有 友 方 的 O 魔力 +2 转 移 给 最 近 的 前 方 伙 伴 。\n) Bie BR > 把 所 有 友 方 的 候 魔力 +4 转 移 给 最 近 的 前 方 伙伴 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"3独角兽兽群","sourceRow":73},{"id":"pack3_pet_0046","kind":"pack3_pet_0046","packKey":"pack3","nameZh":"狼人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/狼人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0046.png","iconMissing":false,"hintZhRaw":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 ， 获 得 +50% @ 攻击 和 全 生命 。 否 则 ， 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 ， 获 得 +100% @xtn 全 生命 。 否 则 ， 获 得 12 点 O 魔力 。\nNM) pec maar ab HSH ee ORM tno, M wt @+ es Km egies A e+","hintZhClean":"狼人\nCD 战斗 开始 时 加 回合 数 为 偶数 时 , 获 得 +50% 攻击 和 全 生命 。 否 则 , 获 得 6 点 OM.\n) CB 战斗 开始 时 嘱 回合 数 为 偶数 时 , 获 得 +100% xtn 全 生命 。 否 则 , 获 得 12 点 O 魔力 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"3独角兽兽群","sourceRow":74},{"id":"pack3_pet_0047","kind":"pack3_pet_0047","packKey":"pack3","nameZh":"红龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/红龙2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0047.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"3独角兽兽群","sourceRow":76},{"id":"pack3_pet_0048","kind":"pack3_pet_0048","packKey":"pack3","nameZh":"羊蹄鸟身龙虾","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/羊蹄鸟身龙虾2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0048.png","iconMissing":false,"hintZhRaw":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintZhClean":"tf 2/7\n受惊 页 24/\n受到 的 伤害 O +1.","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f93","sourceSheet":"3独角兽兽群","sourceRow":78},{"id":"pack3_pet_0049","kind":"pack3_pet_0049","packKey":"pack3","nameZh":"貔貅","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/貔貅.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0049.png","iconMissing":false,"hintZhRaw":"5 tk\nCO ame = 消耗 4 点 O 魔力 ， 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 ， 下 回合 获得 +6 人 金币。\n1) exces wb KE Ame 下 站 公共 和/ ao Nex","hintZhClean":"5 tk\nCO ame 消耗 4 点 O 魔力 , 下 回合 获得 +3 人 金币。\n小 BARN > 消耗 4 点 O 魔力 , 下 回合 获得 +6 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cc","sourceSheet":"3独角兽兽群","sourceRow":79},{"id":"pack3_pet_0050","kind":"pack3_pet_0050","packKey":"pack3","nameZh":"青蛙人","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/动物/青蛙人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0050.png","iconMissing":false,"hintZhRaw":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 | 攻击 和 +2 吉 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 @ 攻击 和 *4 二 生命 ， 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\nNY? op oe ty os ea 人 诈 革 共有 ”mp 二 Is @ Ht HAR OT RK HEA Ow","hintZhClean":"青蛙 人\nCD 伙伴 攻击 前 > 使 其 获得 +1 攻击 和 +2 吉 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。\n小 伙伴 攻击 前 > 使 其 获得 +2 攻击 和 *4 二 生命 , 生 效 一 次 。 跳 跃 时 变 为 永久 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"3独角兽兽群","sourceRow":80},{"id":"pack3_pet_0051","kind":"pack3_pet_0051","packKey":"pack3","nameZh":"不死鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/不死鸟2.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0051.png","iconMissing":false,"hintZhRaw":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 @ 受到 6 点 伤害 合 ， 生 效 一 次 。","hintZhClean":"、 tf 2/3\n清脆 页 21/\n任意 单位 攻击 时 受到 6 点 伤害 合 , 生 效 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"3独角兽兽群","sourceRow":85},{"id":"pack3_pet_0052","kind":"pack3_pet_0052","packKey":"pack3","nameZh":"九头蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/九头蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0052.png","iconMissing":false,"hintZhRaw":"九 头 蛇\nOQ) sre = 每 有 10 点 攻击 ， 便 召唤 一 个 5/5 的 头 。\n) CO srt = 每 有 10 点 攻击 ， 便 召唤 一 个 10/10 的 头 。\n1 men wm MHASH MMA ema","hintZhClean":"九 头 蛇\nOQ) sre 每 有 10 点 攻击 , 便 召唤 一 个 5/5 的 头 。\n) CO srt 每 有 10 点 攻击 , 便 召唤 一 个 10/10 的 头 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"3独角兽兽群","sourceRow":86},{"id":"pack3_pet_0053","kind":"pack3_pet_0053","packKey":"pack3","nameZh":"刻耳柏洛斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/刻耳柏洛斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0053.png","iconMissing":false,"hintZhRaw":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 —> 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。\nfy 24 +8 4% cS 7 人 AD RDER el at hi #55 $% £8 21 At BS 2‘","hintZhClean":"刻 耳 相 洛 斯\nCO) 前 持 为 空 > 在 最 前 排 召唤 一 个 8/8 的 3 级 火焰 小 狗 。 每 场 战 斗 生 效 1 次 。\n) C8 前 排 为 空 > 在 最 前 排 召唤 一 个 818 的 3 级 火焰 小 狗 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"3独角兽兽群","sourceRow":87},{"id":"pack3_pet_0054","kind":"pack3_pet_0054","packKey":"pack3","nameZh":"团队精神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/团队精神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0054.png","iconMissing":false,"hintZhRaw":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 @ 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 @ 攻击 和 +*2 O 生命\nNY op oe Then Rt ea CESK Erol oe 257822 A wsti.? @ +s","hintZhClean":"团队 精神\nCD 伙伴 升级 时 > 使 所 有 伙伴 获得 +1 攻击 和 +1 O tm.\n) CB 伙伴 升级 时 > 使 所 有 伙伴 获得 +2 攻击 和 +*2 O 生命","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"3独角兽兽群","sourceRow":88},{"id":"pack3_pet_0055","kind":"pack3_pet_0055","packKey":"pack3","nameZh":"斯雷普尼尔","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/斯雷普尼尔.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0055.png","iconMissing":false,"hintZhRaw":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 ， 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 ， 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.\nfront ea MEI MR w ee —Aswae.) A est","hintZhClean":"Ah SER\nDO 战斗 开始 时 路 每 有 2 点 攻击 , 便 使 最 前 排 的 伙伴 获得 +1 O Mn.\n小 MLAB > 每 有 2 点 攻击 , 便 使 最 前 排 的 两 个 伙伴 获得 +1 O MH.","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"3独角兽兽群","sourceRow":89},{"id":"pack3_pet_0056","kind":"pack3_pet_0056","packKey":"pack3","nameZh":"海蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/海蛇.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0056.png","iconMissing":false,"hintZhRaw":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。\nNf iM Fe on 23 Ae OS Bw tote § IN — A StS A OS FM Tae ee fy Hk we","hintZhClean":"海蛇\nOD 此 宠物 对 生命 最 高 的 敌人 和 一 个 额外 敌人 造成 相当 于 其 魔力 O 的 伤害 。\nCB 此 宠物 对 生命 最 高 的 敌人 和 两 个 额外 敌人 造成 相当 于 其 魔力 个 的 伤害 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"3独角兽兽群","sourceRow":90},{"id":"pack3_pet_0057","kind":"pack3_pet_0057","packKey":"pack3","nameZh":"羽蛇神","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/羽蛇神.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0057.png","iconMissing":false,"hintZhRaw":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B@ 经 验 值 。 触发 2 次 。\nNM) =o ot at ea CH _ ANIME Kee eB.) BA MOH Bh P22","hintZhClean":"tc\nOD OAR > 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B SRE.\n) CB 回合 结束 时 D> 使 一 个 随机 3 阶 及 以 下 伙伴 获得 +2 B 经 验 值 。 触发 2 次 。","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"3独角兽兽群","sourceRow":91},{"id":"pack3_pet_0058","kind":"pack3_pet_0058","packKey":"pack3","nameZh":"蝎尾狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/蝎尾狮.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0058.png","iconMissing":false,"hintZhRaw":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。\nNM) seb ome Re wD Hee","hintZhClean":"bs Fz nh\nOD 敌人 的 不 适 状态 效果 恶化 为 两 倍 。\n小 敌人 的 不 适 状 态 效 果 恶化 为 三 倍 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb5d1","sourceSheet":"3独角兽兽群","sourceRow":92},{"id":"pack3_pet_0059","kind":"pack3_pet_0059","packKey":"pack3","nameZh":"贝希摩斯","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/贝希摩斯.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0059.png","iconMissing":false,"hintZhRaw":"Dl #5 FF BA\nOD 回合 结束 时 > 获得 +2 @xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\n哆 回合 结束 时 > 获得 +4 | 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100，\nNf Fl +t Bet ea 1278. 加 十 In Fr @ += The N44 SS BWaresiwBiinni","hintZhClean":"Dl 5 FF BA\nOD 回合 结束 时 > 获得 +2 xsH+2 O 生命 。 攻 击 和 生命 至 多 可 提升 至 100,\n哆 回合 结束 时 > 获得 +4 攻击 和 *+4 全 生命 。 攻 击 和 生命 至 多 可 提升 至 100,","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ac8f","sourceSheet":"3独角兽兽群","sourceRow":93},{"id":"pack3_pet_0060","kind":"pack3_pet_0060","packKey":"pack3","nameZh":"雪人","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/动物/雪人.png","iconAliasRel":"assets/icons_en/pack3/pets/pack3_pet_0060.png","iconMissing":false,"hintZhRaw":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。\nNf fal @ Tbh Re ab 77S ot Te On Ww Ell oe INRA Oo Oe OO MEO OCT OB! Sk 4 ae","hintZhClean":"雪人\nCD 回合 开始 时 > 在 冻结 宠物 复制 体 和 6 阶 食物 的 情况 下 刷新 四 次 。\n) 鸣 回合 开始 时 > 在 冻结 队伍 中 已 有 的 宠物 和 6 阶 食物 的 情况 下 刷新 八 次 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cfd18f","sourceSheet":"3独角兽兽群","sourceRow":94},{"id":"pack4_pet_0001","kind":"pack4_pet_0001","packKey":"pack4","nameZh":"喜鹊","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/喜鹊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0001.png","iconMissing":false,"hintZhRaw":"rs 8S\nQO 回合 结束 时 — 花费 至 多 1 @ 〇 金币 ， 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 ， 并 在 下 回合 重新 获得 之 。\nfy fa) + RY ome TT BE 22) eos t+ Xr Kh) > SS C738","hintZhClean":"rs 8S\nQO 回合 结束 时 花费 至 多 1 金币 , 并 在 下 回合 重新 获得 之 。\n) MB 回合 结束 时 加 花费 至 多 2 人 金币 , 并 在 下 回合 重新 获得 之 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb7","sourceSheet":"4金毛兽群","sourceRow":2},{"id":"pack4_pet_0002","kind":"pack4_pet_0002","packKey":"pack4","nameZh":"土拨鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/土拨鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0002.png","iconMissing":false,"hintZhRaw":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。\nL3 晕厥时 -> 获得+3 喇叭。","hintZhClean":"土拨鼠\nL1 晕厥时 -> 获得+1 喇叭。\nL2 晕厥时 -> 获得+2 喇叭。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1a6","sourceSheet":"4金毛兽群","sourceRow":3},{"id":"pack4_pet_0003","kind":"pack4_pet_0003","packKey":"pack4","nameZh":"斗牛犬","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/斗牛犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0003.png","iconMissing":false,"hintZhRaw":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。\nNS sem st ob Roc PT 二","hintZhClean":"斗牛 大\nOQ 首次 攻击 后 > 获得 +2 加 攻击 。\n) OB 首次 攻击 后 > 获得 +4 加 攻击 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb9","sourceSheet":"4金毛兽群","sourceRow":4},{"id":"pack4_pet_0004","kind":"pack4_pet_0004","packKey":"pack4","nameZh":"旅鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/旅鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0004.png","iconMissing":false,"hintZhRaw":"旅居\nCO) 出 镶 时 =» 下 回合 获得 +1 O 金币。\n) ume => 下 回合 获得 +2 O 金币 。\nNS wee wa EKMom 8.2 f\\ os","hintZhClean":"旅居\nCO) 出 镶 时 下 回合 获得 +1 O 金币。\n) ume > 下 回合 获得 +2 O 金币 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1ad","sourceSheet":"4金毛兽群","sourceRow":5},{"id":"pack4_pet_0005","kind":"pack4_pet_0005","packKey":"pack4","nameZh":"芋螺","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/芋螺.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0005.png","iconMissing":false,"hintZhRaw":"+\nCD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac @ te","hintZhClean":"CD RAR > 使 最 近 的 后 方 伙伴 获得 +2 O 生命 。\n) 哆 战斗 开始 时 > 使 最 近 的 后 方 伙 伴 获得 +4 O tH.\nME) pe cl mae ea CEB SEM Ho) oe ac te","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb2","sourceSheet":"4金毛兽群","sourceRow":6},{"id":"pack4_pet_0006","kind":"pack4_pet_0006","packKey":"pack4","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0006.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1aa","sourceSheet":"4金毛兽群","sourceRow":7},{"id":"pack4_pet_0007","kind":"pack4_pet_0007","packKey":"pack4","nameZh":"蚕蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/蚕蛾.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0007.png","iconMissing":false,"hintZhRaw":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。\nNM) hp 到 人 pe ea he. 国生 全 mM Sse BHI","hintZhClean":"ay\nOD mA > 使 其 获得 +1 全 生命 。 每 回合 生效 2 次 。\n) 鸣 前 方 伙伴 受伤 时 哆 使 其 获得 +2 考 生命 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb4","sourceSheet":"4金毛兽群","sourceRow":8},{"id":"pack4_pet_0008","kind":"pack4_pet_0008","packKey":"pack4","nameZh":"负鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/负鼠.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0008.png","iconMissing":false,"hintZhRaw":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) CB 出 售 时 => 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 @ 攻击 和 +2 Ota.\nTE) ws oe et eh CHA EE he eae Ow Rt eee? Ow wtw.? @+-s","hintZhClean":"fA ft\nCD 出 售 时 > 使 一 个 商店 中 的 随机 量 顾 时 宠物 获得 +1 攻击 和 +1 O tm.\n) CB 出 售 时 > 使 一 个 商店 中 的 随机 晕厥 时 宠物 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"4金毛兽群","sourceRow":9},{"id":"pack4_pet_0009","kind":"pack4_pet_0009","packKey":"pack4","nameZh":"鹅","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0009.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 => 使 最 前 排 的 政 人 -1 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2@ 攻击 .\nNM) pes) raed ea CBee > A wt","hintZhClean":"CD 战斗 开始 时 > 使 最 前 排 的 政 人 -1 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 敌人 2 攻击 .\nNM) pes) raed ea CBee > A wt","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"4金毛兽群","sourceRow":10},{"id":"pack4_pet_0010","kind":"pack4_pet_0010","packKey":"pack4","nameZh":"黑白花绒","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/动物/黑白花绒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0010.png","iconMissing":false,"hintZhRaw":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy = 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言 〇\nfy oR ee 和 部 A miner ARs ise Lot reas ice","hintZhClean":"BACH\n加 eet 9 花费 1 作 喇叭 对 一 个 随机 敌人 造成 3 点 伤害 O,\n) Waxy 花费 1 依 喇叭 对 两 个 随机 敌人 造成 3 点 伤 言","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cb8fd1","sourceSheet":"4金毛兽群","sourceRow":11},{"id":"pack4_pet_0011","kind":"pack4_pet_0011","packKey":"pack4","nameZh":"海胆","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海胆.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0011.png","iconMissing":false,"hintZhRaw":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are = 使 前 两 个 政 人 .5 @ Em.\nNS ment wa 人 一 人 天 CAH","hintZhClean":"海胆\n加 票据 时 > 使 盟 前 排 的 政 人 -5 OER.\n) are 使 前 两 个 政 人 .5 Em.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#96d18f","sourceSheet":"4金毛兽群","sourceRow":14},{"id":"pack4_pet_0012","kind":"pack4_pet_0012","packKey":"pack4","nameZh":"海龟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/海龟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0012.png","iconMissing":false,"hintZhRaw":"3\nD 伙伴 被 召唤 时 =» 使 其 获得 +2 @ 生命 ， 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY? aoe ae Tmt eb CHE hac te < 站 人","hintZhClean":"D 伙伴 被 召唤 时 使 其 获得 +2 生命 , 持 续 一 回合 。\n鸣 伙伴 被 召唤 时 中 使 其 获得 *4 O 生命 持续 一 回合 。\nNY aoe ae Tmt eb CHE hac te < 站 人","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cd8fd1","sourceSheet":"4金毛兽群","sourceRow":15},{"id":"pack4_pet_0013","kind":"pack4_pet_0013","packKey":"pack4","nameZh":"狐獴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/狐獴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0013.png","iconMissing":false,"hintZhRaw":"AM aR\nOQ 战斗 开始 时 =» 本 回合 每 花费 4 人 〇 金币 ， 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 @ 〇 金币 ， 就 使 相 邻 伙伴 获得 *2 O 攻击 ，\nfy teach TT AR ab we Honma lf) om 69K I9 404 Oe 2579.2 MA Tb 二","hintZhClean":"AM aR\nOQ 战斗 开始 时 本 回合 每 花费 4 人 金币 , 就 使 相 邻 伙伴 获得 +1 O 攻击 。\n) C8 战斗 开始 时 加 本 回合 每 花费 4 金币 , 就 使 相 邻 伙伴 获得 *2 O 攻击 ,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#94d18f","sourceSheet":"4金毛兽群","sourceRow":16},{"id":"pack4_pet_0014","kind":"pack4_pet_0014","packKey":"pack4","nameZh":"独角仙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/独角仙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0014.png","iconMissing":false,"hintZhRaw":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 @ 午 攻击， 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 ， 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\nEY us om tt em CHUL Ok EE ee Cech peeled 人 人 二 wt BOE ewe HeN THOR","hintZhClean":"独 角 仙\nCD 出 售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 的 午 攻击, 攻击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。\n) CB 出售 时 > 使 伙伴 获得 相当 于 此 宠物 参与 战斗 次 数 2 倍 的 全 攻击 , 攻 击 点 数 在 所 有 伙伴 中 依次 平均 分 配 。","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c68fd1","sourceSheet":"4金毛兽群","sourceRow":17},{"id":"pack4_pet_0015","kind":"pack4_pet_0015","packKey":"pack4","nameZh":"白鼬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/白鼬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0015.png","iconMissing":false,"hintZhRaw":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 ， 并 使 其 变 为 1/1。\n小 出 售 时 => 召 歇 一 个 当前 阶 的 2 级 宠物 ， 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintZhClean":"OD 出 售 时 > 召唤 一 个 当前 阶 的 1 级 宠物 , 并 使 其 变 为 1/1。\n小 出 售 时 > 召 歇 一 个 当前 阶 的 2 级 宠物 , 并 使 其 变 为 1/1。\n(EY us ome et ee 2A AERA RAISER SOE OR 1/1","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9bd18f","sourceSheet":"4金毛兽群","sourceRow":18},{"id":"pack4_pet_0016","kind":"pack4_pet_0016","packKey":"pack4","nameZh":"蜥蜴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/蜥蜴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0016.png","iconMissing":false,"hintZhRaw":"oH OF\nCD 受伤 时 > BR—73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。\nNT) =u et ee 站 内 入 opnakss 忆 OE St ath","hintZhClean":"oH OF\nCD 受伤 时 > BR 73/1HMRR. 每 回合 生效 2 次 。\n) 哆 受伤 时 > 召唤 一 个 6/2 的 杀 蝎 尾 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c88fd1","sourceSheet":"4金毛兽群","sourceRow":19},{"id":"pack4_pet_0017","kind":"pack4_pet_0017","packKey":"pack4","nameZh":"非洲企鹅","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/非洲企鹅.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0017.png","iconMissing":false,"hintZhRaw":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 @ 攻击 。\n) CB 购买 时 => 使 三 个 随机 伙伴 获得 +2 @ 攻击\nNM) ast ab OHO A een oe 8. ? a wt","hintZhClean":"SEN ZF 8S\nOD 购买 时 > 使 三 个 随机 伙伴 获得 +1 攻击 。\n) CB 购买 时 > 使 三 个 随机 伙伴 获得 +2 攻击","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#99d18f","sourceSheet":"4金毛兽群","sourceRow":20},{"id":"pack4_pet_0018","kind":"pack4_pet_0018","packKey":"pack4","nameZh":"鱿鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/鱿鱼1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0018.png","iconMissing":false,"hintZhRaw":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。\nL2 晕厥时 -> 花费1 喇叭使前两个敌人染墨。\nL3 晕厥时 -> 花费1 喇叭使前三个敌人染墨。","hintZhClean":"鱿鱼\n页 1/2\nL1 晕厥时 -> 花费1 喇叭使第一个敌人染墨。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"4金毛兽群","sourceRow":21},{"id":"pack4_pet_0019","kind":"pack4_pet_0019","packKey":"pack4","nameZh":"黑颈长脚鹬","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/黑颈长脚鹬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0019.png","iconMissing":false,"hintZhRaw":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。\nL3 晕厥时 -> 获得+6 喇叭。","hintZhClean":"黑颈长脚鹬\nL1 晕厥时 -> 获得+2 喇叭。\nL2 晕厥时 -> 获得+4 喇叭。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"4金毛兽群","sourceRow":23},{"id":"pack4_pet_0020","kind":"pack4_pet_0020","packKey":"pack4","nameZh":"龟蚁","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/动物/龟蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0020.png","iconMissing":false,"hintZhRaw":"& By\nQD 前 排 为 空 > 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 ， 并 在 战斗 中 获得 +8 Ota.\nM1) ee wa OT Eee Otte Esl toh.) @ +e","hintZhClean":"By\nQD 前 排 为 空 > 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +4 Ota.\n小 前 排 为 空 DP 跳跃 至 最 前 排 , 并 在 战斗 中 获得 +8 Ota.","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bed18f","sourceSheet":"4金毛兽群","sourceRow":24},{"id":"pack4_pet_0021","kind":"pack4_pet_0021","packKey":"pack4","nameZh":"五彩搏鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/五彩搏鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0021.png","iconMissing":false,"hintZhRaw":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, ， 或 攻击 造成 +3 伤 害 名 ， 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintZhClean":"站 Am\nREI DY 2/2\n屏蔽 3 点 伤害 O, , 或 攻击 造成 +3 伤 害 名 , 生 效 一 次 (同时 生效 均 可 触发 ) 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a38fd1","sourceSheet":"4金毛兽群","sourceRow":29},{"id":"pack4_pet_0022","kind":"pack4_pet_0022","packKey":"pack4","nameZh":"刺尾鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/刺尾鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0022.png","iconMissing":false,"hintZhRaw":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 ， 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.\n1) ect ab te) Aw BCR MORAL Hoo 8.1) @ +s","hintZhClean":"刺 尾 鱼\nOD say > 花费 2 作 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +4 OY 生命 。\n) Bam o> 花费 ) 俏 喇叭 , 使 最 近 的 两 个 后 方 伙 伴 获得 +8 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bcd18f","sourceSheet":"4金毛兽群","sourceRow":30},{"id":"pack4_pet_0023","kind":"pack4_pet_0023","packKey":"pack4","nameZh":"狒狒","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/狒狒.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0023.png","iconMissing":false,"hintZhRaw":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 @xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 @ 攻击 与 + O tm.\nNf fal & 42 3 Rt ab (8: 6 24 Be BG OD FE rt RO Bb OH) * RE 2 OO) Oe OB 7B. 2 a tty = &H—.2 r) ye >","hintZhClean":"456 9B\nOD 回合 结束 时 加 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +1 xE5+1 O tm.\n) 哆 回合 结束 时 > 使 当前 或 更 高 商店 阶 数 的 一 个 随机 伙伴 获得 +2 攻击 与 + O tm.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a58fd1","sourceSheet":"4金毛兽群","sourceRow":31},{"id":"pack4_pet_0024","kind":"pack4_pet_0024","packKey":"pack4","nameZh":"珠鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/珠鸡.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0024.png","iconMissing":false,"hintZhRaw":"珠 鸡\nOO 受伤 时 = 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,\nNM) =u ps ea 2t7B.c D wn","hintZhClean":"珠 鸡\nOO 受伤 时 获得 +2 从 喇叭 。\n) 哆 受伤 时 加 获得 +4 OS MN,","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bad18f","sourceSheet":"4金毛兽群","sourceRow":32},{"id":"pack4_pet_0025","kind":"pack4_pet_0025","packKey":"pack4","nameZh":"皇霸鹟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/皇霸鹟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0025.png","iconMissing":false,"hintZhRaw":"CO =ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M=a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintZhClean":"CO ARA BRM > 对 一 个 随机 敌人 造成 4 点 伤害 加 。\n) M a,HA BRN 路 对 一 个 随机 敌人 造成 8 点 伤 宫 加 。\nfy 一 人 5 人 SER om HARKINS Lee BeBe NV","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a78fd1","sourceSheet":"4金毛兽群","sourceRow":33},{"id":"pack4_pet_0026","kind":"pack4_pet_0026","packKey":"pack4","nameZh":"跳蚤","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/跳蚤2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0026.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b8d18f","sourceSheet":"4金毛兽群","sourceRow":35},{"id":"pack4_pet_0027","kind":"pack4_pet_0027","packKey":"pack4","nameZh":"飞鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/飞鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0027.png","iconMissing":false,"hintZhRaw":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 ， 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。\nfy ble O84 TI eb Ar 了 sr OR EIB F 人 tte St fp) & 4e 6a 3°","hintZhClean":"飞鱼\n加 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +2 向 既 验 值 。 每 回合 生效 2 次 。\n) 拘 伙伴 被 召唤 时 > 如 果 在 战斗 中 , 使 其 获得 +4 各 经 验 值 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a98fd1","sourceSheet":"4金毛兽群","sourceRow":36},{"id":"pack4_pet_0028","kind":"pack4_pet_0028","packKey":"pack4","nameZh":"鱼鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/鱼鹰.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0028.png","iconMissing":false,"hintZhRaw":"—\nOD say =» 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n)\n1) eee ot 力作 一 人 Dion 二 eg","hintZhClean":"OD say 召唤 一 个 2/1 的 土 拨 鼠 。\nCB sme > 召唤 两 个 2/1 的 土 拨 鼠 。\n1) eee ot 力作 一 人 Dion 二 eg","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b5d18f","sourceSheet":"4金毛兽群","sourceRow":37},{"id":"pack4_pet_0029","kind":"pack4_pet_0029","packKey":"pack4","nameZh":"麝牛","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/麝牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0029.png","iconMissing":false,"hintZhRaw":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 @@ 攻击 和 +4 @ 生命 ， 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2? HB wtiic Ot yz 闲 丫 公","hintZhClean":"DO 前 方 伙 伴 量 顾 时 吵 获得 +1 攻击 和 +2 全 生命 , 持 续 一 回合 。\n小 MAKE RRS > 获得 +2 攻击 和 +4 生命 , 持 续 一 回合 。\nNE) ase a ok Rt oe 708.2 HB wtiic Ot yz 闲 丫 公","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ac8fd1","sourceSheet":"4金毛兽群","sourceRow":38},{"id":"pack4_pet_0030","kind":"pack4_pet_0030","packKey":"pack4","nameZh":"黄鼠狼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/动物/黄鼠狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0030.png","iconMissing":false,"hintZhRaw":"& EUR\n@) sae =» 下 一 回合 获得 +1 O 金币 。\n)\nNS men wa 下 站 全 六 f\\ os\nC8 smo = 下 一 回合 获得 +*2 〇 人 金币。","hintZhClean":"EUR\n) sae 下 一 回合 获得 +1 O 金币 。\nNS men wa 下 站 全 六 f os","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9cd1","sourceSheet":"4金毛兽群","sourceRow":39},{"id":"pack4_pet_0031","kind":"pack4_pet_0031","packKey":"pack4","nameZh":"凤头鹦鹉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/凤头鹦鹉.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0031.png","iconMissing":false,"hintZhRaw":"CD 购买 时 => 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 => 使 最 高 阶 的 伙伴 获得 +*4 @ 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc @ +","hintZhClean":"CD 购买 时 > 使 最 高 阶 的 伙伴 获得 +*2 伟 攻击 和 +2 O tm.\n) CB 购买 时 > 使 最 高 阶 的 伙伴 获得 +*4 攻击 和 +4 Ota.\nNY ays ea CRB AO ok ce A wtinsc +","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c38f","sourceSheet":"4金毛兽群","sourceRow":43},{"id":"pack4_pet_0032","kind":"pack4_pet_0032","packKey":"pack4","nameZh":"墨鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/墨鱼2.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0032.png","iconMissing":false,"hintZhRaw":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintZhClean":"Th -\n攻击 和 能 力 造成 的 伤害 O 减少 3 点 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ed1","sourceSheet":"4金毛兽群","sourceRow":45},{"id":"pack4_pet_0033","kind":"pack4_pet_0033","packKey":"pack4","nameZh":"小头鼠海豚","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/小头鼠海豚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0033.png","iconMissing":false,"hintZhRaw":"小 头 刀 海豚\nCD sry = 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey => 获得 +100% DMN (最少 +8 OS 喇叭 ) 。\nNE) exert we 共有 cro A wn (@e2.10 DA was","hintZhClean":"小 头 刀 海豚\nCD sry 获得 +50% DG 量 叭 (最少 +4 DO 喇叭 ) 。\n) CB wey > 获得 +100% DMN (最少 +8 OS 喇叭 ) 。","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c18f","sourceSheet":"4金毛兽群","sourceRow":46},{"id":"pack4_pet_0034","kind":"pack4_pet_0034","packKey":"pack4","nameZh":"海牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0034.png","iconMissing":false,"hintZhRaw":"海牛\nDassen @ 受到 5 点 伤害 含 ， 并 使 最 近 的 前 方 伙 伴 获得 +2 @ 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 ， 并 使 最 近 的 前 方 伙伴 获得 +4 @ 攻击 与 +2 二 tH.\nNf mo +t Bee at Vc Se eH +h Eras roo ee. Aa wtc.2 Oo t=","hintZhClean":"海牛\nDassen 受到 5 点 伤害 含 , 并 使 最 近 的 前 方 伙 伴 获得 +2 攻击 与 +1 OG tm.\n) 哆 回合 结束 时 > 受到 5 点 伤害 合 , 并 使 最 近 的 前 方 伙伴 获得 +4 攻击 与 +2 二 tH.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"4金毛兽群","sourceRow":47},{"id":"pack4_pet_0035","kind":"pack4_pet_0035","packKey":"pack4","nameZh":"海狮","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/海狮.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0035.png","iconMissing":false,"hintZhRaw":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 ， 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击， 前方 的 所 有 伙伴 获得 +*2 @ tm.\nNf Fh) > ¢t Bet ab CEE OOS Brel Oe 2378.2 A ws aa SAW eet, Pen 小 全","hintZhClean":"海狮\nOD 回合 结束 时 D 使 后 方 的 所 有 伙伴 获得 +1 全 攻击 , 前 方 的 所 有 伙伴 获得 +1 O tm.\n) 哆 回合 结束 时 D> 使 后 方 的 所 有 伙伴 获得 +2 合 攻击, 前方 的 所 有 伙伴 获得 +*2 tm.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"4金毛兽群","sourceRow":48},{"id":"pack4_pet_0036","kind":"pack4_pet_0036","packKey":"pack4","nameZh":"箭毒蛙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/箭毒蛙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0036.png","iconMissing":false,"hintZhRaw":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.\n1 22 ea ok Rt ek EO Be rn 上 人 丰富","hintZhClean":"A op\nD MAKER > 对 生命 最 高 的 敌人 造成 4 点 伤害 O.\n) 哆 前 方 伙 伴 旺 厥 时 > 对 生命 最 高 的 敌人 造成 8 点 伤害 O.","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f9ad1","sourceSheet":"4金毛兽群","sourceRow":49},{"id":"pack4_pet_0037","kind":"pack4_pet_0037","packKey":"pack4","nameZh":"蛞蝓","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蛞蝓.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0037.png","iconMissing":false,"hintZhRaw":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。\nNf @ Rt ad 72 4 “6/05 ,!.63 2@ (71.03 20 > FM A 2/209 22 | OF oe)","hintZhClean":"BS Si\nCD wma 吵 召唤 一 个 2/2 的 小 蜂 给 (小 妖 输 会 召唤 一 个 1/1 的 超 小 蜂 答 ) 。\n) 0B BRAY <P 召唤 一 个 4/4 的 小 蜂 答 (小 蜂 答 会 召唤 一 个 2/2 的 超 小 蜂 往 ) 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c58f","sourceSheet":"4金毛兽群","sourceRow":50},{"id":"pack4_pet_0038","kind":"pack4_pet_0038","packKey":"pack4","nameZh":"蝠鲼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/蝠鲼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0038.png","iconMissing":false,"hintZhRaw":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 ， 下 回合 获得 +2 〇 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 ， 下 回合 获得 +4 O £m.\nfy fal st BR eb INN TrSis 下 辣 全 让 ? 本 _C fom","hintZhClean":"be bi\nOQ 回合 结束 时 吵 如 果 有 空位 , 下 回合 获得 +2 ) 金币 。\n) 哆 回合 结束 时 - 如 果 有 空位 , 下 回合 获得 +4 O m.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f93d1","sourceSheet":"4金毛兽群","sourceRow":51},{"id":"pack4_pet_0039","kind":"pack4_pet_0039","packKey":"pack4","nameZh":"隼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/隼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0039.png","iconMissing":false,"hintZhRaw":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 => 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 | | ER CL AE Bb","hintZhClean":"CD 击 倒 时 > 召唤 一 个 3/3 的 1 级 复制 。 每 场 战斗 生效 3 次 。\n) 0B 击 倒 时 > 召唤 一 个 6/6 的 2 级 复制 。 每 场 战斗 生效 3 次 。\n人 和 证 二 了 ee 站 办 和 araoanain 和 入 和 ER CL AE Bb","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1cc8f","sourceSheet":"4金毛兽群","sourceRow":52},{"id":"pack4_pet_0040","kind":"pack4_pet_0040","packKey":"pack4","nameZh":"高鼻羚羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/动物/高鼻羚羊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0040.png","iconMissing":false,"hintZhRaw":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。\nL3 两个伙伴晕厥时 -> 获得+9 喇叭。","hintZhClean":"高鼻羚羊\nL1 两个伙伴晕厥时 -> 获得+3 喇叭。\nL2 两个伙伴晕厥时 -> 获得+6 喇叭。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a48f","sourceSheet":"4金毛兽群","sourceRow":53},{"id":"pack4_pet_0041","kind":"pack4_pet_0041","packKey":"pack4","nameZh":"护士鲨","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/护士鲨.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0041.png","iconMissing":false,"hintZhRaw":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 ， 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 ， 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\nNf BER ab Tee sac JD mini 34 — Amp inte be cP rR TBR Tt eee aN er","hintZhClean":"护士 多\nCD sre 吵 花费 至 多 6 OS 喇叭 , 对 一 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.\n) CB sre > 花费 至 多 6 OD 喇叭 , 对 两 个 随机 敌人 造成 三 倍 于 所 花费 数量 的 伤害 O.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbbd1","sourceSheet":"4金毛兽群","sourceRow":57},{"id":"pack4_pet_0042","kind":"pack4_pet_0042","packKey":"pack4","nameZh":"火蚁","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/火蚁.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0042.png","iconMissing":false,"hintZhRaw":"CD Srey > 使 最 高 阶 的 伙伴 获得 @ 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 @ 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintZhClean":"CD Srey > 使 最 高 阶 的 伙伴 获得 攻击 。\n) CB SRY > 使 两 个 最 高 阶 的 伙伴 获得 攻击 。\n1) eet ab HO A Be OK ee ww ws","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a28f","sourceSheet":"4金毛兽群","sourceRow":58},{"id":"pack4_pet_0043","kind":"pack4_pet_0043","packKey":"pack4","nameZh":"狼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/狼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0043.png","iconMissing":false,"hintZhRaw":"狼\nL1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintZhClean":"L1 晕厥时 -> 召唤三个3/2的猪。\nL2 晕厥时 -> 召唤三个6/4的猪。\nL3 晕厥时 -> 召唤三个9/6的猪。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbdd1","sourceSheet":"4金毛兽群","sourceRow":59},{"id":"pack4_pet_0044","kind":"pack4_pet_0044","packKey":"pack4","nameZh":"猕猴","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/猕猴.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0044.png","iconMissing":false,"hintZhRaw":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。\nMEY pe cl raed ab TI _ ACL bh Be on Se ES OIC CHET EIB DP","hintZhClean":"Soh\nCD 战斗 开始 时 加 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 12/12 的 红 毛 猩 猩 。\n) CB 战斗 开始 时 > 召唤 一 个 与 此 宠物 有 相同 食物 特性 的 24/24 的 红 毛 猩 猩 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19f8f","sourceSheet":"4金毛兽群","sourceRow":60},{"id":"pack4_pet_0045","kind":"pack4_pet_0045","packKey":"pack4","nameZh":"白斑羚","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白斑羚.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0045.png","iconMissing":false,"hintZhRaw":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。\nL3 晕厥时 -> 获得+24 喇叭。","hintZhClean":"白斑羚\nL1 晕厥时 -> 获得+8 喇叭。\nL2 晕厥时 -> 获得+16 喇叭。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fbfd1","sourceSheet":"4金毛兽群","sourceRow":61},{"id":"pack4_pet_0046","kind":"pack4_pet_0046","packKey":"pack4","nameZh":"白鲸","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/白鲸.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0046.png","iconMissing":false,"hintZhRaw":"B&F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 ， 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 ， 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。\nfy nS BE & et ab 7 6 SEE rh ot Peo ee Ot Tr OS ES R47 A Tr ae OO ERIS Sn","hintZhClean":"B F\nCD 吃 挤 食 物 时 > 吞 只 商店 中 最 左 侧 的 宠物 , 并 在 入 丘 时 召唤 出 基础 属性 的 1 级 该 宠物 。\n) CB 吃 掠 食物 时 > 知 唾 商店 中 最 左 例 的 宠物 , 并 在 是 氛 时 召唤 出 双 倍 属性 的 2 级 该 宠物 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19d8f","sourceSheet":"4金毛兽群","sourceRow":62},{"id":"pack4_pet_0047","kind":"pack4_pet_0047","packKey":"pack4","nameZh":"蓝环章鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蓝环章鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0047.png","iconMissing":false,"hintZhRaw":"监 环 章鱼\nCO) 购买 时 = 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 => 使 伙伴 获得 +2 O 攻击 和 +2 @ tH,\nfy BTR at CREEK EI AY The tein? +s","hintZhClean":"监 环 章鱼\nCO) 购买 时 使 伙伴 获得 +1 OREM O tH,\n) CH 购买 时 > 使 伙伴 获得 +2 O 攻击 和 +2 tH,","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc2d1","sourceSheet":"4金毛兽群","sourceRow":63},{"id":"pack4_pet_0048","kind":"pack4_pet_0048","packKey":"pack4","nameZh":"蛇鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/蛇鹫.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0048.png","iconMissing":false,"hintZhRaw":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 @ 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 @ 攻击 和 +8 Ota.\nNY =e A a ok Rt ee CBR A Es oe eo Mw tin.1) @ ts","hintZhClean":"顺 两 个 伙伴 是 顾 时 > 使 最 近 的 前 方 伙 伴 获得 +3 攻击 和 +*4 Ota,\n) BRAHAM D> 使 最 近 的 前 方 伙伴 获得 +6 攻击 和 +8 Ota.\nNY e A a ok Rt ee CBR A Es oe eo Mw tin.1) ts","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"4金毛兽群","sourceRow":64},{"id":"pack4_pet_0049","kind":"pack4_pet_0049","packKey":"pack4","nameZh":"鸸鹋","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鸸鹋.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0049.png","iconMissing":false,"hintZhRaw":"mS &S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 ， 并 将 其 移动 至 最 前 排 。\nNf ae 6 BoD em Pb Cl eh CB BBR AD Ae te Ol) Oe 87.) tm Hv ier ABs is","hintZhClean":"mS S\nOD 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙伴 获得 +4 Ot, HEMBME BAI.\n) CB 前 排 为 空 > 战斗 中 使 最 近 的 前 方 伙 伴 获得 +8 全 生命 , 并 将 其 移动 至 最 前 排 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"4金毛兽群","sourceRow":65},{"id":"pack4_pet_0050","kind":"pack4_pet_0050","packKey":"pack4","nameZh":"鹤","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/动物/鹤.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0050.png","iconMissing":false,"hintZhRaw":"#5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 @Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 @wxs. 每 回合 生效 2 次 。\nfi 和 ae me ao ie Rt ea EEUU 4te ines Tb 二 SMS ab","hintZhClean":"5 TQ 1/2\nOD 前 方 伙伴 受伤 时 D 使 其 获得 西瓜 特性 和 +5 Oxs. 每 回合 生效 1 次 。\n小 前 方 伙 伴 受 伤 时 > 使 其 获得 西风 特性 和 +5 wxs. 每 回合 生效 2 次 。","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c6","sourceSheet":"4金毛兽群","sourceRow":66},{"id":"pack4_pet_0051","kind":"pack4_pet_0051","packKey":"pack4","nameZh":"天堂鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/天堂鸟.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0051.png","iconMissing":false,"hintZhRaw":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 | 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。\n1? se ose mt ea CET Aino 0% 28? BO wtw.2 @t se mS Ht ab,","hintZhClean":"KES\nCD 花费 7 金币 时 D> 使 三 个 随机 伙伴 获得 +1 攻击 和 *+1 Hts. 每 回合 生效 3 次 。\n) 鸣 花费 7 金币 时 加 使 三 个 随机 伙伴 获得 +2 全 攻击 和 +*2 二 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f9b","sourceSheet":"4金毛兽群","sourceRow":70},{"id":"pack4_pet_0052","kind":"pack4_pet_0052","packKey":"pack4","nameZh":"德国牧羊犬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/德国牧羊犬.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0052.png","iconMissing":false,"hintZhRaw":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 ， 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 => 使 其 获得 此 宠物 50% 的 Oks, 4-4.\nNEY ab oe a 20 mt ea CHES TEI ees 人 wt tte ms","hintZhClean":"德国 牧 皇 大\nCD 伙伴 被 召唤 时 加 使 其 获得 此 宠物 25% 的 伟 攻击 , 持 续 一 回合 。\n) 哆 伙伴 被 召唤 时 > 使 其 获得 此 宠物 50% 的 Oks, 4-4.","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1c8","sourceSheet":"4金毛兽群","sourceRow":71},{"id":"pack4_pet_0053","kind":"pack4_pet_0053","packKey":"pack4","nameZh":"无齿翼龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/无齿翼龙.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0053.png","iconMissing":false,"hintZhRaw":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 ， 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。\nND)? op oe eR eb KO Seem woe ZITA 2¢ 12 Sf OTK 41/71 4a, 4%, FS 、| AE Be QU","hintZhClean":"ik HV\nCD ke SR > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 1 次 。\n) 鸣 伙伴 量 顾 时 > 在 此 宠物 后 排 重 新 召唤 , 并 将 其 变 为 1/1。 每 场 战斗 生效 2 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f99","sourceSheet":"4金毛兽群","sourceRow":72},{"id":"pack4_pet_0054","kind":"pack4_pet_0054","packKey":"pack4","nameZh":"灰熊","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/灰熊.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0054.png","iconMissing":false,"hintZhRaw":"TRAE\nQO 友 方 单位 攻击 五 次 后 @ 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.\nfi 生生 廊 吕 人 让 本 工 帮 户 天 人 入 卫 tn ein 上 人 丰富 全","hintZhClean":"TRAE\nQO 友 方 单位 攻击 五 次 后 对 两 个 随机 敌人 造成 6 点 伤害 O.\n) 鸣 友 方 单位 攻击 五 次 后 D> 对 两 个 随机 敌人 造成 12 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cb","sourceSheet":"4金毛兽群","sourceRow":73},{"id":"pack4_pet_0055","kind":"pack4_pet_0055","packKey":"pack4","nameZh":"牛羚","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牛羚1.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0055.png","iconMissing":false,"hintZhRaw":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。\nEY ve es te to ey A mini cece Ot OER CL AE ab YD","hintZhClean":"FH TQ 1/2\nOO 攻击 前 > 花费 2 俏 WURORF 特性 。 每 场 战 斗 生 效 1 次 。\n) B 攻击 前 > 花费 2 俏 喇叭 获得 椰子 特性 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f96","sourceSheet":"4金毛兽群","sourceRow":74},{"id":"pack4_pet_0056","kind":"pack4_pet_0056","packKey":"pack4","nameZh":"牡蛎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/牡蛎.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0056.png","iconMissing":false,"hintZhRaw":"tt OF\nCO 出 售 时 > 获得 +3 @ 〇 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,\nNM) wee ab 证 四, of 人 公干","hintZhClean":"tt OF\nCO 出 售 时 > 获得 +3 Sh.\n) 3 出 售 时 加 获得 +6 O Sh,","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1cd","sourceSheet":"4金毛兽群","sourceRow":76},{"id":"pack4_pet_0057","kind":"pack4_pet_0057","packKey":"pack4","nameZh":"疣猪","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/疣猪.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0057.png","iconMissing":false,"hintZhRaw":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +1 @ 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 ， 使 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) een ab ib Seem rset CBN OL oe a8. M@ wtin.2 @*=-+","hintZhClean":"EG\nQO SkY 吵 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +1 攻击 和 +1 Ota.\n) BskY > 此 宠物 每 有 3 点 攻击 , 使 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18f94","sourceSheet":"4金毛兽群","sourceRow":77},{"id":"pack4_pet_0058","kind":"pack4_pet_0058","packKey":"pack4","nameZh":"眼镜蛇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/眼镜蛇.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0058.png","iconMissing":false,"hintZhRaw":"BR $3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.\nfi 和 pmp 二 pa 入 xiinrh LCE REI SOT ENOL ie aA","hintZhClean":"BR 3 8\nDO MAKER > 对 一 个 随机 敌人 造成 此 宠物 攻击 20% 的 伤害 O.\n) CB 前 方 伙伴 攻击 时 D> 对 一 个 随机 敌人 造成 此 宠物 攻击 40% 的 伤害 O.","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"4金毛兽群","sourceRow":78},{"id":"pack4_pet_0059","kind":"pack4_pet_0059","packKey":"pack4","nameZh":"高地牛","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/高地牛.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0059.png","iconMissing":false,"hintZhRaw":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 ， 额 外 获得 +2 侈 MO.\nNE? rs: raed ea 2578.19 AD win) bh eee ee eee) oom oke.2 DA wn","hintZhClean":"高 地 和牛\nCD 战斗 开始 时 + 获得 +4 俏 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +1 PD 喇叭 。\n) 哆 战斗 开始 时 路 获得 +8 OH 喇叭 。 此 宠物 每 有 3 点 生命 , 额 外 获得 +2 侈 MO.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"4金毛兽群","sourceRow":79},{"id":"pack4_pet_0060","kind":"pack4_pet_0060","packKey":"pack4","nameZh":"鲶鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/动物/鲶鱼.png","iconAliasRel":"assets/icons_en/pack4/pets/pack4_pet_0060.png","iconMissing":false,"hintZhRaw":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 一 次 ， 或 使 其 获得 +4 @ 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 ， 生 效 两 次 ， 或 使 其 获得 +8 O tH.\nNf fal & Tbh Re ab 186 SF 24 ot BB IE OH OL 1 OY BD FD Oot Bt -人 A4- Ah — at 4% tf 257.1 @ AE am","hintZhClean":"铃 鱼\nCD 回合 开始 时 串 激活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 一 次 , 或 使 其 获得 +4 生命 。\n) CB OSM > 数 活 前 方 最 近 的 伙伴 的 购买 时 能 力 , 生 效 两 次 , 或 使 其 获得 +8 O tH.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b1d18f","sourceSheet":"4金毛兽群","sourceRow":80},{"id":"pack5_pet_0001","kind":"pack5_pet_0001","packKey":"pack5","nameZh":"几维鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/几维鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0001.png","iconMissing":false,"hintZhRaw":"LES\nCD 受伤 时 & HM > SREHORASBRMBRG+1 @ 攻击 。\n受伤 时 & 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 @ 攻击 。\n小 -\nuch @ Wet ob HBC tt ae ee. Aa wes","hintZhClean":"LES\nCD 受伤 时 HM > SREHORASBRMBRG+1 攻击 。\n受伤 时 出 售 时 > 使 最 后 排 的 友 方 草莓 宠物 获得 +2 攻击 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fad","sourceSheet":"5海星兽群","sourceRow":2},{"id":"pack5_pet_0002","kind":"pack5_pet_0002","packKey":"pack5","nameZh":"吉娃娃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/吉娃娃.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0002.png","iconMissing":false,"hintZhRaw":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。\nME) peel wae ea OH eB te Settee rh— we","hintZhClean":"言 娃娃\nCD 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 一 格 。\n) CB 战斗 开始 时 > 将 生命 最 高 的 敌人 向 前 推动 两 格 。","hintEn":"","attack":1,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b7","sourceSheet":"5海星兽群","sourceRow":3},{"id":"pack5_pet_0003","kind":"pack5_pet_0003","packKey":"pack5","nameZh":"家鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/家鼠2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0003.png","iconMissing":true,"hintZhRaw":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintZhClean":"页 21/:\n苹果 DY 2/2\n使 一 个 宠物 获得 +1 O KHM+11O 生命 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18faa","sourceSheet":"5海星兽群","sourceRow":5},{"id":"pack5_pet_0004","kind":"pack5_pet_0004","packKey":"pack5","nameZh":"狨猴","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/狨猴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0004.png","iconMissing":false,"hintZhRaw":"A\nCO 出 售 时 => 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintZhClean":"CO 出 售 时 > 下 一 次 剧 新 免费 。\n) 哆 出 售 时 > 下 两 次 剧 新 免费 。\nNM) weet ab Ko rRisame","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b9","sourceSheet":"5海星兽群","sourceRow":6},{"id":"pack5_pet_0005","kind":"pack5_pet_0005","packKey":"pack5","nameZh":"萤火虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/萤火虫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0005.png","iconMissing":false,"hintZhRaw":"mK Dp\nOQ 票据 时 © 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay => 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.\n1S op cnt bd MN RI HEE Tee Bae","hintZhClean":"mK Dp\nOQ 票据 时 对 一 格 以 内 的 所 有 宠物 造成 1 点 伤害 O.\n) 8 aay > 对 两 格 以 内 的 所 有 宠物 造成 点 伤 襄 O.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa8","sourceSheet":"5海星兽群","sourceRow":7},{"id":"pack5_pet_0006","kind":"pack5_pet_0006","packKey":"pack5","nameZh":"蜂鸟","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蜂鸟2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0006.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bb","sourceSheet":"5海星兽群","sourceRow":9},{"id":"pack5_pet_0007","kind":"pack5_pet_0007","packKey":"pack5","nameZh":"蟑螂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/蟑螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0007.png","iconMissing":false,"hintZhRaw":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 @ SRA.\nCB She => 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n)\n1) exer ab 7274 _ A111 om ee tt 2? BD 42m","hintZhClean":"CD SRY > 召唤 一 个 1/1 的 镍 卿 并 使 其 获得 +1 SRA.\nCB She > 召 隐 一 个 1/1 的 是 娜 并 使 其 获得 +2 B 经 验 值 。\n1) exer ab 7274 A111 om ee tt 2 BD 42m","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa6","sourceSheet":"5海星兽群","sourceRow":10},{"id":"pack5_pet_0008","kind":"pack5_pet_0008","packKey":"pack5","nameZh":"雉鸡","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/雉鸡2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0008.png","iconMissing":true,"hintZhRaw":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l @ 攻击 和 +1 O 生命 。","hintZhClean":"晕厥 时 加 使 最 后 排 的 伙伴 获得 +1l 攻击 和 +1 O 生命 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1bd","sourceSheet":"5海星兽群","sourceRow":12},{"id":"pack5_pet_0009","kind":"pack5_pet_0009","packKey":"pack5","nameZh":"青蛙","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/青蛙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0009.png","iconMissing":false,"hintZhRaw":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 ， 则 互 换 其 属性 。\n) 2) 出 售 时 => 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 ， 则 互 换 其 属性 。\nEY us oe et eh AN ER ARON AR AGL OK RR KID MCR UPI are","hintZhClean":"青蛙\nCD 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 2 阶 , 则 互 换 其 属性 。\n) 2) 出 售 时 > 如 果 相 邻 的 两 个 伙伴 都 不 超过 4 阶 , 则 互 换 其 属性 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa4","sourceSheet":"5海星兽群","sourceRow":13},{"id":"pack5_pet_0010","kind":"pack5_pet_0010","packKey":"pack5","nameZh":"鼠妇","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/动物/鼠妇1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0010.png","iconMissing":false,"hintZhRaw":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 => 转 积 两 个 免费 的 安眠 药 。\n1) wee ap MIO—AewmeHocws","hintZhClean":"鼠 妇 页 1/:\nCO 出 售 时 > 转 积 一 个 免费 的 安眠 药 。\n) 鸣 出售 时 > 转 积 两 个 免费 的 安眠 药 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b58f","sourceSheet":"5海星兽群","sourceRow":14},{"id":"pack5_pet_0011","kind":"pack5_pet_0011","packKey":"pack5","nameZh":"小飞象章鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/小飞象章鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0011.png","iconMissing":false,"hintZhRaw":"| ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 1 〇 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 ， 并 使 其 价格 减 2 〇 SH.\nNS areca nt wa LL CIR ASR MOR DRIO_AYC EA HEME IY Os","hintZhClean":"ERE B\nCD 别 新 3 次 时 > 从 最 近 解 锁 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 1 金币 。\n) GB PRIN > 从 最 近 解 镇 的 3 阶 中 图 积 一 个 任意 食物 , 并 使 其 价格 减 2 SH.","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa9d1","sourceSheet":"5海星兽群","sourceRow":18},{"id":"pack5_pet_0012","kind":"pack5_pet_0012","packKey":"pack5","nameZh":"海蜇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/海蜇.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0012.png","iconMissing":false,"hintZhRaw":"9 6\nOD 伙伴 升级 时 > 获得 +1 @xsn-1 @ 生命\n) OB 伙伴 升级 时 => 获得 +2 @ 攻击 和 +2 O tm.\nNM) op oe tenet ea 2258.2 MA wstiw.? @ +s","hintZhClean":"9 6\nOD 伙伴 升级 时 > 获得 +1 xsn-1 生命\n) OB 伙伴 升级 时 > 获得 +2 攻击 和 +2 O tm.","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b38f","sourceSheet":"5海星兽群","sourceRow":19},{"id":"pack5_pet_0013","kind":"pack5_pet_0013","packKey":"pack5","nameZh":"白鸽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/白鸽.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0013.png","iconMissing":false,"hintZhRaw":"三 下\nCO eae = 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 ， 且 相应 效果 变 为 两 倍 。\n1) eee ob BIT OKHATCHTEBR Siascwerno-e","hintZhClean":"三 下\nCO eae 茹 活 三 个 友 方 草 攻 。\n小 BAY > 激活 三 个 友 方 草 葡 , 且 相应 效果 变 为 两 倍 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8facd1","sourceSheet":"5海星兽群","sourceRow":20},{"id":"pack5_pet_0014","kind":"pack5_pet_0014","packKey":"pack5","nameZh":"绿鬣蜥","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/绿鬣蜥.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0014.png","iconMissing":false,"hintZhRaw":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 @ HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 &@ 对 其 造成 4 点 伤害 人 @.\nMEY sek ah Tm Be ECHR ea MO BCS ROC EEED","hintZhClean":"1 Be Sf\nOD 敌人 被 召唤 或 推动 时 HMAR2ADEO.\n) 哆 敌人 被 召唤 或 推动 时 对 其 造成 4 点 伤害 人 .","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b18f","sourceSheet":"5海星兽群","sourceRow":21},{"id":"pack5_pet_0015","kind":"pack5_pet_0015","packKey":"pack5","nameZh":"考拉","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/考拉2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0015.png","iconMissing":false,"hintZhRaw":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 ， 生 效 一 次 。","hintZhClean":"校 树 用\n屏蔽 4 点 敌 方 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faed1","sourceSheet":"5海星兽群","sourceRow":23},{"id":"pack5_pet_0016","kind":"pack5_pet_0016","packKey":"pack5","nameZh":"蝾螈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/蝾螈.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0016.png","iconMissing":false,"hintZhRaw":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 ， 获 得 +2 @ 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn? AB wstin.2? @ ts","hintZhClean":"CD 战斗 开始 时 > 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +1 O 攻击 和 +1 Ot.\n) CBSA Oe 每 个 出 售 时 伙伴 每 有 一 级 , 获 得 +2 攻击 和 +2 O tm.\nMEY pes) rae ea OY Wh om RS OL Ok eet Rn AB wstin.2 ts","hintEn":"","attack":4,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1af8f","sourceSheet":"5海星兽群","sourceRow":24},{"id":"pack5_pet_0017","kind":"pack5_pet_0017","packKey":"pack5","nameZh":"豚鼠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/豚鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0017.png","iconMissing":false,"hintZhRaw":"豚鼠\nOO 购买 时 = 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 => BR—22/20RM.\nNM) sos ab 72°40 2/2o8E","hintZhClean":"豚鼠\nOO 购买 时 召唤 一 只 1/1 的 豚鼠。\n) 0B 购买 时 > BR 22/20RM.","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb0d1","sourceSheet":"5海星兽群","sourceRow":25},{"id":"pack5_pet_0018","kind":"pack5_pet_0018","packKey":"pack5","nameZh":"长尾山雀","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/长尾山雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0018.png","iconMissing":false,"hintZhRaw":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 ， 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 ， 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。\nNf 4 2¢ 2 BR ab Ff BS Teenie eee OP eS OZ eK Ia OL 45 [二 | & 4+ 869 Yr","hintZhClean":"KREWE\nCD ce Sma > 如 果 该 宠物 拥有 草莓 , 在 其 位 置 召 唤 一 个 2/2 的 伙伴 。 每 回合 生效 2 次 。\n) Binks > 如 果 该 宠物 拥有 草 葡 , 在 其 位 置 召唤 一 个 4/4 的 伙伴 。 每 回合 生效 2 次 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ad8f","sourceSheet":"5海星兽群","sourceRow":26},{"id":"pack5_pet_0019","kind":"pack5_pet_0019","packKey":"pack5","nameZh":"鲈鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鲈鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0019.png","iconMissing":false,"hintZhRaw":"鲈鱼\nCD 票 挨 时 & 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 & SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 & 经 验 值 。\n1S} mens po Ws tet om CRS OT a EHR oe ER. 2 OD tH","hintZhClean":"鲈鱼\nCD 票 挨 时 出 售 时 > 使 一 个 只 有 出 鲁能 力 的 2 级 伙伴 获得 +1 SKE.\n) CO mrs 出 售 时 > 使 一 个 只 有 出 售 能 力 的 2 级 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fb2d1","sourceSheet":"5海星兽群","sourceRow":27},{"id":"pack5_pet_0020","kind":"pack5_pet_0020","packKey":"pack5","nameZh":"鹳","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/动物/鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0020.png","iconMissing":false,"hintZhRaw":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb _ RA EE NA _A CICA ER OO","hintZhClean":"CD sey oe 从 上 一 阶 商店 召唤 任意 一 个 2/2 的 1 级 宠物 。\n) CB SRY > 从 上 一 阶 商店 召唤 任意 一 个 4/4 的 2 级 宠物 。\nNE) ex ret ob (lb RA EE NA A CICA ER OO","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa0d1","sourceSheet":"5海星兽群","sourceRow":28},{"id":"pack5_pet_0021","kind":"pack5_pet_0021","packKey":"pack5","nameZh":"哈巴狗","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/哈巴狗.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0021.png","iconMissing":false,"hintZhRaw":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 & 经 验 值 。\nME) pec) wae ea CRB EO) Oe eI. BS bzw","hintZhClean":"哈巴 狗\nCD 战斗 开始 时 > 使 最 近 的 前 方 伙伴 获得 +1 B 经 验 值 。\n) BHAA > 使 最 近 的 前 方 伙伴 获得 +2 经 验 值 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1be8f","sourceSheet":"5海星兽群","sourceRow":32},{"id":"pack5_pet_0022","kind":"pack5_pet_0022","packKey":"pack5","nameZh":"水蛭","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水蛭.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0022.png","iconMissing":false,"hintZhRaw":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 ， 并 获得 等 量 全 生命\nNf fe) >} +t Be ab HBS EO OM Se See +7227 @ + -","hintZhClean":"7K BF\nOD 回合 结束 时 DP 对 最 近 的 前 方 伙 伴 造 成 1 点 伤害 O, HRBSRO 生命 .\n) 鸣 回合 结束 时 D 对 最 近 的 前 方 伙伴 造成 2 点 伤害 全 , 并 获得 等 量 全 生命","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa3d1","sourceSheet":"5海星兽群","sourceRow":33},{"id":"pack5_pet_0023","kind":"pack5_pet_0023","packKey":"pack5","nameZh":"水豚","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/水豚.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0023.png","iconMissing":false,"hintZhRaw":"7K BR\nCD 刷新 时 & 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 Ota.\n) 哆 刷新 时 & 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 @ 攻击 和 +2 Ota.\nNf BIS e+ @ We ht am CHET BS Ww WOE os eee the. 2? BA wtin.? @ +=","hintZhClean":"7K BR\nCD 刷新 时 出 售 时 > 使 商店 刚 剧 新 出 来 的 所 有 宠物 获得 +1 攻击 和 +1 Ota.\n) 哆 刷新 时 出 售 时 > 使 商店 刚 刷新 出 来 的 所 有 宠物 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bc8f","sourceSheet":"5海星兽群","sourceRow":34},{"id":"pack5_pet_0024","kind":"pack5_pet_0024","packKey":"pack5","nameZh":"獾珈独","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/獾珈独.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0024.png","iconMissing":false,"hintZhRaw":"Ae 400 AR\nCD 剧 新 时 => 获得 +1 @ 攻击 和 +1 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 => 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。 每 回合 生效 5 次 。\n1) arp ea 共有 ”mp 二 ri” Ot 这, 京 、 门人 mM SH Bee","hintZhClean":"Ae 400 AR\nCD 剧 新 时 > 获得 +1 攻击 和 +1 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。\n) CB 刷新 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。 每 回合 生效 5 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":35},{"id":"pack5_pet_0025","kind":"pack5_pet_0025","packKey":"pack5","nameZh":"红毛猩猩","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红毛猩猩.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0025.png","iconMissing":false,"hintZhRaw":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 @ 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.\n1) mace sn ea HH Se Bam et wet. 和 小 全","hintZhClean":"红 毛 猩猩\nOD 回合 结束 时 D> 使 生命 最 低 的 友 方 宠物 获得 +3 生命 。\n) 鸣 回合 结束 时 加 使 生命 最 低 的 友 方 宠物 获得 +6 全 tH.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1ba8f","sourceSheet":"5海星兽群","sourceRow":36},{"id":"pack5_pet_0026","kind":"pack5_pet_0026","packKey":"pack5","nameZh":"红衣凤头鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/红衣凤头鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0026.png","iconMissing":false,"hintZhRaw":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 ， 并 使 其 价格 减 2 〇 ) 金币 。\nfy 作证 二 Re TOLER mst ete Ooo HET ve 人 om","hintZhClean":"TK RAS\nOO 回合 结束 时 + 复制 并 围 积 最 近 的 前 方 特性 , 并 使 其 价格 减 1 O 金币 。\n) CB 回合 结束 时 > 复制 并 转 积 最 近 的 前 方 特性 , 并 使 其 价格 减 2 ) 金币 。","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa7d1","sourceSheet":"5海星兽群","sourceRow":37},{"id":"pack5_pet_0027","kind":"pack5_pet_0027","packKey":"pack5","nameZh":"蟾蜍","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/蟾蜍2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0027.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b88f","sourceSheet":"5海星兽群","sourceRow":39},{"id":"pack5_pet_0028","kind":"pack5_pet_0028","packKey":"pack5","nameZh":"金枪鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/金枪鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0028.png","iconMissing":false,"hintZhRaw":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 @ tm.\n) CB Bet > 每 当 此 宠物 受伤 时 ， 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +2 Ota.\nNf Se BE Rt ae 485 MC HO 22 4 个 RAEN 4 OK ZEIBs 2 a Thy 2 2042 @ Ate &","hintZhClean":"金枪鱼\nOD SRN > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 tm.\n) CB Bet > 每 当 此 宠物 受伤 时 , 使 一 个 随机 伙伴 获得 +*2 攻击 和 +2 Ota.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8f98d1","sourceSheet":"5海星兽群","sourceRow":40},{"id":"pack5_pet_0029","kind":"pack5_pet_0029","packKey":"pack5","nameZh":"食蚁兽","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/食蚁兽2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0029.png","iconMissing":false,"hintZhRaw":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 @ 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n1) exes ob OHA een oe 2. >? BA wtin.2? @ +s","hintZhClean":"蚂蚁 页 2/:\nCD ere > 使 一 个 随机 伙伴 获得 +1 攻击 和 +1 O te.\n) CB eRe > 使 一 个 随机 伙伴 获得 +2 攻击 和 +2 Ota.","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c78f","sourceSheet":"5海星兽群","sourceRow":42},{"id":"pack5_pet_0030","kind":"pack5_pet_0030","packKey":"pack5","nameZh":"鹤鸵","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/动物/鹤鸵.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0030.png","iconMissing":false,"hintZhRaw":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 @@ 生命\n。 另 获得 +1 @ 攻击 ， 持 续 一 回合\n友 方 获得 草莓 时 @ R290 生命\n。 另 获得 +2 千 攻击， 持续 一 回合\n小 -\n> * Thi BER aa 28.2? @ + =\nowe. 2 a wt\nem ¢*® fs) &","hintZhClean":"一 ] 一\nDO 友 方 获得 草莓 时 9 获得 +1 生命\n。 另 获得 +1 攻击 , 持 续 一 回合","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcc","sourceSheet":"5海星兽群","sourceRow":43},{"id":"pack5_pet_0031","kind":"pack5_pet_0031","packKey":"pack5","nameZh":"仙女犰狳","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/仙女犰狳2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0031.png","iconMissing":false,"hintZhRaw":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。\nNW) mma week","hintZhClean":"仙女 球 TQ 2/:\nOO 受到 的 伤害 减少 2 点 。\n小 受到 的 伤害 减少 4 点 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd195","sourceSheet":"5海星兽群","sourceRow":49},{"id":"pack5_pet_0032","kind":"pack5_pet_0032","packKey":"pack5","nameZh":"小丑鱼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/小丑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0032.png","iconMissing":false,"hintZhRaw":"小 丑 鱼\nOD REAR > 使 其 获得 +2 @ 攻击 和 +2 @ tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 @ 生命 。\nMM) +e ain ea Heme A wt. @ +2","hintZhClean":"小 丑 鱼\nOD REAR > 使 其 获得 +2 攻击 和 +2 tH.\n) 鸣 友 方 升级 时 > 使 其 获得 +4 全 攻击 和 +*4 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc9","sourceSheet":"5海星兽群","sourceRow":50},{"id":"pack5_pet_0033","kind":"pack5_pet_0033","packKey":"pack5","nameZh":"暹罗猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/暹罗猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0033.png","iconMissing":false,"hintZhRaw":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 获得 +1 @ 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 ， 再 使 其 黎 得 +2 人 @ FM,\nfg 站 全 广 示 Re HHA AN ee OM KER HINKBHRe he Bw. Oa","hintZhClean":"HEF 4\nDoser > sexeMRe-1 人 O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 获得 +1 生命。\ny B 回合 结束 时 > KASEMRI-2O 攻击 。 若 商店 有 折扣 价格 食物 , 再 使 其 黎 得 +2 人 FM,","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd198","sourceSheet":"5海星兽群","sourceRow":51},{"id":"pack5_pet_0034","kind":"pack5_pet_0034","packKey":"pack5","nameZh":"猎鹰","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/猎鹰.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0034.png","iconMissing":false,"hintZhRaw":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.\nNM) pec) wae ea 必要 AT) 生疏 1 上 个 十 全","hintZhClean":"55\nCD 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 7 点 伤害 O.\n) CB 战斗 开始 时 > 对 另 一 侧 此 位 置 的 敌人 造成 14 点 伤害 O.","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fd0","sourceSheet":"5海星兽群","sourceRow":52},{"id":"pack5_pet_0035","kind":"pack5_pet_0035","packKey":"pack5","nameZh":"螳螂","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/螳螂.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0035.png","iconMissing":false,"hintZhRaw":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, ， 并 获得 +2 @ 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.\nNM) marron ab HiRes oe een aie ae ON tee. 让 二 IF @+s","hintZhClean":"oF off\nDO 回合 开始 时 路 对 相 邻 的 伙伴 造成 50 点 伤害 O, , 并 获得 +2 攻击 和 +2 Ota.\n) 哆 回合 开始 时 > 对 相 邻 的 伙伴 造成 50 点 伤害 O, HRG4 QO 攻击 和 +4 Ota.","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd191","sourceSheet":"5海星兽群","sourceRow":53},{"id":"pack5_pet_0036","kind":"pack5_pet_0036","packKey":"pack5","nameZh":"长尾灵猫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/长尾灵猫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0036.png","iconMissing":false,"hintZhRaw":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 ， 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 ， 使 前 两 个 敌人 2O tH.\nNM) pec) mae ea 由 中 人 向 症 parp 和 人 了 2 @+-s","hintZhClean":"长 尾 灵 和 猫\nCD 战斗 开始 时 路 此 回合 每 次 刷新 时 , 使 前 两 个 政 人 -1 O tH.\n) 鸣 战斗 开始 时 串 此 回合 每 次 刷新 时 , 使 前 两 个 敌人 2O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fce","sourceSheet":"5海星兽群","sourceRow":54},{"id":"pack5_pet_0037","kind":"pack5_pet_0037","packKey":"pack5","nameZh":"驴","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/驴.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0037.png","iconMissing":false,"hintZhRaw":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 ， 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。\nNS? op oe Rt ab 4 只 Fn eg 2 DT 二 IRB cl A Bd","hintZhClean":"gp\nOD ke SR > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 敌人 -3 ONE. 每 场 战 斗 生效 1 次 。\n) C3 te BRE > 将 最 后 排 的 敌人 推动 到 最 前 排 , 并 使 该 政 人 -3 O 攻击 。 每 场 战斗 生效 2 次 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd193","sourceSheet":"5海星兽群","sourceRow":55},{"id":"pack5_pet_0038","kind":"pack5_pet_0038","packKey":"pack5","nameZh":"鸭嘴兽","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/鸭嘴兽3.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0038.png","iconMissing":false,"hintZhRaw":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ 攻击 .\nE> us oe et em CHAE A HEN OL Ok ee. Hawt","hintZhClean":"AE 页 3/3\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 攻击 .","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc3","sourceSheet":"5海星兽群","sourceRow":58},{"id":"pack5_pet_0039","kind":"pack5_pet_0039","packKey":"pack5","nameZh":"麋鹿","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麋鹿.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0039.png","iconMissing":false,"hintZhRaw":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。\nNf fl & 4t Bede ab CE“ en SW me BE OE OK HU eH ANASatnc Com","hintZhClean":"RR EE\nQD 回合 结束 时 > 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 2 O 金币 。\n) 鸣 回合 结束 时 叫 使 一 个 随机 具有 出 售 能 力 的 伙伴 的 出 售 价值 加 4 O 人 金币。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19e","sourceSheet":"5海星兽群","sourceRow":59},{"id":"pack5_pet_0040","kind":"pack5_pet_0040","packKey":"pack5","nameZh":"麻雀","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/动物/麻雀.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0040.png","iconMissing":false,"hintZhRaw":"FR £€\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。\nf 人 人 ee Ene Re 1/ 丰 ab ee ae oe ee ee","hintZhClean":"FR\nRAMBRASAGE (生效 两 次 ) 或 不 适 状 态 (生效 一 次 ) 。\n小 友 方 草莓 屏蔽 10 点 伤害 (生效 两 次 ) 或 不 适 状态 (生效 一 次 ) 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b98fd1","sourceSheet":"5海星兽群","sourceRow":60},{"id":"pack5_pet_0041","kind":"pack5_pet_0041","packKey":"pack5","nameZh":"三角龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/三角龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0041.png","iconMissing":false,"hintZhRaw":"","hintZhClean":"","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a8d18f","sourceSheet":"5海星兽群","sourceRow":64},{"id":"pack5_pet_0042","kind":"pack5_pet_0042","packKey":"pack5","nameZh":"仓鼠","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/仓鼠.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0042.png","iconMissing":false,"hintZhRaw":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。\nNM) aise ea 1B RIS OI Se","hintZhClean":"仓鼠\nCD 刷新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 2 次 。\n) CB 剧 新 时 > 获得 一 次 免费 刷新 。 每 回合 生效 4 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#bb8fd1","sourceSheet":"5海星兽群","sourceRow":65},{"id":"pack5_pet_0043","kind":"pack5_pet_0043","packKey":"pack5","nameZh":"剑鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/剑鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0043.png","iconMissing":false,"hintZhRaw":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 〇 。\nfy te cl TT ARA ab 3 了 直人 们 加 0 了 bin 4 ise Ol OTS 二 ONIN Hs Se ON","hintZhClean":"sl)\nCO) 战斗 开始 时 > 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 100% 的 伤害 O.\n) 8 战斗 开始 时 路 对 生命 最 高 的 敌人 和 自己 造成 此 宠物 攻击 值 200% 的 伤 庆 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#a6d18f","sourceSheet":"5海星兽群","sourceRow":66},{"id":"pack5_pet_0044","kind":"pack5_pet_0044","packKey":"pack5","nameZh":"啄木鸟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/啄木鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0044.png","iconMissing":false,"hintZhRaw":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。\nfy ta cl TT PRA eb 3 了 | 品 :FAN 下 人 二 下 -Rh 这 FF 人 1 二 As SNe ONE LOE PU ICTS","hintZhClean":"KAS\nCO) 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤害 O 两 次 。 对 敌人 造成 双 倍 伤 客 。\n) C3 战斗 开始 时 > 对 最 近 的 两 个 前 方 宠物 造成 1 点 伤 齐 O 四 次 。 对 敌人 造成 双 倍 伤 富 。","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b48fd1","sourceSheet":"5海星兽群","sourceRow":67},{"id":"pack5_pet_0045","kind":"pack5_pet_0045","packKey":"pack5","nameZh":"水滴鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/水滴鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0045.png","iconMissing":false,"hintZhRaw":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B@ 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\nNf SBR ab HEIR M LA LS KH OK hi. ? BA eee ES 、| cto BOO LS MM O61 OK RIB IM oo","hintZhClean":"水 滴 鱼\nOD SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +1 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。\n) CB SRY > 使 最 近 的 一 个 后 方 伙 伴 获得 +*2 B 经 验 值 。 战 斗 中 额外 使 一 个 伙伴 获得 此 效果 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#add18f","sourceSheet":"5海星兽群","sourceRow":68},{"id":"pack5_pet_0046","kind":"pack5_pet_0046","packKey":"pack5","nameZh":"海星","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/海星.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0046.png","iconMissing":false,"hintZhRaw":"海星\nCD 出 镶 3 级 伙伴 时 => 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 => 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 @ 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10， 则 效果 变 为 三 倍 。\nfy 条 QtRi 人 Re OR BE Tre OK ee DY the en. 2 OOD OH Ot eT Se RIN miIAh we Hie","hintZhClean":"海星\nCD 出 镶 3 级 伙伴 时 > 使 所 有 伙伴 获得 +1 O 攻击 和 +1 O 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。\n) CB 出 售 3 级 伙伴 时 > 使 所 有 伙伴 获得 +2 O 攻击 和 *+2 生命 。 若 出 售 的 宠物 的 攻击 不 少 于 10, 则 效果 变 为 三 倍 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#b78fd1","sourceSheet":"5海星兽群","sourceRow":69},{"id":"pack5_pet_0047","kind":"pack5_pet_0047","packKey":"pack5","nameZh":"秃鹫","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/秃鹫.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0047.png","iconMissing":false,"hintZhRaw":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) =A ook BR ob tH _ AEN Se LCE PILI REREAD","hintZhClean":"OD Bake RRO > 对 一 个 随机 敌人 造成 4 点 伤害 O.\n) BRERA > 对 一 个 随机 敌人 造成 8 点 伤害 O.\nNM) A ook BR ob tH AEN Se LCE PILI REREAD","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#aad18f","sourceSheet":"5海星兽群","sourceRow":70},{"id":"pack5_pet_0048","kind":"pack5_pet_0048","packKey":"pack5","nameZh":"羱羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/羱羊.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0048.png","iconMissing":false,"hintZhRaw":"R=\nCD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintZhClean":"CD 敌人 受伤 或 被 推动 时 > 使 其 .70% 全 生命 。 每 场 战斗 对 一 个 敌人 生效 。\n) CB 敌人 受伤 或 被 推动 时 > 使 其 70% 二 生命 。 每 场 战斗 对 两 个 不 同 敌人 生效 。\nfm 各 ip ea EE Ono, QO Om cl HO Ame tae","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#c28fd1","sourceSheet":"5海星兽群","sourceRow":71},{"id":"pack5_pet_0049","kind":"pack5_pet_0049","packKey":"pack5","nameZh":"鲸头鹳","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鲸头鹳.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0049.png","iconMissing":false,"hintZhRaw":"BRK #\nOQ) 回合 开始 时 => 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。\nfy 辣 们 这 hpARA ebm Ut Be ROB 8k a 10 OY te te t9.819 6 全 全","hintZhClean":"BRK\nOQ) 回合 开始 时 > 将 前 方 最 近 的 草 楚 特性 痊 换 为 +4 O 攻击 和 +4 O tH,\n) OAM > 将 前 方 最 近 的 草 东 特 性 谷 换 为 +8 O 攻击 和 +8 O 生命 。","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#9fd18f","sourceSheet":"5海星兽群","sourceRow":72},{"id":"pack5_pet_0050","kind":"pack5_pet_0050","packKey":"pack5","nameZh":"鹈鹕","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/动物/鹈鹕1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0050.png","iconMissing":false,"hintZhRaw":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL2 战斗开始时 -> 吞噬前方两个草莓伙伴，并在晕厥时将其变成鲑鱼。\nL3 战斗开始时 -> 吞噬前方三个草莓伙伴，并在晕厥时将其变成鲑鱼。","hintZhClean":"鹈鹕\n页 1/2\nL1 战斗开始时 -> 吞噬前方一个草莓伙伴,并在晕厥时将其变成鲑鱼。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"5海星兽群","sourceRow":73},{"id":"pack5_pet_0051","kind":"pack5_pet_0051","packKey":"pack5","nameZh":"剑齿虎","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/剑齿虎1.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0051.png","iconMissing":false,"hintZhRaw":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL2 晕厥时 -> 召唤两个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。\nL3 晕厥时 -> 召唤三个猛犸，且此宠物每受伤一次，使其获得+2 攻击和+3 生命。","hintZhClean":"剑齿虎\n页 1/2\nL1 晕厥时 -> 召唤一个猛犸,且此宠物每受伤一次,使其获得+2 攻击和+3 生命。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"5海星兽群","sourceRow":78},{"id":"pack5_pet_0052","kind":"pack5_pet_0052","packKey":"pack5","nameZh":"棘背龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/棘背龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0052.png","iconMissing":false,"hintZhRaw":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 @ 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 @ 攻击 和 *6 Ot.\nNY? aoe eR eb CRA an on oe ac BM wt. @ +s","hintZhClean":"PREV\nCD ke SRE D> 使 一 个 随机 伙伴 获得 +*2 攻击 和 +3 Ot.\n) CB ee BRE D> 使 一 个 随机 伙伴 获得 +4 攻击 和 *6 Ot.","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"5海星兽群","sourceRow":80},{"id":"pack5_pet_0053","kind":"pack5_pet_0053","packKey":"pack5","nameZh":"真迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/真迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0053.png","iconMissing":false,"hintZhRaw":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。\nNY? one ee teen ab CBA MM SOHO ARS a","hintZhClean":"FAA He\nCD 伙伴 失去 特性 时 DP 返还 其 特性 。 每 回合 对 一 个 伙伴 生效 。\n) CB 伙伴 失去 特性 时 SD 返还 其 特性 。 每 回合 对 两 个 不 同伙 伴生 效 。","hintEn":"","attack":6,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"5海星兽群","sourceRow":81},{"id":"pack5_pet_0054","kind":"pack5_pet_0054","packKey":"pack5","nameZh":"羊驼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/羊驼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0054.png","iconMissing":false,"hintZhRaw":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 => 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintZhClean":"D 伙伴 被 召唤 时 > 使 其 获得 +1 SB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 1 次 。\n小 伙伴 被 召唤 时 > 使 其 获得 +1 WB 经 验 值 。 战 斗 中 效果 变 为 三 倍 。 每 回合 生效 2 次 。\nNY a oe ae Tam et ee CHEE.) OB ie 让 :ra 图 六 一 立 MSH AI","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"5海星兽群","sourceRow":82},{"id":"pack5_pet_0055","kind":"pack5_pet_0055","packKey":"pack5","nameZh":"菊石","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/菊石2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0055.png","iconMissing":false,"hintZhRaw":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n1) ws ab HK AK SBS Le EEA","hintZhClean":"拟态 章鱼 页 2/2\nOD 攻击 后 > 对 一 个 生命 最 低 的 敌人 造成 4 点 伤害 O.\n) B 攻击 后 > 对 两 个 生命 最 低 的 敌人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"5海星兽群","sourceRow":84},{"id":"pack5_pet_0056","kind":"pack5_pet_0056","packKey":"pack5","nameZh":"虎鲸","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/虎鲸.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0056.png","iconMissing":false,"hintZhRaw":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。\n1) eee ob (OR MH RMO ACI COO Bw is","hintZhClean":"aR\nOD SRY > 从 任意 兽 群 召唤 一 个 6/6 的 随机 量 顾 时 宠物 。\n) CB SRY > 从 任意 兽 群 召唤 两 个 6/6 的 随机 旱 顾 时 宠物 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"5海星兽群","sourceRow":85},{"id":"pack5_pet_0057","kind":"pack5_pet_0057","packKey":"pack5","nameZh":"迅猛龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/迅猛龙.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0057.png","iconMissing":false,"hintZhRaw":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 ， 使 所 有 伙伴 获得 +2 @xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 ， 使 所 有 伙伴 获得 +4 @ 攻击 和 *6 O tm.\nNf 4 2¢ ty SRS at (2 3 At te Oh tS te Bmw et 43 BR Se Os O% BSB a The 2 3020 r) ye >","hintZhClean":"whe WY\nD 伙伴 攻击 时 * 偷 走 前 方 的 友 方 草莓 特性 , 使 所 有 伙伴 获得 +2 xtN+3 O 生命 。\n) 鸣 伙伴 攻击 时 > 偷 走 前 方 的 友 方 草 藉 特性 , 使 所 有 伙伴 获得 +4 攻击 和 *6 O tm.","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"5海星兽群","sourceRow":86},{"id":"pack5_pet_0058","kind":"pack5_pet_0058","packKey":"pack5","nameZh":"食人鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/食人鱼.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0058.png","iconMissing":false,"hintZhRaw":"RAS\nOQ 受伤 时 = 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.\nNS xt ae wa CEB Trio Bo Mbt","hintZhClean":"RAS\nOQ 受伤 时 使 所 有 伙伴 获得 +3 O 攻击 。\n) 拘 受伤 时 加 使 所 有 伙伴 获得 +6 O KH.","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19f","sourceSheet":"5海星兽群","sourceRow":87},{"id":"pack5_pet_0059","kind":"pack5_pet_0059","packKey":"pack5","nameZh":"驯鹿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/驯鹿2.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0059.png","iconMissing":true,"hintZhRaw":"屏蔽 20 点 伤害 和 ， 生 效 一 次 。","hintZhClean":"屏蔽 20 点 伤害 和 , 生 效 一 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fbf","sourceSheet":"5海星兽群","sourceRow":89},{"id":"pack5_pet_0060","kind":"pack5_pet_0060","packKey":"pack5","nameZh":"鸵鸟","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/动物/鸵鸟.png","iconAliasRel":"assets/icons_en/pack5/pets/pack5_pet_0060.png","iconMissing":false,"hintZhRaw":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 @ 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 ， 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。\nNS plas wa SETTAAN SEE SEM EPR ORI SE eee ORE roe eRe OE) MOH BA","hintZhClean":"eS\nOD) 别 新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +2 生命 。 每 回合 生效 4 次 。\n) 3 刷新 时 > 若 有 4 个 商店 宠物 等 阶 相同 , 则 刷新 宠物 并 使 所 有 伙伴 获得 +4 Oth. 每 回合 生效 4 次 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa5d1","sourceSheet":"5海星兽群","sourceRow":90},{"id":"pack6_pet_0001","kind":"pack6_pet_0001","packKey":"pack6","nameZh":"壁虎","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/壁虎.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0001.png","iconMissing":false,"hintZhRaw":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 ， 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 ， 获得 +4 @ 生命 。\nNM) rs: mwaoe eb Om Sic me 共有 Mts","hintZhClean":"BR\nCD 战斗 开始 时 + 如 果 有 玩具 , 获 得 +2 全 生命 。\ny 8 战斗 开始 时 > 如 果 有 玩具 , 获得 +4 生命 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c28f","sourceSheet":"6幼犬兽群","sourceRow":2},{"id":"pack6_pet_0002","kind":"beaver","packKey":"pack6","nameZh":"河狸","nameEn":"Beaver","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/河狸.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0002.png","iconMissing":false,"hintZhRaw":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 @ 攻击 。\n) 鸣 出 售 时 => 使 两 个 随机 伙伴 获得 +2 @ wah.\nE> us oe et em CHAE A HEN OL Ok ee. > Hawt","hintZhClean":"79) 42\nCD 出 售 时 > 使 两 个 随机 伙伴 获得 +1 攻击 。\n) 鸣 出 售 时 > 使 两 个 随机 伙伴 获得 +2 wah.","hintEn":"","attack":2,"health":2,"abilityKey":"sell_buff_attack","implStatus":"implemented","color":"#ab7d61","sourceSheet":"6幼犬兽群","sourceRow":3},{"id":"pack6_pet_0003","kind":"pack6_pet_0003","packKey":"pack6","nameZh":"瓢虫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/瓢虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0003.png","iconMissing":false,"hintZhRaw":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击， 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 ， 持 续 一 回合 。\nfy rest PL a ee 让 Ie Tb 二 于 -站 人 心","hintZhClean":"于 虫\nOQ 友 方 获得 特性 时 > 获得 +2 O 攻击, 持续 一 回合 。\n) CO 友 方 获得 特性 时 > 获得 +4 加 攻击 , 持 续 一 回合 。","hintEn":"","attack":1,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1c48f","sourceSheet":"6幼犬兽群","sourceRow":4},{"id":"pack6_pet_0004","kind":"pack6_pet_0004","packKey":"pack6","nameZh":"甲鱼","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/甲鱼2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0004.png","iconMissing":false,"hintZhRaw":"胡桃 A 2\n屏蔽 2 点 伤害 侠 ， 生 效 一 次 。","hintZhClean":"胡桃 A 2\n屏蔽 2 点 伤害 侠 , 生 效 一 次 。","hintEn":"","attack":3,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":6},{"id":"pack6_pet_0005","kind":"pack6_pet_0005","packKey":"pack6","nameZh":"花栗鼠","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/花栗鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0005.png","iconMissing":false,"hintZhRaw":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\nEY us ee et ea GIO I A ht 人 全","hintZhClean":"16 SR\nCD 出 售 时 > 转 积 一 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。\n) CB 出 售 时 <> 围 积 两 个 此 宠物 的 食物 特性 对 应 的 免费 食物 。","hintEn":"","attack":1,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":7},{"id":"pack6_pet_0006","kind":"pack6_pet_0006","packKey":"pack6","nameZh":"蓝鸲","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蓝鸲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0006.png","iconMissing":false,"hintZhRaw":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 @ 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 @ wa.\nNM) =o ot at ee O_o ow 8? A ws","hintZhClean":"is 15\nOD DSR > 使 一 个 随机 伙伴 获得 +1 攻击 。\n) 哆 回合 结束 时 > 使 一 个 随机 伙伴 获得 +2 wa.","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa2d1","sourceSheet":"6幼犬兽群","sourceRow":8},{"id":"pack6_pet_0007","kind":"pack6_pet_0007","packKey":"pack6","nameZh":"蛾","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/蛾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0007.png","iconMissing":false,"hintZhRaw":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 @ 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 @ 攻击 。\nME) pec) Tan ea CBS te eet ec A ws","hintZhClean":"oF\nCD 战斗 开始 时 加 使 最 前 排 的 友 方 宠 物 获得 +2 攻击 。\n) 哆 战斗 开始 时 > 使 最 前 排 的 友 方 宠物 获得 +4 攻击 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bf8f","sourceSheet":"6幼犬兽群","sourceRow":9},{"id":"pack6_pet_0008","kind":"pack6_pet_0008","packKey":"pack6","nameZh":"雪貂","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/雪貂1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0008.png","iconMissing":false,"hintZhRaw":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。\nL2 回合开始时 -> 选择一个2级的雪貂玩具。\nL3 回合开始时 -> 选择一个3级的雪貂玩具。","hintZhClean":"雪貂\n页 1/3\nL1 回合开始时 -> 选择一个1级的雪貂玩具。","hintEn":"","attack":2,"health":2,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":10},{"id":"pack6_pet_0009","kind":"pack6_pet_0009","packKey":"pack6","nameZh":"鸭子","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/鸭子.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0009.png","iconMissing":false,"hintZhRaw":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim => 使 商店 中 的 宠物 获得 +2 O 生命\nTE) us oe et em CREE heh eee. @ +s","hintZhClean":"AG 子\nOD nme > 使 商店 中 的 宠物 获得 +1 O tH.\n) Bim > 使 商店 中 的 宠物 获得 +2 O 生命","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":13},{"id":"pack6_pet_0010","kind":"pack6_pet_0010","packKey":"pack6","nameZh":"龙猫","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/动物/龙猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0010.png","iconMissing":false,"hintZhRaw":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 => 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。\nEY us om et em 22H _ AC ICON 2ER Dee wh He at","hintZhClean":"龙 狂\nCD 出 售 时 > 召 隐 一 个 2/2 的 1 级 忠诚 的 龙 猫 。\n) 哆 出 售 时 > 召唤 一 个 4/4 的 2 级 忠诚 的 龙 猫 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1a08f","sourceSheet":"6幼犬兽群","sourceRow":14},{"id":"pack6_pet_0011","kind":"pack6_pet_0011","packKey":"pack6","nameZh":"兔耳袋狸","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/兔耳袋狸2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0011.png","iconMissing":true,"hintZhRaw":"受到 的 伤害 O 减少 2 点 。","hintZhClean":"受到 的 伤害 O 减少 2 点 。","hintEn":"","attack":2,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc1d1","sourceSheet":"6幼犬兽群","sourceRow":18},{"id":"pack6_pet_0012","kind":"pack6_pet_0012","packKey":"pack6","nameZh":"单峰驼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/单峰驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0012.png","iconMissing":false,"hintZhRaw":"& le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 @ 攻击 和 +1 O tm.\n) BOSH © 使 商店 最 左 侧 的 两 个 宠物 获得 +2 @ 攻击 和 *+*2 @O tH.\nNM marron ob CHEE Bt wm BA went. @ wtin.2 @ +s","hintZhClean":"le 9E\nOD DSU > 使 商店 最 左 侧 的 两 个 宠物 获得 +1 攻击 和 +1 O tm.\n) BOSH 使 商店 最 左 侧 的 两 个 宠物 获得 +2 攻击 和 *+*2 O tH.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19e8f","sourceSheet":"6幼犬兽群","sourceRow":19},{"id":"pack6_pet_0013","kind":"pack6_pet_0013","packKey":"pack6","nameZh":"山魈","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/山魈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0013.png","iconMissing":false,"hintZhRaw":"LL) #5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。\nfi 和 总 区 ab ECM BY COE EIS RIX","hintZhClean":"LL) 5\nCD SRY > 使 2 阶 及 以 下 的 友 方 玩具 损坏 。\n) CB SRY > 使 4 阶 及 以 下 的 友 方 玩具 损坏 。","hintEn":"","attack":3,"health":3,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc3d1","sourceSheet":"6幼犬兽群","sourceRow":20},{"id":"pack6_pet_0014","kind":"pack6_pet_0014","packKey":"pack6","nameZh":"欧洲鳇","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/欧洲鳇2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0014.png","iconMissing":true,"hintZhRaw":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintZhClean":"米饭 DY 2/2\n出 售 时 获得 +2 O 金币 。","hintEn":"","attack":2,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":22},{"id":"pack6_pet_0015","kind":"pack6_pet_0015","packKey":"pack6","nameZh":"狐猴","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/狐猴4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0015.png","iconMissing":false,"hintZhRaw":"SBE SE 页 4/4\nCD 战斗 开始 时 —> 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。\nMEY pec) raed ea CRBS IK Ao) oe Bite tee","hintZhClean":"SBE SE 页 4/4\nCD 战斗 开始 时 > 使 最 前 排 的 伙伴 获得 校 树 特性 。\nCB 战斗 开始 时 D> 使 最 前 排 的 两 个 伙伴 获得 校 树 特性 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":26},{"id":"pack6_pet_0016","kind":"pack6_pet_0016","packKey":"pack6","nameZh":"知更鸟","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/知更鸟3.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0016.png","iconMissing":true,"hintZhRaw":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 ， 生 效 一 次 。","hintZhClean":"Th 2/:\n鸡蛋 Ri 3/:\n攻击 前 > 对 目标 造成 2 点 伤害 加 , 生 效 一 次 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19a8f","sourceSheet":"6幼犬兽群","sourceRow":29},{"id":"pack6_pet_0017","kind":"pack6_pet_0017","packKey":"pack6","nameZh":"虎斑猫","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虎斑猫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0017.png","iconMissing":false,"hintZhRaw":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 ， 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 ， 持 续 一 回合 .\nME) + ee sett ob Ch A ENOL oe 2 te tems","hintZhClean":"FRB\nCD 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +1 全 生命 , 持 续 一 回合 .\n) 鸣 友 方 获得 特性 时 > 使 两 个 随机 伙伴 获得 +2 二 生命 , 持 续 一 回合 .","hintEn":"","attack":2,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc7d1","sourceSheet":"6幼犬兽群","sourceRow":30},{"id":"pack6_pet_0018","kind":"pack6_pet_0018","packKey":"pack6","nameZh":"虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0018.png","iconMissing":false,"hintZhRaw":"oF\nCD 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ，\n) CB 伙伴 被 出 售 时 => 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。\nfi 人 41, oe a Us om Ae am (5h pain ol Oe 2h. 2? @ +s 48 fr) & A&E Bb >","hintZhClean":"oF\nCD 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +1 全 生命 。 每 回合 生效 3 次 ,\n) CB 伙伴 被 出 售 时 > 使 一 个 随机 伙伴 获得 +*2 全 生命 。 每 回合 生效 3 次 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":31},{"id":"pack6_pet_0019","kind":"pack6_pet_0019","packKey":"pack6","nameZh":"蝙蝠","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/蝙蝠2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0019.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":33},{"id":"pack6_pet_0020","kind":"pack6_pet_0020","packKey":"pack6","nameZh":"金鱼","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/动物/金鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0020.png","iconMissing":false,"hintZhRaw":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 = 出 售 价格 加 2 O em.\nfy 全 TITTphpA ee Wt Metin f) 总 不","hintZhClean":"金鱼\nOQ) 回合 开始 时 吵 出 售 价格 加 1 Om.\n) 拘 回合 开始 时 出 售 价格 加 2 O em.","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b5","sourceSheet":"6幼犬兽群","sourceRow":34},{"id":"pack6_pet_0021","kind":"pack6_pet_0021","packKey":"pack6","nameZh":"巨嘴鸟","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/巨嘴鸟.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0021.png","iconMissing":false,"hintZhRaw":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。\nNf St > th = oS ab WOR ee) KAO ete = 6f( PTE CUM ENS BORA KAMA CK OI ee","hintZhClean":"BwS\nCD 首次 攻击 前 > 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 后 方 伙伴 。\n) CB 首次 攻击 前 DP 将 5 阶 或 以 下 的 特性 (或 鸡蛋 ) 复制 至 最 近 的 两 个 后 方 伙 伴 。","hintEn":"","attack":3,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa9","sourceSheet":"6幼犬兽群","sourceRow":38},{"id":"pack6_pet_0022","kind":"pack6_pet_0022","packKey":"pack6","nameZh":"戴胜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/戴胜.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0022.png","iconMissing":false,"hintZhRaw":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintZhClean":"CD sey > 对 最 前 排 和 最 后 排 的 敌人 造成 2 点 伤害 O.\n) CB SRY > 对 最 前 排 和 最 后 排 的 敌人 造成 4 点 伤害 O.\nTE aw eit a 3 Bites Leech DD","hintEn":"","attack":3,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b3","sourceSheet":"6幼犬兽群","sourceRow":39},{"id":"pack6_pet_0023","kind":"pack6_pet_0023","packKey":"pack6","nameZh":"热带鱼","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/热带鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0023.png","iconMissing":false,"hintZhRaw":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 @ tH.\n) CO 回合 开始 时 => 使 相 邻 伙伴 获得 +2 O tH.\nfy fal & bet ed $6184 Oe 25782 +","hintZhClean":"热带 鱼\nCQ) 回合 开始 时 嘱 使 相 邻 伙伴 获得 +1 tH.\n) CO 回合 开始 时 > 使 相 邻 伙伴 获得 +2 O tH.","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fac","sourceSheet":"6幼犬兽群","sourceRow":40},{"id":"pack6_pet_0024","kind":"pack6_pet_0024","packKey":"pack6","nameZh":"猫头鹰","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/猫头鹰1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0024.png","iconMissing":false,"hintZhRaw":"猫 头 应 页 1/:\nDO 回合 开始 时 © 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。\nNM marron ad TOURS el","hintZhClean":"猫 头 应 页 1/:\nDO 回合 开始 时 召唤 一 只 1 级 的 家 鼠 。\n) CB 回合 开始 时 > 召唤 一 只 2 级 的 家 鼠 。","hintEn":"","attack":4,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1b1","sourceSheet":"6幼犬兽群","sourceRow":41},{"id":"pack6_pet_0025","kind":"pack6_pet_0025","packKey":"pack6","nameZh":"破壳鸡","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/破壳鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0025.png","iconMissing":false,"hintZhRaw":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 @xtH-3 O 生命 ， 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 @ 攻击 和 +2 @ 生命 。\nNM) =o ot ee ee 人 二 是:Fona Eo oe er.) 2 ,zhe 人 让","hintZhClean":"oR XS\nD DASE D> 使 最 近 的 前 方 伙 伴 获得 +3 xtH-3 O 生命 , 持 续 一 回合 。\n) 鸣 回合 结束 时 D> 使 最 近 的 前 方 伙伴 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fae","sourceSheet":"6幼犬兽群","sourceRow":43},{"id":"pack6_pet_0026","kind":"pack6_pet_0026","packKey":"pack6","nameZh":"穿山甲","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/穿山甲.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0026.png","iconMissing":false,"hintZhRaw":"Fw\nCD SRY > 如 果 有 玩具 ， 使 最 近 的 后 方 伙 伴 获 得 +*4 @ 生命 。\n小 RAKY PD 如 果 有 玩具 ， 使 最 近 的 后 方 伙伴 获得 +8 @ tm,\n1) eee eb ESI mM CRB RM Kom.) @ +s","hintZhClean":"Fw\nCD SRY > 如 果 有 玩具 , 使 最 近 的 后 方 伙 伴 获 得 +*4 生命 。\n小 RAKY PD 如 果 有 玩具 , 使 最 近 的 后 方 伙伴 获得 +8 tm,","hintEn":"","attack":5,"health":4,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1af","sourceSheet":"6幼犬兽群","sourceRow":44},{"id":"pack6_pet_0027","kind":"pack6_pet_0027","packKey":"pack6","nameZh":"紫蛙","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/紫蛙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0027.png","iconMissing":false,"hintZhRaw":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 => 激活 并 禁用 其 回合 开始 时 能 力 ， 直 到 下 一 回合 。 每 回合 生效 2 次 。\nND) aoe ae Tmt ek MOTH MMEMeA They OIRO Om SH Ab 2","hintZhClean":"紧 蛙\nCD 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 1 次 。\n) 鸣 伙伴 被 召唤 时 > 激活 并 禁用 其 回合 开始 时 能 力 , 直 到 下 一 回合 。 每 回合 生效 2 次 。","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fb0","sourceSheet":"6幼犬兽群","sourceRow":45},{"id":"pack6_pet_0028","kind":"pack6_pet_0028","packKey":"pack6","nameZh":"野兔","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/野兔.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0028.png","iconMissing":false,"hintZhRaw":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 => 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。\nEY ver ee 和香 s 入 了 in 入 在 用 人 全 sn 性 IER Cl te aby","hintZhClean":"FR\nCD 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生效 1 次 。\n) CB 攻击 前 > 复制 一 个 随机 敌人 的 一 个 有 用 的 食物 特性 。 每 场 战 斗 生 效 2 次 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd1be","sourceSheet":"6幼犬兽群","sourceRow":46},{"id":"pack6_pet_0029","kind":"pack6_pet_0029","packKey":"pack6","nameZh":"长吻鳄","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/长吻鳄2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0029.png","iconMissing":false,"hintZhRaw":"ae 页 2/4\nCD 损坏 时 => 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 => 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。\nNY 人 水 pr ea CRO NH AGL OK CEI ote","hintZhClean":"ae 页 2/4\nCD 损坏 时 > 使 最 前 排 的 一 个 伙伴 获得 西风 特性 。\nCB 损坏 时 > 使 最 前 排 的 两 个 伙伴 获得 西风 特性 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fa0","sourceSheet":"6幼犬兽群","sourceRow":48},{"id":"pack6_pet_0030","kind":"pack6_pet_0030","packKey":"pack6","nameZh":"鼹鼠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/动物/鼹鼠.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0030.png","iconMissing":false,"hintZhRaw":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 ， 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM_O1E/1 om ORD","hintZhClean":"CD Srey > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 6/6 的 中 刀 。\n) CB SRY > 移 除 最 近 的 两 个 友 方 特性 , 召 唤 一 只 12/12 的 跟 鼠 。\n1) ow crt ah IPS BCR OAR HEM NM O1E/1 om ORD","hintEn":"","attack":3,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fcb","sourceSheet":"6幼犬兽群","sourceRow":51},{"id":"pack6_pet_0031","kind":"pack6_pet_0031","packKey":"pack6","nameZh":"变色龙","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/变色龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0031.png","iconMissing":false,"hintZhRaw":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 ， 最 高 为 1 级， 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 ， 最 高 为 2 级 ， 持 续 一 回合 。\nNM aace sn ea SHIEK Ssh BeHUR 这/ 素 _ 站 属","hintZhClean":"TAK\nD 回合 结束 时 哆 复制 友 方 玩具 能 力 , 最 高 为 1 级, 持续 一 回合 。\n小 回合 结束 时 加 复制 友 方 玩具 能 力 , 最 高 为 2 级 , 持 续 一 回合 。","hintEn":"","attack":6,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd194","sourceSheet":"6幼犬兽群","sourceRow":55},{"id":"pack6_pet_0032","kind":"pack6_pet_0032","packKey":"pack6","nameZh":"塔尔羊","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/塔尔羊2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0032.png","iconMissing":false,"hintZhRaw":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintZhClean":", 内 2/2\n攻击 对 第 二 排 敌 人 造成 4 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc8","sourceSheet":"6幼犬兽群","sourceRow":57},{"id":"pack6_pet_0033","kind":"pack6_pet_0033","packKey":"pack6","nameZh":"幼犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/幼犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0033.png","iconMissing":false,"hintZhRaw":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。\nNM marron ab :友人 Donnnch wee","hintZhClean":"幼 大 页 1/4\nCD 回合 开始 时 > 选择 一 个 1 级 的 幼 犬 玩具 。\n) 哆 回合 开始 时 串 选择 一 个 2 级 的 幼 犬 玩具 。","hintEn":"","attack":5,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd196","sourceSheet":"6幼犬兽群","sourceRow":58},{"id":"pack6_pet_0034","kind":"pack6_pet_0034","packKey":"pack6","nameZh":"微生物","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/微生物2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0034.png","iconMissing":false,"hintZhRaw":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintZhClean":"由 2/2\nie 55\n受到 的 伤害 O +3.","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc6","sourceSheet":"6幼犬兽群","sourceRow":63},{"id":"pack6_pet_0035","kind":"pack6_pet_0035","packKey":"pack6","nameZh":"杜宾犬","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/杜宾犬1.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0035.png","iconMissing":false,"hintZhRaw":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 => 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 村 子 特性 。\n) C3 战斗 开始 时 = 获得 +16 O 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 ， 还 会 获得 醒 子 特性 。\nfy Fe cl TT AR em 13578204 TR 人 二 MP ER TOE RRO TIMOR TATED tte","hintZhClean":"Fe ee -\n杜 宾 大 内 1/2\nC) 战斗 开始 时 > 获得 +8 名 攻击 。 如 果 所 有 伙伴 都 只 有 更 高 等 阶 , 还 会 获得 村 子 特性 。","hintEn":"","attack":4,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd199","sourceSheet":"6幼犬兽群","sourceRow":64},{"id":"pack6_pet_0036","kind":"pack6_pet_0036","packKey":"pack6","nameZh":"毛毛虫","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/毛毛虫.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0036.png","iconMissing":false,"hintZhRaw":"毛毛 虫\nOO) 回合 开始 时 =» 获得 +1 & 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。\nfy tec] WARS eb TF HMA 1 OH OUD 二 + 8 ants 3 O watts 1 ah & wr","hintZhClean":"毛毛 虫\nOO) 回合 开始 时 获得 +1 经 验 值 。\n) MB 回合 开始 时 中 获得 +1 8 经 验 值 。","hintEn":"","attack":4,"health":5,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d18fc4","sourceSheet":"6幼犬兽群","sourceRow":66},{"id":"pack6_pet_0037","kind":"pack6_pet_0037","packKey":"pack6","nameZh":"水牛","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/水牛.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0037.png","iconMissing":false,"hintZhRaw":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 @ 攻击 和 +2 全 生命 ， 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 @ 攻击 和 +4 @ 生命 ， 持 续 一 回合 .\nNY op oe am em et ae E08 ac Mwtiw.c @ te 1244 _ ms","hintZhClean":"水 牛\nDO 伙伴 被 出 售 时 > 获得 +2 攻击 和 +2 全 生命 , 持 续 一 回合 。\nyD 伙 伴 被 出 售 时 中 获得 +4 攻击 和 +4 生命 , 持 续 一 回合 .","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd19b","sourceSheet":"6幼犬兽群","sourceRow":67},{"id":"pack6_pet_0038","kind":"pack6_pet_0038","packKey":"pack6","nameZh":"美洲驼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/美洲驼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0038.png","iconMissing":false,"hintZhRaw":"NIE\nOQ 回合 结束 时 @ 如 果 有 空位 ， 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 ， 获 得 +2 轩 攻击 和 +4 O tH,\nfy inl &@ ¢2 DBRS a ff | Ty Sods Fe T1 Pell @ ee ee oe","hintZhClean":"NIE\nOQ 回合 结束 时 如 果 有 空位 , 获 得 +1 O KEHHO 生命 。\n) 拘 回合 结束 时 路 如 果 有 空位 , 获 得 +2 轩 攻击 和 +4 O tH,","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#cf8fd1","sourceSheet":"6幼犬兽群","sourceRow":68},{"id":"pack6_pet_0039","kind":"pack6_pet_0039","packKey":"pack6","nameZh":"鲸鲨","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/鲸鲨.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0039.png","iconMissing":false,"hintZhRaw":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +1 O 攻击 和 +1 @@ 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 ， 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH=E,\nfy Poel Lie ie Oe ee ee E22 AC et Pee Tb 十 了 ID 小 和 Cee a eet","hintZhClean":"89 fm\nCH) 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +1 O 攻击 和 +1 生命 。 战 斗 中 效果 变 为 三 倍 。\n) C3 获得 特性 或 不 适 状态 时 > 将 其 移 除 , 并 获得 +2 O 攻击 和 +2 加 ER. RUPRMREH E,","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#92d18f","sourceSheet":"6幼犬兽群","sourceRow":69},{"id":"pack6_pet_0040","kind":"pack6_pet_0040","packKey":"pack6","nameZh":"龙虾","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/动物/龙虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0040.png","iconMissing":false,"hintZhRaw":"龙 是\nCD 伙伴 被 召唤 时 =D 如 果 在 战斗 外 ， 使 其 获得 +1 @ 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 ， 使 其 获得 +2 @ 攻击 和 +4 个 生命 .\nNY? aoe ae mt em Nw tecl oh Ooh he? MW wstw.ic @t+=s","hintZhClean":"龙 是\nCD 伙伴 被 召唤 时 D 如 果 在 战斗 外 , 使 其 获得 +1 攻击 和 +2 O tH.\n小 伙伴 被 召唤 时 加 如 果 在 战斗 外 , 使 其 获得 +2 攻击 和 +4 个 生命 .","hintEn":"","attack":4,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fadd1","sourceSheet":"6幼犬兽群","sourceRow":70},{"id":"pack6_pet_0041","kind":"pack6_pet_0041","packKey":"pack6","nameZh":"兰花螳螂","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/兰花螳螂.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0041.png","iconMissing":false,"hintZhRaw":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 ， 使 其 获得 此 宠物 40% 的 @ 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 ， 使 其 获得 此 宠物 80% 的 @ 攻击 和 OD 生命 .\n小 -\nks、 Tbk ee FIM —_ Asem CHET TRIB Swen 市 十 态 @ +=","hintZhClean":"兰 化 星 螂\nCD 战斗 开始 时 > 召唤 一 个 蝗 螂 , 使 其 获得 此 宠物 40% 的 攻击 和 Ota.\nHILAR > 召唤 一 个 铂 螂 , 使 其 获得 此 宠物 80% 的 攻击 和 OD 生命 .","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b48f","sourceSheet":"6幼犬兽群","sourceRow":74},{"id":"pack6_pet_0042","kind":"pack6_pet_0042","packKey":"pack6","nameZh":"山羊","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/山羊.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0042.png","iconMissing":false,"hintZhRaw":"虽 购买 伙伴 时 + 获得 +1 @@ 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintZhClean":"虽 购买 伙伴 时 + 获得 +1 金币 。 每 回合 生效 2 次 。\n小 购买 伙伴 时 加 获得 +2 人 SH. 每 回合 生效 2 次 。\nNW) sree ab 2IB.2 OO Om MSH Oh","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8faad1","sourceSheet":"6幼犬兽群","sourceRow":75},{"id":"pack6_pet_0043","kind":"pack6_pet_0043","packKey":"pack6","nameZh":"沧龙","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/沧龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0043.png","iconMissing":false,"hintZhRaw":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 @ 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,\nfy — EH mee om CRIA eek TA te tino OO +s","hintZhClean":"BH\nOQ) 友 方 玩具 损坏 时 加 使 相 邻 伙伴 获得 +2 O 攻击 和 +3 生命 。\n) CORBA > 使 相 邻 伙伴 获得 +4 O 攻击 和 +6 O tH,","hintEn":"","attack":5,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b78f","sourceSheet":"6幼犬兽群","sourceRow":76},{"id":"pack6_pet_0044","kind":"pack6_pet_0044","packKey":"pack6","nameZh":"石头鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/石头鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0044.png","iconMissing":false,"hintZhRaw":"石头 鱼\nOQ) ket © 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。\nfy SRR? wd HEE a M1 9B KI AT mice SX","hintZhClean":"石头 鱼\nOQ) ket 对 击 倒 此 宠物 的 单位 返还 等 同 于 攻击 的 伤害 O.\n) age > 对 击 倒 此 宠物 的 单位 返还 二 倍 于 攻击 的 伤 宫 加 。","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa8d1","sourceSheet":"6幼犬兽群","sourceRow":77},{"id":"pack6_pet_0045","kind":"pack6_pet_0045","packKey":"pack6","nameZh":"美洲豹","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美洲豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0045.png","iconMissing":false,"hintZhRaw":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。\nEY ut acy mm ee att OER Cl cho 2s ee eee","hintZhClean":"FINS\nOD 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 两 倍 。\n) CB 此 单位 具有 的 特性 在 战斗 中 强度 为 原 有 的 三 倍 。","hintEn":"","attack":7,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1b98f","sourceSheet":"6幼犬兽群","sourceRow":78},{"id":"pack6_pet_0046","kind":"pack6_pet_0046","packKey":"pack6","nameZh":"美西螈","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/美西螈.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0046.png","iconMissing":false,"hintZhRaw":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 @wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 @ 攻击 和 +2 二 生命。 每 回合 生效 3 次 。\nND) + + eps este ne ab HEAD 2372.2 @ wtin.2? @ += 455 f=) & Abt Bb Qi","hintZhClean":"Fe Fa\nCD 友 方 获得 特性 时 DS 使 其 永久 获得 +1 wxswe1 Ots,. 每 回合 生效 3 次 。\n) BEARS > 使 其 永久 获得 +2 攻击 和 +2 二 生命。 每 回合 生效 3 次 。","hintEn":"","attack":5,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa6d1","sourceSheet":"6幼犬兽群","sourceRow":79},{"id":"pack6_pet_0047","kind":"pack6_pet_0047","packKey":"pack6","nameZh":"魟鱼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/魟鱼4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0047.png","iconMissing":false,"hintZhRaw":"B\n照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。\nfy tec) TT AR ad HHISETtOWMO— Aw tL tno MA ws","hintZhClean":"照相 机 页 4/4\nCO) BAA > 使 攻击 最 高 的 一 个 敌人 -30% O 攻击 。\nC3 战斗 开始 时 > 使 攻击 最 高 的 两 个 政 人 -30% O 攻击 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bb8f","sourceSheet":"6幼犬兽群","sourceRow":83},{"id":"pack6_pet_0048","kind":"pack6_pet_0048","packKey":"pack6","nameZh":"鳄龟","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鳄龟2.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0048.png","iconMissing":false,"hintZhRaw":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintZhClean":"onl 一\n肉 串 YL 2/2\n攻击 对 第 二 排 和 第 三 排 的 敌人 造成 3 点 伤害 O.","hintEn":"","attack":7,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fa4d1","sourceSheet":"6幼犬兽群","sourceRow":85},{"id":"pack6_pet_0049","kind":"pack6_pet_0049","packKey":"pack6","nameZh":"鸡","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鸡.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0049.png","iconMissing":false,"hintZhRaw":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 @ 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 @ 攻击 和 +2 @@ 生命 。\nNM) aaron ob CEE DOSE oe eee. A wti.? @ +s","hintZhClean":"x8\nCD 回合 开始 时 > 使 商店 将 来 的 所 有 宠物 获得 +1 攻击 和 +1 O 生命 。\n) 鸣 回合 开始 时 串 使 商店 将 来 的 所 有 宠物 获得 +2 攻击 和 +2 生命 。","hintEn":"","attack":5,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1bd8f","sourceSheet":"6幼犬兽群","sourceRow":86},{"id":"pack6_pet_0050","kind":"pack6_pet_0050","packKey":"pack6","nameZh":"鹰","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/动物/鹰.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0050.png","iconMissing":false,"hintZhRaw":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY => 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 _RA EE _A 1/1 EBD 26","hintZhClean":"OD SRY > 从 下 一 阶 商店 召唤 一 个 5/5 的 1 级 宠物 。\n) CB SRY > 从 下 一 阶 商店 召唤 一 个 10/10 的 2 级 宠物 。\nTE ew et mh ii 下 RA EE A 1/1 EBD 26","hintEn":"","attack":6,"health":6,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1938f","sourceSheet":"6幼犬兽群","sourceRow":87},{"id":"pack6_pet_0051","kind":"pack6_pet_0051","packKey":"pack6","nameZh":"梁龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/梁龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0051.png","iconMissing":false,"hintZhRaw":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C 〇 ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 〇 金币 。 每 回合 生效 3 次 。\nfy 和 下 ot Kh) 8.2 (人 os 455 (Al) & 4 GA 2° Ar","hintZhClean":"梁 龙\nQO 友 方 获得 特性 时 + 下 回合 获得 +1 C ) 金币 。 每 回合 生效 3 次 。\n拘 友 方 获得 特性 时 > 下 回合 获得 +2 人 金币 。 每 回合 生效 3 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fced1","sourceSheet":"6幼犬兽群","sourceRow":91},{"id":"pack6_pet_0052","kind":"pack6_pet_0052","packKey":"pack6","nameZh":"灯笼鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/灯笼鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0052.png","iconMissing":false,"hintZhRaw":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 。\n) 03 购买 时 => 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 ， 并 将 其 围 积 两 次 。\nfy BH YT? Rh ab 【| dr 上 -人 了 Shik IR LAH FEE 了 TR FR] 30 a","hintZhClean":"kT B\nCD) 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 。\n) 03 购买 时 > 从 你 上 一 个 对 手中 选择 一 个 免费 宠物 , 并 将 其 围 积 两 次 。","hintEn":"","attack":8,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1918f","sourceSheet":"6幼犬兽群","sourceRow":92},{"id":"pack6_pet_0053","kind":"pack6_pet_0053","packKey":"pack6","nameZh":"狮子鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/狮子鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0053.png","iconMissing":false,"hintZhRaw":"Wh &\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH—R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 ， 便 额外 触发 一 次 。\n1 exert od 2 _ Ahan Leto skie we ON mM BINS Me Oh et ev","hintZhClean":"Wh\nCD Smet > 对 一 个 随机 敌人 造成 3 点 伤害 O. SHLOAKA, GMIMH R.\n) CB Sey > 对 一 个 随机 敌人 造成 6 点 伤害 侠 。 每 有 10 点 攻击 , 便 额外 触发 一 次 。","hintEn":"","attack":7,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fd0d1","sourceSheet":"6幼犬兽群","sourceRow":93},{"id":"pack6_pet_0054","kind":"pack6_pet_0054","packKey":"pack6","nameZh":"猫鼬","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/猫鼬4.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0054.png","iconMissing":false,"hintZhRaw":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。\nMEY pes) rp ea Chet BM KH Ao oe eis","hintZhClean":"RAH 页 4/4\nCD 战斗 开始 时 > 使 攻击 最 高 的 一 个 伙伴 获得 椰子 特性 。\n鸣 战斗 开始 时 加 使 攻击 最 高 的 两 个 伙伴 获得 椰子 特性 。","hintEn":"","attack":8,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1988f","sourceSheet":"6幼犬兽群","sourceRow":97},{"id":"pack6_pet_0055","kind":"pack6_pet_0055","packKey":"pack6","nameZh":"皮皮虾","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/皮皮虾.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0055.png","iconMissing":false,"hintZhRaw":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ，\nMY peel wae ab HB ees LCE PIN ee we eh Ele","hintZhClean":"皮 皮 是\nCD 战斗 开始 时 > 对 最 前 排 的 敌人 造成 10 点 伤害 O.\n) BHAA > 对 最 前 排 的 敌人 造成 10 点 伤害 OO, 触发 2 次 ,","hintEn":"","attack":7,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc9d1","sourceSheet":"6幼犬兽群","sourceRow":98},{"id":"pack6_pet_0056","kind":"pack6_pet_0056","packKey":"pack6","nameZh":"章鱼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/章鱼.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0056.png","iconMissing":false,"hintZhRaw":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.\n1) wes ab HK Amine Loe ec HEE eA","hintZhClean":"章鱼\nOD 攻击 后 > 对 一 个 随机 敌人 造成 6 点 伤害 O.\n) B 攻击 后 > 对 两 个 随机 敌人 造成 6 点 伤害 O.","hintEn":"","attack":6,"health":7,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d1958f","sourceSheet":"6幼犬兽群","sourceRow":99},{"id":"pack6_pet_0057","kind":"pack6_pet_0057","packKey":"pack6","nameZh":"美洲狮","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/美洲狮.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0057.png","iconMissing":false,"hintZhRaw":"Fe iN\n@ 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 ， 如 同 其 为 2 级 玩具 。\nNM) ++i me wee eee Oe HOUR","hintZhClean":"Fe iN\n友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 1 级 玩具 。\n小 友 方 玩具 重复 触发 其 能 力 , 如 同 其 为 2 级 玩具 。","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fccd1","sourceSheet":"6幼犬兽群","sourceRow":100},{"id":"pack6_pet_0058","kind":"pack6_pet_0058","packKey":"pack6","nameZh":"象海豹","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/象海豹.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0058.png","iconMissing":false,"hintZhRaw":"Ris\nOD 获得 特性 © 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 ， 持 续 一 回合 。 每 回合 生效 1 次 。\nNf PKB Aste ot OO 4) OV TRIB 1D a Ty 二 xz 1 @ += 4% (eh [| a 45 fr) & 4b Bb 1 AP","hintZhClean":"Ris\nOD 获得 特性 使 三 个 伙伴 获得 +4 OS 攻击 和 +4 Ota, se-Os. 每 回合 生效 1 次 。\n) CB 获得 特性 > 使 三 个 伙伴 获得 +8 便 攻击 和 +8 二 生命 , 持 续 一 回合 。 每 回合 生效 1 次 。","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#d19c8f","sourceSheet":"6幼犬兽群","sourceRow":101},{"id":"pack6_pet_0059","kind":"pack6_pet_0059","packKey":"pack6","nameZh":"霸王龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/霸王龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0059.png","iconMissing":false,"hintZhRaw":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 @ 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 @ 攻击 和 +4 Ota.\nNM) marron abd EACH SE bee oe aie MBM wt. @+=s","hintZhClean":"霸王 万\nCD 回合 开始 时 加 使 两 个 5 阶 或 以 上 的 伙伴 获得 +2 攻击 和 +2 Ota.\n) 鸣 回合 开始 时 D> 使 两 个 5 阶 或 以 上 的 伙伴 获得 +4 攻击 和 +4 Ota.","hintEn":"","attack":8,"health":9,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#8fc5d1","sourceSheet":"6幼犬兽群","sourceRow":102},{"id":"pack6_pet_0060","kind":"pack6_pet_0060","packKey":"pack6","nameZh":"龙","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/动物/龙.png","iconAliasRel":"assets/icons_en/pack6/pets/pack6_pet_0060.png","iconMissing":false,"hintZhRaw":"龙\nCD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28? BM wtin.? @ +s 45 [二 | & 4& BHA Ye","hintZhClean":"CD 购买 1 阶 伙伴 时 > 使 伙伴 获得 +1 便 攻击 和 +1 全 生命 。 每 回合 生效 4 次 。\n) CB 购买 1 阶 伙伴 时 > 使 伙伴 获得 +2 伟 攻击 和 +2 仁 生命 。 每 回合 生效 4 次 。\nNY wy Rh a Oe Rt ea ORO) OK 28 BM wtin. +s 45 [二 4 BHA Ye","hintEn":"","attack":6,"health":8,"abilityKey":"placeholder_none","implStatus":"placeholder","color":"#ba8fd1","sourceSheet":"6幼犬兽群","sourceRow":103}],"foods":[{"id":"pack1_food_0001","kind":"apple","packKey":"pack1","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"1乌龟兽群","sourceRow":13},{"id":"pack1_food_0002","kind":"honey","packKey":"pack1","nameZh":"蜂蜜","nameEn":"Honey","tier":1,"roundUnlock":1,"iconSrcRel":"1乌龟兽群/1级商店 回合1/食物/蜂蜜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0002.png","iconMissing":false,"hintZhRaw":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT @ Zi —O]/|/ME£s.","hintZhClean":"ee\n使 一 个 宠物 获得 蜂 密 特性 。\nBRAT Zi O]/ /ME s.","hintEn":"","effectKey":"summon_bee","implStatus":"implemented","placeholderBuff":1,"color":"#e0aa35","sourceSheet":"1乌龟兽群","sourceRow":14},{"id":"pack1_food_0003","kind":"pack1_food_0003","packKey":"pack1","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9adac9","sourceSheet":"1乌龟兽群","sourceRow":26},{"id":"pack1_food_0004","kind":"cupcake","packKey":"pack1","nameZh":"纸杯蛋糕","nameEn":"Cupcake","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/纸杯蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0004.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 ， 持 续 一 回合 。","hintZhClean":"使 一 个 宠物 获得 +3 OC 攻击 和 +3 O 生命 , 持 续 一 回合 。","hintEn":"","effectKey":"temp_3_3","implStatus":"implemented","placeholderBuff":1,"color":"#f29ec0","sourceSheet":"1乌龟兽群","sourceRow":27},{"id":"pack1_food_0005","kind":"meat","packKey":"pack1","nameZh":"肉骨头","nameEn":"Meat","tier":2,"roundUnlock":3,"iconSrcRel":"1乌龟兽群/2级商店 回合3/食物/肉骨头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0005.png","iconMissing":false,"hintZhRaw":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintZhClean":"肉 骨 头\n使 一 个 宠物 获得 肉 骨头 特性 。\nIRIGE CY 42.","hintEn":"","effectKey":"perk_meat","implStatus":"implemented","placeholderBuff":1,"color":"#d66a4f","sourceSheet":"1乌龟兽群","sourceRow":28},{"id":"pack1_food_0006","kind":"garlic","packKey":"pack1","nameZh":"大蒜","nameEn":"Garlic","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/大蒜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0006.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintZhClean":"使 一 个 宠物 获得 大 蒜 特性 。\n01197205","hintEn":"","effectKey":"perk_garlic","implStatus":"implemented","placeholderBuff":2,"color":"#b9b3a6","sourceSheet":"1乌龟兽群","sourceRow":40},{"id":"pack1_food_0007","kind":"salad","packKey":"pack1","nameZh":"碗装沙拉","nameEn":"Salad","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/碗装沙拉.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0007.png","iconMissing":false,"hintZhRaw":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"Bye 35 3D FZ\n使 两 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"team_random_buff_1_1","implStatus":"implemented","placeholderBuff":2,"color":"#62c26e","sourceSheet":"1乌龟兽群","sourceRow":41},{"id":"pack1_food_0008","kind":"pack1_food_0008","packKey":"pack1","nameZh":"蛋糕","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"1乌龟兽群/3级商店 回合5/食物/蛋糕.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0008.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintZhClean":"使 一 个 宠物 获得 蛋糕 特性 。\nGait Rt mm WHA EIT OSs.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9ab7","sourceSheet":"1乌龟兽群","sourceRow":42},{"id":"pack1_food_0009","kind":"canned_food","packKey":"pack1","nameZh":"食物罐头","nameEn":"Can","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/食物罐头.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0009.png","iconMissing":false,"hintZhRaw":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"shop_buff_2_1","implStatus":"implemented","placeholderBuff":2,"color":"#8ea7bb","sourceSheet":"1乌龟兽群","sourceRow":55},{"id":"pack1_food_0010","kind":"pear","packKey":"pack1","nameZh":"鸭梨","nameEn":"Pear","tier":4,"roundUnlock":7,"iconSrcRel":"1乌龟兽群/4级商店 回合7/食物/鸭梨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0010.png","iconMissing":false,"hintZhRaw":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"stat_2_2","implStatus":"implemented","placeholderBuff":2,"color":"#8dc95f","sourceSheet":"1乌龟兽群","sourceRow":56},{"id":"pack1_food_0011","kind":"pack1_food_0011","packKey":"pack1","nameZh":"寿司","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/寿司.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0011.png","iconMissing":false,"hintZhRaw":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"寿司\n使 三 个 随机 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ace","sourceSheet":"1乌龟兽群","sourceRow":69},{"id":"pack1_food_0012","kind":"chocolate","packKey":"pack1","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"1乌龟兽群","sourceRow":70},{"id":"pack1_food_0013","kind":"pack1_food_0013","packKey":"pack1","nameZh":"辣椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"1乌龟兽群/5级商店 回合9/食物/辣椒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintZhClean":"使 一 个 宠物 获得 辣椒 特性 。\nTot IAB HHH ASE RPS SEEO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9ad0","sourceSheet":"1乌龟兽群","sourceRow":71},{"id":"pack1_food_0014","kind":"pack1_food_0014","packKey":"pack1","nameZh":"披萨","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/披萨.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0014.png","iconMissing":false,"hintZhRaw":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"披萨\n使 两 个 随机 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaab","sourceSheet":"1乌龟兽群","sourceRow":83},{"id":"pack1_food_0015","kind":"pack1_food_0015","packKey":"pack1","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0015.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aca","sourceSheet":"1乌龟兽群","sourceRow":84},{"id":"pack1_food_0016","kind":"pack1_food_0016","packKey":"pack1","nameZh":"蘑菇","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/蘑菇.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0016.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintZhClean":"使 一 个 宠物 获得 蘑菇 特性 。\nBRET 本 本 为 1/[/]) 匡 中 大声","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaa9","sourceSheet":"1乌龟兽群","sourceRow":85},{"id":"pack1_food_0017","kind":"pack1_food_0017","packKey":"pack1","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"1乌龟兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack1/foods/pack1_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9acc","sourceSheet":"1乌龟兽群","sourceRow":86},{"id":"pack2_food_0001","kind":"pack2_food_0001","packKey":"pack2","nameZh":"大麦克香蕉","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/大麦克香蕉.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0001.png","iconMissing":false,"hintZhRaw":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta @ FH —Oseaey .","hintZhClean":"KS\n使 一 个 宠物 获得 大 麦克 香蕉 特性 。\nkta FH Oseaey .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab5da","sourceSheet":"2濒危兽群","sourceRow":14},{"id":"pack2_food_0002","kind":"pack2_food_0002","packKey":"pack2","nameZh":"淡水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"2濒危兽群/1级商店 回合1/食物/淡水.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0002.png","iconMissing":false,"hintZhRaw":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintZhClean":"淡水\n使 一 个 宠物 的 最 低 属 性 +2。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dabe9a","sourceSheet":"2濒危兽群","sourceRow":15},{"id":"pack2_food_0003","kind":"pack2_food_0003","packKey":"pack2","nameZh":"南极磷虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/南极磷虾.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0003.png","iconMissing":false,"hintZhRaw":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 ， 并 花费 1 金币 围 积 。","hintZhClean":"南极 磷 是\n从 当前 等 阶 任 选 一 种 特性 食物 , 并 花费 1 金币 围 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab7da","sourceSheet":"2濒危兽群","sourceRow":29},{"id":"pack2_food_0004","kind":"pack2_food_0004","packKey":"pack2","nameZh":"苏达斯番茄","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/苏达斯番茄.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0004.png","iconMissing":false,"hintZhRaw":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK #2278841 OCF tH.","hintZhClean":"Pid Hh B hin\n使 一 个 宠物 获得 苏 达 斯 番茄 特性 。\nBet ab SMAAK 2278841 OCF tH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac59a","sourceSheet":"2濒危兽群","sourceRow":30},{"id":"pack2_food_0005","kind":"pack2_food_0005","packKey":"pack2","nameZh":"鳕鱼籽","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"2濒危兽群/2级商店 回合3/食物/鳕鱼籽.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0005.png","iconMissing":false,"hintZhRaw":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintZhClean":"鳃 鱼 籽\n使 一 个 宠物 获得 鳄鱼 籽 特性 。\nBaF eo BHAI.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab1da","sourceSheet":"2濒危兽群","sourceRow":31},{"id":"pack2_food_0006","kind":"pack2_food_0006","packKey":"pack2","nameZh":"吉奇红豌豆","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/吉奇红豌豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0006.png","iconMissing":false,"hintZhRaw":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintZhClean":"ADAMS\n使 一 个 宠物 获得 +3 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac39a","sourceSheet":"2濒危兽群","sourceRow":44},{"id":"pack2_food_0007","kind":"pack2_food_0007","packKey":"pack2","nameZh":"巴黎胡萝卜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/巴黎胡萝卜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0007.png","iconMissing":false,"hintZhRaw":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintZhClean":"巴黎 胡萝卜\n使 一 个 宠物 获得 +3 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab3da","sourceSheet":"2濒危兽群","sourceRow":45},{"id":"pack2_food_0008","kind":"pack2_food_0008","packKey":"pack2","nameZh":"白松露","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"2濒危兽群/3级商店 回合5/食物/白松露.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0008.png","iconMissing":false,"hintZhRaw":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击，并对攻击力最高的敌人发动跳跃攻击，生效一次。","hintZhClean":"白松露\n使一个宠物获得白松露特性。\n伙伴晕厥时 -> 获得+4 攻击,并对攻击力最高的敌人发动跳跃攻击,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":46},{"id":"pack2_food_0009","kind":"pack2_food_0009","packKey":"pack2","nameZh":"枫糖","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/枫糖.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0009.png","iconMissing":false,"hintZhRaw":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%，且受到的伤害-50%，生效三次。","hintZhClean":"枫糖\n使一个宠物获得枫糖特性。\n攻击造成的伤害-50%,且受到的伤害-50%,生效三次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":59},{"id":"pack2_food_0010","kind":"pack2_food_0010","packKey":"pack2","nameZh":"香荚兰豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/香荚兰豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0010.png","iconMissing":false,"hintZhRaw":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"香 英 兰 豆\n使 商店 最 左 侧 的 两 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aafda","sourceSheet":"2濒危兽群","sourceRow":60},{"id":"pack2_food_0011","kind":"pack2_food_0011","packKey":"pack2","nameZh":"鹰嘴豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"2濒危兽群/4级商店 回合7/食物/鹰嘴豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0011.png","iconMissing":false,"hintZhRaw":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 ， 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintZhClean":"Ya D\n把 一 个 宠物 变 为 同 阶 的 另 一 个 宠物 , 并 且 使 另 两 个 宠物 获得 +1 加 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac79a","sourceSheet":"2濒危兽群","sourceRow":61},{"id":"pack2_food_0012","kind":"pack2_food_0012","packKey":"pack2","nameZh":"可可豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/可可豆.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0012.png","iconMissing":false,"hintZhRaw":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制，生效一次。","hintZhClean":"可可豆\n使一个宠物获得可可豆特性。\n攻击前 -> 变为一个随机敌人的一模一样的复制,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aacda","sourceSheet":"2濒危兽群","sourceRow":75},{"id":"pack2_food_0013","kind":"pack2_food_0013","packKey":"pack2","nameZh":"奥布洛诺特甜瓜","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/奥布洛诺特甜瓜.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0013.png","iconMissing":false,"hintZhRaw":"BR Fi 78 15 $5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintZhClean":"BR Fi 78 15 5 AH\n使 一 个 宠物 的 最 低 属性 +5。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dac99a","sourceSheet":"2濒危兽群","sourceRow":76},{"id":"pack2_food_0014","kind":"chocolate","packKey":"pack2","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"2濒危兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0014.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"2濒危兽群","sourceRow":77},{"id":"pack2_food_0015","kind":"pack2_food_0015","packKey":"pack2","nameZh":"撒丁岛醋栗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/撒丁岛醋栗.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0015.png","iconMissing":false,"hintZhRaw":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintZhClean":"Ww] Baas\n使 一 个 宠物 获得 撒 丁 岛 醋 票 特性 。\nla > FOS BS 本 水 和 77 O PF.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacb9a","sourceSheet":"2濒危兽群","sourceRow":88},{"id":"pack2_food_0016","kind":"pack2_food_0016","packKey":"pack2","nameZh":"犹太海枣","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/犹太海枣3.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0016.png","iconMissing":false,"hintZhRaw":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20， 生 效 一 次 。","hintZhClean":"Th 2/-\n牛 扒 页 3/:\n攻击 伤害 O +20, 生 效 一 次 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa8da","sourceSheet":"2濒危兽群","sourceRow":91},{"id":"pack2_food_0017","kind":"pack2_food_0017","packKey":"pack2","nameZh":"白秋葵","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"2濒危兽群/6级商店 回合11/食物/白秋葵.png","iconAliasRel":"assets/icons_en/pack2/foods/pack2_food_0017.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH#E (4N BF) PRIZFRXK (4NH—7) .","hintZhClean":"使 一 个 宠物 获得 白 秋 英 特性 。\nBMeBINSGBGH E (4N BF) PRIZFRXK (4NH 7) .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacd9a","sourceSheet":"2濒危兽群","sourceRow":92},{"id":"pack3_food_0001","kind":"pack3_food_0001","packKey":"pack3","nameZh":"南瓜","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/南瓜.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 ， 在 偶数 回合 获得 +2 O 生命 。","hintZhClean":"使 一 个 宠物 在 奇数 回合 获得 +2 全 攻击 , 在 偶数 回合 获得 +2 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c0da9a","sourceSheet":"3独角兽兽群","sourceRow":17},{"id":"pack3_food_0002","kind":"pack3_food_0002","packKey":"pack3","nameZh":"魔力药水","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"3独角兽兽群/1级商店 回合1/食物/魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0002.png","iconMissing":false,"hintZhRaw":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintZhClean":"魔力 约 水\n使 一 个 宠物 获得 +3 O RH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b19ada","sourceSheet":"3独角兽兽群","sourceRow":18},{"id":"pack3_food_0003","kind":"pack3_food_0003","packKey":"pack3","nameZh":"仙尘","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/仙尘.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0003.png","iconMissing":false,"hintZhRaw":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen\nny\n—v","hintZhClean":"仙 全\n使 一 个 宠物 获得 仙 全 特性\nattty eo a PRA 472+7 Owen","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#c3da9a","sourceSheet":"3独角兽兽群","sourceRow":30},{"id":"pack3_food_0004","kind":"pack3_food_0004","packKey":"pack3","nameZh":"壁中鸡","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/壁中鸡.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0004.png","iconMissing":false,"hintZhRaw":"壁 中 鸡\n使 一 个 宠物 获得 +3 @ 攻击 和 虚弱 ®.","hintZhClean":"壁 中 鸡\n使 一 个 宠物 获得 +3 攻击 和 虚弱 .","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#b79ada","sourceSheet":"3独角兽兽群","sourceRow":31},{"id":"pack3_food_0005","kind":"pack3_food_0005","packKey":"pack3","nameZh":"晕厥面包","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"3独角兽兽群/2级商店 回合3/食物/晕厥面包.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0005.png","iconMissing":false,"hintZhRaw":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintZhClean":"晕厥面包\n使一个宠物获得晕厥面包特性。\n晕厥时 -> 召唤任意一个1阶的晕厥宠物。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#bcda9a","sourceSheet":"3独角兽兽群","sourceRow":32},{"id":"pack3_food_0006","kind":"pack3_food_0006","packKey":"pack3","nameZh":"姜饼人","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/姜饼人.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0006.png","iconMissing":false,"hintZhRaw":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintZhClean":"委 饼 人\n使 一 个 宠物 获得 姜 饼 人 特性 。\nLP sl oF ad T2784) BW 2B.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b59ada","sourceSheet":"3独角兽兽群","sourceRow":49},{"id":"pack3_food_0007","kind":"pack3_food_0007","packKey":"pack3","nameZh":"美味粥","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/美味粥.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0007.png","iconMissing":false,"hintZhRaw":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintZhClean":"FE DK 55\n使 一 个 宠物 的 最 低 属性 +3。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#beda9a","sourceSheet":"3独角兽兽群","sourceRow":50},{"id":"pack3_food_0008","kind":"pack3_food_0008","packKey":"pack3","nameZh":"青春之水","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"3独角兽兽群/3级商店 回合5/食物/青春之水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0008.png","iconMissing":false,"hintZhRaw":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintZhClean":"青春 之 水\n把 一 个 宠物 变 为 同 阶 的 另 一 个 带 有 任意 3 阶 特性 的 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#bb9ada","sourceSheet":"3独角兽兽群","sourceRow":51},{"id":"pack3_food_0009","kind":"pack3_food_0009","packKey":"pack3","nameZh":"变大蛋糕","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/变大蛋糕.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0009.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 +3 O 攻击 ， 并 将 2 久 生命 转化 为 攻击 。","hintZhClean":"使 一 个 宠物 获得 +3 O 攻击 , 并 将 2 久 生命 转化 为 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#b8da9a","sourceSheet":"3独角兽兽群","sourceRow":63},{"id":"pack3_food_0010","kind":"pack3_food_0010","packKey":"pack3","nameZh":"珍馐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/珍馐.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0010.png","iconMissing":false,"hintZhRaw":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H —7.","hintZhClean":"12 Va\n使 一 个 宠物 获得 珍 馈 特性 。\nBERIERKASSEEO +H 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dad39a","sourceSheet":"3独角兽兽群","sourceRow":64},{"id":"pack3_food_0011","kind":"pack3_food_0011","packKey":"pack3","nameZh":"缩小水","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"3独角兽兽群/4级商店 回合7/食物/缩小水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0011.png","iconMissing":false,"hintZhRaw":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 ， 并 将 2 加 攻击 转化 为 生命 。","hintZhClean":"缩小 水\n使 一 个 宠物 获得 +3 O 生命 , 并 将 2 加 攻击 转化 为 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa2da","sourceSheet":"3独角兽兽群","sourceRow":65},{"id":"pack3_food_0012","kind":"pack3_food_0012","packKey":"pack3","nameZh":"大瓶魔力药水","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/大瓶魔力药水.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0012.png","iconMissing":false,"hintZhRaw":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintZhClean":"A HRT 24 7k\n使 一 个 宠物 获得 +6 O BH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad69a","sourceSheet":"3独角兽兽群","sourceRow":81},{"id":"pack3_food_0013","kind":"chocolate","packKey":"pack3","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0013.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"3独角兽兽群","sourceRow":82},{"id":"pack3_food_0014","kind":"pack3_food_0014","packKey":"pack3","nameZh":"魔豆","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"3独角兽兽群/5级商店 回合9/食物/魔豆.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0014.png","iconMissing":false,"hintZhRaw":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。\nla > FOS BS 本 IEP BIS. HPHHEKRB+1ZO SF.","hintZhClean":"魔 豆\n页 1/。\n使 一 个 宠物 获得 魔 豆 特性 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacf9a","sourceSheet":"3独角兽兽群","sourceRow":83},{"id":"pack3_food_0015","kind":"pack3_food_0015","packKey":"pack3","nameZh":"丰饶角","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/丰饶角.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0015.png","iconMissing":false,"hintZhRaw":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 ， 可 从 所 有 兽 群 中 选择 。","hintZhClean":"丰饶 角\n围 积 一 个 免费 6 阶 食 物 , 可 从 所 有 兽 群 中 选择 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa6da","sourceSheet":"3独角兽兽群","sourceRow":95},{"id":"pack3_food_0016","kind":"pack3_food_0016","packKey":"pack3","nameZh":"星星糖","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/星星糖.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0016.png","iconMissing":false,"hintZhRaw":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintZhClean":"星星 糖\n把 一 个 宠物 变 为 高 一 阶 的 另 一 个 宠物 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad19a","sourceSheet":"3独角兽兽群","sourceRow":96},{"id":"pack3_food_0017","kind":"pack3_food_0017","packKey":"pack3","nameZh":"长生桃","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"3独角兽兽群/6级商店 回合11/食物/长生桃.png","iconAliasRel":"assets/icons_en/pack3/foods/pack3_food_0017.png","iconMissing":false,"hintZhRaw":"KK Hk\n使 一 个 宠物 获得 +2 @ 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintZhClean":"KK Hk\n使 一 个 宠物 获得 +2 攻击 和 +2 O 生命 。 未 来 升级 桃子 可 额外 获得 +1 攻 击 和 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa4da","sourceSheet":"3独角兽兽群","sourceRow":97},{"id":"pack4_food_0001","kind":"apple","packKey":"pack4","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"4金毛兽群","sourceRow":12},{"id":"pack4_food_0002","kind":"pack4_food_0002","packKey":"pack4","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"4金毛兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ada9a","sourceSheet":"4金毛兽群","sourceRow":13},{"id":"pack4_food_0003","kind":"pack4_food_0003","packKey":"pack4","nameZh":"巧克力蛋糕","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/巧克力蛋糕.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0003.png","iconMissing":false,"hintZhRaw":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta @ 21/217 BERGHE.","hintZhClean":"IORHASE\n使 一 个 宠物 获得 巧克力 蛋糕 特性 。\nLeta 21/217 BERGHE.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d99ada","sourceSheet":"4金毛兽群","sourceRow":25},{"id":"pack4_food_0004","kind":"pack4_food_0004","packKey":"pack4","nameZh":"樱桃","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/樱桃.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0004.png","iconMissing":false,"hintZhRaw":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM |","hintZhClean":"樱桃\n使 一 个 宠物 获得 樱桃 特性 。\nAp、 at ad 129% DP BDI PEFISSSISIM","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#a1da9a","sourceSheet":"4金毛兽群","sourceRow":26},{"id":"pack4_food_0005","kind":"pack4_food_0005","packKey":"pack4","nameZh":"白菜","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"4金毛兽群/2级商店 回合3/食物/白菜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0005.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintZhClean":"使 一 个 宠物 获得 白菜 特性 。\n7c BRA PIE +2 国生 全 人 妨 一 加","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#d29ada","sourceSheet":"4金毛兽群","sourceRow":27},{"id":"pack4_food_0006","kind":"pack4_food_0006","packKey":"pack4","nameZh":"无花果","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/无花果.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0006.png","iconMissing":false,"hintZhRaw":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintZhClean":"无 化 果\n使 一 个 宠物 获得 无 化 果 特性 。\nTe tet ab TIDE EB IGOOM A SERIE LY. 大 入 一 和","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9fda9a","sourceSheet":"4金毛兽群","sourceRow":40},{"id":"pack4_food_0007","kind":"pack4_food_0007","packKey":"pack4","nameZh":"莴苣","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/莴苣.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0007.png","iconMissing":false,"hintZhRaw":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 @ 〇 攻击 和 +1 O 生命。","hintZhClean":"ae\n使 三 个 当前 商店 阶 数 或 更 高 等 级 的 宠物 获得 +1 攻击 和 +1 O 生命。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#d59ada","sourceSheet":"4金毛兽群","sourceRow":41},{"id":"pack4_food_0008","kind":"pack4_food_0008","packKey":"pack4","nameZh":"鳄梨","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"4金毛兽群/3级商店 回合5/食物/鳄梨.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0008.png","iconMissing":false,"hintZhRaw":"ED\n下 一 回合 获得 +3 O 金币 。","hintZhClean":"ED\n下 一 回合 获得 +3 O 金币 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#a5da9a","sourceSheet":"4金毛兽群","sourceRow":42},{"id":"pack4_food_0009","kind":"pack4_food_0009","packKey":"pack4","nameZh":"华夫饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/华夫饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0009.png","iconMissing":false,"hintZhRaw":"华 夫 饼\n激活 宠物 的 “购买 时 ”能 力 ， 或 获得 +3 OY +H.","hintZhClean":"华 夫 饼\n激活 宠物 的 购买 时 能 力 , 或 获得 +3 OY +H.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#ce9ada","sourceSheet":"4金毛兽群","sourceRow":54},{"id":"pack4_food_0010","kind":"pack4_food_0010","packKey":"pack4","nameZh":"土豆","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/土豆.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0010.png","iconMissing":false,"hintZhRaw":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO\nEB BBA","hintZhClean":"土豆\n使 一 个 宠物 获得 土豆 特性 。\nBEINSREBNHSISHRMEEO","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#da9abd","sourceSheet":"4金毛兽群","sourceRow":55},{"id":"pack4_food_0011","kind":"pack4_food_0011","packKey":"pack4","nameZh":"香蕉","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"4金毛兽群/4级商店 回合7/食物/香蕉.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0011.png","iconMissing":false,"hintZhRaw":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT @ ZIG nhALIMIEL.","hintZhClean":"和 理 焦\n使 一 个 宠物 获得 香 茹 特性 。\nBEAT ZIG nhALIMIEL.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adab8","sourceSheet":"4金毛兽群","sourceRow":56},{"id":"pack4_food_0012","kind":"chocolate","packKey":"pack4","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"4金毛兽群","sourceRow":67},{"id":"pack4_food_0013","kind":"pack4_food_0013","packKey":"pack4","nameZh":"榴莲","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/榴莲.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0013.png","iconMissing":false,"hintZhRaw":"一 0 一 4 一\n榴\n连\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全\noy —, a","hintZhClean":"一 0 一 4 一\n使 一 个 宠物 获得 榴 连 特性 。\nLota od Ste BEMHA C1224 国生 全","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adab6","sourceSheet":"4金毛兽群","sourceRow":68},{"id":"pack4_food_0014","kind":"melon","packKey":"pack4","nameZh":"蜜瓜","nameEn":"Melon","tier":5,"roundUnlock":9,"iconSrcRel":"4金毛兽群/5级商店 回合9/食物/蜜瓜.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintZhClean":"使 一 个 宠物 获得 宫 瓜 特性 。\nFF","hintEn":"","effectKey":"perk_melon","implStatus":"implemented","placeholderBuff":3,"color":"#8fdc78","sourceSheet":"4金毛兽群","sourceRow":69},{"id":"pack4_food_0015","kind":"pack4_food_0015","packKey":"pack4","nameZh":"口袋饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/口袋饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0015.png","iconMissing":false,"hintZhRaw":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap £79415 +2 +H -—7.","hintZhClean":"口袋 饼\n使 一 个 宠物 获得 口袋 饼 特性 。\nBigot ap 79415 +2 +H - 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adabc","sourceSheet":"4金毛兽群","sourceRow":81},{"id":"pack4_food_0016","kind":"pack4_food_0016","packKey":"pack4","nameZh":"椒盐卷饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/椒盐卷饼.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0016.png","iconMissing":false,"hintZhRaw":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 @ HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 ， 此 效果 翻 倍 。","hintZhClean":"椒盐 卷 饼\n使 一 个 宠物 获得 +2 HMO 生命 。 如 果 所 有 的 宠物 都 为 4 阶 或 更 高 , 此 效果 翻 倍 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9abb","sourceSheet":"4金毛兽群","sourceRow":82},{"id":"pack4_food_0017","kind":"pack4_food_0017","packKey":"pack4","nameZh":"西红柿","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"4金毛兽群/6级商店 回合11/食物/西红柿.png","iconAliasRel":"assets/icons_en/pack4/foods/pack4_food_0017.png","iconMissing":false,"hintZhRaw":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta @ TRBEUMHASRPIISEEO. 4+H-—7.","hintZhClean":"西红柿\n使 一 个 宠物 获得 西红柿 特性 。\nLeta TRBEUMHASRPIISEEO. 4+H- 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adaba","sourceSheet":"4金毛兽群","sourceRow":83},{"id":"pack5_food_0001","kind":"pack5_food_0001","packKey":"pack5","nameZh":"草莓","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/草莓.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0001.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。\nBRR od (PREM MO WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac7da","sourceSheet":"5海星兽群","sourceRow":16},{"id":"pack5_food_0002","kind":"pack5_food_0002","packKey":"pack5","nameZh":"蜜桃","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"5海星兽群/1级商店 回合1/食物/蜜桃.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0002.png","iconMissing":false,"hintZhRaw":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintZhClean":"pk\n使 一 个 宠物 获得 +2 YO 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daaf9a","sourceSheet":"5海星兽群","sourceRow":17},{"id":"pack5_food_0003","kind":"pack5_food_0003","packKey":"pack5","nameZh":"炸虾","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/炸虾.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0003.png","iconMissing":false,"hintZhRaw":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintZhClean":"炸 是\n使 一 个 宠物 获得 +3 O KHH-1O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ac5da","sourceSheet":"5海星兽群","sourceRow":29},{"id":"pack5_food_0004","kind":"pack5_food_0004","packKey":"pack5","nameZh":"焦糖","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/焦糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0004.png","iconMissing":false,"hintZhRaw":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖；每有一个焦糖便对生命最高的敌人造成3点伤害，生效一次。","hintZhClean":"焦糖\n使一个宠物获得焦糖特性。\n攻击前 -> 组合友方焦糖 每有一个焦糖便对生命最高的敌人造成3点伤害,生效一次。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#daa89a","sourceSheet":"5海星兽群","sourceRow":30},{"id":"pack5_food_0005","kind":"pack5_food_0005","packKey":"pack5","nameZh":"西兰花","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"5海星兽群/2级商店 回合3/食物/西兰花.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0005.png","iconMissing":false,"hintZhRaw":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 @ 攻击 。","hintZhClean":"丁 兰 化\n使 一 个 宠物 获得 +3 O 生命 并 -1 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9acbda","sourceSheet":"5海星兽群","sourceRow":31},{"id":"pack5_food_0006","kind":"pack5_food_0006","packKey":"pack5","nameZh":"棒棒糖","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/棒棒糖.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0006.png","iconMissing":false,"hintZhRaw":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ，","hintZhClean":"棒 棒 糖\n使 一 个 宠物 的 攻击 与 生命 互 换 。 始 终 优惠 ,","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#daaa9a","sourceSheet":"5海星兽群","sourceRow":44},{"id":"pack5_food_0007","kind":"pack5_food_0007","packKey":"pack5","nameZh":"海草","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/海草2.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0007.png","iconMissing":false,"hintZhRaw":"小 海胆 页 2/7\n加 票据 时 => 使 盟 前 排 的 政 人 -4 @ 生命 。\n) ary = 使 前 两 个 政 人 .4 @ Em.\nNS} ment ob 人 一 人 天 AH","hintZhClean":"小 海胆 页 2/7\n加 票据 时 > 使 盟 前 排 的 政 人 -4 生命 。\n) ary 使 前 两 个 政 人 .4 Em.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ac9da","sourceSheet":"5海星兽群","sourceRow":46},{"id":"pack5_food_0008","kind":"pack5_food_0008","packKey":"pack5","nameZh":"火腿肠","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"5海星兽群/3级商店 回合5/食物/火腿肠.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0008.png","iconMissing":false,"hintZhRaw":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE — TT GB BP.","hintZhClean":"火腿 肠\n使 一 个 宠物 获得 火腿 肠 特性 。\nlal > FO BS 本 HIE TT GB BP.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dab59a","sourceSheet":"5海星兽群","sourceRow":47},{"id":"pack5_food_0009","kind":"pack5_food_0009","packKey":"pack5","nameZh":"法国面包","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/法国面包.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0009.png","iconMissing":false,"hintZhRaw":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintZhClean":"法 国 面 包\n使 一 个 宠物 获得 法 国 面 包 特性 。\neet ed FSSOEEALHEEY A OIE tb or","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9abeda","sourceSheet":"5海星兽群","sourceRow":61},{"id":"pack5_food_0010","kind":"pack5_food_0010","packKey":"pack5","nameZh":"芝士","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/芝士.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0010.png","iconMissing":false,"hintZhRaw":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals £2 —7.","hintZhClean":">t\n使 一 个 宠物 获得 艺 士 特性 。\nWt Qnepwals 2 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9adacd","sourceSheet":"5海星兽群","sourceRow":62},{"id":"pack5_food_0011","kind":"pear","packKey":"pack5","nameZh":"鸭梨","nameEn":"Pear","tier":4,"roundUnlock":7,"iconSrcRel":"5海星兽群/4级商店 回合7/食物/鸭梨.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0011.png","iconMissing":false,"hintZhRaw":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintZhClean":"AG 42\n使 一 个 宠物 获得 +2 O 攻击 和 +2 O 生命 。","hintEn":"","effectKey":"stat_2_2","implStatus":"implemented","placeholderBuff":2,"color":"#8dc95f","sourceSheet":"5海星兽群","sourceRow":63},{"id":"pack5_food_0012","kind":"chocolate","packKey":"pack5","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0012.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"5海星兽群","sourceRow":75},{"id":"pack5_food_0013","kind":"pack5_food_0013","packKey":"pack5","nameZh":"草莓酱","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/草莓酱.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0013.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ，\nBRR o> (FREY WEIS +) @ wtH+] 国生 会","hintZhClean":"使 一 个 宠物 获得 草莓 特性 。 始 终 优 惠 ,\nBRR o> (FREY WEIS +) wtH+] 国生 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaa","sourceSheet":"5海星兽群","sourceRow":76},{"id":"pack5_food_0014","kind":"pack5_food_0014","packKey":"pack5","nameZh":"青椒","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"5海星兽群/5级商店 回合9/食物/青椒.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0014.png","iconMissing":false,"hintZhRaw":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintZhClean":"青椒\n使一个宠物获得青椒特性。\n生命不会降低至1以下。受到伤害后移除此效果。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac9","sourceSheet":"5海星兽群","sourceRow":77},{"id":"pack5_food_0015","kind":"pack5_food_0015","packKey":"pack5","nameZh":"杨桃+","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/杨桃+.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0015.png","iconMissing":false,"hintZhRaw":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintZhClean":"杨桃\n从 任意 兽 群 选择 一 个 5.6 阶 特性 的 食物 免费 图 积 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aac","sourceSheet":"5海星兽群","sourceRow":91},{"id":"pack5_food_0016","kind":"pack5_food_0016","packKey":"pack5","nameZh":"热狗","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/热狗.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0016.png","iconMissing":false,"hintZhRaw":"热狗\n使 两 个 随机 宠物 获得 +4 @ 攻击 。","hintZhClean":"热狗\n使 两 个 随机 宠物 获得 +4 攻击 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9adac7","sourceSheet":"5海星兽群","sourceRow":92},{"id":"pack5_food_0017","kind":"pack5_food_0017","packKey":"pack5","nameZh":"芹菜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"5海星兽群/6级商店 回合11/食物/芹菜.png","iconAliasRel":"assets/icons_en/pack5/foods/pack5_food_0017.png","iconMissing":false,"hintZhRaw":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintZhClean":"Are\n使 一 个 宠物 获得 +6 OY 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#da9aaf","sourceSheet":"5海星兽群","sourceRow":93},{"id":"pack6_food_0001","kind":"apple","packKey":"pack6","nameZh":"苹果","nameEn":"Apple","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/食物/苹果.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0001.png","iconMissing":false,"hintZhRaw":"sz\n使 一 个 宠物 获得 +1 @KHH+1 O 生命 。","hintZhClean":"sz\n使 一 个 宠物 获得 +1 KHH+1 O 生命 。","hintEn":"","effectKey":"stat_1_1","implStatus":"implemented","placeholderBuff":1,"color":"#e55e57","sourceSheet":"6幼犬兽群","sourceRow":15},{"id":"pack6_food_0002","kind":"pack6_food_0002","packKey":"pack6","nameZh":"鸡蛋","nameEn":"","tier":1,"roundUnlock":1,"iconSrcRel":"6幼犬兽群/1级商店 回合1/食物/鸡蛋.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0002.png","iconMissing":false,"hintZhRaw":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY £ex—r.","hintZhClean":"XS\n使 一 个 宠物 获得 鸡蛋 特性 。\nTe tet ab TISAI SEE OY ex r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9aadda","sourceSheet":"6幼犬兽群","sourceRow":16},{"id":"pack6_food_0003","kind":"pack6_food_0003","packKey":"pack6","nameZh":"安眠药","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/安眠药.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0003.png","iconMissing":false,"hintZhRaw":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠 !","hintZhClean":"安眠 药\n使 一 个 宠物 晤 厥 。 始 终 优惠","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac69a","sourceSheet":"6幼犬兽群","sourceRow":35},{"id":"pack6_food_0004","kind":"pack6_food_0004","packKey":"pack6","nameZh":"米饭","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/米饭.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0004.png","iconMissing":false,"hintZhRaw":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintZhClean":"米饭\n使 一 个 宠物 获得 米饭 特性 。\nth tt 99 FEIE 49 OC) OH.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#9ab0da","sourceSheet":"6幼犬兽群","sourceRow":36},{"id":"pack6_food_0005","kind":"pack6_food_0005","packKey":"pack6","nameZh":"酸橙","nameEn":"","tier":2,"roundUnlock":3,"iconSrcRel":"6幼犬兽群/2级商店 回合3/食物/酸橙.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0005.png","iconMissing":false,"hintZhRaw":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintZhClean":"酸 橙\n使 一 个 宠物 获得 酸 权 特性 。\nBm ppee OY PDS.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":1,"color":"#dac49a","sourceSheet":"6幼犬兽群","sourceRow":37},{"id":"pack6_food_0006","kind":"pack6_food_0006","packKey":"pack6","nameZh":"可颂","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/可颂.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0006.png","iconMissing":false,"hintZhRaw":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintZhClean":"By AR\n使 一 个 宠物 获得 可 颂 特性 。\nltt BPP a 78+) a wt.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab2da","sourceSheet":"6幼犬兽群","sourceRow":52},{"id":"pack6_food_0007","kind":"pack6_food_0007","packKey":"pack6","nameZh":"节瓜","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/节瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0007.png","iconMissing":false,"hintZhRaw":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 | te tH — 7.","hintZhClean":"73 I\n使 一 个 宠物 获得 节 凤 特性 。\nRte bo PSH 6 te tH 7.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dac29a","sourceSheet":"6幼犬兽群","sourceRow":53},{"id":"pack6_food_0008","kind":"pack6_food_0008","packKey":"pack6","nameZh":"黑莓","nameEn":"","tier":3,"roundUnlock":5,"iconSrcRel":"6幼犬兽群/3级商店 回合5/食物/黑莓.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0008.png","iconMissing":false,"hintZhRaw":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) @ wtH17@ +2.","hintZhClean":"Pe\n使 一 个 宠物 获得 黑莓 特性 。\n3078+) wtH17 +2.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9ab4da","sourceSheet":"6幼犬兽群","sourceRow":54},{"id":"pack6_food_0009","kind":"pack6_food_0009","packKey":"pack6","nameZh":"盐","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/盐.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0009.png","iconMissing":false,"hintZhRaw":"盐\n使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintZhClean":"使 一 个 宠物 获得 盐 特性 。\nIFPI VIZGEO. 全 访 一 力","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#dabf9a","sourceSheet":"6幼犬兽群","sourceRow":71},{"id":"pack6_food_0010","kind":"canned_food","packKey":"pack6","nameZh":"食物罐头","nameEn":"Can","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/食物罐头.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0010.png","iconMissing":false,"hintZhRaw":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintZhClean":"BIDE\n使 商店 当前 和 将 来 的 所 有 宠物 获得 +1 O 攻击 和 +1 O 生命 。","hintEn":"","effectKey":"shop_buff_2_1","implStatus":"implemented","placeholderBuff":2,"color":"#8ea7bb","sourceSheet":"6幼犬兽群","sourceRow":72},{"id":"pack6_food_0011","kind":"pack6_food_0011","packKey":"pack6","nameZh":"馅饼","nameEn":"","tier":4,"roundUnlock":7,"iconSrcRel":"6幼犬兽群/4级商店 回合7/食物/馅饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0011.png","iconMissing":false,"hintZhRaw":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintZhClean":"馅 饼\n使 一 个 宠物 获得 馅 饼 特性 。\nAp hy bd 27946 OC) OHH47O FO.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":2,"color":"#9aa5da","sourceSheet":"6幼犬兽群","sourceRow":73},{"id":"pack6_food_0012","kind":"pack6_food_0012","packKey":"pack6","nameZh":"千层饼","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/千层饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0012.png","iconMissing":false,"hintZhRaw":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintZhClean":"千 层 饼\n使 一 个 宠物 获得 +2 O 攻击 和 +3 O 生命 。","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dad09a","sourceSheet":"6幼犬兽群","sourceRow":88},{"id":"pack6_food_0013","kind":"chocolate","packKey":"pack6","nameZh":"巧克力","nameEn":"Chocolate","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/巧克力.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0013.png","iconMissing":false,"hintZhRaw":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintZhClean":"I95 克 力\n使 一 个 宠物 获得 +1 B 经 验 值 。","hintEn":"","effectKey":"exp_1","implStatus":"implemented","placeholderBuff":3,"color":"#9f7a58","sourceSheet":"6幼犬兽群","sourceRow":89},{"id":"pack6_food_0014","kind":"pack6_food_0014","packKey":"pack6","nameZh":"柠檬","nameEn":"","tier":5,"roundUnlock":9,"iconSrcRel":"6幼犬兽群/5级商店 回合9/食物/柠檬.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0014.png","iconMissing":false,"hintZhRaw":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintZhClean":"使 一 个 宠物 获得 柠檬 特性 。\nBEBTISEEO FYB.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#daca9a","sourceSheet":"6幼犬兽群","sourceRow":90},{"id":"pack6_food_0015","kind":"pack6_food_0015","packKey":"pack6","nameZh":"煎饼","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/煎饼.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0015.png","iconMissing":false,"hintZhRaw":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS +? @ 大 入 77 国 和 会","hintZhClean":"Al TH\n使 一 个 宠物 获得 煎饼 特性 。\nLG SL Bt ad (ERE EIS + 大 入 77 国 和 会","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa9da","sourceSheet":"6幼犬兽群","sourceRow":104},{"id":"pack6_food_0016","kind":"pack6_food_0016","packKey":"pack6","nameZh":"牛扒","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/牛扒.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0016.png","iconMissing":false,"hintZhRaw":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. £2x—r.","hintZhClean":"牛 扒\n使 一 个 宠物 获得 牛 扒 特性 。\nIWHRIGE OY 420. 2x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#dacc9a","sourceSheet":"6幼犬兽群","sourceRow":105},{"id":"pack6_food_0017","kind":"pack6_food_0017","packKey":"pack6","nameZh":"西瓜","nameEn":"","tier":6,"roundUnlock":11,"iconSrcRel":"6幼犬兽群/6级商店 回合11/食物/西瓜.png","iconAliasRel":"assets/icons_en/pack6/foods/pack6_food_0017.png","iconMissing":false,"hintZhRaw":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. £x—r.","hintZhClean":"西瓜\n使 一 个 宠物 获得 西瓜 特性 。\nBRINSIRE LOY. x r.","hintEn":"","effectKey":"placeholder_stat_buff","implStatus":"placeholder","placeholderBuff":3,"color":"#9aa7da","sourceSheet":"6幼犬兽群","sourceRow":106}]};
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import battle_sim  # noqa: E402
+import bench_game_catalog  # noqa: E402
+
+
+def test_load_catalog_resolves_fingerprinted_shards(tmp_path: Path) -> None:
+    bench_game_catalog.generate_project(tmp_path, packs=2, rows_per_pack=12, dup_ratio=0.0, icon_size=16, seed=1)
+    builder = tmp_path / "scripts" / "build_game_catalog.py"
+    subprocess.run([sys.executable, str(builder), "--shards", "--fingerprint"], check=True, capture_output=True)
+
+    core = tmp_path / "src" / "game_data.generated.js"
+    shard_srcs = [pack["shard"]["src"] for pack in battle_sim.read_data_script(core)["packs"]]
+    assert all(src.startswith("./assets/fp/") for src in shard_srcs)
+
+    payload = battle_sim.load_catalog(core, root=tmp_path)
+    assert {pet["packKey"] for pet in payload["pets"]} == {"pack1", "pack2"}
+    assert len(payload["pets"]) + len(payload["foods"]) == 24
+
+
+def test_resolve_root_url_strips_version_query(tmp_path: Path) -> None:
+    assert battle_sim.resolve_root_url("./src/game_data.pack1.js?v=abc", tmp_path) == tmp_path / "src" / "game_data.pack1.js"
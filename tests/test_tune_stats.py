@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import bench_game_catalog  # noqa: E402
+
+
+def dry_run_overrides(project_dir: Path, jobs: int) -> dict:
+    result = subprocess.run(
+        [
+            sys.executable,
+            str(project_dir / "scripts" / "tune_stats.py"),
+            "--dry-run",
+            "--battles", "300",
+            "--iterations", "2",
+            "--jobs", str(jobs),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # The overrides follow the progress lines as one indented JSON document.
+    return json.loads(result.stdout[result.stdout.index("\n{") :])
+
+
+def test_overrides_do_not_depend_on_jobs(tmp_path: Path) -> None:
+    bench_game_catalog.generate_project(tmp_path, packs=2, rows_per_pack=12, dup_ratio=0.0, icon_size=16, seed=1)
+    for name in ("battle_sim.py", "tune_stats.py"):
+        shutil.copy2(SCRIPTS_DIR / name, tmp_path / "scripts" / name)
+    subprocess.run([sys.executable, str(tmp_path / "scripts" / "build_game_catalog.py")], check=True, capture_output=True)
+
+    assert dry_run_overrides(tmp_path, 1) == dry_run_overrides(tmp_path, 4)